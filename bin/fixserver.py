@@ -15,7 +15,7 @@ except ImportError:
 
 import sxsuite.exc as exc
 from sxsuite.fix import FixClient, FixProtocol, FixContext
-from sxsuite.reaktor import Reaktor
+from sxsuite.reaktor import create_reaktor
 from sxsuite.apps import ProcessApplication
 ##from chixhandler import ChixCaptureReport
 
@@ -97,7 +97,7 @@ def run_session(handler_expr, options):
         sys.exit(1)
 
     
-    reaktor = Reaktor()
+    reaktor = create_reaktor()
     protocol = FixProtocol(version=fix_version)
 
     target = make_app(handler_expr)
@@ -140,7 +140,7 @@ def run_session(handler_expr, options):
 
     savelist = []
     if statepath:
-        ses.state.restore(statepath)
+        ses.state.open_record(statepath)
         savelist = [(ses, statepath)]
 
     reaktor.run(savelist=savelist, exc_handler=validator.exchandler)
@@ -7,7 +7,7 @@
 
 import sys
 import xml.parsers.expat as xmlparser
-from sxproto.fixtypes import *
+from sxsuite.fix.context import fix_pytype
 
 _copying = """
 # Copyright (c) Harri Rautila, 2011
@@ -25,6 +25,9 @@ messages = {}
 cur_m = None
 cur_f = None
 cur_g = None
+cur_c = None
+# messages, groups and components being parsed, innermost last
+_open = []
 
 components = {}
 fields = {}
@@ -133,66 +136,60 @@ def handle_start_element(name, attrs):
             cur_f.add_enum(enum)
 
     else: ## in_messages or in_header or in_components or in_trailer:
+        if _open:
+            parent = _open[-1]
+        elif in_header:
+            parent = header
+        elif in_trailer:
+            parent = trailer
+        else:
+            parent = None
+
         if name == 'message':
             # start new message
             cur_m = Message(attrs['name'])
             cur_m.msgtype = attrs['msgtype']
             cur_m.application = attrs['msgcat'] == 'app'
             messages[cur_m.name] = cur_m
+            _open.append(cur_m)
 
         elif name == 'field':
             cur_f = MessageField(attrs['name'])
-            cur_f.required = bool(attrs['required'])
-            if cur_g is not None:
-                cur_g.add_component(cur_f)
-            elif in_header:
-                header.add_component(cur_f)
-            elif in_trailer:
-                trailer.add_component(cur_f)
-            elif in_messages:
-                cur_m.add_component(cur_f)
-            elif in_components:
-                cur_c.add_component(cur_f)
+            cur_f.required = attrs.get('required') == 'Y'
+            if parent is not None:
+                parent.add_component(cur_f)
 
         elif name == 'group':
+            # groups may be nested in groups
             cur_g = MessageGroup(attrs['name'])
             groups[cur_g.name] = cur_g
-            cur_g.required = bool(attrs['required'])
-            if in_header:
-                header.add_component(cur_g)
-                return
-            if in_messages:
-                cur_m.add_component(cur_g)
-            elif in_components:
-                cur_c.add_component(cur_g)
+            cur_g.required = attrs.get('required') == 'Y'
+            if parent is not None:
+                parent.add_component(cur_g)
+            _open.append(cur_g)
 
         elif name == 'component':
             cur_c = Component(attrs['name'])
-            if not in_components:
-                cur_c.required = bool(attrs['required'])
-                if cur_g is not None:
-                    cur_g.add_component(cur_c)
-                else:
-                    cur_m.add_component(cur_c)
-
+            if parent is not None:
+                # reference to component defined in components
+                cur_c.required = attrs.get('required') == 'Y'
+                parent.add_component(cur_c)
             else:
-                cur_c = Component(attrs['name'])
                 components[cur_c.name] = cur_c
-                
+            _open.append(cur_c)
+
 
-        
 def handle_end_element(name):
+    global cur_m, cur_f, cur_g, cur_c
+    if name in ('message', 'group', 'component'):
+        _open.pop()
     if name == 'message':
-        global cur_m
         cur_m = None
     elif name == 'field':
-        global cur_f
         cur_f = None
     elif name == 'group':
-        global cur_g
         cur_g = None
     elif name == 'component':
-        global cur_c
         cur_c = None
         
 def start_element(name, attrs):
@@ -242,6 +239,64 @@ def _indent(x):
 
 
 
+def _pytype_name(field):
+    """Name of Python type for ``field`` as used in descriptors."""
+    pytype = fix_pytype(field.ftype)
+    if pytype == int:
+        return 'int'
+    elif pytype == float:
+        return 'float'
+    return 'str'
+
+def _group_spec(group):
+    """List of field and nested group names in ``group``."""
+    return _message_fields(group)
+
+def _message_fields(composite, seen=None):
+    """List of field and group names in ``composite`` with components expanded."""
+    if seen is None:
+        seen = []
+    names = []
+    for c in composite.components():
+        if isinstance(c, Component):
+            comp = components.get(c.name, c)
+            if c.name in seen:
+                continue
+            names.extend(_message_fields(comp, seen + [c.name]))
+        elif c.name in fields and c.name not in names:
+            names.append(str(c.name))
+    return names
+
+# fields commonly set in order flow messages; stored in slots if present
+_common_fields = ['ClOrdID', 'Account', 'OrderQty', 'Price', 'TransactTime',
+                  'LastQty', 'LastPx']
+
+def _slot_fields(message):
+    """List of required and common fields of ``message`` in message order."""
+    required = _required_fields(message)
+    return [x for x in _message_fields(message)
+            if x in required or x in _common_fields]
+
+def _required_fields(composite, seen=None):
+    """List of required field and group names in ``composite``.
+
+    Fields of required components are included.
+    """
+    if seen is None:
+        seen = []
+    names = []
+    for c in composite.components():
+        if not c.required:
+            continue
+        if isinstance(c, Component):
+            comp = components.get(c.name, c)
+            if c.name in seen:
+                continue
+            names.extend(_required_fields(comp, seen + [c.name]))
+        elif c.name in fields and c.name not in names:
+            names.append(str(c.name))
+    return names
+
 def write_field_types(filep, source_file):
     global messages, fields, composites, groups
     
@@ -276,13 +331,7 @@ def write_field_types(filep, source_file):
     names.sort()
     for name in names:
         field = fields[name]
-        pytype = fix_pytype(field.ftype)
-        if pytype == int:
-            ptyp = 'int'
-        elif pytype == float:
-            ptyp = 'float'
-        else:
-            ptyp = 'str'
+        ptyp = _pytype_name(field)
 
         if field.ftype == 'NUMINGROUP':
             filep.write("\t'%s': FixGroupDescriptor('%s', %d),\n" %
@@ -306,14 +355,9 @@ def write_field_types(filep, source_file):
     names = groups.keys()
     names.sort()
     for name in names:
-        group = groups[name]
         filep.write("\t'%s': [\n" % name)
-        for c in group.components():
-            if isinstance(c, Component):
-                for x in c.components():
-                    filep.write("\t\t(%d, '%s'),\n" % (fields[x.name].fnumber, x.name))
-            else:
-                filep.write("\t\t(%d, '%s'),\n" % (fields[c.name].fnumber, c.name))
+        for x in _group_spec(groups[name]):
+            filep.write("\t\t(%d, '%s'),\n" % (fields[x].fnumber, x))
         filep.write("\t\t],\n")
 
     filep.write("}\n\n")
@@ -334,7 +378,7 @@ def write_field_types(filep, source_file):
     filep.write("\n\n")
 
 
-def write_message_types(filep, source_file):
+def write_message_types(filep, source_file, codecs=True, slots=False):
     global messages
 
     names = messages.keys()
@@ -343,15 +387,178 @@ def write_message_types(filep, source_file):
     ses_messages = ['Heartbeat', 'Logon', 'Logout', 'Reject', 'ResendRequest', 'SequenceReset', 'TestRequest']
     filep.write("# automatically generated, do not edit\n\n# (source: %s)\n\n" % source_file)
     filep.write("from sxsuite.fix.message import FixObject\n\n")
+    if slots:
+        filep.write("from sxsuite.fix.message import FixSlotObject\n\n")
     filep.write("from sxsuite.fix.message import %s\n\n" % ','.join(ses_messages))
-    
+    if codecs:
+        filep.write("from sxsuite.fix.message import _make_mbody, _extract_body, _convert_value, "
+                    "_check_group\n\n")
+        write_group_codecs(filep)
+
     for name in names:
         # only application messages
         if messages[name].application:
-            filep.write("class %s(FixObject):\n" % name)
-            filep.write("\tpass\n\n")
-        
-    
+            if codecs:
+                write_message_codec(filep, name, slots)
+            if slots:
+                filep.write("class %s(FixSlotObject):\n" % name)
+                # other fields go to overflow dict
+                filep.write("\t__slots__ = %s\n" % repr(tuple(_slot_fields(messages[name]))))
+            else:
+                filep.write("class %s(FixObject):\n" % name)
+            if codecs:
+                if not slots:
+                    filep.write("\t_encode = staticmethod(_encode_%s)\n" % name)
+                filep.write("\t_decode = staticmethod(_decode_%s)\n\n" % name)
+            elif not slots:
+                filep.write("\tpass\n\n")
+            else:
+                filep.write("\n")
+
+
+def _unique(names):
+    result = []
+    for name in names:
+        if name not in result:
+            result.append(name)
+    return result
+
+def _is_group(name):
+    return fields[name].ftype == 'NUMINGROUP' and name in groups
+
+def _write_encode_fields(filep, names, count):
+    """Write encoding statements for fields ``names`` of dictionary ``d``.
+
+    If ``count`` is true encoded fields are counted in variable ``n``.
+    """
+    i = '\t'
+    for name in names:
+        field = fields[name]
+        filep.write("%sif '%s' in d:\n" % (i, name))
+        if _is_group(name):
+            filep.write("%s\tgrp = d['%s']\n" % (i, name))
+            filep.write("%s\tadd('%d=' + str(len(grp)))\n" % (i, field.fnumber))
+            filep.write("%s\tfor entry in grp:\n" % i)
+            filep.write("%s\t\t_encode_grp_%s(entry, fixm)\n" % (i, name))
+        else:
+            filep.write("%s\tadd('%d=' + str(d['%s']))\n" % (i, field.fnumber, name))
+        if count:
+            filep.write("%s\tn += 1\n" % i)
+
+def _write_tag_table(filep, table, names):
+    """Write tag table mapping field number to (name, pytype, group decoder)."""
+    filep.write("%s = {\n" % table)
+    for name in names:
+        field = fields[name]
+        if _is_group(name):
+            filep.write("\t%d: ('%s', int, _decode_grp_%s),\n" % (field.fnumber, name, name))
+        else:
+            filep.write("\t%d: ('%s', %s, None),\n" % (field.fnumber, name, _pytype_name(field)))
+    filep.write("}\n\n")
+
+def _write_decode_loop(filep, table, group, slots=False):
+    """Write loop decoding fields listed in ``table`` to dictionary ``d``.
+
+    If ``slots`` is true fields are stored with ``obj._store`` instead.
+    """
+    filep.write("\tcount = len(fields)\n")
+    filep.write("\twhile index < count:\n")
+    filep.write("\t\tnum, val = fields[index]\n")
+    filep.write("\t\tspec = %s.get(num)\n" % table)
+    filep.write("\t\tif spec is None:\n")
+    if group:
+        filep.write("\t\t\tbreak\n")
+    else:
+        filep.write("\t\t\t# not a field of this message, continue with generic decoder\n")
+        filep.write("\t\t\tbody, index = _extract_body(fields, index, context, obj)\n")
+        filep.write("\t\t\treturn index\n")
+    filep.write("\t\tname, pytype, decode_grp = spec\n")
+    if group:
+        filep.write("\t\tif name in d:\n")
+        filep.write("\t\t\t# repeating group\n")
+        filep.write("\t\t\tentries.append(entry)\n")
+        filep.write("\t\t\tentry = FixObject(context)\n")
+        filep.write("\t\t\td = entry.__dict__\n")
+    if slots:
+        filep.write("\t\tif decode_grp is not None:\n")
+        filep.write("\t\t\tgrp, index = decode_grp(fields, index+1, context, val)\n")
+        filep.write("\t\t\tstore(name, grp)\n")
+        filep.write("\t\t\tcontinue\n")
+        filep.write("\t\ttry:\n")
+        filep.write("\t\t\tstore(name, pytype(val))\n")
+        filep.write("\t\texcept ValueError:\n")
+        filep.write("\t\t\tstore(name, _convert_value(pytype, val))\n")
+    else:
+        filep.write("\t\tif decode_grp is not None:\n")
+        filep.write("\t\t\td[name], index = decode_grp(fields, index+1, context, val)\n")
+        filep.write("\t\t\tcontinue\n")
+        filep.write("\t\ttry:\n")
+        filep.write("\t\t\td[name] = pytype(val)\n")
+        filep.write("\t\texcept ValueError:\n")
+        filep.write("\t\t\td[name] = _convert_value(pytype, val)\n")
+    filep.write("\t\tindex += 1\n")
+
+def write_group_codecs(filep):
+    """Write encode and decode functions for all field groups."""
+    names = groups.keys()
+    names.sort()
+    for name in names:
+        spec = _unique([str(x) for x in _group_spec(groups[name]) if x in fields])
+
+        filep.write("def _encode_grp_%s(entry, fixm):\n" % name)
+        filep.write("\td = entry.__dict__\n")
+        filep.write("\tadd = fixm.append\n")
+        _write_encode_fields(filep, spec, False)
+        filep.write("\n")
+
+        filep.write("def _decode_grp_%s(fields, index, context, nentries):\n" % name)
+        filep.write("\tentries = []\n")
+        filep.write("\tentry = FixObject(context)\n")
+        filep.write("\td = entry.__dict__\n")
+        filep.write("\tstart = index\n")
+        _write_decode_loop(filep, '_grp_%s_tags' % name, True)
+        filep.write("\tif index > start:\n")
+        filep.write("\t\tentries.append(entry)\n")
+        filep.write("\t_check_group(%d, nentries, entries)\n" % fields[name].fnumber)
+        filep.write("\treturn entries, index\n\n")
+
+    for name in names:
+        spec = _unique([str(x) for x in _group_spec(groups[name]) if x in fields])
+        _write_tag_table(filep, '_grp_%s_tags' % name, spec)
+
+def write_message_codec(filep, name, slots=False):
+    """Write compiled encode and decode functions for message ``name``.
+
+    Slotted messages get only the decode function; they are encoded with
+    the generic encoder.
+    """
+    names = _message_fields(messages[name])
+
+    if not slots:
+        filep.write("_msg_%s_names = frozenset(%s)\n\n" % (name, names))
+    _write_tag_table(filep, '_msg_%s_tags' % name, names)
+    if slots:
+        filep.write("def _decode_%s(obj, fields, index, context):\n" % name)
+        filep.write("\tstore = obj._store\n")
+        _write_decode_loop(filep, '_msg_%s_tags' % name, False, True)
+        filep.write("\treturn index\n\n")
+        return
+
+    filep.write("def _encode_%s(obj, fixm):\n" % name)
+    filep.write("\td = obj.__dict__\n")
+    filep.write("\tadd = fixm.append\n")
+    filep.write("\tn = 1\n")
+    _write_encode_fields(filep, names, True)
+    filep.write("\tif len(d) > n:\n")
+    filep.write("\t\t_make_mbody(obj, obj._context, fixm, _msg_%s_names)\n" % name)
+    filep.write("\treturn fixm\n\n")
+
+    filep.write("def _decode_%s(obj, fields, index, context):\n" % name)
+    filep.write("\td = obj.__dict__\n")
+    _write_decode_loop(filep, '_msg_%s_tags' % name, False)
+    filep.write("\treturn index\n\n")
+
+
 def write_utils(filep):
     
     filep.write("def fix_desc_for_name(name):\n")
@@ -403,7 +610,8 @@ def main(argv):
     import getopt
 
     try:
-        opts, args = getopt.getopt(argv, "f:m:N", ["fields=", "messages=", "noout"])
+        opts, args = getopt.getopt(argv, "f:m:NCS", ["fields=", "messages=", "noout",
+                                                    "nocodecs", "slots"])
     except getopt.GetoptError, e:
         print str(e)
         sys.exit(1)
@@ -412,6 +620,8 @@ def main(argv):
     messagetypes_file = "fixmtypes.py"
     source_file = ''
     no_output = False
+    codecs = True
+    slots = False
 
     for o, a in opts:
         if o in ("-f", "--fields"):
@@ -420,9 +630,13 @@ def main(argv):
             messagetypes_file = a
         elif o in ("-N", "--noout"):
             no_output = True
+        elif o in ("-C", "--nocodecs"):
+            codecs = False
+        elif o in ("-S", "--slots"):
+            slots = True
         
     if not args:
-        print "Usage: fixxml.py [-f path -m path] xmlfile"
+        print "Usage: fixxml.py [-f path -m path -C -S] xmlfile"
         sys.exit(1)
     
     parser = xmlparser.ParserCreate()
@@ -460,6 +674,6 @@ def main(argv):
         write_field_types(fp, source_file)
 
     with open(messagetypes_file, "w") as fp:
-        write_message_types(fp, source_file)
+        write_message_types(fp, source_file, codecs, slots)
 
 main(sys.argv[1:])
@@ -10,8 +10,16 @@
 """
 setup.py file for sxsuite package.
 """
+import sys
+
 from distutils.core import setup, Extension
 
+# sxsuite.aio uses asyncio backport on Python 2
+if sys.version_info < (3, 4):
+    requires = ['trollius']
+else:
+    requires = []
+
 setup(name = 'sxsuite',
       version = '0.1a',
       author = 'Harri Rautila',
@@ -19,4 +27,5 @@ setup(name = 'sxsuite',
       description = """Xchange protocol suite""",
       packages = [ "sxsuite", "sxsuite.fix"],
       scripts = ["bin/fixserver.py"],
+      requires = requires,
       )
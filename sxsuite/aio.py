@@ -0,0 +1,295 @@
+# (c) Harri Rautila, 2011
+
+# This file is part of sxsuite library. It is free software, distributed
+# under the terms of the GNU Lesser General Public License Version 3,
+# or any later version.
+# See the COPYING file included in this archive
+
+"""
+Run sessions on an asyncio event loop.
+
+``AioTransport`` is an asyncio protocol that drives ``Session`` state
+machine in place of asyncore based transports and ``AioReaktor`` runs
+``sxsuite.timer`` timers on the event loop. Sessions can then share the
+event loop with other asyncio services::
+
+    reaktor = AioReaktor(loop)
+    client = FixClient(reaktor, FixProtocol(), transport=AioTransport(reaktor))
+    client.start((host, port))
+
+    server = FixServer(reaktor, FixProtocol(), transport=AioTransport(reaktor))
+    reaktor.listen(server, (host, port))
+
+Uses ``trollius`` if ``asyncio`` is not available; on Python 2 install
+it with ``pip install trollius``. TLS/SSL is not supported.
+"""
+
+import logging
+
+from time import time
+
+try:
+    import asyncio
+except ImportError:
+    import trollius as asyncio
+
+from sxsuite.exc import S_ETIMEOUT
+from sxsuite.reaktor import Reaktor
+from sxsuite.session import Session
+from sxsuite.store import close_stores
+from sxsuite.timer import run_timers, add_timer, next_deadline
+from sxsuite.transport import Transport
+
+_ensure_future = getattr(asyncio, 'ensure_future', None) or getattr(asyncio, 'async')
+
+
+class AioTransport(asyncio.Protocol):
+    """Session transport on asyncio event loop.
+
+    Implements the parts of ``Transport`` interface used by sessions.
+    Writes go directly to asyncio transport which buffers them. Reading is
+    paused while session is paused by back-pressure.
+    """
+
+    def __init__(self, reaktor, session=None):
+        self.reaktor = reaktor
+        self.session = session
+        self.state = Transport.IDLE
+        self.socket = None
+        self._transport = None
+        self._connecting = None
+        self._data = b''
+        self._reading = True
+
+    def __str__(self):
+        return "%s: %s" % (self.__class__.__name__, str(self.getpeername()))
+
+    def set_session(self, session):
+        self.session = session
+        session.set_direct(True)
+
+    def test_session_state(self, state):
+        return self.session.in_state(state)
+
+    def getpeername(self):
+        if self._transport is None:
+            return None
+        return self._transport.get_extra_info('peername')
+
+    def create(self):
+        self.state = Transport.IDLE
+
+    def add_channel(self):
+        self.reaktor.add_channel(id(self), self)
+
+    def del_channel(self):
+        self.reaktor.del_channel(id(self))
+
+    def start(self, target):
+        """Connect to ``target``."""
+        self.state = Transport.CONNECTING
+        self.add_channel()
+        self.session.event_start(self)
+        host, port = target
+        loop = self.reaktor.loop
+        self._connecting = _ensure_future(
+            loop.create_connection(lambda: self, host, port), loop=loop)
+        self._connecting.add_done_callback(self._connect_done)
+
+    def stop(self):
+        self.reaktor.dispatch(self.session.event_stop, self)
+
+    def timeout(self):
+        self.session.event_timeout(self, S_ETIMEOUT)
+
+    def close(self):
+        self.state = Transport.DISCONNECTED
+        if self._connecting is not None:
+            self._connecting.cancel()
+            self._connecting = None
+        if self._transport is not None:
+            self._transport.close()
+            self._transport = None
+
+    def send(self, data):
+        if self._transport is None:
+            return 0
+        self._transport.write(data)
+        return len(data)
+
+    def sendv(self, bufs):
+        if self._transport is None:
+            return 0
+        self._transport.writelines(bufs)
+        return sum(map(len, bufs))
+
+    def recv(self, size=0):
+        data = self._data
+        self._data = b''
+        return data
+
+    def writable(self):
+        return self.session.writable()
+
+    def readable(self):
+        if self.session.is_paused():
+            return False
+        return self.state == Transport.CONNECTED
+
+    def update_reading(self):
+        """Pause or resume reading of asyncio transport to follow session."""
+        if self._transport is None:
+            return
+        reading = not self.session.is_paused()
+        if reading == self._reading:
+            return
+        self._reading = reading
+        if reading:
+            self._transport.resume_reading()
+        else:
+            self._transport.pause_reading()
+
+    # asyncio protocol events
+
+    def connection_made(self, transport):
+        session = self.session
+        if session.server:
+            current = session.transport
+            if current is not None and current is not self \
+                    and current.state == Transport.CONNECTED:
+                logging.info("ALREADY connected")
+                transport.close()
+                return
+        self._transport = transport
+        self._reading = True
+        self.socket = transport.get_extra_info('socket')
+        self.state = Transport.CONNECTED
+        self.update_reading()
+        if session.server:
+            self.add_channel()
+            self.reaktor.dispatch(session.attach, self)
+        else:
+            self.reaktor.dispatch(session.event_connect, self)
+        self._drain()
+
+    def data_received(self, data):
+        self._data = data
+        self.reaktor.dispatch(self.session.event_readable, self)
+        self._drain()
+
+    def connection_lost(self, exc):
+        self._transport = None
+        if self.state == Transport.DISCONNECTED or self.session.transport is not self:
+            # closed from this side or rejected connection
+            return
+        self.state = Transport.DISCONNECTED
+        self.reaktor.dispatch(self.session.event_disconnect, self)
+
+    def pause_writing(self):
+        self.reaktor.dispatch(self.session.event_pause, self)
+
+    def resume_writing(self):
+        self.reaktor.dispatch(self.session.event_resume, self)
+        self._drain()
+
+    # Private methods
+
+    def _connect_done(self, future):
+        self._connecting = None
+        if future.cancelled():
+            return
+        try:
+            future.result()
+        except Exception:
+            self.state = Transport.ERROR
+            self.reaktor.dispatch(self.session.event_error, self)
+
+    def _drain(self):
+        """Write data queued in session before transport was connected.
+
+        Stops when a write does not shrink the queue.
+        """
+        session = self.session
+        size = None
+        while self.state == Transport.CONNECTED and session.writable() \
+                and not session.in_state(Session.SSL_INIT):
+            if size is not None and session.outq_size() >= size:
+                break
+            size = session.outq_size()
+            self.reaktor.dispatch(session.event_writable, self)
+
+
+class AioReaktor(Reaktor):
+    """Reaktor running session timers and transports on asyncio event loop.
+
+    Timers are run at their deadline but at least every ``max_wait``
+    seconds to pick up timers added outside of session events.
+    """
+
+    def __init__(self, loop=None, max_wait=0.5):
+        Reaktor.__init__(self)
+        if loop is None:
+            loop = asyncio.get_event_loop()
+        self.loop = loop
+        self.max_wait = max_wait
+        self._handle = None
+        self._due = 0
+        self._exc_handler = None
+
+    def run(self, savelist=[], exc_handler=None):
+        """Run event loop forever."""
+        self.start(savelist, exc_handler)
+        self.loop.run_forever()
+        close_stores()
+
+    def start(self, savelist=[], exc_handler=None):
+        """Start running timers on event loop."""
+        self._savelist = savelist
+        self._exc_handler = exc_handler
+        if self._savelist:
+            self._stid = add_timer(5, self.save_states)
+        self.schedule()
+
+    def listen(self, session, address):
+        """Accept connections for server side ``session`` at ``address``.
+
+        Returns future of asyncio server.
+        """
+        host, port = address
+        return _ensure_future(
+            self.loop.create_server(lambda: AioTransport(self, session), host, port),
+            loop=self.loop)
+
+    def update_interest(self, transport):
+        """Pause or resume reading of ``transport`` as its session requires."""
+        update = getattr(transport, 'update_reading', None)
+        if update is not None:
+            update()
+
+    def dispatch(self, func, *args):
+        """Call session event handler and handle raised exceptions."""
+        try:
+            func(*args)
+        except Exception as ex:
+            if self._exc_handler is None:
+                logging.debug("reaktor: %s: %s", type(ex).__name__, str(ex))
+            elif not self._exc_handler(ex):
+                self.loop.stop()
+        self.schedule()
+
+    def schedule(self):
+        """Schedule timer run to next timer deadline."""
+        due = time() + self.max_wait
+        deadline = next_deadline()
+        if deadline is not None:
+            due = min(due, deadline)
+        if self._handle is not None:
+            if self._due <= due:
+                return
+            self._handle.cancel()
+        self._due = due
+        self._handle = self.loop.call_later(max(0.0, due - time()), self._run_timers)
+
+    def _run_timers(self):
+        self._handle = None
+        self.dispatch(run_timers)
@@ -10,13 +10,14 @@ import signal
 import logging
 import traceback
 import os
+import zlib
 
-from multiprocessing import Process
+from multiprocessing import Process, cpu_count
 
 import sxsuite.exc as exc
 from sxsuite.exc import ConfigError, SessionError
 from sxsuite.session import *
-from sxsuite.timer import flush_timers, run_timers
+from sxsuite.timer import add_timer, del_timer, flush_timers, run_timers
 
 if sys.platform != 'win32':
     from multiprocessing import Pipe
@@ -112,6 +113,16 @@ class ConsoleApplication(Application):
         traceback.print_exc()
 
 
+class _Batch(list):
+    """Messages sent in one write between processes."""
+    pass
+
+
+class _Reply(tuple):
+    """Results (seqno, results) of one message handled in pool worker."""
+    pass
+
+
 class Handler(object):
     def setup(self, connection, config):
         pass
@@ -119,6 +130,24 @@ class Handler(object):
     def handle(self, data, connection):
         pass
 
+    def handle_batch(self, messages, connection):
+        """Handle messages received in one wakeup.
+
+        Returns list of results to send back. Exception raised by
+        ``handle`` is returned in place of result. If ``handle_batch``
+        itself raises, the exception is sent back instead of results.
+        """
+        results = []
+        for data in messages:
+            try:
+                result = self.handle(data, connection)
+            except Exception, e:
+                logging.error("Handler %s raised %s", str(self), str(e))
+                result = e
+            if result is not None:
+                results.append(result)
+        return results
+
     def finish(self, connection):
         pass
 
@@ -127,14 +156,19 @@ class Handler(object):
 
 
 class _Subprocess(object):
+
+    # most messages to drain on one wakeup
+    MAX_BATCH = 4096
     
-    def __init__(self, target, conn, config):
+    def __init__(self, target, conn, config, ordered=False):
         self.target = target
         self.conn = conn
         self.init = None
         self.finish = None
         self.running = False
         self.config = config
+        # messages are (seqno, data) and results are returned per message
+        self.ordered = ordered
 
     def run(self):
         """Run the application data receiving loop.
@@ -150,10 +184,11 @@ class _Subprocess(object):
 
         self.init = getattr(self.target, 'setup', None)
         self.finish = getattr(self.target, 'finish', None)
+        self.batch_handler = getattr(self.target, 'handle_batch', None)
         if hasattr(self.target, 'handle'):
             self.handler = getattr(self.target, 'handle')
         else:
-            self.handler = target
+            self.handler = self.target
         if not callable(self.handler):
             raise ConfigError(self, exc.E_NOTCALLABLE)
 
@@ -166,24 +201,61 @@ class _Subprocess(object):
                 run_timers()
                 if not readable:
                     continue
-                data = self.conn.recv()
-            except (IOError, KeyboardInterrupt), ex:
+                messages = self._drain()
+                if not messages:
+                    continue
+            except (IOError, EOFError, KeyboardInterrupt), ex:
                 break
             except Exception, e:
                 logging.error("Subprocess recv failed: %s", str(e))
                 break
-            try:
-                result = self.handler(data, self.conn)
-                if result is not None:
-                    self.conn.send(result)
-            except Exception, e:
-                logging.error("Subprocess %s raised %s", str(self.target), str(e))
-                self.conn.send(e)
+            if self.ordered:
+                results = [_Reply((seqno, self._handle(data))) for seqno, data in messages]
+            elif self.batch_handler is not None:
+                try:
+                    results = self.batch_handler(messages, self.conn)
+                except Exception, e:
+                    # results of messages handled before error are lost
+                    logging.error("Subprocess %s raised %s, results of %d messages discarded",
+                                  str(self.target), str(e), len(messages))
+                    results = [e]
+            else:
+                results = []
+                for data in messages:
+                    results.extend(self._handle(data))
+            if len(results) == 1:
+                self.conn.send(results[0])
+            elif results:
+                self.conn.send(_Batch(results))
         # end while
         if callable(self.finish):
             self.finish(self.conn)
         self.conn.close()
 
+    def _handle(self, data):
+        """Handle one message and return list of results."""
+        try:
+            result = self.handler(data, self.conn)
+        except Exception, e:
+            logging.error("Subprocess %s raised %s", str(self.target), str(e))
+            result = e
+        if result is None:
+            return []
+        return [result]
+
+    def _drain(self):
+        """Receive all pending messages."""
+        messages = []
+        while len(messages) < self.MAX_BATCH:
+            data = self.conn.recv()
+            if isinstance(data, _Batch):
+                messages.extend(data)
+            elif data is not None:
+                messages.append(data)
+            if not self.conn.poll(0):
+                break
+        return messages
+
     def run_module(self, modulename):
         import importlib
         self.target = importlib.import_module(modulename)
@@ -196,7 +268,13 @@ class _Subprocess(object):
 
 
 class ProcessApplication(Application):
-    """Run application class in subprocess."""
+    """Run application class in subprocess.
+
+    Data is passed to subprocess through ``multiprocessing.Pipe``.
+
+    Messages sent during one reaktor round are written to subprocess
+    together and handled with ``handle_batch`` of the handler.
+    """
 
     def __init__(self, reaktor, target, name=''):
         Application.__init__(self, None, name)
@@ -207,6 +285,8 @@ class ProcessApplication(Application):
         self.child = None
         self.transport = None
         self.runner = None
+        self._sendq = []
+        self._stid = None
 
     def start(self):
         signal.signal(signal.SIGCHLD, self._sigchld)
@@ -230,15 +310,43 @@ class ProcessApplication(Application):
         self._close(0.5)
 
     def stop(self):
+        self.flush()
         self._process.terminate()
         self._close(2.0)
 
     def send(self, data):
-        """Send data to application."""
-        self.parent.send(data)
+        """Queue data to application. Queue is written at end of reaktor round."""
+        self._sendq.append(data)
+        if self._stid is None:
+            self._stid = add_timer(0, self.flush)
+
+    def flush(self):
+        """Write queued data to application."""
+        if self._stid is not None:
+            del_timer(self._stid)
+            self._stid = None
+        queue, self._sendq = self._sendq, []
+        if self.parent is None or not queue:
+            return
+        if len(queue) == 1:
+            self.parent.send(queue[0])
+        else:
+            self.parent.send(_Batch(queue))
 
     def recv(self, data):
         """Handle data received from subprocess application."""
+        if isinstance(data, _Batch):
+            # deliver all results before raising first error
+            error = None
+            for item in data:
+                try:
+                    self.recv(item)
+                except Exception, e:
+                    if error is None:
+                        error = e
+            if error is not None:
+                raise error
+            return
         if isinstance(data, Exception):
             self.log.error("Subprocess exception: %s", str(data))
             raise data
@@ -257,6 +365,186 @@ class ProcessApplication(Application):
             self.log.debug("process: %s", str(ex))
 
 
+class ProcessPoolApplication(ProcessApplication):
+    """Run application class in pool of ``workers`` subprocesses.
+
+    Messages are partitioned to workers by key: ``key(data)`` if given,
+    otherwise field conf ``partition_key`` (tag number, or field name if
+    FIX ``context`` is given). Messages of one key are handled in order by
+    one worker and results are passed on in the order of the messages.
+    Messages without key go to the first worker. Handlers are called
+    with ``handle`` one message at a time.
+
+    Worker that exits is started again. Messages it had not handled are
+    skipped and ``SessionError`` is raised after results of earlier
+    messages are passed on.
+    """
+
+    def __init__(self, reaktor, target, name='', workers=0, key=None, context=None):
+        ProcessApplication.__init__(self, reaktor, target, name)
+        self.nworkers = workers if workers > 0 else cpu_count()
+        self.key = key
+        self.context = context
+        self._workers = []
+        self._sendqs = []
+        # seqno of next message and of next result to pass on
+        self._seqno = 0
+        self._next = 0
+        self._results = {}
+        # worker of each message waiting for result
+        self._outstanding = {}
+        self._stopped = False
+
+    def start(self):
+        signal.signal(signal.SIGCHLD, self._sigchld)
+        self._workers = [None] * self.nworkers
+        self._sendqs = [[] for n in range(self.nworkers)]
+        for n in range(self.nworkers):
+            self._spawn(n)
+
+    def _spawn(self, n):
+        """Start worker ``n``."""
+        parent, child = Pipe(duplex=True)
+        transport = ConnectedTransport(self._reaktor, parent, self)
+        runner = _Subprocess(self.target, child, self.config, ordered=True)
+        process = Process(target=runner.run, name='%s-%d' % (self.name, n))
+        process.start()
+        # without our handle of child end send to dead worker fails
+        child.close()
+        self._workers[n] = (parent, transport, process)
+
+    def partition(self, data):
+        """Return index of worker handling ``data``."""
+        if self.key is not None:
+            key = self.key(data)
+        else:
+            name = self.get_conf('partition_key', '')
+            key = None
+            if name and hasattr(data, 'get_field'):
+                if self.context is None:
+                    key = data.get_field(int(name))
+                else:
+                    key = data.get_field(name, self.context)
+        if key is None:
+            return 0
+        return (zlib.crc32(str(key)) & 0x7fffffff) % self.nworkers
+
+    def send(self, data):
+        """Queue data to worker. Queues are written at end of reaktor round."""
+        n = self.partition(data)
+        self._sendqs[n].append((self._seqno, data))
+        self._outstanding[self._seqno] = n
+        self._seqno += 1
+        if self._stid is None:
+            self._stid = add_timer(0, self.flush)
+
+    def flush(self):
+        if self._stid is not None:
+            del_timer(self._stid)
+            self._stid = None
+        failed = False
+        for n, (parent, transport, process) in enumerate(self._workers):
+            queue, self._sendqs[n] = self._sendqs[n], []
+            try:
+                if len(queue) == 1:
+                    parent.send(queue[0])
+                elif queue:
+                    parent.send(_Batch(queue))
+            except (IOError, EOFError, OSError), e:
+                self.log.error("sending to worker %s failed: %s", process.name, str(e))
+                process.terminate()
+                process.join(1.0)
+                failed = True
+        if failed:
+            self._check_workers()
+
+    def recv(self, data):
+        """Handle data received from worker."""
+        if not isinstance(data, _Reply):
+            return ProcessApplication.recv(self, data)
+        seqno, results = data
+        if self._outstanding.pop(seqno, None) is None:
+            # message was skipped
+            return
+        self._results[seqno] = results
+        self._deliver()
+
+    def _deliver(self):
+        """Pass on results that are next in order of messages."""
+        error = None
+        while self._next in self._results:
+            for item in self._results.pop(self._next):
+                try:
+                    ProcessApplication.recv(self, item)
+                except Exception, e:
+                    if error is None:
+                        error = e
+            self._next += 1
+        if error is not None:
+            raise error
+
+    def _check_workers(self):
+        """Start exited workers again and skip their unhandled messages."""
+        if self._stopped:
+            # workers exit when their connections are closed
+            return
+        error = None
+        for n, (parent, transport, process) in enumerate(self._workers):
+            if process.is_alive():
+                continue
+            # messages still queued go to the new worker
+            queued = set(seqno for seqno, data in self._sendqs[n])
+            lost = [seqno for seqno, w in self._outstanding.items()
+                    if w == n and seqno not in queued]
+            self.log.error("worker %s exited: %s, %d messages not handled",
+                           process.name, process.exitcode, len(lost))
+            for seqno in lost:
+                del self._outstanding[seqno]
+                self._results[seqno] = []
+            transport.close()
+            transport.del_channel()
+            self._spawn(n)
+            if lost and error is None:
+                error = SessionError(self, exc.S_ESHUTDOWN,
+                                     "worker %s exited" % process.name)
+        self._deliver()
+        if error is not None:
+            raise error
+
+    def event_readable(self, transport):
+        data = transport.socket.recv()
+        if data is not None:
+            self.recv(data)
+
+    def _interest_changed(self):
+        """Tell reaktor that worker transports may wait for different events."""
+        for parent, transport, process in self._workers:
+            self._reaktor.update_interest(transport)
+
+    def event_stop(self, transport):
+        self._stopped = True
+        ProcessApplication.event_stop(self, transport)
+
+    def _close(self, timeout):
+        for parent, transport, process in self._workers:
+            process.join(timeout)
+            transport.close()
+            transport.del_channel()
+        self._workers = []
+
+    def _sigchld(self, signum, frame):
+        # handled on reaktor round, not inside interrupted code
+        add_timer(0, self._check_workers)
+
+    def stop(self):
+        self.flush()
+        self._stopped = True
+        signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+        for parent, transport, process in self._workers:
+            process.terminate()
+        self._close(2.0)
+
+
 class SessionProcess(object):
 
     def __init__(self, sessionClass, protocol, config):
@@ -310,7 +598,7 @@ def run_session_process(pipe, sessionClass, protocol, config, netaddr, sslcontex
     ses.start(netaddr)
     app.start()
     if state_path:
-        ses.state.restore(state_path)
+        ses.state.open_record(state_path)
         savelist = [(ses, state_path)]
     reaktor.run(savelist=savelist, exc_handler=exchandler)
     
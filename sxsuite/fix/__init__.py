@@ -9,7 +9,7 @@ from context import *
 from message import *
 from fixproto import *
 
-__all__ = ['FixClient', 'FixServer', 'FixProtocol',
+__all__ = ['FixClient', 'FixServer', 'FixAcceptor', 'FixProtocol',
            'FixMessage', 'FixContext', 'FixObject',
            'utc_timestamp', 'utc_today', 'utc_now',
            'datetime_now']
@@ -77,16 +77,51 @@ class FixContext(object):
             self.name = name
         else:
             self.name = 'FIX.' + self.version
-        self.header_ids = getattr(self._fixmod, 'FIX_HEADER_FIELD_IDS')
-        self.trailer_ids = getattr(self._fixmod, 'FIX_TRAILER_FIELD_IDS')
+        self.header_ids = frozenset(getattr(self._fixmod, 'FIX_HEADER_FIELD_IDS'))
+        self.trailer_ids = frozenset(getattr(self._fixmod, 'FIX_TRAILER_FIELD_IDS'))
+        self._build_tables()
+
+    def _build_tables(self):
+        """Build merged lookup tables from FIX module dictionaries.
+
+        Descriptors of standard fields are kept in a list indexed by tag
+        number, custom fields with numbers beyond it in ``_field_numbers``.
+        """
+        fixmod = self._fixmod
+        numbers = getattr(fixmod, '_fix_field_numbers')
+        self._desc_table = [None] * (max(numbers) + 1)
+        for num, desc in numbers.iteritems():
+            self._desc_table[num] = desc
+        self._desc_names = dict(getattr(fixmod, '_fix_field_types'))
+        self._group_names = dict(getattr(fixmod, '_fix_group_types'))
+        self._group_ids = dict(getattr(fixmod, '_fix_group_numbers'))
+        self._group_tags = {}
+        for num, gspec in self._group_ids.iteritems():
+            self._group_tags[num] = _group_tags(gspec)
+
+        # msgname -> (msgtype, is_application, class)
+        # msgtype -> (msgname, is_application, class)
+        self._msgname_table = {}
+        self._msgtype_table = {}
+        for name, (mtyp, is_app) in getattr(fixmod, '_fix_message_types').iteritems():
+            cls = getattr(fixmod, name, None)
+            self._msgname_table[name] = (mtyp, is_app, cls)
+            self._msgtype_table[mtyp] = (name, is_app, cls)
+
+    def _add_desc(self, desc):
+        self._field_types[desc.name] = desc
+        self._desc_names[desc.name] = desc
+        if desc.number < len(self._desc_table):
+            self._desc_table[desc.number] = desc
+        else:
+            self._field_numbers[desc.number] = desc
 
     def add_field(self, name, num, fixtype):
         """Add new field to context.
 
         """
         desc = FixFieldDescriptor(name, num, fixtype, fix_pytype(fixtype))
-        self._field_types[name] = desc
-        self._field_numbers[num] = desc
+        self._add_desc(desc)
         
 
     def add_group(self, name, num, groupfields):
@@ -94,8 +129,7 @@ class FixContext(object):
 
         """
         groupdesc = FixGroupDescriptor(name, num)
-        self._field_types[name] = groupdesc
-        self._field_numbers[num] = groupdesc
+        self._add_desc(groupdesc)
 
         gspec = []
         for field in groupfields:
@@ -112,56 +146,72 @@ class FixContext(object):
                 pass
 
         self._group_types[name] = gspec
-        self._group_numbers[num] = self._group_types[name]
+        self._group_numbers[num] = gspec
+        self._group_names[name] = gspec
+        self._group_ids[num] = gspec
+        self._group_tags[num] = _group_tags(gspec)
+
+    def has_custom_fields(self):
+        """Test if fields or groups have been added to context."""
+        return len(self._field_types) > 0
 
     def desc_for_name(self, name):
         """Get field descriptor for ``name``"""
         if name[0] == '_':
-            num = int(name[1:])
-            return self.desc_for_id(num)
-
-        if name in self._field_types:
-            return self._field_types[name]
-        return fix_desc_for_name(self._fixmod, name)
+            return self.desc_for_id(int(name[1:]))
+        return self._desc_names[name]
 
     def desc_for_id(self, num):
         """Get field descriptor for message field numbered ``num``."""
-        if num in self._field_numbers:
-            return self._field_numbers[num]
-        return fix_desc_for_id(self._fixmod, num)
+        if num < 0:
+            raise KeyError, num
+        try:
+            desc = self._desc_table[num]
+            if desc is not None:
+                return desc
+        except IndexError:
+            pass
+        return self._field_numbers[num]
     
     def group_for_name(self, name):
         """Get group descriptor for group ``name``."""
-        if name in self._group_types:
-            return self._group_types[name]
-        return fix_group_for_name(self._fixmod, name)
+        return self._group_names[name]
 
     def group_for_id(self, num):
         """Get group descriptor for group numbered ``num``."""
-        if num in self._group_numbers:
-            return self._group_numbers[num]
-        return fix_group_for_id(self._fixmod, num)
+        return self._group_ids[num]
+
+    def group_tags(self, num):
+        """Get delimiter tag and set of member tags of group numbered ``num``."""
+        return self._group_tags[num]
 
     def msgtype_for_name(self, name):
         """Get FIX message type code for message ``name``."""
-        return fix_msgtype_for_name(self._fixmod, name)
+        return self._msgname_table[name][0]
 
     def name_for_msgtype(self, mtyp):
         """Get FIX message name for message of type code ``mtyp``."""
-        return fix_name_for_msgtype(self._fixmod, mtyp)
+        return self._msgtype_table[mtyp][0]
 
     def msgname_is_application(self, msgname):
         """Test if FIX message is application message."""
-        return fix_message_is_application(self._fixmod, msgname, True)
+        return self._msgname_table[msgname][1]
 
     def msgtype_is_application(self, msgtyp):
         """Test if message type corresponds application message."""
-        return fix_message_is_application(self._fixmod, msgtyp, False)
+        return self._msgtype_table[msgtyp][1]
 
     def class_for_msgname(self, name):
         """Return Python class for message."""
-        return fix_class_for_msgname(self._fixmod, name)
+        try:
+            return self._msgname_table[name][2]
+        except KeyError:
+            return fix_class_for_msgname(self._fixmod, name)
     
+    def class_for_msgtype(self, mtyp):
+        """Return Python class for message of type code ``mtyp``."""
+        return self._msgtype_table[mtyp][2]
+
     def create_message(self, name):
         """Return Python object for message type ``name``."""
         cls = self.class_for_msgname(name)
@@ -169,8 +219,14 @@ class FixContext(object):
 
     def isinstance(self, num, cls):
         """Test if message is of type ``cls``."""
-        mcls = self.class_for_msgname(self.name_for_msgtype(num))
-        return cls == mcls
+        return cls == self._msgtype_table[num][2]
+
+def _group_tags(gspec):
+    """Return (delimiter, frozenset of tags) for group spec ``gspec``."""
+    if not gspec:
+        return None, frozenset()
+    return gspec[0][0], frozenset([x[0] for x in gspec])
+
 
 def fix_desc_for_name(fixmod, name):
     return getattr(fixmod, '_fix_field_types')[name]
@@ -649,6 +649,7 @@ _fix_group_types = {
 		(364, 'EncodedUnderlyingSecurityDescLen'),
 		(365, 'EncodedUnderlyingSecurityDesc'),
 		(304, 'TotQuoteEntries'),
+		(295, 'NoQuoteEntries'),
 		],
 	'NoRelatedSym': [
 		(311, 'UnderlyingSymbol'),
@@ -6,120 +6,6222 @@ from sxsuite.fix.message import FixObject
 
 from sxsuite.fix.message import Heartbeat,Logon,Logout,Reject,ResendRequest,SequenceReset,TestRequest
 
+from sxsuite.fix.message import _make_mbody, _extract_body, _convert_value, _check_group
+
+def _encode_grp_LinesOfText(entry, fixm):
+	d = entry.__dict__
+	add = fixm.append
+	if 'Text' in d:
+		add('58=' + str(d['Text']))
+	if 'EncodedTextLen' in d:
+		add('354=' + str(d['EncodedTextLen']))
+	if 'EncodedText' in d:
+		add('355=' + str(d['EncodedText']))
+
+def _decode_grp_LinesOfText(fields, index, context, nentries):
+	entries = []
+	entry = FixObject(context)
+	d = entry.__dict__
+	start = index
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _grp_LinesOfText_tags.get(num)
+		if spec is None:
+			break
+		name, pytype, decode_grp = spec
+		if name in d:
+			# repeating group
+			entries.append(entry)
+			entry = FixObject(context)
+			d = entry.__dict__
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	if index > start:
+		entries.append(entry)
+	_check_group(33, nentries, entries)
+	return entries, index
+
+def _encode_grp_NoAllocs(entry, fixm):
+	d = entry.__dict__
+	add = fixm.append
+	if 'AllocAccount' in d:
+		add('79=' + str(d['AllocAccount']))
+	if 'AllocShares' in d:
+		add('80=' + str(d['AllocShares']))
+
+def _decode_grp_NoAllocs(fields, index, context, nentries):
+	entries = []
+	entry = FixObject(context)
+	d = entry.__dict__
+	start = index
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _grp_NoAllocs_tags.get(num)
+		if spec is None:
+			break
+		name, pytype, decode_grp = spec
+		if name in d:
+			# repeating group
+			entries.append(entry)
+			entry = FixObject(context)
+			d = entry.__dict__
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	if index > start:
+		entries.append(entry)
+	_check_group(78, nentries, entries)
+	return entries, index
+
+def _encode_grp_NoBidComponents(entry, fixm):
+	d = entry.__dict__
+	add = fixm.append
+	if 'Commission' in d:
+		add('12=' + str(d['Commission']))
+	if 'CommType' in d:
+		add('13=' + str(d['CommType']))
+	if 'ListID' in d:
+		add('66=' + str(d['ListID']))
+	if 'Country' in d:
+		add('421=' + str(d['Country']))
+	if 'Side' in d:
+		add('54=' + str(d['Side']))
+	if 'Price' in d:
+		add('44=' + str(d['Price']))
+	if 'PriceType' in d:
+		add('423=' + str(d['PriceType']))
+	if 'FairValue' in d:
+		add('406=' + str(d['FairValue']))
+	if 'NetGrossInd' in d:
+		add('430=' + str(d['NetGrossInd']))
+	if 'SettlmntTyp' in d:
+		add('63=' + str(d['SettlmntTyp']))
+	if 'FutSettDate' in d:
+		add('64=' + str(d['FutSettDate']))
+	if 'TradingSessionID' in d:
+		add('336=' + str(d['TradingSessionID']))
+	if 'Text' in d:
+		add('58=' + str(d['Text']))
+	if 'EncodedTextLen' in d:
+		add('354=' + str(d['EncodedTextLen']))
+	if 'EncodedText' in d:
+		add('355=' + str(d['EncodedText']))
+
+def _decode_grp_NoBidComponents(fields, index, context, nentries):
+	entries = []
+	entry = FixObject(context)
+	d = entry.__dict__
+	start = index
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _grp_NoBidComponents_tags.get(num)
+		if spec is None:
+			break
+		name, pytype, decode_grp = spec
+		if name in d:
+			# repeating group
+			entries.append(entry)
+			entry = FixObject(context)
+			d = entry.__dict__
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	if index > start:
+		entries.append(entry)
+	_check_group(420, nentries, entries)
+	return entries, index
+
+def _encode_grp_NoBidDescriptors(entry, fixm):
+	d = entry.__dict__
+	add = fixm.append
+	if 'BidDescriptorType' in d:
+		add('399=' + str(d['BidDescriptorType']))
+	if 'BidDescriptor' in d:
+		add('400=' + str(d['BidDescriptor']))
+	if 'SideValueInd' in d:
+		add('401=' + str(d['SideValueInd']))
+	if 'LiquidityValue' in d:
+		add('404=' + str(d['LiquidityValue']))
+	if 'LiquidityNumSecurities' in d:
+		add('441=' + str(d['LiquidityNumSecurities']))
+	if 'LiquidityPctLow' in d:
+		add('402=' + str(d['LiquidityPctLow']))
+	if 'LiquidityPctHigh' in d:
+		add('403=' + str(d['LiquidityPctHigh']))
+	if 'EFPTrackingError' in d:
+		add('405=' + str(d['EFPTrackingError']))
+	if 'FairValue' in d:
+		add('406=' + str(d['FairValue']))
+	if 'OutsideIndexPct' in d:
+		add('407=' + str(d['OutsideIndexPct']))
+	if 'ValueOfFutures' in d:
+		add('408=' + str(d['ValueOfFutures']))
+
+def _decode_grp_NoBidDescriptors(fields, index, context, nentries):
+	entries = []
+	entry = FixObject(context)
+	d = entry.__dict__
+	start = index
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _grp_NoBidDescriptors_tags.get(num)
+		if spec is None:
+			break
+		name, pytype, decode_grp = spec
+		if name in d:
+			# repeating group
+			entries.append(entry)
+			entry = FixObject(context)
+			d = entry.__dict__
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	if index > start:
+		entries.append(entry)
+	_check_group(398, nentries, entries)
+	return entries, index
+
+def _encode_grp_NoContraBrokers(entry, fixm):
+	d = entry.__dict__
+	add = fixm.append
+	if 'ContraBroker' in d:
+		add('375=' + str(d['ContraBroker']))
+	if 'ContraTrader' in d:
+		add('337=' + str(d['ContraTrader']))
+	if 'ContraTradeQty' in d:
+		add('437=' + str(d['ContraTradeQty']))
+	if 'ContraTradeTime' in d:
+		add('438=' + str(d['ContraTradeTime']))
+
+def _decode_grp_NoContraBrokers(fields, index, context, nentries):
+	entries = []
+	entry = FixObject(context)
+	d = entry.__dict__
+	start = index
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _grp_NoContraBrokers_tags.get(num)
+		if spec is None:
+			break
+		name, pytype, decode_grp = spec
+		if name in d:
+			# repeating group
+			entries.append(entry)
+			entry = FixObject(context)
+			d = entry.__dict__
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	if index > start:
+		entries.append(entry)
+	_check_group(382, nentries, entries)
+	return entries, index
+
+def _encode_grp_NoExecs(entry, fixm):
+	d = entry.__dict__
+	add = fixm.append
+	if 'LastShares' in d:
+		add('32=' + str(d['LastShares']))
+	if 'ExecID' in d:
+		add('17=' + str(d['ExecID']))
+	if 'LastPx' in d:
+		add('31=' + str(d['LastPx']))
+	if 'LastCapacity' in d:
+		add('29=' + str(d['LastCapacity']))
+
+def _decode_grp_NoExecs(fields, index, context, nentries):
+	entries = []
+	entry = FixObject(context)
+	d = entry.__dict__
+	start = index
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _grp_NoExecs_tags.get(num)
+		if spec is None:
+			break
+		name, pytype, decode_grp = spec
+		if name in d:
+			# repeating group
+			entries.append(entry)
+			entry = FixObject(context)
+			d = entry.__dict__
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	if index > start:
+		entries.append(entry)
+	_check_group(124, nentries, entries)
+	return entries, index
+
+def _encode_grp_NoIOIQualifiers(entry, fixm):
+	d = entry.__dict__
+	add = fixm.append
+	if 'IOIQualifier' in d:
+		add('104=' + str(d['IOIQualifier']))
+
+def _decode_grp_NoIOIQualifiers(fields, index, context, nentries):
+	entries = []
+	entry = FixObject(context)
+	d = entry.__dict__
+	start = index
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _grp_NoIOIQualifiers_tags.get(num)
+		if spec is None:
+			break
+		name, pytype, decode_grp = spec
+		if name in d:
+			# repeating group
+			entries.append(entry)
+			entry = FixObject(context)
+			d = entry.__dict__
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	if index > start:
+		entries.append(entry)
+	_check_group(199, nentries, entries)
+	return entries, index
+
+def _encode_grp_NoMDEntries(entry, fixm):
+	d = entry.__dict__
+	add = fixm.append
+	if 'MDUpdateAction' in d:
+		add('279=' + str(d['MDUpdateAction']))
+	if 'DeleteReason' in d:
+		add('285=' + str(d['DeleteReason']))
+	if 'MDEntryType' in d:
+		add('269=' + str(d['MDEntryType']))
+	if 'MDEntryID' in d:
+		add('278=' + str(d['MDEntryID']))
+	if 'MDEntryRefID' in d:
+		add('280=' + str(d['MDEntryRefID']))
+	if 'Symbol' in d:
+		add('55=' + str(d['Symbol']))
+	if 'SymbolSfx' in d:
+		add('65=' + str(d['SymbolSfx']))
+	if 'SecurityID' in d:
+		add('48=' + str(d['SecurityID']))
+	if 'IDSource' in d:
+		add('22=' + str(d['IDSource']))
+	if 'SecurityType' in d:
+		add('167=' + str(d['SecurityType']))
+	if 'MaturityMonthYear' in d:
+		add('200=' + str(d['MaturityMonthYear']))
+	if 'MaturityDay' in d:
+		add('205=' + str(d['MaturityDay']))
+	if 'PutOrCall' in d:
+		add('201=' + str(d['PutOrCall']))
+	if 'StrikePrice' in d:
+		add('202=' + str(d['StrikePrice']))
+	if 'OptAttribute' in d:
+		add('206=' + str(d['OptAttribute']))
+	if 'ContractMultiplier' in d:
+		add('231=' + str(d['ContractMultiplier']))
+	if 'CouponRate' in d:
+		add('223=' + str(d['CouponRate']))
+	if 'SecurityExchange' in d:
+		add('207=' + str(d['SecurityExchange']))
+	if 'Issuer' in d:
+		add('106=' + str(d['Issuer']))
+	if 'EncodedIssuerLen' in d:
+		add('348=' + str(d['EncodedIssuerLen']))
+	if 'EncodedIssuer' in d:
+		add('349=' + str(d['EncodedIssuer']))
+	if 'SecurityDesc' in d:
+		add('107=' + str(d['SecurityDesc']))
+	if 'EncodedSecurityDescLen' in d:
+		add('350=' + str(d['EncodedSecurityDescLen']))
+	if 'EncodedSecurityDesc' in d:
+		add('351=' + str(d['EncodedSecurityDesc']))
+	if 'FinancialStatus' in d:
+		add('291=' + str(d['FinancialStatus']))
+	if 'CorporateAction' in d:
+		add('292=' + str(d['CorporateAction']))
+	if 'MDEntryPx' in d:
+		add('270=' + str(d['MDEntryPx']))
+	if 'Currency' in d:
+		add('15=' + str(d['Currency']))
+	if 'MDEntrySize' in d:
+		add('271=' + str(d['MDEntrySize']))
+	if 'MDEntryDate' in d:
+		add('272=' + str(d['MDEntryDate']))
+	if 'MDEntryTime' in d:
+		add('273=' + str(d['MDEntryTime']))
+	if 'TickDirection' in d:
+		add('274=' + str(d['TickDirection']))
+	if 'MDMkt' in d:
+		add('275=' + str(d['MDMkt']))
+	if 'TradingSessionID' in d:
+		add('336=' + str(d['TradingSessionID']))
+	if 'QuoteCondition' in d:
+		add('276=' + str(d['QuoteCondition']))
+	if 'TradeCondition' in d:
+		add('277=' + str(d['TradeCondition']))
+	if 'MDEntryOriginator' in d:
+		add('282=' + str(d['MDEntryOriginator']))
+	if 'LocationID' in d:
+		add('283=' + str(d['LocationID']))
+	if 'DeskID' in d:
+		add('284=' + str(d['DeskID']))
+	if 'OpenCloseSettleFlag' in d:
+		add('286=' + str(d['OpenCloseSettleFlag']))
+	if 'TimeInForce' in d:
+		add('59=' + str(d['TimeInForce']))
+	if 'ExpireDate' in d:
+		add('432=' + str(d['ExpireDate']))
+	if 'ExpireTime' in d:
+		add('126=' + str(d['ExpireTime']))
+	if 'MinQty' in d:
+		add('110=' + str(d['MinQty']))
+	if 'ExecInst' in d:
+		add('18=' + str(d['ExecInst']))
+	if 'SellerDays' in d:
+		add('287=' + str(d['SellerDays']))
+	if 'OrderID' in d:
+		add('37=' + str(d['OrderID']))
+	if 'QuoteEntryID' in d:
+		add('299=' + str(d['QuoteEntryID']))
+	if 'MDEntryBuyer' in d:
+		add('288=' + str(d['MDEntryBuyer']))
+	if 'MDEntrySeller' in d:
+		add('289=' + str(d['MDEntrySeller']))
+	if 'NumberOfOrders' in d:
+		add('346=' + str(d['NumberOfOrders']))
+	if 'MDEntryPositionNo' in d:
+		add('290=' + str(d['MDEntryPositionNo']))
+	if 'TotalVolumeTraded' in d:
+		add('387=' + str(d['TotalVolumeTraded']))
+	if 'Text' in d:
+		add('58=' + str(d['Text']))
+	if 'EncodedTextLen' in d:
+		add('354=' + str(d['EncodedTextLen']))
+	if 'EncodedText' in d:
+		add('355=' + str(d['EncodedText']))
+
+def _decode_grp_NoMDEntries(fields, index, context, nentries):
+	entries = []
+	entry = FixObject(context)
+	d = entry.__dict__
+	start = index
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _grp_NoMDEntries_tags.get(num)
+		if spec is None:
+			break
+		name, pytype, decode_grp = spec
+		if name in d:
+			# repeating group
+			entries.append(entry)
+			entry = FixObject(context)
+			d = entry.__dict__
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	if index > start:
+		entries.append(entry)
+	_check_group(268, nentries, entries)
+	return entries, index
+
+def _encode_grp_NoMDEntryTypes(entry, fixm):
+	d = entry.__dict__
+	add = fixm.append
+	if 'MDEntryType' in d:
+		add('269=' + str(d['MDEntryType']))
+
+def _decode_grp_NoMDEntryTypes(fields, index, context, nentries):
+	entries = []
+	entry = FixObject(context)
+	d = entry.__dict__
+	start = index
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _grp_NoMDEntryTypes_tags.get(num)
+		if spec is None:
+			break
+		name, pytype, decode_grp = spec
+		if name in d:
+			# repeating group
+			entries.append(entry)
+			entry = FixObject(context)
+			d = entry.__dict__
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	if index > start:
+		entries.append(entry)
+	_check_group(267, nentries, entries)
+	return entries, index
+
+def _encode_grp_NoMiscFees(entry, fixm):
+	d = entry.__dict__
+	add = fixm.append
+	if 'MiscFeeAmt' in d:
+		add('137=' + str(d['MiscFeeAmt']))
+	if 'MiscFeeCurr' in d:
+		add('138=' + str(d['MiscFeeCurr']))
+	if 'MiscFeeType' in d:
+		add('139=' + str(d['MiscFeeType']))
+
+def _decode_grp_NoMiscFees(fields, index, context, nentries):
+	entries = []
+	entry = FixObject(context)
+	d = entry.__dict__
+	start = index
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _grp_NoMiscFees_tags.get(num)
+		if spec is None:
+			break
+		name, pytype, decode_grp = spec
+		if name in d:
+			# repeating group
+			entries.append(entry)
+			entry = FixObject(context)
+			d = entry.__dict__
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	if index > start:
+		entries.append(entry)
+	_check_group(136, nentries, entries)
+	return entries, index
+
+def _encode_grp_NoMsgTypes(entry, fixm):
+	d = entry.__dict__
+	add = fixm.append
+	if 'RefMsgType' in d:
+		add('372=' + str(d['RefMsgType']))
+	if 'MsgDirection' in d:
+		add('385=' + str(d['MsgDirection']))
+
+def _decode_grp_NoMsgTypes(fields, index, context, nentries):
+	entries = []
+	entry = FixObject(context)
+	d = entry.__dict__
+	start = index
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _grp_NoMsgTypes_tags.get(num)
+		if spec is None:
+			break
+		name, pytype, decode_grp = spec
+		if name in d:
+			# repeating group
+			entries.append(entry)
+			entry = FixObject(context)
+			d = entry.__dict__
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	if index > start:
+		entries.append(entry)
+	_check_group(384, nentries, entries)
+	return entries, index
+
+def _encode_grp_NoOrders(entry, fixm):
+	d = entry.__dict__
+	add = fixm.append
+	if 'ClOrdID' in d:
+		add('11=' + str(d['ClOrdID']))
+	if 'CumQty' in d:
+		add('14=' + str(d['CumQty']))
+	if 'OrdStatus' in d:
+		add('39=' + str(d['OrdStatus']))
+	if 'LeavesQty' in d:
+		add('151=' + str(d['LeavesQty']))
+	if 'CxlQty' in d:
+		add('84=' + str(d['CxlQty']))
+	if 'AvgPx' in d:
+		add('6=' + str(d['AvgPx']))
+	if 'OrdRejReason' in d:
+		add('103=' + str(d['OrdRejReason']))
+	if 'Text' in d:
+		add('58=' + str(d['Text']))
+	if 'EncodedTextLen' in d:
+		add('354=' + str(d['EncodedTextLen']))
+	if 'EncodedText' in d:
+		add('355=' + str(d['EncodedText']))
+
+def _decode_grp_NoOrders(fields, index, context, nentries):
+	entries = []
+	entry = FixObject(context)
+	d = entry.__dict__
+	start = index
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _grp_NoOrders_tags.get(num)
+		if spec is None:
+			break
+		name, pytype, decode_grp = spec
+		if name in d:
+			# repeating group
+			entries.append(entry)
+			entry = FixObject(context)
+			d = entry.__dict__
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	if index > start:
+		entries.append(entry)
+	_check_group(73, nentries, entries)
+	return entries, index
+
+def _encode_grp_NoQuoteEntries(entry, fixm):
+	d = entry.__dict__
+	add = fixm.append
+	if 'QuoteEntryID' in d:
+		add('299=' + str(d['QuoteEntryID']))
+	if 'Symbol' in d:
+		add('55=' + str(d['Symbol']))
+	if 'SymbolSfx' in d:
+		add('65=' + str(d['SymbolSfx']))
+	if 'SecurityID' in d:
+		add('48=' + str(d['SecurityID']))
+	if 'IDSource' in d:
+		add('22=' + str(d['IDSource']))
+	if 'SecurityType' in d:
+		add('167=' + str(d['SecurityType']))
+	if 'MaturityMonthYear' in d:
+		add('200=' + str(d['MaturityMonthYear']))
+	if 'MaturityDay' in d:
+		add('205=' + str(d['MaturityDay']))
+	if 'PutOrCall' in d:
+		add('201=' + str(d['PutOrCall']))
+	if 'StrikePrice' in d:
+		add('202=' + str(d['StrikePrice']))
+	if 'OptAttribute' in d:
+		add('206=' + str(d['OptAttribute']))
+	if 'ContractMultiplier' in d:
+		add('231=' + str(d['ContractMultiplier']))
+	if 'CouponRate' in d:
+		add('223=' + str(d['CouponRate']))
+	if 'SecurityExchange' in d:
+		add('207=' + str(d['SecurityExchange']))
+	if 'Issuer' in d:
+		add('106=' + str(d['Issuer']))
+	if 'EncodedIssuerLen' in d:
+		add('348=' + str(d['EncodedIssuerLen']))
+	if 'EncodedIssuer' in d:
+		add('349=' + str(d['EncodedIssuer']))
+	if 'SecurityDesc' in d:
+		add('107=' + str(d['SecurityDesc']))
+	if 'EncodedSecurityDescLen' in d:
+		add('350=' + str(d['EncodedSecurityDescLen']))
+	if 'EncodedSecurityDesc' in d:
+		add('351=' + str(d['EncodedSecurityDesc']))
+	if 'QuoteEntryRejectReason' in d:
+		add('368=' + str(d['QuoteEntryRejectReason']))
+
+def _decode_grp_NoQuoteEntries(fields, index, context, nentries):
+	entries = []
+	entry = FixObject(context)
+	d = entry.__dict__
+	start = index
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _grp_NoQuoteEntries_tags.get(num)
+		if spec is None:
+			break
+		name, pytype, decode_grp = spec
+		if name in d:
+			# repeating group
+			entries.append(entry)
+			entry = FixObject(context)
+			d = entry.__dict__
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	if index > start:
+		entries.append(entry)
+	_check_group(295, nentries, entries)
+	return entries, index
+
+def _encode_grp_NoQuoteSets(entry, fixm):
+	d = entry.__dict__
+	add = fixm.append
+	if 'QuoteSetID' in d:
+		add('302=' + str(d['QuoteSetID']))
+	if 'UnderlyingSymbol' in d:
+		add('311=' + str(d['UnderlyingSymbol']))
+	if 'UnderlyingSymbolSfx' in d:
+		add('312=' + str(d['UnderlyingSymbolSfx']))
+	if 'UnderlyingSecurityID' in d:
+		add('309=' + str(d['UnderlyingSecurityID']))
+	if 'UnderlyingIDSource' in d:
+		add('305=' + str(d['UnderlyingIDSource']))
+	if 'UnderlyingSecurityType' in d:
+		add('310=' + str(d['UnderlyingSecurityType']))
+	if 'UnderlyingMaturityMonthYear' in d:
+		add('313=' + str(d['UnderlyingMaturityMonthYear']))
+	if 'UnderlyingMaturityDay' in d:
+		add('314=' + str(d['UnderlyingMaturityDay']))
+	if 'UnderlyingPutOrCall' in d:
+		add('315=' + str(d['UnderlyingPutOrCall']))
+	if 'UnderlyingStrikePrice' in d:
+		add('316=' + str(d['UnderlyingStrikePrice']))
+	if 'UnderlyingOptAttribute' in d:
+		add('317=' + str(d['UnderlyingOptAttribute']))
+	if 'UnderlyingContractMultiplier' in d:
+		add('436=' + str(d['UnderlyingContractMultiplier']))
+	if 'UnderlyingCouponRate' in d:
+		add('435=' + str(d['UnderlyingCouponRate']))
+	if 'UnderlyingSecurityExchange' in d:
+		add('308=' + str(d['UnderlyingSecurityExchange']))
+	if 'UnderlyingIssuer' in d:
+		add('306=' + str(d['UnderlyingIssuer']))
+	if 'EncodedUnderlyingIssuerLen' in d:
+		add('362=' + str(d['EncodedUnderlyingIssuerLen']))
+	if 'EncodedUnderlyingIssuer' in d:
+		add('363=' + str(d['EncodedUnderlyingIssuer']))
+	if 'UnderlyingSecurityDesc' in d:
+		add('307=' + str(d['UnderlyingSecurityDesc']))
+	if 'EncodedUnderlyingSecurityDescLen' in d:
+		add('364=' + str(d['EncodedUnderlyingSecurityDescLen']))
+	if 'EncodedUnderlyingSecurityDesc' in d:
+		add('365=' + str(d['EncodedUnderlyingSecurityDesc']))
+	if 'TotQuoteEntries' in d:
+		add('304=' + str(d['TotQuoteEntries']))
+	if 'NoQuoteEntries' in d:
+		add('295=' + str(d['NoQuoteEntries']))
+
+def _decode_grp_NoQuoteSets(fields, index, context, nentries):
+	entries = []
+	entry = FixObject(context)
+	d = entry.__dict__
+	start = index
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _grp_NoQuoteSets_tags.get(num)
+		if spec is None:
+			break
+		name, pytype, decode_grp = spec
+		if name in d:
+			# repeating group
+			entries.append(entry)
+			entry = FixObject(context)
+			d = entry.__dict__
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	if index > start:
+		entries.append(entry)
+	_check_group(296, nentries, entries)
+	return entries, index
+
+def _encode_grp_NoRelatedSym(entry, fixm):
+	d = entry.__dict__
+	add = fixm.append
+	if 'UnderlyingSymbol' in d:
+		add('311=' + str(d['UnderlyingSymbol']))
+	if 'UnderlyingSymbolSfx' in d:
+		add('312=' + str(d['UnderlyingSymbolSfx']))
+	if 'UnderlyingSecurityID' in d:
+		add('309=' + str(d['UnderlyingSecurityID']))
+	if 'UnderlyingIDSource' in d:
+		add('305=' + str(d['UnderlyingIDSource']))
+	if 'UnderlyingSecurityType' in d:
+		add('310=' + str(d['UnderlyingSecurityType']))
+	if 'UnderlyingMaturityMonthYear' in d:
+		add('313=' + str(d['UnderlyingMaturityMonthYear']))
+	if 'UnderlyingMaturityDay' in d:
+		add('314=' + str(d['UnderlyingMaturityDay']))
+	if 'UnderlyingPutOrCall' in d:
+		add('315=' + str(d['UnderlyingPutOrCall']))
+	if 'UnderlyingStrikePrice' in d:
+		add('316=' + str(d['UnderlyingStrikePrice']))
+	if 'UnderlyingOptAttribute' in d:
+		add('317=' + str(d['UnderlyingOptAttribute']))
+	if 'UnderlyingContractMultiplier' in d:
+		add('436=' + str(d['UnderlyingContractMultiplier']))
+	if 'UnderlyingCouponRate' in d:
+		add('435=' + str(d['UnderlyingCouponRate']))
+	if 'UnderlyingSecurityExchange' in d:
+		add('308=' + str(d['UnderlyingSecurityExchange']))
+	if 'UnderlyingIssuer' in d:
+		add('306=' + str(d['UnderlyingIssuer']))
+	if 'EncodedUnderlyingIssuerLen' in d:
+		add('362=' + str(d['EncodedUnderlyingIssuerLen']))
+	if 'EncodedUnderlyingIssuer' in d:
+		add('363=' + str(d['EncodedUnderlyingIssuer']))
+	if 'UnderlyingSecurityDesc' in d:
+		add('307=' + str(d['UnderlyingSecurityDesc']))
+	if 'EncodedUnderlyingSecurityDescLen' in d:
+		add('364=' + str(d['EncodedUnderlyingSecurityDescLen']))
+	if 'EncodedUnderlyingSecurityDesc' in d:
+		add('365=' + str(d['EncodedUnderlyingSecurityDesc']))
+	if 'RatioQty' in d:
+		add('319=' + str(d['RatioQty']))
+	if 'Side' in d:
+		add('54=' + str(d['Side']))
+	if 'UnderlyingCurrency' in d:
+		add('318=' + str(d['UnderlyingCurrency']))
+
+def _decode_grp_NoRelatedSym(fields, index, context, nentries):
+	entries = []
+	entry = FixObject(context)
+	d = entry.__dict__
+	start = index
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _grp_NoRelatedSym_tags.get(num)
+		if spec is None:
+			break
+		name, pytype, decode_grp = spec
+		if name in d:
+			# repeating group
+			entries.append(entry)
+			entry = FixObject(context)
+			d = entry.__dict__
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	if index > start:
+		entries.append(entry)
+	_check_group(146, nentries, entries)
+	return entries, index
+
+def _encode_grp_NoRoutingIDs(entry, fixm):
+	d = entry.__dict__
+	add = fixm.append
+	if 'RoutingType' in d:
+		add('216=' + str(d['RoutingType']))
+	if 'RoutingID' in d:
+		add('217=' + str(d['RoutingID']))
+
+def _decode_grp_NoRoutingIDs(fields, index, context, nentries):
+	entries = []
+	entry = FixObject(context)
+	d = entry.__dict__
+	start = index
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _grp_NoRoutingIDs_tags.get(num)
+		if spec is None:
+			break
+		name, pytype, decode_grp = spec
+		if name in d:
+			# repeating group
+			entries.append(entry)
+			entry = FixObject(context)
+			d = entry.__dict__
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	if index > start:
+		entries.append(entry)
+	_check_group(215, nentries, entries)
+	return entries, index
+
+def _encode_grp_NoStrikes(entry, fixm):
+	d = entry.__dict__
+	add = fixm.append
+	if 'Symbol' in d:
+		add('55=' + str(d['Symbol']))
+	if 'SymbolSfx' in d:
+		add('65=' + str(d['SymbolSfx']))
+	if 'SecurityID' in d:
+		add('48=' + str(d['SecurityID']))
+	if 'IDSource' in d:
+		add('22=' + str(d['IDSource']))
+	if 'SecurityType' in d:
+		add('167=' + str(d['SecurityType']))
+	if 'MaturityMonthYear' in d:
+		add('200=' + str(d['MaturityMonthYear']))
+	if 'MaturityDay' in d:
+		add('205=' + str(d['MaturityDay']))
+	if 'PutOrCall' in d:
+		add('201=' + str(d['PutOrCall']))
+	if 'StrikePrice' in d:
+		add('202=' + str(d['StrikePrice']))
+	if 'OptAttribute' in d:
+		add('206=' + str(d['OptAttribute']))
+	if 'ContractMultiplier' in d:
+		add('231=' + str(d['ContractMultiplier']))
+	if 'CouponRate' in d:
+		add('223=' + str(d['CouponRate']))
+	if 'SecurityExchange' in d:
+		add('207=' + str(d['SecurityExchange']))
+	if 'Issuer' in d:
+		add('106=' + str(d['Issuer']))
+	if 'EncodedIssuerLen' in d:
+		add('348=' + str(d['EncodedIssuerLen']))
+	if 'EncodedIssuer' in d:
+		add('349=' + str(d['EncodedIssuer']))
+	if 'SecurityDesc' in d:
+		add('107=' + str(d['SecurityDesc']))
+	if 'EncodedSecurityDescLen' in d:
+		add('350=' + str(d['EncodedSecurityDescLen']))
+	if 'EncodedSecurityDesc' in d:
+		add('351=' + str(d['EncodedSecurityDesc']))
+	if 'PrevClosePx' in d:
+		add('140=' + str(d['PrevClosePx']))
+	if 'ClOrdID' in d:
+		add('11=' + str(d['ClOrdID']))
+	if 'Side' in d:
+		add('54=' + str(d['Side']))
+	if 'Price' in d:
+		add('44=' + str(d['Price']))
+	if 'Currency' in d:
+		add('15=' + str(d['Currency']))
+	if 'Text' in d:
+		add('58=' + str(d['Text']))
+	if 'EncodedTextLen' in d:
+		add('354=' + str(d['EncodedTextLen']))
+	if 'EncodedText' in d:
+		add('355=' + str(d['EncodedText']))
+
+def _decode_grp_NoStrikes(fields, index, context, nentries):
+	entries = []
+	entry = FixObject(context)
+	d = entry.__dict__
+	start = index
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _grp_NoStrikes_tags.get(num)
+		if spec is None:
+			break
+		name, pytype, decode_grp = spec
+		if name in d:
+			# repeating group
+			entries.append(entry)
+			entry = FixObject(context)
+			d = entry.__dict__
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	if index > start:
+		entries.append(entry)
+	_check_group(428, nentries, entries)
+	return entries, index
+
+def _encode_grp_NoTradingSessions(entry, fixm):
+	d = entry.__dict__
+	add = fixm.append
+	if 'TradingSessionID' in d:
+		add('336=' + str(d['TradingSessionID']))
+
+def _decode_grp_NoTradingSessions(fields, index, context, nentries):
+	entries = []
+	entry = FixObject(context)
+	d = entry.__dict__
+	start = index
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _grp_NoTradingSessions_tags.get(num)
+		if spec is None:
+			break
+		name, pytype, decode_grp = spec
+		if name in d:
+			# repeating group
+			entries.append(entry)
+			entry = FixObject(context)
+			d = entry.__dict__
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	if index > start:
+		entries.append(entry)
+	_check_group(386, nentries, entries)
+	return entries, index
+
+_grp_LinesOfText_tags = {
+	58: ('Text', str, None),
+	354: ('EncodedTextLen', int, None),
+	355: ('EncodedText', str, None),
+}
+
+_grp_NoAllocs_tags = {
+	79: ('AllocAccount', str, None),
+	80: ('AllocShares', float, None),
+}
+
+_grp_NoBidComponents_tags = {
+	12: ('Commission', float, None),
+	13: ('CommType', str, None),
+	66: ('ListID', str, None),
+	421: ('Country', str, None),
+	54: ('Side', str, None),
+	44: ('Price', float, None),
+	423: ('PriceType', int, None),
+	406: ('FairValue', float, None),
+	430: ('NetGrossInd', int, None),
+	63: ('SettlmntTyp', str, None),
+	64: ('FutSettDate', str, None),
+	336: ('TradingSessionID', str, None),
+	58: ('Text', str, None),
+	354: ('EncodedTextLen', int, None),
+	355: ('EncodedText', str, None),
+}
+
+_grp_NoBidDescriptors_tags = {
+	399: ('BidDescriptorType', int, None),
+	400: ('BidDescriptor', str, None),
+	401: ('SideValueInd', int, None),
+	404: ('LiquidityValue', float, None),
+	441: ('LiquidityNumSecurities', int, None),
+	402: ('LiquidityPctLow', float, None),
+	403: ('LiquidityPctHigh', float, None),
+	405: ('EFPTrackingError', float, None),
+	406: ('FairValue', float, None),
+	407: ('OutsideIndexPct', float, None),
+	408: ('ValueOfFutures', float, None),
+}
+
+_grp_NoContraBrokers_tags = {
+	375: ('ContraBroker', str, None),
+	337: ('ContraTrader', str, None),
+	437: ('ContraTradeQty', float, None),
+	438: ('ContraTradeTime', str, None),
+}
+
+_grp_NoExecs_tags = {
+	32: ('LastShares', float, None),
+	17: ('ExecID', str, None),
+	31: ('LastPx', float, None),
+	29: ('LastCapacity', str, None),
+}
+
+_grp_NoIOIQualifiers_tags = {
+	104: ('IOIQualifier', str, None),
+}
+
+_grp_NoMDEntries_tags = {
+	279: ('MDUpdateAction', str, None),
+	285: ('DeleteReason', str, None),
+	269: ('MDEntryType', str, None),
+	278: ('MDEntryID', str, None),
+	280: ('MDEntryRefID', str, None),
+	55: ('Symbol', str, None),
+	65: ('SymbolSfx', str, None),
+	48: ('SecurityID', str, None),
+	22: ('IDSource', str, None),
+	167: ('SecurityType', str, None),
+	200: ('MaturityMonthYear', str, None),
+	205: ('MaturityDay', int, None),
+	201: ('PutOrCall', int, None),
+	202: ('StrikePrice', float, None),
+	206: ('OptAttribute', str, None),
+	231: ('ContractMultiplier', float, None),
+	223: ('CouponRate', float, None),
+	207: ('SecurityExchange', str, None),
+	106: ('Issuer', str, None),
+	348: ('EncodedIssuerLen', int, None),
+	349: ('EncodedIssuer', str, None),
+	107: ('SecurityDesc', str, None),
+	350: ('EncodedSecurityDescLen', int, None),
+	351: ('EncodedSecurityDesc', str, None),
+	291: ('FinancialStatus', str, None),
+	292: ('CorporateAction', str, None),
+	270: ('MDEntryPx', float, None),
+	15: ('Currency', str, None),
+	271: ('MDEntrySize', float, None),
+	272: ('MDEntryDate', str, None),
+	273: ('MDEntryTime', str, None),
+	274: ('TickDirection', str, None),
+	275: ('MDMkt', str, None),
+	336: ('TradingSessionID', str, None),
+	276: ('QuoteCondition', str, None),
+	277: ('TradeCondition', str, None),
+	282: ('MDEntryOriginator', str, None),
+	283: ('LocationID', str, None),
+	284: ('DeskID', str, None),
+	286: ('OpenCloseSettleFlag', str, None),
+	59: ('TimeInForce', str, None),
+	432: ('ExpireDate', str, None),
+	126: ('ExpireTime', str, None),
+	110: ('MinQty', float, None),
+	18: ('ExecInst', str, None),
+	287: ('SellerDays', int, None),
+	37: ('OrderID', str, None),
+	299: ('QuoteEntryID', str, None),
+	288: ('MDEntryBuyer', str, None),
+	289: ('MDEntrySeller', str, None),
+	346: ('NumberOfOrders', int, None),
+	290: ('MDEntryPositionNo', int, None),
+	387: ('TotalVolumeTraded', float, None),
+	58: ('Text', str, None),
+	354: ('EncodedTextLen', int, None),
+	355: ('EncodedText', str, None),
+}
+
+_grp_NoMDEntryTypes_tags = {
+	269: ('MDEntryType', str, None),
+}
+
+_grp_NoMiscFees_tags = {
+	137: ('MiscFeeAmt', float, None),
+	138: ('MiscFeeCurr', str, None),
+	139: ('MiscFeeType', str, None),
+}
+
+_grp_NoMsgTypes_tags = {
+	372: ('RefMsgType', str, None),
+	385: ('MsgDirection', str, None),
+}
+
+_grp_NoOrders_tags = {
+	11: ('ClOrdID', str, None),
+	14: ('CumQty', float, None),
+	39: ('OrdStatus', str, None),
+	151: ('LeavesQty', float, None),
+	84: ('CxlQty', float, None),
+	6: ('AvgPx', float, None),
+	103: ('OrdRejReason', int, None),
+	58: ('Text', str, None),
+	354: ('EncodedTextLen', int, None),
+	355: ('EncodedText', str, None),
+}
+
+_grp_NoQuoteEntries_tags = {
+	299: ('QuoteEntryID', str, None),
+	55: ('Symbol', str, None),
+	65: ('SymbolSfx', str, None),
+	48: ('SecurityID', str, None),
+	22: ('IDSource', str, None),
+	167: ('SecurityType', str, None),
+	200: ('MaturityMonthYear', str, None),
+	205: ('MaturityDay', int, None),
+	201: ('PutOrCall', int, None),
+	202: ('StrikePrice', float, None),
+	206: ('OptAttribute', str, None),
+	231: ('ContractMultiplier', float, None),
+	223: ('CouponRate', float, None),
+	207: ('SecurityExchange', str, None),
+	106: ('Issuer', str, None),
+	348: ('EncodedIssuerLen', int, None),
+	349: ('EncodedIssuer', str, None),
+	107: ('SecurityDesc', str, None),
+	350: ('EncodedSecurityDescLen', int, None),
+	351: ('EncodedSecurityDesc', str, None),
+	368: ('QuoteEntryRejectReason', int, None),
+}
+
+_grp_NoQuoteSets_tags = {
+	302: ('QuoteSetID', str, None),
+	311: ('UnderlyingSymbol', str, None),
+	312: ('UnderlyingSymbolSfx', str, None),
+	309: ('UnderlyingSecurityID', str, None),
+	305: ('UnderlyingIDSource', str, None),
+	310: ('UnderlyingSecurityType', str, None),
+	313: ('UnderlyingMaturityMonthYear', str, None),
+	314: ('UnderlyingMaturityDay', int, None),
+	315: ('UnderlyingPutOrCall', int, None),
+	316: ('UnderlyingStrikePrice', float, None),
+	317: ('UnderlyingOptAttribute', str, None),
+	436: ('UnderlyingContractMultiplier', float, None),
+	435: ('UnderlyingCouponRate', float, None),
+	308: ('UnderlyingSecurityExchange', str, None),
+	306: ('UnderlyingIssuer', str, None),
+	362: ('EncodedUnderlyingIssuerLen', int, None),
+	363: ('EncodedUnderlyingIssuer', str, None),
+	307: ('UnderlyingSecurityDesc', str, None),
+	364: ('EncodedUnderlyingSecurityDescLen', int, None),
+	365: ('EncodedUnderlyingSecurityDesc', str, None),
+	304: ('TotQuoteEntries', int, None),
+	295: ('NoQuoteEntries', int, None),
+}
+
+_grp_NoRelatedSym_tags = {
+	311: ('UnderlyingSymbol', str, None),
+	312: ('UnderlyingSymbolSfx', str, None),
+	309: ('UnderlyingSecurityID', str, None),
+	305: ('UnderlyingIDSource', str, None),
+	310: ('UnderlyingSecurityType', str, None),
+	313: ('UnderlyingMaturityMonthYear', str, None),
+	314: ('UnderlyingMaturityDay', int, None),
+	315: ('UnderlyingPutOrCall', int, None),
+	316: ('UnderlyingStrikePrice', float, None),
+	317: ('UnderlyingOptAttribute', str, None),
+	436: ('UnderlyingContractMultiplier', float, None),
+	435: ('UnderlyingCouponRate', float, None),
+	308: ('UnderlyingSecurityExchange', str, None),
+	306: ('UnderlyingIssuer', str, None),
+	362: ('EncodedUnderlyingIssuerLen', int, None),
+	363: ('EncodedUnderlyingIssuer', str, None),
+	307: ('UnderlyingSecurityDesc', str, None),
+	364: ('EncodedUnderlyingSecurityDescLen', int, None),
+	365: ('EncodedUnderlyingSecurityDesc', str, None),
+	319: ('RatioQty', float, None),
+	54: ('Side', str, None),
+	318: ('UnderlyingCurrency', str, None),
+}
+
+_grp_NoRoutingIDs_tags = {
+	216: ('RoutingType', int, None),
+	217: ('RoutingID', str, None),
+}
+
+_grp_NoStrikes_tags = {
+	55: ('Symbol', str, None),
+	65: ('SymbolSfx', str, None),
+	48: ('SecurityID', str, None),
+	22: ('IDSource', str, None),
+	167: ('SecurityType', str, None),
+	200: ('MaturityMonthYear', str, None),
+	205: ('MaturityDay', int, None),
+	201: ('PutOrCall', int, None),
+	202: ('StrikePrice', float, None),
+	206: ('OptAttribute', str, None),
+	231: ('ContractMultiplier', float, None),
+	223: ('CouponRate', float, None),
+	207: ('SecurityExchange', str, None),
+	106: ('Issuer', str, None),
+	348: ('EncodedIssuerLen', int, None),
+	349: ('EncodedIssuer', str, None),
+	107: ('SecurityDesc', str, None),
+	350: ('EncodedSecurityDescLen', int, None),
+	351: ('EncodedSecurityDesc', str, None),
+	140: ('PrevClosePx', float, None),
+	11: ('ClOrdID', str, None),
+	54: ('Side', str, None),
+	44: ('Price', float, None),
+	15: ('Currency', str, None),
+	58: ('Text', str, None),
+	354: ('EncodedTextLen', int, None),
+	355: ('EncodedText', str, None),
+}
+
+_grp_NoTradingSessions_tags = {
+	336: ('TradingSessionID', str, None),
+}
+
+_msg_Advertisement_names = frozenset(['AdvId', 'AdvTransType', 'AdvRefID', 'Symbol', 'SymbolSfx', 'SecurityID', 'IDSource', 'SecurityType', 'MaturityMonthYear', 'MaturityDay', 'PutOrCall', 'StrikePrice', 'OptAttribute', 'ContractMultiplier', 'CouponRate', 'SecurityExchange', 'Issuer', 'EncodedIssuerLen', 'EncodedIssuer', 'SecurityDesc', 'EncodedSecurityDescLen', 'EncodedSecurityDesc', 'AdvSide', 'Shares', 'Price', 'Currency', 'TradeDate', 'TransactTime', 'Text', 'EncodedTextLen', 'EncodedText', 'URLLink', 'LastMkt', 'TradingSessionID'])
+
+_msg_Advertisement_tags = {
+	2: ('AdvId', str, None),
+	5: ('AdvTransType', str, None),
+	3: ('AdvRefID', str, None),
+	55: ('Symbol', str, None),
+	65: ('SymbolSfx', str, None),
+	48: ('SecurityID', str, None),
+	22: ('IDSource', str, None),
+	167: ('SecurityType', str, None),
+	200: ('MaturityMonthYear', str, None),
+	205: ('MaturityDay', int, None),
+	201: ('PutOrCall', int, None),
+	202: ('StrikePrice', float, None),
+	206: ('OptAttribute', str, None),
+	231: ('ContractMultiplier', float, None),
+	223: ('CouponRate', float, None),
+	207: ('SecurityExchange', str, None),
+	106: ('Issuer', str, None),
+	348: ('EncodedIssuerLen', int, None),
+	349: ('EncodedIssuer', str, None),
+	107: ('SecurityDesc', str, None),
+	350: ('EncodedSecurityDescLen', int, None),
+	351: ('EncodedSecurityDesc', str, None),
+	4: ('AdvSide', str, None),
+	53: ('Shares', float, None),
+	44: ('Price', float, None),
+	15: ('Currency', str, None),
+	75: ('TradeDate', str, None),
+	60: ('TransactTime', str, None),
+	58: ('Text', str, None),
+	354: ('EncodedTextLen', int, None),
+	355: ('EncodedText', str, None),
+	149: ('URLLink', str, None),
+	30: ('LastMkt', str, None),
+	336: ('TradingSessionID', str, None),
+}
+
+def _encode_Advertisement(obj, fixm):
+	d = obj.__dict__
+	add = fixm.append
+	n = 1
+	if 'AdvId' in d:
+		add('2=' + str(d['AdvId']))
+		n += 1
+	if 'AdvTransType' in d:
+		add('5=' + str(d['AdvTransType']))
+		n += 1
+	if 'AdvRefID' in d:
+		add('3=' + str(d['AdvRefID']))
+		n += 1
+	if 'Symbol' in d:
+		add('55=' + str(d['Symbol']))
+		n += 1
+	if 'SymbolSfx' in d:
+		add('65=' + str(d['SymbolSfx']))
+		n += 1
+	if 'SecurityID' in d:
+		add('48=' + str(d['SecurityID']))
+		n += 1
+	if 'IDSource' in d:
+		add('22=' + str(d['IDSource']))
+		n += 1
+	if 'SecurityType' in d:
+		add('167=' + str(d['SecurityType']))
+		n += 1
+	if 'MaturityMonthYear' in d:
+		add('200=' + str(d['MaturityMonthYear']))
+		n += 1
+	if 'MaturityDay' in d:
+		add('205=' + str(d['MaturityDay']))
+		n += 1
+	if 'PutOrCall' in d:
+		add('201=' + str(d['PutOrCall']))
+		n += 1
+	if 'StrikePrice' in d:
+		add('202=' + str(d['StrikePrice']))
+		n += 1
+	if 'OptAttribute' in d:
+		add('206=' + str(d['OptAttribute']))
+		n += 1
+	if 'ContractMultiplier' in d:
+		add('231=' + str(d['ContractMultiplier']))
+		n += 1
+	if 'CouponRate' in d:
+		add('223=' + str(d['CouponRate']))
+		n += 1
+	if 'SecurityExchange' in d:
+		add('207=' + str(d['SecurityExchange']))
+		n += 1
+	if 'Issuer' in d:
+		add('106=' + str(d['Issuer']))
+		n += 1
+	if 'EncodedIssuerLen' in d:
+		add('348=' + str(d['EncodedIssuerLen']))
+		n += 1
+	if 'EncodedIssuer' in d:
+		add('349=' + str(d['EncodedIssuer']))
+		n += 1
+	if 'SecurityDesc' in d:
+		add('107=' + str(d['SecurityDesc']))
+		n += 1
+	if 'EncodedSecurityDescLen' in d:
+		add('350=' + str(d['EncodedSecurityDescLen']))
+		n += 1
+	if 'EncodedSecurityDesc' in d:
+		add('351=' + str(d['EncodedSecurityDesc']))
+		n += 1
+	if 'AdvSide' in d:
+		add('4=' + str(d['AdvSide']))
+		n += 1
+	if 'Shares' in d:
+		add('53=' + str(d['Shares']))
+		n += 1
+	if 'Price' in d:
+		add('44=' + str(d['Price']))
+		n += 1
+	if 'Currency' in d:
+		add('15=' + str(d['Currency']))
+		n += 1
+	if 'TradeDate' in d:
+		add('75=' + str(d['TradeDate']))
+		n += 1
+	if 'TransactTime' in d:
+		add('60=' + str(d['TransactTime']))
+		n += 1
+	if 'Text' in d:
+		add('58=' + str(d['Text']))
+		n += 1
+	if 'EncodedTextLen' in d:
+		add('354=' + str(d['EncodedTextLen']))
+		n += 1
+	if 'EncodedText' in d:
+		add('355=' + str(d['EncodedText']))
+		n += 1
+	if 'URLLink' in d:
+		add('149=' + str(d['URLLink']))
+		n += 1
+	if 'LastMkt' in d:
+		add('30=' + str(d['LastMkt']))
+		n += 1
+	if 'TradingSessionID' in d:
+		add('336=' + str(d['TradingSessionID']))
+		n += 1
+	if len(d) > n:
+		_make_mbody(obj, obj._context, fixm, _msg_Advertisement_names)
+	return fixm
+
+def _decode_Advertisement(obj, fields, index, context):
+	d = obj.__dict__
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _msg_Advertisement_tags.get(num)
+		if spec is None:
+			# not a field of this message, continue with generic decoder
+			body, index = _extract_body(fields, index, context, obj)
+			return index
+		name, pytype, decode_grp = spec
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	return index
+
 class Advertisement(FixObject):
-	pass
+	_encode = staticmethod(_encode_Advertisement)
+	_decode = staticmethod(_decode_Advertisement)
+
+_msg_Allocation_names = frozenset(['AllocID', 'AllocTransType', 'RefAllocID', 'AllocLinkID', 'AllocLinkType', 'NoOrders', 'NoExecs', 'Side', 'Symbol', 'SymbolSfx', 'SecurityID', 'IDSource', 'SecurityType', 'MaturityMonthYear', 'MaturityDay', 'PutOrCall', 'StrikePrice', 'OptAttribute', 'ContractMultiplier', 'CouponRate', 'SecurityExchange', 'Issuer', 'EncodedIssuerLen', 'EncodedIssuer', 'SecurityDesc', 'EncodedSecurityDescLen', 'EncodedSecurityDesc', 'Shares', 'LastMkt', 'TradingSessionID', 'AvgPx', 'Currency', 'AvgPrxPrecision', 'TradeDate', 'TransactTime', 'SettlmntTyp', 'FutSettDate', 'GrossTradeAmt', 'NetMoney', 'OpenClose', 'Text', 'EncodedTextLen', 'EncodedText', 'NumDaysInterest', 'AccruedInterestRate', 'NoAllocs'])
+
+_msg_Allocation_tags = {
+	70: ('AllocID', str, None),
+	71: ('AllocTransType', str, None),
+	72: ('RefAllocID', str, None),
+	196: ('AllocLinkID', str, None),
+	197: ('AllocLinkType', int, None),
+	73: ('NoOrders', int, None),
+	124: ('NoExecs', int, None),
+	54: ('Side', str, None),
+	55: ('Symbol', str, None),
+	65: ('SymbolSfx', str, None),
+	48: ('SecurityID', str, None),
+	22: ('IDSource', str, None),
+	167: ('SecurityType', str, None),
+	200: ('MaturityMonthYear', str, None),
+	205: ('MaturityDay', int, None),
+	201: ('PutOrCall', int, None),
+	202: ('StrikePrice', float, None),
+	206: ('OptAttribute', str, None),
+	231: ('ContractMultiplier', float, None),
+	223: ('CouponRate', float, None),
+	207: ('SecurityExchange', str, None),
+	106: ('Issuer', str, None),
+	348: ('EncodedIssuerLen', int, None),
+	349: ('EncodedIssuer', str, None),
+	107: ('SecurityDesc', str, None),
+	350: ('EncodedSecurityDescLen', int, None),
+	351: ('EncodedSecurityDesc', str, None),
+	53: ('Shares', float, None),
+	30: ('LastMkt', str, None),
+	336: ('TradingSessionID', str, None),
+	6: ('AvgPx', float, None),
+	15: ('Currency', str, None),
+	74: ('AvgPrxPrecision', int, None),
+	75: ('TradeDate', str, None),
+	60: ('TransactTime', str, None),
+	63: ('SettlmntTyp', str, None),
+	64: ('FutSettDate', str, None),
+	381: ('GrossTradeAmt', float, None),
+	118: ('NetMoney', float, None),
+	77: ('OpenClose', str, None),
+	58: ('Text', str, None),
+	354: ('EncodedTextLen', int, None),
+	355: ('EncodedText', str, None),
+	157: ('NumDaysInterest', int, None),
+	158: ('AccruedInterestRate', float, None),
+	78: ('NoAllocs', int, None),
+}
+
+def _encode_Allocation(obj, fixm):
+	d = obj.__dict__
+	add = fixm.append
+	n = 1
+	if 'AllocID' in d:
+		add('70=' + str(d['AllocID']))
+		n += 1
+	if 'AllocTransType' in d:
+		add('71=' + str(d['AllocTransType']))
+		n += 1
+	if 'RefAllocID' in d:
+		add('72=' + str(d['RefAllocID']))
+		n += 1
+	if 'AllocLinkID' in d:
+		add('196=' + str(d['AllocLinkID']))
+		n += 1
+	if 'AllocLinkType' in d:
+		add('197=' + str(d['AllocLinkType']))
+		n += 1
+	if 'NoOrders' in d:
+		add('73=' + str(d['NoOrders']))
+		n += 1
+	if 'NoExecs' in d:
+		add('124=' + str(d['NoExecs']))
+		n += 1
+	if 'Side' in d:
+		add('54=' + str(d['Side']))
+		n += 1
+	if 'Symbol' in d:
+		add('55=' + str(d['Symbol']))
+		n += 1
+	if 'SymbolSfx' in d:
+		add('65=' + str(d['SymbolSfx']))
+		n += 1
+	if 'SecurityID' in d:
+		add('48=' + str(d['SecurityID']))
+		n += 1
+	if 'IDSource' in d:
+		add('22=' + str(d['IDSource']))
+		n += 1
+	if 'SecurityType' in d:
+		add('167=' + str(d['SecurityType']))
+		n += 1
+	if 'MaturityMonthYear' in d:
+		add('200=' + str(d['MaturityMonthYear']))
+		n += 1
+	if 'MaturityDay' in d:
+		add('205=' + str(d['MaturityDay']))
+		n += 1
+	if 'PutOrCall' in d:
+		add('201=' + str(d['PutOrCall']))
+		n += 1
+	if 'StrikePrice' in d:
+		add('202=' + str(d['StrikePrice']))
+		n += 1
+	if 'OptAttribute' in d:
+		add('206=' + str(d['OptAttribute']))
+		n += 1
+	if 'ContractMultiplier' in d:
+		add('231=' + str(d['ContractMultiplier']))
+		n += 1
+	if 'CouponRate' in d:
+		add('223=' + str(d['CouponRate']))
+		n += 1
+	if 'SecurityExchange' in d:
+		add('207=' + str(d['SecurityExchange']))
+		n += 1
+	if 'Issuer' in d:
+		add('106=' + str(d['Issuer']))
+		n += 1
+	if 'EncodedIssuerLen' in d:
+		add('348=' + str(d['EncodedIssuerLen']))
+		n += 1
+	if 'EncodedIssuer' in d:
+		add('349=' + str(d['EncodedIssuer']))
+		n += 1
+	if 'SecurityDesc' in d:
+		add('107=' + str(d['SecurityDesc']))
+		n += 1
+	if 'EncodedSecurityDescLen' in d:
+		add('350=' + str(d['EncodedSecurityDescLen']))
+		n += 1
+	if 'EncodedSecurityDesc' in d:
+		add('351=' + str(d['EncodedSecurityDesc']))
+		n += 1
+	if 'Shares' in d:
+		add('53=' + str(d['Shares']))
+		n += 1
+	if 'LastMkt' in d:
+		add('30=' + str(d['LastMkt']))
+		n += 1
+	if 'TradingSessionID' in d:
+		add('336=' + str(d['TradingSessionID']))
+		n += 1
+	if 'AvgPx' in d:
+		add('6=' + str(d['AvgPx']))
+		n += 1
+	if 'Currency' in d:
+		add('15=' + str(d['Currency']))
+		n += 1
+	if 'AvgPrxPrecision' in d:
+		add('74=' + str(d['AvgPrxPrecision']))
+		n += 1
+	if 'TradeDate' in d:
+		add('75=' + str(d['TradeDate']))
+		n += 1
+	if 'TransactTime' in d:
+		add('60=' + str(d['TransactTime']))
+		n += 1
+	if 'SettlmntTyp' in d:
+		add('63=' + str(d['SettlmntTyp']))
+		n += 1
+	if 'FutSettDate' in d:
+		add('64=' + str(d['FutSettDate']))
+		n += 1
+	if 'GrossTradeAmt' in d:
+		add('381=' + str(d['GrossTradeAmt']))
+		n += 1
+	if 'NetMoney' in d:
+		add('118=' + str(d['NetMoney']))
+		n += 1
+	if 'OpenClose' in d:
+		add('77=' + str(d['OpenClose']))
+		n += 1
+	if 'Text' in d:
+		add('58=' + str(d['Text']))
+		n += 1
+	if 'EncodedTextLen' in d:
+		add('354=' + str(d['EncodedTextLen']))
+		n += 1
+	if 'EncodedText' in d:
+		add('355=' + str(d['EncodedText']))
+		n += 1
+	if 'NumDaysInterest' in d:
+		add('157=' + str(d['NumDaysInterest']))
+		n += 1
+	if 'AccruedInterestRate' in d:
+		add('158=' + str(d['AccruedInterestRate']))
+		n += 1
+	if 'NoAllocs' in d:
+		add('78=' + str(d['NoAllocs']))
+		n += 1
+	if len(d) > n:
+		_make_mbody(obj, obj._context, fixm, _msg_Allocation_names)
+	return fixm
+
+def _decode_Allocation(obj, fields, index, context):
+	d = obj.__dict__
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _msg_Allocation_tags.get(num)
+		if spec is None:
+			# not a field of this message, continue with generic decoder
+			body, index = _extract_body(fields, index, context, obj)
+			return index
+		name, pytype, decode_grp = spec
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	return index
 
 class Allocation(FixObject):
-	pass
+	_encode = staticmethod(_encode_Allocation)
+	_decode = staticmethod(_decode_Allocation)
+
+_msg_AllocationACK_names = frozenset(['ClientID', 'ExecBroker', 'AllocID', 'TradeDate', 'TransactTime', 'AllocStatus', 'AllocRejCode', 'Text', 'EncodedTextLen', 'EncodedText'])
+
+_msg_AllocationACK_tags = {
+	109: ('ClientID', str, None),
+	76: ('ExecBroker', str, None),
+	70: ('AllocID', str, None),
+	75: ('TradeDate', str, None),
+	60: ('TransactTime', str, None),
+	87: ('AllocStatus', int, None),
+	88: ('AllocRejCode', int, None),
+	58: ('Text', str, None),
+	354: ('EncodedTextLen', int, None),
+	355: ('EncodedText', str, None),
+}
+
+def _encode_AllocationACK(obj, fixm):
+	d = obj.__dict__
+	add = fixm.append
+	n = 1
+	if 'ClientID' in d:
+		add('109=' + str(d['ClientID']))
+		n += 1
+	if 'ExecBroker' in d:
+		add('76=' + str(d['ExecBroker']))
+		n += 1
+	if 'AllocID' in d:
+		add('70=' + str(d['AllocID']))
+		n += 1
+	if 'TradeDate' in d:
+		add('75=' + str(d['TradeDate']))
+		n += 1
+	if 'TransactTime' in d:
+		add('60=' + str(d['TransactTime']))
+		n += 1
+	if 'AllocStatus' in d:
+		add('87=' + str(d['AllocStatus']))
+		n += 1
+	if 'AllocRejCode' in d:
+		add('88=' + str(d['AllocRejCode']))
+		n += 1
+	if 'Text' in d:
+		add('58=' + str(d['Text']))
+		n += 1
+	if 'EncodedTextLen' in d:
+		add('354=' + str(d['EncodedTextLen']))
+		n += 1
+	if 'EncodedText' in d:
+		add('355=' + str(d['EncodedText']))
+		n += 1
+	if len(d) > n:
+		_make_mbody(obj, obj._context, fixm, _msg_AllocationACK_names)
+	return fixm
+
+def _decode_AllocationACK(obj, fields, index, context):
+	d = obj.__dict__
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _msg_AllocationACK_tags.get(num)
+		if spec is None:
+			# not a field of this message, continue with generic decoder
+			body, index = _extract_body(fields, index, context, obj)
+			return index
+		name, pytype, decode_grp = spec
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	return index
 
 class AllocationACK(FixObject):
-	pass
+	_encode = staticmethod(_encode_AllocationACK)
+	_decode = staticmethod(_decode_AllocationACK)
+
+_msg_BidRequest_names = frozenset(['BidID', 'ClientBidID', 'BidRequestTransType', 'ListName', 'TotalNumSecurities', 'BidType', 'NumTickets', 'Currency', 'SideValue1', 'SideValue2', 'NoBidDescriptors', 'NoBidComponents', 'LiquidityIndType', 'WtAverageLiquidity', 'ExchangeForPhysical', 'OutMainCntryUIndex', 'CrossPercent', 'ProgRptReqs', 'ProgPeriodInterval', 'IncTaxInd', 'ForexReq', 'NumBidders', 'TradeDate', 'TradeType', 'BasisPxType', 'StrikeTime', 'Text', 'EncodedTextLen', 'EncodedText'])
+
+_msg_BidRequest_tags = {
+	390: ('BidID', str, None),
+	391: ('ClientBidID', str, None),
+	374: ('BidRequestTransType', str, None),
+	392: ('ListName', str, None),
+	393: ('TotalNumSecurities', int, None),
+	394: ('BidType', int, None),
+	395: ('NumTickets', int, None),
+	15: ('Currency', str, None),
+	396: ('SideValue1', float, None),
+	397: ('SideValue2', float, None),
+	398: ('NoBidDescriptors', int, None),
+	420: ('NoBidComponents', int, None),
+	409: ('LiquidityIndType', int, None),
+	410: ('WtAverageLiquidity', float, None),
+	411: ('ExchangeForPhysical', str, None),
+	412: ('OutMainCntryUIndex', float, None),
+	413: ('CrossPercent', float, None),
+	414: ('ProgRptReqs', int, None),
+	415: ('ProgPeriodInterval', int, None),
+	416: ('IncTaxInd', int, None),
+	121: ('ForexReq', str, None),
+	417: ('NumBidders', int, None),
+	75: ('TradeDate', str, None),
+	418: ('TradeType', str, None),
+	419: ('BasisPxType', str, None),
+	443: ('StrikeTime', str, None),
+	58: ('Text', str, None),
+	354: ('EncodedTextLen', int, None),
+	355: ('EncodedText', str, None),
+}
+
+def _encode_BidRequest(obj, fixm):
+	d = obj.__dict__
+	add = fixm.append
+	n = 1
+	if 'BidID' in d:
+		add('390=' + str(d['BidID']))
+		n += 1
+	if 'ClientBidID' in d:
+		add('391=' + str(d['ClientBidID']))
+		n += 1
+	if 'BidRequestTransType' in d:
+		add('374=' + str(d['BidRequestTransType']))
+		n += 1
+	if 'ListName' in d:
+		add('392=' + str(d['ListName']))
+		n += 1
+	if 'TotalNumSecurities' in d:
+		add('393=' + str(d['TotalNumSecurities']))
+		n += 1
+	if 'BidType' in d:
+		add('394=' + str(d['BidType']))
+		n += 1
+	if 'NumTickets' in d:
+		add('395=' + str(d['NumTickets']))
+		n += 1
+	if 'Currency' in d:
+		add('15=' + str(d['Currency']))
+		n += 1
+	if 'SideValue1' in d:
+		add('396=' + str(d['SideValue1']))
+		n += 1
+	if 'SideValue2' in d:
+		add('397=' + str(d['SideValue2']))
+		n += 1
+	if 'NoBidDescriptors' in d:
+		add('398=' + str(d['NoBidDescriptors']))
+		n += 1
+	if 'NoBidComponents' in d:
+		add('420=' + str(d['NoBidComponents']))
+		n += 1
+	if 'LiquidityIndType' in d:
+		add('409=' + str(d['LiquidityIndType']))
+		n += 1
+	if 'WtAverageLiquidity' in d:
+		add('410=' + str(d['WtAverageLiquidity']))
+		n += 1
+	if 'ExchangeForPhysical' in d:
+		add('411=' + str(d['ExchangeForPhysical']))
+		n += 1
+	if 'OutMainCntryUIndex' in d:
+		add('412=' + str(d['OutMainCntryUIndex']))
+		n += 1
+	if 'CrossPercent' in d:
+		add('413=' + str(d['CrossPercent']))
+		n += 1
+	if 'ProgRptReqs' in d:
+		add('414=' + str(d['ProgRptReqs']))
+		n += 1
+	if 'ProgPeriodInterval' in d:
+		add('415=' + str(d['ProgPeriodInterval']))
+		n += 1
+	if 'IncTaxInd' in d:
+		add('416=' + str(d['IncTaxInd']))
+		n += 1
+	if 'ForexReq' in d:
+		add('121=' + str(d['ForexReq']))
+		n += 1
+	if 'NumBidders' in d:
+		add('417=' + str(d['NumBidders']))
+		n += 1
+	if 'TradeDate' in d:
+		add('75=' + str(d['TradeDate']))
+		n += 1
+	if 'TradeType' in d:
+		add('418=' + str(d['TradeType']))
+		n += 1
+	if 'BasisPxType' in d:
+		add('419=' + str(d['BasisPxType']))
+		n += 1
+	if 'StrikeTime' in d:
+		add('443=' + str(d['StrikeTime']))
+		n += 1
+	if 'Text' in d:
+		add('58=' + str(d['Text']))
+		n += 1
+	if 'EncodedTextLen' in d:
+		add('354=' + str(d['EncodedTextLen']))
+		n += 1
+	if 'EncodedText' in d:
+		add('355=' + str(d['EncodedText']))
+		n += 1
+	if len(d) > n:
+		_make_mbody(obj, obj._context, fixm, _msg_BidRequest_names)
+	return fixm
+
+def _decode_BidRequest(obj, fields, index, context):
+	d = obj.__dict__
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _msg_BidRequest_tags.get(num)
+		if spec is None:
+			# not a field of this message, continue with generic decoder
+			body, index = _extract_body(fields, index, context, obj)
+			return index
+		name, pytype, decode_grp = spec
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	return index
 
 class BidRequest(FixObject):
-	pass
+	_encode = staticmethod(_encode_BidRequest)
+	_decode = staticmethod(_decode_BidRequest)
+
+_msg_BidResponse_names = frozenset(['BidID', 'ClientBidID', 'NoBidComponents'])
+
+_msg_BidResponse_tags = {
+	390: ('BidID', str, None),
+	391: ('ClientBidID', str, None),
+	420: ('NoBidComponents', int, None),
+}
+
+def _encode_BidResponse(obj, fixm):
+	d = obj.__dict__
+	add = fixm.append
+	n = 1
+	if 'BidID' in d:
+		add('390=' + str(d['BidID']))
+		n += 1
+	if 'ClientBidID' in d:
+		add('391=' + str(d['ClientBidID']))
+		n += 1
+	if 'NoBidComponents' in d:
+		add('420=' + str(d['NoBidComponents']))
+		n += 1
+	if len(d) > n:
+		_make_mbody(obj, obj._context, fixm, _msg_BidResponse_names)
+	return fixm
+
+def _decode_BidResponse(obj, fields, index, context):
+	d = obj.__dict__
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _msg_BidResponse_tags.get(num)
+		if spec is None:
+			# not a field of this message, continue with generic decoder
+			body, index = _extract_body(fields, index, context, obj)
+			return index
+		name, pytype, decode_grp = spec
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	return index
 
 class BidResponse(FixObject):
-	pass
+	_encode = staticmethod(_encode_BidResponse)
+	_decode = staticmethod(_decode_BidResponse)
+
+_msg_BusinessMessageReject_names = frozenset(['RefSeqNum', 'RefMsgType', 'BusinessRejectRefID', 'BusinessRejectReason', 'Text', 'EncodedTextLen', 'EncodedText'])
+
+_msg_BusinessMessageReject_tags = {
+	45: ('RefSeqNum', int, None),
+	372: ('RefMsgType', str, None),
+	379: ('BusinessRejectRefID', str, None),
+	380: ('BusinessRejectReason', int, None),
+	58: ('Text', str, None),
+	354: ('EncodedTextLen', int, None),
+	355: ('EncodedText', str, None),
+}
+
+def _encode_BusinessMessageReject(obj, fixm):
+	d = obj.__dict__
+	add = fixm.append
+	n = 1
+	if 'RefSeqNum' in d:
+		add('45=' + str(d['RefSeqNum']))
+		n += 1
+	if 'RefMsgType' in d:
+		add('372=' + str(d['RefMsgType']))
+		n += 1
+	if 'BusinessRejectRefID' in d:
+		add('379=' + str(d['BusinessRejectRefID']))
+		n += 1
+	if 'BusinessRejectReason' in d:
+		add('380=' + str(d['BusinessRejectReason']))
+		n += 1
+	if 'Text' in d:
+		add('58=' + str(d['Text']))
+		n += 1
+	if 'EncodedTextLen' in d:
+		add('354=' + str(d['EncodedTextLen']))
+		n += 1
+	if 'EncodedText' in d:
+		add('355=' + str(d['EncodedText']))
+		n += 1
+	if len(d) > n:
+		_make_mbody(obj, obj._context, fixm, _msg_BusinessMessageReject_names)
+	return fixm
+
+def _decode_BusinessMessageReject(obj, fields, index, context):
+	d = obj.__dict__
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _msg_BusinessMessageReject_tags.get(num)
+		if spec is None:
+			# not a field of this message, continue with generic decoder
+			body, index = _extract_body(fields, index, context, obj)
+			return index
+		name, pytype, decode_grp = spec
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	return index
 
 class BusinessMessageReject(FixObject):
-	pass
+	_encode = staticmethod(_encode_BusinessMessageReject)
+	_decode = staticmethod(_decode_BusinessMessageReject)
+
+_msg_DontKnowTrade_names = frozenset(['OrderID', 'ExecID', 'DKReason', 'Symbol', 'SymbolSfx', 'SecurityID', 'IDSource', 'SecurityType', 'MaturityMonthYear', 'MaturityDay', 'PutOrCall', 'StrikePrice', 'OptAttribute', 'ContractMultiplier', 'CouponRate', 'SecurityExchange', 'Issuer', 'EncodedIssuerLen', 'EncodedIssuer', 'SecurityDesc', 'EncodedSecurityDescLen', 'EncodedSecurityDesc', 'Side', 'OrderQty', 'CashOrderQty', 'LastShares', 'LastPx', 'Text', 'EncodedTextLen', 'EncodedText'])
+
+_msg_DontKnowTrade_tags = {
+	37: ('OrderID', str, None),
+	17: ('ExecID', str, None),
+	127: ('DKReason', str, None),
+	55: ('Symbol', str, None),
+	65: ('SymbolSfx', str, None),
+	48: ('SecurityID', str, None),
+	22: ('IDSource', str, None),
+	167: ('SecurityType', str, None),
+	200: ('MaturityMonthYear', str, None),
+	205: ('MaturityDay', int, None),
+	201: ('PutOrCall', int, None),
+	202: ('StrikePrice', float, None),
+	206: ('OptAttribute', str, None),
+	231: ('ContractMultiplier', float, None),
+	223: ('CouponRate', float, None),
+	207: ('SecurityExchange', str, None),
+	106: ('Issuer', str, None),
+	348: ('EncodedIssuerLen', int, None),
+	349: ('EncodedIssuer', str, None),
+	107: ('SecurityDesc', str, None),
+	350: ('EncodedSecurityDescLen', int, None),
+	351: ('EncodedSecurityDesc', str, None),
+	54: ('Side', str, None),
+	38: ('OrderQty', float, None),
+	152: ('CashOrderQty', float, None),
+	32: ('LastShares', float, None),
+	31: ('LastPx', float, None),
+	58: ('Text', str, None),
+	354: ('EncodedTextLen', int, None),
+	355: ('EncodedText', str, None),
+}
+
+def _encode_DontKnowTrade(obj, fixm):
+	d = obj.__dict__
+	add = fixm.append
+	n = 1
+	if 'OrderID' in d:
+		add('37=' + str(d['OrderID']))
+		n += 1
+	if 'ExecID' in d:
+		add('17=' + str(d['ExecID']))
+		n += 1
+	if 'DKReason' in d:
+		add('127=' + str(d['DKReason']))
+		n += 1
+	if 'Symbol' in d:
+		add('55=' + str(d['Symbol']))
+		n += 1
+	if 'SymbolSfx' in d:
+		add('65=' + str(d['SymbolSfx']))
+		n += 1
+	if 'SecurityID' in d:
+		add('48=' + str(d['SecurityID']))
+		n += 1
+	if 'IDSource' in d:
+		add('22=' + str(d['IDSource']))
+		n += 1
+	if 'SecurityType' in d:
+		add('167=' + str(d['SecurityType']))
+		n += 1
+	if 'MaturityMonthYear' in d:
+		add('200=' + str(d['MaturityMonthYear']))
+		n += 1
+	if 'MaturityDay' in d:
+		add('205=' + str(d['MaturityDay']))
+		n += 1
+	if 'PutOrCall' in d:
+		add('201=' + str(d['PutOrCall']))
+		n += 1
+	if 'StrikePrice' in d:
+		add('202=' + str(d['StrikePrice']))
+		n += 1
+	if 'OptAttribute' in d:
+		add('206=' + str(d['OptAttribute']))
+		n += 1
+	if 'ContractMultiplier' in d:
+		add('231=' + str(d['ContractMultiplier']))
+		n += 1
+	if 'CouponRate' in d:
+		add('223=' + str(d['CouponRate']))
+		n += 1
+	if 'SecurityExchange' in d:
+		add('207=' + str(d['SecurityExchange']))
+		n += 1
+	if 'Issuer' in d:
+		add('106=' + str(d['Issuer']))
+		n += 1
+	if 'EncodedIssuerLen' in d:
+		add('348=' + str(d['EncodedIssuerLen']))
+		n += 1
+	if 'EncodedIssuer' in d:
+		add('349=' + str(d['EncodedIssuer']))
+		n += 1
+	if 'SecurityDesc' in d:
+		add('107=' + str(d['SecurityDesc']))
+		n += 1
+	if 'EncodedSecurityDescLen' in d:
+		add('350=' + str(d['EncodedSecurityDescLen']))
+		n += 1
+	if 'EncodedSecurityDesc' in d:
+		add('351=' + str(d['EncodedSecurityDesc']))
+		n += 1
+	if 'Side' in d:
+		add('54=' + str(d['Side']))
+		n += 1
+	if 'OrderQty' in d:
+		add('38=' + str(d['OrderQty']))
+		n += 1
+	if 'CashOrderQty' in d:
+		add('152=' + str(d['CashOrderQty']))
+		n += 1
+	if 'LastShares' in d:
+		add('32=' + str(d['LastShares']))
+		n += 1
+	if 'LastPx' in d:
+		add('31=' + str(d['LastPx']))
+		n += 1
+	if 'Text' in d:
+		add('58=' + str(d['Text']))
+		n += 1
+	if 'EncodedTextLen' in d:
+		add('354=' + str(d['EncodedTextLen']))
+		n += 1
+	if 'EncodedText' in d:
+		add('355=' + str(d['EncodedText']))
+		n += 1
+	if len(d) > n:
+		_make_mbody(obj, obj._context, fixm, _msg_DontKnowTrade_names)
+	return fixm
+
+def _decode_DontKnowTrade(obj, fields, index, context):
+	d = obj.__dict__
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _msg_DontKnowTrade_tags.get(num)
+		if spec is None:
+			# not a field of this message, continue with generic decoder
+			body, index = _extract_body(fields, index, context, obj)
+			return index
+		name, pytype, decode_grp = spec
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	return index
 
 class DontKnowTrade(FixObject):
-	pass
+	_encode = staticmethod(_encode_DontKnowTrade)
+	_decode = staticmethod(_decode_DontKnowTrade)
+
+_msg_Email_names = frozenset(['EmailThreadID', 'EmailType', 'OrigTime', 'Subject', 'EncodedSubjectLen', 'EncodedSubject', 'NoRoutingIDs', 'NoRelatedSym', 'OrderID', 'ClOrdID', 'LinesOfText', 'RawDataLength', 'RawData'])
+
+_msg_Email_tags = {
+	164: ('EmailThreadID', str, None),
+	94: ('EmailType', str, None),
+	42: ('OrigTime', str, None),
+	147: ('Subject', str, None),
+	356: ('EncodedSubjectLen', int, None),
+	357: ('EncodedSubject', str, None),
+	215: ('NoRoutingIDs', int, None),
+	146: ('NoRelatedSym', int, None),
+	37: ('OrderID', str, None),
+	11: ('ClOrdID', str, None),
+	33: ('LinesOfText', int, None),
+	95: ('RawDataLength', int, None),
+	96: ('RawData', str, None),
+}
+
+def _encode_Email(obj, fixm):
+	d = obj.__dict__
+	add = fixm.append
+	n = 1
+	if 'EmailThreadID' in d:
+		add('164=' + str(d['EmailThreadID']))
+		n += 1
+	if 'EmailType' in d:
+		add('94=' + str(d['EmailType']))
+		n += 1
+	if 'OrigTime' in d:
+		add('42=' + str(d['OrigTime']))
+		n += 1
+	if 'Subject' in d:
+		add('147=' + str(d['Subject']))
+		n += 1
+	if 'EncodedSubjectLen' in d:
+		add('356=' + str(d['EncodedSubjectLen']))
+		n += 1
+	if 'EncodedSubject' in d:
+		add('357=' + str(d['EncodedSubject']))
+		n += 1
+	if 'NoRoutingIDs' in d:
+		add('215=' + str(d['NoRoutingIDs']))
+		n += 1
+	if 'NoRelatedSym' in d:
+		add('146=' + str(d['NoRelatedSym']))
+		n += 1
+	if 'OrderID' in d:
+		add('37=' + str(d['OrderID']))
+		n += 1
+	if 'ClOrdID' in d:
+		add('11=' + str(d['ClOrdID']))
+		n += 1
+	if 'LinesOfText' in d:
+		add('33=' + str(d['LinesOfText']))
+		n += 1
+	if 'RawDataLength' in d:
+		add('95=' + str(d['RawDataLength']))
+		n += 1
+	if 'RawData' in d:
+		add('96=' + str(d['RawData']))
+		n += 1
+	if len(d) > n:
+		_make_mbody(obj, obj._context, fixm, _msg_Email_names)
+	return fixm
+
+def _decode_Email(obj, fields, index, context):
+	d = obj.__dict__
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _msg_Email_tags.get(num)
+		if spec is None:
+			# not a field of this message, continue with generic decoder
+			body, index = _extract_body(fields, index, context, obj)
+			return index
+		name, pytype, decode_grp = spec
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	return index
 
 class Email(FixObject):
-	pass
+	_encode = staticmethod(_encode_Email)
+	_decode = staticmethod(_decode_Email)
+
+_msg_ExecutionReport_names = frozenset(['OrderID', 'SecondaryOrderID', 'ClOrdID', 'OrigClOrdID', 'ClientID', 'ExecBroker', 'NoContraBrokers', 'ListID', 'ExecID', 'ExecTransType', 'ExecRefID', 'ExecType', 'OrdStatus', 'OrdRejReason', 'ExecRestatementReason', 'Account', 'SettlmntTyp', 'FutSettDate', 'Symbol', 'SymbolSfx', 'SecurityID', 'IDSource', 'SecurityType', 'MaturityMonthYear', 'MaturityDay', 'PutOrCall', 'StrikePrice', 'OptAttribute', 'ContractMultiplier', 'CouponRate', 'SecurityExchange', 'Issuer', 'EncodedIssuerLen', 'EncodedIssuer', 'SecurityDesc', 'EncodedSecurityDescLen', 'EncodedSecurityDesc', 'Side', 'OrderQty', 'CashOrderQty', 'OrdType', 'Price', 'StopPx', 'PegDifference', 'DiscretionInst', 'DiscretionOffset', 'Currency', 'ComplianceID', 'SolicitedFlag', 'TimeInForce', 'EffectiveTime', 'ExpireDate', 'ExpireTime', 'ExecInst', 'Rule80A', 'LastShares', 'LastPx', 'LastSpotRate', 'LastForwardPoints', 'LastMkt', 'TradingSessionID', 'LastCapacity', 'LeavesQty', 'CumQty', 'AvgPx', 'DayOrderQty', 'DayCumQty', 'DayAvgPx', 'GTBookingInst', 'TradeDate', 'TransactTime', 'ReportToExch', 'Commission', 'CommType', 'GrossTradeAmt', 'SettlCurrAmt', 'SettlCurrency', 'SettlCurrFxRate', 'SettlCurrFxRateCalc', 'HandlInst', 'MinQty', 'MaxFloor', 'OpenClose', 'MaxShow', 'Text', 'EncodedTextLen', 'EncodedText', 'FutSettDate2', 'OrderQty2', 'ClearingFirm', 'ClearingAccount', 'MultiLegReportingType'])
+
+_msg_ExecutionReport_tags = {
+	37: ('OrderID', str, None),
+	198: ('SecondaryOrderID', str, None),
+	11: ('ClOrdID', str, None),
+	41: ('OrigClOrdID', str, None),
+	109: ('ClientID', str, None),
+	76: ('ExecBroker', str, None),
+	382: ('NoContraBrokers', int, None),
+	66: ('ListID', str, None),
+	17: ('ExecID', str, None),
+	20: ('ExecTransType', str, None),
+	19: ('ExecRefID', str, None),
+	150: ('ExecType', str, None),
+	39: ('OrdStatus', str, None),
+	103: ('OrdRejReason', int, None),
+	378: ('ExecRestatementReason', int, None),
+	1: ('Account', str, None),
+	63: ('SettlmntTyp', str, None),
+	64: ('FutSettDate', str, None),
+	55: ('Symbol', str, None),
+	65: ('SymbolSfx', str, None),
+	48: ('SecurityID', str, None),
+	22: ('IDSource', str, None),
+	167: ('SecurityType', str, None),
+	200: ('MaturityMonthYear', str, None),
+	205: ('MaturityDay', int, None),
+	201: ('PutOrCall', int, None),
+	202: ('StrikePrice', float, None),
+	206: ('OptAttribute', str, None),
+	231: ('ContractMultiplier', float, None),
+	223: ('CouponRate', float, None),
+	207: ('SecurityExchange', str, None),
+	106: ('Issuer', str, None),
+	348: ('EncodedIssuerLen', int, None),
+	349: ('EncodedIssuer', str, None),
+	107: ('SecurityDesc', str, None),
+	350: ('EncodedSecurityDescLen', int, None),
+	351: ('EncodedSecurityDesc', str, None),
+	54: ('Side', str, None),
+	38: ('OrderQty', float, None),
+	152: ('CashOrderQty', float, None),
+	40: ('OrdType', str, None),
+	44: ('Price', float, None),
+	99: ('StopPx', float, None),
+	211: ('PegDifference', float, None),
+	388: ('DiscretionInst', str, None),
+	389: ('DiscretionOffset', float, None),
+	15: ('Currency', str, None),
+	376: ('ComplianceID', str, None),
+	377: ('SolicitedFlag', str, None),
+	59: ('TimeInForce', str, None),
+	168: ('EffectiveTime', str, None),
+	432: ('ExpireDate', str, None),
+	126: ('ExpireTime', str, None),
+	18: ('ExecInst', str, None),
+	47: ('Rule80A', str, None),
+	32: ('LastShares', float, None),
+	31: ('LastPx', float, None),
+	194: ('LastSpotRate', float, None),
+	195: ('LastForwardPoints', float, None),
+	30: ('LastMkt', str, None),
+	336: ('TradingSessionID', str, None),
+	29: ('LastCapacity', str, None),
+	151: ('LeavesQty', float, None),
+	14: ('CumQty', float, None),
+	6: ('AvgPx', float, None),
+	424: ('DayOrderQty', float, None),
+	425: ('DayCumQty', float, None),
+	426: ('DayAvgPx', float, None),
+	427: ('GTBookingInst', int, None),
+	75: ('TradeDate', str, None),
+	60: ('TransactTime', str, None),
+	113: ('ReportToExch', str, None),
+	12: ('Commission', float, None),
+	13: ('CommType', str, None),
+	381: ('GrossTradeAmt', float, None),
+	119: ('SettlCurrAmt', float, None),
+	120: ('SettlCurrency', str, None),
+	155: ('SettlCurrFxRate', float, None),
+	156: ('SettlCurrFxRateCalc', str, None),
+	21: ('HandlInst', str, None),
+	110: ('MinQty', float, None),
+	111: ('MaxFloor', float, None),
+	77: ('OpenClose', str, None),
+	210: ('MaxShow', float, None),
+	58: ('Text', str, None),
+	354: ('EncodedTextLen', int, None),
+	355: ('EncodedText', str, None),
+	193: ('FutSettDate2', str, None),
+	192: ('OrderQty2', float, None),
+	439: ('ClearingFirm', str, None),
+	440: ('ClearingAccount', str, None),
+	442: ('MultiLegReportingType', str, None),
+}
+
+def _encode_ExecutionReport(obj, fixm):
+	d = obj.__dict__
+	add = fixm.append
+	n = 1
+	if 'OrderID' in d:
+		add('37=' + str(d['OrderID']))
+		n += 1
+	if 'SecondaryOrderID' in d:
+		add('198=' + str(d['SecondaryOrderID']))
+		n += 1
+	if 'ClOrdID' in d:
+		add('11=' + str(d['ClOrdID']))
+		n += 1
+	if 'OrigClOrdID' in d:
+		add('41=' + str(d['OrigClOrdID']))
+		n += 1
+	if 'ClientID' in d:
+		add('109=' + str(d['ClientID']))
+		n += 1
+	if 'ExecBroker' in d:
+		add('76=' + str(d['ExecBroker']))
+		n += 1
+	if 'NoContraBrokers' in d:
+		add('382=' + str(d['NoContraBrokers']))
+		n += 1
+	if 'ListID' in d:
+		add('66=' + str(d['ListID']))
+		n += 1
+	if 'ExecID' in d:
+		add('17=' + str(d['ExecID']))
+		n += 1
+	if 'ExecTransType' in d:
+		add('20=' + str(d['ExecTransType']))
+		n += 1
+	if 'ExecRefID' in d:
+		add('19=' + str(d['ExecRefID']))
+		n += 1
+	if 'ExecType' in d:
+		add('150=' + str(d['ExecType']))
+		n += 1
+	if 'OrdStatus' in d:
+		add('39=' + str(d['OrdStatus']))
+		n += 1
+	if 'OrdRejReason' in d:
+		add('103=' + str(d['OrdRejReason']))
+		n += 1
+	if 'ExecRestatementReason' in d:
+		add('378=' + str(d['ExecRestatementReason']))
+		n += 1
+	if 'Account' in d:
+		add('1=' + str(d['Account']))
+		n += 1
+	if 'SettlmntTyp' in d:
+		add('63=' + str(d['SettlmntTyp']))
+		n += 1
+	if 'FutSettDate' in d:
+		add('64=' + str(d['FutSettDate']))
+		n += 1
+	if 'Symbol' in d:
+		add('55=' + str(d['Symbol']))
+		n += 1
+	if 'SymbolSfx' in d:
+		add('65=' + str(d['SymbolSfx']))
+		n += 1
+	if 'SecurityID' in d:
+		add('48=' + str(d['SecurityID']))
+		n += 1
+	if 'IDSource' in d:
+		add('22=' + str(d['IDSource']))
+		n += 1
+	if 'SecurityType' in d:
+		add('167=' + str(d['SecurityType']))
+		n += 1
+	if 'MaturityMonthYear' in d:
+		add('200=' + str(d['MaturityMonthYear']))
+		n += 1
+	if 'MaturityDay' in d:
+		add('205=' + str(d['MaturityDay']))
+		n += 1
+	if 'PutOrCall' in d:
+		add('201=' + str(d['PutOrCall']))
+		n += 1
+	if 'StrikePrice' in d:
+		add('202=' + str(d['StrikePrice']))
+		n += 1
+	if 'OptAttribute' in d:
+		add('206=' + str(d['OptAttribute']))
+		n += 1
+	if 'ContractMultiplier' in d:
+		add('231=' + str(d['ContractMultiplier']))
+		n += 1
+	if 'CouponRate' in d:
+		add('223=' + str(d['CouponRate']))
+		n += 1
+	if 'SecurityExchange' in d:
+		add('207=' + str(d['SecurityExchange']))
+		n += 1
+	if 'Issuer' in d:
+		add('106=' + str(d['Issuer']))
+		n += 1
+	if 'EncodedIssuerLen' in d:
+		add('348=' + str(d['EncodedIssuerLen']))
+		n += 1
+	if 'EncodedIssuer' in d:
+		add('349=' + str(d['EncodedIssuer']))
+		n += 1
+	if 'SecurityDesc' in d:
+		add('107=' + str(d['SecurityDesc']))
+		n += 1
+	if 'EncodedSecurityDescLen' in d:
+		add('350=' + str(d['EncodedSecurityDescLen']))
+		n += 1
+	if 'EncodedSecurityDesc' in d:
+		add('351=' + str(d['EncodedSecurityDesc']))
+		n += 1
+	if 'Side' in d:
+		add('54=' + str(d['Side']))
+		n += 1
+	if 'OrderQty' in d:
+		add('38=' + str(d['OrderQty']))
+		n += 1
+	if 'CashOrderQty' in d:
+		add('152=' + str(d['CashOrderQty']))
+		n += 1
+	if 'OrdType' in d:
+		add('40=' + str(d['OrdType']))
+		n += 1
+	if 'Price' in d:
+		add('44=' + str(d['Price']))
+		n += 1
+	if 'StopPx' in d:
+		add('99=' + str(d['StopPx']))
+		n += 1
+	if 'PegDifference' in d:
+		add('211=' + str(d['PegDifference']))
+		n += 1
+	if 'DiscretionInst' in d:
+		add('388=' + str(d['DiscretionInst']))
+		n += 1
+	if 'DiscretionOffset' in d:
+		add('389=' + str(d['DiscretionOffset']))
+		n += 1
+	if 'Currency' in d:
+		add('15=' + str(d['Currency']))
+		n += 1
+	if 'ComplianceID' in d:
+		add('376=' + str(d['ComplianceID']))
+		n += 1
+	if 'SolicitedFlag' in d:
+		add('377=' + str(d['SolicitedFlag']))
+		n += 1
+	if 'TimeInForce' in d:
+		add('59=' + str(d['TimeInForce']))
+		n += 1
+	if 'EffectiveTime' in d:
+		add('168=' + str(d['EffectiveTime']))
+		n += 1
+	if 'ExpireDate' in d:
+		add('432=' + str(d['ExpireDate']))
+		n += 1
+	if 'ExpireTime' in d:
+		add('126=' + str(d['ExpireTime']))
+		n += 1
+	if 'ExecInst' in d:
+		add('18=' + str(d['ExecInst']))
+		n += 1
+	if 'Rule80A' in d:
+		add('47=' + str(d['Rule80A']))
+		n += 1
+	if 'LastShares' in d:
+		add('32=' + str(d['LastShares']))
+		n += 1
+	if 'LastPx' in d:
+		add('31=' + str(d['LastPx']))
+		n += 1
+	if 'LastSpotRate' in d:
+		add('194=' + str(d['LastSpotRate']))
+		n += 1
+	if 'LastForwardPoints' in d:
+		add('195=' + str(d['LastForwardPoints']))
+		n += 1
+	if 'LastMkt' in d:
+		add('30=' + str(d['LastMkt']))
+		n += 1
+	if 'TradingSessionID' in d:
+		add('336=' + str(d['TradingSessionID']))
+		n += 1
+	if 'LastCapacity' in d:
+		add('29=' + str(d['LastCapacity']))
+		n += 1
+	if 'LeavesQty' in d:
+		add('151=' + str(d['LeavesQty']))
+		n += 1
+	if 'CumQty' in d:
+		add('14=' + str(d['CumQty']))
+		n += 1
+	if 'AvgPx' in d:
+		add('6=' + str(d['AvgPx']))
+		n += 1
+	if 'DayOrderQty' in d:
+		add('424=' + str(d['DayOrderQty']))
+		n += 1
+	if 'DayCumQty' in d:
+		add('425=' + str(d['DayCumQty']))
+		n += 1
+	if 'DayAvgPx' in d:
+		add('426=' + str(d['DayAvgPx']))
+		n += 1
+	if 'GTBookingInst' in d:
+		add('427=' + str(d['GTBookingInst']))
+		n += 1
+	if 'TradeDate' in d:
+		add('75=' + str(d['TradeDate']))
+		n += 1
+	if 'TransactTime' in d:
+		add('60=' + str(d['TransactTime']))
+		n += 1
+	if 'ReportToExch' in d:
+		add('113=' + str(d['ReportToExch']))
+		n += 1
+	if 'Commission' in d:
+		add('12=' + str(d['Commission']))
+		n += 1
+	if 'CommType' in d:
+		add('13=' + str(d['CommType']))
+		n += 1
+	if 'GrossTradeAmt' in d:
+		add('381=' + str(d['GrossTradeAmt']))
+		n += 1
+	if 'SettlCurrAmt' in d:
+		add('119=' + str(d['SettlCurrAmt']))
+		n += 1
+	if 'SettlCurrency' in d:
+		add('120=' + str(d['SettlCurrency']))
+		n += 1
+	if 'SettlCurrFxRate' in d:
+		add('155=' + str(d['SettlCurrFxRate']))
+		n += 1
+	if 'SettlCurrFxRateCalc' in d:
+		add('156=' + str(d['SettlCurrFxRateCalc']))
+		n += 1
+	if 'HandlInst' in d:
+		add('21=' + str(d['HandlInst']))
+		n += 1
+	if 'MinQty' in d:
+		add('110=' + str(d['MinQty']))
+		n += 1
+	if 'MaxFloor' in d:
+		add('111=' + str(d['MaxFloor']))
+		n += 1
+	if 'OpenClose' in d:
+		add('77=' + str(d['OpenClose']))
+		n += 1
+	if 'MaxShow' in d:
+		add('210=' + str(d['MaxShow']))
+		n += 1
+	if 'Text' in d:
+		add('58=' + str(d['Text']))
+		n += 1
+	if 'EncodedTextLen' in d:
+		add('354=' + str(d['EncodedTextLen']))
+		n += 1
+	if 'EncodedText' in d:
+		add('355=' + str(d['EncodedText']))
+		n += 1
+	if 'FutSettDate2' in d:
+		add('193=' + str(d['FutSettDate2']))
+		n += 1
+	if 'OrderQty2' in d:
+		add('192=' + str(d['OrderQty2']))
+		n += 1
+	if 'ClearingFirm' in d:
+		add('439=' + str(d['ClearingFirm']))
+		n += 1
+	if 'ClearingAccount' in d:
+		add('440=' + str(d['ClearingAccount']))
+		n += 1
+	if 'MultiLegReportingType' in d:
+		add('442=' + str(d['MultiLegReportingType']))
+		n += 1
+	if len(d) > n:
+		_make_mbody(obj, obj._context, fixm, _msg_ExecutionReport_names)
+	return fixm
+
+def _decode_ExecutionReport(obj, fields, index, context):
+	d = obj.__dict__
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _msg_ExecutionReport_tags.get(num)
+		if spec is None:
+			# not a field of this message, continue with generic decoder
+			body, index = _extract_body(fields, index, context, obj)
+			return index
+		name, pytype, decode_grp = spec
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	return index
 
 class ExecutionReport(FixObject):
-	pass
+	_encode = staticmethod(_encode_ExecutionReport)
+	_decode = staticmethod(_decode_ExecutionReport)
+
+_msg_IndicationofInterest_names = frozenset(['IOIid', 'IOITransType', 'IOIRefID', 'Symbol', 'SymbolSfx', 'SecurityID', 'IDSource', 'SecurityType', 'MaturityMonthYear', 'MaturityDay', 'PutOrCall', 'StrikePrice', 'OptAttribute', 'ContractMultiplier', 'CouponRate', 'SecurityExchange', 'Issuer', 'EncodedIssuerLen', 'EncodedIssuer', 'SecurityDesc', 'EncodedSecurityDescLen', 'EncodedSecurityDesc', 'Side', 'IOIShares', 'Price', 'Currency', 'ValidUntilTime', 'IOIQltyInd', 'IOINaturalFlag', 'NoIOIQualifiers', 'Text', 'EncodedTextLen', 'EncodedText', 'TransactTime', 'URLLink', 'NoRoutingIDs', 'SpreadToBenchmark', 'Benchmark'])
+
+_msg_IndicationofInterest_tags = {
+	23: ('IOIid', str, None),
+	28: ('IOITransType', str, None),
+	26: ('IOIRefID', str, None),
+	55: ('Symbol', str, None),
+	65: ('SymbolSfx', str, None),
+	48: ('SecurityID', str, None),
+	22: ('IDSource', str, None),
+	167: ('SecurityType', str, None),
+	200: ('MaturityMonthYear', str, None),
+	205: ('MaturityDay', int, None),
+	201: ('PutOrCall', int, None),
+	202: ('StrikePrice', float, None),
+	206: ('OptAttribute', str, None),
+	231: ('ContractMultiplier', float, None),
+	223: ('CouponRate', float, None),
+	207: ('SecurityExchange', str, None),
+	106: ('Issuer', str, None),
+	348: ('EncodedIssuerLen', int, None),
+	349: ('EncodedIssuer', str, None),
+	107: ('SecurityDesc', str, None),
+	350: ('EncodedSecurityDescLen', int, None),
+	351: ('EncodedSecurityDesc', str, None),
+	54: ('Side', str, None),
+	27: ('IOIShares', str, None),
+	44: ('Price', float, None),
+	15: ('Currency', str, None),
+	62: ('ValidUntilTime', str, None),
+	25: ('IOIQltyInd', str, None),
+	130: ('IOINaturalFlag', str, None),
+	199: ('NoIOIQualifiers', int, None),
+	58: ('Text', str, None),
+	354: ('EncodedTextLen', int, None),
+	355: ('EncodedText', str, None),
+	60: ('TransactTime', str, None),
+	149: ('URLLink', str, None),
+	215: ('NoRoutingIDs', int, None),
+	218: ('SpreadToBenchmark', float, None),
+	219: ('Benchmark', str, None),
+}
+
+def _encode_IndicationofInterest(obj, fixm):
+	d = obj.__dict__
+	add = fixm.append
+	n = 1
+	if 'IOIid' in d:
+		add('23=' + str(d['IOIid']))
+		n += 1
+	if 'IOITransType' in d:
+		add('28=' + str(d['IOITransType']))
+		n += 1
+	if 'IOIRefID' in d:
+		add('26=' + str(d['IOIRefID']))
+		n += 1
+	if 'Symbol' in d:
+		add('55=' + str(d['Symbol']))
+		n += 1
+	if 'SymbolSfx' in d:
+		add('65=' + str(d['SymbolSfx']))
+		n += 1
+	if 'SecurityID' in d:
+		add('48=' + str(d['SecurityID']))
+		n += 1
+	if 'IDSource' in d:
+		add('22=' + str(d['IDSource']))
+		n += 1
+	if 'SecurityType' in d:
+		add('167=' + str(d['SecurityType']))
+		n += 1
+	if 'MaturityMonthYear' in d:
+		add('200=' + str(d['MaturityMonthYear']))
+		n += 1
+	if 'MaturityDay' in d:
+		add('205=' + str(d['MaturityDay']))
+		n += 1
+	if 'PutOrCall' in d:
+		add('201=' + str(d['PutOrCall']))
+		n += 1
+	if 'StrikePrice' in d:
+		add('202=' + str(d['StrikePrice']))
+		n += 1
+	if 'OptAttribute' in d:
+		add('206=' + str(d['OptAttribute']))
+		n += 1
+	if 'ContractMultiplier' in d:
+		add('231=' + str(d['ContractMultiplier']))
+		n += 1
+	if 'CouponRate' in d:
+		add('223=' + str(d['CouponRate']))
+		n += 1
+	if 'SecurityExchange' in d:
+		add('207=' + str(d['SecurityExchange']))
+		n += 1
+	if 'Issuer' in d:
+		add('106=' + str(d['Issuer']))
+		n += 1
+	if 'EncodedIssuerLen' in d:
+		add('348=' + str(d['EncodedIssuerLen']))
+		n += 1
+	if 'EncodedIssuer' in d:
+		add('349=' + str(d['EncodedIssuer']))
+		n += 1
+	if 'SecurityDesc' in d:
+		add('107=' + str(d['SecurityDesc']))
+		n += 1
+	if 'EncodedSecurityDescLen' in d:
+		add('350=' + str(d['EncodedSecurityDescLen']))
+		n += 1
+	if 'EncodedSecurityDesc' in d:
+		add('351=' + str(d['EncodedSecurityDesc']))
+		n += 1
+	if 'Side' in d:
+		add('54=' + str(d['Side']))
+		n += 1
+	if 'IOIShares' in d:
+		add('27=' + str(d['IOIShares']))
+		n += 1
+	if 'Price' in d:
+		add('44=' + str(d['Price']))
+		n += 1
+	if 'Currency' in d:
+		add('15=' + str(d['Currency']))
+		n += 1
+	if 'ValidUntilTime' in d:
+		add('62=' + str(d['ValidUntilTime']))
+		n += 1
+	if 'IOIQltyInd' in d:
+		add('25=' + str(d['IOIQltyInd']))
+		n += 1
+	if 'IOINaturalFlag' in d:
+		add('130=' + str(d['IOINaturalFlag']))
+		n += 1
+	if 'NoIOIQualifiers' in d:
+		add('199=' + str(d['NoIOIQualifiers']))
+		n += 1
+	if 'Text' in d:
+		add('58=' + str(d['Text']))
+		n += 1
+	if 'EncodedTextLen' in d:
+		add('354=' + str(d['EncodedTextLen']))
+		n += 1
+	if 'EncodedText' in d:
+		add('355=' + str(d['EncodedText']))
+		n += 1
+	if 'TransactTime' in d:
+		add('60=' + str(d['TransactTime']))
+		n += 1
+	if 'URLLink' in d:
+		add('149=' + str(d['URLLink']))
+		n += 1
+	if 'NoRoutingIDs' in d:
+		add('215=' + str(d['NoRoutingIDs']))
+		n += 1
+	if 'SpreadToBenchmark' in d:
+		add('218=' + str(d['SpreadToBenchmark']))
+		n += 1
+	if 'Benchmark' in d:
+		add('219=' + str(d['Benchmark']))
+		n += 1
+	if len(d) > n:
+		_make_mbody(obj, obj._context, fixm, _msg_IndicationofInterest_names)
+	return fixm
+
+def _decode_IndicationofInterest(obj, fields, index, context):
+	d = obj.__dict__
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _msg_IndicationofInterest_tags.get(num)
+		if spec is None:
+			# not a field of this message, continue with generic decoder
+			body, index = _extract_body(fields, index, context, obj)
+			return index
+		name, pytype, decode_grp = spec
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	return index
 
 class IndicationofInterest(FixObject):
-	pass
+	_encode = staticmethod(_encode_IndicationofInterest)
+	_decode = staticmethod(_decode_IndicationofInterest)
+
+_msg_ListCancelRequest_names = frozenset(['ListID', 'TransactTime', 'Text', 'EncodedTextLen', 'EncodedText'])
+
+_msg_ListCancelRequest_tags = {
+	66: ('ListID', str, None),
+	60: ('TransactTime', str, None),
+	58: ('Text', str, None),
+	354: ('EncodedTextLen', int, None),
+	355: ('EncodedText', str, None),
+}
+
+def _encode_ListCancelRequest(obj, fixm):
+	d = obj.__dict__
+	add = fixm.append
+	n = 1
+	if 'ListID' in d:
+		add('66=' + str(d['ListID']))
+		n += 1
+	if 'TransactTime' in d:
+		add('60=' + str(d['TransactTime']))
+		n += 1
+	if 'Text' in d:
+		add('58=' + str(d['Text']))
+		n += 1
+	if 'EncodedTextLen' in d:
+		add('354=' + str(d['EncodedTextLen']))
+		n += 1
+	if 'EncodedText' in d:
+		add('355=' + str(d['EncodedText']))
+		n += 1
+	if len(d) > n:
+		_make_mbody(obj, obj._context, fixm, _msg_ListCancelRequest_names)
+	return fixm
+
+def _decode_ListCancelRequest(obj, fields, index, context):
+	d = obj.__dict__
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _msg_ListCancelRequest_tags.get(num)
+		if spec is None:
+			# not a field of this message, continue with generic decoder
+			body, index = _extract_body(fields, index, context, obj)
+			return index
+		name, pytype, decode_grp = spec
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	return index
 
 class ListCancelRequest(FixObject):
-	pass
+	_encode = staticmethod(_encode_ListCancelRequest)
+	_decode = staticmethod(_decode_ListCancelRequest)
+
+_msg_ListExecute_names = frozenset(['ListID', 'ClientBidID', 'BidID', 'TransactTime', 'Text', 'EncodedTextLen', 'EncodedText'])
+
+_msg_ListExecute_tags = {
+	66: ('ListID', str, None),
+	391: ('ClientBidID', str, None),
+	390: ('BidID', str, None),
+	60: ('TransactTime', str, None),
+	58: ('Text', str, None),
+	354: ('EncodedTextLen', int, None),
+	355: ('EncodedText', str, None),
+}
+
+def _encode_ListExecute(obj, fixm):
+	d = obj.__dict__
+	add = fixm.append
+	n = 1
+	if 'ListID' in d:
+		add('66=' + str(d['ListID']))
+		n += 1
+	if 'ClientBidID' in d:
+		add('391=' + str(d['ClientBidID']))
+		n += 1
+	if 'BidID' in d:
+		add('390=' + str(d['BidID']))
+		n += 1
+	if 'TransactTime' in d:
+		add('60=' + str(d['TransactTime']))
+		n += 1
+	if 'Text' in d:
+		add('58=' + str(d['Text']))
+		n += 1
+	if 'EncodedTextLen' in d:
+		add('354=' + str(d['EncodedTextLen']))
+		n += 1
+	if 'EncodedText' in d:
+		add('355=' + str(d['EncodedText']))
+		n += 1
+	if len(d) > n:
+		_make_mbody(obj, obj._context, fixm, _msg_ListExecute_names)
+	return fixm
+
+def _decode_ListExecute(obj, fields, index, context):
+	d = obj.__dict__
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _msg_ListExecute_tags.get(num)
+		if spec is None:
+			# not a field of this message, continue with generic decoder
+			body, index = _extract_body(fields, index, context, obj)
+			return index
+		name, pytype, decode_grp = spec
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	return index
 
 class ListExecute(FixObject):
-	pass
+	_encode = staticmethod(_encode_ListExecute)
+	_decode = staticmethod(_decode_ListExecute)
+
+_msg_ListStatus_names = frozenset(['ListID', 'ListStatusType', 'NoRpts', 'ListOrderStatus', 'RptSeq', 'ListStatusText', 'EncodedListStatusTextLen', 'EncodedListStatusText', 'TransactTime', 'TotNoOrders', 'NoOrders'])
+
+_msg_ListStatus_tags = {
+	66: ('ListID', str, None),
+	429: ('ListStatusType', int, None),
+	82: ('NoRpts', int, None),
+	431: ('ListOrderStatus', int, None),
+	83: ('RptSeq', int, None),
+	444: ('ListStatusText', str, None),
+	445: ('EncodedListStatusTextLen', int, None),
+	446: ('EncodedListStatusText', str, None),
+	60: ('TransactTime', str, None),
+	68: ('TotNoOrders', int, None),
+	73: ('NoOrders', int, None),
+}
+
+def _encode_ListStatus(obj, fixm):
+	d = obj.__dict__
+	add = fixm.append
+	n = 1
+	if 'ListID' in d:
+		add('66=' + str(d['ListID']))
+		n += 1
+	if 'ListStatusType' in d:
+		add('429=' + str(d['ListStatusType']))
+		n += 1
+	if 'NoRpts' in d:
+		add('82=' + str(d['NoRpts']))
+		n += 1
+	if 'ListOrderStatus' in d:
+		add('431=' + str(d['ListOrderStatus']))
+		n += 1
+	if 'RptSeq' in d:
+		add('83=' + str(d['RptSeq']))
+		n += 1
+	if 'ListStatusText' in d:
+		add('444=' + str(d['ListStatusText']))
+		n += 1
+	if 'EncodedListStatusTextLen' in d:
+		add('445=' + str(d['EncodedListStatusTextLen']))
+		n += 1
+	if 'EncodedListStatusText' in d:
+		add('446=' + str(d['EncodedListStatusText']))
+		n += 1
+	if 'TransactTime' in d:
+		add('60=' + str(d['TransactTime']))
+		n += 1
+	if 'TotNoOrders' in d:
+		add('68=' + str(d['TotNoOrders']))
+		n += 1
+	if 'NoOrders' in d:
+		add('73=' + str(d['NoOrders']))
+		n += 1
+	if len(d) > n:
+		_make_mbody(obj, obj._context, fixm, _msg_ListStatus_names)
+	return fixm
+
+def _decode_ListStatus(obj, fields, index, context):
+	d = obj.__dict__
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _msg_ListStatus_tags.get(num)
+		if spec is None:
+			# not a field of this message, continue with generic decoder
+			body, index = _extract_body(fields, index, context, obj)
+			return index
+		name, pytype, decode_grp = spec
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	return index
 
 class ListStatus(FixObject):
-	pass
+	_encode = staticmethod(_encode_ListStatus)
+	_decode = staticmethod(_decode_ListStatus)
+
+_msg_ListStatusRequest_names = frozenset(['ListID', 'Text', 'EncodedTextLen', 'EncodedText'])
+
+_msg_ListStatusRequest_tags = {
+	66: ('ListID', str, None),
+	58: ('Text', str, None),
+	354: ('EncodedTextLen', int, None),
+	355: ('EncodedText', str, None),
+}
+
+def _encode_ListStatusRequest(obj, fixm):
+	d = obj.__dict__
+	add = fixm.append
+	n = 1
+	if 'ListID' in d:
+		add('66=' + str(d['ListID']))
+		n += 1
+	if 'Text' in d:
+		add('58=' + str(d['Text']))
+		n += 1
+	if 'EncodedTextLen' in d:
+		add('354=' + str(d['EncodedTextLen']))
+		n += 1
+	if 'EncodedText' in d:
+		add('355=' + str(d['EncodedText']))
+		n += 1
+	if len(d) > n:
+		_make_mbody(obj, obj._context, fixm, _msg_ListStatusRequest_names)
+	return fixm
+
+def _decode_ListStatusRequest(obj, fields, index, context):
+	d = obj.__dict__
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _msg_ListStatusRequest_tags.get(num)
+		if spec is None:
+			# not a field of this message, continue with generic decoder
+			body, index = _extract_body(fields, index, context, obj)
+			return index
+		name, pytype, decode_grp = spec
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	return index
 
 class ListStatusRequest(FixObject):
-	pass
+	_encode = staticmethod(_encode_ListStatusRequest)
+	_decode = staticmethod(_decode_ListStatusRequest)
+
+_msg_ListStrikePrice_names = frozenset(['ListID', 'TotNoStrikes', 'NoStrikes'])
+
+_msg_ListStrikePrice_tags = {
+	66: ('ListID', str, None),
+	422: ('TotNoStrikes', int, None),
+	428: ('NoStrikes', int, None),
+}
+
+def _encode_ListStrikePrice(obj, fixm):
+	d = obj.__dict__
+	add = fixm.append
+	n = 1
+	if 'ListID' in d:
+		add('66=' + str(d['ListID']))
+		n += 1
+	if 'TotNoStrikes' in d:
+		add('422=' + str(d['TotNoStrikes']))
+		n += 1
+	if 'NoStrikes' in d:
+		add('428=' + str(d['NoStrikes']))
+		n += 1
+	if len(d) > n:
+		_make_mbody(obj, obj._context, fixm, _msg_ListStrikePrice_names)
+	return fixm
+
+def _decode_ListStrikePrice(obj, fields, index, context):
+	d = obj.__dict__
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _msg_ListStrikePrice_tags.get(num)
+		if spec is None:
+			# not a field of this message, continue with generic decoder
+			body, index = _extract_body(fields, index, context, obj)
+			return index
+		name, pytype, decode_grp = spec
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	return index
 
 class ListStrikePrice(FixObject):
-	pass
+	_encode = staticmethod(_encode_ListStrikePrice)
+	_decode = staticmethod(_decode_ListStrikePrice)
+
+_msg_MarketDataIncrementalRefresh_names = frozenset(['MDReqID', 'NoMDEntries'])
+
+_msg_MarketDataIncrementalRefresh_tags = {
+	262: ('MDReqID', str, None),
+	268: ('NoMDEntries', int, None),
+}
+
+def _encode_MarketDataIncrementalRefresh(obj, fixm):
+	d = obj.__dict__
+	add = fixm.append
+	n = 1
+	if 'MDReqID' in d:
+		add('262=' + str(d['MDReqID']))
+		n += 1
+	if 'NoMDEntries' in d:
+		add('268=' + str(d['NoMDEntries']))
+		n += 1
+	if len(d) > n:
+		_make_mbody(obj, obj._context, fixm, _msg_MarketDataIncrementalRefresh_names)
+	return fixm
+
+def _decode_MarketDataIncrementalRefresh(obj, fields, index, context):
+	d = obj.__dict__
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _msg_MarketDataIncrementalRefresh_tags.get(num)
+		if spec is None:
+			# not a field of this message, continue with generic decoder
+			body, index = _extract_body(fields, index, context, obj)
+			return index
+		name, pytype, decode_grp = spec
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	return index
 
 class MarketDataIncrementalRefresh(FixObject):
-	pass
+	_encode = staticmethod(_encode_MarketDataIncrementalRefresh)
+	_decode = staticmethod(_decode_MarketDataIncrementalRefresh)
+
+_msg_MarketDataRequest_names = frozenset(['MDReqID', 'SubscriptionRequestType', 'MarketDepth', 'MDUpdateType', 'AggregatedBook', 'NoMDEntryTypes', 'NoRelatedSym'])
+
+_msg_MarketDataRequest_tags = {
+	262: ('MDReqID', str, None),
+	263: ('SubscriptionRequestType', str, None),
+	264: ('MarketDepth', int, None),
+	265: ('MDUpdateType', int, None),
+	266: ('AggregatedBook', str, None),
+	267: ('NoMDEntryTypes', int, None),
+	146: ('NoRelatedSym', int, None),
+}
+
+def _encode_MarketDataRequest(obj, fixm):
+	d = obj.__dict__
+	add = fixm.append
+	n = 1
+	if 'MDReqID' in d:
+		add('262=' + str(d['MDReqID']))
+		n += 1
+	if 'SubscriptionRequestType' in d:
+		add('263=' + str(d['SubscriptionRequestType']))
+		n += 1
+	if 'MarketDepth' in d:
+		add('264=' + str(d['MarketDepth']))
+		n += 1
+	if 'MDUpdateType' in d:
+		add('265=' + str(d['MDUpdateType']))
+		n += 1
+	if 'AggregatedBook' in d:
+		add('266=' + str(d['AggregatedBook']))
+		n += 1
+	if 'NoMDEntryTypes' in d:
+		add('267=' + str(d['NoMDEntryTypes']))
+		n += 1
+	if 'NoRelatedSym' in d:
+		add('146=' + str(d['NoRelatedSym']))
+		n += 1
+	if len(d) > n:
+		_make_mbody(obj, obj._context, fixm, _msg_MarketDataRequest_names)
+	return fixm
+
+def _decode_MarketDataRequest(obj, fields, index, context):
+	d = obj.__dict__
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _msg_MarketDataRequest_tags.get(num)
+		if spec is None:
+			# not a field of this message, continue with generic decoder
+			body, index = _extract_body(fields, index, context, obj)
+			return index
+		name, pytype, decode_grp = spec
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	return index
 
 class MarketDataRequest(FixObject):
-	pass
+	_encode = staticmethod(_encode_MarketDataRequest)
+	_decode = staticmethod(_decode_MarketDataRequest)
+
+_msg_MarketDataRequestReject_names = frozenset(['MDReqID', 'MDReqRejReason', 'Text', 'EncodedTextLen', 'EncodedText'])
+
+_msg_MarketDataRequestReject_tags = {
+	262: ('MDReqID', str, None),
+	281: ('MDReqRejReason', str, None),
+	58: ('Text', str, None),
+	354: ('EncodedTextLen', int, None),
+	355: ('EncodedText', str, None),
+}
+
+def _encode_MarketDataRequestReject(obj, fixm):
+	d = obj.__dict__
+	add = fixm.append
+	n = 1
+	if 'MDReqID' in d:
+		add('262=' + str(d['MDReqID']))
+		n += 1
+	if 'MDReqRejReason' in d:
+		add('281=' + str(d['MDReqRejReason']))
+		n += 1
+	if 'Text' in d:
+		add('58=' + str(d['Text']))
+		n += 1
+	if 'EncodedTextLen' in d:
+		add('354=' + str(d['EncodedTextLen']))
+		n += 1
+	if 'EncodedText' in d:
+		add('355=' + str(d['EncodedText']))
+		n += 1
+	if len(d) > n:
+		_make_mbody(obj, obj._context, fixm, _msg_MarketDataRequestReject_names)
+	return fixm
+
+def _decode_MarketDataRequestReject(obj, fields, index, context):
+	d = obj.__dict__
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _msg_MarketDataRequestReject_tags.get(num)
+		if spec is None:
+			# not a field of this message, continue with generic decoder
+			body, index = _extract_body(fields, index, context, obj)
+			return index
+		name, pytype, decode_grp = spec
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	return index
 
 class MarketDataRequestReject(FixObject):
-	pass
+	_encode = staticmethod(_encode_MarketDataRequestReject)
+	_decode = staticmethod(_decode_MarketDataRequestReject)
+
+_msg_MarketDataSnapshotFullRefresh_names = frozenset(['MDReqID', 'Symbol', 'SymbolSfx', 'SecurityID', 'IDSource', 'SecurityType', 'MaturityMonthYear', 'MaturityDay', 'PutOrCall', 'StrikePrice', 'OptAttribute', 'ContractMultiplier', 'CouponRate', 'SecurityExchange', 'Issuer', 'EncodedIssuerLen', 'EncodedIssuer', 'SecurityDesc', 'EncodedSecurityDescLen', 'EncodedSecurityDesc', 'FinancialStatus', 'CorporateAction', 'TotalVolumeTraded', 'NoMDEntries'])
+
+_msg_MarketDataSnapshotFullRefresh_tags = {
+	262: ('MDReqID', str, None),
+	55: ('Symbol', str, None),
+	65: ('SymbolSfx', str, None),
+	48: ('SecurityID', str, None),
+	22: ('IDSource', str, None),
+	167: ('SecurityType', str, None),
+	200: ('MaturityMonthYear', str, None),
+	205: ('MaturityDay', int, None),
+	201: ('PutOrCall', int, None),
+	202: ('StrikePrice', float, None),
+	206: ('OptAttribute', str, None),
+	231: ('ContractMultiplier', float, None),
+	223: ('CouponRate', float, None),
+	207: ('SecurityExchange', str, None),
+	106: ('Issuer', str, None),
+	348: ('EncodedIssuerLen', int, None),
+	349: ('EncodedIssuer', str, None),
+	107: ('SecurityDesc', str, None),
+	350: ('EncodedSecurityDescLen', int, None),
+	351: ('EncodedSecurityDesc', str, None),
+	291: ('FinancialStatus', str, None),
+	292: ('CorporateAction', str, None),
+	387: ('TotalVolumeTraded', float, None),
+	268: ('NoMDEntries', int, None),
+}
+
+def _encode_MarketDataSnapshotFullRefresh(obj, fixm):
+	d = obj.__dict__
+	add = fixm.append
+	n = 1
+	if 'MDReqID' in d:
+		add('262=' + str(d['MDReqID']))
+		n += 1
+	if 'Symbol' in d:
+		add('55=' + str(d['Symbol']))
+		n += 1
+	if 'SymbolSfx' in d:
+		add('65=' + str(d['SymbolSfx']))
+		n += 1
+	if 'SecurityID' in d:
+		add('48=' + str(d['SecurityID']))
+		n += 1
+	if 'IDSource' in d:
+		add('22=' + str(d['IDSource']))
+		n += 1
+	if 'SecurityType' in d:
+		add('167=' + str(d['SecurityType']))
+		n += 1
+	if 'MaturityMonthYear' in d:
+		add('200=' + str(d['MaturityMonthYear']))
+		n += 1
+	if 'MaturityDay' in d:
+		add('205=' + str(d['MaturityDay']))
+		n += 1
+	if 'PutOrCall' in d:
+		add('201=' + str(d['PutOrCall']))
+		n += 1
+	if 'StrikePrice' in d:
+		add('202=' + str(d['StrikePrice']))
+		n += 1
+	if 'OptAttribute' in d:
+		add('206=' + str(d['OptAttribute']))
+		n += 1
+	if 'ContractMultiplier' in d:
+		add('231=' + str(d['ContractMultiplier']))
+		n += 1
+	if 'CouponRate' in d:
+		add('223=' + str(d['CouponRate']))
+		n += 1
+	if 'SecurityExchange' in d:
+		add('207=' + str(d['SecurityExchange']))
+		n += 1
+	if 'Issuer' in d:
+		add('106=' + str(d['Issuer']))
+		n += 1
+	if 'EncodedIssuerLen' in d:
+		add('348=' + str(d['EncodedIssuerLen']))
+		n += 1
+	if 'EncodedIssuer' in d:
+		add('349=' + str(d['EncodedIssuer']))
+		n += 1
+	if 'SecurityDesc' in d:
+		add('107=' + str(d['SecurityDesc']))
+		n += 1
+	if 'EncodedSecurityDescLen' in d:
+		add('350=' + str(d['EncodedSecurityDescLen']))
+		n += 1
+	if 'EncodedSecurityDesc' in d:
+		add('351=' + str(d['EncodedSecurityDesc']))
+		n += 1
+	if 'FinancialStatus' in d:
+		add('291=' + str(d['FinancialStatus']))
+		n += 1
+	if 'CorporateAction' in d:
+		add('292=' + str(d['CorporateAction']))
+		n += 1
+	if 'TotalVolumeTraded' in d:
+		add('387=' + str(d['TotalVolumeTraded']))
+		n += 1
+	if 'NoMDEntries' in d:
+		add('268=' + str(d['NoMDEntries']))
+		n += 1
+	if len(d) > n:
+		_make_mbody(obj, obj._context, fixm, _msg_MarketDataSnapshotFullRefresh_names)
+	return fixm
+
+def _decode_MarketDataSnapshotFullRefresh(obj, fields, index, context):
+	d = obj.__dict__
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _msg_MarketDataSnapshotFullRefresh_tags.get(num)
+		if spec is None:
+			# not a field of this message, continue with generic decoder
+			body, index = _extract_body(fields, index, context, obj)
+			return index
+		name, pytype, decode_grp = spec
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	return index
 
 class MarketDataSnapshotFullRefresh(FixObject):
-	pass
+	_encode = staticmethod(_encode_MarketDataSnapshotFullRefresh)
+	_decode = staticmethod(_decode_MarketDataSnapshotFullRefresh)
+
+_msg_MassQuote_names = frozenset(['QuoteReqID', 'QuoteID', 'QuoteResponseLevel', 'DefBidSize', 'DefOfferSize', 'NoQuoteSets'])
+
+_msg_MassQuote_tags = {
+	131: ('QuoteReqID', str, None),
+	117: ('QuoteID', str, None),
+	301: ('QuoteResponseLevel', int, None),
+	293: ('DefBidSize', float, None),
+	294: ('DefOfferSize', float, None),
+	296: ('NoQuoteSets', int, None),
+}
+
+def _encode_MassQuote(obj, fixm):
+	d = obj.__dict__
+	add = fixm.append
+	n = 1
+	if 'QuoteReqID' in d:
+		add('131=' + str(d['QuoteReqID']))
+		n += 1
+	if 'QuoteID' in d:
+		add('117=' + str(d['QuoteID']))
+		n += 1
+	if 'QuoteResponseLevel' in d:
+		add('301=' + str(d['QuoteResponseLevel']))
+		n += 1
+	if 'DefBidSize' in d:
+		add('293=' + str(d['DefBidSize']))
+		n += 1
+	if 'DefOfferSize' in d:
+		add('294=' + str(d['DefOfferSize']))
+		n += 1
+	if 'NoQuoteSets' in d:
+		add('296=' + str(d['NoQuoteSets']))
+		n += 1
+	if len(d) > n:
+		_make_mbody(obj, obj._context, fixm, _msg_MassQuote_names)
+	return fixm
+
+def _decode_MassQuote(obj, fields, index, context):
+	d = obj.__dict__
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _msg_MassQuote_tags.get(num)
+		if spec is None:
+			# not a field of this message, continue with generic decoder
+			body, index = _extract_body(fields, index, context, obj)
+			return index
+		name, pytype, decode_grp = spec
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	return index
 
 class MassQuote(FixObject):
-	pass
+	_encode = staticmethod(_encode_MassQuote)
+	_decode = staticmethod(_decode_MassQuote)
+
+_msg_NewOrderList_names = frozenset(['ListID', 'BidID', 'ClientBidID', 'ProgRptReqs', 'BidType', 'ProgPeriodInterval', 'ListExecInstType', 'ListExecInst', 'EncodedListExecInstLen', 'EncodedListExecInst', 'TotNoOrders', 'NoOrders'])
+
+_msg_NewOrderList_tags = {
+	66: ('ListID', str, None),
+	390: ('BidID', str, None),
+	391: ('ClientBidID', str, None),
+	414: ('ProgRptReqs', int, None),
+	394: ('BidType', int, None),
+	415: ('ProgPeriodInterval', int, None),
+	433: ('ListExecInstType', str, None),
+	69: ('ListExecInst', str, None),
+	352: ('EncodedListExecInstLen', int, None),
+	353: ('EncodedListExecInst', str, None),
+	68: ('TotNoOrders', int, None),
+	73: ('NoOrders', int, None),
+}
+
+def _encode_NewOrderList(obj, fixm):
+	d = obj.__dict__
+	add = fixm.append
+	n = 1
+	if 'ListID' in d:
+		add('66=' + str(d['ListID']))
+		n += 1
+	if 'BidID' in d:
+		add('390=' + str(d['BidID']))
+		n += 1
+	if 'ClientBidID' in d:
+		add('391=' + str(d['ClientBidID']))
+		n += 1
+	if 'ProgRptReqs' in d:
+		add('414=' + str(d['ProgRptReqs']))
+		n += 1
+	if 'BidType' in d:
+		add('394=' + str(d['BidType']))
+		n += 1
+	if 'ProgPeriodInterval' in d:
+		add('415=' + str(d['ProgPeriodInterval']))
+		n += 1
+	if 'ListExecInstType' in d:
+		add('433=' + str(d['ListExecInstType']))
+		n += 1
+	if 'ListExecInst' in d:
+		add('69=' + str(d['ListExecInst']))
+		n += 1
+	if 'EncodedListExecInstLen' in d:
+		add('352=' + str(d['EncodedListExecInstLen']))
+		n += 1
+	if 'EncodedListExecInst' in d:
+		add('353=' + str(d['EncodedListExecInst']))
+		n += 1
+	if 'TotNoOrders' in d:
+		add('68=' + str(d['TotNoOrders']))
+		n += 1
+	if 'NoOrders' in d:
+		add('73=' + str(d['NoOrders']))
+		n += 1
+	if len(d) > n:
+		_make_mbody(obj, obj._context, fixm, _msg_NewOrderList_names)
+	return fixm
+
+def _decode_NewOrderList(obj, fields, index, context):
+	d = obj.__dict__
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _msg_NewOrderList_tags.get(num)
+		if spec is None:
+			# not a field of this message, continue with generic decoder
+			body, index = _extract_body(fields, index, context, obj)
+			return index
+		name, pytype, decode_grp = spec
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	return index
 
 class NewOrderList(FixObject):
-	pass
+	_encode = staticmethod(_encode_NewOrderList)
+	_decode = staticmethod(_decode_NewOrderList)
+
+_msg_NewOrderSingle_names = frozenset(['ClOrdID', 'ClientID', 'ExecBroker', 'Account', 'NoAllocs', 'SettlmntTyp', 'FutSettDate', 'HandlInst', 'ExecInst', 'MinQty', 'MaxFloor', 'ExDestination', 'NoTradingSessions', 'ProcessCode', 'Symbol', 'SymbolSfx', 'SecurityID', 'IDSource', 'SecurityType', 'MaturityMonthYear', 'MaturityDay', 'PutOrCall', 'StrikePrice', 'OptAttribute', 'ContractMultiplier', 'CouponRate', 'SecurityExchange', 'Issuer', 'EncodedIssuerLen', 'EncodedIssuer', 'SecurityDesc', 'EncodedSecurityDescLen', 'EncodedSecurityDesc', 'PrevClosePx', 'Side', 'LocateReqd', 'TransactTime', 'OrderQty', 'CashOrderQty', 'OrdType', 'Price', 'StopPx', 'Currency', 'ComplianceID', 'SolicitedFlag', 'IOIid', 'QuoteID', 'TimeInForce', 'EffectiveTime', 'ExpireDate', 'ExpireTime', 'GTBookingInst', 'Commission', 'CommType', 'Rule80A', 'ForexReq', 'SettlCurrency', 'Text', 'EncodedTextLen', 'EncodedText', 'FutSettDate2', 'OrderQty2', 'OpenClose', 'CoveredOrUncovered', 'CustomerOrFirm', 'MaxShow', 'PegDifference', 'DiscretionInst', 'DiscretionOffset', 'ClearingFirm', 'ClearingAccount'])
+
+_msg_NewOrderSingle_tags = {
+	11: ('ClOrdID', str, None),
+	109: ('ClientID', str, None),
+	76: ('ExecBroker', str, None),
+	1: ('Account', str, None),
+	78: ('NoAllocs', int, None),
+	63: ('SettlmntTyp', str, None),
+	64: ('FutSettDate', str, None),
+	21: ('HandlInst', str, None),
+	18: ('ExecInst', str, None),
+	110: ('MinQty', float, None),
+	111: ('MaxFloor', float, None),
+	100: ('ExDestination', str, None),
+	386: ('NoTradingSessions', int, None),
+	81: ('ProcessCode', str, None),
+	55: ('Symbol', str, None),
+	65: ('SymbolSfx', str, None),
+	48: ('SecurityID', str, None),
+	22: ('IDSource', str, None),
+	167: ('SecurityType', str, None),
+	200: ('MaturityMonthYear', str, None),
+	205: ('MaturityDay', int, None),
+	201: ('PutOrCall', int, None),
+	202: ('StrikePrice', float, None),
+	206: ('OptAttribute', str, None),
+	231: ('ContractMultiplier', float, None),
+	223: ('CouponRate', float, None),
+	207: ('SecurityExchange', str, None),
+	106: ('Issuer', str, None),
+	348: ('EncodedIssuerLen', int, None),
+	349: ('EncodedIssuer', str, None),
+	107: ('SecurityDesc', str, None),
+	350: ('EncodedSecurityDescLen', int, None),
+	351: ('EncodedSecurityDesc', str, None),
+	140: ('PrevClosePx', float, None),
+	54: ('Side', str, None),
+	114: ('LocateReqd', str, None),
+	60: ('TransactTime', str, None),
+	38: ('OrderQty', float, None),
+	152: ('CashOrderQty', float, None),
+	40: ('OrdType', str, None),
+	44: ('Price', float, None),
+	99: ('StopPx', float, None),
+	15: ('Currency', str, None),
+	376: ('ComplianceID', str, None),
+	377: ('SolicitedFlag', str, None),
+	23: ('IOIid', str, None),
+	117: ('QuoteID', str, None),
+	59: ('TimeInForce', str, None),
+	168: ('EffectiveTime', str, None),
+	432: ('ExpireDate', str, None),
+	126: ('ExpireTime', str, None),
+	427: ('GTBookingInst', int, None),
+	12: ('Commission', float, None),
+	13: ('CommType', str, None),
+	47: ('Rule80A', str, None),
+	121: ('ForexReq', str, None),
+	120: ('SettlCurrency', str, None),
+	58: ('Text', str, None),
+	354: ('EncodedTextLen', int, None),
+	355: ('EncodedText', str, None),
+	193: ('FutSettDate2', str, None),
+	192: ('OrderQty2', float, None),
+	77: ('OpenClose', str, None),
+	203: ('CoveredOrUncovered', int, None),
+	204: ('CustomerOrFirm', int, None),
+	210: ('MaxShow', float, None),
+	211: ('PegDifference', float, None),
+	388: ('DiscretionInst', str, None),
+	389: ('DiscretionOffset', float, None),
+	439: ('ClearingFirm', str, None),
+	440: ('ClearingAccount', str, None),
+}
+
+def _encode_NewOrderSingle(obj, fixm):
+	d = obj.__dict__
+	add = fixm.append
+	n = 1
+	if 'ClOrdID' in d:
+		add('11=' + str(d['ClOrdID']))
+		n += 1
+	if 'ClientID' in d:
+		add('109=' + str(d['ClientID']))
+		n += 1
+	if 'ExecBroker' in d:
+		add('76=' + str(d['ExecBroker']))
+		n += 1
+	if 'Account' in d:
+		add('1=' + str(d['Account']))
+		n += 1
+	if 'NoAllocs' in d:
+		add('78=' + str(d['NoAllocs']))
+		n += 1
+	if 'SettlmntTyp' in d:
+		add('63=' + str(d['SettlmntTyp']))
+		n += 1
+	if 'FutSettDate' in d:
+		add('64=' + str(d['FutSettDate']))
+		n += 1
+	if 'HandlInst' in d:
+		add('21=' + str(d['HandlInst']))
+		n += 1
+	if 'ExecInst' in d:
+		add('18=' + str(d['ExecInst']))
+		n += 1
+	if 'MinQty' in d:
+		add('110=' + str(d['MinQty']))
+		n += 1
+	if 'MaxFloor' in d:
+		add('111=' + str(d['MaxFloor']))
+		n += 1
+	if 'ExDestination' in d:
+		add('100=' + str(d['ExDestination']))
+		n += 1
+	if 'NoTradingSessions' in d:
+		add('386=' + str(d['NoTradingSessions']))
+		n += 1
+	if 'ProcessCode' in d:
+		add('81=' + str(d['ProcessCode']))
+		n += 1
+	if 'Symbol' in d:
+		add('55=' + str(d['Symbol']))
+		n += 1
+	if 'SymbolSfx' in d:
+		add('65=' + str(d['SymbolSfx']))
+		n += 1
+	if 'SecurityID' in d:
+		add('48=' + str(d['SecurityID']))
+		n += 1
+	if 'IDSource' in d:
+		add('22=' + str(d['IDSource']))
+		n += 1
+	if 'SecurityType' in d:
+		add('167=' + str(d['SecurityType']))
+		n += 1
+	if 'MaturityMonthYear' in d:
+		add('200=' + str(d['MaturityMonthYear']))
+		n += 1
+	if 'MaturityDay' in d:
+		add('205=' + str(d['MaturityDay']))
+		n += 1
+	if 'PutOrCall' in d:
+		add('201=' + str(d['PutOrCall']))
+		n += 1
+	if 'StrikePrice' in d:
+		add('202=' + str(d['StrikePrice']))
+		n += 1
+	if 'OptAttribute' in d:
+		add('206=' + str(d['OptAttribute']))
+		n += 1
+	if 'ContractMultiplier' in d:
+		add('231=' + str(d['ContractMultiplier']))
+		n += 1
+	if 'CouponRate' in d:
+		add('223=' + str(d['CouponRate']))
+		n += 1
+	if 'SecurityExchange' in d:
+		add('207=' + str(d['SecurityExchange']))
+		n += 1
+	if 'Issuer' in d:
+		add('106=' + str(d['Issuer']))
+		n += 1
+	if 'EncodedIssuerLen' in d:
+		add('348=' + str(d['EncodedIssuerLen']))
+		n += 1
+	if 'EncodedIssuer' in d:
+		add('349=' + str(d['EncodedIssuer']))
+		n += 1
+	if 'SecurityDesc' in d:
+		add('107=' + str(d['SecurityDesc']))
+		n += 1
+	if 'EncodedSecurityDescLen' in d:
+		add('350=' + str(d['EncodedSecurityDescLen']))
+		n += 1
+	if 'EncodedSecurityDesc' in d:
+		add('351=' + str(d['EncodedSecurityDesc']))
+		n += 1
+	if 'PrevClosePx' in d:
+		add('140=' + str(d['PrevClosePx']))
+		n += 1
+	if 'Side' in d:
+		add('54=' + str(d['Side']))
+		n += 1
+	if 'LocateReqd' in d:
+		add('114=' + str(d['LocateReqd']))
+		n += 1
+	if 'TransactTime' in d:
+		add('60=' + str(d['TransactTime']))
+		n += 1
+	if 'OrderQty' in d:
+		add('38=' + str(d['OrderQty']))
+		n += 1
+	if 'CashOrderQty' in d:
+		add('152=' + str(d['CashOrderQty']))
+		n += 1
+	if 'OrdType' in d:
+		add('40=' + str(d['OrdType']))
+		n += 1
+	if 'Price' in d:
+		add('44=' + str(d['Price']))
+		n += 1
+	if 'StopPx' in d:
+		add('99=' + str(d['StopPx']))
+		n += 1
+	if 'Currency' in d:
+		add('15=' + str(d['Currency']))
+		n += 1
+	if 'ComplianceID' in d:
+		add('376=' + str(d['ComplianceID']))
+		n += 1
+	if 'SolicitedFlag' in d:
+		add('377=' + str(d['SolicitedFlag']))
+		n += 1
+	if 'IOIid' in d:
+		add('23=' + str(d['IOIid']))
+		n += 1
+	if 'QuoteID' in d:
+		add('117=' + str(d['QuoteID']))
+		n += 1
+	if 'TimeInForce' in d:
+		add('59=' + str(d['TimeInForce']))
+		n += 1
+	if 'EffectiveTime' in d:
+		add('168=' + str(d['EffectiveTime']))
+		n += 1
+	if 'ExpireDate' in d:
+		add('432=' + str(d['ExpireDate']))
+		n += 1
+	if 'ExpireTime' in d:
+		add('126=' + str(d['ExpireTime']))
+		n += 1
+	if 'GTBookingInst' in d:
+		add('427=' + str(d['GTBookingInst']))
+		n += 1
+	if 'Commission' in d:
+		add('12=' + str(d['Commission']))
+		n += 1
+	if 'CommType' in d:
+		add('13=' + str(d['CommType']))
+		n += 1
+	if 'Rule80A' in d:
+		add('47=' + str(d['Rule80A']))
+		n += 1
+	if 'ForexReq' in d:
+		add('121=' + str(d['ForexReq']))
+		n += 1
+	if 'SettlCurrency' in d:
+		add('120=' + str(d['SettlCurrency']))
+		n += 1
+	if 'Text' in d:
+		add('58=' + str(d['Text']))
+		n += 1
+	if 'EncodedTextLen' in d:
+		add('354=' + str(d['EncodedTextLen']))
+		n += 1
+	if 'EncodedText' in d:
+		add('355=' + str(d['EncodedText']))
+		n += 1
+	if 'FutSettDate2' in d:
+		add('193=' + str(d['FutSettDate2']))
+		n += 1
+	if 'OrderQty2' in d:
+		add('192=' + str(d['OrderQty2']))
+		n += 1
+	if 'OpenClose' in d:
+		add('77=' + str(d['OpenClose']))
+		n += 1
+	if 'CoveredOrUncovered' in d:
+		add('203=' + str(d['CoveredOrUncovered']))
+		n += 1
+	if 'CustomerOrFirm' in d:
+		add('204=' + str(d['CustomerOrFirm']))
+		n += 1
+	if 'MaxShow' in d:
+		add('210=' + str(d['MaxShow']))
+		n += 1
+	if 'PegDifference' in d:
+		add('211=' + str(d['PegDifference']))
+		n += 1
+	if 'DiscretionInst' in d:
+		add('388=' + str(d['DiscretionInst']))
+		n += 1
+	if 'DiscretionOffset' in d:
+		add('389=' + str(d['DiscretionOffset']))
+		n += 1
+	if 'ClearingFirm' in d:
+		add('439=' + str(d['ClearingFirm']))
+		n += 1
+	if 'ClearingAccount' in d:
+		add('440=' + str(d['ClearingAccount']))
+		n += 1
+	if len(d) > n:
+		_make_mbody(obj, obj._context, fixm, _msg_NewOrderSingle_names)
+	return fixm
+
+def _decode_NewOrderSingle(obj, fields, index, context):
+	d = obj.__dict__
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _msg_NewOrderSingle_tags.get(num)
+		if spec is None:
+			# not a field of this message, continue with generic decoder
+			body, index = _extract_body(fields, index, context, obj)
+			return index
+		name, pytype, decode_grp = spec
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	return index
 
 class NewOrderSingle(FixObject):
-	pass
+	_encode = staticmethod(_encode_NewOrderSingle)
+	_decode = staticmethod(_decode_NewOrderSingle)
+
+_msg_News_names = frozenset(['OrigTime', 'Urgency', 'Headline', 'EncodedHeadlineLen', 'EncodedHeadline', 'NoRoutingIDs', 'NoRelatedSym', 'LinesOfText', 'URLLink', 'RawDataLength', 'RawData'])
+
+_msg_News_tags = {
+	42: ('OrigTime', str, None),
+	61: ('Urgency', str, None),
+	148: ('Headline', str, None),
+	358: ('EncodedHeadlineLen', int, None),
+	359: ('EncodedHeadline', str, None),
+	215: ('NoRoutingIDs', int, None),
+	146: ('NoRelatedSym', int, None),
+	33: ('LinesOfText', int, None),
+	149: ('URLLink', str, None),
+	95: ('RawDataLength', int, None),
+	96: ('RawData', str, None),
+}
+
+def _encode_News(obj, fixm):
+	d = obj.__dict__
+	add = fixm.append
+	n = 1
+	if 'OrigTime' in d:
+		add('42=' + str(d['OrigTime']))
+		n += 1
+	if 'Urgency' in d:
+		add('61=' + str(d['Urgency']))
+		n += 1
+	if 'Headline' in d:
+		add('148=' + str(d['Headline']))
+		n += 1
+	if 'EncodedHeadlineLen' in d:
+		add('358=' + str(d['EncodedHeadlineLen']))
+		n += 1
+	if 'EncodedHeadline' in d:
+		add('359=' + str(d['EncodedHeadline']))
+		n += 1
+	if 'NoRoutingIDs' in d:
+		add('215=' + str(d['NoRoutingIDs']))
+		n += 1
+	if 'NoRelatedSym' in d:
+		add('146=' + str(d['NoRelatedSym']))
+		n += 1
+	if 'LinesOfText' in d:
+		add('33=' + str(d['LinesOfText']))
+		n += 1
+	if 'URLLink' in d:
+		add('149=' + str(d['URLLink']))
+		n += 1
+	if 'RawDataLength' in d:
+		add('95=' + str(d['RawDataLength']))
+		n += 1
+	if 'RawData' in d:
+		add('96=' + str(d['RawData']))
+		n += 1
+	if len(d) > n:
+		_make_mbody(obj, obj._context, fixm, _msg_News_names)
+	return fixm
+
+def _decode_News(obj, fields, index, context):
+	d = obj.__dict__
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _msg_News_tags.get(num)
+		if spec is None:
+			# not a field of this message, continue with generic decoder
+			body, index = _extract_body(fields, index, context, obj)
+			return index
+		name, pytype, decode_grp = spec
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	return index
 
 class News(FixObject):
-	pass
+	_encode = staticmethod(_encode_News)
+	_decode = staticmethod(_decode_News)
+
+_msg_OrderCancelReject_names = frozenset(['OrderID', 'SecondaryOrderID', 'ClOrdID', 'OrigClOrdID', 'OrdStatus', 'ClientID', 'ExecBroker', 'ListID', 'Account', 'TransactTime', 'CxlRejResponseTo', 'CxlRejReason', 'Text', 'EncodedTextLen', 'EncodedText'])
+
+_msg_OrderCancelReject_tags = {
+	37: ('OrderID', str, None),
+	198: ('SecondaryOrderID', str, None),
+	11: ('ClOrdID', str, None),
+	41: ('OrigClOrdID', str, None),
+	39: ('OrdStatus', str, None),
+	109: ('ClientID', str, None),
+	76: ('ExecBroker', str, None),
+	66: ('ListID', str, None),
+	1: ('Account', str, None),
+	60: ('TransactTime', str, None),
+	434: ('CxlRejResponseTo', str, None),
+	102: ('CxlRejReason', int, None),
+	58: ('Text', str, None),
+	354: ('EncodedTextLen', int, None),
+	355: ('EncodedText', str, None),
+}
+
+def _encode_OrderCancelReject(obj, fixm):
+	d = obj.__dict__
+	add = fixm.append
+	n = 1
+	if 'OrderID' in d:
+		add('37=' + str(d['OrderID']))
+		n += 1
+	if 'SecondaryOrderID' in d:
+		add('198=' + str(d['SecondaryOrderID']))
+		n += 1
+	if 'ClOrdID' in d:
+		add('11=' + str(d['ClOrdID']))
+		n += 1
+	if 'OrigClOrdID' in d:
+		add('41=' + str(d['OrigClOrdID']))
+		n += 1
+	if 'OrdStatus' in d:
+		add('39=' + str(d['OrdStatus']))
+		n += 1
+	if 'ClientID' in d:
+		add('109=' + str(d['ClientID']))
+		n += 1
+	if 'ExecBroker' in d:
+		add('76=' + str(d['ExecBroker']))
+		n += 1
+	if 'ListID' in d:
+		add('66=' + str(d['ListID']))
+		n += 1
+	if 'Account' in d:
+		add('1=' + str(d['Account']))
+		n += 1
+	if 'TransactTime' in d:
+		add('60=' + str(d['TransactTime']))
+		n += 1
+	if 'CxlRejResponseTo' in d:
+		add('434=' + str(d['CxlRejResponseTo']))
+		n += 1
+	if 'CxlRejReason' in d:
+		add('102=' + str(d['CxlRejReason']))
+		n += 1
+	if 'Text' in d:
+		add('58=' + str(d['Text']))
+		n += 1
+	if 'EncodedTextLen' in d:
+		add('354=' + str(d['EncodedTextLen']))
+		n += 1
+	if 'EncodedText' in d:
+		add('355=' + str(d['EncodedText']))
+		n += 1
+	if len(d) > n:
+		_make_mbody(obj, obj._context, fixm, _msg_OrderCancelReject_names)
+	return fixm
+
+def _decode_OrderCancelReject(obj, fields, index, context):
+	d = obj.__dict__
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _msg_OrderCancelReject_tags.get(num)
+		if spec is None:
+			# not a field of this message, continue with generic decoder
+			body, index = _extract_body(fields, index, context, obj)
+			return index
+		name, pytype, decode_grp = spec
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	return index
 
 class OrderCancelReject(FixObject):
-	pass
+	_encode = staticmethod(_encode_OrderCancelReject)
+	_decode = staticmethod(_decode_OrderCancelReject)
+
+_msg_OrderCancelReplaceRequest_names = frozenset(['OrderID', 'ClientID', 'ExecBroker', 'OrigClOrdID', 'ClOrdID', 'ListID', 'Account', 'NoAllocs', 'SettlmntTyp', 'FutSettDate', 'HandlInst', 'ExecInst', 'MinQty', 'MaxFloor', 'ExDestination', 'NoTradingSessions', 'Symbol', 'SymbolSfx', 'SecurityID', 'IDSource', 'SecurityType', 'MaturityMonthYear', 'MaturityDay', 'PutOrCall', 'StrikePrice', 'OptAttribute', 'ContractMultiplier', 'CouponRate', 'SecurityExchange', 'Issuer', 'EncodedIssuerLen', 'EncodedIssuer', 'SecurityDesc', 'EncodedSecurityDescLen', 'EncodedSecurityDesc', 'Side', 'TransactTime', 'OrderQty', 'CashOrderQty', 'OrdType', 'Price', 'StopPx', 'PegDifference', 'DiscretionInst', 'DiscretionOffset', 'ComplianceID', 'SolicitedFlag', 'Currency', 'TimeInForce', 'EffectiveTime', 'ExpireDate', 'ExpireTime', 'GTBookingInst', 'Commission', 'CommType', 'Rule80A', 'ForexReq', 'SettlCurrency', 'Text', 'EncodedTextLen', 'EncodedText', 'FutSettDate2', 'OrderQty2', 'OpenClose', 'CoveredOrUncovered', 'CustomerOrFirm', 'MaxShow', 'LocateReqd', 'ClearingFirm', 'ClearingAccount'])
+
+_msg_OrderCancelReplaceRequest_tags = {
+	37: ('OrderID', str, None),
+	109: ('ClientID', str, None),
+	76: ('ExecBroker', str, None),
+	41: ('OrigClOrdID', str, None),
+	11: ('ClOrdID', str, None),
+	66: ('ListID', str, None),
+	1: ('Account', str, None),
+	78: ('NoAllocs', int, None),
+	63: ('SettlmntTyp', str, None),
+	64: ('FutSettDate', str, None),
+	21: ('HandlInst', str, None),
+	18: ('ExecInst', str, None),
+	110: ('MinQty', float, None),
+	111: ('MaxFloor', float, None),
+	100: ('ExDestination', str, None),
+	386: ('NoTradingSessions', int, None),
+	55: ('Symbol', str, None),
+	65: ('SymbolSfx', str, None),
+	48: ('SecurityID', str, None),
+	22: ('IDSource', str, None),
+	167: ('SecurityType', str, None),
+	200: ('MaturityMonthYear', str, None),
+	205: ('MaturityDay', int, None),
+	201: ('PutOrCall', int, None),
+	202: ('StrikePrice', float, None),
+	206: ('OptAttribute', str, None),
+	231: ('ContractMultiplier', float, None),
+	223: ('CouponRate', float, None),
+	207: ('SecurityExchange', str, None),
+	106: ('Issuer', str, None),
+	348: ('EncodedIssuerLen', int, None),
+	349: ('EncodedIssuer', str, None),
+	107: ('SecurityDesc', str, None),
+	350: ('EncodedSecurityDescLen', int, None),
+	351: ('EncodedSecurityDesc', str, None),
+	54: ('Side', str, None),
+	60: ('TransactTime', str, None),
+	38: ('OrderQty', float, None),
+	152: ('CashOrderQty', float, None),
+	40: ('OrdType', str, None),
+	44: ('Price', float, None),
+	99: ('StopPx', float, None),
+	211: ('PegDifference', float, None),
+	388: ('DiscretionInst', str, None),
+	389: ('DiscretionOffset', float, None),
+	376: ('ComplianceID', str, None),
+	377: ('SolicitedFlag', str, None),
+	15: ('Currency', str, None),
+	59: ('TimeInForce', str, None),
+	168: ('EffectiveTime', str, None),
+	432: ('ExpireDate', str, None),
+	126: ('ExpireTime', str, None),
+	427: ('GTBookingInst', int, None),
+	12: ('Commission', float, None),
+	13: ('CommType', str, None),
+	47: ('Rule80A', str, None),
+	121: ('ForexReq', str, None),
+	120: ('SettlCurrency', str, None),
+	58: ('Text', str, None),
+	354: ('EncodedTextLen', int, None),
+	355: ('EncodedText', str, None),
+	193: ('FutSettDate2', str, None),
+	192: ('OrderQty2', float, None),
+	77: ('OpenClose', str, None),
+	203: ('CoveredOrUncovered', int, None),
+	204: ('CustomerOrFirm', int, None),
+	210: ('MaxShow', float, None),
+	114: ('LocateReqd', str, None),
+	439: ('ClearingFirm', str, None),
+	440: ('ClearingAccount', str, None),
+}
+
+def _encode_OrderCancelReplaceRequest(obj, fixm):
+	d = obj.__dict__
+	add = fixm.append
+	n = 1
+	if 'OrderID' in d:
+		add('37=' + str(d['OrderID']))
+		n += 1
+	if 'ClientID' in d:
+		add('109=' + str(d['ClientID']))
+		n += 1
+	if 'ExecBroker' in d:
+		add('76=' + str(d['ExecBroker']))
+		n += 1
+	if 'OrigClOrdID' in d:
+		add('41=' + str(d['OrigClOrdID']))
+		n += 1
+	if 'ClOrdID' in d:
+		add('11=' + str(d['ClOrdID']))
+		n += 1
+	if 'ListID' in d:
+		add('66=' + str(d['ListID']))
+		n += 1
+	if 'Account' in d:
+		add('1=' + str(d['Account']))
+		n += 1
+	if 'NoAllocs' in d:
+		add('78=' + str(d['NoAllocs']))
+		n += 1
+	if 'SettlmntTyp' in d:
+		add('63=' + str(d['SettlmntTyp']))
+		n += 1
+	if 'FutSettDate' in d:
+		add('64=' + str(d['FutSettDate']))
+		n += 1
+	if 'HandlInst' in d:
+		add('21=' + str(d['HandlInst']))
+		n += 1
+	if 'ExecInst' in d:
+		add('18=' + str(d['ExecInst']))
+		n += 1
+	if 'MinQty' in d:
+		add('110=' + str(d['MinQty']))
+		n += 1
+	if 'MaxFloor' in d:
+		add('111=' + str(d['MaxFloor']))
+		n += 1
+	if 'ExDestination' in d:
+		add('100=' + str(d['ExDestination']))
+		n += 1
+	if 'NoTradingSessions' in d:
+		add('386=' + str(d['NoTradingSessions']))
+		n += 1
+	if 'Symbol' in d:
+		add('55=' + str(d['Symbol']))
+		n += 1
+	if 'SymbolSfx' in d:
+		add('65=' + str(d['SymbolSfx']))
+		n += 1
+	if 'SecurityID' in d:
+		add('48=' + str(d['SecurityID']))
+		n += 1
+	if 'IDSource' in d:
+		add('22=' + str(d['IDSource']))
+		n += 1
+	if 'SecurityType' in d:
+		add('167=' + str(d['SecurityType']))
+		n += 1
+	if 'MaturityMonthYear' in d:
+		add('200=' + str(d['MaturityMonthYear']))
+		n += 1
+	if 'MaturityDay' in d:
+		add('205=' + str(d['MaturityDay']))
+		n += 1
+	if 'PutOrCall' in d:
+		add('201=' + str(d['PutOrCall']))
+		n += 1
+	if 'StrikePrice' in d:
+		add('202=' + str(d['StrikePrice']))
+		n += 1
+	if 'OptAttribute' in d:
+		add('206=' + str(d['OptAttribute']))
+		n += 1
+	if 'ContractMultiplier' in d:
+		add('231=' + str(d['ContractMultiplier']))
+		n += 1
+	if 'CouponRate' in d:
+		add('223=' + str(d['CouponRate']))
+		n += 1
+	if 'SecurityExchange' in d:
+		add('207=' + str(d['SecurityExchange']))
+		n += 1
+	if 'Issuer' in d:
+		add('106=' + str(d['Issuer']))
+		n += 1
+	if 'EncodedIssuerLen' in d:
+		add('348=' + str(d['EncodedIssuerLen']))
+		n += 1
+	if 'EncodedIssuer' in d:
+		add('349=' + str(d['EncodedIssuer']))
+		n += 1
+	if 'SecurityDesc' in d:
+		add('107=' + str(d['SecurityDesc']))
+		n += 1
+	if 'EncodedSecurityDescLen' in d:
+		add('350=' + str(d['EncodedSecurityDescLen']))
+		n += 1
+	if 'EncodedSecurityDesc' in d:
+		add('351=' + str(d['EncodedSecurityDesc']))
+		n += 1
+	if 'Side' in d:
+		add('54=' + str(d['Side']))
+		n += 1
+	if 'TransactTime' in d:
+		add('60=' + str(d['TransactTime']))
+		n += 1
+	if 'OrderQty' in d:
+		add('38=' + str(d['OrderQty']))
+		n += 1
+	if 'CashOrderQty' in d:
+		add('152=' + str(d['CashOrderQty']))
+		n += 1
+	if 'OrdType' in d:
+		add('40=' + str(d['OrdType']))
+		n += 1
+	if 'Price' in d:
+		add('44=' + str(d['Price']))
+		n += 1
+	if 'StopPx' in d:
+		add('99=' + str(d['StopPx']))
+		n += 1
+	if 'PegDifference' in d:
+		add('211=' + str(d['PegDifference']))
+		n += 1
+	if 'DiscretionInst' in d:
+		add('388=' + str(d['DiscretionInst']))
+		n += 1
+	if 'DiscretionOffset' in d:
+		add('389=' + str(d['DiscretionOffset']))
+		n += 1
+	if 'ComplianceID' in d:
+		add('376=' + str(d['ComplianceID']))
+		n += 1
+	if 'SolicitedFlag' in d:
+		add('377=' + str(d['SolicitedFlag']))
+		n += 1
+	if 'Currency' in d:
+		add('15=' + str(d['Currency']))
+		n += 1
+	if 'TimeInForce' in d:
+		add('59=' + str(d['TimeInForce']))
+		n += 1
+	if 'EffectiveTime' in d:
+		add('168=' + str(d['EffectiveTime']))
+		n += 1
+	if 'ExpireDate' in d:
+		add('432=' + str(d['ExpireDate']))
+		n += 1
+	if 'ExpireTime' in d:
+		add('126=' + str(d['ExpireTime']))
+		n += 1
+	if 'GTBookingInst' in d:
+		add('427=' + str(d['GTBookingInst']))
+		n += 1
+	if 'Commission' in d:
+		add('12=' + str(d['Commission']))
+		n += 1
+	if 'CommType' in d:
+		add('13=' + str(d['CommType']))
+		n += 1
+	if 'Rule80A' in d:
+		add('47=' + str(d['Rule80A']))
+		n += 1
+	if 'ForexReq' in d:
+		add('121=' + str(d['ForexReq']))
+		n += 1
+	if 'SettlCurrency' in d:
+		add('120=' + str(d['SettlCurrency']))
+		n += 1
+	if 'Text' in d:
+		add('58=' + str(d['Text']))
+		n += 1
+	if 'EncodedTextLen' in d:
+		add('354=' + str(d['EncodedTextLen']))
+		n += 1
+	if 'EncodedText' in d:
+		add('355=' + str(d['EncodedText']))
+		n += 1
+	if 'FutSettDate2' in d:
+		add('193=' + str(d['FutSettDate2']))
+		n += 1
+	if 'OrderQty2' in d:
+		add('192=' + str(d['OrderQty2']))
+		n += 1
+	if 'OpenClose' in d:
+		add('77=' + str(d['OpenClose']))
+		n += 1
+	if 'CoveredOrUncovered' in d:
+		add('203=' + str(d['CoveredOrUncovered']))
+		n += 1
+	if 'CustomerOrFirm' in d:
+		add('204=' + str(d['CustomerOrFirm']))
+		n += 1
+	if 'MaxShow' in d:
+		add('210=' + str(d['MaxShow']))
+		n += 1
+	if 'LocateReqd' in d:
+		add('114=' + str(d['LocateReqd']))
+		n += 1
+	if 'ClearingFirm' in d:
+		add('439=' + str(d['ClearingFirm']))
+		n += 1
+	if 'ClearingAccount' in d:
+		add('440=' + str(d['ClearingAccount']))
+		n += 1
+	if len(d) > n:
+		_make_mbody(obj, obj._context, fixm, _msg_OrderCancelReplaceRequest_names)
+	return fixm
+
+def _decode_OrderCancelReplaceRequest(obj, fields, index, context):
+	d = obj.__dict__
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _msg_OrderCancelReplaceRequest_tags.get(num)
+		if spec is None:
+			# not a field of this message, continue with generic decoder
+			body, index = _extract_body(fields, index, context, obj)
+			return index
+		name, pytype, decode_grp = spec
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	return index
 
 class OrderCancelReplaceRequest(FixObject):
-	pass
+	_encode = staticmethod(_encode_OrderCancelReplaceRequest)
+	_decode = staticmethod(_decode_OrderCancelReplaceRequest)
+
+_msg_OrderCancelRequest_names = frozenset(['OrigClOrdID', 'OrderID', 'ClOrdID', 'ListID', 'Account', 'ClientID', 'ExecBroker', 'Symbol', 'SymbolSfx', 'SecurityID', 'IDSource', 'SecurityType', 'MaturityMonthYear', 'MaturityDay', 'PutOrCall', 'StrikePrice', 'OptAttribute', 'ContractMultiplier', 'CouponRate', 'SecurityExchange', 'Issuer', 'EncodedIssuerLen', 'EncodedIssuer', 'SecurityDesc', 'EncodedSecurityDescLen', 'EncodedSecurityDesc', 'Side', 'TransactTime', 'OrderQty', 'CashOrderQty', 'ComplianceID', 'SolicitedFlag', 'Text', 'EncodedTextLen', 'EncodedText'])
+
+_msg_OrderCancelRequest_tags = {
+	41: ('OrigClOrdID', str, None),
+	37: ('OrderID', str, None),
+	11: ('ClOrdID', str, None),
+	66: ('ListID', str, None),
+	1: ('Account', str, None),
+	109: ('ClientID', str, None),
+	76: ('ExecBroker', str, None),
+	55: ('Symbol', str, None),
+	65: ('SymbolSfx', str, None),
+	48: ('SecurityID', str, None),
+	22: ('IDSource', str, None),
+	167: ('SecurityType', str, None),
+	200: ('MaturityMonthYear', str, None),
+	205: ('MaturityDay', int, None),
+	201: ('PutOrCall', int, None),
+	202: ('StrikePrice', float, None),
+	206: ('OptAttribute', str, None),
+	231: ('ContractMultiplier', float, None),
+	223: ('CouponRate', float, None),
+	207: ('SecurityExchange', str, None),
+	106: ('Issuer', str, None),
+	348: ('EncodedIssuerLen', int, None),
+	349: ('EncodedIssuer', str, None),
+	107: ('SecurityDesc', str, None),
+	350: ('EncodedSecurityDescLen', int, None),
+	351: ('EncodedSecurityDesc', str, None),
+	54: ('Side', str, None),
+	60: ('TransactTime', str, None),
+	38: ('OrderQty', float, None),
+	152: ('CashOrderQty', float, None),
+	376: ('ComplianceID', str, None),
+	377: ('SolicitedFlag', str, None),
+	58: ('Text', str, None),
+	354: ('EncodedTextLen', int, None),
+	355: ('EncodedText', str, None),
+}
+
+def _encode_OrderCancelRequest(obj, fixm):
+	d = obj.__dict__
+	add = fixm.append
+	n = 1
+	if 'OrigClOrdID' in d:
+		add('41=' + str(d['OrigClOrdID']))
+		n += 1
+	if 'OrderID' in d:
+		add('37=' + str(d['OrderID']))
+		n += 1
+	if 'ClOrdID' in d:
+		add('11=' + str(d['ClOrdID']))
+		n += 1
+	if 'ListID' in d:
+		add('66=' + str(d['ListID']))
+		n += 1
+	if 'Account' in d:
+		add('1=' + str(d['Account']))
+		n += 1
+	if 'ClientID' in d:
+		add('109=' + str(d['ClientID']))
+		n += 1
+	if 'ExecBroker' in d:
+		add('76=' + str(d['ExecBroker']))
+		n += 1
+	if 'Symbol' in d:
+		add('55=' + str(d['Symbol']))
+		n += 1
+	if 'SymbolSfx' in d:
+		add('65=' + str(d['SymbolSfx']))
+		n += 1
+	if 'SecurityID' in d:
+		add('48=' + str(d['SecurityID']))
+		n += 1
+	if 'IDSource' in d:
+		add('22=' + str(d['IDSource']))
+		n += 1
+	if 'SecurityType' in d:
+		add('167=' + str(d['SecurityType']))
+		n += 1
+	if 'MaturityMonthYear' in d:
+		add('200=' + str(d['MaturityMonthYear']))
+		n += 1
+	if 'MaturityDay' in d:
+		add('205=' + str(d['MaturityDay']))
+		n += 1
+	if 'PutOrCall' in d:
+		add('201=' + str(d['PutOrCall']))
+		n += 1
+	if 'StrikePrice' in d:
+		add('202=' + str(d['StrikePrice']))
+		n += 1
+	if 'OptAttribute' in d:
+		add('206=' + str(d['OptAttribute']))
+		n += 1
+	if 'ContractMultiplier' in d:
+		add('231=' + str(d['ContractMultiplier']))
+		n += 1
+	if 'CouponRate' in d:
+		add('223=' + str(d['CouponRate']))
+		n += 1
+	if 'SecurityExchange' in d:
+		add('207=' + str(d['SecurityExchange']))
+		n += 1
+	if 'Issuer' in d:
+		add('106=' + str(d['Issuer']))
+		n += 1
+	if 'EncodedIssuerLen' in d:
+		add('348=' + str(d['EncodedIssuerLen']))
+		n += 1
+	if 'EncodedIssuer' in d:
+		add('349=' + str(d['EncodedIssuer']))
+		n += 1
+	if 'SecurityDesc' in d:
+		add('107=' + str(d['SecurityDesc']))
+		n += 1
+	if 'EncodedSecurityDescLen' in d:
+		add('350=' + str(d['EncodedSecurityDescLen']))
+		n += 1
+	if 'EncodedSecurityDesc' in d:
+		add('351=' + str(d['EncodedSecurityDesc']))
+		n += 1
+	if 'Side' in d:
+		add('54=' + str(d['Side']))
+		n += 1
+	if 'TransactTime' in d:
+		add('60=' + str(d['TransactTime']))
+		n += 1
+	if 'OrderQty' in d:
+		add('38=' + str(d['OrderQty']))
+		n += 1
+	if 'CashOrderQty' in d:
+		add('152=' + str(d['CashOrderQty']))
+		n += 1
+	if 'ComplianceID' in d:
+		add('376=' + str(d['ComplianceID']))
+		n += 1
+	if 'SolicitedFlag' in d:
+		add('377=' + str(d['SolicitedFlag']))
+		n += 1
+	if 'Text' in d:
+		add('58=' + str(d['Text']))
+		n += 1
+	if 'EncodedTextLen' in d:
+		add('354=' + str(d['EncodedTextLen']))
+		n += 1
+	if 'EncodedText' in d:
+		add('355=' + str(d['EncodedText']))
+		n += 1
+	if len(d) > n:
+		_make_mbody(obj, obj._context, fixm, _msg_OrderCancelRequest_names)
+	return fixm
+
+def _decode_OrderCancelRequest(obj, fields, index, context):
+	d = obj.__dict__
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _msg_OrderCancelRequest_tags.get(num)
+		if spec is None:
+			# not a field of this message, continue with generic decoder
+			body, index = _extract_body(fields, index, context, obj)
+			return index
+		name, pytype, decode_grp = spec
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	return index
 
 class OrderCancelRequest(FixObject):
-	pass
+	_encode = staticmethod(_encode_OrderCancelRequest)
+	_decode = staticmethod(_decode_OrderCancelRequest)
+
+_msg_OrderStatusRequest_names = frozenset(['OrderID', 'ClOrdID', 'ClientID', 'Account', 'ExecBroker', 'Symbol', 'SymbolSfx', 'SecurityID', 'IDSource', 'SecurityType', 'MaturityMonthYear', 'MaturityDay', 'PutOrCall', 'StrikePrice', 'OptAttribute', 'ContractMultiplier', 'CouponRate', 'SecurityExchange', 'Issuer', 'EncodedIssuerLen', 'EncodedIssuer', 'SecurityDesc', 'EncodedSecurityDescLen', 'EncodedSecurityDesc', 'Side'])
+
+_msg_OrderStatusRequest_tags = {
+	37: ('OrderID', str, None),
+	11: ('ClOrdID', str, None),
+	109: ('ClientID', str, None),
+	1: ('Account', str, None),
+	76: ('ExecBroker', str, None),
+	55: ('Symbol', str, None),
+	65: ('SymbolSfx', str, None),
+	48: ('SecurityID', str, None),
+	22: ('IDSource', str, None),
+	167: ('SecurityType', str, None),
+	200: ('MaturityMonthYear', str, None),
+	205: ('MaturityDay', int, None),
+	201: ('PutOrCall', int, None),
+	202: ('StrikePrice', float, None),
+	206: ('OptAttribute', str, None),
+	231: ('ContractMultiplier', float, None),
+	223: ('CouponRate', float, None),
+	207: ('SecurityExchange', str, None),
+	106: ('Issuer', str, None),
+	348: ('EncodedIssuerLen', int, None),
+	349: ('EncodedIssuer', str, None),
+	107: ('SecurityDesc', str, None),
+	350: ('EncodedSecurityDescLen', int, None),
+	351: ('EncodedSecurityDesc', str, None),
+	54: ('Side', str, None),
+}
+
+def _encode_OrderStatusRequest(obj, fixm):
+	d = obj.__dict__
+	add = fixm.append
+	n = 1
+	if 'OrderID' in d:
+		add('37=' + str(d['OrderID']))
+		n += 1
+	if 'ClOrdID' in d:
+		add('11=' + str(d['ClOrdID']))
+		n += 1
+	if 'ClientID' in d:
+		add('109=' + str(d['ClientID']))
+		n += 1
+	if 'Account' in d:
+		add('1=' + str(d['Account']))
+		n += 1
+	if 'ExecBroker' in d:
+		add('76=' + str(d['ExecBroker']))
+		n += 1
+	if 'Symbol' in d:
+		add('55=' + str(d['Symbol']))
+		n += 1
+	if 'SymbolSfx' in d:
+		add('65=' + str(d['SymbolSfx']))
+		n += 1
+	if 'SecurityID' in d:
+		add('48=' + str(d['SecurityID']))
+		n += 1
+	if 'IDSource' in d:
+		add('22=' + str(d['IDSource']))
+		n += 1
+	if 'SecurityType' in d:
+		add('167=' + str(d['SecurityType']))
+		n += 1
+	if 'MaturityMonthYear' in d:
+		add('200=' + str(d['MaturityMonthYear']))
+		n += 1
+	if 'MaturityDay' in d:
+		add('205=' + str(d['MaturityDay']))
+		n += 1
+	if 'PutOrCall' in d:
+		add('201=' + str(d['PutOrCall']))
+		n += 1
+	if 'StrikePrice' in d:
+		add('202=' + str(d['StrikePrice']))
+		n += 1
+	if 'OptAttribute' in d:
+		add('206=' + str(d['OptAttribute']))
+		n += 1
+	if 'ContractMultiplier' in d:
+		add('231=' + str(d['ContractMultiplier']))
+		n += 1
+	if 'CouponRate' in d:
+		add('223=' + str(d['CouponRate']))
+		n += 1
+	if 'SecurityExchange' in d:
+		add('207=' + str(d['SecurityExchange']))
+		n += 1
+	if 'Issuer' in d:
+		add('106=' + str(d['Issuer']))
+		n += 1
+	if 'EncodedIssuerLen' in d:
+		add('348=' + str(d['EncodedIssuerLen']))
+		n += 1
+	if 'EncodedIssuer' in d:
+		add('349=' + str(d['EncodedIssuer']))
+		n += 1
+	if 'SecurityDesc' in d:
+		add('107=' + str(d['SecurityDesc']))
+		n += 1
+	if 'EncodedSecurityDescLen' in d:
+		add('350=' + str(d['EncodedSecurityDescLen']))
+		n += 1
+	if 'EncodedSecurityDesc' in d:
+		add('351=' + str(d['EncodedSecurityDesc']))
+		n += 1
+	if 'Side' in d:
+		add('54=' + str(d['Side']))
+		n += 1
+	if len(d) > n:
+		_make_mbody(obj, obj._context, fixm, _msg_OrderStatusRequest_names)
+	return fixm
+
+def _decode_OrderStatusRequest(obj, fields, index, context):
+	d = obj.__dict__
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _msg_OrderStatusRequest_tags.get(num)
+		if spec is None:
+			# not a field of this message, continue with generic decoder
+			body, index = _extract_body(fields, index, context, obj)
+			return index
+		name, pytype, decode_grp = spec
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	return index
 
 class OrderStatusRequest(FixObject):
-	pass
+	_encode = staticmethod(_encode_OrderStatusRequest)
+	_decode = staticmethod(_decode_OrderStatusRequest)
+
+_msg_Quote_names = frozenset(['QuoteReqID', 'QuoteID', 'QuoteResponseLevel', 'TradingSessionID', 'Symbol', 'SymbolSfx', 'SecurityID', 'IDSource', 'SecurityType', 'MaturityMonthYear', 'MaturityDay', 'PutOrCall', 'StrikePrice', 'OptAttribute', 'ContractMultiplier', 'CouponRate', 'SecurityExchange', 'Issuer', 'EncodedIssuerLen', 'EncodedIssuer', 'SecurityDesc', 'EncodedSecurityDescLen', 'EncodedSecurityDesc', 'BidPx', 'OfferPx', 'BidSize', 'OfferSize', 'ValidUntilTime', 'BidSpotRate', 'OfferSpotRate', 'BidForwardPoints', 'OfferForwardPoints', 'TransactTime', 'FutSettDate', 'OrdType', 'FutSettDate2', 'OrderQty2', 'Currency'])
+
+_msg_Quote_tags = {
+	131: ('QuoteReqID', str, None),
+	117: ('QuoteID', str, None),
+	301: ('QuoteResponseLevel', int, None),
+	336: ('TradingSessionID', str, None),
+	55: ('Symbol', str, None),
+	65: ('SymbolSfx', str, None),
+	48: ('SecurityID', str, None),
+	22: ('IDSource', str, None),
+	167: ('SecurityType', str, None),
+	200: ('MaturityMonthYear', str, None),
+	205: ('MaturityDay', int, None),
+	201: ('PutOrCall', int, None),
+	202: ('StrikePrice', float, None),
+	206: ('OptAttribute', str, None),
+	231: ('ContractMultiplier', float, None),
+	223: ('CouponRate', float, None),
+	207: ('SecurityExchange', str, None),
+	106: ('Issuer', str, None),
+	348: ('EncodedIssuerLen', int, None),
+	349: ('EncodedIssuer', str, None),
+	107: ('SecurityDesc', str, None),
+	350: ('EncodedSecurityDescLen', int, None),
+	351: ('EncodedSecurityDesc', str, None),
+	132: ('BidPx', float, None),
+	133: ('OfferPx', float, None),
+	134: ('BidSize', float, None),
+	135: ('OfferSize', float, None),
+	62: ('ValidUntilTime', str, None),
+	188: ('BidSpotRate', float, None),
+	190: ('OfferSpotRate', float, None),
+	189: ('BidForwardPoints', float, None),
+	191: ('OfferForwardPoints', float, None),
+	60: ('TransactTime', str, None),
+	64: ('FutSettDate', str, None),
+	40: ('OrdType', str, None),
+	193: ('FutSettDate2', str, None),
+	192: ('OrderQty2', float, None),
+	15: ('Currency', str, None),
+}
+
+def _encode_Quote(obj, fixm):
+	d = obj.__dict__
+	add = fixm.append
+	n = 1
+	if 'QuoteReqID' in d:
+		add('131=' + str(d['QuoteReqID']))
+		n += 1
+	if 'QuoteID' in d:
+		add('117=' + str(d['QuoteID']))
+		n += 1
+	if 'QuoteResponseLevel' in d:
+		add('301=' + str(d['QuoteResponseLevel']))
+		n += 1
+	if 'TradingSessionID' in d:
+		add('336=' + str(d['TradingSessionID']))
+		n += 1
+	if 'Symbol' in d:
+		add('55=' + str(d['Symbol']))
+		n += 1
+	if 'SymbolSfx' in d:
+		add('65=' + str(d['SymbolSfx']))
+		n += 1
+	if 'SecurityID' in d:
+		add('48=' + str(d['SecurityID']))
+		n += 1
+	if 'IDSource' in d:
+		add('22=' + str(d['IDSource']))
+		n += 1
+	if 'SecurityType' in d:
+		add('167=' + str(d['SecurityType']))
+		n += 1
+	if 'MaturityMonthYear' in d:
+		add('200=' + str(d['MaturityMonthYear']))
+		n += 1
+	if 'MaturityDay' in d:
+		add('205=' + str(d['MaturityDay']))
+		n += 1
+	if 'PutOrCall' in d:
+		add('201=' + str(d['PutOrCall']))
+		n += 1
+	if 'StrikePrice' in d:
+		add('202=' + str(d['StrikePrice']))
+		n += 1
+	if 'OptAttribute' in d:
+		add('206=' + str(d['OptAttribute']))
+		n += 1
+	if 'ContractMultiplier' in d:
+		add('231=' + str(d['ContractMultiplier']))
+		n += 1
+	if 'CouponRate' in d:
+		add('223=' + str(d['CouponRate']))
+		n += 1
+	if 'SecurityExchange' in d:
+		add('207=' + str(d['SecurityExchange']))
+		n += 1
+	if 'Issuer' in d:
+		add('106=' + str(d['Issuer']))
+		n += 1
+	if 'EncodedIssuerLen' in d:
+		add('348=' + str(d['EncodedIssuerLen']))
+		n += 1
+	if 'EncodedIssuer' in d:
+		add('349=' + str(d['EncodedIssuer']))
+		n += 1
+	if 'SecurityDesc' in d:
+		add('107=' + str(d['SecurityDesc']))
+		n += 1
+	if 'EncodedSecurityDescLen' in d:
+		add('350=' + str(d['EncodedSecurityDescLen']))
+		n += 1
+	if 'EncodedSecurityDesc' in d:
+		add('351=' + str(d['EncodedSecurityDesc']))
+		n += 1
+	if 'BidPx' in d:
+		add('132=' + str(d['BidPx']))
+		n += 1
+	if 'OfferPx' in d:
+		add('133=' + str(d['OfferPx']))
+		n += 1
+	if 'BidSize' in d:
+		add('134=' + str(d['BidSize']))
+		n += 1
+	if 'OfferSize' in d:
+		add('135=' + str(d['OfferSize']))
+		n += 1
+	if 'ValidUntilTime' in d:
+		add('62=' + str(d['ValidUntilTime']))
+		n += 1
+	if 'BidSpotRate' in d:
+		add('188=' + str(d['BidSpotRate']))
+		n += 1
+	if 'OfferSpotRate' in d:
+		add('190=' + str(d['OfferSpotRate']))
+		n += 1
+	if 'BidForwardPoints' in d:
+		add('189=' + str(d['BidForwardPoints']))
+		n += 1
+	if 'OfferForwardPoints' in d:
+		add('191=' + str(d['OfferForwardPoints']))
+		n += 1
+	if 'TransactTime' in d:
+		add('60=' + str(d['TransactTime']))
+		n += 1
+	if 'FutSettDate' in d:
+		add('64=' + str(d['FutSettDate']))
+		n += 1
+	if 'OrdType' in d:
+		add('40=' + str(d['OrdType']))
+		n += 1
+	if 'FutSettDate2' in d:
+		add('193=' + str(d['FutSettDate2']))
+		n += 1
+	if 'OrderQty2' in d:
+		add('192=' + str(d['OrderQty2']))
+		n += 1
+	if 'Currency' in d:
+		add('15=' + str(d['Currency']))
+		n += 1
+	if len(d) > n:
+		_make_mbody(obj, obj._context, fixm, _msg_Quote_names)
+	return fixm
+
+def _decode_Quote(obj, fields, index, context):
+	d = obj.__dict__
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _msg_Quote_tags.get(num)
+		if spec is None:
+			# not a field of this message, continue with generic decoder
+			body, index = _extract_body(fields, index, context, obj)
+			return index
+		name, pytype, decode_grp = spec
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	return index
 
 class Quote(FixObject):
-	pass
+	_encode = staticmethod(_encode_Quote)
+	_decode = staticmethod(_decode_Quote)
+
+_msg_QuoteAcknowledgement_names = frozenset(['QuoteReqID', 'QuoteID', 'QuoteAckStatus', 'QuoteRejectReason', 'QuoteResponseLevel', 'TradingSessionID', 'Text', 'NoQuoteSets'])
+
+_msg_QuoteAcknowledgement_tags = {
+	131: ('QuoteReqID', str, None),
+	117: ('QuoteID', str, None),
+	297: ('QuoteAckStatus', int, None),
+	300: ('QuoteRejectReason', int, None),
+	301: ('QuoteResponseLevel', int, None),
+	336: ('TradingSessionID', str, None),
+	58: ('Text', str, None),
+	296: ('NoQuoteSets', int, None),
+}
+
+def _encode_QuoteAcknowledgement(obj, fixm):
+	d = obj.__dict__
+	add = fixm.append
+	n = 1
+	if 'QuoteReqID' in d:
+		add('131=' + str(d['QuoteReqID']))
+		n += 1
+	if 'QuoteID' in d:
+		add('117=' + str(d['QuoteID']))
+		n += 1
+	if 'QuoteAckStatus' in d:
+		add('297=' + str(d['QuoteAckStatus']))
+		n += 1
+	if 'QuoteRejectReason' in d:
+		add('300=' + str(d['QuoteRejectReason']))
+		n += 1
+	if 'QuoteResponseLevel' in d:
+		add('301=' + str(d['QuoteResponseLevel']))
+		n += 1
+	if 'TradingSessionID' in d:
+		add('336=' + str(d['TradingSessionID']))
+		n += 1
+	if 'Text' in d:
+		add('58=' + str(d['Text']))
+		n += 1
+	if 'NoQuoteSets' in d:
+		add('296=' + str(d['NoQuoteSets']))
+		n += 1
+	if len(d) > n:
+		_make_mbody(obj, obj._context, fixm, _msg_QuoteAcknowledgement_names)
+	return fixm
+
+def _decode_QuoteAcknowledgement(obj, fields, index, context):
+	d = obj.__dict__
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _msg_QuoteAcknowledgement_tags.get(num)
+		if spec is None:
+			# not a field of this message, continue with generic decoder
+			body, index = _extract_body(fields, index, context, obj)
+			return index
+		name, pytype, decode_grp = spec
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	return index
 
 class QuoteAcknowledgement(FixObject):
-	pass
+	_encode = staticmethod(_encode_QuoteAcknowledgement)
+	_decode = staticmethod(_decode_QuoteAcknowledgement)
+
+_msg_QuoteCancel_names = frozenset(['QuoteReqID', 'QuoteID', 'QuoteCancelType', 'QuoteResponseLevel', 'TradingSessionID', 'NoQuoteEntries'])
+
+_msg_QuoteCancel_tags = {
+	131: ('QuoteReqID', str, None),
+	117: ('QuoteID', str, None),
+	298: ('QuoteCancelType', int, None),
+	301: ('QuoteResponseLevel', int, None),
+	336: ('TradingSessionID', str, None),
+	295: ('NoQuoteEntries', int, None),
+}
+
+def _encode_QuoteCancel(obj, fixm):
+	d = obj.__dict__
+	add = fixm.append
+	n = 1
+	if 'QuoteReqID' in d:
+		add('131=' + str(d['QuoteReqID']))
+		n += 1
+	if 'QuoteID' in d:
+		add('117=' + str(d['QuoteID']))
+		n += 1
+	if 'QuoteCancelType' in d:
+		add('298=' + str(d['QuoteCancelType']))
+		n += 1
+	if 'QuoteResponseLevel' in d:
+		add('301=' + str(d['QuoteResponseLevel']))
+		n += 1
+	if 'TradingSessionID' in d:
+		add('336=' + str(d['TradingSessionID']))
+		n += 1
+	if 'NoQuoteEntries' in d:
+		add('295=' + str(d['NoQuoteEntries']))
+		n += 1
+	if len(d) > n:
+		_make_mbody(obj, obj._context, fixm, _msg_QuoteCancel_names)
+	return fixm
+
+def _decode_QuoteCancel(obj, fields, index, context):
+	d = obj.__dict__
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _msg_QuoteCancel_tags.get(num)
+		if spec is None:
+			# not a field of this message, continue with generic decoder
+			body, index = _extract_body(fields, index, context, obj)
+			return index
+		name, pytype, decode_grp = spec
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	return index
 
 class QuoteCancel(FixObject):
-	pass
+	_encode = staticmethod(_encode_QuoteCancel)
+	_decode = staticmethod(_decode_QuoteCancel)
+
+_msg_QuoteRequest_names = frozenset(['QuoteReqID', 'NoRelatedSym'])
+
+_msg_QuoteRequest_tags = {
+	131: ('QuoteReqID', str, None),
+	146: ('NoRelatedSym', int, None),
+}
+
+def _encode_QuoteRequest(obj, fixm):
+	d = obj.__dict__
+	add = fixm.append
+	n = 1
+	if 'QuoteReqID' in d:
+		add('131=' + str(d['QuoteReqID']))
+		n += 1
+	if 'NoRelatedSym' in d:
+		add('146=' + str(d['NoRelatedSym']))
+		n += 1
+	if len(d) > n:
+		_make_mbody(obj, obj._context, fixm, _msg_QuoteRequest_names)
+	return fixm
+
+def _decode_QuoteRequest(obj, fields, index, context):
+	d = obj.__dict__
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _msg_QuoteRequest_tags.get(num)
+		if spec is None:
+			# not a field of this message, continue with generic decoder
+			body, index = _extract_body(fields, index, context, obj)
+			return index
+		name, pytype, decode_grp = spec
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	return index
 
 class QuoteRequest(FixObject):
-	pass
+	_encode = staticmethod(_encode_QuoteRequest)
+	_decode = staticmethod(_decode_QuoteRequest)
+
+_msg_QuoteStatusRequest_names = frozenset(['QuoteID', 'Symbol', 'SymbolSfx', 'SecurityID', 'IDSource', 'SecurityType', 'MaturityMonthYear', 'MaturityDay', 'PutOrCall', 'StrikePrice', 'OptAttribute', 'ContractMultiplier', 'CouponRate', 'SecurityExchange', 'Issuer', 'EncodedIssuerLen', 'EncodedIssuer', 'SecurityDesc', 'EncodedSecurityDescLen', 'EncodedSecurityDesc', 'Side', 'TradingSessionID'])
+
+_msg_QuoteStatusRequest_tags = {
+	117: ('QuoteID', str, None),
+	55: ('Symbol', str, None),
+	65: ('SymbolSfx', str, None),
+	48: ('SecurityID', str, None),
+	22: ('IDSource', str, None),
+	167: ('SecurityType', str, None),
+	200: ('MaturityMonthYear', str, None),
+	205: ('MaturityDay', int, None),
+	201: ('PutOrCall', int, None),
+	202: ('StrikePrice', float, None),
+	206: ('OptAttribute', str, None),
+	231: ('ContractMultiplier', float, None),
+	223: ('CouponRate', float, None),
+	207: ('SecurityExchange', str, None),
+	106: ('Issuer', str, None),
+	348: ('EncodedIssuerLen', int, None),
+	349: ('EncodedIssuer', str, None),
+	107: ('SecurityDesc', str, None),
+	350: ('EncodedSecurityDescLen', int, None),
+	351: ('EncodedSecurityDesc', str, None),
+	54: ('Side', str, None),
+	336: ('TradingSessionID', str, None),
+}
+
+def _encode_QuoteStatusRequest(obj, fixm):
+	d = obj.__dict__
+	add = fixm.append
+	n = 1
+	if 'QuoteID' in d:
+		add('117=' + str(d['QuoteID']))
+		n += 1
+	if 'Symbol' in d:
+		add('55=' + str(d['Symbol']))
+		n += 1
+	if 'SymbolSfx' in d:
+		add('65=' + str(d['SymbolSfx']))
+		n += 1
+	if 'SecurityID' in d:
+		add('48=' + str(d['SecurityID']))
+		n += 1
+	if 'IDSource' in d:
+		add('22=' + str(d['IDSource']))
+		n += 1
+	if 'SecurityType' in d:
+		add('167=' + str(d['SecurityType']))
+		n += 1
+	if 'MaturityMonthYear' in d:
+		add('200=' + str(d['MaturityMonthYear']))
+		n += 1
+	if 'MaturityDay' in d:
+		add('205=' + str(d['MaturityDay']))
+		n += 1
+	if 'PutOrCall' in d:
+		add('201=' + str(d['PutOrCall']))
+		n += 1
+	if 'StrikePrice' in d:
+		add('202=' + str(d['StrikePrice']))
+		n += 1
+	if 'OptAttribute' in d:
+		add('206=' + str(d['OptAttribute']))
+		n += 1
+	if 'ContractMultiplier' in d:
+		add('231=' + str(d['ContractMultiplier']))
+		n += 1
+	if 'CouponRate' in d:
+		add('223=' + str(d['CouponRate']))
+		n += 1
+	if 'SecurityExchange' in d:
+		add('207=' + str(d['SecurityExchange']))
+		n += 1
+	if 'Issuer' in d:
+		add('106=' + str(d['Issuer']))
+		n += 1
+	if 'EncodedIssuerLen' in d:
+		add('348=' + str(d['EncodedIssuerLen']))
+		n += 1
+	if 'EncodedIssuer' in d:
+		add('349=' + str(d['EncodedIssuer']))
+		n += 1
+	if 'SecurityDesc' in d:
+		add('107=' + str(d['SecurityDesc']))
+		n += 1
+	if 'EncodedSecurityDescLen' in d:
+		add('350=' + str(d['EncodedSecurityDescLen']))
+		n += 1
+	if 'EncodedSecurityDesc' in d:
+		add('351=' + str(d['EncodedSecurityDesc']))
+		n += 1
+	if 'Side' in d:
+		add('54=' + str(d['Side']))
+		n += 1
+	if 'TradingSessionID' in d:
+		add('336=' + str(d['TradingSessionID']))
+		n += 1
+	if len(d) > n:
+		_make_mbody(obj, obj._context, fixm, _msg_QuoteStatusRequest_names)
+	return fixm
+
+def _decode_QuoteStatusRequest(obj, fields, index, context):
+	d = obj.__dict__
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _msg_QuoteStatusRequest_tags.get(num)
+		if spec is None:
+			# not a field of this message, continue with generic decoder
+			body, index = _extract_body(fields, index, context, obj)
+			return index
+		name, pytype, decode_grp = spec
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	return index
 
 class QuoteStatusRequest(FixObject):
-	pass
+	_encode = staticmethod(_encode_QuoteStatusRequest)
+	_decode = staticmethod(_decode_QuoteStatusRequest)
+
+_msg_SecurityDefinition_names = frozenset(['SecurityReqID', 'SecurityResponseID', 'SecurityResponseType', 'TotalNumSecurities', 'Symbol', 'SymbolSfx', 'SecurityID', 'IDSource', 'SecurityType', 'MaturityMonthYear', 'MaturityDay', 'PutOrCall', 'StrikePrice', 'OptAttribute', 'ContractMultiplier', 'CouponRate', 'SecurityExchange', 'Issuer', 'EncodedIssuerLen', 'EncodedIssuer', 'SecurityDesc', 'EncodedSecurityDescLen', 'EncodedSecurityDesc', 'Currency', 'TradingSessionID', 'Text', 'EncodedTextLen', 'EncodedText', 'NoRelatedSym'])
+
+_msg_SecurityDefinition_tags = {
+	320: ('SecurityReqID', str, None),
+	322: ('SecurityResponseID', str, None),
+	323: ('SecurityResponseType', int, None),
+	393: ('TotalNumSecurities', int, None),
+	55: ('Symbol', str, None),
+	65: ('SymbolSfx', str, None),
+	48: ('SecurityID', str, None),
+	22: ('IDSource', str, None),
+	167: ('SecurityType', str, None),
+	200: ('MaturityMonthYear', str, None),
+	205: ('MaturityDay', int, None),
+	201: ('PutOrCall', int, None),
+	202: ('StrikePrice', float, None),
+	206: ('OptAttribute', str, None),
+	231: ('ContractMultiplier', float, None),
+	223: ('CouponRate', float, None),
+	207: ('SecurityExchange', str, None),
+	106: ('Issuer', str, None),
+	348: ('EncodedIssuerLen', int, None),
+	349: ('EncodedIssuer', str, None),
+	107: ('SecurityDesc', str, None),
+	350: ('EncodedSecurityDescLen', int, None),
+	351: ('EncodedSecurityDesc', str, None),
+	15: ('Currency', str, None),
+	336: ('TradingSessionID', str, None),
+	58: ('Text', str, None),
+	354: ('EncodedTextLen', int, None),
+	355: ('EncodedText', str, None),
+	146: ('NoRelatedSym', int, None),
+}
+
+def _encode_SecurityDefinition(obj, fixm):
+	d = obj.__dict__
+	add = fixm.append
+	n = 1
+	if 'SecurityReqID' in d:
+		add('320=' + str(d['SecurityReqID']))
+		n += 1
+	if 'SecurityResponseID' in d:
+		add('322=' + str(d['SecurityResponseID']))
+		n += 1
+	if 'SecurityResponseType' in d:
+		add('323=' + str(d['SecurityResponseType']))
+		n += 1
+	if 'TotalNumSecurities' in d:
+		add('393=' + str(d['TotalNumSecurities']))
+		n += 1
+	if 'Symbol' in d:
+		add('55=' + str(d['Symbol']))
+		n += 1
+	if 'SymbolSfx' in d:
+		add('65=' + str(d['SymbolSfx']))
+		n += 1
+	if 'SecurityID' in d:
+		add('48=' + str(d['SecurityID']))
+		n += 1
+	if 'IDSource' in d:
+		add('22=' + str(d['IDSource']))
+		n += 1
+	if 'SecurityType' in d:
+		add('167=' + str(d['SecurityType']))
+		n += 1
+	if 'MaturityMonthYear' in d:
+		add('200=' + str(d['MaturityMonthYear']))
+		n += 1
+	if 'MaturityDay' in d:
+		add('205=' + str(d['MaturityDay']))
+		n += 1
+	if 'PutOrCall' in d:
+		add('201=' + str(d['PutOrCall']))
+		n += 1
+	if 'StrikePrice' in d:
+		add('202=' + str(d['StrikePrice']))
+		n += 1
+	if 'OptAttribute' in d:
+		add('206=' + str(d['OptAttribute']))
+		n += 1
+	if 'ContractMultiplier' in d:
+		add('231=' + str(d['ContractMultiplier']))
+		n += 1
+	if 'CouponRate' in d:
+		add('223=' + str(d['CouponRate']))
+		n += 1
+	if 'SecurityExchange' in d:
+		add('207=' + str(d['SecurityExchange']))
+		n += 1
+	if 'Issuer' in d:
+		add('106=' + str(d['Issuer']))
+		n += 1
+	if 'EncodedIssuerLen' in d:
+		add('348=' + str(d['EncodedIssuerLen']))
+		n += 1
+	if 'EncodedIssuer' in d:
+		add('349=' + str(d['EncodedIssuer']))
+		n += 1
+	if 'SecurityDesc' in d:
+		add('107=' + str(d['SecurityDesc']))
+		n += 1
+	if 'EncodedSecurityDescLen' in d:
+		add('350=' + str(d['EncodedSecurityDescLen']))
+		n += 1
+	if 'EncodedSecurityDesc' in d:
+		add('351=' + str(d['EncodedSecurityDesc']))
+		n += 1
+	if 'Currency' in d:
+		add('15=' + str(d['Currency']))
+		n += 1
+	if 'TradingSessionID' in d:
+		add('336=' + str(d['TradingSessionID']))
+		n += 1
+	if 'Text' in d:
+		add('58=' + str(d['Text']))
+		n += 1
+	if 'EncodedTextLen' in d:
+		add('354=' + str(d['EncodedTextLen']))
+		n += 1
+	if 'EncodedText' in d:
+		add('355=' + str(d['EncodedText']))
+		n += 1
+	if 'NoRelatedSym' in d:
+		add('146=' + str(d['NoRelatedSym']))
+		n += 1
+	if len(d) > n:
+		_make_mbody(obj, obj._context, fixm, _msg_SecurityDefinition_names)
+	return fixm
+
+def _decode_SecurityDefinition(obj, fields, index, context):
+	d = obj.__dict__
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _msg_SecurityDefinition_tags.get(num)
+		if spec is None:
+			# not a field of this message, continue with generic decoder
+			body, index = _extract_body(fields, index, context, obj)
+			return index
+		name, pytype, decode_grp = spec
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	return index
 
 class SecurityDefinition(FixObject):
-	pass
+	_encode = staticmethod(_encode_SecurityDefinition)
+	_decode = staticmethod(_decode_SecurityDefinition)
+
+_msg_SecurityDefinitionRequest_names = frozenset(['SecurityReqID', 'SecurityRequestType', 'Symbol', 'SymbolSfx', 'SecurityID', 'IDSource', 'SecurityType', 'MaturityMonthYear', 'MaturityDay', 'PutOrCall', 'StrikePrice', 'OptAttribute', 'ContractMultiplier', 'CouponRate', 'SecurityExchange', 'Issuer', 'EncodedIssuerLen', 'EncodedIssuer', 'SecurityDesc', 'EncodedSecurityDescLen', 'EncodedSecurityDesc', 'Currency', 'Text', 'EncodedTextLen', 'EncodedText', 'TradingSessionID', 'NoRelatedSym'])
+
+_msg_SecurityDefinitionRequest_tags = {
+	320: ('SecurityReqID', str, None),
+	321: ('SecurityRequestType', int, None),
+	55: ('Symbol', str, None),
+	65: ('SymbolSfx', str, None),
+	48: ('SecurityID', str, None),
+	22: ('IDSource', str, None),
+	167: ('SecurityType', str, None),
+	200: ('MaturityMonthYear', str, None),
+	205: ('MaturityDay', int, None),
+	201: ('PutOrCall', int, None),
+	202: ('StrikePrice', float, None),
+	206: ('OptAttribute', str, None),
+	231: ('ContractMultiplier', float, None),
+	223: ('CouponRate', float, None),
+	207: ('SecurityExchange', str, None),
+	106: ('Issuer', str, None),
+	348: ('EncodedIssuerLen', int, None),
+	349: ('EncodedIssuer', str, None),
+	107: ('SecurityDesc', str, None),
+	350: ('EncodedSecurityDescLen', int, None),
+	351: ('EncodedSecurityDesc', str, None),
+	15: ('Currency', str, None),
+	58: ('Text', str, None),
+	354: ('EncodedTextLen', int, None),
+	355: ('EncodedText', str, None),
+	336: ('TradingSessionID', str, None),
+	146: ('NoRelatedSym', int, None),
+}
+
+def _encode_SecurityDefinitionRequest(obj, fixm):
+	d = obj.__dict__
+	add = fixm.append
+	n = 1
+	if 'SecurityReqID' in d:
+		add('320=' + str(d['SecurityReqID']))
+		n += 1
+	if 'SecurityRequestType' in d:
+		add('321=' + str(d['SecurityRequestType']))
+		n += 1
+	if 'Symbol' in d:
+		add('55=' + str(d['Symbol']))
+		n += 1
+	if 'SymbolSfx' in d:
+		add('65=' + str(d['SymbolSfx']))
+		n += 1
+	if 'SecurityID' in d:
+		add('48=' + str(d['SecurityID']))
+		n += 1
+	if 'IDSource' in d:
+		add('22=' + str(d['IDSource']))
+		n += 1
+	if 'SecurityType' in d:
+		add('167=' + str(d['SecurityType']))
+		n += 1
+	if 'MaturityMonthYear' in d:
+		add('200=' + str(d['MaturityMonthYear']))
+		n += 1
+	if 'MaturityDay' in d:
+		add('205=' + str(d['MaturityDay']))
+		n += 1
+	if 'PutOrCall' in d:
+		add('201=' + str(d['PutOrCall']))
+		n += 1
+	if 'StrikePrice' in d:
+		add('202=' + str(d['StrikePrice']))
+		n += 1
+	if 'OptAttribute' in d:
+		add('206=' + str(d['OptAttribute']))
+		n += 1
+	if 'ContractMultiplier' in d:
+		add('231=' + str(d['ContractMultiplier']))
+		n += 1
+	if 'CouponRate' in d:
+		add('223=' + str(d['CouponRate']))
+		n += 1
+	if 'SecurityExchange' in d:
+		add('207=' + str(d['SecurityExchange']))
+		n += 1
+	if 'Issuer' in d:
+		add('106=' + str(d['Issuer']))
+		n += 1
+	if 'EncodedIssuerLen' in d:
+		add('348=' + str(d['EncodedIssuerLen']))
+		n += 1
+	if 'EncodedIssuer' in d:
+		add('349=' + str(d['EncodedIssuer']))
+		n += 1
+	if 'SecurityDesc' in d:
+		add('107=' + str(d['SecurityDesc']))
+		n += 1
+	if 'EncodedSecurityDescLen' in d:
+		add('350=' + str(d['EncodedSecurityDescLen']))
+		n += 1
+	if 'EncodedSecurityDesc' in d:
+		add('351=' + str(d['EncodedSecurityDesc']))
+		n += 1
+	if 'Currency' in d:
+		add('15=' + str(d['Currency']))
+		n += 1
+	if 'Text' in d:
+		add('58=' + str(d['Text']))
+		n += 1
+	if 'EncodedTextLen' in d:
+		add('354=' + str(d['EncodedTextLen']))
+		n += 1
+	if 'EncodedText' in d:
+		add('355=' + str(d['EncodedText']))
+		n += 1
+	if 'TradingSessionID' in d:
+		add('336=' + str(d['TradingSessionID']))
+		n += 1
+	if 'NoRelatedSym' in d:
+		add('146=' + str(d['NoRelatedSym']))
+		n += 1
+	if len(d) > n:
+		_make_mbody(obj, obj._context, fixm, _msg_SecurityDefinitionRequest_names)
+	return fixm
+
+def _decode_SecurityDefinitionRequest(obj, fields, index, context):
+	d = obj.__dict__
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _msg_SecurityDefinitionRequest_tags.get(num)
+		if spec is None:
+			# not a field of this message, continue with generic decoder
+			body, index = _extract_body(fields, index, context, obj)
+			return index
+		name, pytype, decode_grp = spec
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	return index
 
 class SecurityDefinitionRequest(FixObject):
-	pass
+	_encode = staticmethod(_encode_SecurityDefinitionRequest)
+	_decode = staticmethod(_decode_SecurityDefinitionRequest)
+
+_msg_SecurityStatus_names = frozenset(['SecurityStatusReqID', 'Symbol', 'SymbolSfx', 'SecurityID', 'IDSource', 'SecurityType', 'MaturityMonthYear', 'MaturityDay', 'PutOrCall', 'StrikePrice', 'OptAttribute', 'ContractMultiplier', 'CouponRate', 'SecurityExchange', 'Issuer', 'EncodedIssuerLen', 'EncodedIssuer', 'SecurityDesc', 'EncodedSecurityDescLen', 'EncodedSecurityDesc', 'Currency', 'TradingSessionID', 'UnsolicitedIndicator', 'SecurityTradingStatus', 'FinancialStatus', 'CorporateAction', 'HaltReason', 'InViewOfCommon', 'DueToRelated', 'BuyVolume', 'SellVolume', 'HighPx', 'LowPx', 'LastPx', 'TransactTime', 'Adjustment'])
+
+_msg_SecurityStatus_tags = {
+	324: ('SecurityStatusReqID', str, None),
+	55: ('Symbol', str, None),
+	65: ('SymbolSfx', str, None),
+	48: ('SecurityID', str, None),
+	22: ('IDSource', str, None),
+	167: ('SecurityType', str, None),
+	200: ('MaturityMonthYear', str, None),
+	205: ('MaturityDay', int, None),
+	201: ('PutOrCall', int, None),
+	202: ('StrikePrice', float, None),
+	206: ('OptAttribute', str, None),
+	231: ('ContractMultiplier', float, None),
+	223: ('CouponRate', float, None),
+	207: ('SecurityExchange', str, None),
+	106: ('Issuer', str, None),
+	348: ('EncodedIssuerLen', int, None),
+	349: ('EncodedIssuer', str, None),
+	107: ('SecurityDesc', str, None),
+	350: ('EncodedSecurityDescLen', int, None),
+	351: ('EncodedSecurityDesc', str, None),
+	15: ('Currency', str, None),
+	336: ('TradingSessionID', str, None),
+	325: ('UnsolicitedIndicator', str, None),
+	326: ('SecurityTradingStatus', int, None),
+	291: ('FinancialStatus', str, None),
+	292: ('CorporateAction', str, None),
+	327: ('HaltReason', str, None),
+	328: ('InViewOfCommon', str, None),
+	329: ('DueToRelated', str, None),
+	330: ('BuyVolume', float, None),
+	331: ('SellVolume', float, None),
+	332: ('HighPx', float, None),
+	333: ('LowPx', float, None),
+	31: ('LastPx', float, None),
+	60: ('TransactTime', str, None),
+	334: ('Adjustment', int, None),
+}
+
+def _encode_SecurityStatus(obj, fixm):
+	d = obj.__dict__
+	add = fixm.append
+	n = 1
+	if 'SecurityStatusReqID' in d:
+		add('324=' + str(d['SecurityStatusReqID']))
+		n += 1
+	if 'Symbol' in d:
+		add('55=' + str(d['Symbol']))
+		n += 1
+	if 'SymbolSfx' in d:
+		add('65=' + str(d['SymbolSfx']))
+		n += 1
+	if 'SecurityID' in d:
+		add('48=' + str(d['SecurityID']))
+		n += 1
+	if 'IDSource' in d:
+		add('22=' + str(d['IDSource']))
+		n += 1
+	if 'SecurityType' in d:
+		add('167=' + str(d['SecurityType']))
+		n += 1
+	if 'MaturityMonthYear' in d:
+		add('200=' + str(d['MaturityMonthYear']))
+		n += 1
+	if 'MaturityDay' in d:
+		add('205=' + str(d['MaturityDay']))
+		n += 1
+	if 'PutOrCall' in d:
+		add('201=' + str(d['PutOrCall']))
+		n += 1
+	if 'StrikePrice' in d:
+		add('202=' + str(d['StrikePrice']))
+		n += 1
+	if 'OptAttribute' in d:
+		add('206=' + str(d['OptAttribute']))
+		n += 1
+	if 'ContractMultiplier' in d:
+		add('231=' + str(d['ContractMultiplier']))
+		n += 1
+	if 'CouponRate' in d:
+		add('223=' + str(d['CouponRate']))
+		n += 1
+	if 'SecurityExchange' in d:
+		add('207=' + str(d['SecurityExchange']))
+		n += 1
+	if 'Issuer' in d:
+		add('106=' + str(d['Issuer']))
+		n += 1
+	if 'EncodedIssuerLen' in d:
+		add('348=' + str(d['EncodedIssuerLen']))
+		n += 1
+	if 'EncodedIssuer' in d:
+		add('349=' + str(d['EncodedIssuer']))
+		n += 1
+	if 'SecurityDesc' in d:
+		add('107=' + str(d['SecurityDesc']))
+		n += 1
+	if 'EncodedSecurityDescLen' in d:
+		add('350=' + str(d['EncodedSecurityDescLen']))
+		n += 1
+	if 'EncodedSecurityDesc' in d:
+		add('351=' + str(d['EncodedSecurityDesc']))
+		n += 1
+	if 'Currency' in d:
+		add('15=' + str(d['Currency']))
+		n += 1
+	if 'TradingSessionID' in d:
+		add('336=' + str(d['TradingSessionID']))
+		n += 1
+	if 'UnsolicitedIndicator' in d:
+		add('325=' + str(d['UnsolicitedIndicator']))
+		n += 1
+	if 'SecurityTradingStatus' in d:
+		add('326=' + str(d['SecurityTradingStatus']))
+		n += 1
+	if 'FinancialStatus' in d:
+		add('291=' + str(d['FinancialStatus']))
+		n += 1
+	if 'CorporateAction' in d:
+		add('292=' + str(d['CorporateAction']))
+		n += 1
+	if 'HaltReason' in d:
+		add('327=' + str(d['HaltReason']))
+		n += 1
+	if 'InViewOfCommon' in d:
+		add('328=' + str(d['InViewOfCommon']))
+		n += 1
+	if 'DueToRelated' in d:
+		add('329=' + str(d['DueToRelated']))
+		n += 1
+	if 'BuyVolume' in d:
+		add('330=' + str(d['BuyVolume']))
+		n += 1
+	if 'SellVolume' in d:
+		add('331=' + str(d['SellVolume']))
+		n += 1
+	if 'HighPx' in d:
+		add('332=' + str(d['HighPx']))
+		n += 1
+	if 'LowPx' in d:
+		add('333=' + str(d['LowPx']))
+		n += 1
+	if 'LastPx' in d:
+		add('31=' + str(d['LastPx']))
+		n += 1
+	if 'TransactTime' in d:
+		add('60=' + str(d['TransactTime']))
+		n += 1
+	if 'Adjustment' in d:
+		add('334=' + str(d['Adjustment']))
+		n += 1
+	if len(d) > n:
+		_make_mbody(obj, obj._context, fixm, _msg_SecurityStatus_names)
+	return fixm
+
+def _decode_SecurityStatus(obj, fields, index, context):
+	d = obj.__dict__
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _msg_SecurityStatus_tags.get(num)
+		if spec is None:
+			# not a field of this message, continue with generic decoder
+			body, index = _extract_body(fields, index, context, obj)
+			return index
+		name, pytype, decode_grp = spec
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	return index
 
 class SecurityStatus(FixObject):
-	pass
+	_encode = staticmethod(_encode_SecurityStatus)
+	_decode = staticmethod(_decode_SecurityStatus)
+
+_msg_SecurityStatusRequest_names = frozenset(['SecurityStatusReqID', 'Symbol', 'SymbolSfx', 'SecurityID', 'IDSource', 'SecurityType', 'MaturityMonthYear', 'MaturityDay', 'PutOrCall', 'StrikePrice', 'OptAttribute', 'ContractMultiplier', 'CouponRate', 'SecurityExchange', 'Issuer', 'EncodedIssuerLen', 'EncodedIssuer', 'SecurityDesc', 'EncodedSecurityDescLen', 'EncodedSecurityDesc', 'Currency', 'SubscriptionRequestType', 'TradingSessionID'])
+
+_msg_SecurityStatusRequest_tags = {
+	324: ('SecurityStatusReqID', str, None),
+	55: ('Symbol', str, None),
+	65: ('SymbolSfx', str, None),
+	48: ('SecurityID', str, None),
+	22: ('IDSource', str, None),
+	167: ('SecurityType', str, None),
+	200: ('MaturityMonthYear', str, None),
+	205: ('MaturityDay', int, None),
+	201: ('PutOrCall', int, None),
+	202: ('StrikePrice', float, None),
+	206: ('OptAttribute', str, None),
+	231: ('ContractMultiplier', float, None),
+	223: ('CouponRate', float, None),
+	207: ('SecurityExchange', str, None),
+	106: ('Issuer', str, None),
+	348: ('EncodedIssuerLen', int, None),
+	349: ('EncodedIssuer', str, None),
+	107: ('SecurityDesc', str, None),
+	350: ('EncodedSecurityDescLen', int, None),
+	351: ('EncodedSecurityDesc', str, None),
+	15: ('Currency', str, None),
+	263: ('SubscriptionRequestType', str, None),
+	336: ('TradingSessionID', str, None),
+}
+
+def _encode_SecurityStatusRequest(obj, fixm):
+	d = obj.__dict__
+	add = fixm.append
+	n = 1
+	if 'SecurityStatusReqID' in d:
+		add('324=' + str(d['SecurityStatusReqID']))
+		n += 1
+	if 'Symbol' in d:
+		add('55=' + str(d['Symbol']))
+		n += 1
+	if 'SymbolSfx' in d:
+		add('65=' + str(d['SymbolSfx']))
+		n += 1
+	if 'SecurityID' in d:
+		add('48=' + str(d['SecurityID']))
+		n += 1
+	if 'IDSource' in d:
+		add('22=' + str(d['IDSource']))
+		n += 1
+	if 'SecurityType' in d:
+		add('167=' + str(d['SecurityType']))
+		n += 1
+	if 'MaturityMonthYear' in d:
+		add('200=' + str(d['MaturityMonthYear']))
+		n += 1
+	if 'MaturityDay' in d:
+		add('205=' + str(d['MaturityDay']))
+		n += 1
+	if 'PutOrCall' in d:
+		add('201=' + str(d['PutOrCall']))
+		n += 1
+	if 'StrikePrice' in d:
+		add('202=' + str(d['StrikePrice']))
+		n += 1
+	if 'OptAttribute' in d:
+		add('206=' + str(d['OptAttribute']))
+		n += 1
+	if 'ContractMultiplier' in d:
+		add('231=' + str(d['ContractMultiplier']))
+		n += 1
+	if 'CouponRate' in d:
+		add('223=' + str(d['CouponRate']))
+		n += 1
+	if 'SecurityExchange' in d:
+		add('207=' + str(d['SecurityExchange']))
+		n += 1
+	if 'Issuer' in d:
+		add('106=' + str(d['Issuer']))
+		n += 1
+	if 'EncodedIssuerLen' in d:
+		add('348=' + str(d['EncodedIssuerLen']))
+		n += 1
+	if 'EncodedIssuer' in d:
+		add('349=' + str(d['EncodedIssuer']))
+		n += 1
+	if 'SecurityDesc' in d:
+		add('107=' + str(d['SecurityDesc']))
+		n += 1
+	if 'EncodedSecurityDescLen' in d:
+		add('350=' + str(d['EncodedSecurityDescLen']))
+		n += 1
+	if 'EncodedSecurityDesc' in d:
+		add('351=' + str(d['EncodedSecurityDesc']))
+		n += 1
+	if 'Currency' in d:
+		add('15=' + str(d['Currency']))
+		n += 1
+	if 'SubscriptionRequestType' in d:
+		add('263=' + str(d['SubscriptionRequestType']))
+		n += 1
+	if 'TradingSessionID' in d:
+		add('336=' + str(d['TradingSessionID']))
+		n += 1
+	if len(d) > n:
+		_make_mbody(obj, obj._context, fixm, _msg_SecurityStatusRequest_names)
+	return fixm
+
+def _decode_SecurityStatusRequest(obj, fields, index, context):
+	d = obj.__dict__
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _msg_SecurityStatusRequest_tags.get(num)
+		if spec is None:
+			# not a field of this message, continue with generic decoder
+			body, index = _extract_body(fields, index, context, obj)
+			return index
+		name, pytype, decode_grp = spec
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	return index
 
 class SecurityStatusRequest(FixObject):
-	pass
+	_encode = staticmethod(_encode_SecurityStatusRequest)
+	_decode = staticmethod(_decode_SecurityStatusRequest)
+
+_msg_SettlementInstructions_names = frozenset(['SettlInstID', 'SettlInstTransType', 'SettlInstRefID', 'SettlInstMode', 'SettlInstSource', 'AllocAccount', 'SettlLocation', 'TradeDate', 'AllocID', 'LastMkt', 'TradingSessionID', 'Side', 'SecurityType', 'EffectiveTime', 'TransactTime', 'ClientID', 'ExecBroker', 'StandInstDbType', 'StandInstDbName', 'StandInstDbID', 'SettlDeliveryType', 'SettlDepositoryCode', 'SettlBrkrCode', 'SettlInstCode', 'SecuritySettlAgentName', 'SecuritySettlAgentCode', 'SecuritySettlAgentAcctNum', 'SecuritySettlAgentAcctName', 'SecuritySettlAgentContactName', 'SecuritySettlAgentContactPhone', 'CashSettlAgentName', 'CashSettlAgentCode', 'CashSettlAgentAcctNum', 'CashSettlAgentAcctName', 'CashSettlAgentContactName', 'CashSettlAgentContactPhone'])
+
+_msg_SettlementInstructions_tags = {
+	162: ('SettlInstID', str, None),
+	163: ('SettlInstTransType', str, None),
+	214: ('SettlInstRefID', str, None),
+	160: ('SettlInstMode', str, None),
+	165: ('SettlInstSource', str, None),
+	79: ('AllocAccount', str, None),
+	166: ('SettlLocation', str, None),
+	75: ('TradeDate', str, None),
+	70: ('AllocID', str, None),
+	30: ('LastMkt', str, None),
+	336: ('TradingSessionID', str, None),
+	54: ('Side', str, None),
+	167: ('SecurityType', str, None),
+	168: ('EffectiveTime', str, None),
+	60: ('TransactTime', str, None),
+	109: ('ClientID', str, None),
+	76: ('ExecBroker', str, None),
+	169: ('StandInstDbType', int, None),
+	170: ('StandInstDbName', str, None),
+	171: ('StandInstDbID', str, None),
+	172: ('SettlDeliveryType', int, None),
+	173: ('SettlDepositoryCode', str, None),
+	174: ('SettlBrkrCode', str, None),
+	175: ('SettlInstCode', str, None),
+	176: ('SecuritySettlAgentName', str, None),
+	177: ('SecuritySettlAgentCode', str, None),
+	178: ('SecuritySettlAgentAcctNum', str, None),
+	179: ('SecuritySettlAgentAcctName', str, None),
+	180: ('SecuritySettlAgentContactName', str, None),
+	181: ('SecuritySettlAgentContactPhone', str, None),
+	182: ('CashSettlAgentName', str, None),
+	183: ('CashSettlAgentCode', str, None),
+	184: ('CashSettlAgentAcctNum', str, None),
+	185: ('CashSettlAgentAcctName', str, None),
+	186: ('CashSettlAgentContactName', str, None),
+	187: ('CashSettlAgentContactPhone', str, None),
+}
+
+def _encode_SettlementInstructions(obj, fixm):
+	d = obj.__dict__
+	add = fixm.append
+	n = 1
+	if 'SettlInstID' in d:
+		add('162=' + str(d['SettlInstID']))
+		n += 1
+	if 'SettlInstTransType' in d:
+		add('163=' + str(d['SettlInstTransType']))
+		n += 1
+	if 'SettlInstRefID' in d:
+		add('214=' + str(d['SettlInstRefID']))
+		n += 1
+	if 'SettlInstMode' in d:
+		add('160=' + str(d['SettlInstMode']))
+		n += 1
+	if 'SettlInstSource' in d:
+		add('165=' + str(d['SettlInstSource']))
+		n += 1
+	if 'AllocAccount' in d:
+		add('79=' + str(d['AllocAccount']))
+		n += 1
+	if 'SettlLocation' in d:
+		add('166=' + str(d['SettlLocation']))
+		n += 1
+	if 'TradeDate' in d:
+		add('75=' + str(d['TradeDate']))
+		n += 1
+	if 'AllocID' in d:
+		add('70=' + str(d['AllocID']))
+		n += 1
+	if 'LastMkt' in d:
+		add('30=' + str(d['LastMkt']))
+		n += 1
+	if 'TradingSessionID' in d:
+		add('336=' + str(d['TradingSessionID']))
+		n += 1
+	if 'Side' in d:
+		add('54=' + str(d['Side']))
+		n += 1
+	if 'SecurityType' in d:
+		add('167=' + str(d['SecurityType']))
+		n += 1
+	if 'EffectiveTime' in d:
+		add('168=' + str(d['EffectiveTime']))
+		n += 1
+	if 'TransactTime' in d:
+		add('60=' + str(d['TransactTime']))
+		n += 1
+	if 'ClientID' in d:
+		add('109=' + str(d['ClientID']))
+		n += 1
+	if 'ExecBroker' in d:
+		add('76=' + str(d['ExecBroker']))
+		n += 1
+	if 'StandInstDbType' in d:
+		add('169=' + str(d['StandInstDbType']))
+		n += 1
+	if 'StandInstDbName' in d:
+		add('170=' + str(d['StandInstDbName']))
+		n += 1
+	if 'StandInstDbID' in d:
+		add('171=' + str(d['StandInstDbID']))
+		n += 1
+	if 'SettlDeliveryType' in d:
+		add('172=' + str(d['SettlDeliveryType']))
+		n += 1
+	if 'SettlDepositoryCode' in d:
+		add('173=' + str(d['SettlDepositoryCode']))
+		n += 1
+	if 'SettlBrkrCode' in d:
+		add('174=' + str(d['SettlBrkrCode']))
+		n += 1
+	if 'SettlInstCode' in d:
+		add('175=' + str(d['SettlInstCode']))
+		n += 1
+	if 'SecuritySettlAgentName' in d:
+		add('176=' + str(d['SecuritySettlAgentName']))
+		n += 1
+	if 'SecuritySettlAgentCode' in d:
+		add('177=' + str(d['SecuritySettlAgentCode']))
+		n += 1
+	if 'SecuritySettlAgentAcctNum' in d:
+		add('178=' + str(d['SecuritySettlAgentAcctNum']))
+		n += 1
+	if 'SecuritySettlAgentAcctName' in d:
+		add('179=' + str(d['SecuritySettlAgentAcctName']))
+		n += 1
+	if 'SecuritySettlAgentContactName' in d:
+		add('180=' + str(d['SecuritySettlAgentContactName']))
+		n += 1
+	if 'SecuritySettlAgentContactPhone' in d:
+		add('181=' + str(d['SecuritySettlAgentContactPhone']))
+		n += 1
+	if 'CashSettlAgentName' in d:
+		add('182=' + str(d['CashSettlAgentName']))
+		n += 1
+	if 'CashSettlAgentCode' in d:
+		add('183=' + str(d['CashSettlAgentCode']))
+		n += 1
+	if 'CashSettlAgentAcctNum' in d:
+		add('184=' + str(d['CashSettlAgentAcctNum']))
+		n += 1
+	if 'CashSettlAgentAcctName' in d:
+		add('185=' + str(d['CashSettlAgentAcctName']))
+		n += 1
+	if 'CashSettlAgentContactName' in d:
+		add('186=' + str(d['CashSettlAgentContactName']))
+		n += 1
+	if 'CashSettlAgentContactPhone' in d:
+		add('187=' + str(d['CashSettlAgentContactPhone']))
+		n += 1
+	if len(d) > n:
+		_make_mbody(obj, obj._context, fixm, _msg_SettlementInstructions_names)
+	return fixm
+
+def _decode_SettlementInstructions(obj, fields, index, context):
+	d = obj.__dict__
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _msg_SettlementInstructions_tags.get(num)
+		if spec is None:
+			# not a field of this message, continue with generic decoder
+			body, index = _extract_body(fields, index, context, obj)
+			return index
+		name, pytype, decode_grp = spec
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	return index
 
 class SettlementInstructions(FixObject):
-	pass
+	_encode = staticmethod(_encode_SettlementInstructions)
+	_decode = staticmethod(_decode_SettlementInstructions)
+
+_msg_TradingSessionStatus_names = frozenset(['TradSesReqID', 'TradingSessionID', 'TradSesMethod', 'TradSesMode', 'UnsolicitedIndicator', 'TradSesStatus', 'TradSesStartTime', 'TradSesOpenTime', 'TradSesPreCloseTime', 'TradSesCloseTime', 'TradSesEndTime', 'TotalVolumeTraded', 'Text', 'EncodedTextLen', 'EncodedText'])
+
+_msg_TradingSessionStatus_tags = {
+	335: ('TradSesReqID', str, None),
+	336: ('TradingSessionID', str, None),
+	338: ('TradSesMethod', int, None),
+	339: ('TradSesMode', int, None),
+	325: ('UnsolicitedIndicator', str, None),
+	340: ('TradSesStatus', int, None),
+	341: ('TradSesStartTime', str, None),
+	342: ('TradSesOpenTime', str, None),
+	343: ('TradSesPreCloseTime', str, None),
+	344: ('TradSesCloseTime', str, None),
+	345: ('TradSesEndTime', str, None),
+	387: ('TotalVolumeTraded', float, None),
+	58: ('Text', str, None),
+	354: ('EncodedTextLen', int, None),
+	355: ('EncodedText', str, None),
+}
+
+def _encode_TradingSessionStatus(obj, fixm):
+	d = obj.__dict__
+	add = fixm.append
+	n = 1
+	if 'TradSesReqID' in d:
+		add('335=' + str(d['TradSesReqID']))
+		n += 1
+	if 'TradingSessionID' in d:
+		add('336=' + str(d['TradingSessionID']))
+		n += 1
+	if 'TradSesMethod' in d:
+		add('338=' + str(d['TradSesMethod']))
+		n += 1
+	if 'TradSesMode' in d:
+		add('339=' + str(d['TradSesMode']))
+		n += 1
+	if 'UnsolicitedIndicator' in d:
+		add('325=' + str(d['UnsolicitedIndicator']))
+		n += 1
+	if 'TradSesStatus' in d:
+		add('340=' + str(d['TradSesStatus']))
+		n += 1
+	if 'TradSesStartTime' in d:
+		add('341=' + str(d['TradSesStartTime']))
+		n += 1
+	if 'TradSesOpenTime' in d:
+		add('342=' + str(d['TradSesOpenTime']))
+		n += 1
+	if 'TradSesPreCloseTime' in d:
+		add('343=' + str(d['TradSesPreCloseTime']))
+		n += 1
+	if 'TradSesCloseTime' in d:
+		add('344=' + str(d['TradSesCloseTime']))
+		n += 1
+	if 'TradSesEndTime' in d:
+		add('345=' + str(d['TradSesEndTime']))
+		n += 1
+	if 'TotalVolumeTraded' in d:
+		add('387=' + str(d['TotalVolumeTraded']))
+		n += 1
+	if 'Text' in d:
+		add('58=' + str(d['Text']))
+		n += 1
+	if 'EncodedTextLen' in d:
+		add('354=' + str(d['EncodedTextLen']))
+		n += 1
+	if 'EncodedText' in d:
+		add('355=' + str(d['EncodedText']))
+		n += 1
+	if len(d) > n:
+		_make_mbody(obj, obj._context, fixm, _msg_TradingSessionStatus_names)
+	return fixm
+
+def _decode_TradingSessionStatus(obj, fields, index, context):
+	d = obj.__dict__
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _msg_TradingSessionStatus_tags.get(num)
+		if spec is None:
+			# not a field of this message, continue with generic decoder
+			body, index = _extract_body(fields, index, context, obj)
+			return index
+		name, pytype, decode_grp = spec
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	return index
 
 class TradingSessionStatus(FixObject):
-	pass
+	_encode = staticmethod(_encode_TradingSessionStatus)
+	_decode = staticmethod(_decode_TradingSessionStatus)
+
+_msg_TradingSessionStatusRequest_names = frozenset(['TradSesReqID', 'TradingSessionID', 'TradSesMethod', 'TradSesMode', 'SubscriptionRequestType'])
+
+_msg_TradingSessionStatusRequest_tags = {
+	335: ('TradSesReqID', str, None),
+	336: ('TradingSessionID', str, None),
+	338: ('TradSesMethod', int, None),
+	339: ('TradSesMode', int, None),
+	263: ('SubscriptionRequestType', str, None),
+}
+
+def _encode_TradingSessionStatusRequest(obj, fixm):
+	d = obj.__dict__
+	add = fixm.append
+	n = 1
+	if 'TradSesReqID' in d:
+		add('335=' + str(d['TradSesReqID']))
+		n += 1
+	if 'TradingSessionID' in d:
+		add('336=' + str(d['TradingSessionID']))
+		n += 1
+	if 'TradSesMethod' in d:
+		add('338=' + str(d['TradSesMethod']))
+		n += 1
+	if 'TradSesMode' in d:
+		add('339=' + str(d['TradSesMode']))
+		n += 1
+	if 'SubscriptionRequestType' in d:
+		add('263=' + str(d['SubscriptionRequestType']))
+		n += 1
+	if len(d) > n:
+		_make_mbody(obj, obj._context, fixm, _msg_TradingSessionStatusRequest_names)
+	return fixm
+
+def _decode_TradingSessionStatusRequest(obj, fields, index, context):
+	d = obj.__dict__
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _msg_TradingSessionStatusRequest_tags.get(num)
+		if spec is None:
+			# not a field of this message, continue with generic decoder
+			body, index = _extract_body(fields, index, context, obj)
+			return index
+		name, pytype, decode_grp = spec
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	return index
 
 class TradingSessionStatusRequest(FixObject):
-	pass
+	_encode = staticmethod(_encode_TradingSessionStatusRequest)
+	_decode = staticmethod(_decode_TradingSessionStatusRequest)
 
@@ -1038,12 +1038,17 @@ _fix_group_types = {
 		(661, 'AllocAcctIDSource'),
 		(736, 'AllocSettlCurrency'),
 		(467, 'IndividualAllocID'),
+		(756, 'NoNested2PartyIDs'),
 		(80, 'AllocQty'),
 		],
 	'NoAltMDSource': [
 		(817, 'AltMDSourceID'),
 		],
 	'NoBidComponents': [
+		(12, 'Commission'),
+		(13, 'CommType'),
+		(479, 'CommCurrency'),
+		(497, 'FundRenewWaiv'),
 		(66, 'ListID'),
 		(421, 'Country'),
 		(54, 'Side'),
@@ -1120,6 +1125,7 @@ _fix_group_types = {
 	'NoDlvyInst': [
 		(165, 'SettlInstSource'),
 		(787, 'DlvyInstType'),
+		(781, 'NoSettlPartyIDs'),
 		],
 	'NoEvents': [
 		(865, 'EventType'),
@@ -1145,6 +1151,7 @@ _fix_group_types = {
 	'NoLegAllocs': [
 		(671, 'LegAllocAccount'),
 		(672, 'LegIndividualAllocID'),
+		(756, 'NoNested2PartyIDs'),
 		(673, 'LegAllocQty'),
 		(674, 'LegAllocAcctIDSource'),
 		(675, 'LegSettlCurrency'),
@@ -1158,6 +1165,48 @@ _fix_group_types = {
 		(689, 'LegStipulationValue'),
 		],
 	'NoLegs': [
+		(600, 'LegSymbol'),
+		(601, 'LegSymbolSfx'),
+		(602, 'LegSecurityID'),
+		(603, 'LegSecurityIDSource'),
+		(604, 'NoLegSecurityAltID'),
+		(607, 'LegProduct'),
+		(608, 'LegCFICode'),
+		(609, 'LegSecurityType'),
+		(764, 'LegSecuritySubType'),
+		(610, 'LegMaturityMonthYear'),
+		(611, 'LegMaturityDate'),
+		(248, 'LegCouponPaymentDate'),
+		(249, 'LegIssueDate'),
+		(250, 'LegRepoCollateralSecurityType'),
+		(251, 'LegRepurchaseTerm'),
+		(252, 'LegRepurchaseRate'),
+		(253, 'LegFactor'),
+		(257, 'LegCreditRating'),
+		(599, 'LegInstrRegistry'),
+		(596, 'LegCountryOfIssue'),
+		(597, 'LegStateOrProvinceOfIssue'),
+		(598, 'LegLocaleOfIssue'),
+		(254, 'LegRedemptionDate'),
+		(612, 'LegStrikePrice'),
+		(942, 'LegStrikeCurrency'),
+		(613, 'LegOptAttribute'),
+		(614, 'LegContractMultiplier'),
+		(615, 'LegCouponRate'),
+		(616, 'LegSecurityExchange'),
+		(617, 'LegIssuer'),
+		(618, 'EncodedLegIssuerLen'),
+		(619, 'EncodedLegIssuer'),
+		(620, 'LegSecurityDesc'),
+		(621, 'EncodedLegSecurityDescLen'),
+		(622, 'EncodedLegSecurityDesc'),
+		(623, 'LegRatioQty'),
+		(624, 'LegSide'),
+		(556, 'LegCurrency'),
+		(740, 'LegPool'),
+		(739, 'LegDatedDate'),
+		(955, 'LegContractSettlMonth'),
+		(956, 'LegInterestAccrualDate'),
 		],
 	'NoMDEntries': [
 		(279, 'MDUpdateAction'),
@@ -1165,6 +1214,85 @@ _fix_group_types = {
 		(269, 'MDEntryType'),
 		(278, 'MDEntryID'),
 		(280, 'MDEntryRefID'),
+		(55, 'Symbol'),
+		(65, 'SymbolSfx'),
+		(48, 'SecurityID'),
+		(22, 'SecurityIDSource'),
+		(454, 'NoSecurityAltID'),
+		(460, 'Product'),
+		(461, 'CFICode'),
+		(167, 'SecurityType'),
+		(762, 'SecuritySubType'),
+		(200, 'MaturityMonthYear'),
+		(541, 'MaturityDate'),
+		(224, 'CouponPaymentDate'),
+		(225, 'IssueDate'),
+		(239, 'RepoCollateralSecurityType'),
+		(226, 'RepurchaseTerm'),
+		(227, 'RepurchaseRate'),
+		(228, 'Factor'),
+		(255, 'CreditRating'),
+		(543, 'InstrRegistry'),
+		(470, 'CountryOfIssue'),
+		(471, 'StateOrProvinceOfIssue'),
+		(472, 'LocaleOfIssue'),
+		(240, 'RedemptionDate'),
+		(202, 'StrikePrice'),
+		(947, 'StrikeCurrency'),
+		(206, 'OptAttribute'),
+		(231, 'ContractMultiplier'),
+		(223, 'CouponRate'),
+		(207, 'SecurityExchange'),
+		(106, 'Issuer'),
+		(348, 'EncodedIssuerLen'),
+		(349, 'EncodedIssuer'),
+		(107, 'SecurityDesc'),
+		(350, 'EncodedSecurityDescLen'),
+		(351, 'EncodedSecurityDesc'),
+		(691, 'Pool'),
+		(667, 'ContractSettlMonth'),
+		(875, 'CPProgram'),
+		(876, 'CPRegType'),
+		(864, 'NoEvents'),
+		(873, 'DatedDate'),
+		(874, 'InterestAccrualDate'),
+		(711, 'NoUnderlyings'),
+		(555, 'NoLegs'),
+		(291, 'FinancialStatus'),
+		(292, 'CorporateAction'),
+		(270, 'MDEntryPx'),
+		(15, 'Currency'),
+		(271, 'MDEntrySize'),
+		(272, 'MDEntryDate'),
+		(273, 'MDEntryTime'),
+		(274, 'TickDirection'),
+		(275, 'MDMkt'),
+		(336, 'TradingSessionID'),
+		(625, 'TradingSessionSubID'),
+		(276, 'QuoteCondition'),
+		(277, 'TradeCondition'),
+		(282, 'MDEntryOriginator'),
+		(283, 'LocationID'),
+		(284, 'DeskID'),
+		(286, 'OpenCloseSettlFlag'),
+		(59, 'TimeInForce'),
+		(432, 'ExpireDate'),
+		(126, 'ExpireTime'),
+		(110, 'MinQty'),
+		(18, 'ExecInst'),
+		(287, 'SellerDays'),
+		(37, 'OrderID'),
+		(299, 'QuoteEntryID'),
+		(288, 'MDEntryBuyer'),
+		(289, 'MDEntrySeller'),
+		(346, 'NumberOfOrders'),
+		(290, 'MDEntryPositionNo'),
+		(546, 'Scope'),
+		(811, 'PriceDelta'),
+		(451, 'NetChgPrevDay'),
+		(58, 'Text'),
+		(354, 'EncodedTextLen'),
+		(355, 'EncodedText'),
 		],
 	'NoMDEntryTypes': [
 		(269, 'MDEntryType'),
@@ -1183,6 +1311,7 @@ _fix_group_types = {
 		(757, 'Nested2PartyID'),
 		(758, 'Nested2PartyIDSource'),
 		(759, 'Nested2PartyRole'),
+		(806, 'NoNested2PartySubIDs'),
 		],
 	'NoNested2PartySubIDs': [
 		(760, 'Nested2PartySubID'),
@@ -1192,6 +1321,7 @@ _fix_group_types = {
 		(949, 'Nested3PartyID'),
 		(950, 'Nested3PartyIDSource'),
 		(951, 'Nested3PartyRole'),
+		(952, 'NoNested3PartySubIDs'),
 		],
 	'NoNested3PartySubIDs': [
 		(953, 'Nested3PartySubID'),
@@ -1201,6 +1331,7 @@ _fix_group_types = {
 		(524, 'NestedPartyID'),
 		(525, 'NestedPartyIDSource'),
 		(538, 'NestedPartyRole'),
+		(804, 'NoNestedPartySubIDs'),
 		],
 	'NoNestedPartySubIDs': [
 		(545, 'NestedPartySubID'),
@@ -1212,6 +1343,7 @@ _fix_group_types = {
 		(198, 'SecondaryOrderID'),
 		(526, 'SecondaryClOrdID'),
 		(66, 'ListID'),
+		(756, 'NoNested2PartyIDs'),
 		(38, 'OrderQty'),
 		(799, 'OrderAvgPx'),
 		(800, 'OrderBookingQty'),
@@ -1220,6 +1352,7 @@ _fix_group_types = {
 		(448, 'PartyID'),
 		(447, 'PartyIDSource'),
 		(452, 'PartyRole'),
+		(802, 'NoPartySubIDs'),
 		],
 	'NoPartySubIDs': [
 		(523, 'PartySubID'),
@@ -1234,30 +1367,197 @@ _fix_group_types = {
 		(704, 'LongQty'),
 		(705, 'ShortQty'),
 		(706, 'PosQtyStatus'),
+		(539, 'NoNestedPartyIDs'),
 		],
 	'NoQuoteEntries': [
 		(299, 'QuoteEntryID'),
+		(55, 'Symbol'),
+		(65, 'SymbolSfx'),
+		(48, 'SecurityID'),
+		(22, 'SecurityIDSource'),
+		(454, 'NoSecurityAltID'),
+		(460, 'Product'),
+		(461, 'CFICode'),
+		(167, 'SecurityType'),
+		(762, 'SecuritySubType'),
+		(200, 'MaturityMonthYear'),
+		(541, 'MaturityDate'),
+		(224, 'CouponPaymentDate'),
+		(225, 'IssueDate'),
+		(239, 'RepoCollateralSecurityType'),
+		(226, 'RepurchaseTerm'),
+		(227, 'RepurchaseRate'),
+		(228, 'Factor'),
+		(255, 'CreditRating'),
+		(543, 'InstrRegistry'),
+		(470, 'CountryOfIssue'),
+		(471, 'StateOrProvinceOfIssue'),
+		(472, 'LocaleOfIssue'),
+		(240, 'RedemptionDate'),
+		(202, 'StrikePrice'),
+		(947, 'StrikeCurrency'),
+		(206, 'OptAttribute'),
+		(231, 'ContractMultiplier'),
+		(223, 'CouponRate'),
+		(207, 'SecurityExchange'),
+		(106, 'Issuer'),
+		(348, 'EncodedIssuerLen'),
+		(349, 'EncodedIssuer'),
+		(107, 'SecurityDesc'),
+		(350, 'EncodedSecurityDescLen'),
+		(351, 'EncodedSecurityDesc'),
+		(691, 'Pool'),
+		(667, 'ContractSettlMonth'),
+		(875, 'CPProgram'),
+		(876, 'CPRegType'),
+		(864, 'NoEvents'),
+		(873, 'DatedDate'),
+		(874, 'InterestAccrualDate'),
+		(555, 'NoLegs'),
+		(132, 'BidPx'),
+		(133, 'OfferPx'),
+		(134, 'BidSize'),
+		(135, 'OfferSize'),
+		(62, 'ValidUntilTime'),
+		(188, 'BidSpotRate'),
+		(190, 'OfferSpotRate'),
+		(189, 'BidForwardPoints'),
+		(191, 'OfferForwardPoints'),
+		(631, 'MidPx'),
+		(632, 'BidYield'),
+		(633, 'MidYield'),
+		(634, 'OfferYield'),
+		(60, 'TransactTime'),
+		(336, 'TradingSessionID'),
+		(625, 'TradingSessionSubID'),
+		(64, 'SettlDate'),
+		(40, 'OrdType'),
+		(193, 'SettlDate2'),
+		(192, 'OrderQty2'),
+		(642, 'BidForwardPoints2'),
+		(643, 'OfferForwardPoints2'),
+		(15, 'Currency'),
+		(368, 'QuoteEntryRejectReason'),
 		],
 	'NoQuoteQualifiers': [
 		(695, 'QuoteQualifier'),
 		],
 	'NoQuoteSets': [
 		(302, 'QuoteSetID'),
+		(311, 'UnderlyingSymbol'),
+		(312, 'UnderlyingSymbolSfx'),
+		(309, 'UnderlyingSecurityID'),
+		(305, 'UnderlyingSecurityIDSource'),
+		(457, 'NoUnderlyingSecurityAltID'),
+		(462, 'UnderlyingProduct'),
+		(463, 'UnderlyingCFICode'),
+		(310, 'UnderlyingSecurityType'),
+		(763, 'UnderlyingSecuritySubType'),
+		(313, 'UnderlyingMaturityMonthYear'),
+		(542, 'UnderlyingMaturityDate'),
+		(241, 'UnderlyingCouponPaymentDate'),
+		(242, 'UnderlyingIssueDate'),
+		(243, 'UnderlyingRepoCollateralSecurityType'),
+		(244, 'UnderlyingRepurchaseTerm'),
+		(245, 'UnderlyingRepurchaseRate'),
+		(246, 'UnderlyingFactor'),
+		(256, 'UnderlyingCreditRating'),
+		(595, 'UnderlyingInstrRegistry'),
+		(592, 'UnderlyingCountryOfIssue'),
+		(593, 'UnderlyingStateOrProvinceOfIssue'),
+		(594, 'UnderlyingLocaleOfIssue'),
+		(247, 'UnderlyingRedemptionDate'),
+		(316, 'UnderlyingStrikePrice'),
+		(941, 'UnderlyingStrikeCurrency'),
+		(317, 'UnderlyingOptAttribute'),
+		(436, 'UnderlyingContractMultiplier'),
+		(435, 'UnderlyingCouponRate'),
+		(308, 'UnderlyingSecurityExchange'),
+		(306, 'UnderlyingIssuer'),
+		(362, 'EncodedUnderlyingIssuerLen'),
+		(363, 'EncodedUnderlyingIssuer'),
+		(307, 'UnderlyingSecurityDesc'),
+		(364, 'EncodedUnderlyingSecurityDescLen'),
+		(365, 'EncodedUnderlyingSecurityDesc'),
+		(877, 'UnderlyingCPProgram'),
+		(878, 'UnderlyingCPRegType'),
+		(318, 'UnderlyingCurrency'),
+		(879, 'UnderlyingQty'),
+		(810, 'UnderlyingPx'),
+		(882, 'UnderlyingDirtyPrice'),
+		(883, 'UnderlyingEndPrice'),
+		(884, 'UnderlyingStartValue'),
+		(885, 'UnderlyingCurrentValue'),
+		(886, 'UnderlyingEndValue'),
+		(887, 'NoUnderlyingStips'),
 		(304, 'TotNoQuoteEntries'),
 		(893, 'LastFragment'),
+		(295, 'NoQuoteEntries'),
 		],
 	'NoRegistDtls': [
 		(509, 'RegistDtls'),
 		(511, 'RegistEmail'),
 		(474, 'MailingDtls'),
 		(482, 'MailingInst'),
+		(539, 'NoNestedPartyIDs'),
 		(522, 'OwnerType'),
 		(486, 'DateOfBirth'),
 		(475, 'InvestorCountryOfResidence'),
 		],
 	'NoRelatedSym': [
+		(55, 'Symbol'),
+		(65, 'SymbolSfx'),
+		(48, 'SecurityID'),
+		(22, 'SecurityIDSource'),
+		(454, 'NoSecurityAltID'),
+		(460, 'Product'),
+		(461, 'CFICode'),
+		(167, 'SecurityType'),
+		(762, 'SecuritySubType'),
+		(200, 'MaturityMonthYear'),
+		(541, 'MaturityDate'),
+		(224, 'CouponPaymentDate'),
+		(225, 'IssueDate'),
+		(239, 'RepoCollateralSecurityType'),
+		(226, 'RepurchaseTerm'),
+		(227, 'RepurchaseRate'),
+		(228, 'Factor'),
+		(255, 'CreditRating'),
+		(543, 'InstrRegistry'),
+		(470, 'CountryOfIssue'),
+		(471, 'StateOrProvinceOfIssue'),
+		(472, 'LocaleOfIssue'),
+		(240, 'RedemptionDate'),
+		(202, 'StrikePrice'),
+		(947, 'StrikeCurrency'),
+		(206, 'OptAttribute'),
+		(231, 'ContractMultiplier'),
+		(223, 'CouponRate'),
+		(207, 'SecurityExchange'),
+		(106, 'Issuer'),
+		(348, 'EncodedIssuerLen'),
+		(349, 'EncodedIssuer'),
+		(107, 'SecurityDesc'),
+		(350, 'EncodedSecurityDescLen'),
+		(351, 'EncodedSecurityDesc'),
+		(691, 'Pool'),
+		(667, 'ContractSettlMonth'),
+		(875, 'CPProgram'),
+		(876, 'CPRegType'),
+		(864, 'NoEvents'),
+		(873, 'DatedDate'),
+		(874, 'InterestAccrualDate'),
 		(15, 'Currency'),
 		(827, 'ExpirationCycle'),
+		(668, 'DeliveryForm'),
+		(869, 'PctAtRisk'),
+		(870, 'NoInstrAttrib'),
+		(555, 'NoLegs'),
+		(336, 'TradingSessionID'),
+		(625, 'TradingSessionSubID'),
+		(58, 'Text'),
+		(354, 'EncodedTextLen'),
+		(355, 'EncodedText'),
 		],
 	'NoRoutingIDs': [
 		(216, 'RoutingType'),
@@ -1277,6 +1577,7 @@ _fix_group_types = {
 		(162, 'SettlInstID'),
 		(163, 'SettlInstTransType'),
 		(214, 'SettlInstRefID'),
+		(453, 'NoPartyIDs'),
 		(54, 'Side'),
 		(460, 'Product'),
 		(167, 'SecurityType'),
@@ -1284,6 +1585,11 @@ _fix_group_types = {
 		(168, 'EffectiveTime'),
 		(126, 'ExpireTime'),
 		(779, 'LastUpdateTime'),
+		(172, 'SettlDeliveryType'),
+		(169, 'StandInstDbType'),
+		(170, 'StandInstDbName'),
+		(171, 'StandInstDbID'),
+		(85, 'NoDlvyInst'),
 		(492, 'PaymentMethod'),
 		(476, 'PaymentRef'),
 		(488, 'CardHolderName'),
@@ -1298,6 +1604,7 @@ _fix_group_types = {
 		(782, 'SettlPartyID'),
 		(783, 'SettlPartyIDSource'),
 		(784, 'SettlPartyRole'),
+		(801, 'NoSettlPartySubIDs'),
 		],
 	'NoSettlPartySubIDs': [
 		(785, 'SettlPartySubID'),
@@ -1310,17 +1617,110 @@ _fix_group_types = {
 		(11, 'ClOrdID'),
 		(526, 'SecondaryClOrdID'),
 		(66, 'ListID'),
+		(453, 'NoPartyIDs'),
 		(1, 'Account'),
 		(660, 'AcctIDSource'),
 		(581, 'AccountType'),
 		(81, 'ProcessCode'),
 		(575, 'OddLot'),
+		(576, 'NoClearingInstructions'),
+		(635, 'ClearingFeeIndicator'),
+		(578, 'TradeInputSource'),
+		(579, 'TradeInputDevice'),
+		(821, 'OrderInputDevice'),
+		(15, 'Currency'),
+		(376, 'ComplianceID'),
+		(377, 'SolicitedFlag'),
+		(528, 'OrderCapacity'),
+		(529, 'OrderRestrictions'),
+		(582, 'CustOrderCapacity'),
+		(40, 'OrdType'),
+		(18, 'ExecInst'),
+		(483, 'TransBkdTime'),
+		(336, 'TradingSessionID'),
+		(625, 'TradingSessionSubID'),
+		(943, 'TimeBracket'),
+		(12, 'Commission'),
+		(13, 'CommType'),
+		(479, 'CommCurrency'),
+		(497, 'FundRenewWaiv'),
+		(381, 'GrossTradeAmt'),
+		(157, 'NumDaysInterest'),
+		(230, 'ExDate'),
+		(158, 'AccruedInterestRate'),
+		(159, 'AccruedInterestAmt'),
+		(738, 'InterestAtMaturity'),
+		(920, 'EndAccruedInterestAmt'),
+		(921, 'StartCash'),
+		(922, 'EndCash'),
+		(238, 'Concession'),
+		(237, 'TotalTakedown'),
+		(118, 'NetMoney'),
+		(119, 'SettlCurrAmt'),
+		(120, 'SettlCurrency'),
+		(155, 'SettlCurrFxRate'),
+		(156, 'SettlCurrFxRateCalc'),
+		(77, 'PositionEffect'),
+		(58, 'Text'),
+		(354, 'EncodedTextLen'),
+		(355, 'EncodedText'),
+		(752, 'SideMultiLegReportingType'),
+		(518, 'NoContAmts'),
+		(232, 'NoStipulations'),
+		(136, 'NoMiscFees'),
+		(825, 'ExchangeRule'),
+		(826, 'TradeAllocIndicator'),
+		(591, 'PreallocMethod'),
+		(70, 'AllocID'),
+		(78, 'NoAllocs'),
 		],
 	'NoStipulations': [
 		(233, 'StipulationType'),
 		(234, 'StipulationValue'),
 		],
 	'NoStrikes': [
+		(55, 'Symbol'),
+		(65, 'SymbolSfx'),
+		(48, 'SecurityID'),
+		(22, 'SecurityIDSource'),
+		(454, 'NoSecurityAltID'),
+		(460, 'Product'),
+		(461, 'CFICode'),
+		(167, 'SecurityType'),
+		(762, 'SecuritySubType'),
+		(200, 'MaturityMonthYear'),
+		(541, 'MaturityDate'),
+		(224, 'CouponPaymentDate'),
+		(225, 'IssueDate'),
+		(239, 'RepoCollateralSecurityType'),
+		(226, 'RepurchaseTerm'),
+		(227, 'RepurchaseRate'),
+		(228, 'Factor'),
+		(255, 'CreditRating'),
+		(543, 'InstrRegistry'),
+		(470, 'CountryOfIssue'),
+		(471, 'StateOrProvinceOfIssue'),
+		(472, 'LocaleOfIssue'),
+		(240, 'RedemptionDate'),
+		(202, 'StrikePrice'),
+		(947, 'StrikeCurrency'),
+		(206, 'OptAttribute'),
+		(231, 'ContractMultiplier'),
+		(223, 'CouponRate'),
+		(207, 'SecurityExchange'),
+		(106, 'Issuer'),
+		(348, 'EncodedIssuerLen'),
+		(349, 'EncodedIssuer'),
+		(107, 'SecurityDesc'),
+		(350, 'EncodedSecurityDescLen'),
+		(351, 'EncodedSecurityDesc'),
+		(691, 'Pool'),
+		(667, 'ContractSettlMonth'),
+		(875, 'CPProgram'),
+		(876, 'CPRegType'),
+		(864, 'NoEvents'),
+		(873, 'DatedDate'),
+		(874, 'InterestAccrualDate'),
 		],
 	'NoTrades': [
 		(571, 'TradeReportID'),
@@ -1344,6 +1744,52 @@ _fix_group_types = {
 		(889, 'UnderlyingStipValue'),
 		],
 	'NoUnderlyings': [
+		(311, 'UnderlyingSymbol'),
+		(312, 'UnderlyingSymbolSfx'),
+		(309, 'UnderlyingSecurityID'),
+		(305, 'UnderlyingSecurityIDSource'),
+		(457, 'NoUnderlyingSecurityAltID'),
+		(462, 'UnderlyingProduct'),
+		(463, 'UnderlyingCFICode'),
+		(310, 'UnderlyingSecurityType'),
+		(763, 'UnderlyingSecuritySubType'),
+		(313, 'UnderlyingMaturityMonthYear'),
+		(542, 'UnderlyingMaturityDate'),
+		(241, 'UnderlyingCouponPaymentDate'),
+		(242, 'UnderlyingIssueDate'),
+		(243, 'UnderlyingRepoCollateralSecurityType'),
+		(244, 'UnderlyingRepurchaseTerm'),
+		(245, 'UnderlyingRepurchaseRate'),
+		(246, 'UnderlyingFactor'),
+		(256, 'UnderlyingCreditRating'),
+		(595, 'UnderlyingInstrRegistry'),
+		(592, 'UnderlyingCountryOfIssue'),
+		(593, 'UnderlyingStateOrProvinceOfIssue'),
+		(594, 'UnderlyingLocaleOfIssue'),
+		(247, 'UnderlyingRedemptionDate'),
+		(316, 'UnderlyingStrikePrice'),
+		(941, 'UnderlyingStrikeCurrency'),
+		(317, 'UnderlyingOptAttribute'),
+		(436, 'UnderlyingContractMultiplier'),
+		(435, 'UnderlyingCouponRate'),
+		(308, 'UnderlyingSecurityExchange'),
+		(306, 'UnderlyingIssuer'),
+		(362, 'EncodedUnderlyingIssuerLen'),
+		(363, 'EncodedUnderlyingIssuer'),
+		(307, 'UnderlyingSecurityDesc'),
+		(364, 'EncodedUnderlyingSecurityDescLen'),
+		(365, 'EncodedUnderlyingSecurityDesc'),
+		(877, 'UnderlyingCPProgram'),
+		(878, 'UnderlyingCPRegType'),
+		(318, 'UnderlyingCurrency'),
+		(879, 'UnderlyingQty'),
+		(810, 'UnderlyingPx'),
+		(882, 'UnderlyingDirtyPrice'),
+		(883, 'UnderlyingEndPrice'),
+		(884, 'UnderlyingStartValue'),
+		(885, 'UnderlyingCurrentValue'),
+		(886, 'UnderlyingEndValue'),
+		(887, 'NoUnderlyingStips'),
 		],
 }
 
@@ -6,255 +6,28627 @@ from sxsuite.fix.message import FixObject
 
 from sxsuite.fix.message import Heartbeat,Logon,Logout,Reject,ResendRequest,SequenceReset,TestRequest
 
+from sxsuite.fix.message import _make_mbody, _extract_body, _convert_value, _check_group
+
+def _encode_grp_LinesOfText(entry, fixm):
+	d = entry.__dict__
+	add = fixm.append
+	if 'Text' in d:
+		add('58=' + str(d['Text']))
+	if 'EncodedTextLen' in d:
+		add('354=' + str(d['EncodedTextLen']))
+	if 'EncodedText' in d:
+		add('355=' + str(d['EncodedText']))
+
+def _decode_grp_LinesOfText(fields, index, context, nentries):
+	entries = []
+	entry = FixObject(context)
+	d = entry.__dict__
+	start = index
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _grp_LinesOfText_tags.get(num)
+		if spec is None:
+			break
+		name, pytype, decode_grp = spec
+		if name in d:
+			# repeating group
+			entries.append(entry)
+			entry = FixObject(context)
+			d = entry.__dict__
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	if index > start:
+		entries.append(entry)
+	_check_group(33, nentries, entries)
+	return entries, index
+
+def _encode_grp_NoAffectedOrders(entry, fixm):
+	d = entry.__dict__
+	add = fixm.append
+	if 'OrigClOrdID' in d:
+		add('41=' + str(d['OrigClOrdID']))
+	if 'AffectedOrderID' in d:
+		add('535=' + str(d['AffectedOrderID']))
+	if 'AffectedSecondaryOrderID' in d:
+		add('536=' + str(d['AffectedSecondaryOrderID']))
+
+def _decode_grp_NoAffectedOrders(fields, index, context, nentries):
+	entries = []
+	entry = FixObject(context)
+	d = entry.__dict__
+	start = index
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _grp_NoAffectedOrders_tags.get(num)
+		if spec is None:
+			break
+		name, pytype, decode_grp = spec
+		if name in d:
+			# repeating group
+			entries.append(entry)
+			entry = FixObject(context)
+			d = entry.__dict__
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	if index > start:
+		entries.append(entry)
+	_check_group(534, nentries, entries)
+	return entries, index
+
+def _encode_grp_NoAllocs(entry, fixm):
+	d = entry.__dict__
+	add = fixm.append
+	if 'AllocAccount' in d:
+		add('79=' + str(d['AllocAccount']))
+	if 'AllocAcctIDSource' in d:
+		add('661=' + str(d['AllocAcctIDSource']))
+	if 'AllocSettlCurrency' in d:
+		add('736=' + str(d['AllocSettlCurrency']))
+	if 'IndividualAllocID' in d:
+		add('467=' + str(d['IndividualAllocID']))
+	if 'NoNested2PartyIDs' in d:
+		grp = d['NoNested2PartyIDs']
+		add('756=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoNested2PartyIDs(entry, fixm)
+	if 'AllocQty' in d:
+		add('80=' + str(d['AllocQty']))
+
+def _decode_grp_NoAllocs(fields, index, context, nentries):
+	entries = []
+	entry = FixObject(context)
+	d = entry.__dict__
+	start = index
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _grp_NoAllocs_tags.get(num)
+		if spec is None:
+			break
+		name, pytype, decode_grp = spec
+		if name in d:
+			# repeating group
+			entries.append(entry)
+			entry = FixObject(context)
+			d = entry.__dict__
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	if index > start:
+		entries.append(entry)
+	_check_group(78, nentries, entries)
+	return entries, index
+
+def _encode_grp_NoAltMDSource(entry, fixm):
+	d = entry.__dict__
+	add = fixm.append
+	if 'AltMDSourceID' in d:
+		add('817=' + str(d['AltMDSourceID']))
+
+def _decode_grp_NoAltMDSource(fields, index, context, nentries):
+	entries = []
+	entry = FixObject(context)
+	d = entry.__dict__
+	start = index
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _grp_NoAltMDSource_tags.get(num)
+		if spec is None:
+			break
+		name, pytype, decode_grp = spec
+		if name in d:
+			# repeating group
+			entries.append(entry)
+			entry = FixObject(context)
+			d = entry.__dict__
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	if index > start:
+		entries.append(entry)
+	_check_group(816, nentries, entries)
+	return entries, index
+
+def _encode_grp_NoBidComponents(entry, fixm):
+	d = entry.__dict__
+	add = fixm.append
+	if 'Commission' in d:
+		add('12=' + str(d['Commission']))
+	if 'CommType' in d:
+		add('13=' + str(d['CommType']))
+	if 'CommCurrency' in d:
+		add('479=' + str(d['CommCurrency']))
+	if 'FundRenewWaiv' in d:
+		add('497=' + str(d['FundRenewWaiv']))
+	if 'ListID' in d:
+		add('66=' + str(d['ListID']))
+	if 'Country' in d:
+		add('421=' + str(d['Country']))
+	if 'Side' in d:
+		add('54=' + str(d['Side']))
+	if 'Price' in d:
+		add('44=' + str(d['Price']))
+	if 'PriceType' in d:
+		add('423=' + str(d['PriceType']))
+	if 'FairValue' in d:
+		add('406=' + str(d['FairValue']))
+	if 'NetGrossInd' in d:
+		add('430=' + str(d['NetGrossInd']))
+	if 'SettlType' in d:
+		add('63=' + str(d['SettlType']))
+	if 'SettlDate' in d:
+		add('64=' + str(d['SettlDate']))
+	if 'TradingSessionID' in d:
+		add('336=' + str(d['TradingSessionID']))
+	if 'TradingSessionSubID' in d:
+		add('625=' + str(d['TradingSessionSubID']))
+	if 'Text' in d:
+		add('58=' + str(d['Text']))
+	if 'EncodedTextLen' in d:
+		add('354=' + str(d['EncodedTextLen']))
+	if 'EncodedText' in d:
+		add('355=' + str(d['EncodedText']))
+
+def _decode_grp_NoBidComponents(fields, index, context, nentries):
+	entries = []
+	entry = FixObject(context)
+	d = entry.__dict__
+	start = index
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _grp_NoBidComponents_tags.get(num)
+		if spec is None:
+			break
+		name, pytype, decode_grp = spec
+		if name in d:
+			# repeating group
+			entries.append(entry)
+			entry = FixObject(context)
+			d = entry.__dict__
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	if index > start:
+		entries.append(entry)
+	_check_group(420, nentries, entries)
+	return entries, index
+
+def _encode_grp_NoBidDescriptors(entry, fixm):
+	d = entry.__dict__
+	add = fixm.append
+	if 'BidDescriptorType' in d:
+		add('399=' + str(d['BidDescriptorType']))
+	if 'BidDescriptor' in d:
+		add('400=' + str(d['BidDescriptor']))
+	if 'SideValueInd' in d:
+		add('401=' + str(d['SideValueInd']))
+	if 'LiquidityValue' in d:
+		add('404=' + str(d['LiquidityValue']))
+	if 'LiquidityNumSecurities' in d:
+		add('441=' + str(d['LiquidityNumSecurities']))
+	if 'LiquidityPctLow' in d:
+		add('402=' + str(d['LiquidityPctLow']))
+	if 'LiquidityPctHigh' in d:
+		add('403=' + str(d['LiquidityPctHigh']))
+	if 'EFPTrackingError' in d:
+		add('405=' + str(d['EFPTrackingError']))
+	if 'FairValue' in d:
+		add('406=' + str(d['FairValue']))
+	if 'OutsideIndexPct' in d:
+		add('407=' + str(d['OutsideIndexPct']))
+	if 'ValueOfFutures' in d:
+		add('408=' + str(d['ValueOfFutures']))
+
+def _decode_grp_NoBidDescriptors(fields, index, context, nentries):
+	entries = []
+	entry = FixObject(context)
+	d = entry.__dict__
+	start = index
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _grp_NoBidDescriptors_tags.get(num)
+		if spec is None:
+			break
+		name, pytype, decode_grp = spec
+		if name in d:
+			# repeating group
+			entries.append(entry)
+			entry = FixObject(context)
+			d = entry.__dict__
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	if index > start:
+		entries.append(entry)
+	_check_group(398, nentries, entries)
+	return entries, index
+
+def _encode_grp_NoCapacities(entry, fixm):
+	d = entry.__dict__
+	add = fixm.append
+	if 'OrderCapacity' in d:
+		add('528=' + str(d['OrderCapacity']))
+	if 'OrderRestrictions' in d:
+		add('529=' + str(d['OrderRestrictions']))
+	if 'OrderCapacityQty' in d:
+		add('863=' + str(d['OrderCapacityQty']))
+
+def _decode_grp_NoCapacities(fields, index, context, nentries):
+	entries = []
+	entry = FixObject(context)
+	d = entry.__dict__
+	start = index
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _grp_NoCapacities_tags.get(num)
+		if spec is None:
+			break
+		name, pytype, decode_grp = spec
+		if name in d:
+			# repeating group
+			entries.append(entry)
+			entry = FixObject(context)
+			d = entry.__dict__
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	if index > start:
+		entries.append(entry)
+	_check_group(862, nentries, entries)
+	return entries, index
+
+def _encode_grp_NoClearingInstructions(entry, fixm):
+	d = entry.__dict__
+	add = fixm.append
+	if 'ClearingInstruction' in d:
+		add('577=' + str(d['ClearingInstruction']))
+
+def _decode_grp_NoClearingInstructions(fields, index, context, nentries):
+	entries = []
+	entry = FixObject(context)
+	d = entry.__dict__
+	start = index
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _grp_NoClearingInstructions_tags.get(num)
+		if spec is None:
+			break
+		name, pytype, decode_grp = spec
+		if name in d:
+			# repeating group
+			entries.append(entry)
+			entry = FixObject(context)
+			d = entry.__dict__
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	if index > start:
+		entries.append(entry)
+	_check_group(576, nentries, entries)
+	return entries, index
+
+def _encode_grp_NoCollInquiryQualifier(entry, fixm):
+	d = entry.__dict__
+	add = fixm.append
+	if 'CollInquiryQualifier' in d:
+		add('896=' + str(d['CollInquiryQualifier']))
+
+def _decode_grp_NoCollInquiryQualifier(fields, index, context, nentries):
+	entries = []
+	entry = FixObject(context)
+	d = entry.__dict__
+	start = index
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _grp_NoCollInquiryQualifier_tags.get(num)
+		if spec is None:
+			break
+		name, pytype, decode_grp = spec
+		if name in d:
+			# repeating group
+			entries.append(entry)
+			entry = FixObject(context)
+			d = entry.__dict__
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	if index > start:
+		entries.append(entry)
+	_check_group(938, nentries, entries)
+	return entries, index
+
+def _encode_grp_NoCompIDs(entry, fixm):
+	d = entry.__dict__
+	add = fixm.append
+	if 'RefCompID' in d:
+		add('930=' + str(d['RefCompID']))
+	if 'RefSubID' in d:
+		add('931=' + str(d['RefSubID']))
+	if 'LocationID' in d:
+		add('283=' + str(d['LocationID']))
+	if 'DeskID' in d:
+		add('284=' + str(d['DeskID']))
+	if 'StatusValue' in d:
+		add('928=' + str(d['StatusValue']))
+	if 'StatusText' in d:
+		add('929=' + str(d['StatusText']))
+
+def _decode_grp_NoCompIDs(fields, index, context, nentries):
+	entries = []
+	entry = FixObject(context)
+	d = entry.__dict__
+	start = index
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _grp_NoCompIDs_tags.get(num)
+		if spec is None:
+			break
+		name, pytype, decode_grp = spec
+		if name in d:
+			# repeating group
+			entries.append(entry)
+			entry = FixObject(context)
+			d = entry.__dict__
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	if index > start:
+		entries.append(entry)
+	_check_group(936, nentries, entries)
+	return entries, index
+
+def _encode_grp_NoContAmts(entry, fixm):
+	d = entry.__dict__
+	add = fixm.append
+	if 'ContAmtType' in d:
+		add('519=' + str(d['ContAmtType']))
+	if 'ContAmtValue' in d:
+		add('520=' + str(d['ContAmtValue']))
+	if 'ContAmtCurr' in d:
+		add('521=' + str(d['ContAmtCurr']))
+
+def _decode_grp_NoContAmts(fields, index, context, nentries):
+	entries = []
+	entry = FixObject(context)
+	d = entry.__dict__
+	start = index
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _grp_NoContAmts_tags.get(num)
+		if spec is None:
+			break
+		name, pytype, decode_grp = spec
+		if name in d:
+			# repeating group
+			entries.append(entry)
+			entry = FixObject(context)
+			d = entry.__dict__
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	if index > start:
+		entries.append(entry)
+	_check_group(518, nentries, entries)
+	return entries, index
+
+def _encode_grp_NoContraBrokers(entry, fixm):
+	d = entry.__dict__
+	add = fixm.append
+	if 'ContraBroker' in d:
+		add('375=' + str(d['ContraBroker']))
+	if 'ContraTrader' in d:
+		add('337=' + str(d['ContraTrader']))
+	if 'ContraTradeQty' in d:
+		add('437=' + str(d['ContraTradeQty']))
+	if 'ContraTradeTime' in d:
+		add('438=' + str(d['ContraTradeTime']))
+	if 'ContraLegRefID' in d:
+		add('655=' + str(d['ContraLegRefID']))
+
+def _decode_grp_NoContraBrokers(fields, index, context, nentries):
+	entries = []
+	entry = FixObject(context)
+	d = entry.__dict__
+	start = index
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _grp_NoContraBrokers_tags.get(num)
+		if spec is None:
+			break
+		name, pytype, decode_grp = spec
+		if name in d:
+			# repeating group
+			entries.append(entry)
+			entry = FixObject(context)
+			d = entry.__dict__
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	if index > start:
+		entries.append(entry)
+	_check_group(382, nentries, entries)
+	return entries, index
+
+def _encode_grp_NoDates(entry, fixm):
+	d = entry.__dict__
+	add = fixm.append
+	if 'TradeDate' in d:
+		add('75=' + str(d['TradeDate']))
+	if 'TransactTime' in d:
+		add('60=' + str(d['TransactTime']))
+
+def _decode_grp_NoDates(fields, index, context, nentries):
+	entries = []
+	entry = FixObject(context)
+	d = entry.__dict__
+	start = index
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _grp_NoDates_tags.get(num)
+		if spec is None:
+			break
+		name, pytype, decode_grp = spec
+		if name in d:
+			# repeating group
+			entries.append(entry)
+			entry = FixObject(context)
+			d = entry.__dict__
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	if index > start:
+		entries.append(entry)
+	_check_group(580, nentries, entries)
+	return entries, index
+
+def _encode_grp_NoDistribInsts(entry, fixm):
+	d = entry.__dict__
+	add = fixm.append
+	if 'DistribPaymentMethod' in d:
+		add('477=' + str(d['DistribPaymentMethod']))
+	if 'DistribPercentage' in d:
+		add('512=' + str(d['DistribPercentage']))
+	if 'CashDistribCurr' in d:
+		add('478=' + str(d['CashDistribCurr']))
+	if 'CashDistribAgentName' in d:
+		add('498=' + str(d['CashDistribAgentName']))
+	if 'CashDistribAgentCode' in d:
+		add('499=' + str(d['CashDistribAgentCode']))
+	if 'CashDistribAgentAcctNumber' in d:
+		add('500=' + str(d['CashDistribAgentAcctNumber']))
+	if 'CashDistribPayRef' in d:
+		add('501=' + str(d['CashDistribPayRef']))
+	if 'CashDistribAgentAcctName' in d:
+		add('502=' + str(d['CashDistribAgentAcctName']))
+
+def _decode_grp_NoDistribInsts(fields, index, context, nentries):
+	entries = []
+	entry = FixObject(context)
+	d = entry.__dict__
+	start = index
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _grp_NoDistribInsts_tags.get(num)
+		if spec is None:
+			break
+		name, pytype, decode_grp = spec
+		if name in d:
+			# repeating group
+			entries.append(entry)
+			entry = FixObject(context)
+			d = entry.__dict__
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	if index > start:
+		entries.append(entry)
+	_check_group(510, nentries, entries)
+	return entries, index
+
+def _encode_grp_NoDlvyInst(entry, fixm):
+	d = entry.__dict__
+	add = fixm.append
+	if 'SettlInstSource' in d:
+		add('165=' + str(d['SettlInstSource']))
+	if 'DlvyInstType' in d:
+		add('787=' + str(d['DlvyInstType']))
+	if 'NoSettlPartyIDs' in d:
+		grp = d['NoSettlPartyIDs']
+		add('781=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoSettlPartyIDs(entry, fixm)
+
+def _decode_grp_NoDlvyInst(fields, index, context, nentries):
+	entries = []
+	entry = FixObject(context)
+	d = entry.__dict__
+	start = index
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _grp_NoDlvyInst_tags.get(num)
+		if spec is None:
+			break
+		name, pytype, decode_grp = spec
+		if name in d:
+			# repeating group
+			entries.append(entry)
+			entry = FixObject(context)
+			d = entry.__dict__
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	if index > start:
+		entries.append(entry)
+	_check_group(85, nentries, entries)
+	return entries, index
+
+def _encode_grp_NoEvents(entry, fixm):
+	d = entry.__dict__
+	add = fixm.append
+	if 'EventType' in d:
+		add('865=' + str(d['EventType']))
+	if 'EventDate' in d:
+		add('866=' + str(d['EventDate']))
+	if 'EventPx' in d:
+		add('867=' + str(d['EventPx']))
+	if 'EventText' in d:
+		add('868=' + str(d['EventText']))
+
+def _decode_grp_NoEvents(fields, index, context, nentries):
+	entries = []
+	entry = FixObject(context)
+	d = entry.__dict__
+	start = index
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _grp_NoEvents_tags.get(num)
+		if spec is None:
+			break
+		name, pytype, decode_grp = spec
+		if name in d:
+			# repeating group
+			entries.append(entry)
+			entry = FixObject(context)
+			d = entry.__dict__
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	if index > start:
+		entries.append(entry)
+	_check_group(864, nentries, entries)
+	return entries, index
+
+def _encode_grp_NoExecs(entry, fixm):
+	d = entry.__dict__
+	add = fixm.append
+	if 'ExecID' in d:
+		add('17=' + str(d['ExecID']))
+
+def _decode_grp_NoExecs(fields, index, context, nentries):
+	entries = []
+	entry = FixObject(context)
+	d = entry.__dict__
+	start = index
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _grp_NoExecs_tags.get(num)
+		if spec is None:
+			break
+		name, pytype, decode_grp = spec
+		if name in d:
+			# repeating group
+			entries.append(entry)
+			entry = FixObject(context)
+			d = entry.__dict__
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	if index > start:
+		entries.append(entry)
+	_check_group(124, nentries, entries)
+	return entries, index
+
+def _encode_grp_NoHops(entry, fixm):
+	d = entry.__dict__
+	add = fixm.append
+	if 'HopCompID' in d:
+		add('628=' + str(d['HopCompID']))
+	if 'HopSendingTime' in d:
+		add('629=' + str(d['HopSendingTime']))
+	if 'HopRefID' in d:
+		add('630=' + str(d['HopRefID']))
+
+def _decode_grp_NoHops(fields, index, context, nentries):
+	entries = []
+	entry = FixObject(context)
+	d = entry.__dict__
+	start = index
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _grp_NoHops_tags.get(num)
+		if spec is None:
+			break
+		name, pytype, decode_grp = spec
+		if name in d:
+			# repeating group
+			entries.append(entry)
+			entry = FixObject(context)
+			d = entry.__dict__
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	if index > start:
+		entries.append(entry)
+	_check_group(627, nentries, entries)
+	return entries, index
+
+def _encode_grp_NoIOIQualifiers(entry, fixm):
+	d = entry.__dict__
+	add = fixm.append
+	if 'IOIQualifier' in d:
+		add('104=' + str(d['IOIQualifier']))
+
+def _decode_grp_NoIOIQualifiers(fields, index, context, nentries):
+	entries = []
+	entry = FixObject(context)
+	d = entry.__dict__
+	start = index
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _grp_NoIOIQualifiers_tags.get(num)
+		if spec is None:
+			break
+		name, pytype, decode_grp = spec
+		if name in d:
+			# repeating group
+			entries.append(entry)
+			entry = FixObject(context)
+			d = entry.__dict__
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	if index > start:
+		entries.append(entry)
+	_check_group(199, nentries, entries)
+	return entries, index
+
+def _encode_grp_NoInstrAttrib(entry, fixm):
+	d = entry.__dict__
+	add = fixm.append
+	if 'InstrAttribType' in d:
+		add('871=' + str(d['InstrAttribType']))
+	if 'InstrAttribValue' in d:
+		add('872=' + str(d['InstrAttribValue']))
+
+def _decode_grp_NoInstrAttrib(fields, index, context, nentries):
+	entries = []
+	entry = FixObject(context)
+	d = entry.__dict__
+	start = index
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _grp_NoInstrAttrib_tags.get(num)
+		if spec is None:
+			break
+		name, pytype, decode_grp = spec
+		if name in d:
+			# repeating group
+			entries.append(entry)
+			entry = FixObject(context)
+			d = entry.__dict__
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	if index > start:
+		entries.append(entry)
+	_check_group(870, nentries, entries)
+	return entries, index
+
+def _encode_grp_NoLegAllocs(entry, fixm):
+	d = entry.__dict__
+	add = fixm.append
+	if 'LegAllocAccount' in d:
+		add('671=' + str(d['LegAllocAccount']))
+	if 'LegIndividualAllocID' in d:
+		add('672=' + str(d['LegIndividualAllocID']))
+	if 'NoNested2PartyIDs' in d:
+		grp = d['NoNested2PartyIDs']
+		add('756=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoNested2PartyIDs(entry, fixm)
+	if 'LegAllocQty' in d:
+		add('673=' + str(d['LegAllocQty']))
+	if 'LegAllocAcctIDSource' in d:
+		add('674=' + str(d['LegAllocAcctIDSource']))
+	if 'LegSettlCurrency' in d:
+		add('675=' + str(d['LegSettlCurrency']))
+
+def _decode_grp_NoLegAllocs(fields, index, context, nentries):
+	entries = []
+	entry = FixObject(context)
+	d = entry.__dict__
+	start = index
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _grp_NoLegAllocs_tags.get(num)
+		if spec is None:
+			break
+		name, pytype, decode_grp = spec
+		if name in d:
+			# repeating group
+			entries.append(entry)
+			entry = FixObject(context)
+			d = entry.__dict__
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	if index > start:
+		entries.append(entry)
+	_check_group(670, nentries, entries)
+	return entries, index
+
+def _encode_grp_NoLegSecurityAltID(entry, fixm):
+	d = entry.__dict__
+	add = fixm.append
+	if 'LegSecurityAltID' in d:
+		add('605=' + str(d['LegSecurityAltID']))
+	if 'LegSecurityAltIDSource' in d:
+		add('606=' + str(d['LegSecurityAltIDSource']))
+
+def _decode_grp_NoLegSecurityAltID(fields, index, context, nentries):
+	entries = []
+	entry = FixObject(context)
+	d = entry.__dict__
+	start = index
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _grp_NoLegSecurityAltID_tags.get(num)
+		if spec is None:
+			break
+		name, pytype, decode_grp = spec
+		if name in d:
+			# repeating group
+			entries.append(entry)
+			entry = FixObject(context)
+			d = entry.__dict__
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	if index > start:
+		entries.append(entry)
+	_check_group(604, nentries, entries)
+	return entries, index
+
+def _encode_grp_NoLegStipulations(entry, fixm):
+	d = entry.__dict__
+	add = fixm.append
+	if 'LegStipulationType' in d:
+		add('688=' + str(d['LegStipulationType']))
+	if 'LegStipulationValue' in d:
+		add('689=' + str(d['LegStipulationValue']))
+
+def _decode_grp_NoLegStipulations(fields, index, context, nentries):
+	entries = []
+	entry = FixObject(context)
+	d = entry.__dict__
+	start = index
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _grp_NoLegStipulations_tags.get(num)
+		if spec is None:
+			break
+		name, pytype, decode_grp = spec
+		if name in d:
+			# repeating group
+			entries.append(entry)
+			entry = FixObject(context)
+			d = entry.__dict__
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	if index > start:
+		entries.append(entry)
+	_check_group(683, nentries, entries)
+	return entries, index
+
+def _encode_grp_NoLegs(entry, fixm):
+	d = entry.__dict__
+	add = fixm.append
+	if 'LegSymbol' in d:
+		add('600=' + str(d['LegSymbol']))
+	if 'LegSymbolSfx' in d:
+		add('601=' + str(d['LegSymbolSfx']))
+	if 'LegSecurityID' in d:
+		add('602=' + str(d['LegSecurityID']))
+	if 'LegSecurityIDSource' in d:
+		add('603=' + str(d['LegSecurityIDSource']))
+	if 'NoLegSecurityAltID' in d:
+		add('604=' + str(d['NoLegSecurityAltID']))
+	if 'LegProduct' in d:
+		add('607=' + str(d['LegProduct']))
+	if 'LegCFICode' in d:
+		add('608=' + str(d['LegCFICode']))
+	if 'LegSecurityType' in d:
+		add('609=' + str(d['LegSecurityType']))
+	if 'LegSecuritySubType' in d:
+		add('764=' + str(d['LegSecuritySubType']))
+	if 'LegMaturityMonthYear' in d:
+		add('610=' + str(d['LegMaturityMonthYear']))
+	if 'LegMaturityDate' in d:
+		add('611=' + str(d['LegMaturityDate']))
+	if 'LegCouponPaymentDate' in d:
+		add('248=' + str(d['LegCouponPaymentDate']))
+	if 'LegIssueDate' in d:
+		add('249=' + str(d['LegIssueDate']))
+	if 'LegRepoCollateralSecurityType' in d:
+		add('250=' + str(d['LegRepoCollateralSecurityType']))
+	if 'LegRepurchaseTerm' in d:
+		add('251=' + str(d['LegRepurchaseTerm']))
+	if 'LegRepurchaseRate' in d:
+		add('252=' + str(d['LegRepurchaseRate']))
+	if 'LegFactor' in d:
+		add('253=' + str(d['LegFactor']))
+	if 'LegCreditRating' in d:
+		add('257=' + str(d['LegCreditRating']))
+	if 'LegInstrRegistry' in d:
+		add('599=' + str(d['LegInstrRegistry']))
+	if 'LegCountryOfIssue' in d:
+		add('596=' + str(d['LegCountryOfIssue']))
+	if 'LegStateOrProvinceOfIssue' in d:
+		add('597=' + str(d['LegStateOrProvinceOfIssue']))
+	if 'LegLocaleOfIssue' in d:
+		add('598=' + str(d['LegLocaleOfIssue']))
+	if 'LegRedemptionDate' in d:
+		add('254=' + str(d['LegRedemptionDate']))
+	if 'LegStrikePrice' in d:
+		add('612=' + str(d['LegStrikePrice']))
+	if 'LegStrikeCurrency' in d:
+		add('942=' + str(d['LegStrikeCurrency']))
+	if 'LegOptAttribute' in d:
+		add('613=' + str(d['LegOptAttribute']))
+	if 'LegContractMultiplier' in d:
+		add('614=' + str(d['LegContractMultiplier']))
+	if 'LegCouponRate' in d:
+		add('615=' + str(d['LegCouponRate']))
+	if 'LegSecurityExchange' in d:
+		add('616=' + str(d['LegSecurityExchange']))
+	if 'LegIssuer' in d:
+		add('617=' + str(d['LegIssuer']))
+	if 'EncodedLegIssuerLen' in d:
+		add('618=' + str(d['EncodedLegIssuerLen']))
+	if 'EncodedLegIssuer' in d:
+		add('619=' + str(d['EncodedLegIssuer']))
+	if 'LegSecurityDesc' in d:
+		add('620=' + str(d['LegSecurityDesc']))
+	if 'EncodedLegSecurityDescLen' in d:
+		add('621=' + str(d['EncodedLegSecurityDescLen']))
+	if 'EncodedLegSecurityDesc' in d:
+		add('622=' + str(d['EncodedLegSecurityDesc']))
+	if 'LegRatioQty' in d:
+		add('623=' + str(d['LegRatioQty']))
+	if 'LegSide' in d:
+		add('624=' + str(d['LegSide']))
+	if 'LegCurrency' in d:
+		add('556=' + str(d['LegCurrency']))
+	if 'LegPool' in d:
+		add('740=' + str(d['LegPool']))
+	if 'LegDatedDate' in d:
+		add('739=' + str(d['LegDatedDate']))
+	if 'LegContractSettlMonth' in d:
+		add('955=' + str(d['LegContractSettlMonth']))
+	if 'LegInterestAccrualDate' in d:
+		add('956=' + str(d['LegInterestAccrualDate']))
+
+def _decode_grp_NoLegs(fields, index, context, nentries):
+	entries = []
+	entry = FixObject(context)
+	d = entry.__dict__
+	start = index
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _grp_NoLegs_tags.get(num)
+		if spec is None:
+			break
+		name, pytype, decode_grp = spec
+		if name in d:
+			# repeating group
+			entries.append(entry)
+			entry = FixObject(context)
+			d = entry.__dict__
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	if index > start:
+		entries.append(entry)
+	_check_group(555, nentries, entries)
+	return entries, index
+
+def _encode_grp_NoMDEntries(entry, fixm):
+	d = entry.__dict__
+	add = fixm.append
+	if 'MDUpdateAction' in d:
+		add('279=' + str(d['MDUpdateAction']))
+	if 'DeleteReason' in d:
+		add('285=' + str(d['DeleteReason']))
+	if 'MDEntryType' in d:
+		add('269=' + str(d['MDEntryType']))
+	if 'MDEntryID' in d:
+		add('278=' + str(d['MDEntryID']))
+	if 'MDEntryRefID' in d:
+		add('280=' + str(d['MDEntryRefID']))
+	if 'Symbol' in d:
+		add('55=' + str(d['Symbol']))
+	if 'SymbolSfx' in d:
+		add('65=' + str(d['SymbolSfx']))
+	if 'SecurityID' in d:
+		add('48=' + str(d['SecurityID']))
+	if 'SecurityIDSource' in d:
+		add('22=' + str(d['SecurityIDSource']))
+	if 'NoSecurityAltID' in d:
+		grp = d['NoSecurityAltID']
+		add('454=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoSecurityAltID(entry, fixm)
+	if 'Product' in d:
+		add('460=' + str(d['Product']))
+	if 'CFICode' in d:
+		add('461=' + str(d['CFICode']))
+	if 'SecurityType' in d:
+		add('167=' + str(d['SecurityType']))
+	if 'SecuritySubType' in d:
+		add('762=' + str(d['SecuritySubType']))
+	if 'MaturityMonthYear' in d:
+		add('200=' + str(d['MaturityMonthYear']))
+	if 'MaturityDate' in d:
+		add('541=' + str(d['MaturityDate']))
+	if 'CouponPaymentDate' in d:
+		add('224=' + str(d['CouponPaymentDate']))
+	if 'IssueDate' in d:
+		add('225=' + str(d['IssueDate']))
+	if 'RepoCollateralSecurityType' in d:
+		add('239=' + str(d['RepoCollateralSecurityType']))
+	if 'RepurchaseTerm' in d:
+		add('226=' + str(d['RepurchaseTerm']))
+	if 'RepurchaseRate' in d:
+		add('227=' + str(d['RepurchaseRate']))
+	if 'Factor' in d:
+		add('228=' + str(d['Factor']))
+	if 'CreditRating' in d:
+		add('255=' + str(d['CreditRating']))
+	if 'InstrRegistry' in d:
+		add('543=' + str(d['InstrRegistry']))
+	if 'CountryOfIssue' in d:
+		add('470=' + str(d['CountryOfIssue']))
+	if 'StateOrProvinceOfIssue' in d:
+		add('471=' + str(d['StateOrProvinceOfIssue']))
+	if 'LocaleOfIssue' in d:
+		add('472=' + str(d['LocaleOfIssue']))
+	if 'RedemptionDate' in d:
+		add('240=' + str(d['RedemptionDate']))
+	if 'StrikePrice' in d:
+		add('202=' + str(d['StrikePrice']))
+	if 'StrikeCurrency' in d:
+		add('947=' + str(d['StrikeCurrency']))
+	if 'OptAttribute' in d:
+		add('206=' + str(d['OptAttribute']))
+	if 'ContractMultiplier' in d:
+		add('231=' + str(d['ContractMultiplier']))
+	if 'CouponRate' in d:
+		add('223=' + str(d['CouponRate']))
+	if 'SecurityExchange' in d:
+		add('207=' + str(d['SecurityExchange']))
+	if 'Issuer' in d:
+		add('106=' + str(d['Issuer']))
+	if 'EncodedIssuerLen' in d:
+		add('348=' + str(d['EncodedIssuerLen']))
+	if 'EncodedIssuer' in d:
+		add('349=' + str(d['EncodedIssuer']))
+	if 'SecurityDesc' in d:
+		add('107=' + str(d['SecurityDesc']))
+	if 'EncodedSecurityDescLen' in d:
+		add('350=' + str(d['EncodedSecurityDescLen']))
+	if 'EncodedSecurityDesc' in d:
+		add('351=' + str(d['EncodedSecurityDesc']))
+	if 'Pool' in d:
+		add('691=' + str(d['Pool']))
+	if 'ContractSettlMonth' in d:
+		add('667=' + str(d['ContractSettlMonth']))
+	if 'CPProgram' in d:
+		add('875=' + str(d['CPProgram']))
+	if 'CPRegType' in d:
+		add('876=' + str(d['CPRegType']))
+	if 'NoEvents' in d:
+		grp = d['NoEvents']
+		add('864=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoEvents(entry, fixm)
+	if 'DatedDate' in d:
+		add('873=' + str(d['DatedDate']))
+	if 'InterestAccrualDate' in d:
+		add('874=' + str(d['InterestAccrualDate']))
+	if 'NoUnderlyings' in d:
+		grp = d['NoUnderlyings']
+		add('711=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoUnderlyings(entry, fixm)
+	if 'NoLegs' in d:
+		grp = d['NoLegs']
+		add('555=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoLegs(entry, fixm)
+	if 'FinancialStatus' in d:
+		add('291=' + str(d['FinancialStatus']))
+	if 'CorporateAction' in d:
+		add('292=' + str(d['CorporateAction']))
+	if 'MDEntryPx' in d:
+		add('270=' + str(d['MDEntryPx']))
+	if 'Currency' in d:
+		add('15=' + str(d['Currency']))
+	if 'MDEntrySize' in d:
+		add('271=' + str(d['MDEntrySize']))
+	if 'MDEntryDate' in d:
+		add('272=' + str(d['MDEntryDate']))
+	if 'MDEntryTime' in d:
+		add('273=' + str(d['MDEntryTime']))
+	if 'TickDirection' in d:
+		add('274=' + str(d['TickDirection']))
+	if 'MDMkt' in d:
+		add('275=' + str(d['MDMkt']))
+	if 'TradingSessionID' in d:
+		add('336=' + str(d['TradingSessionID']))
+	if 'TradingSessionSubID' in d:
+		add('625=' + str(d['TradingSessionSubID']))
+	if 'QuoteCondition' in d:
+		add('276=' + str(d['QuoteCondition']))
+	if 'TradeCondition' in d:
+		add('277=' + str(d['TradeCondition']))
+	if 'MDEntryOriginator' in d:
+		add('282=' + str(d['MDEntryOriginator']))
+	if 'LocationID' in d:
+		add('283=' + str(d['LocationID']))
+	if 'DeskID' in d:
+		add('284=' + str(d['DeskID']))
+	if 'OpenCloseSettlFlag' in d:
+		add('286=' + str(d['OpenCloseSettlFlag']))
+	if 'TimeInForce' in d:
+		add('59=' + str(d['TimeInForce']))
+	if 'ExpireDate' in d:
+		add('432=' + str(d['ExpireDate']))
+	if 'ExpireTime' in d:
+		add('126=' + str(d['ExpireTime']))
+	if 'MinQty' in d:
+		add('110=' + str(d['MinQty']))
+	if 'ExecInst' in d:
+		add('18=' + str(d['ExecInst']))
+	if 'SellerDays' in d:
+		add('287=' + str(d['SellerDays']))
+	if 'OrderID' in d:
+		add('37=' + str(d['OrderID']))
+	if 'QuoteEntryID' in d:
+		add('299=' + str(d['QuoteEntryID']))
+	if 'MDEntryBuyer' in d:
+		add('288=' + str(d['MDEntryBuyer']))
+	if 'MDEntrySeller' in d:
+		add('289=' + str(d['MDEntrySeller']))
+	if 'NumberOfOrders' in d:
+		add('346=' + str(d['NumberOfOrders']))
+	if 'MDEntryPositionNo' in d:
+		add('290=' + str(d['MDEntryPositionNo']))
+	if 'Scope' in d:
+		add('546=' + str(d['Scope']))
+	if 'PriceDelta' in d:
+		add('811=' + str(d['PriceDelta']))
+	if 'NetChgPrevDay' in d:
+		add('451=' + str(d['NetChgPrevDay']))
+	if 'Text' in d:
+		add('58=' + str(d['Text']))
+	if 'EncodedTextLen' in d:
+		add('354=' + str(d['EncodedTextLen']))
+	if 'EncodedText' in d:
+		add('355=' + str(d['EncodedText']))
+
+def _decode_grp_NoMDEntries(fields, index, context, nentries):
+	entries = []
+	entry = FixObject(context)
+	d = entry.__dict__
+	start = index
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _grp_NoMDEntries_tags.get(num)
+		if spec is None:
+			break
+		name, pytype, decode_grp = spec
+		if name in d:
+			# repeating group
+			entries.append(entry)
+			entry = FixObject(context)
+			d = entry.__dict__
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	if index > start:
+		entries.append(entry)
+	_check_group(268, nentries, entries)
+	return entries, index
+
+def _encode_grp_NoMDEntryTypes(entry, fixm):
+	d = entry.__dict__
+	add = fixm.append
+	if 'MDEntryType' in d:
+		add('269=' + str(d['MDEntryType']))
+
+def _decode_grp_NoMDEntryTypes(fields, index, context, nentries):
+	entries = []
+	entry = FixObject(context)
+	d = entry.__dict__
+	start = index
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _grp_NoMDEntryTypes_tags.get(num)
+		if spec is None:
+			break
+		name, pytype, decode_grp = spec
+		if name in d:
+			# repeating group
+			entries.append(entry)
+			entry = FixObject(context)
+			d = entry.__dict__
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	if index > start:
+		entries.append(entry)
+	_check_group(267, nentries, entries)
+	return entries, index
+
+def _encode_grp_NoMiscFees(entry, fixm):
+	d = entry.__dict__
+	add = fixm.append
+	if 'MiscFeeAmt' in d:
+		add('137=' + str(d['MiscFeeAmt']))
+	if 'MiscFeeCurr' in d:
+		add('138=' + str(d['MiscFeeCurr']))
+	if 'MiscFeeType' in d:
+		add('139=' + str(d['MiscFeeType']))
+	if 'MiscFeeBasis' in d:
+		add('891=' + str(d['MiscFeeBasis']))
+
+def _decode_grp_NoMiscFees(fields, index, context, nentries):
+	entries = []
+	entry = FixObject(context)
+	d = entry.__dict__
+	start = index
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _grp_NoMiscFees_tags.get(num)
+		if spec is None:
+			break
+		name, pytype, decode_grp = spec
+		if name in d:
+			# repeating group
+			entries.append(entry)
+			entry = FixObject(context)
+			d = entry.__dict__
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	if index > start:
+		entries.append(entry)
+	_check_group(136, nentries, entries)
+	return entries, index
+
+def _encode_grp_NoMsgTypes(entry, fixm):
+	d = entry.__dict__
+	add = fixm.append
+	if 'RefMsgType' in d:
+		add('372=' + str(d['RefMsgType']))
+	if 'MsgDirection' in d:
+		add('385=' + str(d['MsgDirection']))
+
+def _decode_grp_NoMsgTypes(fields, index, context, nentries):
+	entries = []
+	entry = FixObject(context)
+	d = entry.__dict__
+	start = index
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _grp_NoMsgTypes_tags.get(num)
+		if spec is None:
+			break
+		name, pytype, decode_grp = spec
+		if name in d:
+			# repeating group
+			entries.append(entry)
+			entry = FixObject(context)
+			d = entry.__dict__
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	if index > start:
+		entries.append(entry)
+	_check_group(384, nentries, entries)
+	return entries, index
+
+def _encode_grp_NoNested2PartyIDs(entry, fixm):
+	d = entry.__dict__
+	add = fixm.append
+	if 'Nested2PartyID' in d:
+		add('757=' + str(d['Nested2PartyID']))
+	if 'Nested2PartyIDSource' in d:
+		add('758=' + str(d['Nested2PartyIDSource']))
+	if 'Nested2PartyRole' in d:
+		add('759=' + str(d['Nested2PartyRole']))
+	if 'NoNested2PartySubIDs' in d:
+		grp = d['NoNested2PartySubIDs']
+		add('806=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoNested2PartySubIDs(entry, fixm)
+
+def _decode_grp_NoNested2PartyIDs(fields, index, context, nentries):
+	entries = []
+	entry = FixObject(context)
+	d = entry.__dict__
+	start = index
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _grp_NoNested2PartyIDs_tags.get(num)
+		if spec is None:
+			break
+		name, pytype, decode_grp = spec
+		if name in d:
+			# repeating group
+			entries.append(entry)
+			entry = FixObject(context)
+			d = entry.__dict__
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	if index > start:
+		entries.append(entry)
+	_check_group(756, nentries, entries)
+	return entries, index
+
+def _encode_grp_NoNested2PartySubIDs(entry, fixm):
+	d = entry.__dict__
+	add = fixm.append
+	if 'Nested2PartySubID' in d:
+		add('760=' + str(d['Nested2PartySubID']))
+	if 'Nested2PartySubIDType' in d:
+		add('807=' + str(d['Nested2PartySubIDType']))
+
+def _decode_grp_NoNested2PartySubIDs(fields, index, context, nentries):
+	entries = []
+	entry = FixObject(context)
+	d = entry.__dict__
+	start = index
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _grp_NoNested2PartySubIDs_tags.get(num)
+		if spec is None:
+			break
+		name, pytype, decode_grp = spec
+		if name in d:
+			# repeating group
+			entries.append(entry)
+			entry = FixObject(context)
+			d = entry.__dict__
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	if index > start:
+		entries.append(entry)
+	_check_group(806, nentries, entries)
+	return entries, index
+
+def _encode_grp_NoNested3PartyIDs(entry, fixm):
+	d = entry.__dict__
+	add = fixm.append
+	if 'Nested3PartyID' in d:
+		add('949=' + str(d['Nested3PartyID']))
+	if 'Nested3PartyIDSource' in d:
+		add('950=' + str(d['Nested3PartyIDSource']))
+	if 'Nested3PartyRole' in d:
+		add('951=' + str(d['Nested3PartyRole']))
+	if 'NoNested3PartySubIDs' in d:
+		grp = d['NoNested3PartySubIDs']
+		add('952=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoNested3PartySubIDs(entry, fixm)
+
+def _decode_grp_NoNested3PartyIDs(fields, index, context, nentries):
+	entries = []
+	entry = FixObject(context)
+	d = entry.__dict__
+	start = index
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _grp_NoNested3PartyIDs_tags.get(num)
+		if spec is None:
+			break
+		name, pytype, decode_grp = spec
+		if name in d:
+			# repeating group
+			entries.append(entry)
+			entry = FixObject(context)
+			d = entry.__dict__
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	if index > start:
+		entries.append(entry)
+	_check_group(948, nentries, entries)
+	return entries, index
+
+def _encode_grp_NoNested3PartySubIDs(entry, fixm):
+	d = entry.__dict__
+	add = fixm.append
+	if 'Nested3PartySubID' in d:
+		add('953=' + str(d['Nested3PartySubID']))
+	if 'Nested3PartySubIDType' in d:
+		add('954=' + str(d['Nested3PartySubIDType']))
+
+def _decode_grp_NoNested3PartySubIDs(fields, index, context, nentries):
+	entries = []
+	entry = FixObject(context)
+	d = entry.__dict__
+	start = index
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _grp_NoNested3PartySubIDs_tags.get(num)
+		if spec is None:
+			break
+		name, pytype, decode_grp = spec
+		if name in d:
+			# repeating group
+			entries.append(entry)
+			entry = FixObject(context)
+			d = entry.__dict__
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	if index > start:
+		entries.append(entry)
+	_check_group(952, nentries, entries)
+	return entries, index
+
+def _encode_grp_NoNestedPartyIDs(entry, fixm):
+	d = entry.__dict__
+	add = fixm.append
+	if 'NestedPartyID' in d:
+		add('524=' + str(d['NestedPartyID']))
+	if 'NestedPartyIDSource' in d:
+		add('525=' + str(d['NestedPartyIDSource']))
+	if 'NestedPartyRole' in d:
+		add('538=' + str(d['NestedPartyRole']))
+	if 'NoNestedPartySubIDs' in d:
+		grp = d['NoNestedPartySubIDs']
+		add('804=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoNestedPartySubIDs(entry, fixm)
+
+def _decode_grp_NoNestedPartyIDs(fields, index, context, nentries):
+	entries = []
+	entry = FixObject(context)
+	d = entry.__dict__
+	start = index
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _grp_NoNestedPartyIDs_tags.get(num)
+		if spec is None:
+			break
+		name, pytype, decode_grp = spec
+		if name in d:
+			# repeating group
+			entries.append(entry)
+			entry = FixObject(context)
+			d = entry.__dict__
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	if index > start:
+		entries.append(entry)
+	_check_group(539, nentries, entries)
+	return entries, index
+
+def _encode_grp_NoNestedPartySubIDs(entry, fixm):
+	d = entry.__dict__
+	add = fixm.append
+	if 'NestedPartySubID' in d:
+		add('545=' + str(d['NestedPartySubID']))
+	if 'NestedPartySubIDType' in d:
+		add('805=' + str(d['NestedPartySubIDType']))
+
+def _decode_grp_NoNestedPartySubIDs(fields, index, context, nentries):
+	entries = []
+	entry = FixObject(context)
+	d = entry.__dict__
+	start = index
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _grp_NoNestedPartySubIDs_tags.get(num)
+		if spec is None:
+			break
+		name, pytype, decode_grp = spec
+		if name in d:
+			# repeating group
+			entries.append(entry)
+			entry = FixObject(context)
+			d = entry.__dict__
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	if index > start:
+		entries.append(entry)
+	_check_group(804, nentries, entries)
+	return entries, index
+
+def _encode_grp_NoOrders(entry, fixm):
+	d = entry.__dict__
+	add = fixm.append
+	if 'ClOrdID' in d:
+		add('11=' + str(d['ClOrdID']))
+	if 'OrderID' in d:
+		add('37=' + str(d['OrderID']))
+	if 'SecondaryOrderID' in d:
+		add('198=' + str(d['SecondaryOrderID']))
+	if 'SecondaryClOrdID' in d:
+		add('526=' + str(d['SecondaryClOrdID']))
+	if 'ListID' in d:
+		add('66=' + str(d['ListID']))
+	if 'NoNested2PartyIDs' in d:
+		grp = d['NoNested2PartyIDs']
+		add('756=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoNested2PartyIDs(entry, fixm)
+	if 'OrderQty' in d:
+		add('38=' + str(d['OrderQty']))
+	if 'OrderAvgPx' in d:
+		add('799=' + str(d['OrderAvgPx']))
+	if 'OrderBookingQty' in d:
+		add('800=' + str(d['OrderBookingQty']))
+
+def _decode_grp_NoOrders(fields, index, context, nentries):
+	entries = []
+	entry = FixObject(context)
+	d = entry.__dict__
+	start = index
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _grp_NoOrders_tags.get(num)
+		if spec is None:
+			break
+		name, pytype, decode_grp = spec
+		if name in d:
+			# repeating group
+			entries.append(entry)
+			entry = FixObject(context)
+			d = entry.__dict__
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	if index > start:
+		entries.append(entry)
+	_check_group(73, nentries, entries)
+	return entries, index
+
+def _encode_grp_NoPartyIDs(entry, fixm):
+	d = entry.__dict__
+	add = fixm.append
+	if 'PartyID' in d:
+		add('448=' + str(d['PartyID']))
+	if 'PartyIDSource' in d:
+		add('447=' + str(d['PartyIDSource']))
+	if 'PartyRole' in d:
+		add('452=' + str(d['PartyRole']))
+	if 'NoPartySubIDs' in d:
+		grp = d['NoPartySubIDs']
+		add('802=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoPartySubIDs(entry, fixm)
+
+def _decode_grp_NoPartyIDs(fields, index, context, nentries):
+	entries = []
+	entry = FixObject(context)
+	d = entry.__dict__
+	start = index
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _grp_NoPartyIDs_tags.get(num)
+		if spec is None:
+			break
+		name, pytype, decode_grp = spec
+		if name in d:
+			# repeating group
+			entries.append(entry)
+			entry = FixObject(context)
+			d = entry.__dict__
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	if index > start:
+		entries.append(entry)
+	_check_group(453, nentries, entries)
+	return entries, index
+
+def _encode_grp_NoPartySubIDs(entry, fixm):
+	d = entry.__dict__
+	add = fixm.append
+	if 'PartySubID' in d:
+		add('523=' + str(d['PartySubID']))
+	if 'PartySubIDType' in d:
+		add('803=' + str(d['PartySubIDType']))
+
+def _decode_grp_NoPartySubIDs(fields, index, context, nentries):
+	entries = []
+	entry = FixObject(context)
+	d = entry.__dict__
+	start = index
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _grp_NoPartySubIDs_tags.get(num)
+		if spec is None:
+			break
+		name, pytype, decode_grp = spec
+		if name in d:
+			# repeating group
+			entries.append(entry)
+			entry = FixObject(context)
+			d = entry.__dict__
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	if index > start:
+		entries.append(entry)
+	_check_group(802, nentries, entries)
+	return entries, index
+
+def _encode_grp_NoPosAmt(entry, fixm):
+	d = entry.__dict__
+	add = fixm.append
+	if 'PosAmtType' in d:
+		add('707=' + str(d['PosAmtType']))
+	if 'PosAmt' in d:
+		add('708=' + str(d['PosAmt']))
+
+def _decode_grp_NoPosAmt(fields, index, context, nentries):
+	entries = []
+	entry = FixObject(context)
+	d = entry.__dict__
+	start = index
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _grp_NoPosAmt_tags.get(num)
+		if spec is None:
+			break
+		name, pytype, decode_grp = spec
+		if name in d:
+			# repeating group
+			entries.append(entry)
+			entry = FixObject(context)
+			d = entry.__dict__
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	if index > start:
+		entries.append(entry)
+	_check_group(753, nentries, entries)
+	return entries, index
+
+def _encode_grp_NoPositions(entry, fixm):
+	d = entry.__dict__
+	add = fixm.append
+	if 'PosType' in d:
+		add('703=' + str(d['PosType']))
+	if 'LongQty' in d:
+		add('704=' + str(d['LongQty']))
+	if 'ShortQty' in d:
+		add('705=' + str(d['ShortQty']))
+	if 'PosQtyStatus' in d:
+		add('706=' + str(d['PosQtyStatus']))
+	if 'NoNestedPartyIDs' in d:
+		grp = d['NoNestedPartyIDs']
+		add('539=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoNestedPartyIDs(entry, fixm)
+
+def _decode_grp_NoPositions(fields, index, context, nentries):
+	entries = []
+	entry = FixObject(context)
+	d = entry.__dict__
+	start = index
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _grp_NoPositions_tags.get(num)
+		if spec is None:
+			break
+		name, pytype, decode_grp = spec
+		if name in d:
+			# repeating group
+			entries.append(entry)
+			entry = FixObject(context)
+			d = entry.__dict__
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	if index > start:
+		entries.append(entry)
+	_check_group(702, nentries, entries)
+	return entries, index
+
+def _encode_grp_NoQuoteEntries(entry, fixm):
+	d = entry.__dict__
+	add = fixm.append
+	if 'QuoteEntryID' in d:
+		add('299=' + str(d['QuoteEntryID']))
+	if 'Symbol' in d:
+		add('55=' + str(d['Symbol']))
+	if 'SymbolSfx' in d:
+		add('65=' + str(d['SymbolSfx']))
+	if 'SecurityID' in d:
+		add('48=' + str(d['SecurityID']))
+	if 'SecurityIDSource' in d:
+		add('22=' + str(d['SecurityIDSource']))
+	if 'NoSecurityAltID' in d:
+		grp = d['NoSecurityAltID']
+		add('454=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoSecurityAltID(entry, fixm)
+	if 'Product' in d:
+		add('460=' + str(d['Product']))
+	if 'CFICode' in d:
+		add('461=' + str(d['CFICode']))
+	if 'SecurityType' in d:
+		add('167=' + str(d['SecurityType']))
+	if 'SecuritySubType' in d:
+		add('762=' + str(d['SecuritySubType']))
+	if 'MaturityMonthYear' in d:
+		add('200=' + str(d['MaturityMonthYear']))
+	if 'MaturityDate' in d:
+		add('541=' + str(d['MaturityDate']))
+	if 'CouponPaymentDate' in d:
+		add('224=' + str(d['CouponPaymentDate']))
+	if 'IssueDate' in d:
+		add('225=' + str(d['IssueDate']))
+	if 'RepoCollateralSecurityType' in d:
+		add('239=' + str(d['RepoCollateralSecurityType']))
+	if 'RepurchaseTerm' in d:
+		add('226=' + str(d['RepurchaseTerm']))
+	if 'RepurchaseRate' in d:
+		add('227=' + str(d['RepurchaseRate']))
+	if 'Factor' in d:
+		add('228=' + str(d['Factor']))
+	if 'CreditRating' in d:
+		add('255=' + str(d['CreditRating']))
+	if 'InstrRegistry' in d:
+		add('543=' + str(d['InstrRegistry']))
+	if 'CountryOfIssue' in d:
+		add('470=' + str(d['CountryOfIssue']))
+	if 'StateOrProvinceOfIssue' in d:
+		add('471=' + str(d['StateOrProvinceOfIssue']))
+	if 'LocaleOfIssue' in d:
+		add('472=' + str(d['LocaleOfIssue']))
+	if 'RedemptionDate' in d:
+		add('240=' + str(d['RedemptionDate']))
+	if 'StrikePrice' in d:
+		add('202=' + str(d['StrikePrice']))
+	if 'StrikeCurrency' in d:
+		add('947=' + str(d['StrikeCurrency']))
+	if 'OptAttribute' in d:
+		add('206=' + str(d['OptAttribute']))
+	if 'ContractMultiplier' in d:
+		add('231=' + str(d['ContractMultiplier']))
+	if 'CouponRate' in d:
+		add('223=' + str(d['CouponRate']))
+	if 'SecurityExchange' in d:
+		add('207=' + str(d['SecurityExchange']))
+	if 'Issuer' in d:
+		add('106=' + str(d['Issuer']))
+	if 'EncodedIssuerLen' in d:
+		add('348=' + str(d['EncodedIssuerLen']))
+	if 'EncodedIssuer' in d:
+		add('349=' + str(d['EncodedIssuer']))
+	if 'SecurityDesc' in d:
+		add('107=' + str(d['SecurityDesc']))
+	if 'EncodedSecurityDescLen' in d:
+		add('350=' + str(d['EncodedSecurityDescLen']))
+	if 'EncodedSecurityDesc' in d:
+		add('351=' + str(d['EncodedSecurityDesc']))
+	if 'Pool' in d:
+		add('691=' + str(d['Pool']))
+	if 'ContractSettlMonth' in d:
+		add('667=' + str(d['ContractSettlMonth']))
+	if 'CPProgram' in d:
+		add('875=' + str(d['CPProgram']))
+	if 'CPRegType' in d:
+		add('876=' + str(d['CPRegType']))
+	if 'NoEvents' in d:
+		grp = d['NoEvents']
+		add('864=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoEvents(entry, fixm)
+	if 'DatedDate' in d:
+		add('873=' + str(d['DatedDate']))
+	if 'InterestAccrualDate' in d:
+		add('874=' + str(d['InterestAccrualDate']))
+	if 'NoLegs' in d:
+		grp = d['NoLegs']
+		add('555=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoLegs(entry, fixm)
+	if 'BidPx' in d:
+		add('132=' + str(d['BidPx']))
+	if 'OfferPx' in d:
+		add('133=' + str(d['OfferPx']))
+	if 'BidSize' in d:
+		add('134=' + str(d['BidSize']))
+	if 'OfferSize' in d:
+		add('135=' + str(d['OfferSize']))
+	if 'ValidUntilTime' in d:
+		add('62=' + str(d['ValidUntilTime']))
+	if 'BidSpotRate' in d:
+		add('188=' + str(d['BidSpotRate']))
+	if 'OfferSpotRate' in d:
+		add('190=' + str(d['OfferSpotRate']))
+	if 'BidForwardPoints' in d:
+		add('189=' + str(d['BidForwardPoints']))
+	if 'OfferForwardPoints' in d:
+		add('191=' + str(d['OfferForwardPoints']))
+	if 'MidPx' in d:
+		add('631=' + str(d['MidPx']))
+	if 'BidYield' in d:
+		add('632=' + str(d['BidYield']))
+	if 'MidYield' in d:
+		add('633=' + str(d['MidYield']))
+	if 'OfferYield' in d:
+		add('634=' + str(d['OfferYield']))
+	if 'TransactTime' in d:
+		add('60=' + str(d['TransactTime']))
+	if 'TradingSessionID' in d:
+		add('336=' + str(d['TradingSessionID']))
+	if 'TradingSessionSubID' in d:
+		add('625=' + str(d['TradingSessionSubID']))
+	if 'SettlDate' in d:
+		add('64=' + str(d['SettlDate']))
+	if 'OrdType' in d:
+		add('40=' + str(d['OrdType']))
+	if 'SettlDate2' in d:
+		add('193=' + str(d['SettlDate2']))
+	if 'OrderQty2' in d:
+		add('192=' + str(d['OrderQty2']))
+	if 'BidForwardPoints2' in d:
+		add('642=' + str(d['BidForwardPoints2']))
+	if 'OfferForwardPoints2' in d:
+		add('643=' + str(d['OfferForwardPoints2']))
+	if 'Currency' in d:
+		add('15=' + str(d['Currency']))
+	if 'QuoteEntryRejectReason' in d:
+		add('368=' + str(d['QuoteEntryRejectReason']))
+
+def _decode_grp_NoQuoteEntries(fields, index, context, nentries):
+	entries = []
+	entry = FixObject(context)
+	d = entry.__dict__
+	start = index
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _grp_NoQuoteEntries_tags.get(num)
+		if spec is None:
+			break
+		name, pytype, decode_grp = spec
+		if name in d:
+			# repeating group
+			entries.append(entry)
+			entry = FixObject(context)
+			d = entry.__dict__
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	if index > start:
+		entries.append(entry)
+	_check_group(295, nentries, entries)
+	return entries, index
+
+def _encode_grp_NoQuoteQualifiers(entry, fixm):
+	d = entry.__dict__
+	add = fixm.append
+	if 'QuoteQualifier' in d:
+		add('695=' + str(d['QuoteQualifier']))
+
+def _decode_grp_NoQuoteQualifiers(fields, index, context, nentries):
+	entries = []
+	entry = FixObject(context)
+	d = entry.__dict__
+	start = index
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _grp_NoQuoteQualifiers_tags.get(num)
+		if spec is None:
+			break
+		name, pytype, decode_grp = spec
+		if name in d:
+			# repeating group
+			entries.append(entry)
+			entry = FixObject(context)
+			d = entry.__dict__
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	if index > start:
+		entries.append(entry)
+	_check_group(735, nentries, entries)
+	return entries, index
+
+def _encode_grp_NoQuoteSets(entry, fixm):
+	d = entry.__dict__
+	add = fixm.append
+	if 'QuoteSetID' in d:
+		add('302=' + str(d['QuoteSetID']))
+	if 'UnderlyingSymbol' in d:
+		add('311=' + str(d['UnderlyingSymbol']))
+	if 'UnderlyingSymbolSfx' in d:
+		add('312=' + str(d['UnderlyingSymbolSfx']))
+	if 'UnderlyingSecurityID' in d:
+		add('309=' + str(d['UnderlyingSecurityID']))
+	if 'UnderlyingSecurityIDSource' in d:
+		add('305=' + str(d['UnderlyingSecurityIDSource']))
+	if 'NoUnderlyingSecurityAltID' in d:
+		grp = d['NoUnderlyingSecurityAltID']
+		add('457=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoUnderlyingSecurityAltID(entry, fixm)
+	if 'UnderlyingProduct' in d:
+		add('462=' + str(d['UnderlyingProduct']))
+	if 'UnderlyingCFICode' in d:
+		add('463=' + str(d['UnderlyingCFICode']))
+	if 'UnderlyingSecurityType' in d:
+		add('310=' + str(d['UnderlyingSecurityType']))
+	if 'UnderlyingSecuritySubType' in d:
+		add('763=' + str(d['UnderlyingSecuritySubType']))
+	if 'UnderlyingMaturityMonthYear' in d:
+		add('313=' + str(d['UnderlyingMaturityMonthYear']))
+	if 'UnderlyingMaturityDate' in d:
+		add('542=' + str(d['UnderlyingMaturityDate']))
+	if 'UnderlyingCouponPaymentDate' in d:
+		add('241=' + str(d['UnderlyingCouponPaymentDate']))
+	if 'UnderlyingIssueDate' in d:
+		add('242=' + str(d['UnderlyingIssueDate']))
+	if 'UnderlyingRepoCollateralSecurityType' in d:
+		add('243=' + str(d['UnderlyingRepoCollateralSecurityType']))
+	if 'UnderlyingRepurchaseTerm' in d:
+		add('244=' + str(d['UnderlyingRepurchaseTerm']))
+	if 'UnderlyingRepurchaseRate' in d:
+		add('245=' + str(d['UnderlyingRepurchaseRate']))
+	if 'UnderlyingFactor' in d:
+		add('246=' + str(d['UnderlyingFactor']))
+	if 'UnderlyingCreditRating' in d:
+		add('256=' + str(d['UnderlyingCreditRating']))
+	if 'UnderlyingInstrRegistry' in d:
+		add('595=' + str(d['UnderlyingInstrRegistry']))
+	if 'UnderlyingCountryOfIssue' in d:
+		add('592=' + str(d['UnderlyingCountryOfIssue']))
+	if 'UnderlyingStateOrProvinceOfIssue' in d:
+		add('593=' + str(d['UnderlyingStateOrProvinceOfIssue']))
+	if 'UnderlyingLocaleOfIssue' in d:
+		add('594=' + str(d['UnderlyingLocaleOfIssue']))
+	if 'UnderlyingRedemptionDate' in d:
+		add('247=' + str(d['UnderlyingRedemptionDate']))
+	if 'UnderlyingStrikePrice' in d:
+		add('316=' + str(d['UnderlyingStrikePrice']))
+	if 'UnderlyingStrikeCurrency' in d:
+		add('941=' + str(d['UnderlyingStrikeCurrency']))
+	if 'UnderlyingOptAttribute' in d:
+		add('317=' + str(d['UnderlyingOptAttribute']))
+	if 'UnderlyingContractMultiplier' in d:
+		add('436=' + str(d['UnderlyingContractMultiplier']))
+	if 'UnderlyingCouponRate' in d:
+		add('435=' + str(d['UnderlyingCouponRate']))
+	if 'UnderlyingSecurityExchange' in d:
+		add('308=' + str(d['UnderlyingSecurityExchange']))
+	if 'UnderlyingIssuer' in d:
+		add('306=' + str(d['UnderlyingIssuer']))
+	if 'EncodedUnderlyingIssuerLen' in d:
+		add('362=' + str(d['EncodedUnderlyingIssuerLen']))
+	if 'EncodedUnderlyingIssuer' in d:
+		add('363=' + str(d['EncodedUnderlyingIssuer']))
+	if 'UnderlyingSecurityDesc' in d:
+		add('307=' + str(d['UnderlyingSecurityDesc']))
+	if 'EncodedUnderlyingSecurityDescLen' in d:
+		add('364=' + str(d['EncodedUnderlyingSecurityDescLen']))
+	if 'EncodedUnderlyingSecurityDesc' in d:
+		add('365=' + str(d['EncodedUnderlyingSecurityDesc']))
+	if 'UnderlyingCPProgram' in d:
+		add('877=' + str(d['UnderlyingCPProgram']))
+	if 'UnderlyingCPRegType' in d:
+		add('878=' + str(d['UnderlyingCPRegType']))
+	if 'UnderlyingCurrency' in d:
+		add('318=' + str(d['UnderlyingCurrency']))
+	if 'UnderlyingQty' in d:
+		add('879=' + str(d['UnderlyingQty']))
+	if 'UnderlyingPx' in d:
+		add('810=' + str(d['UnderlyingPx']))
+	if 'UnderlyingDirtyPrice' in d:
+		add('882=' + str(d['UnderlyingDirtyPrice']))
+	if 'UnderlyingEndPrice' in d:
+		add('883=' + str(d['UnderlyingEndPrice']))
+	if 'UnderlyingStartValue' in d:
+		add('884=' + str(d['UnderlyingStartValue']))
+	if 'UnderlyingCurrentValue' in d:
+		add('885=' + str(d['UnderlyingCurrentValue']))
+	if 'UnderlyingEndValue' in d:
+		add('886=' + str(d['UnderlyingEndValue']))
+	if 'NoUnderlyingStips' in d:
+		grp = d['NoUnderlyingStips']
+		add('887=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoUnderlyingStips(entry, fixm)
+	if 'TotNoQuoteEntries' in d:
+		add('304=' + str(d['TotNoQuoteEntries']))
+	if 'LastFragment' in d:
+		add('893=' + str(d['LastFragment']))
+	if 'NoQuoteEntries' in d:
+		grp = d['NoQuoteEntries']
+		add('295=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoQuoteEntries(entry, fixm)
+
+def _decode_grp_NoQuoteSets(fields, index, context, nentries):
+	entries = []
+	entry = FixObject(context)
+	d = entry.__dict__
+	start = index
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _grp_NoQuoteSets_tags.get(num)
+		if spec is None:
+			break
+		name, pytype, decode_grp = spec
+		if name in d:
+			# repeating group
+			entries.append(entry)
+			entry = FixObject(context)
+			d = entry.__dict__
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	if index > start:
+		entries.append(entry)
+	_check_group(296, nentries, entries)
+	return entries, index
+
+def _encode_grp_NoRegistDtls(entry, fixm):
+	d = entry.__dict__
+	add = fixm.append
+	if 'RegistDtls' in d:
+		add('509=' + str(d['RegistDtls']))
+	if 'RegistEmail' in d:
+		add('511=' + str(d['RegistEmail']))
+	if 'MailingDtls' in d:
+		add('474=' + str(d['MailingDtls']))
+	if 'MailingInst' in d:
+		add('482=' + str(d['MailingInst']))
+	if 'NoNestedPartyIDs' in d:
+		grp = d['NoNestedPartyIDs']
+		add('539=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoNestedPartyIDs(entry, fixm)
+	if 'OwnerType' in d:
+		add('522=' + str(d['OwnerType']))
+	if 'DateOfBirth' in d:
+		add('486=' + str(d['DateOfBirth']))
+	if 'InvestorCountryOfResidence' in d:
+		add('475=' + str(d['InvestorCountryOfResidence']))
+
+def _decode_grp_NoRegistDtls(fields, index, context, nentries):
+	entries = []
+	entry = FixObject(context)
+	d = entry.__dict__
+	start = index
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _grp_NoRegistDtls_tags.get(num)
+		if spec is None:
+			break
+		name, pytype, decode_grp = spec
+		if name in d:
+			# repeating group
+			entries.append(entry)
+			entry = FixObject(context)
+			d = entry.__dict__
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	if index > start:
+		entries.append(entry)
+	_check_group(473, nentries, entries)
+	return entries, index
+
+def _encode_grp_NoRelatedSym(entry, fixm):
+	d = entry.__dict__
+	add = fixm.append
+	if 'Symbol' in d:
+		add('55=' + str(d['Symbol']))
+	if 'SymbolSfx' in d:
+		add('65=' + str(d['SymbolSfx']))
+	if 'SecurityID' in d:
+		add('48=' + str(d['SecurityID']))
+	if 'SecurityIDSource' in d:
+		add('22=' + str(d['SecurityIDSource']))
+	if 'NoSecurityAltID' in d:
+		grp = d['NoSecurityAltID']
+		add('454=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoSecurityAltID(entry, fixm)
+	if 'Product' in d:
+		add('460=' + str(d['Product']))
+	if 'CFICode' in d:
+		add('461=' + str(d['CFICode']))
+	if 'SecurityType' in d:
+		add('167=' + str(d['SecurityType']))
+	if 'SecuritySubType' in d:
+		add('762=' + str(d['SecuritySubType']))
+	if 'MaturityMonthYear' in d:
+		add('200=' + str(d['MaturityMonthYear']))
+	if 'MaturityDate' in d:
+		add('541=' + str(d['MaturityDate']))
+	if 'CouponPaymentDate' in d:
+		add('224=' + str(d['CouponPaymentDate']))
+	if 'IssueDate' in d:
+		add('225=' + str(d['IssueDate']))
+	if 'RepoCollateralSecurityType' in d:
+		add('239=' + str(d['RepoCollateralSecurityType']))
+	if 'RepurchaseTerm' in d:
+		add('226=' + str(d['RepurchaseTerm']))
+	if 'RepurchaseRate' in d:
+		add('227=' + str(d['RepurchaseRate']))
+	if 'Factor' in d:
+		add('228=' + str(d['Factor']))
+	if 'CreditRating' in d:
+		add('255=' + str(d['CreditRating']))
+	if 'InstrRegistry' in d:
+		add('543=' + str(d['InstrRegistry']))
+	if 'CountryOfIssue' in d:
+		add('470=' + str(d['CountryOfIssue']))
+	if 'StateOrProvinceOfIssue' in d:
+		add('471=' + str(d['StateOrProvinceOfIssue']))
+	if 'LocaleOfIssue' in d:
+		add('472=' + str(d['LocaleOfIssue']))
+	if 'RedemptionDate' in d:
+		add('240=' + str(d['RedemptionDate']))
+	if 'StrikePrice' in d:
+		add('202=' + str(d['StrikePrice']))
+	if 'StrikeCurrency' in d:
+		add('947=' + str(d['StrikeCurrency']))
+	if 'OptAttribute' in d:
+		add('206=' + str(d['OptAttribute']))
+	if 'ContractMultiplier' in d:
+		add('231=' + str(d['ContractMultiplier']))
+	if 'CouponRate' in d:
+		add('223=' + str(d['CouponRate']))
+	if 'SecurityExchange' in d:
+		add('207=' + str(d['SecurityExchange']))
+	if 'Issuer' in d:
+		add('106=' + str(d['Issuer']))
+	if 'EncodedIssuerLen' in d:
+		add('348=' + str(d['EncodedIssuerLen']))
+	if 'EncodedIssuer' in d:
+		add('349=' + str(d['EncodedIssuer']))
+	if 'SecurityDesc' in d:
+		add('107=' + str(d['SecurityDesc']))
+	if 'EncodedSecurityDescLen' in d:
+		add('350=' + str(d['EncodedSecurityDescLen']))
+	if 'EncodedSecurityDesc' in d:
+		add('351=' + str(d['EncodedSecurityDesc']))
+	if 'Pool' in d:
+		add('691=' + str(d['Pool']))
+	if 'ContractSettlMonth' in d:
+		add('667=' + str(d['ContractSettlMonth']))
+	if 'CPProgram' in d:
+		add('875=' + str(d['CPProgram']))
+	if 'CPRegType' in d:
+		add('876=' + str(d['CPRegType']))
+	if 'NoEvents' in d:
+		grp = d['NoEvents']
+		add('864=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoEvents(entry, fixm)
+	if 'DatedDate' in d:
+		add('873=' + str(d['DatedDate']))
+	if 'InterestAccrualDate' in d:
+		add('874=' + str(d['InterestAccrualDate']))
+	if 'Currency' in d:
+		add('15=' + str(d['Currency']))
+	if 'ExpirationCycle' in d:
+		add('827=' + str(d['ExpirationCycle']))
+	if 'DeliveryForm' in d:
+		add('668=' + str(d['DeliveryForm']))
+	if 'PctAtRisk' in d:
+		add('869=' + str(d['PctAtRisk']))
+	if 'NoInstrAttrib' in d:
+		grp = d['NoInstrAttrib']
+		add('870=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoInstrAttrib(entry, fixm)
+	if 'NoLegs' in d:
+		grp = d['NoLegs']
+		add('555=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoLegs(entry, fixm)
+	if 'TradingSessionID' in d:
+		add('336=' + str(d['TradingSessionID']))
+	if 'TradingSessionSubID' in d:
+		add('625=' + str(d['TradingSessionSubID']))
+	if 'Text' in d:
+		add('58=' + str(d['Text']))
+	if 'EncodedTextLen' in d:
+		add('354=' + str(d['EncodedTextLen']))
+	if 'EncodedText' in d:
+		add('355=' + str(d['EncodedText']))
+
+def _decode_grp_NoRelatedSym(fields, index, context, nentries):
+	entries = []
+	entry = FixObject(context)
+	d = entry.__dict__
+	start = index
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _grp_NoRelatedSym_tags.get(num)
+		if spec is None:
+			break
+		name, pytype, decode_grp = spec
+		if name in d:
+			# repeating group
+			entries.append(entry)
+			entry = FixObject(context)
+			d = entry.__dict__
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	if index > start:
+		entries.append(entry)
+	_check_group(146, nentries, entries)
+	return entries, index
+
+def _encode_grp_NoRoutingIDs(entry, fixm):
+	d = entry.__dict__
+	add = fixm.append
+	if 'RoutingType' in d:
+		add('216=' + str(d['RoutingType']))
+	if 'RoutingID' in d:
+		add('217=' + str(d['RoutingID']))
+
+def _decode_grp_NoRoutingIDs(fields, index, context, nentries):
+	entries = []
+	entry = FixObject(context)
+	d = entry.__dict__
+	start = index
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _grp_NoRoutingIDs_tags.get(num)
+		if spec is None:
+			break
+		name, pytype, decode_grp = spec
+		if name in d:
+			# repeating group
+			entries.append(entry)
+			entry = FixObject(context)
+			d = entry.__dict__
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	if index > start:
+		entries.append(entry)
+	_check_group(215, nentries, entries)
+	return entries, index
+
+def _encode_grp_NoSecurityAltID(entry, fixm):
+	d = entry.__dict__
+	add = fixm.append
+	if 'SecurityAltID' in d:
+		add('455=' + str(d['SecurityAltID']))
+	if 'SecurityAltIDSource' in d:
+		add('456=' + str(d['SecurityAltIDSource']))
+
+def _decode_grp_NoSecurityAltID(fields, index, context, nentries):
+	entries = []
+	entry = FixObject(context)
+	d = entry.__dict__
+	start = index
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _grp_NoSecurityAltID_tags.get(num)
+		if spec is None:
+			break
+		name, pytype, decode_grp = spec
+		if name in d:
+			# repeating group
+			entries.append(entry)
+			entry = FixObject(context)
+			d = entry.__dict__
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	if index > start:
+		entries.append(entry)
+	_check_group(454, nentries, entries)
+	return entries, index
+
+def _encode_grp_NoSecurityTypes(entry, fixm):
+	d = entry.__dict__
+	add = fixm.append
+	if 'SecurityType' in d:
+		add('167=' + str(d['SecurityType']))
+	if 'SecuritySubType' in d:
+		add('762=' + str(d['SecuritySubType']))
+	if 'Product' in d:
+		add('460=' + str(d['Product']))
+	if 'CFICode' in d:
+		add('461=' + str(d['CFICode']))
+
+def _decode_grp_NoSecurityTypes(fields, index, context, nentries):
+	entries = []
+	entry = FixObject(context)
+	d = entry.__dict__
+	start = index
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _grp_NoSecurityTypes_tags.get(num)
+		if spec is None:
+			break
+		name, pytype, decode_grp = spec
+		if name in d:
+			# repeating group
+			entries.append(entry)
+			entry = FixObject(context)
+			d = entry.__dict__
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	if index > start:
+		entries.append(entry)
+	_check_group(558, nentries, entries)
+	return entries, index
+
+def _encode_grp_NoSettlInst(entry, fixm):
+	d = entry.__dict__
+	add = fixm.append
+	if 'SettlInstID' in d:
+		add('162=' + str(d['SettlInstID']))
+	if 'SettlInstTransType' in d:
+		add('163=' + str(d['SettlInstTransType']))
+	if 'SettlInstRefID' in d:
+		add('214=' + str(d['SettlInstRefID']))
+	if 'NoPartyIDs' in d:
+		grp = d['NoPartyIDs']
+		add('453=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoPartyIDs(entry, fixm)
+	if 'Side' in d:
+		add('54=' + str(d['Side']))
+	if 'Product' in d:
+		add('460=' + str(d['Product']))
+	if 'SecurityType' in d:
+		add('167=' + str(d['SecurityType']))
+	if 'CFICode' in d:
+		add('461=' + str(d['CFICode']))
+	if 'EffectiveTime' in d:
+		add('168=' + str(d['EffectiveTime']))
+	if 'ExpireTime' in d:
+		add('126=' + str(d['ExpireTime']))
+	if 'LastUpdateTime' in d:
+		add('779=' + str(d['LastUpdateTime']))
+	if 'SettlDeliveryType' in d:
+		add('172=' + str(d['SettlDeliveryType']))
+	if 'StandInstDbType' in d:
+		add('169=' + str(d['StandInstDbType']))
+	if 'StandInstDbName' in d:
+		add('170=' + str(d['StandInstDbName']))
+	if 'StandInstDbID' in d:
+		add('171=' + str(d['StandInstDbID']))
+	if 'NoDlvyInst' in d:
+		grp = d['NoDlvyInst']
+		add('85=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoDlvyInst(entry, fixm)
+	if 'PaymentMethod' in d:
+		add('492=' + str(d['PaymentMethod']))
+	if 'PaymentRef' in d:
+		add('476=' + str(d['PaymentRef']))
+	if 'CardHolderName' in d:
+		add('488=' + str(d['CardHolderName']))
+	if 'CardNumber' in d:
+		add('489=' + str(d['CardNumber']))
+	if 'CardStartDate' in d:
+		add('503=' + str(d['CardStartDate']))
+	if 'CardExpDate' in d:
+		add('490=' + str(d['CardExpDate']))
+	if 'CardIssNum' in d:
+		add('491=' + str(d['CardIssNum']))
+	if 'PaymentDate' in d:
+		add('504=' + str(d['PaymentDate']))
+	if 'PaymentRemitterID' in d:
+		add('505=' + str(d['PaymentRemitterID']))
+
+def _decode_grp_NoSettlInst(fields, index, context, nentries):
+	entries = []
+	entry = FixObject(context)
+	d = entry.__dict__
+	start = index
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _grp_NoSettlInst_tags.get(num)
+		if spec is None:
+			break
+		name, pytype, decode_grp = spec
+		if name in d:
+			# repeating group
+			entries.append(entry)
+			entry = FixObject(context)
+			d = entry.__dict__
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	if index > start:
+		entries.append(entry)
+	_check_group(778, nentries, entries)
+	return entries, index
+
+def _encode_grp_NoSettlPartyIDs(entry, fixm):
+	d = entry.__dict__
+	add = fixm.append
+	if 'SettlPartyID' in d:
+		add('782=' + str(d['SettlPartyID']))
+	if 'SettlPartyIDSource' in d:
+		add('783=' + str(d['SettlPartyIDSource']))
+	if 'SettlPartyRole' in d:
+		add('784=' + str(d['SettlPartyRole']))
+	if 'NoSettlPartySubIDs' in d:
+		grp = d['NoSettlPartySubIDs']
+		add('801=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoSettlPartySubIDs(entry, fixm)
+
+def _decode_grp_NoSettlPartyIDs(fields, index, context, nentries):
+	entries = []
+	entry = FixObject(context)
+	d = entry.__dict__
+	start = index
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _grp_NoSettlPartyIDs_tags.get(num)
+		if spec is None:
+			break
+		name, pytype, decode_grp = spec
+		if name in d:
+			# repeating group
+			entries.append(entry)
+			entry = FixObject(context)
+			d = entry.__dict__
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	if index > start:
+		entries.append(entry)
+	_check_group(781, nentries, entries)
+	return entries, index
+
+def _encode_grp_NoSettlPartySubIDs(entry, fixm):
+	d = entry.__dict__
+	add = fixm.append
+	if 'SettlPartySubID' in d:
+		add('785=' + str(d['SettlPartySubID']))
+	if 'SettlPartySubIDType' in d:
+		add('786=' + str(d['SettlPartySubIDType']))
+
+def _decode_grp_NoSettlPartySubIDs(fields, index, context, nentries):
+	entries = []
+	entry = FixObject(context)
+	d = entry.__dict__
+	start = index
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _grp_NoSettlPartySubIDs_tags.get(num)
+		if spec is None:
+			break
+		name, pytype, decode_grp = spec
+		if name in d:
+			# repeating group
+			entries.append(entry)
+			entry = FixObject(context)
+			d = entry.__dict__
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	if index > start:
+		entries.append(entry)
+	_check_group(801, nentries, entries)
+	return entries, index
+
+def _encode_grp_NoSides(entry, fixm):
+	d = entry.__dict__
+	add = fixm.append
+	if 'Side' in d:
+		add('54=' + str(d['Side']))
+	if 'OrderID' in d:
+		add('37=' + str(d['OrderID']))
+	if 'SecondaryOrderID' in d:
+		add('198=' + str(d['SecondaryOrderID']))
+	if 'ClOrdID' in d:
+		add('11=' + str(d['ClOrdID']))
+	if 'SecondaryClOrdID' in d:
+		add('526=' + str(d['SecondaryClOrdID']))
+	if 'ListID' in d:
+		add('66=' + str(d['ListID']))
+	if 'NoPartyIDs' in d:
+		grp = d['NoPartyIDs']
+		add('453=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoPartyIDs(entry, fixm)
+	if 'Account' in d:
+		add('1=' + str(d['Account']))
+	if 'AcctIDSource' in d:
+		add('660=' + str(d['AcctIDSource']))
+	if 'AccountType' in d:
+		add('581=' + str(d['AccountType']))
+	if 'ProcessCode' in d:
+		add('81=' + str(d['ProcessCode']))
+	if 'OddLot' in d:
+		add('575=' + str(d['OddLot']))
+	if 'NoClearingInstructions' in d:
+		add('576=' + str(d['NoClearingInstructions']))
+	if 'ClearingFeeIndicator' in d:
+		add('635=' + str(d['ClearingFeeIndicator']))
+	if 'TradeInputSource' in d:
+		add('578=' + str(d['TradeInputSource']))
+	if 'TradeInputDevice' in d:
+		add('579=' + str(d['TradeInputDevice']))
+	if 'OrderInputDevice' in d:
+		add('821=' + str(d['OrderInputDevice']))
+	if 'Currency' in d:
+		add('15=' + str(d['Currency']))
+	if 'ComplianceID' in d:
+		add('376=' + str(d['ComplianceID']))
+	if 'SolicitedFlag' in d:
+		add('377=' + str(d['SolicitedFlag']))
+	if 'OrderCapacity' in d:
+		add('528=' + str(d['OrderCapacity']))
+	if 'OrderRestrictions' in d:
+		add('529=' + str(d['OrderRestrictions']))
+	if 'CustOrderCapacity' in d:
+		add('582=' + str(d['CustOrderCapacity']))
+	if 'OrdType' in d:
+		add('40=' + str(d['OrdType']))
+	if 'ExecInst' in d:
+		add('18=' + str(d['ExecInst']))
+	if 'TransBkdTime' in d:
+		add('483=' + str(d['TransBkdTime']))
+	if 'TradingSessionID' in d:
+		add('336=' + str(d['TradingSessionID']))
+	if 'TradingSessionSubID' in d:
+		add('625=' + str(d['TradingSessionSubID']))
+	if 'TimeBracket' in d:
+		add('943=' + str(d['TimeBracket']))
+	if 'Commission' in d:
+		add('12=' + str(d['Commission']))
+	if 'CommType' in d:
+		add('13=' + str(d['CommType']))
+	if 'CommCurrency' in d:
+		add('479=' + str(d['CommCurrency']))
+	if 'FundRenewWaiv' in d:
+		add('497=' + str(d['FundRenewWaiv']))
+	if 'GrossTradeAmt' in d:
+		add('381=' + str(d['GrossTradeAmt']))
+	if 'NumDaysInterest' in d:
+		add('157=' + str(d['NumDaysInterest']))
+	if 'ExDate' in d:
+		add('230=' + str(d['ExDate']))
+	if 'AccruedInterestRate' in d:
+		add('158=' + str(d['AccruedInterestRate']))
+	if 'AccruedInterestAmt' in d:
+		add('159=' + str(d['AccruedInterestAmt']))
+	if 'InterestAtMaturity' in d:
+		add('738=' + str(d['InterestAtMaturity']))
+	if 'EndAccruedInterestAmt' in d:
+		add('920=' + str(d['EndAccruedInterestAmt']))
+	if 'StartCash' in d:
+		add('921=' + str(d['StartCash']))
+	if 'EndCash' in d:
+		add('922=' + str(d['EndCash']))
+	if 'Concession' in d:
+		add('238=' + str(d['Concession']))
+	if 'TotalTakedown' in d:
+		add('237=' + str(d['TotalTakedown']))
+	if 'NetMoney' in d:
+		add('118=' + str(d['NetMoney']))
+	if 'SettlCurrAmt' in d:
+		add('119=' + str(d['SettlCurrAmt']))
+	if 'SettlCurrency' in d:
+		add('120=' + str(d['SettlCurrency']))
+	if 'SettlCurrFxRate' in d:
+		add('155=' + str(d['SettlCurrFxRate']))
+	if 'SettlCurrFxRateCalc' in d:
+		add('156=' + str(d['SettlCurrFxRateCalc']))
+	if 'PositionEffect' in d:
+		add('77=' + str(d['PositionEffect']))
+	if 'Text' in d:
+		add('58=' + str(d['Text']))
+	if 'EncodedTextLen' in d:
+		add('354=' + str(d['EncodedTextLen']))
+	if 'EncodedText' in d:
+		add('355=' + str(d['EncodedText']))
+	if 'SideMultiLegReportingType' in d:
+		add('752=' + str(d['SideMultiLegReportingType']))
+	if 'NoContAmts' in d:
+		grp = d['NoContAmts']
+		add('518=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoContAmts(entry, fixm)
+	if 'NoStipulations' in d:
+		grp = d['NoStipulations']
+		add('232=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoStipulations(entry, fixm)
+	if 'NoMiscFees' in d:
+		grp = d['NoMiscFees']
+		add('136=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoMiscFees(entry, fixm)
+	if 'ExchangeRule' in d:
+		add('825=' + str(d['ExchangeRule']))
+	if 'TradeAllocIndicator' in d:
+		add('826=' + str(d['TradeAllocIndicator']))
+	if 'PreallocMethod' in d:
+		add('591=' + str(d['PreallocMethod']))
+	if 'AllocID' in d:
+		add('70=' + str(d['AllocID']))
+	if 'NoAllocs' in d:
+		grp = d['NoAllocs']
+		add('78=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoAllocs(entry, fixm)
+
+def _decode_grp_NoSides(fields, index, context, nentries):
+	entries = []
+	entry = FixObject(context)
+	d = entry.__dict__
+	start = index
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _grp_NoSides_tags.get(num)
+		if spec is None:
+			break
+		name, pytype, decode_grp = spec
+		if name in d:
+			# repeating group
+			entries.append(entry)
+			entry = FixObject(context)
+			d = entry.__dict__
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	if index > start:
+		entries.append(entry)
+	_check_group(552, nentries, entries)
+	return entries, index
+
+def _encode_grp_NoStipulations(entry, fixm):
+	d = entry.__dict__
+	add = fixm.append
+	if 'StipulationType' in d:
+		add('233=' + str(d['StipulationType']))
+	if 'StipulationValue' in d:
+		add('234=' + str(d['StipulationValue']))
+
+def _decode_grp_NoStipulations(fields, index, context, nentries):
+	entries = []
+	entry = FixObject(context)
+	d = entry.__dict__
+	start = index
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _grp_NoStipulations_tags.get(num)
+		if spec is None:
+			break
+		name, pytype, decode_grp = spec
+		if name in d:
+			# repeating group
+			entries.append(entry)
+			entry = FixObject(context)
+			d = entry.__dict__
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	if index > start:
+		entries.append(entry)
+	_check_group(232, nentries, entries)
+	return entries, index
+
+def _encode_grp_NoStrikes(entry, fixm):
+	d = entry.__dict__
+	add = fixm.append
+	if 'Symbol' in d:
+		add('55=' + str(d['Symbol']))
+	if 'SymbolSfx' in d:
+		add('65=' + str(d['SymbolSfx']))
+	if 'SecurityID' in d:
+		add('48=' + str(d['SecurityID']))
+	if 'SecurityIDSource' in d:
+		add('22=' + str(d['SecurityIDSource']))
+	if 'NoSecurityAltID' in d:
+		grp = d['NoSecurityAltID']
+		add('454=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoSecurityAltID(entry, fixm)
+	if 'Product' in d:
+		add('460=' + str(d['Product']))
+	if 'CFICode' in d:
+		add('461=' + str(d['CFICode']))
+	if 'SecurityType' in d:
+		add('167=' + str(d['SecurityType']))
+	if 'SecuritySubType' in d:
+		add('762=' + str(d['SecuritySubType']))
+	if 'MaturityMonthYear' in d:
+		add('200=' + str(d['MaturityMonthYear']))
+	if 'MaturityDate' in d:
+		add('541=' + str(d['MaturityDate']))
+	if 'CouponPaymentDate' in d:
+		add('224=' + str(d['CouponPaymentDate']))
+	if 'IssueDate' in d:
+		add('225=' + str(d['IssueDate']))
+	if 'RepoCollateralSecurityType' in d:
+		add('239=' + str(d['RepoCollateralSecurityType']))
+	if 'RepurchaseTerm' in d:
+		add('226=' + str(d['RepurchaseTerm']))
+	if 'RepurchaseRate' in d:
+		add('227=' + str(d['RepurchaseRate']))
+	if 'Factor' in d:
+		add('228=' + str(d['Factor']))
+	if 'CreditRating' in d:
+		add('255=' + str(d['CreditRating']))
+	if 'InstrRegistry' in d:
+		add('543=' + str(d['InstrRegistry']))
+	if 'CountryOfIssue' in d:
+		add('470=' + str(d['CountryOfIssue']))
+	if 'StateOrProvinceOfIssue' in d:
+		add('471=' + str(d['StateOrProvinceOfIssue']))
+	if 'LocaleOfIssue' in d:
+		add('472=' + str(d['LocaleOfIssue']))
+	if 'RedemptionDate' in d:
+		add('240=' + str(d['RedemptionDate']))
+	if 'StrikePrice' in d:
+		add('202=' + str(d['StrikePrice']))
+	if 'StrikeCurrency' in d:
+		add('947=' + str(d['StrikeCurrency']))
+	if 'OptAttribute' in d:
+		add('206=' + str(d['OptAttribute']))
+	if 'ContractMultiplier' in d:
+		add('231=' + str(d['ContractMultiplier']))
+	if 'CouponRate' in d:
+		add('223=' + str(d['CouponRate']))
+	if 'SecurityExchange' in d:
+		add('207=' + str(d['SecurityExchange']))
+	if 'Issuer' in d:
+		add('106=' + str(d['Issuer']))
+	if 'EncodedIssuerLen' in d:
+		add('348=' + str(d['EncodedIssuerLen']))
+	if 'EncodedIssuer' in d:
+		add('349=' + str(d['EncodedIssuer']))
+	if 'SecurityDesc' in d:
+		add('107=' + str(d['SecurityDesc']))
+	if 'EncodedSecurityDescLen' in d:
+		add('350=' + str(d['EncodedSecurityDescLen']))
+	if 'EncodedSecurityDesc' in d:
+		add('351=' + str(d['EncodedSecurityDesc']))
+	if 'Pool' in d:
+		add('691=' + str(d['Pool']))
+	if 'ContractSettlMonth' in d:
+		add('667=' + str(d['ContractSettlMonth']))
+	if 'CPProgram' in d:
+		add('875=' + str(d['CPProgram']))
+	if 'CPRegType' in d:
+		add('876=' + str(d['CPRegType']))
+	if 'NoEvents' in d:
+		grp = d['NoEvents']
+		add('864=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoEvents(entry, fixm)
+	if 'DatedDate' in d:
+		add('873=' + str(d['DatedDate']))
+	if 'InterestAccrualDate' in d:
+		add('874=' + str(d['InterestAccrualDate']))
+
+def _decode_grp_NoStrikes(fields, index, context, nentries):
+	entries = []
+	entry = FixObject(context)
+	d = entry.__dict__
+	start = index
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _grp_NoStrikes_tags.get(num)
+		if spec is None:
+			break
+		name, pytype, decode_grp = spec
+		if name in d:
+			# repeating group
+			entries.append(entry)
+			entry = FixObject(context)
+			d = entry.__dict__
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	if index > start:
+		entries.append(entry)
+	_check_group(428, nentries, entries)
+	return entries, index
+
+def _encode_grp_NoTrades(entry, fixm):
+	d = entry.__dict__
+	add = fixm.append
+	if 'TradeReportID' in d:
+		add('571=' + str(d['TradeReportID']))
+	if 'SecondaryTradeReportID' in d:
+		add('818=' + str(d['SecondaryTradeReportID']))
+
+def _decode_grp_NoTrades(fields, index, context, nentries):
+	entries = []
+	entry = FixObject(context)
+	d = entry.__dict__
+	start = index
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _grp_NoTrades_tags.get(num)
+		if spec is None:
+			break
+		name, pytype, decode_grp = spec
+		if name in d:
+			# repeating group
+			entries.append(entry)
+			entry = FixObject(context)
+			d = entry.__dict__
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	if index > start:
+		entries.append(entry)
+	_check_group(897, nentries, entries)
+	return entries, index
+
+def _encode_grp_NoTradingSessions(entry, fixm):
+	d = entry.__dict__
+	add = fixm.append
+	if 'TradingSessionID' in d:
+		add('336=' + str(d['TradingSessionID']))
+	if 'TradingSessionSubID' in d:
+		add('625=' + str(d['TradingSessionSubID']))
+
+def _decode_grp_NoTradingSessions(fields, index, context, nentries):
+	entries = []
+	entry = FixObject(context)
+	d = entry.__dict__
+	start = index
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _grp_NoTradingSessions_tags.get(num)
+		if spec is None:
+			break
+		name, pytype, decode_grp = spec
+		if name in d:
+			# repeating group
+			entries.append(entry)
+			entry = FixObject(context)
+			d = entry.__dict__
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	if index > start:
+		entries.append(entry)
+	_check_group(386, nentries, entries)
+	return entries, index
+
+def _encode_grp_NoTrdRegTimestamps(entry, fixm):
+	d = entry.__dict__
+	add = fixm.append
+	if 'TrdRegTimestamp' in d:
+		add('769=' + str(d['TrdRegTimestamp']))
+	if 'TrdRegTimestampType' in d:
+		add('770=' + str(d['TrdRegTimestampType']))
+	if 'TrdRegTimestampOrigin' in d:
+		add('771=' + str(d['TrdRegTimestampOrigin']))
+
+def _decode_grp_NoTrdRegTimestamps(fields, index, context, nentries):
+	entries = []
+	entry = FixObject(context)
+	d = entry.__dict__
+	start = index
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _grp_NoTrdRegTimestamps_tags.get(num)
+		if spec is None:
+			break
+		name, pytype, decode_grp = spec
+		if name in d:
+			# repeating group
+			entries.append(entry)
+			entry = FixObject(context)
+			d = entry.__dict__
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	if index > start:
+		entries.append(entry)
+	_check_group(768, nentries, entries)
+	return entries, index
+
+def _encode_grp_NoUnderlyingSecurityAltID(entry, fixm):
+	d = entry.__dict__
+	add = fixm.append
+	if 'UnderlyingSecurityAltID' in d:
+		add('458=' + str(d['UnderlyingSecurityAltID']))
+	if 'UnderlyingSecurityAltIDSource' in d:
+		add('459=' + str(d['UnderlyingSecurityAltIDSource']))
+
+def _decode_grp_NoUnderlyingSecurityAltID(fields, index, context, nentries):
+	entries = []
+	entry = FixObject(context)
+	d = entry.__dict__
+	start = index
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _grp_NoUnderlyingSecurityAltID_tags.get(num)
+		if spec is None:
+			break
+		name, pytype, decode_grp = spec
+		if name in d:
+			# repeating group
+			entries.append(entry)
+			entry = FixObject(context)
+			d = entry.__dict__
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	if index > start:
+		entries.append(entry)
+	_check_group(457, nentries, entries)
+	return entries, index
+
+def _encode_grp_NoUnderlyingStips(entry, fixm):
+	d = entry.__dict__
+	add = fixm.append
+	if 'UnderlyingStipType' in d:
+		add('888=' + str(d['UnderlyingStipType']))
+	if 'UnderlyingStipValue' in d:
+		add('889=' + str(d['UnderlyingStipValue']))
+
+def _decode_grp_NoUnderlyingStips(fields, index, context, nentries):
+	entries = []
+	entry = FixObject(context)
+	d = entry.__dict__
+	start = index
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _grp_NoUnderlyingStips_tags.get(num)
+		if spec is None:
+			break
+		name, pytype, decode_grp = spec
+		if name in d:
+			# repeating group
+			entries.append(entry)
+			entry = FixObject(context)
+			d = entry.__dict__
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	if index > start:
+		entries.append(entry)
+	_check_group(887, nentries, entries)
+	return entries, index
+
+def _encode_grp_NoUnderlyings(entry, fixm):
+	d = entry.__dict__
+	add = fixm.append
+	if 'UnderlyingSymbol' in d:
+		add('311=' + str(d['UnderlyingSymbol']))
+	if 'UnderlyingSymbolSfx' in d:
+		add('312=' + str(d['UnderlyingSymbolSfx']))
+	if 'UnderlyingSecurityID' in d:
+		add('309=' + str(d['UnderlyingSecurityID']))
+	if 'UnderlyingSecurityIDSource' in d:
+		add('305=' + str(d['UnderlyingSecurityIDSource']))
+	if 'NoUnderlyingSecurityAltID' in d:
+		grp = d['NoUnderlyingSecurityAltID']
+		add('457=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoUnderlyingSecurityAltID(entry, fixm)
+	if 'UnderlyingProduct' in d:
+		add('462=' + str(d['UnderlyingProduct']))
+	if 'UnderlyingCFICode' in d:
+		add('463=' + str(d['UnderlyingCFICode']))
+	if 'UnderlyingSecurityType' in d:
+		add('310=' + str(d['UnderlyingSecurityType']))
+	if 'UnderlyingSecuritySubType' in d:
+		add('763=' + str(d['UnderlyingSecuritySubType']))
+	if 'UnderlyingMaturityMonthYear' in d:
+		add('313=' + str(d['UnderlyingMaturityMonthYear']))
+	if 'UnderlyingMaturityDate' in d:
+		add('542=' + str(d['UnderlyingMaturityDate']))
+	if 'UnderlyingCouponPaymentDate' in d:
+		add('241=' + str(d['UnderlyingCouponPaymentDate']))
+	if 'UnderlyingIssueDate' in d:
+		add('242=' + str(d['UnderlyingIssueDate']))
+	if 'UnderlyingRepoCollateralSecurityType' in d:
+		add('243=' + str(d['UnderlyingRepoCollateralSecurityType']))
+	if 'UnderlyingRepurchaseTerm' in d:
+		add('244=' + str(d['UnderlyingRepurchaseTerm']))
+	if 'UnderlyingRepurchaseRate' in d:
+		add('245=' + str(d['UnderlyingRepurchaseRate']))
+	if 'UnderlyingFactor' in d:
+		add('246=' + str(d['UnderlyingFactor']))
+	if 'UnderlyingCreditRating' in d:
+		add('256=' + str(d['UnderlyingCreditRating']))
+	if 'UnderlyingInstrRegistry' in d:
+		add('595=' + str(d['UnderlyingInstrRegistry']))
+	if 'UnderlyingCountryOfIssue' in d:
+		add('592=' + str(d['UnderlyingCountryOfIssue']))
+	if 'UnderlyingStateOrProvinceOfIssue' in d:
+		add('593=' + str(d['UnderlyingStateOrProvinceOfIssue']))
+	if 'UnderlyingLocaleOfIssue' in d:
+		add('594=' + str(d['UnderlyingLocaleOfIssue']))
+	if 'UnderlyingRedemptionDate' in d:
+		add('247=' + str(d['UnderlyingRedemptionDate']))
+	if 'UnderlyingStrikePrice' in d:
+		add('316=' + str(d['UnderlyingStrikePrice']))
+	if 'UnderlyingStrikeCurrency' in d:
+		add('941=' + str(d['UnderlyingStrikeCurrency']))
+	if 'UnderlyingOptAttribute' in d:
+		add('317=' + str(d['UnderlyingOptAttribute']))
+	if 'UnderlyingContractMultiplier' in d:
+		add('436=' + str(d['UnderlyingContractMultiplier']))
+	if 'UnderlyingCouponRate' in d:
+		add('435=' + str(d['UnderlyingCouponRate']))
+	if 'UnderlyingSecurityExchange' in d:
+		add('308=' + str(d['UnderlyingSecurityExchange']))
+	if 'UnderlyingIssuer' in d:
+		add('306=' + str(d['UnderlyingIssuer']))
+	if 'EncodedUnderlyingIssuerLen' in d:
+		add('362=' + str(d['EncodedUnderlyingIssuerLen']))
+	if 'EncodedUnderlyingIssuer' in d:
+		add('363=' + str(d['EncodedUnderlyingIssuer']))
+	if 'UnderlyingSecurityDesc' in d:
+		add('307=' + str(d['UnderlyingSecurityDesc']))
+	if 'EncodedUnderlyingSecurityDescLen' in d:
+		add('364=' + str(d['EncodedUnderlyingSecurityDescLen']))
+	if 'EncodedUnderlyingSecurityDesc' in d:
+		add('365=' + str(d['EncodedUnderlyingSecurityDesc']))
+	if 'UnderlyingCPProgram' in d:
+		add('877=' + str(d['UnderlyingCPProgram']))
+	if 'UnderlyingCPRegType' in d:
+		add('878=' + str(d['UnderlyingCPRegType']))
+	if 'UnderlyingCurrency' in d:
+		add('318=' + str(d['UnderlyingCurrency']))
+	if 'UnderlyingQty' in d:
+		add('879=' + str(d['UnderlyingQty']))
+	if 'UnderlyingPx' in d:
+		add('810=' + str(d['UnderlyingPx']))
+	if 'UnderlyingDirtyPrice' in d:
+		add('882=' + str(d['UnderlyingDirtyPrice']))
+	if 'UnderlyingEndPrice' in d:
+		add('883=' + str(d['UnderlyingEndPrice']))
+	if 'UnderlyingStartValue' in d:
+		add('884=' + str(d['UnderlyingStartValue']))
+	if 'UnderlyingCurrentValue' in d:
+		add('885=' + str(d['UnderlyingCurrentValue']))
+	if 'UnderlyingEndValue' in d:
+		add('886=' + str(d['UnderlyingEndValue']))
+	if 'NoUnderlyingStips' in d:
+		grp = d['NoUnderlyingStips']
+		add('887=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoUnderlyingStips(entry, fixm)
+
+def _decode_grp_NoUnderlyings(fields, index, context, nentries):
+	entries = []
+	entry = FixObject(context)
+	d = entry.__dict__
+	start = index
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _grp_NoUnderlyings_tags.get(num)
+		if spec is None:
+			break
+		name, pytype, decode_grp = spec
+		if name in d:
+			# repeating group
+			entries.append(entry)
+			entry = FixObject(context)
+			d = entry.__dict__
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	if index > start:
+		entries.append(entry)
+	_check_group(711, nentries, entries)
+	return entries, index
+
+_grp_LinesOfText_tags = {
+	58: ('Text', str, None),
+	354: ('EncodedTextLen', str, None),
+	355: ('EncodedText', str, None),
+}
+
+_grp_NoAffectedOrders_tags = {
+	41: ('OrigClOrdID', str, None),
+	535: ('AffectedOrderID', str, None),
+	536: ('AffectedSecondaryOrderID', str, None),
+}
+
+_grp_NoAllocs_tags = {
+	79: ('AllocAccount', str, None),
+	661: ('AllocAcctIDSource', int, None),
+	736: ('AllocSettlCurrency', str, None),
+	467: ('IndividualAllocID', str, None),
+	756: ('NoNested2PartyIDs', int, _decode_grp_NoNested2PartyIDs),
+	80: ('AllocQty', float, None),
+}
+
+_grp_NoAltMDSource_tags = {
+	817: ('AltMDSourceID', str, None),
+}
+
+_grp_NoBidComponents_tags = {
+	12: ('Commission', float, None),
+	13: ('CommType', str, None),
+	479: ('CommCurrency', str, None),
+	497: ('FundRenewWaiv', str, None),
+	66: ('ListID', str, None),
+	421: ('Country', str, None),
+	54: ('Side', str, None),
+	44: ('Price', float, None),
+	423: ('PriceType', int, None),
+	406: ('FairValue', float, None),
+	430: ('NetGrossInd', int, None),
+	63: ('SettlType', str, None),
+	64: ('SettlDate', str, None),
+	336: ('TradingSessionID', str, None),
+	625: ('TradingSessionSubID', str, None),
+	58: ('Text', str, None),
+	354: ('EncodedTextLen', str, None),
+	355: ('EncodedText', str, None),
+}
+
+_grp_NoBidDescriptors_tags = {
+	399: ('BidDescriptorType', int, None),
+	400: ('BidDescriptor', str, None),
+	401: ('SideValueInd', int, None),
+	404: ('LiquidityValue', float, None),
+	441: ('LiquidityNumSecurities', int, None),
+	402: ('LiquidityPctLow', float, None),
+	403: ('LiquidityPctHigh', float, None),
+	405: ('EFPTrackingError', float, None),
+	406: ('FairValue', float, None),
+	407: ('OutsideIndexPct', float, None),
+	408: ('ValueOfFutures', float, None),
+}
+
+_grp_NoCapacities_tags = {
+	528: ('OrderCapacity', str, None),
+	529: ('OrderRestrictions', str, None),
+	863: ('OrderCapacityQty', float, None),
+}
+
+_grp_NoClearingInstructions_tags = {
+	577: ('ClearingInstruction', int, None),
+}
+
+_grp_NoCollInquiryQualifier_tags = {
+	896: ('CollInquiryQualifier', int, None),
+}
+
+_grp_NoCompIDs_tags = {
+	930: ('RefCompID', str, None),
+	931: ('RefSubID', str, None),
+	283: ('LocationID', str, None),
+	284: ('DeskID', str, None),
+	928: ('StatusValue', int, None),
+	929: ('StatusText', str, None),
+}
+
+_grp_NoContAmts_tags = {
+	519: ('ContAmtType', int, None),
+	520: ('ContAmtValue', float, None),
+	521: ('ContAmtCurr', str, None),
+}
+
+_grp_NoContraBrokers_tags = {
+	375: ('ContraBroker', str, None),
+	337: ('ContraTrader', str, None),
+	437: ('ContraTradeQty', float, None),
+	438: ('ContraTradeTime', str, None),
+	655: ('ContraLegRefID', str, None),
+}
+
+_grp_NoDates_tags = {
+	75: ('TradeDate', str, None),
+	60: ('TransactTime', str, None),
+}
+
+_grp_NoDistribInsts_tags = {
+	477: ('DistribPaymentMethod', int, None),
+	512: ('DistribPercentage', float, None),
+	478: ('CashDistribCurr', str, None),
+	498: ('CashDistribAgentName', str, None),
+	499: ('CashDistribAgentCode', str, None),
+	500: ('CashDistribAgentAcctNumber', str, None),
+	501: ('CashDistribPayRef', str, None),
+	502: ('CashDistribAgentAcctName', str, None),
+}
+
+_grp_NoDlvyInst_tags = {
+	165: ('SettlInstSource', str, None),
+	787: ('DlvyInstType', str, None),
+	781: ('NoSettlPartyIDs', int, _decode_grp_NoSettlPartyIDs),
+}
+
+_grp_NoEvents_tags = {
+	865: ('EventType', int, None),
+	866: ('EventDate', str, None),
+	867: ('EventPx', float, None),
+	868: ('EventText', str, None),
+}
+
+_grp_NoExecs_tags = {
+	17: ('ExecID', str, None),
+}
+
+_grp_NoHops_tags = {
+	628: ('HopCompID', str, None),
+	629: ('HopSendingTime', str, None),
+	630: ('HopRefID', int, None),
+}
+
+_grp_NoIOIQualifiers_tags = {
+	104: ('IOIQualifier', str, None),
+}
+
+_grp_NoInstrAttrib_tags = {
+	871: ('InstrAttribType', int, None),
+	872: ('InstrAttribValue', str, None),
+}
+
+_grp_NoLegAllocs_tags = {
+	671: ('LegAllocAccount', str, None),
+	672: ('LegIndividualAllocID', str, None),
+	756: ('NoNested2PartyIDs', int, _decode_grp_NoNested2PartyIDs),
+	673: ('LegAllocQty', float, None),
+	674: ('LegAllocAcctIDSource', str, None),
+	675: ('LegSettlCurrency', str, None),
+}
+
+_grp_NoLegSecurityAltID_tags = {
+	605: ('LegSecurityAltID', str, None),
+	606: ('LegSecurityAltIDSource', str, None),
+}
+
+_grp_NoLegStipulations_tags = {
+	688: ('LegStipulationType', str, None),
+	689: ('LegStipulationValue', str, None),
+}
+
+_grp_NoLegs_tags = {
+	600: ('LegSymbol', str, None),
+	601: ('LegSymbolSfx', str, None),
+	602: ('LegSecurityID', str, None),
+	603: ('LegSecurityIDSource', str, None),
+	604: ('NoLegSecurityAltID', str, None),
+	607: ('LegProduct', int, None),
+	608: ('LegCFICode', str, None),
+	609: ('LegSecurityType', str, None),
+	764: ('LegSecuritySubType', str, None),
+	610: ('LegMaturityMonthYear', str, None),
+	611: ('LegMaturityDate', str, None),
+	248: ('LegCouponPaymentDate', str, None),
+	249: ('LegIssueDate', str, None),
+	250: ('LegRepoCollateralSecurityType', int, None),
+	251: ('LegRepurchaseTerm', int, None),
+	252: ('LegRepurchaseRate', float, None),
+	253: ('LegFactor', float, None),
+	257: ('LegCreditRating', str, None),
+	599: ('LegInstrRegistry', str, None),
+	596: ('LegCountryOfIssue', str, None),
+	597: ('LegStateOrProvinceOfIssue', str, None),
+	598: ('LegLocaleOfIssue', str, None),
+	254: ('LegRedemptionDate', str, None),
+	612: ('LegStrikePrice', float, None),
+	942: ('LegStrikeCurrency', str, None),
+	613: ('LegOptAttribute', str, None),
+	614: ('LegContractMultiplier', float, None),
+	615: ('LegCouponRate', float, None),
+	616: ('LegSecurityExchange', str, None),
+	617: ('LegIssuer', str, None),
+	618: ('EncodedLegIssuerLen', str, None),
+	619: ('EncodedLegIssuer', str, None),
+	620: ('LegSecurityDesc', str, None),
+	621: ('EncodedLegSecurityDescLen', str, None),
+	622: ('EncodedLegSecurityDesc', str, None),
+	623: ('LegRatioQty', float, None),
+	624: ('LegSide', str, None),
+	556: ('LegCurrency', str, None),
+	740: ('LegPool', str, None),
+	739: ('LegDatedDate', str, None),
+	955: ('LegContractSettlMonth', str, None),
+	956: ('LegInterestAccrualDate', str, None),
+}
+
+_grp_NoMDEntries_tags = {
+	279: ('MDUpdateAction', str, None),
+	285: ('DeleteReason', str, None),
+	269: ('MDEntryType', str, None),
+	278: ('MDEntryID', str, None),
+	280: ('MDEntryRefID', str, None),
+	55: ('Symbol', str, None),
+	65: ('SymbolSfx', str, None),
+	48: ('SecurityID', str, None),
+	22: ('SecurityIDSource', str, None),
+	454: ('NoSecurityAltID', int, _decode_grp_NoSecurityAltID),
+	460: ('Product', int, None),
+	461: ('CFICode', str, None),
+	167: ('SecurityType', str, None),
+	762: ('SecuritySubType', str, None),
+	200: ('MaturityMonthYear', str, None),
+	541: ('MaturityDate', str, None),
+	224: ('CouponPaymentDate', str, None),
+	225: ('IssueDate', str, None),
+	239: ('RepoCollateralSecurityType', int, None),
+	226: ('RepurchaseTerm', int, None),
+	227: ('RepurchaseRate', float, None),
+	228: ('Factor', float, None),
+	255: ('CreditRating', str, None),
+	543: ('InstrRegistry', str, None),
+	470: ('CountryOfIssue', str, None),
+	471: ('StateOrProvinceOfIssue', str, None),
+	472: ('LocaleOfIssue', str, None),
+	240: ('RedemptionDate', str, None),
+	202: ('StrikePrice', float, None),
+	947: ('StrikeCurrency', str, None),
+	206: ('OptAttribute', str, None),
+	231: ('ContractMultiplier', float, None),
+	223: ('CouponRate', float, None),
+	207: ('SecurityExchange', str, None),
+	106: ('Issuer', str, None),
+	348: ('EncodedIssuerLen', str, None),
+	349: ('EncodedIssuer', str, None),
+	107: ('SecurityDesc', str, None),
+	350: ('EncodedSecurityDescLen', str, None),
+	351: ('EncodedSecurityDesc', str, None),
+	691: ('Pool', str, None),
+	667: ('ContractSettlMonth', str, None),
+	875: ('CPProgram', int, None),
+	876: ('CPRegType', str, None),
+	864: ('NoEvents', int, _decode_grp_NoEvents),
+	873: ('DatedDate', str, None),
+	874: ('InterestAccrualDate', str, None),
+	711: ('NoUnderlyings', int, _decode_grp_NoUnderlyings),
+	555: ('NoLegs', int, _decode_grp_NoLegs),
+	291: ('FinancialStatus', str, None),
+	292: ('CorporateAction', str, None),
+	270: ('MDEntryPx', float, None),
+	15: ('Currency', str, None),
+	271: ('MDEntrySize', float, None),
+	272: ('MDEntryDate', str, None),
+	273: ('MDEntryTime', str, None),
+	274: ('TickDirection', str, None),
+	275: ('MDMkt', str, None),
+	336: ('TradingSessionID', str, None),
+	625: ('TradingSessionSubID', str, None),
+	276: ('QuoteCondition', str, None),
+	277: ('TradeCondition', str, None),
+	282: ('MDEntryOriginator', str, None),
+	283: ('LocationID', str, None),
+	284: ('DeskID', str, None),
+	286: ('OpenCloseSettlFlag', str, None),
+	59: ('TimeInForce', str, None),
+	432: ('ExpireDate', str, None),
+	126: ('ExpireTime', str, None),
+	110: ('MinQty', float, None),
+	18: ('ExecInst', str, None),
+	287: ('SellerDays', int, None),
+	37: ('OrderID', str, None),
+	299: ('QuoteEntryID', str, None),
+	288: ('MDEntryBuyer', str, None),
+	289: ('MDEntrySeller', str, None),
+	346: ('NumberOfOrders', int, None),
+	290: ('MDEntryPositionNo', int, None),
+	546: ('Scope', str, None),
+	811: ('PriceDelta', float, None),
+	451: ('NetChgPrevDay', float, None),
+	58: ('Text', str, None),
+	354: ('EncodedTextLen', str, None),
+	355: ('EncodedText', str, None),
+}
+
+_grp_NoMDEntryTypes_tags = {
+	269: ('MDEntryType', str, None),
+}
+
+_grp_NoMiscFees_tags = {
+	137: ('MiscFeeAmt', float, None),
+	138: ('MiscFeeCurr', str, None),
+	139: ('MiscFeeType', str, None),
+	891: ('MiscFeeBasis', int, None),
+}
+
+_grp_NoMsgTypes_tags = {
+	372: ('RefMsgType', str, None),
+	385: ('MsgDirection', str, None),
+}
+
+_grp_NoNested2PartyIDs_tags = {
+	757: ('Nested2PartyID', str, None),
+	758: ('Nested2PartyIDSource', str, None),
+	759: ('Nested2PartyRole', int, None),
+	806: ('NoNested2PartySubIDs', int, _decode_grp_NoNested2PartySubIDs),
+}
+
+_grp_NoNested2PartySubIDs_tags = {
+	760: ('Nested2PartySubID', str, None),
+	807: ('Nested2PartySubIDType', int, None),
+}
+
+_grp_NoNested3PartyIDs_tags = {
+	949: ('Nested3PartyID', str, None),
+	950: ('Nested3PartyIDSource', str, None),
+	951: ('Nested3PartyRole', int, None),
+	952: ('NoNested3PartySubIDs', int, _decode_grp_NoNested3PartySubIDs),
+}
+
+_grp_NoNested3PartySubIDs_tags = {
+	953: ('Nested3PartySubID', str, None),
+	954: ('Nested3PartySubIDType', int, None),
+}
+
+_grp_NoNestedPartyIDs_tags = {
+	524: ('NestedPartyID', str, None),
+	525: ('NestedPartyIDSource', str, None),
+	538: ('NestedPartyRole', int, None),
+	804: ('NoNestedPartySubIDs', int, _decode_grp_NoNestedPartySubIDs),
+}
+
+_grp_NoNestedPartySubIDs_tags = {
+	545: ('NestedPartySubID', str, None),
+	805: ('NestedPartySubIDType', int, None),
+}
+
+_grp_NoOrders_tags = {
+	11: ('ClOrdID', str, None),
+	37: ('OrderID', str, None),
+	198: ('SecondaryOrderID', str, None),
+	526: ('SecondaryClOrdID', str, None),
+	66: ('ListID', str, None),
+	756: ('NoNested2PartyIDs', int, _decode_grp_NoNested2PartyIDs),
+	38: ('OrderQty', float, None),
+	799: ('OrderAvgPx', float, None),
+	800: ('OrderBookingQty', float, None),
+}
+
+_grp_NoPartyIDs_tags = {
+	448: ('PartyID', str, None),
+	447: ('PartyIDSource', str, None),
+	452: ('PartyRole', int, None),
+	802: ('NoPartySubIDs', int, _decode_grp_NoPartySubIDs),
+}
+
+_grp_NoPartySubIDs_tags = {
+	523: ('PartySubID', str, None),
+	803: ('PartySubIDType', int, None),
+}
+
+_grp_NoPosAmt_tags = {
+	707: ('PosAmtType', str, None),
+	708: ('PosAmt', float, None),
+}
+
+_grp_NoPositions_tags = {
+	703: ('PosType', str, None),
+	704: ('LongQty', float, None),
+	705: ('ShortQty', float, None),
+	706: ('PosQtyStatus', int, None),
+	539: ('NoNestedPartyIDs', int, _decode_grp_NoNestedPartyIDs),
+}
+
+_grp_NoQuoteEntries_tags = {
+	299: ('QuoteEntryID', str, None),
+	55: ('Symbol', str, None),
+	65: ('SymbolSfx', str, None),
+	48: ('SecurityID', str, None),
+	22: ('SecurityIDSource', str, None),
+	454: ('NoSecurityAltID', int, _decode_grp_NoSecurityAltID),
+	460: ('Product', int, None),
+	461: ('CFICode', str, None),
+	167: ('SecurityType', str, None),
+	762: ('SecuritySubType', str, None),
+	200: ('MaturityMonthYear', str, None),
+	541: ('MaturityDate', str, None),
+	224: ('CouponPaymentDate', str, None),
+	225: ('IssueDate', str, None),
+	239: ('RepoCollateralSecurityType', int, None),
+	226: ('RepurchaseTerm', int, None),
+	227: ('RepurchaseRate', float, None),
+	228: ('Factor', float, None),
+	255: ('CreditRating', str, None),
+	543: ('InstrRegistry', str, None),
+	470: ('CountryOfIssue', str, None),
+	471: ('StateOrProvinceOfIssue', str, None),
+	472: ('LocaleOfIssue', str, None),
+	240: ('RedemptionDate', str, None),
+	202: ('StrikePrice', float, None),
+	947: ('StrikeCurrency', str, None),
+	206: ('OptAttribute', str, None),
+	231: ('ContractMultiplier', float, None),
+	223: ('CouponRate', float, None),
+	207: ('SecurityExchange', str, None),
+	106: ('Issuer', str, None),
+	348: ('EncodedIssuerLen', str, None),
+	349: ('EncodedIssuer', str, None),
+	107: ('SecurityDesc', str, None),
+	350: ('EncodedSecurityDescLen', str, None),
+	351: ('EncodedSecurityDesc', str, None),
+	691: ('Pool', str, None),
+	667: ('ContractSettlMonth', str, None),
+	875: ('CPProgram', int, None),
+	876: ('CPRegType', str, None),
+	864: ('NoEvents', int, _decode_grp_NoEvents),
+	873: ('DatedDate', str, None),
+	874: ('InterestAccrualDate', str, None),
+	555: ('NoLegs', int, _decode_grp_NoLegs),
+	132: ('BidPx', float, None),
+	133: ('OfferPx', float, None),
+	134: ('BidSize', float, None),
+	135: ('OfferSize', float, None),
+	62: ('ValidUntilTime', str, None),
+	188: ('BidSpotRate', float, None),
+	190: ('OfferSpotRate', float, None),
+	189: ('BidForwardPoints', float, None),
+	191: ('OfferForwardPoints', float, None),
+	631: ('MidPx', float, None),
+	632: ('BidYield', float, None),
+	633: ('MidYield', float, None),
+	634: ('OfferYield', float, None),
+	60: ('TransactTime', str, None),
+	336: ('TradingSessionID', str, None),
+	625: ('TradingSessionSubID', str, None),
+	64: ('SettlDate', str, None),
+	40: ('OrdType', str, None),
+	193: ('SettlDate2', str, None),
+	192: ('OrderQty2', float, None),
+	642: ('BidForwardPoints2', float, None),
+	643: ('OfferForwardPoints2', float, None),
+	15: ('Currency', str, None),
+	368: ('QuoteEntryRejectReason', int, None),
+}
+
+_grp_NoQuoteQualifiers_tags = {
+	695: ('QuoteQualifier', str, None),
+}
+
+_grp_NoQuoteSets_tags = {
+	302: ('QuoteSetID', str, None),
+	311: ('UnderlyingSymbol', str, None),
+	312: ('UnderlyingSymbolSfx', str, None),
+	309: ('UnderlyingSecurityID', str, None),
+	305: ('UnderlyingSecurityIDSource', str, None),
+	457: ('NoUnderlyingSecurityAltID', int, _decode_grp_NoUnderlyingSecurityAltID),
+	462: ('UnderlyingProduct', int, None),
+	463: ('UnderlyingCFICode', str, None),
+	310: ('UnderlyingSecurityType', str, None),
+	763: ('UnderlyingSecuritySubType', str, None),
+	313: ('UnderlyingMaturityMonthYear', str, None),
+	542: ('UnderlyingMaturityDate', str, None),
+	241: ('UnderlyingCouponPaymentDate', str, None),
+	242: ('UnderlyingIssueDate', str, None),
+	243: ('UnderlyingRepoCollateralSecurityType', int, None),
+	244: ('UnderlyingRepurchaseTerm', int, None),
+	245: ('UnderlyingRepurchaseRate', float, None),
+	246: ('UnderlyingFactor', float, None),
+	256: ('UnderlyingCreditRating', str, None),
+	595: ('UnderlyingInstrRegistry', str, None),
+	592: ('UnderlyingCountryOfIssue', str, None),
+	593: ('UnderlyingStateOrProvinceOfIssue', str, None),
+	594: ('UnderlyingLocaleOfIssue', str, None),
+	247: ('UnderlyingRedemptionDate', str, None),
+	316: ('UnderlyingStrikePrice', float, None),
+	941: ('UnderlyingStrikeCurrency', str, None),
+	317: ('UnderlyingOptAttribute', str, None),
+	436: ('UnderlyingContractMultiplier', float, None),
+	435: ('UnderlyingCouponRate', float, None),
+	308: ('UnderlyingSecurityExchange', str, None),
+	306: ('UnderlyingIssuer', str, None),
+	362: ('EncodedUnderlyingIssuerLen', str, None),
+	363: ('EncodedUnderlyingIssuer', str, None),
+	307: ('UnderlyingSecurityDesc', str, None),
+	364: ('EncodedUnderlyingSecurityDescLen', str, None),
+	365: ('EncodedUnderlyingSecurityDesc', str, None),
+	877: ('UnderlyingCPProgram', str, None),
+	878: ('UnderlyingCPRegType', str, None),
+	318: ('UnderlyingCurrency', str, None),
+	879: ('UnderlyingQty', float, None),
+	810: ('UnderlyingPx', float, None),
+	882: ('UnderlyingDirtyPrice', float, None),
+	883: ('UnderlyingEndPrice', float, None),
+	884: ('UnderlyingStartValue', float, None),
+	885: ('UnderlyingCurrentValue', float, None),
+	886: ('UnderlyingEndValue', float, None),
+	887: ('NoUnderlyingStips', int, _decode_grp_NoUnderlyingStips),
+	304: ('TotNoQuoteEntries', int, None),
+	893: ('LastFragment', str, None),
+	295: ('NoQuoteEntries', int, _decode_grp_NoQuoteEntries),
+}
+
+_grp_NoRegistDtls_tags = {
+	509: ('RegistDtls', str, None),
+	511: ('RegistEmail', str, None),
+	474: ('MailingDtls', str, None),
+	482: ('MailingInst', str, None),
+	539: ('NoNestedPartyIDs', int, _decode_grp_NoNestedPartyIDs),
+	522: ('OwnerType', int, None),
+	486: ('DateOfBirth', str, None),
+	475: ('InvestorCountryOfResidence', str, None),
+}
+
+_grp_NoRelatedSym_tags = {
+	55: ('Symbol', str, None),
+	65: ('SymbolSfx', str, None),
+	48: ('SecurityID', str, None),
+	22: ('SecurityIDSource', str, None),
+	454: ('NoSecurityAltID', int, _decode_grp_NoSecurityAltID),
+	460: ('Product', int, None),
+	461: ('CFICode', str, None),
+	167: ('SecurityType', str, None),
+	762: ('SecuritySubType', str, None),
+	200: ('MaturityMonthYear', str, None),
+	541: ('MaturityDate', str, None),
+	224: ('CouponPaymentDate', str, None),
+	225: ('IssueDate', str, None),
+	239: ('RepoCollateralSecurityType', int, None),
+	226: ('RepurchaseTerm', int, None),
+	227: ('RepurchaseRate', float, None),
+	228: ('Factor', float, None),
+	255: ('CreditRating', str, None),
+	543: ('InstrRegistry', str, None),
+	470: ('CountryOfIssue', str, None),
+	471: ('StateOrProvinceOfIssue', str, None),
+	472: ('LocaleOfIssue', str, None),
+	240: ('RedemptionDate', str, None),
+	202: ('StrikePrice', float, None),
+	947: ('StrikeCurrency', str, None),
+	206: ('OptAttribute', str, None),
+	231: ('ContractMultiplier', float, None),
+	223: ('CouponRate', float, None),
+	207: ('SecurityExchange', str, None),
+	106: ('Issuer', str, None),
+	348: ('EncodedIssuerLen', str, None),
+	349: ('EncodedIssuer', str, None),
+	107: ('SecurityDesc', str, None),
+	350: ('EncodedSecurityDescLen', str, None),
+	351: ('EncodedSecurityDesc', str, None),
+	691: ('Pool', str, None),
+	667: ('ContractSettlMonth', str, None),
+	875: ('CPProgram', int, None),
+	876: ('CPRegType', str, None),
+	864: ('NoEvents', int, _decode_grp_NoEvents),
+	873: ('DatedDate', str, None),
+	874: ('InterestAccrualDate', str, None),
+	15: ('Currency', str, None),
+	827: ('ExpirationCycle', int, None),
+	668: ('DeliveryForm', int, None),
+	869: ('PctAtRisk', float, None),
+	870: ('NoInstrAttrib', int, _decode_grp_NoInstrAttrib),
+	555: ('NoLegs', int, _decode_grp_NoLegs),
+	336: ('TradingSessionID', str, None),
+	625: ('TradingSessionSubID', str, None),
+	58: ('Text', str, None),
+	354: ('EncodedTextLen', str, None),
+	355: ('EncodedText', str, None),
+}
+
+_grp_NoRoutingIDs_tags = {
+	216: ('RoutingType', int, None),
+	217: ('RoutingID', str, None),
+}
+
+_grp_NoSecurityAltID_tags = {
+	455: ('SecurityAltID', str, None),
+	456: ('SecurityAltIDSource', str, None),
+}
+
+_grp_NoSecurityTypes_tags = {
+	167: ('SecurityType', str, None),
+	762: ('SecuritySubType', str, None),
+	460: ('Product', int, None),
+	461: ('CFICode', str, None),
+}
+
+_grp_NoSettlInst_tags = {
+	162: ('SettlInstID', str, None),
+	163: ('SettlInstTransType', str, None),
+	214: ('SettlInstRefID', str, None),
+	453: ('NoPartyIDs', int, _decode_grp_NoPartyIDs),
+	54: ('Side', str, None),
+	460: ('Product', int, None),
+	167: ('SecurityType', str, None),
+	461: ('CFICode', str, None),
+	168: ('EffectiveTime', str, None),
+	126: ('ExpireTime', str, None),
+	779: ('LastUpdateTime', str, None),
+	172: ('SettlDeliveryType', int, None),
+	169: ('StandInstDbType', int, None),
+	170: ('StandInstDbName', str, None),
+	171: ('StandInstDbID', str, None),
+	85: ('NoDlvyInst', int, _decode_grp_NoDlvyInst),
+	492: ('PaymentMethod', int, None),
+	476: ('PaymentRef', str, None),
+	488: ('CardHolderName', str, None),
+	489: ('CardNumber', str, None),
+	503: ('CardStartDate', str, None),
+	490: ('CardExpDate', str, None),
+	491: ('CardIssNum', str, None),
+	504: ('PaymentDate', str, None),
+	505: ('PaymentRemitterID', str, None),
+}
+
+_grp_NoSettlPartyIDs_tags = {
+	782: ('SettlPartyID', str, None),
+	783: ('SettlPartyIDSource', str, None),
+	784: ('SettlPartyRole', int, None),
+	801: ('NoSettlPartySubIDs', int, _decode_grp_NoSettlPartySubIDs),
+}
+
+_grp_NoSettlPartySubIDs_tags = {
+	785: ('SettlPartySubID', str, None),
+	786: ('SettlPartySubIDType', int, None),
+}
+
+_grp_NoSides_tags = {
+	54: ('Side', str, None),
+	37: ('OrderID', str, None),
+	198: ('SecondaryOrderID', str, None),
+	11: ('ClOrdID', str, None),
+	526: ('SecondaryClOrdID', str, None),
+	66: ('ListID', str, None),
+	453: ('NoPartyIDs', int, _decode_grp_NoPartyIDs),
+	1: ('Account', str, None),
+	660: ('AcctIDSource', int, None),
+	581: ('AccountType', int, None),
+	81: ('ProcessCode', str, None),
+	575: ('OddLot', str, None),
+	576: ('NoClearingInstructions', int, None),
+	635: ('ClearingFeeIndicator', str, None),
+	578: ('TradeInputSource', str, None),
+	579: ('TradeInputDevice', str, None),
+	821: ('OrderInputDevice', str, None),
+	15: ('Currency', str, None),
+	376: ('ComplianceID', str, None),
+	377: ('SolicitedFlag', str, None),
+	528: ('OrderCapacity', str, None),
+	529: ('OrderRestrictions', str, None),
+	582: ('CustOrderCapacity', int, None),
+	40: ('OrdType', str, None),
+	18: ('ExecInst', str, None),
+	483: ('TransBkdTime', str, None),
+	336: ('TradingSessionID', str, None),
+	625: ('TradingSessionSubID', str, None),
+	943: ('TimeBracket', str, None),
+	12: ('Commission', float, None),
+	13: ('CommType', str, None),
+	479: ('CommCurrency', str, None),
+	497: ('FundRenewWaiv', str, None),
+	381: ('GrossTradeAmt', float, None),
+	157: ('NumDaysInterest', int, None),
+	230: ('ExDate', str, None),
+	158: ('AccruedInterestRate', float, None),
+	159: ('AccruedInterestAmt', float, None),
+	738: ('InterestAtMaturity', float, None),
+	920: ('EndAccruedInterestAmt', float, None),
+	921: ('StartCash', float, None),
+	922: ('EndCash', float, None),
+	238: ('Concession', float, None),
+	237: ('TotalTakedown', float, None),
+	118: ('NetMoney', float, None),
+	119: ('SettlCurrAmt', float, None),
+	120: ('SettlCurrency', str, None),
+	155: ('SettlCurrFxRate', float, None),
+	156: ('SettlCurrFxRateCalc', str, None),
+	77: ('PositionEffect', str, None),
+	58: ('Text', str, None),
+	354: ('EncodedTextLen', str, None),
+	355: ('EncodedText', str, None),
+	752: ('SideMultiLegReportingType', int, None),
+	518: ('NoContAmts', int, _decode_grp_NoContAmts),
+	232: ('NoStipulations', int, _decode_grp_NoStipulations),
+	136: ('NoMiscFees', int, _decode_grp_NoMiscFees),
+	825: ('ExchangeRule', str, None),
+	826: ('TradeAllocIndicator', int, None),
+	591: ('PreallocMethod', str, None),
+	70: ('AllocID', str, None),
+	78: ('NoAllocs', int, _decode_grp_NoAllocs),
+}
+
+_grp_NoStipulations_tags = {
+	233: ('StipulationType', str, None),
+	234: ('StipulationValue', str, None),
+}
+
+_grp_NoStrikes_tags = {
+	55: ('Symbol', str, None),
+	65: ('SymbolSfx', str, None),
+	48: ('SecurityID', str, None),
+	22: ('SecurityIDSource', str, None),
+	454: ('NoSecurityAltID', int, _decode_grp_NoSecurityAltID),
+	460: ('Product', int, None),
+	461: ('CFICode', str, None),
+	167: ('SecurityType', str, None),
+	762: ('SecuritySubType', str, None),
+	200: ('MaturityMonthYear', str, None),
+	541: ('MaturityDate', str, None),
+	224: ('CouponPaymentDate', str, None),
+	225: ('IssueDate', str, None),
+	239: ('RepoCollateralSecurityType', int, None),
+	226: ('RepurchaseTerm', int, None),
+	227: ('RepurchaseRate', float, None),
+	228: ('Factor', float, None),
+	255: ('CreditRating', str, None),
+	543: ('InstrRegistry', str, None),
+	470: ('CountryOfIssue', str, None),
+	471: ('StateOrProvinceOfIssue', str, None),
+	472: ('LocaleOfIssue', str, None),
+	240: ('RedemptionDate', str, None),
+	202: ('StrikePrice', float, None),
+	947: ('StrikeCurrency', str, None),
+	206: ('OptAttribute', str, None),
+	231: ('ContractMultiplier', float, None),
+	223: ('CouponRate', float, None),
+	207: ('SecurityExchange', str, None),
+	106: ('Issuer', str, None),
+	348: ('EncodedIssuerLen', str, None),
+	349: ('EncodedIssuer', str, None),
+	107: ('SecurityDesc', str, None),
+	350: ('EncodedSecurityDescLen', str, None),
+	351: ('EncodedSecurityDesc', str, None),
+	691: ('Pool', str, None),
+	667: ('ContractSettlMonth', str, None),
+	875: ('CPProgram', int, None),
+	876: ('CPRegType', str, None),
+	864: ('NoEvents', int, _decode_grp_NoEvents),
+	873: ('DatedDate', str, None),
+	874: ('InterestAccrualDate', str, None),
+}
+
+_grp_NoTrades_tags = {
+	571: ('TradeReportID', str, None),
+	818: ('SecondaryTradeReportID', str, None),
+}
+
+_grp_NoTradingSessions_tags = {
+	336: ('TradingSessionID', str, None),
+	625: ('TradingSessionSubID', str, None),
+}
+
+_grp_NoTrdRegTimestamps_tags = {
+	769: ('TrdRegTimestamp', str, None),
+	770: ('TrdRegTimestampType', int, None),
+	771: ('TrdRegTimestampOrigin', str, None),
+}
+
+_grp_NoUnderlyingSecurityAltID_tags = {
+	458: ('UnderlyingSecurityAltID', str, None),
+	459: ('UnderlyingSecurityAltIDSource', str, None),
+}
+
+_grp_NoUnderlyingStips_tags = {
+	888: ('UnderlyingStipType', str, None),
+	889: ('UnderlyingStipValue', str, None),
+}
+
+_grp_NoUnderlyings_tags = {
+	311: ('UnderlyingSymbol', str, None),
+	312: ('UnderlyingSymbolSfx', str, None),
+	309: ('UnderlyingSecurityID', str, None),
+	305: ('UnderlyingSecurityIDSource', str, None),
+	457: ('NoUnderlyingSecurityAltID', int, _decode_grp_NoUnderlyingSecurityAltID),
+	462: ('UnderlyingProduct', int, None),
+	463: ('UnderlyingCFICode', str, None),
+	310: ('UnderlyingSecurityType', str, None),
+	763: ('UnderlyingSecuritySubType', str, None),
+	313: ('UnderlyingMaturityMonthYear', str, None),
+	542: ('UnderlyingMaturityDate', str, None),
+	241: ('UnderlyingCouponPaymentDate', str, None),
+	242: ('UnderlyingIssueDate', str, None),
+	243: ('UnderlyingRepoCollateralSecurityType', int, None),
+	244: ('UnderlyingRepurchaseTerm', int, None),
+	245: ('UnderlyingRepurchaseRate', float, None),
+	246: ('UnderlyingFactor', float, None),
+	256: ('UnderlyingCreditRating', str, None),
+	595: ('UnderlyingInstrRegistry', str, None),
+	592: ('UnderlyingCountryOfIssue', str, None),
+	593: ('UnderlyingStateOrProvinceOfIssue', str, None),
+	594: ('UnderlyingLocaleOfIssue', str, None),
+	247: ('UnderlyingRedemptionDate', str, None),
+	316: ('UnderlyingStrikePrice', float, None),
+	941: ('UnderlyingStrikeCurrency', str, None),
+	317: ('UnderlyingOptAttribute', str, None),
+	436: ('UnderlyingContractMultiplier', float, None),
+	435: ('UnderlyingCouponRate', float, None),
+	308: ('UnderlyingSecurityExchange', str, None),
+	306: ('UnderlyingIssuer', str, None),
+	362: ('EncodedUnderlyingIssuerLen', str, None),
+	363: ('EncodedUnderlyingIssuer', str, None),
+	307: ('UnderlyingSecurityDesc', str, None),
+	364: ('EncodedUnderlyingSecurityDescLen', str, None),
+	365: ('EncodedUnderlyingSecurityDesc', str, None),
+	877: ('UnderlyingCPProgram', str, None),
+	878: ('UnderlyingCPRegType', str, None),
+	318: ('UnderlyingCurrency', str, None),
+	879: ('UnderlyingQty', float, None),
+	810: ('UnderlyingPx', float, None),
+	882: ('UnderlyingDirtyPrice', float, None),
+	883: ('UnderlyingEndPrice', float, None),
+	884: ('UnderlyingStartValue', float, None),
+	885: ('UnderlyingCurrentValue', float, None),
+	886: ('UnderlyingEndValue', float, None),
+	887: ('NoUnderlyingStips', int, _decode_grp_NoUnderlyingStips),
+}
+
+_msg_Advertisement_names = frozenset(['AdvId', 'AdvTransType', 'AdvRefID', 'Symbol', 'SymbolSfx', 'SecurityID', 'SecurityIDSource', 'NoSecurityAltID', 'Product', 'CFICode', 'SecurityType', 'SecuritySubType', 'MaturityMonthYear', 'MaturityDate', 'CouponPaymentDate', 'IssueDate', 'RepoCollateralSecurityType', 'RepurchaseTerm', 'RepurchaseRate', 'Factor', 'CreditRating', 'InstrRegistry', 'CountryOfIssue', 'StateOrProvinceOfIssue', 'LocaleOfIssue', 'RedemptionDate', 'StrikePrice', 'StrikeCurrency', 'OptAttribute', 'ContractMultiplier', 'CouponRate', 'SecurityExchange', 'Issuer', 'EncodedIssuerLen', 'EncodedIssuer', 'SecurityDesc', 'EncodedSecurityDescLen', 'EncodedSecurityDesc', 'Pool', 'ContractSettlMonth', 'CPProgram', 'CPRegType', 'NoEvents', 'DatedDate', 'InterestAccrualDate', 'NoLegs', 'NoUnderlyings', 'AdvSide', 'Quantity', 'QtyType', 'Price', 'Currency', 'TradeDate', 'TransactTime', 'Text', 'EncodedTextLen', 'EncodedText', 'URLLink', 'LastMkt', 'TradingSessionID', 'TradingSessionSubID'])
+
+_msg_Advertisement_tags = {
+	2: ('AdvId', str, None),
+	5: ('AdvTransType', str, None),
+	3: ('AdvRefID', str, None),
+	55: ('Symbol', str, None),
+	65: ('SymbolSfx', str, None),
+	48: ('SecurityID', str, None),
+	22: ('SecurityIDSource', str, None),
+	454: ('NoSecurityAltID', int, _decode_grp_NoSecurityAltID),
+	460: ('Product', int, None),
+	461: ('CFICode', str, None),
+	167: ('SecurityType', str, None),
+	762: ('SecuritySubType', str, None),
+	200: ('MaturityMonthYear', str, None),
+	541: ('MaturityDate', str, None),
+	224: ('CouponPaymentDate', str, None),
+	225: ('IssueDate', str, None),
+	239: ('RepoCollateralSecurityType', int, None),
+	226: ('RepurchaseTerm', int, None),
+	227: ('RepurchaseRate', float, None),
+	228: ('Factor', float, None),
+	255: ('CreditRating', str, None),
+	543: ('InstrRegistry', str, None),
+	470: ('CountryOfIssue', str, None),
+	471: ('StateOrProvinceOfIssue', str, None),
+	472: ('LocaleOfIssue', str, None),
+	240: ('RedemptionDate', str, None),
+	202: ('StrikePrice', float, None),
+	947: ('StrikeCurrency', str, None),
+	206: ('OptAttribute', str, None),
+	231: ('ContractMultiplier', float, None),
+	223: ('CouponRate', float, None),
+	207: ('SecurityExchange', str, None),
+	106: ('Issuer', str, None),
+	348: ('EncodedIssuerLen', str, None),
+	349: ('EncodedIssuer', str, None),
+	107: ('SecurityDesc', str, None),
+	350: ('EncodedSecurityDescLen', str, None),
+	351: ('EncodedSecurityDesc', str, None),
+	691: ('Pool', str, None),
+	667: ('ContractSettlMonth', str, None),
+	875: ('CPProgram', int, None),
+	876: ('CPRegType', str, None),
+	864: ('NoEvents', int, _decode_grp_NoEvents),
+	873: ('DatedDate', str, None),
+	874: ('InterestAccrualDate', str, None),
+	555: ('NoLegs', int, _decode_grp_NoLegs),
+	711: ('NoUnderlyings', int, _decode_grp_NoUnderlyings),
+	4: ('AdvSide', str, None),
+	53: ('Quantity', float, None),
+	854: ('QtyType', int, None),
+	44: ('Price', float, None),
+	15: ('Currency', str, None),
+	75: ('TradeDate', str, None),
+	60: ('TransactTime', str, None),
+	58: ('Text', str, None),
+	354: ('EncodedTextLen', str, None),
+	355: ('EncodedText', str, None),
+	149: ('URLLink', str, None),
+	30: ('LastMkt', str, None),
+	336: ('TradingSessionID', str, None),
+	625: ('TradingSessionSubID', str, None),
+}
+
+def _encode_Advertisement(obj, fixm):
+	d = obj.__dict__
+	add = fixm.append
+	n = 1
+	if 'AdvId' in d:
+		add('2=' + str(d['AdvId']))
+		n += 1
+	if 'AdvTransType' in d:
+		add('5=' + str(d['AdvTransType']))
+		n += 1
+	if 'AdvRefID' in d:
+		add('3=' + str(d['AdvRefID']))
+		n += 1
+	if 'Symbol' in d:
+		add('55=' + str(d['Symbol']))
+		n += 1
+	if 'SymbolSfx' in d:
+		add('65=' + str(d['SymbolSfx']))
+		n += 1
+	if 'SecurityID' in d:
+		add('48=' + str(d['SecurityID']))
+		n += 1
+	if 'SecurityIDSource' in d:
+		add('22=' + str(d['SecurityIDSource']))
+		n += 1
+	if 'NoSecurityAltID' in d:
+		grp = d['NoSecurityAltID']
+		add('454=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoSecurityAltID(entry, fixm)
+		n += 1
+	if 'Product' in d:
+		add('460=' + str(d['Product']))
+		n += 1
+	if 'CFICode' in d:
+		add('461=' + str(d['CFICode']))
+		n += 1
+	if 'SecurityType' in d:
+		add('167=' + str(d['SecurityType']))
+		n += 1
+	if 'SecuritySubType' in d:
+		add('762=' + str(d['SecuritySubType']))
+		n += 1
+	if 'MaturityMonthYear' in d:
+		add('200=' + str(d['MaturityMonthYear']))
+		n += 1
+	if 'MaturityDate' in d:
+		add('541=' + str(d['MaturityDate']))
+		n += 1
+	if 'CouponPaymentDate' in d:
+		add('224=' + str(d['CouponPaymentDate']))
+		n += 1
+	if 'IssueDate' in d:
+		add('225=' + str(d['IssueDate']))
+		n += 1
+	if 'RepoCollateralSecurityType' in d:
+		add('239=' + str(d['RepoCollateralSecurityType']))
+		n += 1
+	if 'RepurchaseTerm' in d:
+		add('226=' + str(d['RepurchaseTerm']))
+		n += 1
+	if 'RepurchaseRate' in d:
+		add('227=' + str(d['RepurchaseRate']))
+		n += 1
+	if 'Factor' in d:
+		add('228=' + str(d['Factor']))
+		n += 1
+	if 'CreditRating' in d:
+		add('255=' + str(d['CreditRating']))
+		n += 1
+	if 'InstrRegistry' in d:
+		add('543=' + str(d['InstrRegistry']))
+		n += 1
+	if 'CountryOfIssue' in d:
+		add('470=' + str(d['CountryOfIssue']))
+		n += 1
+	if 'StateOrProvinceOfIssue' in d:
+		add('471=' + str(d['StateOrProvinceOfIssue']))
+		n += 1
+	if 'LocaleOfIssue' in d:
+		add('472=' + str(d['LocaleOfIssue']))
+		n += 1
+	if 'RedemptionDate' in d:
+		add('240=' + str(d['RedemptionDate']))
+		n += 1
+	if 'StrikePrice' in d:
+		add('202=' + str(d['StrikePrice']))
+		n += 1
+	if 'StrikeCurrency' in d:
+		add('947=' + str(d['StrikeCurrency']))
+		n += 1
+	if 'OptAttribute' in d:
+		add('206=' + str(d['OptAttribute']))
+		n += 1
+	if 'ContractMultiplier' in d:
+		add('231=' + str(d['ContractMultiplier']))
+		n += 1
+	if 'CouponRate' in d:
+		add('223=' + str(d['CouponRate']))
+		n += 1
+	if 'SecurityExchange' in d:
+		add('207=' + str(d['SecurityExchange']))
+		n += 1
+	if 'Issuer' in d:
+		add('106=' + str(d['Issuer']))
+		n += 1
+	if 'EncodedIssuerLen' in d:
+		add('348=' + str(d['EncodedIssuerLen']))
+		n += 1
+	if 'EncodedIssuer' in d:
+		add('349=' + str(d['EncodedIssuer']))
+		n += 1
+	if 'SecurityDesc' in d:
+		add('107=' + str(d['SecurityDesc']))
+		n += 1
+	if 'EncodedSecurityDescLen' in d:
+		add('350=' + str(d['EncodedSecurityDescLen']))
+		n += 1
+	if 'EncodedSecurityDesc' in d:
+		add('351=' + str(d['EncodedSecurityDesc']))
+		n += 1
+	if 'Pool' in d:
+		add('691=' + str(d['Pool']))
+		n += 1
+	if 'ContractSettlMonth' in d:
+		add('667=' + str(d['ContractSettlMonth']))
+		n += 1
+	if 'CPProgram' in d:
+		add('875=' + str(d['CPProgram']))
+		n += 1
+	if 'CPRegType' in d:
+		add('876=' + str(d['CPRegType']))
+		n += 1
+	if 'NoEvents' in d:
+		grp = d['NoEvents']
+		add('864=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoEvents(entry, fixm)
+		n += 1
+	if 'DatedDate' in d:
+		add('873=' + str(d['DatedDate']))
+		n += 1
+	if 'InterestAccrualDate' in d:
+		add('874=' + str(d['InterestAccrualDate']))
+		n += 1
+	if 'NoLegs' in d:
+		grp = d['NoLegs']
+		add('555=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoLegs(entry, fixm)
+		n += 1
+	if 'NoUnderlyings' in d:
+		grp = d['NoUnderlyings']
+		add('711=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoUnderlyings(entry, fixm)
+		n += 1
+	if 'AdvSide' in d:
+		add('4=' + str(d['AdvSide']))
+		n += 1
+	if 'Quantity' in d:
+		add('53=' + str(d['Quantity']))
+		n += 1
+	if 'QtyType' in d:
+		add('854=' + str(d['QtyType']))
+		n += 1
+	if 'Price' in d:
+		add('44=' + str(d['Price']))
+		n += 1
+	if 'Currency' in d:
+		add('15=' + str(d['Currency']))
+		n += 1
+	if 'TradeDate' in d:
+		add('75=' + str(d['TradeDate']))
+		n += 1
+	if 'TransactTime' in d:
+		add('60=' + str(d['TransactTime']))
+		n += 1
+	if 'Text' in d:
+		add('58=' + str(d['Text']))
+		n += 1
+	if 'EncodedTextLen' in d:
+		add('354=' + str(d['EncodedTextLen']))
+		n += 1
+	if 'EncodedText' in d:
+		add('355=' + str(d['EncodedText']))
+		n += 1
+	if 'URLLink' in d:
+		add('149=' + str(d['URLLink']))
+		n += 1
+	if 'LastMkt' in d:
+		add('30=' + str(d['LastMkt']))
+		n += 1
+	if 'TradingSessionID' in d:
+		add('336=' + str(d['TradingSessionID']))
+		n += 1
+	if 'TradingSessionSubID' in d:
+		add('625=' + str(d['TradingSessionSubID']))
+		n += 1
+	if len(d) > n:
+		_make_mbody(obj, obj._context, fixm, _msg_Advertisement_names)
+	return fixm
+
+def _decode_Advertisement(obj, fields, index, context):
+	d = obj.__dict__
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _msg_Advertisement_tags.get(num)
+		if spec is None:
+			# not a field of this message, continue with generic decoder
+			body, index = _extract_body(fields, index, context, obj)
+			return index
+		name, pytype, decode_grp = spec
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	return index
+
 class Advertisement(FixObject):
-	pass
+	_encode = staticmethod(_encode_Advertisement)
+	_decode = staticmethod(_decode_Advertisement)
+
+_msg_AllocationInstruction_names = frozenset(['AllocID', 'AllocTransType', 'AllocType', 'SecondaryAllocID', 'RefAllocID', 'AllocCancReplaceReason', 'AllocIntermedReqType', 'AllocLinkID', 'AllocLinkType', 'BookingRefID', 'AllocNoOrdersType', 'NoOrders', 'NoExecs', 'PreviouslyReported', 'ReversalIndicator', 'MatchType', 'Side', 'Symbol', 'SymbolSfx', 'SecurityID', 'SecurityIDSource', 'NoSecurityAltID', 'Product', 'CFICode', 'SecurityType', 'SecuritySubType', 'MaturityMonthYear', 'MaturityDate', 'CouponPaymentDate', 'IssueDate', 'RepoCollateralSecurityType', 'RepurchaseTerm', 'RepurchaseRate', 'Factor', 'CreditRating', 'InstrRegistry', 'CountryOfIssue', 'StateOrProvinceOfIssue', 'LocaleOfIssue', 'RedemptionDate', 'StrikePrice', 'StrikeCurrency', 'OptAttribute', 'ContractMultiplier', 'CouponRate', 'SecurityExchange', 'Issuer', 'EncodedIssuerLen', 'EncodedIssuer', 'SecurityDesc', 'EncodedSecurityDescLen', 'EncodedSecurityDesc', 'Pool', 'ContractSettlMonth', 'CPProgram', 'CPRegType', 'NoEvents', 'DatedDate', 'InterestAccrualDate', 'DeliveryForm', 'PctAtRisk', 'NoInstrAttrib', 'AgreementDesc', 'AgreementID', 'AgreementDate', 'AgreementCurrency', 'TerminationType', 'StartDate', 'EndDate', 'DeliveryType', 'MarginRatio', 'NoUnderlyings', 'NoLegs', 'Quantity', 'QtyType', 'LastMkt', 'TradeOriginationDate', 'TradingSessionID', 'TradingSessionSubID', 'PriceType', 'AvgPx', 'AvgParPx', 'Spread', 'BenchmarkCurveCurrency', 'BenchmarkCurveName', 'BenchmarkCurvePoint', 'BenchmarkPrice', 'BenchmarkPriceType', 'BenchmarkSecurityID', 'BenchmarkSecurityIDSource', 'Currency', 'AvgPxPrecision', 'NoPartyIDs', 'TradeDate', 'TransactTime', 'SettlType', 'SettlDate', 'BookingType', 'GrossTradeAmt', 'Concession', 'TotalTakedown', 'NetMoney', 'PositionEffect', 'AutoAcceptIndicator', 'Text', 'EncodedTextLen', 'EncodedText', 'NumDaysInterest', 'AccruedInterestRate', 'AccruedInterestAmt', 'TotalAccruedInterestAmt', 'InterestAtMaturity', 'EndAccruedInterestAmt', 'StartCash', 'EndCash', 'LegalConfirm', 'NoStipulations', 'YieldType', 'Yield', 'YieldCalcDate', 'YieldRedemptionDate', 'YieldRedemptionPrice', 'YieldRedemptionPriceType', 'TotNoAllocs', 'LastFragment', 'NoAllocs'])
+
+_msg_AllocationInstruction_tags = {
+	70: ('AllocID', str, None),
+	71: ('AllocTransType', str, None),
+	626: ('AllocType', int, None),
+	793: ('SecondaryAllocID', str, None),
+	72: ('RefAllocID', str, None),
+	796: ('AllocCancReplaceReason', int, None),
+	808: ('AllocIntermedReqType', int, None),
+	196: ('AllocLinkID', str, None),
+	197: ('AllocLinkType', int, None),
+	466: ('BookingRefID', str, None),
+	857: ('AllocNoOrdersType', int, None),
+	73: ('NoOrders', int, _decode_grp_NoOrders),
+	124: ('NoExecs', int, _decode_grp_NoExecs),
+	570: ('PreviouslyReported', str, None),
+	700: ('ReversalIndicator', str, None),
+	574: ('MatchType', str, None),
+	54: ('Side', str, None),
+	55: ('Symbol', str, None),
+	65: ('SymbolSfx', str, None),
+	48: ('SecurityID', str, None),
+	22: ('SecurityIDSource', str, None),
+	454: ('NoSecurityAltID', int, _decode_grp_NoSecurityAltID),
+	460: ('Product', int, None),
+	461: ('CFICode', str, None),
+	167: ('SecurityType', str, None),
+	762: ('SecuritySubType', str, None),
+	200: ('MaturityMonthYear', str, None),
+	541: ('MaturityDate', str, None),
+	224: ('CouponPaymentDate', str, None),
+	225: ('IssueDate', str, None),
+	239: ('RepoCollateralSecurityType', int, None),
+	226: ('RepurchaseTerm', int, None),
+	227: ('RepurchaseRate', float, None),
+	228: ('Factor', float, None),
+	255: ('CreditRating', str, None),
+	543: ('InstrRegistry', str, None),
+	470: ('CountryOfIssue', str, None),
+	471: ('StateOrProvinceOfIssue', str, None),
+	472: ('LocaleOfIssue', str, None),
+	240: ('RedemptionDate', str, None),
+	202: ('StrikePrice', float, None),
+	947: ('StrikeCurrency', str, None),
+	206: ('OptAttribute', str, None),
+	231: ('ContractMultiplier', float, None),
+	223: ('CouponRate', float, None),
+	207: ('SecurityExchange', str, None),
+	106: ('Issuer', str, None),
+	348: ('EncodedIssuerLen', str, None),
+	349: ('EncodedIssuer', str, None),
+	107: ('SecurityDesc', str, None),
+	350: ('EncodedSecurityDescLen', str, None),
+	351: ('EncodedSecurityDesc', str, None),
+	691: ('Pool', str, None),
+	667: ('ContractSettlMonth', str, None),
+	875: ('CPProgram', int, None),
+	876: ('CPRegType', str, None),
+	864: ('NoEvents', int, _decode_grp_NoEvents),
+	873: ('DatedDate', str, None),
+	874: ('InterestAccrualDate', str, None),
+	668: ('DeliveryForm', int, None),
+	869: ('PctAtRisk', float, None),
+	870: ('NoInstrAttrib', int, _decode_grp_NoInstrAttrib),
+	913: ('AgreementDesc', str, None),
+	914: ('AgreementID', str, None),
+	915: ('AgreementDate', str, None),
+	918: ('AgreementCurrency', str, None),
+	788: ('TerminationType', int, None),
+	916: ('StartDate', str, None),
+	917: ('EndDate', str, None),
+	919: ('DeliveryType', int, None),
+	898: ('MarginRatio', float, None),
+	711: ('NoUnderlyings', int, _decode_grp_NoUnderlyings),
+	555: ('NoLegs', int, _decode_grp_NoLegs),
+	53: ('Quantity', float, None),
+	854: ('QtyType', int, None),
+	30: ('LastMkt', str, None),
+	229: ('TradeOriginationDate', str, None),
+	336: ('TradingSessionID', str, None),
+	625: ('TradingSessionSubID', str, None),
+	423: ('PriceType', int, None),
+	6: ('AvgPx', float, None),
+	860: ('AvgParPx', float, None),
+	218: ('Spread', float, None),
+	220: ('BenchmarkCurveCurrency', str, None),
+	221: ('BenchmarkCurveName', str, None),
+	222: ('BenchmarkCurvePoint', str, None),
+	662: ('BenchmarkPrice', float, None),
+	663: ('BenchmarkPriceType', int, None),
+	699: ('BenchmarkSecurityID', str, None),
+	761: ('BenchmarkSecurityIDSource', str, None),
+	15: ('Currency', str, None),
+	74: ('AvgPxPrecision', int, None),
+	453: ('NoPartyIDs', int, _decode_grp_NoPartyIDs),
+	75: ('TradeDate', str, None),
+	60: ('TransactTime', str, None),
+	63: ('SettlType', str, None),
+	64: ('SettlDate', str, None),
+	775: ('BookingType', int, None),
+	381: ('GrossTradeAmt', float, None),
+	238: ('Concession', float, None),
+	237: ('TotalTakedown', float, None),
+	118: ('NetMoney', float, None),
+	77: ('PositionEffect', str, None),
+	754: ('AutoAcceptIndicator', str, None),
+	58: ('Text', str, None),
+	354: ('EncodedTextLen', str, None),
+	355: ('EncodedText', str, None),
+	157: ('NumDaysInterest', int, None),
+	158: ('AccruedInterestRate', float, None),
+	159: ('AccruedInterestAmt', float, None),
+	540: ('TotalAccruedInterestAmt', float, None),
+	738: ('InterestAtMaturity', float, None),
+	920: ('EndAccruedInterestAmt', float, None),
+	921: ('StartCash', float, None),
+	922: ('EndCash', float, None),
+	650: ('LegalConfirm', str, None),
+	232: ('NoStipulations', int, _decode_grp_NoStipulations),
+	235: ('YieldType', str, None),
+	236: ('Yield', float, None),
+	701: ('YieldCalcDate', str, None),
+	696: ('YieldRedemptionDate', str, None),
+	697: ('YieldRedemptionPrice', float, None),
+	698: ('YieldRedemptionPriceType', int, None),
+	892: ('TotNoAllocs', int, None),
+	893: ('LastFragment', str, None),
+	78: ('NoAllocs', int, _decode_grp_NoAllocs),
+}
+
+def _encode_AllocationInstruction(obj, fixm):
+	d = obj.__dict__
+	add = fixm.append
+	n = 1
+	if 'AllocID' in d:
+		add('70=' + str(d['AllocID']))
+		n += 1
+	if 'AllocTransType' in d:
+		add('71=' + str(d['AllocTransType']))
+		n += 1
+	if 'AllocType' in d:
+		add('626=' + str(d['AllocType']))
+		n += 1
+	if 'SecondaryAllocID' in d:
+		add('793=' + str(d['SecondaryAllocID']))
+		n += 1
+	if 'RefAllocID' in d:
+		add('72=' + str(d['RefAllocID']))
+		n += 1
+	if 'AllocCancReplaceReason' in d:
+		add('796=' + str(d['AllocCancReplaceReason']))
+		n += 1
+	if 'AllocIntermedReqType' in d:
+		add('808=' + str(d['AllocIntermedReqType']))
+		n += 1
+	if 'AllocLinkID' in d:
+		add('196=' + str(d['AllocLinkID']))
+		n += 1
+	if 'AllocLinkType' in d:
+		add('197=' + str(d['AllocLinkType']))
+		n += 1
+	if 'BookingRefID' in d:
+		add('466=' + str(d['BookingRefID']))
+		n += 1
+	if 'AllocNoOrdersType' in d:
+		add('857=' + str(d['AllocNoOrdersType']))
+		n += 1
+	if 'NoOrders' in d:
+		grp = d['NoOrders']
+		add('73=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoOrders(entry, fixm)
+		n += 1
+	if 'NoExecs' in d:
+		grp = d['NoExecs']
+		add('124=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoExecs(entry, fixm)
+		n += 1
+	if 'PreviouslyReported' in d:
+		add('570=' + str(d['PreviouslyReported']))
+		n += 1
+	if 'ReversalIndicator' in d:
+		add('700=' + str(d['ReversalIndicator']))
+		n += 1
+	if 'MatchType' in d:
+		add('574=' + str(d['MatchType']))
+		n += 1
+	if 'Side' in d:
+		add('54=' + str(d['Side']))
+		n += 1
+	if 'Symbol' in d:
+		add('55=' + str(d['Symbol']))
+		n += 1
+	if 'SymbolSfx' in d:
+		add('65=' + str(d['SymbolSfx']))
+		n += 1
+	if 'SecurityID' in d:
+		add('48=' + str(d['SecurityID']))
+		n += 1
+	if 'SecurityIDSource' in d:
+		add('22=' + str(d['SecurityIDSource']))
+		n += 1
+	if 'NoSecurityAltID' in d:
+		grp = d['NoSecurityAltID']
+		add('454=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoSecurityAltID(entry, fixm)
+		n += 1
+	if 'Product' in d:
+		add('460=' + str(d['Product']))
+		n += 1
+	if 'CFICode' in d:
+		add('461=' + str(d['CFICode']))
+		n += 1
+	if 'SecurityType' in d:
+		add('167=' + str(d['SecurityType']))
+		n += 1
+	if 'SecuritySubType' in d:
+		add('762=' + str(d['SecuritySubType']))
+		n += 1
+	if 'MaturityMonthYear' in d:
+		add('200=' + str(d['MaturityMonthYear']))
+		n += 1
+	if 'MaturityDate' in d:
+		add('541=' + str(d['MaturityDate']))
+		n += 1
+	if 'CouponPaymentDate' in d:
+		add('224=' + str(d['CouponPaymentDate']))
+		n += 1
+	if 'IssueDate' in d:
+		add('225=' + str(d['IssueDate']))
+		n += 1
+	if 'RepoCollateralSecurityType' in d:
+		add('239=' + str(d['RepoCollateralSecurityType']))
+		n += 1
+	if 'RepurchaseTerm' in d:
+		add('226=' + str(d['RepurchaseTerm']))
+		n += 1
+	if 'RepurchaseRate' in d:
+		add('227=' + str(d['RepurchaseRate']))
+		n += 1
+	if 'Factor' in d:
+		add('228=' + str(d['Factor']))
+		n += 1
+	if 'CreditRating' in d:
+		add('255=' + str(d['CreditRating']))
+		n += 1
+	if 'InstrRegistry' in d:
+		add('543=' + str(d['InstrRegistry']))
+		n += 1
+	if 'CountryOfIssue' in d:
+		add('470=' + str(d['CountryOfIssue']))
+		n += 1
+	if 'StateOrProvinceOfIssue' in d:
+		add('471=' + str(d['StateOrProvinceOfIssue']))
+		n += 1
+	if 'LocaleOfIssue' in d:
+		add('472=' + str(d['LocaleOfIssue']))
+		n += 1
+	if 'RedemptionDate' in d:
+		add('240=' + str(d['RedemptionDate']))
+		n += 1
+	if 'StrikePrice' in d:
+		add('202=' + str(d['StrikePrice']))
+		n += 1
+	if 'StrikeCurrency' in d:
+		add('947=' + str(d['StrikeCurrency']))
+		n += 1
+	if 'OptAttribute' in d:
+		add('206=' + str(d['OptAttribute']))
+		n += 1
+	if 'ContractMultiplier' in d:
+		add('231=' + str(d['ContractMultiplier']))
+		n += 1
+	if 'CouponRate' in d:
+		add('223=' + str(d['CouponRate']))
+		n += 1
+	if 'SecurityExchange' in d:
+		add('207=' + str(d['SecurityExchange']))
+		n += 1
+	if 'Issuer' in d:
+		add('106=' + str(d['Issuer']))
+		n += 1
+	if 'EncodedIssuerLen' in d:
+		add('348=' + str(d['EncodedIssuerLen']))
+		n += 1
+	if 'EncodedIssuer' in d:
+		add('349=' + str(d['EncodedIssuer']))
+		n += 1
+	if 'SecurityDesc' in d:
+		add('107=' + str(d['SecurityDesc']))
+		n += 1
+	if 'EncodedSecurityDescLen' in d:
+		add('350=' + str(d['EncodedSecurityDescLen']))
+		n += 1
+	if 'EncodedSecurityDesc' in d:
+		add('351=' + str(d['EncodedSecurityDesc']))
+		n += 1
+	if 'Pool' in d:
+		add('691=' + str(d['Pool']))
+		n += 1
+	if 'ContractSettlMonth' in d:
+		add('667=' + str(d['ContractSettlMonth']))
+		n += 1
+	if 'CPProgram' in d:
+		add('875=' + str(d['CPProgram']))
+		n += 1
+	if 'CPRegType' in d:
+		add('876=' + str(d['CPRegType']))
+		n += 1
+	if 'NoEvents' in d:
+		grp = d['NoEvents']
+		add('864=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoEvents(entry, fixm)
+		n += 1
+	if 'DatedDate' in d:
+		add('873=' + str(d['DatedDate']))
+		n += 1
+	if 'InterestAccrualDate' in d:
+		add('874=' + str(d['InterestAccrualDate']))
+		n += 1
+	if 'DeliveryForm' in d:
+		add('668=' + str(d['DeliveryForm']))
+		n += 1
+	if 'PctAtRisk' in d:
+		add('869=' + str(d['PctAtRisk']))
+		n += 1
+	if 'NoInstrAttrib' in d:
+		grp = d['NoInstrAttrib']
+		add('870=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoInstrAttrib(entry, fixm)
+		n += 1
+	if 'AgreementDesc' in d:
+		add('913=' + str(d['AgreementDesc']))
+		n += 1
+	if 'AgreementID' in d:
+		add('914=' + str(d['AgreementID']))
+		n += 1
+	if 'AgreementDate' in d:
+		add('915=' + str(d['AgreementDate']))
+		n += 1
+	if 'AgreementCurrency' in d:
+		add('918=' + str(d['AgreementCurrency']))
+		n += 1
+	if 'TerminationType' in d:
+		add('788=' + str(d['TerminationType']))
+		n += 1
+	if 'StartDate' in d:
+		add('916=' + str(d['StartDate']))
+		n += 1
+	if 'EndDate' in d:
+		add('917=' + str(d['EndDate']))
+		n += 1
+	if 'DeliveryType' in d:
+		add('919=' + str(d['DeliveryType']))
+		n += 1
+	if 'MarginRatio' in d:
+		add('898=' + str(d['MarginRatio']))
+		n += 1
+	if 'NoUnderlyings' in d:
+		grp = d['NoUnderlyings']
+		add('711=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoUnderlyings(entry, fixm)
+		n += 1
+	if 'NoLegs' in d:
+		grp = d['NoLegs']
+		add('555=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoLegs(entry, fixm)
+		n += 1
+	if 'Quantity' in d:
+		add('53=' + str(d['Quantity']))
+		n += 1
+	if 'QtyType' in d:
+		add('854=' + str(d['QtyType']))
+		n += 1
+	if 'LastMkt' in d:
+		add('30=' + str(d['LastMkt']))
+		n += 1
+	if 'TradeOriginationDate' in d:
+		add('229=' + str(d['TradeOriginationDate']))
+		n += 1
+	if 'TradingSessionID' in d:
+		add('336=' + str(d['TradingSessionID']))
+		n += 1
+	if 'TradingSessionSubID' in d:
+		add('625=' + str(d['TradingSessionSubID']))
+		n += 1
+	if 'PriceType' in d:
+		add('423=' + str(d['PriceType']))
+		n += 1
+	if 'AvgPx' in d:
+		add('6=' + str(d['AvgPx']))
+		n += 1
+	if 'AvgParPx' in d:
+		add('860=' + str(d['AvgParPx']))
+		n += 1
+	if 'Spread' in d:
+		add('218=' + str(d['Spread']))
+		n += 1
+	if 'BenchmarkCurveCurrency' in d:
+		add('220=' + str(d['BenchmarkCurveCurrency']))
+		n += 1
+	if 'BenchmarkCurveName' in d:
+		add('221=' + str(d['BenchmarkCurveName']))
+		n += 1
+	if 'BenchmarkCurvePoint' in d:
+		add('222=' + str(d['BenchmarkCurvePoint']))
+		n += 1
+	if 'BenchmarkPrice' in d:
+		add('662=' + str(d['BenchmarkPrice']))
+		n += 1
+	if 'BenchmarkPriceType' in d:
+		add('663=' + str(d['BenchmarkPriceType']))
+		n += 1
+	if 'BenchmarkSecurityID' in d:
+		add('699=' + str(d['BenchmarkSecurityID']))
+		n += 1
+	if 'BenchmarkSecurityIDSource' in d:
+		add('761=' + str(d['BenchmarkSecurityIDSource']))
+		n += 1
+	if 'Currency' in d:
+		add('15=' + str(d['Currency']))
+		n += 1
+	if 'AvgPxPrecision' in d:
+		add('74=' + str(d['AvgPxPrecision']))
+		n += 1
+	if 'NoPartyIDs' in d:
+		grp = d['NoPartyIDs']
+		add('453=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoPartyIDs(entry, fixm)
+		n += 1
+	if 'TradeDate' in d:
+		add('75=' + str(d['TradeDate']))
+		n += 1
+	if 'TransactTime' in d:
+		add('60=' + str(d['TransactTime']))
+		n += 1
+	if 'SettlType' in d:
+		add('63=' + str(d['SettlType']))
+		n += 1
+	if 'SettlDate' in d:
+		add('64=' + str(d['SettlDate']))
+		n += 1
+	if 'BookingType' in d:
+		add('775=' + str(d['BookingType']))
+		n += 1
+	if 'GrossTradeAmt' in d:
+		add('381=' + str(d['GrossTradeAmt']))
+		n += 1
+	if 'Concession' in d:
+		add('238=' + str(d['Concession']))
+		n += 1
+	if 'TotalTakedown' in d:
+		add('237=' + str(d['TotalTakedown']))
+		n += 1
+	if 'NetMoney' in d:
+		add('118=' + str(d['NetMoney']))
+		n += 1
+	if 'PositionEffect' in d:
+		add('77=' + str(d['PositionEffect']))
+		n += 1
+	if 'AutoAcceptIndicator' in d:
+		add('754=' + str(d['AutoAcceptIndicator']))
+		n += 1
+	if 'Text' in d:
+		add('58=' + str(d['Text']))
+		n += 1
+	if 'EncodedTextLen' in d:
+		add('354=' + str(d['EncodedTextLen']))
+		n += 1
+	if 'EncodedText' in d:
+		add('355=' + str(d['EncodedText']))
+		n += 1
+	if 'NumDaysInterest' in d:
+		add('157=' + str(d['NumDaysInterest']))
+		n += 1
+	if 'AccruedInterestRate' in d:
+		add('158=' + str(d['AccruedInterestRate']))
+		n += 1
+	if 'AccruedInterestAmt' in d:
+		add('159=' + str(d['AccruedInterestAmt']))
+		n += 1
+	if 'TotalAccruedInterestAmt' in d:
+		add('540=' + str(d['TotalAccruedInterestAmt']))
+		n += 1
+	if 'InterestAtMaturity' in d:
+		add('738=' + str(d['InterestAtMaturity']))
+		n += 1
+	if 'EndAccruedInterestAmt' in d:
+		add('920=' + str(d['EndAccruedInterestAmt']))
+		n += 1
+	if 'StartCash' in d:
+		add('921=' + str(d['StartCash']))
+		n += 1
+	if 'EndCash' in d:
+		add('922=' + str(d['EndCash']))
+		n += 1
+	if 'LegalConfirm' in d:
+		add('650=' + str(d['LegalConfirm']))
+		n += 1
+	if 'NoStipulations' in d:
+		grp = d['NoStipulations']
+		add('232=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoStipulations(entry, fixm)
+		n += 1
+	if 'YieldType' in d:
+		add('235=' + str(d['YieldType']))
+		n += 1
+	if 'Yield' in d:
+		add('236=' + str(d['Yield']))
+		n += 1
+	if 'YieldCalcDate' in d:
+		add('701=' + str(d['YieldCalcDate']))
+		n += 1
+	if 'YieldRedemptionDate' in d:
+		add('696=' + str(d['YieldRedemptionDate']))
+		n += 1
+	if 'YieldRedemptionPrice' in d:
+		add('697=' + str(d['YieldRedemptionPrice']))
+		n += 1
+	if 'YieldRedemptionPriceType' in d:
+		add('698=' + str(d['YieldRedemptionPriceType']))
+		n += 1
+	if 'TotNoAllocs' in d:
+		add('892=' + str(d['TotNoAllocs']))
+		n += 1
+	if 'LastFragment' in d:
+		add('893=' + str(d['LastFragment']))
+		n += 1
+	if 'NoAllocs' in d:
+		grp = d['NoAllocs']
+		add('78=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoAllocs(entry, fixm)
+		n += 1
+	if len(d) > n:
+		_make_mbody(obj, obj._context, fixm, _msg_AllocationInstruction_names)
+	return fixm
+
+def _decode_AllocationInstruction(obj, fields, index, context):
+	d = obj.__dict__
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _msg_AllocationInstruction_tags.get(num)
+		if spec is None:
+			# not a field of this message, continue with generic decoder
+			body, index = _extract_body(fields, index, context, obj)
+			return index
+		name, pytype, decode_grp = spec
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	return index
 
 class AllocationInstruction(FixObject):
-	pass
+	_encode = staticmethod(_encode_AllocationInstruction)
+	_decode = staticmethod(_decode_AllocationInstruction)
+
+_msg_AllocationInstructionAck_names = frozenset(['AllocID', 'NoPartyIDs', 'SecondaryAllocID', 'TradeDate', 'TransactTime', 'AllocStatus', 'AllocRejCode', 'AllocType', 'AllocIntermedReqType', 'MatchStatus', 'Product', 'SecurityType', 'Text', 'EncodedTextLen', 'EncodedText', 'NoAllocs'])
+
+_msg_AllocationInstructionAck_tags = {
+	70: ('AllocID', str, None),
+	453: ('NoPartyIDs', int, _decode_grp_NoPartyIDs),
+	793: ('SecondaryAllocID', str, None),
+	75: ('TradeDate', str, None),
+	60: ('TransactTime', str, None),
+	87: ('AllocStatus', int, None),
+	88: ('AllocRejCode', int, None),
+	626: ('AllocType', int, None),
+	808: ('AllocIntermedReqType', int, None),
+	573: ('MatchStatus', str, None),
+	460: ('Product', int, None),
+	167: ('SecurityType', str, None),
+	58: ('Text', str, None),
+	354: ('EncodedTextLen', str, None),
+	355: ('EncodedText', str, None),
+	78: ('NoAllocs', int, _decode_grp_NoAllocs),
+}
+
+def _encode_AllocationInstructionAck(obj, fixm):
+	d = obj.__dict__
+	add = fixm.append
+	n = 1
+	if 'AllocID' in d:
+		add('70=' + str(d['AllocID']))
+		n += 1
+	if 'NoPartyIDs' in d:
+		grp = d['NoPartyIDs']
+		add('453=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoPartyIDs(entry, fixm)
+		n += 1
+	if 'SecondaryAllocID' in d:
+		add('793=' + str(d['SecondaryAllocID']))
+		n += 1
+	if 'TradeDate' in d:
+		add('75=' + str(d['TradeDate']))
+		n += 1
+	if 'TransactTime' in d:
+		add('60=' + str(d['TransactTime']))
+		n += 1
+	if 'AllocStatus' in d:
+		add('87=' + str(d['AllocStatus']))
+		n += 1
+	if 'AllocRejCode' in d:
+		add('88=' + str(d['AllocRejCode']))
+		n += 1
+	if 'AllocType' in d:
+		add('626=' + str(d['AllocType']))
+		n += 1
+	if 'AllocIntermedReqType' in d:
+		add('808=' + str(d['AllocIntermedReqType']))
+		n += 1
+	if 'MatchStatus' in d:
+		add('573=' + str(d['MatchStatus']))
+		n += 1
+	if 'Product' in d:
+		add('460=' + str(d['Product']))
+		n += 1
+	if 'SecurityType' in d:
+		add('167=' + str(d['SecurityType']))
+		n += 1
+	if 'Text' in d:
+		add('58=' + str(d['Text']))
+		n += 1
+	if 'EncodedTextLen' in d:
+		add('354=' + str(d['EncodedTextLen']))
+		n += 1
+	if 'EncodedText' in d:
+		add('355=' + str(d['EncodedText']))
+		n += 1
+	if 'NoAllocs' in d:
+		grp = d['NoAllocs']
+		add('78=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoAllocs(entry, fixm)
+		n += 1
+	if len(d) > n:
+		_make_mbody(obj, obj._context, fixm, _msg_AllocationInstructionAck_names)
+	return fixm
+
+def _decode_AllocationInstructionAck(obj, fields, index, context):
+	d = obj.__dict__
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _msg_AllocationInstructionAck_tags.get(num)
+		if spec is None:
+			# not a field of this message, continue with generic decoder
+			body, index = _extract_body(fields, index, context, obj)
+			return index
+		name, pytype, decode_grp = spec
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	return index
+
+class AllocationInstructionAck(FixObject):
+	_encode = staticmethod(_encode_AllocationInstructionAck)
+	_decode = staticmethod(_decode_AllocationInstructionAck)
+
+_msg_AllocationReport_names = frozenset(['AllocReportID', 'AllocID', 'AllocTransType', 'AllocReportRefID', 'AllocCancReplaceReason', 'SecondaryAllocID', 'AllocReportType', 'AllocStatus', 'AllocRejCode', 'RefAllocID', 'AllocIntermedReqType', 'AllocLinkID', 'AllocLinkType', 'BookingRefID', 'AllocNoOrdersType', 'NoOrders', 'NoExecs', 'PreviouslyReported', 'ReversalIndicator', 'MatchType', 'Side', 'Symbol', 'SymbolSfx', 'SecurityID', 'SecurityIDSource', 'NoSecurityAltID', 'Product', 'CFICode', 'SecurityType', 'SecuritySubType', 'MaturityMonthYear', 'MaturityDate', 'CouponPaymentDate', 'IssueDate', 'RepoCollateralSecurityType', 'RepurchaseTerm', 'RepurchaseRate', 'Factor', 'CreditRating', 'InstrRegistry', 'CountryOfIssue', 'StateOrProvinceOfIssue', 'LocaleOfIssue', 'RedemptionDate', 'StrikePrice', 'StrikeCurrency', 'OptAttribute', 'ContractMultiplier', 'CouponRate', 'SecurityExchange', 'Issuer', 'EncodedIssuerLen', 'EncodedIssuer', 'SecurityDesc', 'EncodedSecurityDescLen', 'EncodedSecurityDesc', 'Pool', 'ContractSettlMonth', 'CPProgram', 'CPRegType', 'NoEvents', 'DatedDate', 'InterestAccrualDate', 'DeliveryForm', 'PctAtRisk', 'NoInstrAttrib', 'AgreementDesc', 'AgreementID', 'AgreementDate', 'AgreementCurrency', 'TerminationType', 'StartDate', 'EndDate', 'DeliveryType', 'MarginRatio', 'NoUnderlyings', 'NoLegs', 'Quantity', 'QtyType', 'LastMkt', 'TradeOriginationDate', 'TradingSessionID', 'TradingSessionSubID', 'PriceType', 'AvgPx', 'AvgParPx', 'Spread', 'BenchmarkCurveCurrency', 'BenchmarkCurveName', 'BenchmarkCurvePoint', 'BenchmarkPrice', 'BenchmarkPriceType', 'BenchmarkSecurityID', 'BenchmarkSecurityIDSource', 'Currency', 'AvgPxPrecision', 'NoPartyIDs', 'TradeDate', 'TransactTime', 'SettlType', 'SettlDate', 'BookingType', 'GrossTradeAmt', 'Concession', 'TotalTakedown', 'NetMoney', 'PositionEffect', 'AutoAcceptIndicator', 'Text', 'EncodedTextLen', 'EncodedText', 'NumDaysInterest', 'AccruedInterestRate', 'AccruedInterestAmt', 'TotalAccruedInterestAmt', 'InterestAtMaturity', 'EndAccruedInterestAmt', 'StartCash', 'EndCash', 'LegalConfirm', 'NoStipulations', 'YieldType', 'Yield', 'YieldCalcDate', 'YieldRedemptionDate', 'YieldRedemptionPrice', 'YieldRedemptionPriceType', 'TotNoAllocs', 'LastFragment', 'NoAllocs'])
+
+_msg_AllocationReport_tags = {
+	755: ('AllocReportID', str, None),
+	70: ('AllocID', str, None),
+	71: ('AllocTransType', str, None),
+	795: ('AllocReportRefID', str, None),
+	796: ('AllocCancReplaceReason', int, None),
+	793: ('SecondaryAllocID', str, None),
+	794: ('AllocReportType', int, None),
+	87: ('AllocStatus', int, None),
+	88: ('AllocRejCode', int, None),
+	72: ('RefAllocID', str, None),
+	808: ('AllocIntermedReqType', int, None),
+	196: ('AllocLinkID', str, None),
+	197: ('AllocLinkType', int, None),
+	466: ('BookingRefID', str, None),
+	857: ('AllocNoOrdersType', int, None),
+	73: ('NoOrders', int, _decode_grp_NoOrders),
+	124: ('NoExecs', int, _decode_grp_NoExecs),
+	570: ('PreviouslyReported', str, None),
+	700: ('ReversalIndicator', str, None),
+	574: ('MatchType', str, None),
+	54: ('Side', str, None),
+	55: ('Symbol', str, None),
+	65: ('SymbolSfx', str, None),
+	48: ('SecurityID', str, None),
+	22: ('SecurityIDSource', str, None),
+	454: ('NoSecurityAltID', int, _decode_grp_NoSecurityAltID),
+	460: ('Product', int, None),
+	461: ('CFICode', str, None),
+	167: ('SecurityType', str, None),
+	762: ('SecuritySubType', str, None),
+	200: ('MaturityMonthYear', str, None),
+	541: ('MaturityDate', str, None),
+	224: ('CouponPaymentDate', str, None),
+	225: ('IssueDate', str, None),
+	239: ('RepoCollateralSecurityType', int, None),
+	226: ('RepurchaseTerm', int, None),
+	227: ('RepurchaseRate', float, None),
+	228: ('Factor', float, None),
+	255: ('CreditRating', str, None),
+	543: ('InstrRegistry', str, None),
+	470: ('CountryOfIssue', str, None),
+	471: ('StateOrProvinceOfIssue', str, None),
+	472: ('LocaleOfIssue', str, None),
+	240: ('RedemptionDate', str, None),
+	202: ('StrikePrice', float, None),
+	947: ('StrikeCurrency', str, None),
+	206: ('OptAttribute', str, None),
+	231: ('ContractMultiplier', float, None),
+	223: ('CouponRate', float, None),
+	207: ('SecurityExchange', str, None),
+	106: ('Issuer', str, None),
+	348: ('EncodedIssuerLen', str, None),
+	349: ('EncodedIssuer', str, None),
+	107: ('SecurityDesc', str, None),
+	350: ('EncodedSecurityDescLen', str, None),
+	351: ('EncodedSecurityDesc', str, None),
+	691: ('Pool', str, None),
+	667: ('ContractSettlMonth', str, None),
+	875: ('CPProgram', int, None),
+	876: ('CPRegType', str, None),
+	864: ('NoEvents', int, _decode_grp_NoEvents),
+	873: ('DatedDate', str, None),
+	874: ('InterestAccrualDate', str, None),
+	668: ('DeliveryForm', int, None),
+	869: ('PctAtRisk', float, None),
+	870: ('NoInstrAttrib', int, _decode_grp_NoInstrAttrib),
+	913: ('AgreementDesc', str, None),
+	914: ('AgreementID', str, None),
+	915: ('AgreementDate', str, None),
+	918: ('AgreementCurrency', str, None),
+	788: ('TerminationType', int, None),
+	916: ('StartDate', str, None),
+	917: ('EndDate', str, None),
+	919: ('DeliveryType', int, None),
+	898: ('MarginRatio', float, None),
+	711: ('NoUnderlyings', int, _decode_grp_NoUnderlyings),
+	555: ('NoLegs', int, _decode_grp_NoLegs),
+	53: ('Quantity', float, None),
+	854: ('QtyType', int, None),
+	30: ('LastMkt', str, None),
+	229: ('TradeOriginationDate', str, None),
+	336: ('TradingSessionID', str, None),
+	625: ('TradingSessionSubID', str, None),
+	423: ('PriceType', int, None),
+	6: ('AvgPx', float, None),
+	860: ('AvgParPx', float, None),
+	218: ('Spread', float, None),
+	220: ('BenchmarkCurveCurrency', str, None),
+	221: ('BenchmarkCurveName', str, None),
+	222: ('BenchmarkCurvePoint', str, None),
+	662: ('BenchmarkPrice', float, None),
+	663: ('BenchmarkPriceType', int, None),
+	699: ('BenchmarkSecurityID', str, None),
+	761: ('BenchmarkSecurityIDSource', str, None),
+	15: ('Currency', str, None),
+	74: ('AvgPxPrecision', int, None),
+	453: ('NoPartyIDs', int, _decode_grp_NoPartyIDs),
+	75: ('TradeDate', str, None),
+	60: ('TransactTime', str, None),
+	63: ('SettlType', str, None),
+	64: ('SettlDate', str, None),
+	775: ('BookingType', int, None),
+	381: ('GrossTradeAmt', float, None),
+	238: ('Concession', float, None),
+	237: ('TotalTakedown', float, None),
+	118: ('NetMoney', float, None),
+	77: ('PositionEffect', str, None),
+	754: ('AutoAcceptIndicator', str, None),
+	58: ('Text', str, None),
+	354: ('EncodedTextLen', str, None),
+	355: ('EncodedText', str, None),
+	157: ('NumDaysInterest', int, None),
+	158: ('AccruedInterestRate', float, None),
+	159: ('AccruedInterestAmt', float, None),
+	540: ('TotalAccruedInterestAmt', float, None),
+	738: ('InterestAtMaturity', float, None),
+	920: ('EndAccruedInterestAmt', float, None),
+	921: ('StartCash', float, None),
+	922: ('EndCash', float, None),
+	650: ('LegalConfirm', str, None),
+	232: ('NoStipulations', int, _decode_grp_NoStipulations),
+	235: ('YieldType', str, None),
+	236: ('Yield', float, None),
+	701: ('YieldCalcDate', str, None),
+	696: ('YieldRedemptionDate', str, None),
+	697: ('YieldRedemptionPrice', float, None),
+	698: ('YieldRedemptionPriceType', int, None),
+	892: ('TotNoAllocs', int, None),
+	893: ('LastFragment', str, None),
+	78: ('NoAllocs', int, _decode_grp_NoAllocs),
+}
+
+def _encode_AllocationReport(obj, fixm):
+	d = obj.__dict__
+	add = fixm.append
+	n = 1
+	if 'AllocReportID' in d:
+		add('755=' + str(d['AllocReportID']))
+		n += 1
+	if 'AllocID' in d:
+		add('70=' + str(d['AllocID']))
+		n += 1
+	if 'AllocTransType' in d:
+		add('71=' + str(d['AllocTransType']))
+		n += 1
+	if 'AllocReportRefID' in d:
+		add('795=' + str(d['AllocReportRefID']))
+		n += 1
+	if 'AllocCancReplaceReason' in d:
+		add('796=' + str(d['AllocCancReplaceReason']))
+		n += 1
+	if 'SecondaryAllocID' in d:
+		add('793=' + str(d['SecondaryAllocID']))
+		n += 1
+	if 'AllocReportType' in d:
+		add('794=' + str(d['AllocReportType']))
+		n += 1
+	if 'AllocStatus' in d:
+		add('87=' + str(d['AllocStatus']))
+		n += 1
+	if 'AllocRejCode' in d:
+		add('88=' + str(d['AllocRejCode']))
+		n += 1
+	if 'RefAllocID' in d:
+		add('72=' + str(d['RefAllocID']))
+		n += 1
+	if 'AllocIntermedReqType' in d:
+		add('808=' + str(d['AllocIntermedReqType']))
+		n += 1
+	if 'AllocLinkID' in d:
+		add('196=' + str(d['AllocLinkID']))
+		n += 1
+	if 'AllocLinkType' in d:
+		add('197=' + str(d['AllocLinkType']))
+		n += 1
+	if 'BookingRefID' in d:
+		add('466=' + str(d['BookingRefID']))
+		n += 1
+	if 'AllocNoOrdersType' in d:
+		add('857=' + str(d['AllocNoOrdersType']))
+		n += 1
+	if 'NoOrders' in d:
+		grp = d['NoOrders']
+		add('73=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoOrders(entry, fixm)
+		n += 1
+	if 'NoExecs' in d:
+		grp = d['NoExecs']
+		add('124=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoExecs(entry, fixm)
+		n += 1
+	if 'PreviouslyReported' in d:
+		add('570=' + str(d['PreviouslyReported']))
+		n += 1
+	if 'ReversalIndicator' in d:
+		add('700=' + str(d['ReversalIndicator']))
+		n += 1
+	if 'MatchType' in d:
+		add('574=' + str(d['MatchType']))
+		n += 1
+	if 'Side' in d:
+		add('54=' + str(d['Side']))
+		n += 1
+	if 'Symbol' in d:
+		add('55=' + str(d['Symbol']))
+		n += 1
+	if 'SymbolSfx' in d:
+		add('65=' + str(d['SymbolSfx']))
+		n += 1
+	if 'SecurityID' in d:
+		add('48=' + str(d['SecurityID']))
+		n += 1
+	if 'SecurityIDSource' in d:
+		add('22=' + str(d['SecurityIDSource']))
+		n += 1
+	if 'NoSecurityAltID' in d:
+		grp = d['NoSecurityAltID']
+		add('454=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoSecurityAltID(entry, fixm)
+		n += 1
+	if 'Product' in d:
+		add('460=' + str(d['Product']))
+		n += 1
+	if 'CFICode' in d:
+		add('461=' + str(d['CFICode']))
+		n += 1
+	if 'SecurityType' in d:
+		add('167=' + str(d['SecurityType']))
+		n += 1
+	if 'SecuritySubType' in d:
+		add('762=' + str(d['SecuritySubType']))
+		n += 1
+	if 'MaturityMonthYear' in d:
+		add('200=' + str(d['MaturityMonthYear']))
+		n += 1
+	if 'MaturityDate' in d:
+		add('541=' + str(d['MaturityDate']))
+		n += 1
+	if 'CouponPaymentDate' in d:
+		add('224=' + str(d['CouponPaymentDate']))
+		n += 1
+	if 'IssueDate' in d:
+		add('225=' + str(d['IssueDate']))
+		n += 1
+	if 'RepoCollateralSecurityType' in d:
+		add('239=' + str(d['RepoCollateralSecurityType']))
+		n += 1
+	if 'RepurchaseTerm' in d:
+		add('226=' + str(d['RepurchaseTerm']))
+		n += 1
+	if 'RepurchaseRate' in d:
+		add('227=' + str(d['RepurchaseRate']))
+		n += 1
+	if 'Factor' in d:
+		add('228=' + str(d['Factor']))
+		n += 1
+	if 'CreditRating' in d:
+		add('255=' + str(d['CreditRating']))
+		n += 1
+	if 'InstrRegistry' in d:
+		add('543=' + str(d['InstrRegistry']))
+		n += 1
+	if 'CountryOfIssue' in d:
+		add('470=' + str(d['CountryOfIssue']))
+		n += 1
+	if 'StateOrProvinceOfIssue' in d:
+		add('471=' + str(d['StateOrProvinceOfIssue']))
+		n += 1
+	if 'LocaleOfIssue' in d:
+		add('472=' + str(d['LocaleOfIssue']))
+		n += 1
+	if 'RedemptionDate' in d:
+		add('240=' + str(d['RedemptionDate']))
+		n += 1
+	if 'StrikePrice' in d:
+		add('202=' + str(d['StrikePrice']))
+		n += 1
+	if 'StrikeCurrency' in d:
+		add('947=' + str(d['StrikeCurrency']))
+		n += 1
+	if 'OptAttribute' in d:
+		add('206=' + str(d['OptAttribute']))
+		n += 1
+	if 'ContractMultiplier' in d:
+		add('231=' + str(d['ContractMultiplier']))
+		n += 1
+	if 'CouponRate' in d:
+		add('223=' + str(d['CouponRate']))
+		n += 1
+	if 'SecurityExchange' in d:
+		add('207=' + str(d['SecurityExchange']))
+		n += 1
+	if 'Issuer' in d:
+		add('106=' + str(d['Issuer']))
+		n += 1
+	if 'EncodedIssuerLen' in d:
+		add('348=' + str(d['EncodedIssuerLen']))
+		n += 1
+	if 'EncodedIssuer' in d:
+		add('349=' + str(d['EncodedIssuer']))
+		n += 1
+	if 'SecurityDesc' in d:
+		add('107=' + str(d['SecurityDesc']))
+		n += 1
+	if 'EncodedSecurityDescLen' in d:
+		add('350=' + str(d['EncodedSecurityDescLen']))
+		n += 1
+	if 'EncodedSecurityDesc' in d:
+		add('351=' + str(d['EncodedSecurityDesc']))
+		n += 1
+	if 'Pool' in d:
+		add('691=' + str(d['Pool']))
+		n += 1
+	if 'ContractSettlMonth' in d:
+		add('667=' + str(d['ContractSettlMonth']))
+		n += 1
+	if 'CPProgram' in d:
+		add('875=' + str(d['CPProgram']))
+		n += 1
+	if 'CPRegType' in d:
+		add('876=' + str(d['CPRegType']))
+		n += 1
+	if 'NoEvents' in d:
+		grp = d['NoEvents']
+		add('864=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoEvents(entry, fixm)
+		n += 1
+	if 'DatedDate' in d:
+		add('873=' + str(d['DatedDate']))
+		n += 1
+	if 'InterestAccrualDate' in d:
+		add('874=' + str(d['InterestAccrualDate']))
+		n += 1
+	if 'DeliveryForm' in d:
+		add('668=' + str(d['DeliveryForm']))
+		n += 1
+	if 'PctAtRisk' in d:
+		add('869=' + str(d['PctAtRisk']))
+		n += 1
+	if 'NoInstrAttrib' in d:
+		grp = d['NoInstrAttrib']
+		add('870=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoInstrAttrib(entry, fixm)
+		n += 1
+	if 'AgreementDesc' in d:
+		add('913=' + str(d['AgreementDesc']))
+		n += 1
+	if 'AgreementID' in d:
+		add('914=' + str(d['AgreementID']))
+		n += 1
+	if 'AgreementDate' in d:
+		add('915=' + str(d['AgreementDate']))
+		n += 1
+	if 'AgreementCurrency' in d:
+		add('918=' + str(d['AgreementCurrency']))
+		n += 1
+	if 'TerminationType' in d:
+		add('788=' + str(d['TerminationType']))
+		n += 1
+	if 'StartDate' in d:
+		add('916=' + str(d['StartDate']))
+		n += 1
+	if 'EndDate' in d:
+		add('917=' + str(d['EndDate']))
+		n += 1
+	if 'DeliveryType' in d:
+		add('919=' + str(d['DeliveryType']))
+		n += 1
+	if 'MarginRatio' in d:
+		add('898=' + str(d['MarginRatio']))
+		n += 1
+	if 'NoUnderlyings' in d:
+		grp = d['NoUnderlyings']
+		add('711=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoUnderlyings(entry, fixm)
+		n += 1
+	if 'NoLegs' in d:
+		grp = d['NoLegs']
+		add('555=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoLegs(entry, fixm)
+		n += 1
+	if 'Quantity' in d:
+		add('53=' + str(d['Quantity']))
+		n += 1
+	if 'QtyType' in d:
+		add('854=' + str(d['QtyType']))
+		n += 1
+	if 'LastMkt' in d:
+		add('30=' + str(d['LastMkt']))
+		n += 1
+	if 'TradeOriginationDate' in d:
+		add('229=' + str(d['TradeOriginationDate']))
+		n += 1
+	if 'TradingSessionID' in d:
+		add('336=' + str(d['TradingSessionID']))
+		n += 1
+	if 'TradingSessionSubID' in d:
+		add('625=' + str(d['TradingSessionSubID']))
+		n += 1
+	if 'PriceType' in d:
+		add('423=' + str(d['PriceType']))
+		n += 1
+	if 'AvgPx' in d:
+		add('6=' + str(d['AvgPx']))
+		n += 1
+	if 'AvgParPx' in d:
+		add('860=' + str(d['AvgParPx']))
+		n += 1
+	if 'Spread' in d:
+		add('218=' + str(d['Spread']))
+		n += 1
+	if 'BenchmarkCurveCurrency' in d:
+		add('220=' + str(d['BenchmarkCurveCurrency']))
+		n += 1
+	if 'BenchmarkCurveName' in d:
+		add('221=' + str(d['BenchmarkCurveName']))
+		n += 1
+	if 'BenchmarkCurvePoint' in d:
+		add('222=' + str(d['BenchmarkCurvePoint']))
+		n += 1
+	if 'BenchmarkPrice' in d:
+		add('662=' + str(d['BenchmarkPrice']))
+		n += 1
+	if 'BenchmarkPriceType' in d:
+		add('663=' + str(d['BenchmarkPriceType']))
+		n += 1
+	if 'BenchmarkSecurityID' in d:
+		add('699=' + str(d['BenchmarkSecurityID']))
+		n += 1
+	if 'BenchmarkSecurityIDSource' in d:
+		add('761=' + str(d['BenchmarkSecurityIDSource']))
+		n += 1
+	if 'Currency' in d:
+		add('15=' + str(d['Currency']))
+		n += 1
+	if 'AvgPxPrecision' in d:
+		add('74=' + str(d['AvgPxPrecision']))
+		n += 1
+	if 'NoPartyIDs' in d:
+		grp = d['NoPartyIDs']
+		add('453=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoPartyIDs(entry, fixm)
+		n += 1
+	if 'TradeDate' in d:
+		add('75=' + str(d['TradeDate']))
+		n += 1
+	if 'TransactTime' in d:
+		add('60=' + str(d['TransactTime']))
+		n += 1
+	if 'SettlType' in d:
+		add('63=' + str(d['SettlType']))
+		n += 1
+	if 'SettlDate' in d:
+		add('64=' + str(d['SettlDate']))
+		n += 1
+	if 'BookingType' in d:
+		add('775=' + str(d['BookingType']))
+		n += 1
+	if 'GrossTradeAmt' in d:
+		add('381=' + str(d['GrossTradeAmt']))
+		n += 1
+	if 'Concession' in d:
+		add('238=' + str(d['Concession']))
+		n += 1
+	if 'TotalTakedown' in d:
+		add('237=' + str(d['TotalTakedown']))
+		n += 1
+	if 'NetMoney' in d:
+		add('118=' + str(d['NetMoney']))
+		n += 1
+	if 'PositionEffect' in d:
+		add('77=' + str(d['PositionEffect']))
+		n += 1
+	if 'AutoAcceptIndicator' in d:
+		add('754=' + str(d['AutoAcceptIndicator']))
+		n += 1
+	if 'Text' in d:
+		add('58=' + str(d['Text']))
+		n += 1
+	if 'EncodedTextLen' in d:
+		add('354=' + str(d['EncodedTextLen']))
+		n += 1
+	if 'EncodedText' in d:
+		add('355=' + str(d['EncodedText']))
+		n += 1
+	if 'NumDaysInterest' in d:
+		add('157=' + str(d['NumDaysInterest']))
+		n += 1
+	if 'AccruedInterestRate' in d:
+		add('158=' + str(d['AccruedInterestRate']))
+		n += 1
+	if 'AccruedInterestAmt' in d:
+		add('159=' + str(d['AccruedInterestAmt']))
+		n += 1
+	if 'TotalAccruedInterestAmt' in d:
+		add('540=' + str(d['TotalAccruedInterestAmt']))
+		n += 1
+	if 'InterestAtMaturity' in d:
+		add('738=' + str(d['InterestAtMaturity']))
+		n += 1
+	if 'EndAccruedInterestAmt' in d:
+		add('920=' + str(d['EndAccruedInterestAmt']))
+		n += 1
+	if 'StartCash' in d:
+		add('921=' + str(d['StartCash']))
+		n += 1
+	if 'EndCash' in d:
+		add('922=' + str(d['EndCash']))
+		n += 1
+	if 'LegalConfirm' in d:
+		add('650=' + str(d['LegalConfirm']))
+		n += 1
+	if 'NoStipulations' in d:
+		grp = d['NoStipulations']
+		add('232=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoStipulations(entry, fixm)
+		n += 1
+	if 'YieldType' in d:
+		add('235=' + str(d['YieldType']))
+		n += 1
+	if 'Yield' in d:
+		add('236=' + str(d['Yield']))
+		n += 1
+	if 'YieldCalcDate' in d:
+		add('701=' + str(d['YieldCalcDate']))
+		n += 1
+	if 'YieldRedemptionDate' in d:
+		add('696=' + str(d['YieldRedemptionDate']))
+		n += 1
+	if 'YieldRedemptionPrice' in d:
+		add('697=' + str(d['YieldRedemptionPrice']))
+		n += 1
+	if 'YieldRedemptionPriceType' in d:
+		add('698=' + str(d['YieldRedemptionPriceType']))
+		n += 1
+	if 'TotNoAllocs' in d:
+		add('892=' + str(d['TotNoAllocs']))
+		n += 1
+	if 'LastFragment' in d:
+		add('893=' + str(d['LastFragment']))
+		n += 1
+	if 'NoAllocs' in d:
+		grp = d['NoAllocs']
+		add('78=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoAllocs(entry, fixm)
+		n += 1
+	if len(d) > n:
+		_make_mbody(obj, obj._context, fixm, _msg_AllocationReport_names)
+	return fixm
+
+def _decode_AllocationReport(obj, fields, index, context):
+	d = obj.__dict__
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _msg_AllocationReport_tags.get(num)
+		if spec is None:
+			# not a field of this message, continue with generic decoder
+			body, index = _extract_body(fields, index, context, obj)
+			return index
+		name, pytype, decode_grp = spec
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	return index
+
+class AllocationReport(FixObject):
+	_encode = staticmethod(_encode_AllocationReport)
+	_decode = staticmethod(_decode_AllocationReport)
+
+_msg_AllocationReportAck_names = frozenset(['AllocReportID', 'AllocID', 'NoPartyIDs', 'SecondaryAllocID', 'TradeDate', 'TransactTime', 'AllocStatus', 'AllocRejCode', 'AllocReportType', 'AllocIntermedReqType', 'MatchStatus', 'Product', 'SecurityType', 'Text', 'EncodedTextLen', 'EncodedText', 'NoAllocs'])
+
+_msg_AllocationReportAck_tags = {
+	755: ('AllocReportID', str, None),
+	70: ('AllocID', str, None),
+	453: ('NoPartyIDs', int, _decode_grp_NoPartyIDs),
+	793: ('SecondaryAllocID', str, None),
+	75: ('TradeDate', str, None),
+	60: ('TransactTime', str, None),
+	87: ('AllocStatus', int, None),
+	88: ('AllocRejCode', int, None),
+	794: ('AllocReportType', int, None),
+	808: ('AllocIntermedReqType', int, None),
+	573: ('MatchStatus', str, None),
+	460: ('Product', int, None),
+	167: ('SecurityType', str, None),
+	58: ('Text', str, None),
+	354: ('EncodedTextLen', str, None),
+	355: ('EncodedText', str, None),
+	78: ('NoAllocs', int, _decode_grp_NoAllocs),
+}
+
+def _encode_AllocationReportAck(obj, fixm):
+	d = obj.__dict__
+	add = fixm.append
+	n = 1
+	if 'AllocReportID' in d:
+		add('755=' + str(d['AllocReportID']))
+		n += 1
+	if 'AllocID' in d:
+		add('70=' + str(d['AllocID']))
+		n += 1
+	if 'NoPartyIDs' in d:
+		grp = d['NoPartyIDs']
+		add('453=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoPartyIDs(entry, fixm)
+		n += 1
+	if 'SecondaryAllocID' in d:
+		add('793=' + str(d['SecondaryAllocID']))
+		n += 1
+	if 'TradeDate' in d:
+		add('75=' + str(d['TradeDate']))
+		n += 1
+	if 'TransactTime' in d:
+		add('60=' + str(d['TransactTime']))
+		n += 1
+	if 'AllocStatus' in d:
+		add('87=' + str(d['AllocStatus']))
+		n += 1
+	if 'AllocRejCode' in d:
+		add('88=' + str(d['AllocRejCode']))
+		n += 1
+	if 'AllocReportType' in d:
+		add('794=' + str(d['AllocReportType']))
+		n += 1
+	if 'AllocIntermedReqType' in d:
+		add('808=' + str(d['AllocIntermedReqType']))
+		n += 1
+	if 'MatchStatus' in d:
+		add('573=' + str(d['MatchStatus']))
+		n += 1
+	if 'Product' in d:
+		add('460=' + str(d['Product']))
+		n += 1
+	if 'SecurityType' in d:
+		add('167=' + str(d['SecurityType']))
+		n += 1
+	if 'Text' in d:
+		add('58=' + str(d['Text']))
+		n += 1
+	if 'EncodedTextLen' in d:
+		add('354=' + str(d['EncodedTextLen']))
+		n += 1
+	if 'EncodedText' in d:
+		add('355=' + str(d['EncodedText']))
+		n += 1
+	if 'NoAllocs' in d:
+		grp = d['NoAllocs']
+		add('78=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoAllocs(entry, fixm)
+		n += 1
+	if len(d) > n:
+		_make_mbody(obj, obj._context, fixm, _msg_AllocationReportAck_names)
+	return fixm
+
+def _decode_AllocationReportAck(obj, fields, index, context):
+	d = obj.__dict__
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _msg_AllocationReportAck_tags.get(num)
+		if spec is None:
+			# not a field of this message, continue with generic decoder
+			body, index = _extract_body(fields, index, context, obj)
+			return index
+		name, pytype, decode_grp = spec
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	return index
+
+class AllocationReportAck(FixObject):
+	_encode = staticmethod(_encode_AllocationReportAck)
+	_decode = staticmethod(_decode_AllocationReportAck)
+
+_msg_AssignmentReport_names = frozenset(['AsgnRptID', 'TotNumAssignmentReports', 'LastRptRequested', 'NoPartyIDs', 'Account', 'AccountType', 'Symbol', 'SymbolSfx', 'SecurityID', 'SecurityIDSource', 'NoSecurityAltID', 'Product', 'CFICode', 'SecurityType', 'SecuritySubType', 'MaturityMonthYear', 'MaturityDate', 'CouponPaymentDate', 'IssueDate', 'RepoCollateralSecurityType', 'RepurchaseTerm', 'RepurchaseRate', 'Factor', 'CreditRating', 'InstrRegistry', 'CountryOfIssue', 'StateOrProvinceOfIssue', 'LocaleOfIssue', 'RedemptionDate', 'StrikePrice', 'StrikeCurrency', 'OptAttribute', 'ContractMultiplier', 'CouponRate', 'SecurityExchange', 'Issuer', 'EncodedIssuerLen', 'EncodedIssuer', 'SecurityDesc', 'EncodedSecurityDescLen', 'EncodedSecurityDesc', 'Pool', 'ContractSettlMonth', 'CPProgram', 'CPRegType', 'NoEvents', 'DatedDate', 'InterestAccrualDate', 'Currency', 'NoLegs', 'LegSymbol', 'LegSymbolSfx', 'LegSecurityID', 'LegSecurityIDSource', 'NoLegSecurityAltID', 'LegProduct', 'LegCFICode', 'LegSecurityType', 'LegSecuritySubType', 'LegMaturityMonthYear', 'LegMaturityDate', 'LegCouponPaymentDate', 'LegIssueDate', 'LegRepoCollateralSecurityType', 'LegRepurchaseTerm', 'LegRepurchaseRate', 'LegFactor', 'LegCreditRating', 'LegInstrRegistry', 'LegCountryOfIssue', 'LegStateOrProvinceOfIssue', 'LegLocaleOfIssue', 'LegRedemptionDate', 'LegStrikePrice', 'LegStrikeCurrency', 'LegOptAttribute', 'LegContractMultiplier', 'LegCouponRate', 'LegSecurityExchange', 'LegIssuer', 'EncodedLegIssuerLen', 'EncodedLegIssuer', 'LegSecurityDesc', 'EncodedLegSecurityDescLen', 'EncodedLegSecurityDesc', 'LegRatioQty', 'LegSide', 'LegCurrency', 'LegPool', 'LegDatedDate', 'LegContractSettlMonth', 'LegInterestAccrualDate', 'NoUnderlyings', 'NoPositions', 'NoPosAmt', 'ThresholdAmount', 'SettlPrice', 'SettlPriceType', 'UnderlyingSettlPrice', 'ExpireDate', 'AssignmentMethod', 'AssignmentUnit', 'OpenInterest', 'ExerciseMethod', 'SettlSessID', 'SettlSessSubID', 'ClearingBusinessDate', 'Text', 'EncodedTextLen', 'EncodedText'])
+
+_msg_AssignmentReport_tags = {
+	833: ('AsgnRptID', str, None),
+	832: ('TotNumAssignmentReports', int, None),
+	912: ('LastRptRequested', str, None),
+	453: ('NoPartyIDs', int, _decode_grp_NoPartyIDs),
+	1: ('Account', str, None),
+	581: ('AccountType', int, None),
+	55: ('Symbol', str, None),
+	65: ('SymbolSfx', str, None),
+	48: ('SecurityID', str, None),
+	22: ('SecurityIDSource', str, None),
+	454: ('NoSecurityAltID', int, _decode_grp_NoSecurityAltID),
+	460: ('Product', int, None),
+	461: ('CFICode', str, None),
+	167: ('SecurityType', str, None),
+	762: ('SecuritySubType', str, None),
+	200: ('MaturityMonthYear', str, None),
+	541: ('MaturityDate', str, None),
+	224: ('CouponPaymentDate', str, None),
+	225: ('IssueDate', str, None),
+	239: ('RepoCollateralSecurityType', int, None),
+	226: ('RepurchaseTerm', int, None),
+	227: ('RepurchaseRate', float, None),
+	228: ('Factor', float, None),
+	255: ('CreditRating', str, None),
+	543: ('InstrRegistry', str, None),
+	470: ('CountryOfIssue', str, None),
+	471: ('StateOrProvinceOfIssue', str, None),
+	472: ('LocaleOfIssue', str, None),
+	240: ('RedemptionDate', str, None),
+	202: ('StrikePrice', float, None),
+	947: ('StrikeCurrency', str, None),
+	206: ('OptAttribute', str, None),
+	231: ('ContractMultiplier', float, None),
+	223: ('CouponRate', float, None),
+	207: ('SecurityExchange', str, None),
+	106: ('Issuer', str, None),
+	348: ('EncodedIssuerLen', str, None),
+	349: ('EncodedIssuer', str, None),
+	107: ('SecurityDesc', str, None),
+	350: ('EncodedSecurityDescLen', str, None),
+	351: ('EncodedSecurityDesc', str, None),
+	691: ('Pool', str, None),
+	667: ('ContractSettlMonth', str, None),
+	875: ('CPProgram', int, None),
+	876: ('CPRegType', str, None),
+	864: ('NoEvents', int, _decode_grp_NoEvents),
+	873: ('DatedDate', str, None),
+	874: ('InterestAccrualDate', str, None),
+	15: ('Currency', str, None),
+	555: ('NoLegs', int, _decode_grp_NoLegs),
+	600: ('LegSymbol', str, None),
+	601: ('LegSymbolSfx', str, None),
+	602: ('LegSecurityID', str, None),
+	603: ('LegSecurityIDSource', str, None),
+	604: ('NoLegSecurityAltID', str, None),
+	607: ('LegProduct', int, None),
+	608: ('LegCFICode', str, None),
+	609: ('LegSecurityType', str, None),
+	764: ('LegSecuritySubType', str, None),
+	610: ('LegMaturityMonthYear', str, None),
+	611: ('LegMaturityDate', str, None),
+	248: ('LegCouponPaymentDate', str, None),
+	249: ('LegIssueDate', str, None),
+	250: ('LegRepoCollateralSecurityType', int, None),
+	251: ('LegRepurchaseTerm', int, None),
+	252: ('LegRepurchaseRate', float, None),
+	253: ('LegFactor', float, None),
+	257: ('LegCreditRating', str, None),
+	599: ('LegInstrRegistry', str, None),
+	596: ('LegCountryOfIssue', str, None),
+	597: ('LegStateOrProvinceOfIssue', str, None),
+	598: ('LegLocaleOfIssue', str, None),
+	254: ('LegRedemptionDate', str, None),
+	612: ('LegStrikePrice', float, None),
+	942: ('LegStrikeCurrency', str, None),
+	613: ('LegOptAttribute', str, None),
+	614: ('LegContractMultiplier', float, None),
+	615: ('LegCouponRate', float, None),
+	616: ('LegSecurityExchange', str, None),
+	617: ('LegIssuer', str, None),
+	618: ('EncodedLegIssuerLen', str, None),
+	619: ('EncodedLegIssuer', str, None),
+	620: ('LegSecurityDesc', str, None),
+	621: ('EncodedLegSecurityDescLen', str, None),
+	622: ('EncodedLegSecurityDesc', str, None),
+	623: ('LegRatioQty', float, None),
+	624: ('LegSide', str, None),
+	556: ('LegCurrency', str, None),
+	740: ('LegPool', str, None),
+	739: ('LegDatedDate', str, None),
+	955: ('LegContractSettlMonth', str, None),
+	956: ('LegInterestAccrualDate', str, None),
+	711: ('NoUnderlyings', int, _decode_grp_NoUnderlyings),
+	702: ('NoPositions', int, _decode_grp_NoPositions),
+	753: ('NoPosAmt', int, _decode_grp_NoPosAmt),
+	834: ('ThresholdAmount', float, None),
+	730: ('SettlPrice', float, None),
+	731: ('SettlPriceType', int, None),
+	732: ('UnderlyingSettlPrice', float, None),
+	432: ('ExpireDate', str, None),
+	744: ('AssignmentMethod', str, None),
+	745: ('AssignmentUnit', float, None),
+	746: ('OpenInterest', float, None),
+	747: ('ExerciseMethod', str, None),
+	716: ('SettlSessID', str, None),
+	717: ('SettlSessSubID', str, None),
+	715: ('ClearingBusinessDate', str, None),
+	58: ('Text', str, None),
+	354: ('EncodedTextLen', str, None),
+	355: ('EncodedText', str, None),
+}
+
+def _encode_AssignmentReport(obj, fixm):
+	d = obj.__dict__
+	add = fixm.append
+	n = 1
+	if 'AsgnRptID' in d:
+		add('833=' + str(d['AsgnRptID']))
+		n += 1
+	if 'TotNumAssignmentReports' in d:
+		add('832=' + str(d['TotNumAssignmentReports']))
+		n += 1
+	if 'LastRptRequested' in d:
+		add('912=' + str(d['LastRptRequested']))
+		n += 1
+	if 'NoPartyIDs' in d:
+		grp = d['NoPartyIDs']
+		add('453=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoPartyIDs(entry, fixm)
+		n += 1
+	if 'Account' in d:
+		add('1=' + str(d['Account']))
+		n += 1
+	if 'AccountType' in d:
+		add('581=' + str(d['AccountType']))
+		n += 1
+	if 'Symbol' in d:
+		add('55=' + str(d['Symbol']))
+		n += 1
+	if 'SymbolSfx' in d:
+		add('65=' + str(d['SymbolSfx']))
+		n += 1
+	if 'SecurityID' in d:
+		add('48=' + str(d['SecurityID']))
+		n += 1
+	if 'SecurityIDSource' in d:
+		add('22=' + str(d['SecurityIDSource']))
+		n += 1
+	if 'NoSecurityAltID' in d:
+		grp = d['NoSecurityAltID']
+		add('454=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoSecurityAltID(entry, fixm)
+		n += 1
+	if 'Product' in d:
+		add('460=' + str(d['Product']))
+		n += 1
+	if 'CFICode' in d:
+		add('461=' + str(d['CFICode']))
+		n += 1
+	if 'SecurityType' in d:
+		add('167=' + str(d['SecurityType']))
+		n += 1
+	if 'SecuritySubType' in d:
+		add('762=' + str(d['SecuritySubType']))
+		n += 1
+	if 'MaturityMonthYear' in d:
+		add('200=' + str(d['MaturityMonthYear']))
+		n += 1
+	if 'MaturityDate' in d:
+		add('541=' + str(d['MaturityDate']))
+		n += 1
+	if 'CouponPaymentDate' in d:
+		add('224=' + str(d['CouponPaymentDate']))
+		n += 1
+	if 'IssueDate' in d:
+		add('225=' + str(d['IssueDate']))
+		n += 1
+	if 'RepoCollateralSecurityType' in d:
+		add('239=' + str(d['RepoCollateralSecurityType']))
+		n += 1
+	if 'RepurchaseTerm' in d:
+		add('226=' + str(d['RepurchaseTerm']))
+		n += 1
+	if 'RepurchaseRate' in d:
+		add('227=' + str(d['RepurchaseRate']))
+		n += 1
+	if 'Factor' in d:
+		add('228=' + str(d['Factor']))
+		n += 1
+	if 'CreditRating' in d:
+		add('255=' + str(d['CreditRating']))
+		n += 1
+	if 'InstrRegistry' in d:
+		add('543=' + str(d['InstrRegistry']))
+		n += 1
+	if 'CountryOfIssue' in d:
+		add('470=' + str(d['CountryOfIssue']))
+		n += 1
+	if 'StateOrProvinceOfIssue' in d:
+		add('471=' + str(d['StateOrProvinceOfIssue']))
+		n += 1
+	if 'LocaleOfIssue' in d:
+		add('472=' + str(d['LocaleOfIssue']))
+		n += 1
+	if 'RedemptionDate' in d:
+		add('240=' + str(d['RedemptionDate']))
+		n += 1
+	if 'StrikePrice' in d:
+		add('202=' + str(d['StrikePrice']))
+		n += 1
+	if 'StrikeCurrency' in d:
+		add('947=' + str(d['StrikeCurrency']))
+		n += 1
+	if 'OptAttribute' in d:
+		add('206=' + str(d['OptAttribute']))
+		n += 1
+	if 'ContractMultiplier' in d:
+		add('231=' + str(d['ContractMultiplier']))
+		n += 1
+	if 'CouponRate' in d:
+		add('223=' + str(d['CouponRate']))
+		n += 1
+	if 'SecurityExchange' in d:
+		add('207=' + str(d['SecurityExchange']))
+		n += 1
+	if 'Issuer' in d:
+		add('106=' + str(d['Issuer']))
+		n += 1
+	if 'EncodedIssuerLen' in d:
+		add('348=' + str(d['EncodedIssuerLen']))
+		n += 1
+	if 'EncodedIssuer' in d:
+		add('349=' + str(d['EncodedIssuer']))
+		n += 1
+	if 'SecurityDesc' in d:
+		add('107=' + str(d['SecurityDesc']))
+		n += 1
+	if 'EncodedSecurityDescLen' in d:
+		add('350=' + str(d['EncodedSecurityDescLen']))
+		n += 1
+	if 'EncodedSecurityDesc' in d:
+		add('351=' + str(d['EncodedSecurityDesc']))
+		n += 1
+	if 'Pool' in d:
+		add('691=' + str(d['Pool']))
+		n += 1
+	if 'ContractSettlMonth' in d:
+		add('667=' + str(d['ContractSettlMonth']))
+		n += 1
+	if 'CPProgram' in d:
+		add('875=' + str(d['CPProgram']))
+		n += 1
+	if 'CPRegType' in d:
+		add('876=' + str(d['CPRegType']))
+		n += 1
+	if 'NoEvents' in d:
+		grp = d['NoEvents']
+		add('864=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoEvents(entry, fixm)
+		n += 1
+	if 'DatedDate' in d:
+		add('873=' + str(d['DatedDate']))
+		n += 1
+	if 'InterestAccrualDate' in d:
+		add('874=' + str(d['InterestAccrualDate']))
+		n += 1
+	if 'Currency' in d:
+		add('15=' + str(d['Currency']))
+		n += 1
+	if 'NoLegs' in d:
+		grp = d['NoLegs']
+		add('555=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoLegs(entry, fixm)
+		n += 1
+	if 'LegSymbol' in d:
+		add('600=' + str(d['LegSymbol']))
+		n += 1
+	if 'LegSymbolSfx' in d:
+		add('601=' + str(d['LegSymbolSfx']))
+		n += 1
+	if 'LegSecurityID' in d:
+		add('602=' + str(d['LegSecurityID']))
+		n += 1
+	if 'LegSecurityIDSource' in d:
+		add('603=' + str(d['LegSecurityIDSource']))
+		n += 1
+	if 'NoLegSecurityAltID' in d:
+		add('604=' + str(d['NoLegSecurityAltID']))
+		n += 1
+	if 'LegProduct' in d:
+		add('607=' + str(d['LegProduct']))
+		n += 1
+	if 'LegCFICode' in d:
+		add('608=' + str(d['LegCFICode']))
+		n += 1
+	if 'LegSecurityType' in d:
+		add('609=' + str(d['LegSecurityType']))
+		n += 1
+	if 'LegSecuritySubType' in d:
+		add('764=' + str(d['LegSecuritySubType']))
+		n += 1
+	if 'LegMaturityMonthYear' in d:
+		add('610=' + str(d['LegMaturityMonthYear']))
+		n += 1
+	if 'LegMaturityDate' in d:
+		add('611=' + str(d['LegMaturityDate']))
+		n += 1
+	if 'LegCouponPaymentDate' in d:
+		add('248=' + str(d['LegCouponPaymentDate']))
+		n += 1
+	if 'LegIssueDate' in d:
+		add('249=' + str(d['LegIssueDate']))
+		n += 1
+	if 'LegRepoCollateralSecurityType' in d:
+		add('250=' + str(d['LegRepoCollateralSecurityType']))
+		n += 1
+	if 'LegRepurchaseTerm' in d:
+		add('251=' + str(d['LegRepurchaseTerm']))
+		n += 1
+	if 'LegRepurchaseRate' in d:
+		add('252=' + str(d['LegRepurchaseRate']))
+		n += 1
+	if 'LegFactor' in d:
+		add('253=' + str(d['LegFactor']))
+		n += 1
+	if 'LegCreditRating' in d:
+		add('257=' + str(d['LegCreditRating']))
+		n += 1
+	if 'LegInstrRegistry' in d:
+		add('599=' + str(d['LegInstrRegistry']))
+		n += 1
+	if 'LegCountryOfIssue' in d:
+		add('596=' + str(d['LegCountryOfIssue']))
+		n += 1
+	if 'LegStateOrProvinceOfIssue' in d:
+		add('597=' + str(d['LegStateOrProvinceOfIssue']))
+		n += 1
+	if 'LegLocaleOfIssue' in d:
+		add('598=' + str(d['LegLocaleOfIssue']))
+		n += 1
+	if 'LegRedemptionDate' in d:
+		add('254=' + str(d['LegRedemptionDate']))
+		n += 1
+	if 'LegStrikePrice' in d:
+		add('612=' + str(d['LegStrikePrice']))
+		n += 1
+	if 'LegStrikeCurrency' in d:
+		add('942=' + str(d['LegStrikeCurrency']))
+		n += 1
+	if 'LegOptAttribute' in d:
+		add('613=' + str(d['LegOptAttribute']))
+		n += 1
+	if 'LegContractMultiplier' in d:
+		add('614=' + str(d['LegContractMultiplier']))
+		n += 1
+	if 'LegCouponRate' in d:
+		add('615=' + str(d['LegCouponRate']))
+		n += 1
+	if 'LegSecurityExchange' in d:
+		add('616=' + str(d['LegSecurityExchange']))
+		n += 1
+	if 'LegIssuer' in d:
+		add('617=' + str(d['LegIssuer']))
+		n += 1
+	if 'EncodedLegIssuerLen' in d:
+		add('618=' + str(d['EncodedLegIssuerLen']))
+		n += 1
+	if 'EncodedLegIssuer' in d:
+		add('619=' + str(d['EncodedLegIssuer']))
+		n += 1
+	if 'LegSecurityDesc' in d:
+		add('620=' + str(d['LegSecurityDesc']))
+		n += 1
+	if 'EncodedLegSecurityDescLen' in d:
+		add('621=' + str(d['EncodedLegSecurityDescLen']))
+		n += 1
+	if 'EncodedLegSecurityDesc' in d:
+		add('622=' + str(d['EncodedLegSecurityDesc']))
+		n += 1
+	if 'LegRatioQty' in d:
+		add('623=' + str(d['LegRatioQty']))
+		n += 1
+	if 'LegSide' in d:
+		add('624=' + str(d['LegSide']))
+		n += 1
+	if 'LegCurrency' in d:
+		add('556=' + str(d['LegCurrency']))
+		n += 1
+	if 'LegPool' in d:
+		add('740=' + str(d['LegPool']))
+		n += 1
+	if 'LegDatedDate' in d:
+		add('739=' + str(d['LegDatedDate']))
+		n += 1
+	if 'LegContractSettlMonth' in d:
+		add('955=' + str(d['LegContractSettlMonth']))
+		n += 1
+	if 'LegInterestAccrualDate' in d:
+		add('956=' + str(d['LegInterestAccrualDate']))
+		n += 1
+	if 'NoUnderlyings' in d:
+		grp = d['NoUnderlyings']
+		add('711=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoUnderlyings(entry, fixm)
+		n += 1
+	if 'NoPositions' in d:
+		grp = d['NoPositions']
+		add('702=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoPositions(entry, fixm)
+		n += 1
+	if 'NoPosAmt' in d:
+		grp = d['NoPosAmt']
+		add('753=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoPosAmt(entry, fixm)
+		n += 1
+	if 'ThresholdAmount' in d:
+		add('834=' + str(d['ThresholdAmount']))
+		n += 1
+	if 'SettlPrice' in d:
+		add('730=' + str(d['SettlPrice']))
+		n += 1
+	if 'SettlPriceType' in d:
+		add('731=' + str(d['SettlPriceType']))
+		n += 1
+	if 'UnderlyingSettlPrice' in d:
+		add('732=' + str(d['UnderlyingSettlPrice']))
+		n += 1
+	if 'ExpireDate' in d:
+		add('432=' + str(d['ExpireDate']))
+		n += 1
+	if 'AssignmentMethod' in d:
+		add('744=' + str(d['AssignmentMethod']))
+		n += 1
+	if 'AssignmentUnit' in d:
+		add('745=' + str(d['AssignmentUnit']))
+		n += 1
+	if 'OpenInterest' in d:
+		add('746=' + str(d['OpenInterest']))
+		n += 1
+	if 'ExerciseMethod' in d:
+		add('747=' + str(d['ExerciseMethod']))
+		n += 1
+	if 'SettlSessID' in d:
+		add('716=' + str(d['SettlSessID']))
+		n += 1
+	if 'SettlSessSubID' in d:
+		add('717=' + str(d['SettlSessSubID']))
+		n += 1
+	if 'ClearingBusinessDate' in d:
+		add('715=' + str(d['ClearingBusinessDate']))
+		n += 1
+	if 'Text' in d:
+		add('58=' + str(d['Text']))
+		n += 1
+	if 'EncodedTextLen' in d:
+		add('354=' + str(d['EncodedTextLen']))
+		n += 1
+	if 'EncodedText' in d:
+		add('355=' + str(d['EncodedText']))
+		n += 1
+	if len(d) > n:
+		_make_mbody(obj, obj._context, fixm, _msg_AssignmentReport_names)
+	return fixm
+
+def _decode_AssignmentReport(obj, fields, index, context):
+	d = obj.__dict__
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _msg_AssignmentReport_tags.get(num)
+		if spec is None:
+			# not a field of this message, continue with generic decoder
+			body, index = _extract_body(fields, index, context, obj)
+			return index
+		name, pytype, decode_grp = spec
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	return index
+
+class AssignmentReport(FixObject):
+	_encode = staticmethod(_encode_AssignmentReport)
+	_decode = staticmethod(_decode_AssignmentReport)
+
+_msg_BidRequest_names = frozenset(['BidID', 'ClientBidID', 'BidRequestTransType', 'ListName', 'TotNoRelatedSym', 'BidType', 'NumTickets', 'Currency', 'SideValue1', 'SideValue2', 'NoBidDescriptors', 'NoBidComponents', 'LiquidityIndType', 'WtAverageLiquidity', 'ExchangeForPhysical', 'OutMainCntryUIndex', 'CrossPercent', 'ProgRptReqs', 'ProgPeriodInterval', 'IncTaxInd', 'ForexReq', 'NumBidders', 'TradeDate', 'BidTradeType', 'BasisPxType', 'StrikeTime', 'Text', 'EncodedTextLen', 'EncodedText'])
+
+_msg_BidRequest_tags = {
+	390: ('BidID', str, None),
+	391: ('ClientBidID', str, None),
+	374: ('BidRequestTransType', str, None),
+	392: ('ListName', str, None),
+	393: ('TotNoRelatedSym', int, None),
+	394: ('BidType', int, None),
+	395: ('NumTickets', int, None),
+	15: ('Currency', str, None),
+	396: ('SideValue1', float, None),
+	397: ('SideValue2', float, None),
+	398: ('NoBidDescriptors', int, _decode_grp_NoBidDescriptors),
+	420: ('NoBidComponents', int, _decode_grp_NoBidComponents),
+	409: ('LiquidityIndType', int, None),
+	410: ('WtAverageLiquidity', float, None),
+	411: ('ExchangeForPhysical', str, None),
+	412: ('OutMainCntryUIndex', float, None),
+	413: ('CrossPercent', float, None),
+	414: ('ProgRptReqs', int, None),
+	415: ('ProgPeriodInterval', int, None),
+	416: ('IncTaxInd', int, None),
+	121: ('ForexReq', str, None),
+	417: ('NumBidders', int, None),
+	75: ('TradeDate', str, None),
+	418: ('BidTradeType', str, None),
+	419: ('BasisPxType', str, None),
+	443: ('StrikeTime', str, None),
+	58: ('Text', str, None),
+	354: ('EncodedTextLen', str, None),
+	355: ('EncodedText', str, None),
+}
+
+def _encode_BidRequest(obj, fixm):
+	d = obj.__dict__
+	add = fixm.append
+	n = 1
+	if 'BidID' in d:
+		add('390=' + str(d['BidID']))
+		n += 1
+	if 'ClientBidID' in d:
+		add('391=' + str(d['ClientBidID']))
+		n += 1
+	if 'BidRequestTransType' in d:
+		add('374=' + str(d['BidRequestTransType']))
+		n += 1
+	if 'ListName' in d:
+		add('392=' + str(d['ListName']))
+		n += 1
+	if 'TotNoRelatedSym' in d:
+		add('393=' + str(d['TotNoRelatedSym']))
+		n += 1
+	if 'BidType' in d:
+		add('394=' + str(d['BidType']))
+		n += 1
+	if 'NumTickets' in d:
+		add('395=' + str(d['NumTickets']))
+		n += 1
+	if 'Currency' in d:
+		add('15=' + str(d['Currency']))
+		n += 1
+	if 'SideValue1' in d:
+		add('396=' + str(d['SideValue1']))
+		n += 1
+	if 'SideValue2' in d:
+		add('397=' + str(d['SideValue2']))
+		n += 1
+	if 'NoBidDescriptors' in d:
+		grp = d['NoBidDescriptors']
+		add('398=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoBidDescriptors(entry, fixm)
+		n += 1
+	if 'NoBidComponents' in d:
+		grp = d['NoBidComponents']
+		add('420=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoBidComponents(entry, fixm)
+		n += 1
+	if 'LiquidityIndType' in d:
+		add('409=' + str(d['LiquidityIndType']))
+		n += 1
+	if 'WtAverageLiquidity' in d:
+		add('410=' + str(d['WtAverageLiquidity']))
+		n += 1
+	if 'ExchangeForPhysical' in d:
+		add('411=' + str(d['ExchangeForPhysical']))
+		n += 1
+	if 'OutMainCntryUIndex' in d:
+		add('412=' + str(d['OutMainCntryUIndex']))
+		n += 1
+	if 'CrossPercent' in d:
+		add('413=' + str(d['CrossPercent']))
+		n += 1
+	if 'ProgRptReqs' in d:
+		add('414=' + str(d['ProgRptReqs']))
+		n += 1
+	if 'ProgPeriodInterval' in d:
+		add('415=' + str(d['ProgPeriodInterval']))
+		n += 1
+	if 'IncTaxInd' in d:
+		add('416=' + str(d['IncTaxInd']))
+		n += 1
+	if 'ForexReq' in d:
+		add('121=' + str(d['ForexReq']))
+		n += 1
+	if 'NumBidders' in d:
+		add('417=' + str(d['NumBidders']))
+		n += 1
+	if 'TradeDate' in d:
+		add('75=' + str(d['TradeDate']))
+		n += 1
+	if 'BidTradeType' in d:
+		add('418=' + str(d['BidTradeType']))
+		n += 1
+	if 'BasisPxType' in d:
+		add('419=' + str(d['BasisPxType']))
+		n += 1
+	if 'StrikeTime' in d:
+		add('443=' + str(d['StrikeTime']))
+		n += 1
+	if 'Text' in d:
+		add('58=' + str(d['Text']))
+		n += 1
+	if 'EncodedTextLen' in d:
+		add('354=' + str(d['EncodedTextLen']))
+		n += 1
+	if 'EncodedText' in d:
+		add('355=' + str(d['EncodedText']))
+		n += 1
+	if len(d) > n:
+		_make_mbody(obj, obj._context, fixm, _msg_BidRequest_names)
+	return fixm
+
+def _decode_BidRequest(obj, fields, index, context):
+	d = obj.__dict__
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _msg_BidRequest_tags.get(num)
+		if spec is None:
+			# not a field of this message, continue with generic decoder
+			body, index = _extract_body(fields, index, context, obj)
+			return index
+		name, pytype, decode_grp = spec
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	return index
+
+class BidRequest(FixObject):
+	_encode = staticmethod(_encode_BidRequest)
+	_decode = staticmethod(_decode_BidRequest)
+
+_msg_BidResponse_names = frozenset(['BidID', 'ClientBidID', 'NoBidComponents'])
+
+_msg_BidResponse_tags = {
+	390: ('BidID', str, None),
+	391: ('ClientBidID', str, None),
+	420: ('NoBidComponents', int, _decode_grp_NoBidComponents),
+}
+
+def _encode_BidResponse(obj, fixm):
+	d = obj.__dict__
+	add = fixm.append
+	n = 1
+	if 'BidID' in d:
+		add('390=' + str(d['BidID']))
+		n += 1
+	if 'ClientBidID' in d:
+		add('391=' + str(d['ClientBidID']))
+		n += 1
+	if 'NoBidComponents' in d:
+		grp = d['NoBidComponents']
+		add('420=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoBidComponents(entry, fixm)
+		n += 1
+	if len(d) > n:
+		_make_mbody(obj, obj._context, fixm, _msg_BidResponse_names)
+	return fixm
+
+def _decode_BidResponse(obj, fields, index, context):
+	d = obj.__dict__
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _msg_BidResponse_tags.get(num)
+		if spec is None:
+			# not a field of this message, continue with generic decoder
+			body, index = _extract_body(fields, index, context, obj)
+			return index
+		name, pytype, decode_grp = spec
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	return index
+
+class BidResponse(FixObject):
+	_encode = staticmethod(_encode_BidResponse)
+	_decode = staticmethod(_decode_BidResponse)
+
+_msg_BusinessMessageReject_names = frozenset(['RefSeqNum', 'RefMsgType', 'BusinessRejectRefID', 'BusinessRejectReason', 'Text', 'EncodedTextLen', 'EncodedText'])
+
+_msg_BusinessMessageReject_tags = {
+	45: ('RefSeqNum', int, None),
+	372: ('RefMsgType', str, None),
+	379: ('BusinessRejectRefID', str, None),
+	380: ('BusinessRejectReason', int, None),
+	58: ('Text', str, None),
+	354: ('EncodedTextLen', str, None),
+	355: ('EncodedText', str, None),
+}
+
+def _encode_BusinessMessageReject(obj, fixm):
+	d = obj.__dict__
+	add = fixm.append
+	n = 1
+	if 'RefSeqNum' in d:
+		add('45=' + str(d['RefSeqNum']))
+		n += 1
+	if 'RefMsgType' in d:
+		add('372=' + str(d['RefMsgType']))
+		n += 1
+	if 'BusinessRejectRefID' in d:
+		add('379=' + str(d['BusinessRejectRefID']))
+		n += 1
+	if 'BusinessRejectReason' in d:
+		add('380=' + str(d['BusinessRejectReason']))
+		n += 1
+	if 'Text' in d:
+		add('58=' + str(d['Text']))
+		n += 1
+	if 'EncodedTextLen' in d:
+		add('354=' + str(d['EncodedTextLen']))
+		n += 1
+	if 'EncodedText' in d:
+		add('355=' + str(d['EncodedText']))
+		n += 1
+	if len(d) > n:
+		_make_mbody(obj, obj._context, fixm, _msg_BusinessMessageReject_names)
+	return fixm
+
+def _decode_BusinessMessageReject(obj, fields, index, context):
+	d = obj.__dict__
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _msg_BusinessMessageReject_tags.get(num)
+		if spec is None:
+			# not a field of this message, continue with generic decoder
+			body, index = _extract_body(fields, index, context, obj)
+			return index
+		name, pytype, decode_grp = spec
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	return index
+
+class BusinessMessageReject(FixObject):
+	_encode = staticmethod(_encode_BusinessMessageReject)
+	_decode = staticmethod(_decode_BusinessMessageReject)
+
+_msg_CollateralAssignment_names = frozenset(['CollAsgnID', 'CollReqID', 'CollAsgnReason', 'CollAsgnTransType', 'CollAsgnRefID', 'TransactTime', 'ExpireTime', 'NoPartyIDs', 'Account', 'AccountType', 'ClOrdID', 'OrderID', 'SecondaryOrderID', 'SecondaryClOrdID', 'NoExecs', 'NoTrades', 'Symbol', 'SymbolSfx', 'SecurityID', 'SecurityIDSource', 'NoSecurityAltID', 'Product', 'CFICode', 'SecurityType', 'SecuritySubType', 'MaturityMonthYear', 'MaturityDate', 'CouponPaymentDate', 'IssueDate', 'RepoCollateralSecurityType', 'RepurchaseTerm', 'RepurchaseRate', 'Factor', 'CreditRating', 'InstrRegistry', 'CountryOfIssue', 'StateOrProvinceOfIssue', 'LocaleOfIssue', 'RedemptionDate', 'StrikePrice', 'StrikeCurrency', 'OptAttribute', 'ContractMultiplier', 'CouponRate', 'SecurityExchange', 'Issuer', 'EncodedIssuerLen', 'EncodedIssuer', 'SecurityDesc', 'EncodedSecurityDescLen', 'EncodedSecurityDesc', 'Pool', 'ContractSettlMonth', 'CPProgram', 'CPRegType', 'NoEvents', 'DatedDate', 'InterestAccrualDate', 'AgreementDesc', 'AgreementID', 'AgreementDate', 'AgreementCurrency', 'TerminationType', 'StartDate', 'EndDate', 'DeliveryType', 'MarginRatio', 'SettlDate', 'Quantity', 'QtyType', 'Currency', 'NoLegs', 'LegSymbol', 'LegSymbolSfx', 'LegSecurityID', 'LegSecurityIDSource', 'NoLegSecurityAltID', 'LegProduct', 'LegCFICode', 'LegSecurityType', 'LegSecuritySubType', 'LegMaturityMonthYear', 'LegMaturityDate', 'LegCouponPaymentDate', 'LegIssueDate', 'LegRepoCollateralSecurityType', 'LegRepurchaseTerm', 'LegRepurchaseRate', 'LegFactor', 'LegCreditRating', 'LegInstrRegistry', 'LegCountryOfIssue', 'LegStateOrProvinceOfIssue', 'LegLocaleOfIssue', 'LegRedemptionDate', 'LegStrikePrice', 'LegStrikeCurrency', 'LegOptAttribute', 'LegContractMultiplier', 'LegCouponRate', 'LegSecurityExchange', 'LegIssuer', 'EncodedLegIssuerLen', 'EncodedLegIssuer', 'LegSecurityDesc', 'EncodedLegSecurityDescLen', 'EncodedLegSecurityDesc', 'LegRatioQty', 'LegSide', 'LegCurrency', 'LegPool', 'LegDatedDate', 'LegContractSettlMonth', 'LegInterestAccrualDate', 'NoUnderlyings', 'MarginExcess', 'TotalNetValue', 'CashOutstanding', 'NoTrdRegTimestamps', 'Side', 'NoMiscFees', 'Price', 'PriceType', 'AccruedInterestAmt', 'EndAccruedInterestAmt', 'StartCash', 'EndCash', 'Spread', 'BenchmarkCurveCurrency', 'BenchmarkCurveName', 'BenchmarkCurvePoint', 'BenchmarkPrice', 'BenchmarkPriceType', 'BenchmarkSecurityID', 'BenchmarkSecurityIDSource', 'NoStipulations', 'SettlDeliveryType', 'StandInstDbType', 'StandInstDbName', 'StandInstDbID', 'NoDlvyInst', 'TradingSessionID', 'TradingSessionSubID', 'SettlSessID', 'SettlSessSubID', 'ClearingBusinessDate', 'Text', 'EncodedTextLen', 'EncodedText'])
+
+_msg_CollateralAssignment_tags = {
+	902: ('CollAsgnID', str, None),
+	894: ('CollReqID', str, None),
+	895: ('CollAsgnReason', int, None),
+	903: ('CollAsgnTransType', int, None),
+	907: ('CollAsgnRefID', str, None),
+	60: ('TransactTime', str, None),
+	126: ('ExpireTime', str, None),
+	453: ('NoPartyIDs', int, _decode_grp_NoPartyIDs),
+	1: ('Account', str, None),
+	581: ('AccountType', int, None),
+	11: ('ClOrdID', str, None),
+	37: ('OrderID', str, None),
+	198: ('SecondaryOrderID', str, None),
+	526: ('SecondaryClOrdID', str, None),
+	124: ('NoExecs', int, _decode_grp_NoExecs),
+	897: ('NoTrades', int, _decode_grp_NoTrades),
+	55: ('Symbol', str, None),
+	65: ('SymbolSfx', str, None),
+	48: ('SecurityID', str, None),
+	22: ('SecurityIDSource', str, None),
+	454: ('NoSecurityAltID', int, _decode_grp_NoSecurityAltID),
+	460: ('Product', int, None),
+	461: ('CFICode', str, None),
+	167: ('SecurityType', str, None),
+	762: ('SecuritySubType', str, None),
+	200: ('MaturityMonthYear', str, None),
+	541: ('MaturityDate', str, None),
+	224: ('CouponPaymentDate', str, None),
+	225: ('IssueDate', str, None),
+	239: ('RepoCollateralSecurityType', int, None),
+	226: ('RepurchaseTerm', int, None),
+	227: ('RepurchaseRate', float, None),
+	228: ('Factor', float, None),
+	255: ('CreditRating', str, None),
+	543: ('InstrRegistry', str, None),
+	470: ('CountryOfIssue', str, None),
+	471: ('StateOrProvinceOfIssue', str, None),
+	472: ('LocaleOfIssue', str, None),
+	240: ('RedemptionDate', str, None),
+	202: ('StrikePrice', float, None),
+	947: ('StrikeCurrency', str, None),
+	206: ('OptAttribute', str, None),
+	231: ('ContractMultiplier', float, None),
+	223: ('CouponRate', float, None),
+	207: ('SecurityExchange', str, None),
+	106: ('Issuer', str, None),
+	348: ('EncodedIssuerLen', str, None),
+	349: ('EncodedIssuer', str, None),
+	107: ('SecurityDesc', str, None),
+	350: ('EncodedSecurityDescLen', str, None),
+	351: ('EncodedSecurityDesc', str, None),
+	691: ('Pool', str, None),
+	667: ('ContractSettlMonth', str, None),
+	875: ('CPProgram', int, None),
+	876: ('CPRegType', str, None),
+	864: ('NoEvents', int, _decode_grp_NoEvents),
+	873: ('DatedDate', str, None),
+	874: ('InterestAccrualDate', str, None),
+	913: ('AgreementDesc', str, None),
+	914: ('AgreementID', str, None),
+	915: ('AgreementDate', str, None),
+	918: ('AgreementCurrency', str, None),
+	788: ('TerminationType', int, None),
+	916: ('StartDate', str, None),
+	917: ('EndDate', str, None),
+	919: ('DeliveryType', int, None),
+	898: ('MarginRatio', float, None),
+	64: ('SettlDate', str, None),
+	53: ('Quantity', float, None),
+	854: ('QtyType', int, None),
+	15: ('Currency', str, None),
+	555: ('NoLegs', int, _decode_grp_NoLegs),
+	600: ('LegSymbol', str, None),
+	601: ('LegSymbolSfx', str, None),
+	602: ('LegSecurityID', str, None),
+	603: ('LegSecurityIDSource', str, None),
+	604: ('NoLegSecurityAltID', str, None),
+	607: ('LegProduct', int, None),
+	608: ('LegCFICode', str, None),
+	609: ('LegSecurityType', str, None),
+	764: ('LegSecuritySubType', str, None),
+	610: ('LegMaturityMonthYear', str, None),
+	611: ('LegMaturityDate', str, None),
+	248: ('LegCouponPaymentDate', str, None),
+	249: ('LegIssueDate', str, None),
+	250: ('LegRepoCollateralSecurityType', int, None),
+	251: ('LegRepurchaseTerm', int, None),
+	252: ('LegRepurchaseRate', float, None),
+	253: ('LegFactor', float, None),
+	257: ('LegCreditRating', str, None),
+	599: ('LegInstrRegistry', str, None),
+	596: ('LegCountryOfIssue', str, None),
+	597: ('LegStateOrProvinceOfIssue', str, None),
+	598: ('LegLocaleOfIssue', str, None),
+	254: ('LegRedemptionDate', str, None),
+	612: ('LegStrikePrice', float, None),
+	942: ('LegStrikeCurrency', str, None),
+	613: ('LegOptAttribute', str, None),
+	614: ('LegContractMultiplier', float, None),
+	615: ('LegCouponRate', float, None),
+	616: ('LegSecurityExchange', str, None),
+	617: ('LegIssuer', str, None),
+	618: ('EncodedLegIssuerLen', str, None),
+	619: ('EncodedLegIssuer', str, None),
+	620: ('LegSecurityDesc', str, None),
+	621: ('EncodedLegSecurityDescLen', str, None),
+	622: ('EncodedLegSecurityDesc', str, None),
+	623: ('LegRatioQty', float, None),
+	624: ('LegSide', str, None),
+	556: ('LegCurrency', str, None),
+	740: ('LegPool', str, None),
+	739: ('LegDatedDate', str, None),
+	955: ('LegContractSettlMonth', str, None),
+	956: ('LegInterestAccrualDate', str, None),
+	711: ('NoUnderlyings', int, _decode_grp_NoUnderlyings),
+	899: ('MarginExcess', float, None),
+	900: ('TotalNetValue', float, None),
+	901: ('CashOutstanding', float, None),
+	768: ('NoTrdRegTimestamps', int, _decode_grp_NoTrdRegTimestamps),
+	54: ('Side', str, None),
+	136: ('NoMiscFees', int, _decode_grp_NoMiscFees),
+	44: ('Price', float, None),
+	423: ('PriceType', int, None),
+	159: ('AccruedInterestAmt', float, None),
+	920: ('EndAccruedInterestAmt', float, None),
+	921: ('StartCash', float, None),
+	922: ('EndCash', float, None),
+	218: ('Spread', float, None),
+	220: ('BenchmarkCurveCurrency', str, None),
+	221: ('BenchmarkCurveName', str, None),
+	222: ('BenchmarkCurvePoint', str, None),
+	662: ('BenchmarkPrice', float, None),
+	663: ('BenchmarkPriceType', int, None),
+	699: ('BenchmarkSecurityID', str, None),
+	761: ('BenchmarkSecurityIDSource', str, None),
+	232: ('NoStipulations', int, _decode_grp_NoStipulations),
+	172: ('SettlDeliveryType', int, None),
+	169: ('StandInstDbType', int, None),
+	170: ('StandInstDbName', str, None),
+	171: ('StandInstDbID', str, None),
+	85: ('NoDlvyInst', int, _decode_grp_NoDlvyInst),
+	336: ('TradingSessionID', str, None),
+	625: ('TradingSessionSubID', str, None),
+	716: ('SettlSessID', str, None),
+	717: ('SettlSessSubID', str, None),
+	715: ('ClearingBusinessDate', str, None),
+	58: ('Text', str, None),
+	354: ('EncodedTextLen', str, None),
+	355: ('EncodedText', str, None),
+}
+
+def _encode_CollateralAssignment(obj, fixm):
+	d = obj.__dict__
+	add = fixm.append
+	n = 1
+	if 'CollAsgnID' in d:
+		add('902=' + str(d['CollAsgnID']))
+		n += 1
+	if 'CollReqID' in d:
+		add('894=' + str(d['CollReqID']))
+		n += 1
+	if 'CollAsgnReason' in d:
+		add('895=' + str(d['CollAsgnReason']))
+		n += 1
+	if 'CollAsgnTransType' in d:
+		add('903=' + str(d['CollAsgnTransType']))
+		n += 1
+	if 'CollAsgnRefID' in d:
+		add('907=' + str(d['CollAsgnRefID']))
+		n += 1
+	if 'TransactTime' in d:
+		add('60=' + str(d['TransactTime']))
+		n += 1
+	if 'ExpireTime' in d:
+		add('126=' + str(d['ExpireTime']))
+		n += 1
+	if 'NoPartyIDs' in d:
+		grp = d['NoPartyIDs']
+		add('453=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoPartyIDs(entry, fixm)
+		n += 1
+	if 'Account' in d:
+		add('1=' + str(d['Account']))
+		n += 1
+	if 'AccountType' in d:
+		add('581=' + str(d['AccountType']))
+		n += 1
+	if 'ClOrdID' in d:
+		add('11=' + str(d['ClOrdID']))
+		n += 1
+	if 'OrderID' in d:
+		add('37=' + str(d['OrderID']))
+		n += 1
+	if 'SecondaryOrderID' in d:
+		add('198=' + str(d['SecondaryOrderID']))
+		n += 1
+	if 'SecondaryClOrdID' in d:
+		add('526=' + str(d['SecondaryClOrdID']))
+		n += 1
+	if 'NoExecs' in d:
+		grp = d['NoExecs']
+		add('124=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoExecs(entry, fixm)
+		n += 1
+	if 'NoTrades' in d:
+		grp = d['NoTrades']
+		add('897=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoTrades(entry, fixm)
+		n += 1
+	if 'Symbol' in d:
+		add('55=' + str(d['Symbol']))
+		n += 1
+	if 'SymbolSfx' in d:
+		add('65=' + str(d['SymbolSfx']))
+		n += 1
+	if 'SecurityID' in d:
+		add('48=' + str(d['SecurityID']))
+		n += 1
+	if 'SecurityIDSource' in d:
+		add('22=' + str(d['SecurityIDSource']))
+		n += 1
+	if 'NoSecurityAltID' in d:
+		grp = d['NoSecurityAltID']
+		add('454=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoSecurityAltID(entry, fixm)
+		n += 1
+	if 'Product' in d:
+		add('460=' + str(d['Product']))
+		n += 1
+	if 'CFICode' in d:
+		add('461=' + str(d['CFICode']))
+		n += 1
+	if 'SecurityType' in d:
+		add('167=' + str(d['SecurityType']))
+		n += 1
+	if 'SecuritySubType' in d:
+		add('762=' + str(d['SecuritySubType']))
+		n += 1
+	if 'MaturityMonthYear' in d:
+		add('200=' + str(d['MaturityMonthYear']))
+		n += 1
+	if 'MaturityDate' in d:
+		add('541=' + str(d['MaturityDate']))
+		n += 1
+	if 'CouponPaymentDate' in d:
+		add('224=' + str(d['CouponPaymentDate']))
+		n += 1
+	if 'IssueDate' in d:
+		add('225=' + str(d['IssueDate']))
+		n += 1
+	if 'RepoCollateralSecurityType' in d:
+		add('239=' + str(d['RepoCollateralSecurityType']))
+		n += 1
+	if 'RepurchaseTerm' in d:
+		add('226=' + str(d['RepurchaseTerm']))
+		n += 1
+	if 'RepurchaseRate' in d:
+		add('227=' + str(d['RepurchaseRate']))
+		n += 1
+	if 'Factor' in d:
+		add('228=' + str(d['Factor']))
+		n += 1
+	if 'CreditRating' in d:
+		add('255=' + str(d['CreditRating']))
+		n += 1
+	if 'InstrRegistry' in d:
+		add('543=' + str(d['InstrRegistry']))
+		n += 1
+	if 'CountryOfIssue' in d:
+		add('470=' + str(d['CountryOfIssue']))
+		n += 1
+	if 'StateOrProvinceOfIssue' in d:
+		add('471=' + str(d['StateOrProvinceOfIssue']))
+		n += 1
+	if 'LocaleOfIssue' in d:
+		add('472=' + str(d['LocaleOfIssue']))
+		n += 1
+	if 'RedemptionDate' in d:
+		add('240=' + str(d['RedemptionDate']))
+		n += 1
+	if 'StrikePrice' in d:
+		add('202=' + str(d['StrikePrice']))
+		n += 1
+	if 'StrikeCurrency' in d:
+		add('947=' + str(d['StrikeCurrency']))
+		n += 1
+	if 'OptAttribute' in d:
+		add('206=' + str(d['OptAttribute']))
+		n += 1
+	if 'ContractMultiplier' in d:
+		add('231=' + str(d['ContractMultiplier']))
+		n += 1
+	if 'CouponRate' in d:
+		add('223=' + str(d['CouponRate']))
+		n += 1
+	if 'SecurityExchange' in d:
+		add('207=' + str(d['SecurityExchange']))
+		n += 1
+	if 'Issuer' in d:
+		add('106=' + str(d['Issuer']))
+		n += 1
+	if 'EncodedIssuerLen' in d:
+		add('348=' + str(d['EncodedIssuerLen']))
+		n += 1
+	if 'EncodedIssuer' in d:
+		add('349=' + str(d['EncodedIssuer']))
+		n += 1
+	if 'SecurityDesc' in d:
+		add('107=' + str(d['SecurityDesc']))
+		n += 1
+	if 'EncodedSecurityDescLen' in d:
+		add('350=' + str(d['EncodedSecurityDescLen']))
+		n += 1
+	if 'EncodedSecurityDesc' in d:
+		add('351=' + str(d['EncodedSecurityDesc']))
+		n += 1
+	if 'Pool' in d:
+		add('691=' + str(d['Pool']))
+		n += 1
+	if 'ContractSettlMonth' in d:
+		add('667=' + str(d['ContractSettlMonth']))
+		n += 1
+	if 'CPProgram' in d:
+		add('875=' + str(d['CPProgram']))
+		n += 1
+	if 'CPRegType' in d:
+		add('876=' + str(d['CPRegType']))
+		n += 1
+	if 'NoEvents' in d:
+		grp = d['NoEvents']
+		add('864=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoEvents(entry, fixm)
+		n += 1
+	if 'DatedDate' in d:
+		add('873=' + str(d['DatedDate']))
+		n += 1
+	if 'InterestAccrualDate' in d:
+		add('874=' + str(d['InterestAccrualDate']))
+		n += 1
+	if 'AgreementDesc' in d:
+		add('913=' + str(d['AgreementDesc']))
+		n += 1
+	if 'AgreementID' in d:
+		add('914=' + str(d['AgreementID']))
+		n += 1
+	if 'AgreementDate' in d:
+		add('915=' + str(d['AgreementDate']))
+		n += 1
+	if 'AgreementCurrency' in d:
+		add('918=' + str(d['AgreementCurrency']))
+		n += 1
+	if 'TerminationType' in d:
+		add('788=' + str(d['TerminationType']))
+		n += 1
+	if 'StartDate' in d:
+		add('916=' + str(d['StartDate']))
+		n += 1
+	if 'EndDate' in d:
+		add('917=' + str(d['EndDate']))
+		n += 1
+	if 'DeliveryType' in d:
+		add('919=' + str(d['DeliveryType']))
+		n += 1
+	if 'MarginRatio' in d:
+		add('898=' + str(d['MarginRatio']))
+		n += 1
+	if 'SettlDate' in d:
+		add('64=' + str(d['SettlDate']))
+		n += 1
+	if 'Quantity' in d:
+		add('53=' + str(d['Quantity']))
+		n += 1
+	if 'QtyType' in d:
+		add('854=' + str(d['QtyType']))
+		n += 1
+	if 'Currency' in d:
+		add('15=' + str(d['Currency']))
+		n += 1
+	if 'NoLegs' in d:
+		grp = d['NoLegs']
+		add('555=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoLegs(entry, fixm)
+		n += 1
+	if 'LegSymbol' in d:
+		add('600=' + str(d['LegSymbol']))
+		n += 1
+	if 'LegSymbolSfx' in d:
+		add('601=' + str(d['LegSymbolSfx']))
+		n += 1
+	if 'LegSecurityID' in d:
+		add('602=' + str(d['LegSecurityID']))
+		n += 1
+	if 'LegSecurityIDSource' in d:
+		add('603=' + str(d['LegSecurityIDSource']))
+		n += 1
+	if 'NoLegSecurityAltID' in d:
+		add('604=' + str(d['NoLegSecurityAltID']))
+		n += 1
+	if 'LegProduct' in d:
+		add('607=' + str(d['LegProduct']))
+		n += 1
+	if 'LegCFICode' in d:
+		add('608=' + str(d['LegCFICode']))
+		n += 1
+	if 'LegSecurityType' in d:
+		add('609=' + str(d['LegSecurityType']))
+		n += 1
+	if 'LegSecuritySubType' in d:
+		add('764=' + str(d['LegSecuritySubType']))
+		n += 1
+	if 'LegMaturityMonthYear' in d:
+		add('610=' + str(d['LegMaturityMonthYear']))
+		n += 1
+	if 'LegMaturityDate' in d:
+		add('611=' + str(d['LegMaturityDate']))
+		n += 1
+	if 'LegCouponPaymentDate' in d:
+		add('248=' + str(d['LegCouponPaymentDate']))
+		n += 1
+	if 'LegIssueDate' in d:
+		add('249=' + str(d['LegIssueDate']))
+		n += 1
+	if 'LegRepoCollateralSecurityType' in d:
+		add('250=' + str(d['LegRepoCollateralSecurityType']))
+		n += 1
+	if 'LegRepurchaseTerm' in d:
+		add('251=' + str(d['LegRepurchaseTerm']))
+		n += 1
+	if 'LegRepurchaseRate' in d:
+		add('252=' + str(d['LegRepurchaseRate']))
+		n += 1
+	if 'LegFactor' in d:
+		add('253=' + str(d['LegFactor']))
+		n += 1
+	if 'LegCreditRating' in d:
+		add('257=' + str(d['LegCreditRating']))
+		n += 1
+	if 'LegInstrRegistry' in d:
+		add('599=' + str(d['LegInstrRegistry']))
+		n += 1
+	if 'LegCountryOfIssue' in d:
+		add('596=' + str(d['LegCountryOfIssue']))
+		n += 1
+	if 'LegStateOrProvinceOfIssue' in d:
+		add('597=' + str(d['LegStateOrProvinceOfIssue']))
+		n += 1
+	if 'LegLocaleOfIssue' in d:
+		add('598=' + str(d['LegLocaleOfIssue']))
+		n += 1
+	if 'LegRedemptionDate' in d:
+		add('254=' + str(d['LegRedemptionDate']))
+		n += 1
+	if 'LegStrikePrice' in d:
+		add('612=' + str(d['LegStrikePrice']))
+		n += 1
+	if 'LegStrikeCurrency' in d:
+		add('942=' + str(d['LegStrikeCurrency']))
+		n += 1
+	if 'LegOptAttribute' in d:
+		add('613=' + str(d['LegOptAttribute']))
+		n += 1
+	if 'LegContractMultiplier' in d:
+		add('614=' + str(d['LegContractMultiplier']))
+		n += 1
+	if 'LegCouponRate' in d:
+		add('615=' + str(d['LegCouponRate']))
+		n += 1
+	if 'LegSecurityExchange' in d:
+		add('616=' + str(d['LegSecurityExchange']))
+		n += 1
+	if 'LegIssuer' in d:
+		add('617=' + str(d['LegIssuer']))
+		n += 1
+	if 'EncodedLegIssuerLen' in d:
+		add('618=' + str(d['EncodedLegIssuerLen']))
+		n += 1
+	if 'EncodedLegIssuer' in d:
+		add('619=' + str(d['EncodedLegIssuer']))
+		n += 1
+	if 'LegSecurityDesc' in d:
+		add('620=' + str(d['LegSecurityDesc']))
+		n += 1
+	if 'EncodedLegSecurityDescLen' in d:
+		add('621=' + str(d['EncodedLegSecurityDescLen']))
+		n += 1
+	if 'EncodedLegSecurityDesc' in d:
+		add('622=' + str(d['EncodedLegSecurityDesc']))
+		n += 1
+	if 'LegRatioQty' in d:
+		add('623=' + str(d['LegRatioQty']))
+		n += 1
+	if 'LegSide' in d:
+		add('624=' + str(d['LegSide']))
+		n += 1
+	if 'LegCurrency' in d:
+		add('556=' + str(d['LegCurrency']))
+		n += 1
+	if 'LegPool' in d:
+		add('740=' + str(d['LegPool']))
+		n += 1
+	if 'LegDatedDate' in d:
+		add('739=' + str(d['LegDatedDate']))
+		n += 1
+	if 'LegContractSettlMonth' in d:
+		add('955=' + str(d['LegContractSettlMonth']))
+		n += 1
+	if 'LegInterestAccrualDate' in d:
+		add('956=' + str(d['LegInterestAccrualDate']))
+		n += 1
+	if 'NoUnderlyings' in d:
+		grp = d['NoUnderlyings']
+		add('711=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoUnderlyings(entry, fixm)
+		n += 1
+	if 'MarginExcess' in d:
+		add('899=' + str(d['MarginExcess']))
+		n += 1
+	if 'TotalNetValue' in d:
+		add('900=' + str(d['TotalNetValue']))
+		n += 1
+	if 'CashOutstanding' in d:
+		add('901=' + str(d['CashOutstanding']))
+		n += 1
+	if 'NoTrdRegTimestamps' in d:
+		grp = d['NoTrdRegTimestamps']
+		add('768=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoTrdRegTimestamps(entry, fixm)
+		n += 1
+	if 'Side' in d:
+		add('54=' + str(d['Side']))
+		n += 1
+	if 'NoMiscFees' in d:
+		grp = d['NoMiscFees']
+		add('136=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoMiscFees(entry, fixm)
+		n += 1
+	if 'Price' in d:
+		add('44=' + str(d['Price']))
+		n += 1
+	if 'PriceType' in d:
+		add('423=' + str(d['PriceType']))
+		n += 1
+	if 'AccruedInterestAmt' in d:
+		add('159=' + str(d['AccruedInterestAmt']))
+		n += 1
+	if 'EndAccruedInterestAmt' in d:
+		add('920=' + str(d['EndAccruedInterestAmt']))
+		n += 1
+	if 'StartCash' in d:
+		add('921=' + str(d['StartCash']))
+		n += 1
+	if 'EndCash' in d:
+		add('922=' + str(d['EndCash']))
+		n += 1
+	if 'Spread' in d:
+		add('218=' + str(d['Spread']))
+		n += 1
+	if 'BenchmarkCurveCurrency' in d:
+		add('220=' + str(d['BenchmarkCurveCurrency']))
+		n += 1
+	if 'BenchmarkCurveName' in d:
+		add('221=' + str(d['BenchmarkCurveName']))
+		n += 1
+	if 'BenchmarkCurvePoint' in d:
+		add('222=' + str(d['BenchmarkCurvePoint']))
+		n += 1
+	if 'BenchmarkPrice' in d:
+		add('662=' + str(d['BenchmarkPrice']))
+		n += 1
+	if 'BenchmarkPriceType' in d:
+		add('663=' + str(d['BenchmarkPriceType']))
+		n += 1
+	if 'BenchmarkSecurityID' in d:
+		add('699=' + str(d['BenchmarkSecurityID']))
+		n += 1
+	if 'BenchmarkSecurityIDSource' in d:
+		add('761=' + str(d['BenchmarkSecurityIDSource']))
+		n += 1
+	if 'NoStipulations' in d:
+		grp = d['NoStipulations']
+		add('232=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoStipulations(entry, fixm)
+		n += 1
+	if 'SettlDeliveryType' in d:
+		add('172=' + str(d['SettlDeliveryType']))
+		n += 1
+	if 'StandInstDbType' in d:
+		add('169=' + str(d['StandInstDbType']))
+		n += 1
+	if 'StandInstDbName' in d:
+		add('170=' + str(d['StandInstDbName']))
+		n += 1
+	if 'StandInstDbID' in d:
+		add('171=' + str(d['StandInstDbID']))
+		n += 1
+	if 'NoDlvyInst' in d:
+		grp = d['NoDlvyInst']
+		add('85=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoDlvyInst(entry, fixm)
+		n += 1
+	if 'TradingSessionID' in d:
+		add('336=' + str(d['TradingSessionID']))
+		n += 1
+	if 'TradingSessionSubID' in d:
+		add('625=' + str(d['TradingSessionSubID']))
+		n += 1
+	if 'SettlSessID' in d:
+		add('716=' + str(d['SettlSessID']))
+		n += 1
+	if 'SettlSessSubID' in d:
+		add('717=' + str(d['SettlSessSubID']))
+		n += 1
+	if 'ClearingBusinessDate' in d:
+		add('715=' + str(d['ClearingBusinessDate']))
+		n += 1
+	if 'Text' in d:
+		add('58=' + str(d['Text']))
+		n += 1
+	if 'EncodedTextLen' in d:
+		add('354=' + str(d['EncodedTextLen']))
+		n += 1
+	if 'EncodedText' in d:
+		add('355=' + str(d['EncodedText']))
+		n += 1
+	if len(d) > n:
+		_make_mbody(obj, obj._context, fixm, _msg_CollateralAssignment_names)
+	return fixm
+
+def _decode_CollateralAssignment(obj, fields, index, context):
+	d = obj.__dict__
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _msg_CollateralAssignment_tags.get(num)
+		if spec is None:
+			# not a field of this message, continue with generic decoder
+			body, index = _extract_body(fields, index, context, obj)
+			return index
+		name, pytype, decode_grp = spec
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	return index
+
+class CollateralAssignment(FixObject):
+	_encode = staticmethod(_encode_CollateralAssignment)
+	_decode = staticmethod(_decode_CollateralAssignment)
+
+_msg_CollateralInquiry_names = frozenset(['CollInquiryID', 'NoCollInquiryQualifier', 'SubscriptionRequestType', 'ResponseTransportType', 'ResponseDestination', 'NoPartyIDs', 'Account', 'AccountType', 'ClOrdID', 'OrderID', 'SecondaryOrderID', 'SecondaryClOrdID', 'NoExecs', 'NoTrades', 'Symbol', 'SymbolSfx', 'SecurityID', 'SecurityIDSource', 'NoSecurityAltID', 'Product', 'CFICode', 'SecurityType', 'SecuritySubType', 'MaturityMonthYear', 'MaturityDate', 'CouponPaymentDate', 'IssueDate', 'RepoCollateralSecurityType', 'RepurchaseTerm', 'RepurchaseRate', 'Factor', 'CreditRating', 'InstrRegistry', 'CountryOfIssue', 'StateOrProvinceOfIssue', 'LocaleOfIssue', 'RedemptionDate', 'StrikePrice', 'StrikeCurrency', 'OptAttribute', 'ContractMultiplier', 'CouponRate', 'SecurityExchange', 'Issuer', 'EncodedIssuerLen', 'EncodedIssuer', 'SecurityDesc', 'EncodedSecurityDescLen', 'EncodedSecurityDesc', 'Pool', 'ContractSettlMonth', 'CPProgram', 'CPRegType', 'NoEvents', 'DatedDate', 'InterestAccrualDate', 'AgreementDesc', 'AgreementID', 'AgreementDate', 'AgreementCurrency', 'TerminationType', 'StartDate', 'EndDate', 'DeliveryType', 'MarginRatio', 'SettlDate', 'Quantity', 'QtyType', 'Currency', 'NoLegs', 'LegSymbol', 'LegSymbolSfx', 'LegSecurityID', 'LegSecurityIDSource', 'NoLegSecurityAltID', 'LegProduct', 'LegCFICode', 'LegSecurityType', 'LegSecuritySubType', 'LegMaturityMonthYear', 'LegMaturityDate', 'LegCouponPaymentDate', 'LegIssueDate', 'LegRepoCollateralSecurityType', 'LegRepurchaseTerm', 'LegRepurchaseRate', 'LegFactor', 'LegCreditRating', 'LegInstrRegistry', 'LegCountryOfIssue', 'LegStateOrProvinceOfIssue', 'LegLocaleOfIssue', 'LegRedemptionDate', 'LegStrikePrice', 'LegStrikeCurrency', 'LegOptAttribute', 'LegContractMultiplier', 'LegCouponRate', 'LegSecurityExchange', 'LegIssuer', 'EncodedLegIssuerLen', 'EncodedLegIssuer', 'LegSecurityDesc', 'EncodedLegSecurityDescLen', 'EncodedLegSecurityDesc', 'LegRatioQty', 'LegSide', 'LegCurrency', 'LegPool', 'LegDatedDate', 'LegContractSettlMonth', 'LegInterestAccrualDate', 'NoUnderlyings', 'MarginExcess', 'TotalNetValue', 'CashOutstanding', 'NoTrdRegTimestamps', 'Side', 'Price', 'PriceType', 'AccruedInterestAmt', 'EndAccruedInterestAmt', 'StartCash', 'EndCash', 'Spread', 'BenchmarkCurveCurrency', 'BenchmarkCurveName', 'BenchmarkCurvePoint', 'BenchmarkPrice', 'BenchmarkPriceType', 'BenchmarkSecurityID', 'BenchmarkSecurityIDSource', 'NoStipulations', 'SettlDeliveryType', 'StandInstDbType', 'StandInstDbName', 'StandInstDbID', 'NoDlvyInst', 'TradingSessionID', 'TradingSessionSubID', 'SettlSessID', 'SettlSessSubID', 'ClearingBusinessDate', 'Text', 'EncodedTextLen', 'EncodedText'])
+
+_msg_CollateralInquiry_tags = {
+	909: ('CollInquiryID', str, None),
+	938: ('NoCollInquiryQualifier', int, _decode_grp_NoCollInquiryQualifier),
+	263: ('SubscriptionRequestType', str, None),
+	725: ('ResponseTransportType', int, None),
+	726: ('ResponseDestination', str, None),
+	453: ('NoPartyIDs', int, _decode_grp_NoPartyIDs),
+	1: ('Account', str, None),
+	581: ('AccountType', int, None),
+	11: ('ClOrdID', str, None),
+	37: ('OrderID', str, None),
+	198: ('SecondaryOrderID', str, None),
+	526: ('SecondaryClOrdID', str, None),
+	124: ('NoExecs', int, _decode_grp_NoExecs),
+	897: ('NoTrades', int, _decode_grp_NoTrades),
+	55: ('Symbol', str, None),
+	65: ('SymbolSfx', str, None),
+	48: ('SecurityID', str, None),
+	22: ('SecurityIDSource', str, None),
+	454: ('NoSecurityAltID', int, _decode_grp_NoSecurityAltID),
+	460: ('Product', int, None),
+	461: ('CFICode', str, None),
+	167: ('SecurityType', str, None),
+	762: ('SecuritySubType', str, None),
+	200: ('MaturityMonthYear', str, None),
+	541: ('MaturityDate', str, None),
+	224: ('CouponPaymentDate', str, None),
+	225: ('IssueDate', str, None),
+	239: ('RepoCollateralSecurityType', int, None),
+	226: ('RepurchaseTerm', int, None),
+	227: ('RepurchaseRate', float, None),
+	228: ('Factor', float, None),
+	255: ('CreditRating', str, None),
+	543: ('InstrRegistry', str, None),
+	470: ('CountryOfIssue', str, None),
+	471: ('StateOrProvinceOfIssue', str, None),
+	472: ('LocaleOfIssue', str, None),
+	240: ('RedemptionDate', str, None),
+	202: ('StrikePrice', float, None),
+	947: ('StrikeCurrency', str, None),
+	206: ('OptAttribute', str, None),
+	231: ('ContractMultiplier', float, None),
+	223: ('CouponRate', float, None),
+	207: ('SecurityExchange', str, None),
+	106: ('Issuer', str, None),
+	348: ('EncodedIssuerLen', str, None),
+	349: ('EncodedIssuer', str, None),
+	107: ('SecurityDesc', str, None),
+	350: ('EncodedSecurityDescLen', str, None),
+	351: ('EncodedSecurityDesc', str, None),
+	691: ('Pool', str, None),
+	667: ('ContractSettlMonth', str, None),
+	875: ('CPProgram', int, None),
+	876: ('CPRegType', str, None),
+	864: ('NoEvents', int, _decode_grp_NoEvents),
+	873: ('DatedDate', str, None),
+	874: ('InterestAccrualDate', str, None),
+	913: ('AgreementDesc', str, None),
+	914: ('AgreementID', str, None),
+	915: ('AgreementDate', str, None),
+	918: ('AgreementCurrency', str, None),
+	788: ('TerminationType', int, None),
+	916: ('StartDate', str, None),
+	917: ('EndDate', str, None),
+	919: ('DeliveryType', int, None),
+	898: ('MarginRatio', float, None),
+	64: ('SettlDate', str, None),
+	53: ('Quantity', float, None),
+	854: ('QtyType', int, None),
+	15: ('Currency', str, None),
+	555: ('NoLegs', int, _decode_grp_NoLegs),
+	600: ('LegSymbol', str, None),
+	601: ('LegSymbolSfx', str, None),
+	602: ('LegSecurityID', str, None),
+	603: ('LegSecurityIDSource', str, None),
+	604: ('NoLegSecurityAltID', str, None),
+	607: ('LegProduct', int, None),
+	608: ('LegCFICode', str, None),
+	609: ('LegSecurityType', str, None),
+	764: ('LegSecuritySubType', str, None),
+	610: ('LegMaturityMonthYear', str, None),
+	611: ('LegMaturityDate', str, None),
+	248: ('LegCouponPaymentDate', str, None),
+	249: ('LegIssueDate', str, None),
+	250: ('LegRepoCollateralSecurityType', int, None),
+	251: ('LegRepurchaseTerm', int, None),
+	252: ('LegRepurchaseRate', float, None),
+	253: ('LegFactor', float, None),
+	257: ('LegCreditRating', str, None),
+	599: ('LegInstrRegistry', str, None),
+	596: ('LegCountryOfIssue', str, None),
+	597: ('LegStateOrProvinceOfIssue', str, None),
+	598: ('LegLocaleOfIssue', str, None),
+	254: ('LegRedemptionDate', str, None),
+	612: ('LegStrikePrice', float, None),
+	942: ('LegStrikeCurrency', str, None),
+	613: ('LegOptAttribute', str, None),
+	614: ('LegContractMultiplier', float, None),
+	615: ('LegCouponRate', float, None),
+	616: ('LegSecurityExchange', str, None),
+	617: ('LegIssuer', str, None),
+	618: ('EncodedLegIssuerLen', str, None),
+	619: ('EncodedLegIssuer', str, None),
+	620: ('LegSecurityDesc', str, None),
+	621: ('EncodedLegSecurityDescLen', str, None),
+	622: ('EncodedLegSecurityDesc', str, None),
+	623: ('LegRatioQty', float, None),
+	624: ('LegSide', str, None),
+	556: ('LegCurrency', str, None),
+	740: ('LegPool', str, None),
+	739: ('LegDatedDate', str, None),
+	955: ('LegContractSettlMonth', str, None),
+	956: ('LegInterestAccrualDate', str, None),
+	711: ('NoUnderlyings', int, _decode_grp_NoUnderlyings),
+	899: ('MarginExcess', float, None),
+	900: ('TotalNetValue', float, None),
+	901: ('CashOutstanding', float, None),
+	768: ('NoTrdRegTimestamps', int, _decode_grp_NoTrdRegTimestamps),
+	54: ('Side', str, None),
+	44: ('Price', float, None),
+	423: ('PriceType', int, None),
+	159: ('AccruedInterestAmt', float, None),
+	920: ('EndAccruedInterestAmt', float, None),
+	921: ('StartCash', float, None),
+	922: ('EndCash', float, None),
+	218: ('Spread', float, None),
+	220: ('BenchmarkCurveCurrency', str, None),
+	221: ('BenchmarkCurveName', str, None),
+	222: ('BenchmarkCurvePoint', str, None),
+	662: ('BenchmarkPrice', float, None),
+	663: ('BenchmarkPriceType', int, None),
+	699: ('BenchmarkSecurityID', str, None),
+	761: ('BenchmarkSecurityIDSource', str, None),
+	232: ('NoStipulations', int, _decode_grp_NoStipulations),
+	172: ('SettlDeliveryType', int, None),
+	169: ('StandInstDbType', int, None),
+	170: ('StandInstDbName', str, None),
+	171: ('StandInstDbID', str, None),
+	85: ('NoDlvyInst', int, _decode_grp_NoDlvyInst),
+	336: ('TradingSessionID', str, None),
+	625: ('TradingSessionSubID', str, None),
+	716: ('SettlSessID', str, None),
+	717: ('SettlSessSubID', str, None),
+	715: ('ClearingBusinessDate', str, None),
+	58: ('Text', str, None),
+	354: ('EncodedTextLen', str, None),
+	355: ('EncodedText', str, None),
+}
+
+def _encode_CollateralInquiry(obj, fixm):
+	d = obj.__dict__
+	add = fixm.append
+	n = 1
+	if 'CollInquiryID' in d:
+		add('909=' + str(d['CollInquiryID']))
+		n += 1
+	if 'NoCollInquiryQualifier' in d:
+		grp = d['NoCollInquiryQualifier']
+		add('938=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoCollInquiryQualifier(entry, fixm)
+		n += 1
+	if 'SubscriptionRequestType' in d:
+		add('263=' + str(d['SubscriptionRequestType']))
+		n += 1
+	if 'ResponseTransportType' in d:
+		add('725=' + str(d['ResponseTransportType']))
+		n += 1
+	if 'ResponseDestination' in d:
+		add('726=' + str(d['ResponseDestination']))
+		n += 1
+	if 'NoPartyIDs' in d:
+		grp = d['NoPartyIDs']
+		add('453=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoPartyIDs(entry, fixm)
+		n += 1
+	if 'Account' in d:
+		add('1=' + str(d['Account']))
+		n += 1
+	if 'AccountType' in d:
+		add('581=' + str(d['AccountType']))
+		n += 1
+	if 'ClOrdID' in d:
+		add('11=' + str(d['ClOrdID']))
+		n += 1
+	if 'OrderID' in d:
+		add('37=' + str(d['OrderID']))
+		n += 1
+	if 'SecondaryOrderID' in d:
+		add('198=' + str(d['SecondaryOrderID']))
+		n += 1
+	if 'SecondaryClOrdID' in d:
+		add('526=' + str(d['SecondaryClOrdID']))
+		n += 1
+	if 'NoExecs' in d:
+		grp = d['NoExecs']
+		add('124=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoExecs(entry, fixm)
+		n += 1
+	if 'NoTrades' in d:
+		grp = d['NoTrades']
+		add('897=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoTrades(entry, fixm)
+		n += 1
+	if 'Symbol' in d:
+		add('55=' + str(d['Symbol']))
+		n += 1
+	if 'SymbolSfx' in d:
+		add('65=' + str(d['SymbolSfx']))
+		n += 1
+	if 'SecurityID' in d:
+		add('48=' + str(d['SecurityID']))
+		n += 1
+	if 'SecurityIDSource' in d:
+		add('22=' + str(d['SecurityIDSource']))
+		n += 1
+	if 'NoSecurityAltID' in d:
+		grp = d['NoSecurityAltID']
+		add('454=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoSecurityAltID(entry, fixm)
+		n += 1
+	if 'Product' in d:
+		add('460=' + str(d['Product']))
+		n += 1
+	if 'CFICode' in d:
+		add('461=' + str(d['CFICode']))
+		n += 1
+	if 'SecurityType' in d:
+		add('167=' + str(d['SecurityType']))
+		n += 1
+	if 'SecuritySubType' in d:
+		add('762=' + str(d['SecuritySubType']))
+		n += 1
+	if 'MaturityMonthYear' in d:
+		add('200=' + str(d['MaturityMonthYear']))
+		n += 1
+	if 'MaturityDate' in d:
+		add('541=' + str(d['MaturityDate']))
+		n += 1
+	if 'CouponPaymentDate' in d:
+		add('224=' + str(d['CouponPaymentDate']))
+		n += 1
+	if 'IssueDate' in d:
+		add('225=' + str(d['IssueDate']))
+		n += 1
+	if 'RepoCollateralSecurityType' in d:
+		add('239=' + str(d['RepoCollateralSecurityType']))
+		n += 1
+	if 'RepurchaseTerm' in d:
+		add('226=' + str(d['RepurchaseTerm']))
+		n += 1
+	if 'RepurchaseRate' in d:
+		add('227=' + str(d['RepurchaseRate']))
+		n += 1
+	if 'Factor' in d:
+		add('228=' + str(d['Factor']))
+		n += 1
+	if 'CreditRating' in d:
+		add('255=' + str(d['CreditRating']))
+		n += 1
+	if 'InstrRegistry' in d:
+		add('543=' + str(d['InstrRegistry']))
+		n += 1
+	if 'CountryOfIssue' in d:
+		add('470=' + str(d['CountryOfIssue']))
+		n += 1
+	if 'StateOrProvinceOfIssue' in d:
+		add('471=' + str(d['StateOrProvinceOfIssue']))
+		n += 1
+	if 'LocaleOfIssue' in d:
+		add('472=' + str(d['LocaleOfIssue']))
+		n += 1
+	if 'RedemptionDate' in d:
+		add('240=' + str(d['RedemptionDate']))
+		n += 1
+	if 'StrikePrice' in d:
+		add('202=' + str(d['StrikePrice']))
+		n += 1
+	if 'StrikeCurrency' in d:
+		add('947=' + str(d['StrikeCurrency']))
+		n += 1
+	if 'OptAttribute' in d:
+		add('206=' + str(d['OptAttribute']))
+		n += 1
+	if 'ContractMultiplier' in d:
+		add('231=' + str(d['ContractMultiplier']))
+		n += 1
+	if 'CouponRate' in d:
+		add('223=' + str(d['CouponRate']))
+		n += 1
+	if 'SecurityExchange' in d:
+		add('207=' + str(d['SecurityExchange']))
+		n += 1
+	if 'Issuer' in d:
+		add('106=' + str(d['Issuer']))
+		n += 1
+	if 'EncodedIssuerLen' in d:
+		add('348=' + str(d['EncodedIssuerLen']))
+		n += 1
+	if 'EncodedIssuer' in d:
+		add('349=' + str(d['EncodedIssuer']))
+		n += 1
+	if 'SecurityDesc' in d:
+		add('107=' + str(d['SecurityDesc']))
+		n += 1
+	if 'EncodedSecurityDescLen' in d:
+		add('350=' + str(d['EncodedSecurityDescLen']))
+		n += 1
+	if 'EncodedSecurityDesc' in d:
+		add('351=' + str(d['EncodedSecurityDesc']))
+		n += 1
+	if 'Pool' in d:
+		add('691=' + str(d['Pool']))
+		n += 1
+	if 'ContractSettlMonth' in d:
+		add('667=' + str(d['ContractSettlMonth']))
+		n += 1
+	if 'CPProgram' in d:
+		add('875=' + str(d['CPProgram']))
+		n += 1
+	if 'CPRegType' in d:
+		add('876=' + str(d['CPRegType']))
+		n += 1
+	if 'NoEvents' in d:
+		grp = d['NoEvents']
+		add('864=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoEvents(entry, fixm)
+		n += 1
+	if 'DatedDate' in d:
+		add('873=' + str(d['DatedDate']))
+		n += 1
+	if 'InterestAccrualDate' in d:
+		add('874=' + str(d['InterestAccrualDate']))
+		n += 1
+	if 'AgreementDesc' in d:
+		add('913=' + str(d['AgreementDesc']))
+		n += 1
+	if 'AgreementID' in d:
+		add('914=' + str(d['AgreementID']))
+		n += 1
+	if 'AgreementDate' in d:
+		add('915=' + str(d['AgreementDate']))
+		n += 1
+	if 'AgreementCurrency' in d:
+		add('918=' + str(d['AgreementCurrency']))
+		n += 1
+	if 'TerminationType' in d:
+		add('788=' + str(d['TerminationType']))
+		n += 1
+	if 'StartDate' in d:
+		add('916=' + str(d['StartDate']))
+		n += 1
+	if 'EndDate' in d:
+		add('917=' + str(d['EndDate']))
+		n += 1
+	if 'DeliveryType' in d:
+		add('919=' + str(d['DeliveryType']))
+		n += 1
+	if 'MarginRatio' in d:
+		add('898=' + str(d['MarginRatio']))
+		n += 1
+	if 'SettlDate' in d:
+		add('64=' + str(d['SettlDate']))
+		n += 1
+	if 'Quantity' in d:
+		add('53=' + str(d['Quantity']))
+		n += 1
+	if 'QtyType' in d:
+		add('854=' + str(d['QtyType']))
+		n += 1
+	if 'Currency' in d:
+		add('15=' + str(d['Currency']))
+		n += 1
+	if 'NoLegs' in d:
+		grp = d['NoLegs']
+		add('555=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoLegs(entry, fixm)
+		n += 1
+	if 'LegSymbol' in d:
+		add('600=' + str(d['LegSymbol']))
+		n += 1
+	if 'LegSymbolSfx' in d:
+		add('601=' + str(d['LegSymbolSfx']))
+		n += 1
+	if 'LegSecurityID' in d:
+		add('602=' + str(d['LegSecurityID']))
+		n += 1
+	if 'LegSecurityIDSource' in d:
+		add('603=' + str(d['LegSecurityIDSource']))
+		n += 1
+	if 'NoLegSecurityAltID' in d:
+		add('604=' + str(d['NoLegSecurityAltID']))
+		n += 1
+	if 'LegProduct' in d:
+		add('607=' + str(d['LegProduct']))
+		n += 1
+	if 'LegCFICode' in d:
+		add('608=' + str(d['LegCFICode']))
+		n += 1
+	if 'LegSecurityType' in d:
+		add('609=' + str(d['LegSecurityType']))
+		n += 1
+	if 'LegSecuritySubType' in d:
+		add('764=' + str(d['LegSecuritySubType']))
+		n += 1
+	if 'LegMaturityMonthYear' in d:
+		add('610=' + str(d['LegMaturityMonthYear']))
+		n += 1
+	if 'LegMaturityDate' in d:
+		add('611=' + str(d['LegMaturityDate']))
+		n += 1
+	if 'LegCouponPaymentDate' in d:
+		add('248=' + str(d['LegCouponPaymentDate']))
+		n += 1
+	if 'LegIssueDate' in d:
+		add('249=' + str(d['LegIssueDate']))
+		n += 1
+	if 'LegRepoCollateralSecurityType' in d:
+		add('250=' + str(d['LegRepoCollateralSecurityType']))
+		n += 1
+	if 'LegRepurchaseTerm' in d:
+		add('251=' + str(d['LegRepurchaseTerm']))
+		n += 1
+	if 'LegRepurchaseRate' in d:
+		add('252=' + str(d['LegRepurchaseRate']))
+		n += 1
+	if 'LegFactor' in d:
+		add('253=' + str(d['LegFactor']))
+		n += 1
+	if 'LegCreditRating' in d:
+		add('257=' + str(d['LegCreditRating']))
+		n += 1
+	if 'LegInstrRegistry' in d:
+		add('599=' + str(d['LegInstrRegistry']))
+		n += 1
+	if 'LegCountryOfIssue' in d:
+		add('596=' + str(d['LegCountryOfIssue']))
+		n += 1
+	if 'LegStateOrProvinceOfIssue' in d:
+		add('597=' + str(d['LegStateOrProvinceOfIssue']))
+		n += 1
+	if 'LegLocaleOfIssue' in d:
+		add('598=' + str(d['LegLocaleOfIssue']))
+		n += 1
+	if 'LegRedemptionDate' in d:
+		add('254=' + str(d['LegRedemptionDate']))
+		n += 1
+	if 'LegStrikePrice' in d:
+		add('612=' + str(d['LegStrikePrice']))
+		n += 1
+	if 'LegStrikeCurrency' in d:
+		add('942=' + str(d['LegStrikeCurrency']))
+		n += 1
+	if 'LegOptAttribute' in d:
+		add('613=' + str(d['LegOptAttribute']))
+		n += 1
+	if 'LegContractMultiplier' in d:
+		add('614=' + str(d['LegContractMultiplier']))
+		n += 1
+	if 'LegCouponRate' in d:
+		add('615=' + str(d['LegCouponRate']))
+		n += 1
+	if 'LegSecurityExchange' in d:
+		add('616=' + str(d['LegSecurityExchange']))
+		n += 1
+	if 'LegIssuer' in d:
+		add('617=' + str(d['LegIssuer']))
+		n += 1
+	if 'EncodedLegIssuerLen' in d:
+		add('618=' + str(d['EncodedLegIssuerLen']))
+		n += 1
+	if 'EncodedLegIssuer' in d:
+		add('619=' + str(d['EncodedLegIssuer']))
+		n += 1
+	if 'LegSecurityDesc' in d:
+		add('620=' + str(d['LegSecurityDesc']))
+		n += 1
+	if 'EncodedLegSecurityDescLen' in d:
+		add('621=' + str(d['EncodedLegSecurityDescLen']))
+		n += 1
+	if 'EncodedLegSecurityDesc' in d:
+		add('622=' + str(d['EncodedLegSecurityDesc']))
+		n += 1
+	if 'LegRatioQty' in d:
+		add('623=' + str(d['LegRatioQty']))
+		n += 1
+	if 'LegSide' in d:
+		add('624=' + str(d['LegSide']))
+		n += 1
+	if 'LegCurrency' in d:
+		add('556=' + str(d['LegCurrency']))
+		n += 1
+	if 'LegPool' in d:
+		add('740=' + str(d['LegPool']))
+		n += 1
+	if 'LegDatedDate' in d:
+		add('739=' + str(d['LegDatedDate']))
+		n += 1
+	if 'LegContractSettlMonth' in d:
+		add('955=' + str(d['LegContractSettlMonth']))
+		n += 1
+	if 'LegInterestAccrualDate' in d:
+		add('956=' + str(d['LegInterestAccrualDate']))
+		n += 1
+	if 'NoUnderlyings' in d:
+		grp = d['NoUnderlyings']
+		add('711=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoUnderlyings(entry, fixm)
+		n += 1
+	if 'MarginExcess' in d:
+		add('899=' + str(d['MarginExcess']))
+		n += 1
+	if 'TotalNetValue' in d:
+		add('900=' + str(d['TotalNetValue']))
+		n += 1
+	if 'CashOutstanding' in d:
+		add('901=' + str(d['CashOutstanding']))
+		n += 1
+	if 'NoTrdRegTimestamps' in d:
+		grp = d['NoTrdRegTimestamps']
+		add('768=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoTrdRegTimestamps(entry, fixm)
+		n += 1
+	if 'Side' in d:
+		add('54=' + str(d['Side']))
+		n += 1
+	if 'Price' in d:
+		add('44=' + str(d['Price']))
+		n += 1
+	if 'PriceType' in d:
+		add('423=' + str(d['PriceType']))
+		n += 1
+	if 'AccruedInterestAmt' in d:
+		add('159=' + str(d['AccruedInterestAmt']))
+		n += 1
+	if 'EndAccruedInterestAmt' in d:
+		add('920=' + str(d['EndAccruedInterestAmt']))
+		n += 1
+	if 'StartCash' in d:
+		add('921=' + str(d['StartCash']))
+		n += 1
+	if 'EndCash' in d:
+		add('922=' + str(d['EndCash']))
+		n += 1
+	if 'Spread' in d:
+		add('218=' + str(d['Spread']))
+		n += 1
+	if 'BenchmarkCurveCurrency' in d:
+		add('220=' + str(d['BenchmarkCurveCurrency']))
+		n += 1
+	if 'BenchmarkCurveName' in d:
+		add('221=' + str(d['BenchmarkCurveName']))
+		n += 1
+	if 'BenchmarkCurvePoint' in d:
+		add('222=' + str(d['BenchmarkCurvePoint']))
+		n += 1
+	if 'BenchmarkPrice' in d:
+		add('662=' + str(d['BenchmarkPrice']))
+		n += 1
+	if 'BenchmarkPriceType' in d:
+		add('663=' + str(d['BenchmarkPriceType']))
+		n += 1
+	if 'BenchmarkSecurityID' in d:
+		add('699=' + str(d['BenchmarkSecurityID']))
+		n += 1
+	if 'BenchmarkSecurityIDSource' in d:
+		add('761=' + str(d['BenchmarkSecurityIDSource']))
+		n += 1
+	if 'NoStipulations' in d:
+		grp = d['NoStipulations']
+		add('232=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoStipulations(entry, fixm)
+		n += 1
+	if 'SettlDeliveryType' in d:
+		add('172=' + str(d['SettlDeliveryType']))
+		n += 1
+	if 'StandInstDbType' in d:
+		add('169=' + str(d['StandInstDbType']))
+		n += 1
+	if 'StandInstDbName' in d:
+		add('170=' + str(d['StandInstDbName']))
+		n += 1
+	if 'StandInstDbID' in d:
+		add('171=' + str(d['StandInstDbID']))
+		n += 1
+	if 'NoDlvyInst' in d:
+		grp = d['NoDlvyInst']
+		add('85=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoDlvyInst(entry, fixm)
+		n += 1
+	if 'TradingSessionID' in d:
+		add('336=' + str(d['TradingSessionID']))
+		n += 1
+	if 'TradingSessionSubID' in d:
+		add('625=' + str(d['TradingSessionSubID']))
+		n += 1
+	if 'SettlSessID' in d:
+		add('716=' + str(d['SettlSessID']))
+		n += 1
+	if 'SettlSessSubID' in d:
+		add('717=' + str(d['SettlSessSubID']))
+		n += 1
+	if 'ClearingBusinessDate' in d:
+		add('715=' + str(d['ClearingBusinessDate']))
+		n += 1
+	if 'Text' in d:
+		add('58=' + str(d['Text']))
+		n += 1
+	if 'EncodedTextLen' in d:
+		add('354=' + str(d['EncodedTextLen']))
+		n += 1
+	if 'EncodedText' in d:
+		add('355=' + str(d['EncodedText']))
+		n += 1
+	if len(d) > n:
+		_make_mbody(obj, obj._context, fixm, _msg_CollateralInquiry_names)
+	return fixm
+
+def _decode_CollateralInquiry(obj, fields, index, context):
+	d = obj.__dict__
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _msg_CollateralInquiry_tags.get(num)
+		if spec is None:
+			# not a field of this message, continue with generic decoder
+			body, index = _extract_body(fields, index, context, obj)
+			return index
+		name, pytype, decode_grp = spec
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	return index
+
+class CollateralInquiry(FixObject):
+	_encode = staticmethod(_encode_CollateralInquiry)
+	_decode = staticmethod(_decode_CollateralInquiry)
+
+_msg_CollateralInquiryAck_names = frozenset(['CollInquiryID', 'CollInquiryStatus', 'CollInquiryResult', 'NoCollInquiryQualifier', 'TotNumReports', 'NoPartyIDs', 'Account', 'AccountType', 'ClOrdID', 'OrderID', 'SecondaryOrderID', 'SecondaryClOrdID', 'NoExecs', 'NoTrades', 'Symbol', 'SymbolSfx', 'SecurityID', 'SecurityIDSource', 'NoSecurityAltID', 'Product', 'CFICode', 'SecurityType', 'SecuritySubType', 'MaturityMonthYear', 'MaturityDate', 'CouponPaymentDate', 'IssueDate', 'RepoCollateralSecurityType', 'RepurchaseTerm', 'RepurchaseRate', 'Factor', 'CreditRating', 'InstrRegistry', 'CountryOfIssue', 'StateOrProvinceOfIssue', 'LocaleOfIssue', 'RedemptionDate', 'StrikePrice', 'StrikeCurrency', 'OptAttribute', 'ContractMultiplier', 'CouponRate', 'SecurityExchange', 'Issuer', 'EncodedIssuerLen', 'EncodedIssuer', 'SecurityDesc', 'EncodedSecurityDescLen', 'EncodedSecurityDesc', 'Pool', 'ContractSettlMonth', 'CPProgram', 'CPRegType', 'NoEvents', 'DatedDate', 'InterestAccrualDate', 'AgreementDesc', 'AgreementID', 'AgreementDate', 'AgreementCurrency', 'TerminationType', 'StartDate', 'EndDate', 'DeliveryType', 'MarginRatio', 'SettlDate', 'Quantity', 'QtyType', 'Currency', 'NoLegs', 'LegSymbol', 'LegSymbolSfx', 'LegSecurityID', 'LegSecurityIDSource', 'NoLegSecurityAltID', 'LegProduct', 'LegCFICode', 'LegSecurityType', 'LegSecuritySubType', 'LegMaturityMonthYear', 'LegMaturityDate', 'LegCouponPaymentDate', 'LegIssueDate', 'LegRepoCollateralSecurityType', 'LegRepurchaseTerm', 'LegRepurchaseRate', 'LegFactor', 'LegCreditRating', 'LegInstrRegistry', 'LegCountryOfIssue', 'LegStateOrProvinceOfIssue', 'LegLocaleOfIssue', 'LegRedemptionDate', 'LegStrikePrice', 'LegStrikeCurrency', 'LegOptAttribute', 'LegContractMultiplier', 'LegCouponRate', 'LegSecurityExchange', 'LegIssuer', 'EncodedLegIssuerLen', 'EncodedLegIssuer', 'LegSecurityDesc', 'EncodedLegSecurityDescLen', 'EncodedLegSecurityDesc', 'LegRatioQty', 'LegSide', 'LegCurrency', 'LegPool', 'LegDatedDate', 'LegContractSettlMonth', 'LegInterestAccrualDate', 'NoUnderlyings', 'TradingSessionID', 'TradingSessionSubID', 'SettlSessID', 'SettlSessSubID', 'ClearingBusinessDate', 'ResponseTransportType', 'ResponseDestination', 'Text', 'EncodedTextLen', 'EncodedText'])
+
+_msg_CollateralInquiryAck_tags = {
+	909: ('CollInquiryID', str, None),
+	945: ('CollInquiryStatus', int, None),
+	946: ('CollInquiryResult', int, None),
+	938: ('NoCollInquiryQualifier', int, _decode_grp_NoCollInquiryQualifier),
+	911: ('TotNumReports', int, None),
+	453: ('NoPartyIDs', int, _decode_grp_NoPartyIDs),
+	1: ('Account', str, None),
+	581: ('AccountType', int, None),
+	11: ('ClOrdID', str, None),
+	37: ('OrderID', str, None),
+	198: ('SecondaryOrderID', str, None),
+	526: ('SecondaryClOrdID', str, None),
+	124: ('NoExecs', int, _decode_grp_NoExecs),
+	897: ('NoTrades', int, _decode_grp_NoTrades),
+	55: ('Symbol', str, None),
+	65: ('SymbolSfx', str, None),
+	48: ('SecurityID', str, None),
+	22: ('SecurityIDSource', str, None),
+	454: ('NoSecurityAltID', int, _decode_grp_NoSecurityAltID),
+	460: ('Product', int, None),
+	461: ('CFICode', str, None),
+	167: ('SecurityType', str, None),
+	762: ('SecuritySubType', str, None),
+	200: ('MaturityMonthYear', str, None),
+	541: ('MaturityDate', str, None),
+	224: ('CouponPaymentDate', str, None),
+	225: ('IssueDate', str, None),
+	239: ('RepoCollateralSecurityType', int, None),
+	226: ('RepurchaseTerm', int, None),
+	227: ('RepurchaseRate', float, None),
+	228: ('Factor', float, None),
+	255: ('CreditRating', str, None),
+	543: ('InstrRegistry', str, None),
+	470: ('CountryOfIssue', str, None),
+	471: ('StateOrProvinceOfIssue', str, None),
+	472: ('LocaleOfIssue', str, None),
+	240: ('RedemptionDate', str, None),
+	202: ('StrikePrice', float, None),
+	947: ('StrikeCurrency', str, None),
+	206: ('OptAttribute', str, None),
+	231: ('ContractMultiplier', float, None),
+	223: ('CouponRate', float, None),
+	207: ('SecurityExchange', str, None),
+	106: ('Issuer', str, None),
+	348: ('EncodedIssuerLen', str, None),
+	349: ('EncodedIssuer', str, None),
+	107: ('SecurityDesc', str, None),
+	350: ('EncodedSecurityDescLen', str, None),
+	351: ('EncodedSecurityDesc', str, None),
+	691: ('Pool', str, None),
+	667: ('ContractSettlMonth', str, None),
+	875: ('CPProgram', int, None),
+	876: ('CPRegType', str, None),
+	864: ('NoEvents', int, _decode_grp_NoEvents),
+	873: ('DatedDate', str, None),
+	874: ('InterestAccrualDate', str, None),
+	913: ('AgreementDesc', str, None),
+	914: ('AgreementID', str, None),
+	915: ('AgreementDate', str, None),
+	918: ('AgreementCurrency', str, None),
+	788: ('TerminationType', int, None),
+	916: ('StartDate', str, None),
+	917: ('EndDate', str, None),
+	919: ('DeliveryType', int, None),
+	898: ('MarginRatio', float, None),
+	64: ('SettlDate', str, None),
+	53: ('Quantity', float, None),
+	854: ('QtyType', int, None),
+	15: ('Currency', str, None),
+	555: ('NoLegs', int, _decode_grp_NoLegs),
+	600: ('LegSymbol', str, None),
+	601: ('LegSymbolSfx', str, None),
+	602: ('LegSecurityID', str, None),
+	603: ('LegSecurityIDSource', str, None),
+	604: ('NoLegSecurityAltID', str, None),
+	607: ('LegProduct', int, None),
+	608: ('LegCFICode', str, None),
+	609: ('LegSecurityType', str, None),
+	764: ('LegSecuritySubType', str, None),
+	610: ('LegMaturityMonthYear', str, None),
+	611: ('LegMaturityDate', str, None),
+	248: ('LegCouponPaymentDate', str, None),
+	249: ('LegIssueDate', str, None),
+	250: ('LegRepoCollateralSecurityType', int, None),
+	251: ('LegRepurchaseTerm', int, None),
+	252: ('LegRepurchaseRate', float, None),
+	253: ('LegFactor', float, None),
+	257: ('LegCreditRating', str, None),
+	599: ('LegInstrRegistry', str, None),
+	596: ('LegCountryOfIssue', str, None),
+	597: ('LegStateOrProvinceOfIssue', str, None),
+	598: ('LegLocaleOfIssue', str, None),
+	254: ('LegRedemptionDate', str, None),
+	612: ('LegStrikePrice', float, None),
+	942: ('LegStrikeCurrency', str, None),
+	613: ('LegOptAttribute', str, None),
+	614: ('LegContractMultiplier', float, None),
+	615: ('LegCouponRate', float, None),
+	616: ('LegSecurityExchange', str, None),
+	617: ('LegIssuer', str, None),
+	618: ('EncodedLegIssuerLen', str, None),
+	619: ('EncodedLegIssuer', str, None),
+	620: ('LegSecurityDesc', str, None),
+	621: ('EncodedLegSecurityDescLen', str, None),
+	622: ('EncodedLegSecurityDesc', str, None),
+	623: ('LegRatioQty', float, None),
+	624: ('LegSide', str, None),
+	556: ('LegCurrency', str, None),
+	740: ('LegPool', str, None),
+	739: ('LegDatedDate', str, None),
+	955: ('LegContractSettlMonth', str, None),
+	956: ('LegInterestAccrualDate', str, None),
+	711: ('NoUnderlyings', int, _decode_grp_NoUnderlyings),
+	336: ('TradingSessionID', str, None),
+	625: ('TradingSessionSubID', str, None),
+	716: ('SettlSessID', str, None),
+	717: ('SettlSessSubID', str, None),
+	715: ('ClearingBusinessDate', str, None),
+	725: ('ResponseTransportType', int, None),
+	726: ('ResponseDestination', str, None),
+	58: ('Text', str, None),
+	354: ('EncodedTextLen', str, None),
+	355: ('EncodedText', str, None),
+}
+
+def _encode_CollateralInquiryAck(obj, fixm):
+	d = obj.__dict__
+	add = fixm.append
+	n = 1
+	if 'CollInquiryID' in d:
+		add('909=' + str(d['CollInquiryID']))
+		n += 1
+	if 'CollInquiryStatus' in d:
+		add('945=' + str(d['CollInquiryStatus']))
+		n += 1
+	if 'CollInquiryResult' in d:
+		add('946=' + str(d['CollInquiryResult']))
+		n += 1
+	if 'NoCollInquiryQualifier' in d:
+		grp = d['NoCollInquiryQualifier']
+		add('938=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoCollInquiryQualifier(entry, fixm)
+		n += 1
+	if 'TotNumReports' in d:
+		add('911=' + str(d['TotNumReports']))
+		n += 1
+	if 'NoPartyIDs' in d:
+		grp = d['NoPartyIDs']
+		add('453=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoPartyIDs(entry, fixm)
+		n += 1
+	if 'Account' in d:
+		add('1=' + str(d['Account']))
+		n += 1
+	if 'AccountType' in d:
+		add('581=' + str(d['AccountType']))
+		n += 1
+	if 'ClOrdID' in d:
+		add('11=' + str(d['ClOrdID']))
+		n += 1
+	if 'OrderID' in d:
+		add('37=' + str(d['OrderID']))
+		n += 1
+	if 'SecondaryOrderID' in d:
+		add('198=' + str(d['SecondaryOrderID']))
+		n += 1
+	if 'SecondaryClOrdID' in d:
+		add('526=' + str(d['SecondaryClOrdID']))
+		n += 1
+	if 'NoExecs' in d:
+		grp = d['NoExecs']
+		add('124=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoExecs(entry, fixm)
+		n += 1
+	if 'NoTrades' in d:
+		grp = d['NoTrades']
+		add('897=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoTrades(entry, fixm)
+		n += 1
+	if 'Symbol' in d:
+		add('55=' + str(d['Symbol']))
+		n += 1
+	if 'SymbolSfx' in d:
+		add('65=' + str(d['SymbolSfx']))
+		n += 1
+	if 'SecurityID' in d:
+		add('48=' + str(d['SecurityID']))
+		n += 1
+	if 'SecurityIDSource' in d:
+		add('22=' + str(d['SecurityIDSource']))
+		n += 1
+	if 'NoSecurityAltID' in d:
+		grp = d['NoSecurityAltID']
+		add('454=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoSecurityAltID(entry, fixm)
+		n += 1
+	if 'Product' in d:
+		add('460=' + str(d['Product']))
+		n += 1
+	if 'CFICode' in d:
+		add('461=' + str(d['CFICode']))
+		n += 1
+	if 'SecurityType' in d:
+		add('167=' + str(d['SecurityType']))
+		n += 1
+	if 'SecuritySubType' in d:
+		add('762=' + str(d['SecuritySubType']))
+		n += 1
+	if 'MaturityMonthYear' in d:
+		add('200=' + str(d['MaturityMonthYear']))
+		n += 1
+	if 'MaturityDate' in d:
+		add('541=' + str(d['MaturityDate']))
+		n += 1
+	if 'CouponPaymentDate' in d:
+		add('224=' + str(d['CouponPaymentDate']))
+		n += 1
+	if 'IssueDate' in d:
+		add('225=' + str(d['IssueDate']))
+		n += 1
+	if 'RepoCollateralSecurityType' in d:
+		add('239=' + str(d['RepoCollateralSecurityType']))
+		n += 1
+	if 'RepurchaseTerm' in d:
+		add('226=' + str(d['RepurchaseTerm']))
+		n += 1
+	if 'RepurchaseRate' in d:
+		add('227=' + str(d['RepurchaseRate']))
+		n += 1
+	if 'Factor' in d:
+		add('228=' + str(d['Factor']))
+		n += 1
+	if 'CreditRating' in d:
+		add('255=' + str(d['CreditRating']))
+		n += 1
+	if 'InstrRegistry' in d:
+		add('543=' + str(d['InstrRegistry']))
+		n += 1
+	if 'CountryOfIssue' in d:
+		add('470=' + str(d['CountryOfIssue']))
+		n += 1
+	if 'StateOrProvinceOfIssue' in d:
+		add('471=' + str(d['StateOrProvinceOfIssue']))
+		n += 1
+	if 'LocaleOfIssue' in d:
+		add('472=' + str(d['LocaleOfIssue']))
+		n += 1
+	if 'RedemptionDate' in d:
+		add('240=' + str(d['RedemptionDate']))
+		n += 1
+	if 'StrikePrice' in d:
+		add('202=' + str(d['StrikePrice']))
+		n += 1
+	if 'StrikeCurrency' in d:
+		add('947=' + str(d['StrikeCurrency']))
+		n += 1
+	if 'OptAttribute' in d:
+		add('206=' + str(d['OptAttribute']))
+		n += 1
+	if 'ContractMultiplier' in d:
+		add('231=' + str(d['ContractMultiplier']))
+		n += 1
+	if 'CouponRate' in d:
+		add('223=' + str(d['CouponRate']))
+		n += 1
+	if 'SecurityExchange' in d:
+		add('207=' + str(d['SecurityExchange']))
+		n += 1
+	if 'Issuer' in d:
+		add('106=' + str(d['Issuer']))
+		n += 1
+	if 'EncodedIssuerLen' in d:
+		add('348=' + str(d['EncodedIssuerLen']))
+		n += 1
+	if 'EncodedIssuer' in d:
+		add('349=' + str(d['EncodedIssuer']))
+		n += 1
+	if 'SecurityDesc' in d:
+		add('107=' + str(d['SecurityDesc']))
+		n += 1
+	if 'EncodedSecurityDescLen' in d:
+		add('350=' + str(d['EncodedSecurityDescLen']))
+		n += 1
+	if 'EncodedSecurityDesc' in d:
+		add('351=' + str(d['EncodedSecurityDesc']))
+		n += 1
+	if 'Pool' in d:
+		add('691=' + str(d['Pool']))
+		n += 1
+	if 'ContractSettlMonth' in d:
+		add('667=' + str(d['ContractSettlMonth']))
+		n += 1
+	if 'CPProgram' in d:
+		add('875=' + str(d['CPProgram']))
+		n += 1
+	if 'CPRegType' in d:
+		add('876=' + str(d['CPRegType']))
+		n += 1
+	if 'NoEvents' in d:
+		grp = d['NoEvents']
+		add('864=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoEvents(entry, fixm)
+		n += 1
+	if 'DatedDate' in d:
+		add('873=' + str(d['DatedDate']))
+		n += 1
+	if 'InterestAccrualDate' in d:
+		add('874=' + str(d['InterestAccrualDate']))
+		n += 1
+	if 'AgreementDesc' in d:
+		add('913=' + str(d['AgreementDesc']))
+		n += 1
+	if 'AgreementID' in d:
+		add('914=' + str(d['AgreementID']))
+		n += 1
+	if 'AgreementDate' in d:
+		add('915=' + str(d['AgreementDate']))
+		n += 1
+	if 'AgreementCurrency' in d:
+		add('918=' + str(d['AgreementCurrency']))
+		n += 1
+	if 'TerminationType' in d:
+		add('788=' + str(d['TerminationType']))
+		n += 1
+	if 'StartDate' in d:
+		add('916=' + str(d['StartDate']))
+		n += 1
+	if 'EndDate' in d:
+		add('917=' + str(d['EndDate']))
+		n += 1
+	if 'DeliveryType' in d:
+		add('919=' + str(d['DeliveryType']))
+		n += 1
+	if 'MarginRatio' in d:
+		add('898=' + str(d['MarginRatio']))
+		n += 1
+	if 'SettlDate' in d:
+		add('64=' + str(d['SettlDate']))
+		n += 1
+	if 'Quantity' in d:
+		add('53=' + str(d['Quantity']))
+		n += 1
+	if 'QtyType' in d:
+		add('854=' + str(d['QtyType']))
+		n += 1
+	if 'Currency' in d:
+		add('15=' + str(d['Currency']))
+		n += 1
+	if 'NoLegs' in d:
+		grp = d['NoLegs']
+		add('555=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoLegs(entry, fixm)
+		n += 1
+	if 'LegSymbol' in d:
+		add('600=' + str(d['LegSymbol']))
+		n += 1
+	if 'LegSymbolSfx' in d:
+		add('601=' + str(d['LegSymbolSfx']))
+		n += 1
+	if 'LegSecurityID' in d:
+		add('602=' + str(d['LegSecurityID']))
+		n += 1
+	if 'LegSecurityIDSource' in d:
+		add('603=' + str(d['LegSecurityIDSource']))
+		n += 1
+	if 'NoLegSecurityAltID' in d:
+		add('604=' + str(d['NoLegSecurityAltID']))
+		n += 1
+	if 'LegProduct' in d:
+		add('607=' + str(d['LegProduct']))
+		n += 1
+	if 'LegCFICode' in d:
+		add('608=' + str(d['LegCFICode']))
+		n += 1
+	if 'LegSecurityType' in d:
+		add('609=' + str(d['LegSecurityType']))
+		n += 1
+	if 'LegSecuritySubType' in d:
+		add('764=' + str(d['LegSecuritySubType']))
+		n += 1
+	if 'LegMaturityMonthYear' in d:
+		add('610=' + str(d['LegMaturityMonthYear']))
+		n += 1
+	if 'LegMaturityDate' in d:
+		add('611=' + str(d['LegMaturityDate']))
+		n += 1
+	if 'LegCouponPaymentDate' in d:
+		add('248=' + str(d['LegCouponPaymentDate']))
+		n += 1
+	if 'LegIssueDate' in d:
+		add('249=' + str(d['LegIssueDate']))
+		n += 1
+	if 'LegRepoCollateralSecurityType' in d:
+		add('250=' + str(d['LegRepoCollateralSecurityType']))
+		n += 1
+	if 'LegRepurchaseTerm' in d:
+		add('251=' + str(d['LegRepurchaseTerm']))
+		n += 1
+	if 'LegRepurchaseRate' in d:
+		add('252=' + str(d['LegRepurchaseRate']))
+		n += 1
+	if 'LegFactor' in d:
+		add('253=' + str(d['LegFactor']))
+		n += 1
+	if 'LegCreditRating' in d:
+		add('257=' + str(d['LegCreditRating']))
+		n += 1
+	if 'LegInstrRegistry' in d:
+		add('599=' + str(d['LegInstrRegistry']))
+		n += 1
+	if 'LegCountryOfIssue' in d:
+		add('596=' + str(d['LegCountryOfIssue']))
+		n += 1
+	if 'LegStateOrProvinceOfIssue' in d:
+		add('597=' + str(d['LegStateOrProvinceOfIssue']))
+		n += 1
+	if 'LegLocaleOfIssue' in d:
+		add('598=' + str(d['LegLocaleOfIssue']))
+		n += 1
+	if 'LegRedemptionDate' in d:
+		add('254=' + str(d['LegRedemptionDate']))
+		n += 1
+	if 'LegStrikePrice' in d:
+		add('612=' + str(d['LegStrikePrice']))
+		n += 1
+	if 'LegStrikeCurrency' in d:
+		add('942=' + str(d['LegStrikeCurrency']))
+		n += 1
+	if 'LegOptAttribute' in d:
+		add('613=' + str(d['LegOptAttribute']))
+		n += 1
+	if 'LegContractMultiplier' in d:
+		add('614=' + str(d['LegContractMultiplier']))
+		n += 1
+	if 'LegCouponRate' in d:
+		add('615=' + str(d['LegCouponRate']))
+		n += 1
+	if 'LegSecurityExchange' in d:
+		add('616=' + str(d['LegSecurityExchange']))
+		n += 1
+	if 'LegIssuer' in d:
+		add('617=' + str(d['LegIssuer']))
+		n += 1
+	if 'EncodedLegIssuerLen' in d:
+		add('618=' + str(d['EncodedLegIssuerLen']))
+		n += 1
+	if 'EncodedLegIssuer' in d:
+		add('619=' + str(d['EncodedLegIssuer']))
+		n += 1
+	if 'LegSecurityDesc' in d:
+		add('620=' + str(d['LegSecurityDesc']))
+		n += 1
+	if 'EncodedLegSecurityDescLen' in d:
+		add('621=' + str(d['EncodedLegSecurityDescLen']))
+		n += 1
+	if 'EncodedLegSecurityDesc' in d:
+		add('622=' + str(d['EncodedLegSecurityDesc']))
+		n += 1
+	if 'LegRatioQty' in d:
+		add('623=' + str(d['LegRatioQty']))
+		n += 1
+	if 'LegSide' in d:
+		add('624=' + str(d['LegSide']))
+		n += 1
+	if 'LegCurrency' in d:
+		add('556=' + str(d['LegCurrency']))
+		n += 1
+	if 'LegPool' in d:
+		add('740=' + str(d['LegPool']))
+		n += 1
+	if 'LegDatedDate' in d:
+		add('739=' + str(d['LegDatedDate']))
+		n += 1
+	if 'LegContractSettlMonth' in d:
+		add('955=' + str(d['LegContractSettlMonth']))
+		n += 1
+	if 'LegInterestAccrualDate' in d:
+		add('956=' + str(d['LegInterestAccrualDate']))
+		n += 1
+	if 'NoUnderlyings' in d:
+		grp = d['NoUnderlyings']
+		add('711=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoUnderlyings(entry, fixm)
+		n += 1
+	if 'TradingSessionID' in d:
+		add('336=' + str(d['TradingSessionID']))
+		n += 1
+	if 'TradingSessionSubID' in d:
+		add('625=' + str(d['TradingSessionSubID']))
+		n += 1
+	if 'SettlSessID' in d:
+		add('716=' + str(d['SettlSessID']))
+		n += 1
+	if 'SettlSessSubID' in d:
+		add('717=' + str(d['SettlSessSubID']))
+		n += 1
+	if 'ClearingBusinessDate' in d:
+		add('715=' + str(d['ClearingBusinessDate']))
+		n += 1
+	if 'ResponseTransportType' in d:
+		add('725=' + str(d['ResponseTransportType']))
+		n += 1
+	if 'ResponseDestination' in d:
+		add('726=' + str(d['ResponseDestination']))
+		n += 1
+	if 'Text' in d:
+		add('58=' + str(d['Text']))
+		n += 1
+	if 'EncodedTextLen' in d:
+		add('354=' + str(d['EncodedTextLen']))
+		n += 1
+	if 'EncodedText' in d:
+		add('355=' + str(d['EncodedText']))
+		n += 1
+	if len(d) > n:
+		_make_mbody(obj, obj._context, fixm, _msg_CollateralInquiryAck_names)
+	return fixm
+
+def _decode_CollateralInquiryAck(obj, fields, index, context):
+	d = obj.__dict__
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _msg_CollateralInquiryAck_tags.get(num)
+		if spec is None:
+			# not a field of this message, continue with generic decoder
+			body, index = _extract_body(fields, index, context, obj)
+			return index
+		name, pytype, decode_grp = spec
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	return index
+
+class CollateralInquiryAck(FixObject):
+	_encode = staticmethod(_encode_CollateralInquiryAck)
+	_decode = staticmethod(_decode_CollateralInquiryAck)
+
+_msg_CollateralReport_names = frozenset(['CollRptID', 'CollInquiryID', 'CollStatus', 'TotNumReports', 'LastRptRequested', 'NoPartyIDs', 'Account', 'AccountType', 'ClOrdID', 'OrderID', 'SecondaryOrderID', 'SecondaryClOrdID', 'NoExecs', 'NoTrades', 'Symbol', 'SymbolSfx', 'SecurityID', 'SecurityIDSource', 'NoSecurityAltID', 'Product', 'CFICode', 'SecurityType', 'SecuritySubType', 'MaturityMonthYear', 'MaturityDate', 'CouponPaymentDate', 'IssueDate', 'RepoCollateralSecurityType', 'RepurchaseTerm', 'RepurchaseRate', 'Factor', 'CreditRating', 'InstrRegistry', 'CountryOfIssue', 'StateOrProvinceOfIssue', 'LocaleOfIssue', 'RedemptionDate', 'StrikePrice', 'StrikeCurrency', 'OptAttribute', 'ContractMultiplier', 'CouponRate', 'SecurityExchange', 'Issuer', 'EncodedIssuerLen', 'EncodedIssuer', 'SecurityDesc', 'EncodedSecurityDescLen', 'EncodedSecurityDesc', 'Pool', 'ContractSettlMonth', 'CPProgram', 'CPRegType', 'NoEvents', 'DatedDate', 'InterestAccrualDate', 'AgreementDesc', 'AgreementID', 'AgreementDate', 'AgreementCurrency', 'TerminationType', 'StartDate', 'EndDate', 'DeliveryType', 'MarginRatio', 'SettlDate', 'Quantity', 'QtyType', 'Currency', 'NoLegs', 'LegSymbol', 'LegSymbolSfx', 'LegSecurityID', 'LegSecurityIDSource', 'NoLegSecurityAltID', 'LegProduct', 'LegCFICode', 'LegSecurityType', 'LegSecuritySubType', 'LegMaturityMonthYear', 'LegMaturityDate', 'LegCouponPaymentDate', 'LegIssueDate', 'LegRepoCollateralSecurityType', 'LegRepurchaseTerm', 'LegRepurchaseRate', 'LegFactor', 'LegCreditRating', 'LegInstrRegistry', 'LegCountryOfIssue', 'LegStateOrProvinceOfIssue', 'LegLocaleOfIssue', 'LegRedemptionDate', 'LegStrikePrice', 'LegStrikeCurrency', 'LegOptAttribute', 'LegContractMultiplier', 'LegCouponRate', 'LegSecurityExchange', 'LegIssuer', 'EncodedLegIssuerLen', 'EncodedLegIssuer', 'LegSecurityDesc', 'EncodedLegSecurityDescLen', 'EncodedLegSecurityDesc', 'LegRatioQty', 'LegSide', 'LegCurrency', 'LegPool', 'LegDatedDate', 'LegContractSettlMonth', 'LegInterestAccrualDate', 'NoUnderlyings', 'MarginExcess', 'TotalNetValue', 'CashOutstanding', 'NoTrdRegTimestamps', 'Side', 'NoMiscFees', 'Price', 'PriceType', 'AccruedInterestAmt', 'EndAccruedInterestAmt', 'StartCash', 'EndCash', 'Spread', 'BenchmarkCurveCurrency', 'BenchmarkCurveName', 'BenchmarkCurvePoint', 'BenchmarkPrice', 'BenchmarkPriceType', 'BenchmarkSecurityID', 'BenchmarkSecurityIDSource', 'NoStipulations', 'SettlDeliveryType', 'StandInstDbType', 'StandInstDbName', 'StandInstDbID', 'NoDlvyInst', 'TradingSessionID', 'TradingSessionSubID', 'SettlSessID', 'SettlSessSubID', 'ClearingBusinessDate', 'Text', 'EncodedTextLen', 'EncodedText'])
+
+_msg_CollateralReport_tags = {
+	908: ('CollRptID', str, None),
+	909: ('CollInquiryID', str, None),
+	910: ('CollStatus', int, None),
+	911: ('TotNumReports', int, None),
+	912: ('LastRptRequested', str, None),
+	453: ('NoPartyIDs', int, _decode_grp_NoPartyIDs),
+	1: ('Account', str, None),
+	581: ('AccountType', int, None),
+	11: ('ClOrdID', str, None),
+	37: ('OrderID', str, None),
+	198: ('SecondaryOrderID', str, None),
+	526: ('SecondaryClOrdID', str, None),
+	124: ('NoExecs', int, _decode_grp_NoExecs),
+	897: ('NoTrades', int, _decode_grp_NoTrades),
+	55: ('Symbol', str, None),
+	65: ('SymbolSfx', str, None),
+	48: ('SecurityID', str, None),
+	22: ('SecurityIDSource', str, None),
+	454: ('NoSecurityAltID', int, _decode_grp_NoSecurityAltID),
+	460: ('Product', int, None),
+	461: ('CFICode', str, None),
+	167: ('SecurityType', str, None),
+	762: ('SecuritySubType', str, None),
+	200: ('MaturityMonthYear', str, None),
+	541: ('MaturityDate', str, None),
+	224: ('CouponPaymentDate', str, None),
+	225: ('IssueDate', str, None),
+	239: ('RepoCollateralSecurityType', int, None),
+	226: ('RepurchaseTerm', int, None),
+	227: ('RepurchaseRate', float, None),
+	228: ('Factor', float, None),
+	255: ('CreditRating', str, None),
+	543: ('InstrRegistry', str, None),
+	470: ('CountryOfIssue', str, None),
+	471: ('StateOrProvinceOfIssue', str, None),
+	472: ('LocaleOfIssue', str, None),
+	240: ('RedemptionDate', str, None),
+	202: ('StrikePrice', float, None),
+	947: ('StrikeCurrency', str, None),
+	206: ('OptAttribute', str, None),
+	231: ('ContractMultiplier', float, None),
+	223: ('CouponRate', float, None),
+	207: ('SecurityExchange', str, None),
+	106: ('Issuer', str, None),
+	348: ('EncodedIssuerLen', str, None),
+	349: ('EncodedIssuer', str, None),
+	107: ('SecurityDesc', str, None),
+	350: ('EncodedSecurityDescLen', str, None),
+	351: ('EncodedSecurityDesc', str, None),
+	691: ('Pool', str, None),
+	667: ('ContractSettlMonth', str, None),
+	875: ('CPProgram', int, None),
+	876: ('CPRegType', str, None),
+	864: ('NoEvents', int, _decode_grp_NoEvents),
+	873: ('DatedDate', str, None),
+	874: ('InterestAccrualDate', str, None),
+	913: ('AgreementDesc', str, None),
+	914: ('AgreementID', str, None),
+	915: ('AgreementDate', str, None),
+	918: ('AgreementCurrency', str, None),
+	788: ('TerminationType', int, None),
+	916: ('StartDate', str, None),
+	917: ('EndDate', str, None),
+	919: ('DeliveryType', int, None),
+	898: ('MarginRatio', float, None),
+	64: ('SettlDate', str, None),
+	53: ('Quantity', float, None),
+	854: ('QtyType', int, None),
+	15: ('Currency', str, None),
+	555: ('NoLegs', int, _decode_grp_NoLegs),
+	600: ('LegSymbol', str, None),
+	601: ('LegSymbolSfx', str, None),
+	602: ('LegSecurityID', str, None),
+	603: ('LegSecurityIDSource', str, None),
+	604: ('NoLegSecurityAltID', str, None),
+	607: ('LegProduct', int, None),
+	608: ('LegCFICode', str, None),
+	609: ('LegSecurityType', str, None),
+	764: ('LegSecuritySubType', str, None),
+	610: ('LegMaturityMonthYear', str, None),
+	611: ('LegMaturityDate', str, None),
+	248: ('LegCouponPaymentDate', str, None),
+	249: ('LegIssueDate', str, None),
+	250: ('LegRepoCollateralSecurityType', int, None),
+	251: ('LegRepurchaseTerm', int, None),
+	252: ('LegRepurchaseRate', float, None),
+	253: ('LegFactor', float, None),
+	257: ('LegCreditRating', str, None),
+	599: ('LegInstrRegistry', str, None),
+	596: ('LegCountryOfIssue', str, None),
+	597: ('LegStateOrProvinceOfIssue', str, None),
+	598: ('LegLocaleOfIssue', str, None),
+	254: ('LegRedemptionDate', str, None),
+	612: ('LegStrikePrice', float, None),
+	942: ('LegStrikeCurrency', str, None),
+	613: ('LegOptAttribute', str, None),
+	614: ('LegContractMultiplier', float, None),
+	615: ('LegCouponRate', float, None),
+	616: ('LegSecurityExchange', str, None),
+	617: ('LegIssuer', str, None),
+	618: ('EncodedLegIssuerLen', str, None),
+	619: ('EncodedLegIssuer', str, None),
+	620: ('LegSecurityDesc', str, None),
+	621: ('EncodedLegSecurityDescLen', str, None),
+	622: ('EncodedLegSecurityDesc', str, None),
+	623: ('LegRatioQty', float, None),
+	624: ('LegSide', str, None),
+	556: ('LegCurrency', str, None),
+	740: ('LegPool', str, None),
+	739: ('LegDatedDate', str, None),
+	955: ('LegContractSettlMonth', str, None),
+	956: ('LegInterestAccrualDate', str, None),
+	711: ('NoUnderlyings', int, _decode_grp_NoUnderlyings),
+	899: ('MarginExcess', float, None),
+	900: ('TotalNetValue', float, None),
+	901: ('CashOutstanding', float, None),
+	768: ('NoTrdRegTimestamps', int, _decode_grp_NoTrdRegTimestamps),
+	54: ('Side', str, None),
+	136: ('NoMiscFees', int, _decode_grp_NoMiscFees),
+	44: ('Price', float, None),
+	423: ('PriceType', int, None),
+	159: ('AccruedInterestAmt', float, None),
+	920: ('EndAccruedInterestAmt', float, None),
+	921: ('StartCash', float, None),
+	922: ('EndCash', float, None),
+	218: ('Spread', float, None),
+	220: ('BenchmarkCurveCurrency', str, None),
+	221: ('BenchmarkCurveName', str, None),
+	222: ('BenchmarkCurvePoint', str, None),
+	662: ('BenchmarkPrice', float, None),
+	663: ('BenchmarkPriceType', int, None),
+	699: ('BenchmarkSecurityID', str, None),
+	761: ('BenchmarkSecurityIDSource', str, None),
+	232: ('NoStipulations', int, _decode_grp_NoStipulations),
+	172: ('SettlDeliveryType', int, None),
+	169: ('StandInstDbType', int, None),
+	170: ('StandInstDbName', str, None),
+	171: ('StandInstDbID', str, None),
+	85: ('NoDlvyInst', int, _decode_grp_NoDlvyInst),
+	336: ('TradingSessionID', str, None),
+	625: ('TradingSessionSubID', str, None),
+	716: ('SettlSessID', str, None),
+	717: ('SettlSessSubID', str, None),
+	715: ('ClearingBusinessDate', str, None),
+	58: ('Text', str, None),
+	354: ('EncodedTextLen', str, None),
+	355: ('EncodedText', str, None),
+}
+
+def _encode_CollateralReport(obj, fixm):
+	d = obj.__dict__
+	add = fixm.append
+	n = 1
+	if 'CollRptID' in d:
+		add('908=' + str(d['CollRptID']))
+		n += 1
+	if 'CollInquiryID' in d:
+		add('909=' + str(d['CollInquiryID']))
+		n += 1
+	if 'CollStatus' in d:
+		add('910=' + str(d['CollStatus']))
+		n += 1
+	if 'TotNumReports' in d:
+		add('911=' + str(d['TotNumReports']))
+		n += 1
+	if 'LastRptRequested' in d:
+		add('912=' + str(d['LastRptRequested']))
+		n += 1
+	if 'NoPartyIDs' in d:
+		grp = d['NoPartyIDs']
+		add('453=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoPartyIDs(entry, fixm)
+		n += 1
+	if 'Account' in d:
+		add('1=' + str(d['Account']))
+		n += 1
+	if 'AccountType' in d:
+		add('581=' + str(d['AccountType']))
+		n += 1
+	if 'ClOrdID' in d:
+		add('11=' + str(d['ClOrdID']))
+		n += 1
+	if 'OrderID' in d:
+		add('37=' + str(d['OrderID']))
+		n += 1
+	if 'SecondaryOrderID' in d:
+		add('198=' + str(d['SecondaryOrderID']))
+		n += 1
+	if 'SecondaryClOrdID' in d:
+		add('526=' + str(d['SecondaryClOrdID']))
+		n += 1
+	if 'NoExecs' in d:
+		grp = d['NoExecs']
+		add('124=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoExecs(entry, fixm)
+		n += 1
+	if 'NoTrades' in d:
+		grp = d['NoTrades']
+		add('897=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoTrades(entry, fixm)
+		n += 1
+	if 'Symbol' in d:
+		add('55=' + str(d['Symbol']))
+		n += 1
+	if 'SymbolSfx' in d:
+		add('65=' + str(d['SymbolSfx']))
+		n += 1
+	if 'SecurityID' in d:
+		add('48=' + str(d['SecurityID']))
+		n += 1
+	if 'SecurityIDSource' in d:
+		add('22=' + str(d['SecurityIDSource']))
+		n += 1
+	if 'NoSecurityAltID' in d:
+		grp = d['NoSecurityAltID']
+		add('454=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoSecurityAltID(entry, fixm)
+		n += 1
+	if 'Product' in d:
+		add('460=' + str(d['Product']))
+		n += 1
+	if 'CFICode' in d:
+		add('461=' + str(d['CFICode']))
+		n += 1
+	if 'SecurityType' in d:
+		add('167=' + str(d['SecurityType']))
+		n += 1
+	if 'SecuritySubType' in d:
+		add('762=' + str(d['SecuritySubType']))
+		n += 1
+	if 'MaturityMonthYear' in d:
+		add('200=' + str(d['MaturityMonthYear']))
+		n += 1
+	if 'MaturityDate' in d:
+		add('541=' + str(d['MaturityDate']))
+		n += 1
+	if 'CouponPaymentDate' in d:
+		add('224=' + str(d['CouponPaymentDate']))
+		n += 1
+	if 'IssueDate' in d:
+		add('225=' + str(d['IssueDate']))
+		n += 1
+	if 'RepoCollateralSecurityType' in d:
+		add('239=' + str(d['RepoCollateralSecurityType']))
+		n += 1
+	if 'RepurchaseTerm' in d:
+		add('226=' + str(d['RepurchaseTerm']))
+		n += 1
+	if 'RepurchaseRate' in d:
+		add('227=' + str(d['RepurchaseRate']))
+		n += 1
+	if 'Factor' in d:
+		add('228=' + str(d['Factor']))
+		n += 1
+	if 'CreditRating' in d:
+		add('255=' + str(d['CreditRating']))
+		n += 1
+	if 'InstrRegistry' in d:
+		add('543=' + str(d['InstrRegistry']))
+		n += 1
+	if 'CountryOfIssue' in d:
+		add('470=' + str(d['CountryOfIssue']))
+		n += 1
+	if 'StateOrProvinceOfIssue' in d:
+		add('471=' + str(d['StateOrProvinceOfIssue']))
+		n += 1
+	if 'LocaleOfIssue' in d:
+		add('472=' + str(d['LocaleOfIssue']))
+		n += 1
+	if 'RedemptionDate' in d:
+		add('240=' + str(d['RedemptionDate']))
+		n += 1
+	if 'StrikePrice' in d:
+		add('202=' + str(d['StrikePrice']))
+		n += 1
+	if 'StrikeCurrency' in d:
+		add('947=' + str(d['StrikeCurrency']))
+		n += 1
+	if 'OptAttribute' in d:
+		add('206=' + str(d['OptAttribute']))
+		n += 1
+	if 'ContractMultiplier' in d:
+		add('231=' + str(d['ContractMultiplier']))
+		n += 1
+	if 'CouponRate' in d:
+		add('223=' + str(d['CouponRate']))
+		n += 1
+	if 'SecurityExchange' in d:
+		add('207=' + str(d['SecurityExchange']))
+		n += 1
+	if 'Issuer' in d:
+		add('106=' + str(d['Issuer']))
+		n += 1
+	if 'EncodedIssuerLen' in d:
+		add('348=' + str(d['EncodedIssuerLen']))
+		n += 1
+	if 'EncodedIssuer' in d:
+		add('349=' + str(d['EncodedIssuer']))
+		n += 1
+	if 'SecurityDesc' in d:
+		add('107=' + str(d['SecurityDesc']))
+		n += 1
+	if 'EncodedSecurityDescLen' in d:
+		add('350=' + str(d['EncodedSecurityDescLen']))
+		n += 1
+	if 'EncodedSecurityDesc' in d:
+		add('351=' + str(d['EncodedSecurityDesc']))
+		n += 1
+	if 'Pool' in d:
+		add('691=' + str(d['Pool']))
+		n += 1
+	if 'ContractSettlMonth' in d:
+		add('667=' + str(d['ContractSettlMonth']))
+		n += 1
+	if 'CPProgram' in d:
+		add('875=' + str(d['CPProgram']))
+		n += 1
+	if 'CPRegType' in d:
+		add('876=' + str(d['CPRegType']))
+		n += 1
+	if 'NoEvents' in d:
+		grp = d['NoEvents']
+		add('864=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoEvents(entry, fixm)
+		n += 1
+	if 'DatedDate' in d:
+		add('873=' + str(d['DatedDate']))
+		n += 1
+	if 'InterestAccrualDate' in d:
+		add('874=' + str(d['InterestAccrualDate']))
+		n += 1
+	if 'AgreementDesc' in d:
+		add('913=' + str(d['AgreementDesc']))
+		n += 1
+	if 'AgreementID' in d:
+		add('914=' + str(d['AgreementID']))
+		n += 1
+	if 'AgreementDate' in d:
+		add('915=' + str(d['AgreementDate']))
+		n += 1
+	if 'AgreementCurrency' in d:
+		add('918=' + str(d['AgreementCurrency']))
+		n += 1
+	if 'TerminationType' in d:
+		add('788=' + str(d['TerminationType']))
+		n += 1
+	if 'StartDate' in d:
+		add('916=' + str(d['StartDate']))
+		n += 1
+	if 'EndDate' in d:
+		add('917=' + str(d['EndDate']))
+		n += 1
+	if 'DeliveryType' in d:
+		add('919=' + str(d['DeliveryType']))
+		n += 1
+	if 'MarginRatio' in d:
+		add('898=' + str(d['MarginRatio']))
+		n += 1
+	if 'SettlDate' in d:
+		add('64=' + str(d['SettlDate']))
+		n += 1
+	if 'Quantity' in d:
+		add('53=' + str(d['Quantity']))
+		n += 1
+	if 'QtyType' in d:
+		add('854=' + str(d['QtyType']))
+		n += 1
+	if 'Currency' in d:
+		add('15=' + str(d['Currency']))
+		n += 1
+	if 'NoLegs' in d:
+		grp = d['NoLegs']
+		add('555=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoLegs(entry, fixm)
+		n += 1
+	if 'LegSymbol' in d:
+		add('600=' + str(d['LegSymbol']))
+		n += 1
+	if 'LegSymbolSfx' in d:
+		add('601=' + str(d['LegSymbolSfx']))
+		n += 1
+	if 'LegSecurityID' in d:
+		add('602=' + str(d['LegSecurityID']))
+		n += 1
+	if 'LegSecurityIDSource' in d:
+		add('603=' + str(d['LegSecurityIDSource']))
+		n += 1
+	if 'NoLegSecurityAltID' in d:
+		add('604=' + str(d['NoLegSecurityAltID']))
+		n += 1
+	if 'LegProduct' in d:
+		add('607=' + str(d['LegProduct']))
+		n += 1
+	if 'LegCFICode' in d:
+		add('608=' + str(d['LegCFICode']))
+		n += 1
+	if 'LegSecurityType' in d:
+		add('609=' + str(d['LegSecurityType']))
+		n += 1
+	if 'LegSecuritySubType' in d:
+		add('764=' + str(d['LegSecuritySubType']))
+		n += 1
+	if 'LegMaturityMonthYear' in d:
+		add('610=' + str(d['LegMaturityMonthYear']))
+		n += 1
+	if 'LegMaturityDate' in d:
+		add('611=' + str(d['LegMaturityDate']))
+		n += 1
+	if 'LegCouponPaymentDate' in d:
+		add('248=' + str(d['LegCouponPaymentDate']))
+		n += 1
+	if 'LegIssueDate' in d:
+		add('249=' + str(d['LegIssueDate']))
+		n += 1
+	if 'LegRepoCollateralSecurityType' in d:
+		add('250=' + str(d['LegRepoCollateralSecurityType']))
+		n += 1
+	if 'LegRepurchaseTerm' in d:
+		add('251=' + str(d['LegRepurchaseTerm']))
+		n += 1
+	if 'LegRepurchaseRate' in d:
+		add('252=' + str(d['LegRepurchaseRate']))
+		n += 1
+	if 'LegFactor' in d:
+		add('253=' + str(d['LegFactor']))
+		n += 1
+	if 'LegCreditRating' in d:
+		add('257=' + str(d['LegCreditRating']))
+		n += 1
+	if 'LegInstrRegistry' in d:
+		add('599=' + str(d['LegInstrRegistry']))
+		n += 1
+	if 'LegCountryOfIssue' in d:
+		add('596=' + str(d['LegCountryOfIssue']))
+		n += 1
+	if 'LegStateOrProvinceOfIssue' in d:
+		add('597=' + str(d['LegStateOrProvinceOfIssue']))
+		n += 1
+	if 'LegLocaleOfIssue' in d:
+		add('598=' + str(d['LegLocaleOfIssue']))
+		n += 1
+	if 'LegRedemptionDate' in d:
+		add('254=' + str(d['LegRedemptionDate']))
+		n += 1
+	if 'LegStrikePrice' in d:
+		add('612=' + str(d['LegStrikePrice']))
+		n += 1
+	if 'LegStrikeCurrency' in d:
+		add('942=' + str(d['LegStrikeCurrency']))
+		n += 1
+	if 'LegOptAttribute' in d:
+		add('613=' + str(d['LegOptAttribute']))
+		n += 1
+	if 'LegContractMultiplier' in d:
+		add('614=' + str(d['LegContractMultiplier']))
+		n += 1
+	if 'LegCouponRate' in d:
+		add('615=' + str(d['LegCouponRate']))
+		n += 1
+	if 'LegSecurityExchange' in d:
+		add('616=' + str(d['LegSecurityExchange']))
+		n += 1
+	if 'LegIssuer' in d:
+		add('617=' + str(d['LegIssuer']))
+		n += 1
+	if 'EncodedLegIssuerLen' in d:
+		add('618=' + str(d['EncodedLegIssuerLen']))
+		n += 1
+	if 'EncodedLegIssuer' in d:
+		add('619=' + str(d['EncodedLegIssuer']))
+		n += 1
+	if 'LegSecurityDesc' in d:
+		add('620=' + str(d['LegSecurityDesc']))
+		n += 1
+	if 'EncodedLegSecurityDescLen' in d:
+		add('621=' + str(d['EncodedLegSecurityDescLen']))
+		n += 1
+	if 'EncodedLegSecurityDesc' in d:
+		add('622=' + str(d['EncodedLegSecurityDesc']))
+		n += 1
+	if 'LegRatioQty' in d:
+		add('623=' + str(d['LegRatioQty']))
+		n += 1
+	if 'LegSide' in d:
+		add('624=' + str(d['LegSide']))
+		n += 1
+	if 'LegCurrency' in d:
+		add('556=' + str(d['LegCurrency']))
+		n += 1
+	if 'LegPool' in d:
+		add('740=' + str(d['LegPool']))
+		n += 1
+	if 'LegDatedDate' in d:
+		add('739=' + str(d['LegDatedDate']))
+		n += 1
+	if 'LegContractSettlMonth' in d:
+		add('955=' + str(d['LegContractSettlMonth']))
+		n += 1
+	if 'LegInterestAccrualDate' in d:
+		add('956=' + str(d['LegInterestAccrualDate']))
+		n += 1
+	if 'NoUnderlyings' in d:
+		grp = d['NoUnderlyings']
+		add('711=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoUnderlyings(entry, fixm)
+		n += 1
+	if 'MarginExcess' in d:
+		add('899=' + str(d['MarginExcess']))
+		n += 1
+	if 'TotalNetValue' in d:
+		add('900=' + str(d['TotalNetValue']))
+		n += 1
+	if 'CashOutstanding' in d:
+		add('901=' + str(d['CashOutstanding']))
+		n += 1
+	if 'NoTrdRegTimestamps' in d:
+		grp = d['NoTrdRegTimestamps']
+		add('768=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoTrdRegTimestamps(entry, fixm)
+		n += 1
+	if 'Side' in d:
+		add('54=' + str(d['Side']))
+		n += 1
+	if 'NoMiscFees' in d:
+		grp = d['NoMiscFees']
+		add('136=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoMiscFees(entry, fixm)
+		n += 1
+	if 'Price' in d:
+		add('44=' + str(d['Price']))
+		n += 1
+	if 'PriceType' in d:
+		add('423=' + str(d['PriceType']))
+		n += 1
+	if 'AccruedInterestAmt' in d:
+		add('159=' + str(d['AccruedInterestAmt']))
+		n += 1
+	if 'EndAccruedInterestAmt' in d:
+		add('920=' + str(d['EndAccruedInterestAmt']))
+		n += 1
+	if 'StartCash' in d:
+		add('921=' + str(d['StartCash']))
+		n += 1
+	if 'EndCash' in d:
+		add('922=' + str(d['EndCash']))
+		n += 1
+	if 'Spread' in d:
+		add('218=' + str(d['Spread']))
+		n += 1
+	if 'BenchmarkCurveCurrency' in d:
+		add('220=' + str(d['BenchmarkCurveCurrency']))
+		n += 1
+	if 'BenchmarkCurveName' in d:
+		add('221=' + str(d['BenchmarkCurveName']))
+		n += 1
+	if 'BenchmarkCurvePoint' in d:
+		add('222=' + str(d['BenchmarkCurvePoint']))
+		n += 1
+	if 'BenchmarkPrice' in d:
+		add('662=' + str(d['BenchmarkPrice']))
+		n += 1
+	if 'BenchmarkPriceType' in d:
+		add('663=' + str(d['BenchmarkPriceType']))
+		n += 1
+	if 'BenchmarkSecurityID' in d:
+		add('699=' + str(d['BenchmarkSecurityID']))
+		n += 1
+	if 'BenchmarkSecurityIDSource' in d:
+		add('761=' + str(d['BenchmarkSecurityIDSource']))
+		n += 1
+	if 'NoStipulations' in d:
+		grp = d['NoStipulations']
+		add('232=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoStipulations(entry, fixm)
+		n += 1
+	if 'SettlDeliveryType' in d:
+		add('172=' + str(d['SettlDeliveryType']))
+		n += 1
+	if 'StandInstDbType' in d:
+		add('169=' + str(d['StandInstDbType']))
+		n += 1
+	if 'StandInstDbName' in d:
+		add('170=' + str(d['StandInstDbName']))
+		n += 1
+	if 'StandInstDbID' in d:
+		add('171=' + str(d['StandInstDbID']))
+		n += 1
+	if 'NoDlvyInst' in d:
+		grp = d['NoDlvyInst']
+		add('85=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoDlvyInst(entry, fixm)
+		n += 1
+	if 'TradingSessionID' in d:
+		add('336=' + str(d['TradingSessionID']))
+		n += 1
+	if 'TradingSessionSubID' in d:
+		add('625=' + str(d['TradingSessionSubID']))
+		n += 1
+	if 'SettlSessID' in d:
+		add('716=' + str(d['SettlSessID']))
+		n += 1
+	if 'SettlSessSubID' in d:
+		add('717=' + str(d['SettlSessSubID']))
+		n += 1
+	if 'ClearingBusinessDate' in d:
+		add('715=' + str(d['ClearingBusinessDate']))
+		n += 1
+	if 'Text' in d:
+		add('58=' + str(d['Text']))
+		n += 1
+	if 'EncodedTextLen' in d:
+		add('354=' + str(d['EncodedTextLen']))
+		n += 1
+	if 'EncodedText' in d:
+		add('355=' + str(d['EncodedText']))
+		n += 1
+	if len(d) > n:
+		_make_mbody(obj, obj._context, fixm, _msg_CollateralReport_names)
+	return fixm
+
+def _decode_CollateralReport(obj, fields, index, context):
+	d = obj.__dict__
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _msg_CollateralReport_tags.get(num)
+		if spec is None:
+			# not a field of this message, continue with generic decoder
+			body, index = _extract_body(fields, index, context, obj)
+			return index
+		name, pytype, decode_grp = spec
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	return index
+
+class CollateralReport(FixObject):
+	_encode = staticmethod(_encode_CollateralReport)
+	_decode = staticmethod(_decode_CollateralReport)
+
+_msg_CollateralRequest_names = frozenset(['CollReqID', 'CollAsgnReason', 'TransactTime', 'ExpireTime', 'NoPartyIDs', 'Account', 'AccountType', 'ClOrdID', 'OrderID', 'SecondaryOrderID', 'SecondaryClOrdID', 'NoExecs', 'NoTrades', 'Symbol', 'SymbolSfx', 'SecurityID', 'SecurityIDSource', 'NoSecurityAltID', 'Product', 'CFICode', 'SecurityType', 'SecuritySubType', 'MaturityMonthYear', 'MaturityDate', 'CouponPaymentDate', 'IssueDate', 'RepoCollateralSecurityType', 'RepurchaseTerm', 'RepurchaseRate', 'Factor', 'CreditRating', 'InstrRegistry', 'CountryOfIssue', 'StateOrProvinceOfIssue', 'LocaleOfIssue', 'RedemptionDate', 'StrikePrice', 'StrikeCurrency', 'OptAttribute', 'ContractMultiplier', 'CouponRate', 'SecurityExchange', 'Issuer', 'EncodedIssuerLen', 'EncodedIssuer', 'SecurityDesc', 'EncodedSecurityDescLen', 'EncodedSecurityDesc', 'Pool', 'ContractSettlMonth', 'CPProgram', 'CPRegType', 'NoEvents', 'DatedDate', 'InterestAccrualDate', 'AgreementDesc', 'AgreementID', 'AgreementDate', 'AgreementCurrency', 'TerminationType', 'StartDate', 'EndDate', 'DeliveryType', 'MarginRatio', 'SettlDate', 'Quantity', 'QtyType', 'Currency', 'NoLegs', 'LegSymbol', 'LegSymbolSfx', 'LegSecurityID', 'LegSecurityIDSource', 'NoLegSecurityAltID', 'LegProduct', 'LegCFICode', 'LegSecurityType', 'LegSecuritySubType', 'LegMaturityMonthYear', 'LegMaturityDate', 'LegCouponPaymentDate', 'LegIssueDate', 'LegRepoCollateralSecurityType', 'LegRepurchaseTerm', 'LegRepurchaseRate', 'LegFactor', 'LegCreditRating', 'LegInstrRegistry', 'LegCountryOfIssue', 'LegStateOrProvinceOfIssue', 'LegLocaleOfIssue', 'LegRedemptionDate', 'LegStrikePrice', 'LegStrikeCurrency', 'LegOptAttribute', 'LegContractMultiplier', 'LegCouponRate', 'LegSecurityExchange', 'LegIssuer', 'EncodedLegIssuerLen', 'EncodedLegIssuer', 'LegSecurityDesc', 'EncodedLegSecurityDescLen', 'EncodedLegSecurityDesc', 'LegRatioQty', 'LegSide', 'LegCurrency', 'LegPool', 'LegDatedDate', 'LegContractSettlMonth', 'LegInterestAccrualDate', 'NoUnderlyings', 'MarginExcess', 'TotalNetValue', 'CashOutstanding', 'NoTrdRegTimestamps', 'Side', 'NoMiscFees', 'Price', 'PriceType', 'AccruedInterestAmt', 'EndAccruedInterestAmt', 'StartCash', 'EndCash', 'Spread', 'BenchmarkCurveCurrency', 'BenchmarkCurveName', 'BenchmarkCurvePoint', 'BenchmarkPrice', 'BenchmarkPriceType', 'BenchmarkSecurityID', 'BenchmarkSecurityIDSource', 'NoStipulations', 'TradingSessionID', 'TradingSessionSubID', 'SettlSessID', 'SettlSessSubID', 'ClearingBusinessDate', 'Text', 'EncodedTextLen', 'EncodedText'])
+
+_msg_CollateralRequest_tags = {
+	894: ('CollReqID', str, None),
+	895: ('CollAsgnReason', int, None),
+	60: ('TransactTime', str, None),
+	126: ('ExpireTime', str, None),
+	453: ('NoPartyIDs', int, _decode_grp_NoPartyIDs),
+	1: ('Account', str, None),
+	581: ('AccountType', int, None),
+	11: ('ClOrdID', str, None),
+	37: ('OrderID', str, None),
+	198: ('SecondaryOrderID', str, None),
+	526: ('SecondaryClOrdID', str, None),
+	124: ('NoExecs', int, _decode_grp_NoExecs),
+	897: ('NoTrades', int, _decode_grp_NoTrades),
+	55: ('Symbol', str, None),
+	65: ('SymbolSfx', str, None),
+	48: ('SecurityID', str, None),
+	22: ('SecurityIDSource', str, None),
+	454: ('NoSecurityAltID', int, _decode_grp_NoSecurityAltID),
+	460: ('Product', int, None),
+	461: ('CFICode', str, None),
+	167: ('SecurityType', str, None),
+	762: ('SecuritySubType', str, None),
+	200: ('MaturityMonthYear', str, None),
+	541: ('MaturityDate', str, None),
+	224: ('CouponPaymentDate', str, None),
+	225: ('IssueDate', str, None),
+	239: ('RepoCollateralSecurityType', int, None),
+	226: ('RepurchaseTerm', int, None),
+	227: ('RepurchaseRate', float, None),
+	228: ('Factor', float, None),
+	255: ('CreditRating', str, None),
+	543: ('InstrRegistry', str, None),
+	470: ('CountryOfIssue', str, None),
+	471: ('StateOrProvinceOfIssue', str, None),
+	472: ('LocaleOfIssue', str, None),
+	240: ('RedemptionDate', str, None),
+	202: ('StrikePrice', float, None),
+	947: ('StrikeCurrency', str, None),
+	206: ('OptAttribute', str, None),
+	231: ('ContractMultiplier', float, None),
+	223: ('CouponRate', float, None),
+	207: ('SecurityExchange', str, None),
+	106: ('Issuer', str, None),
+	348: ('EncodedIssuerLen', str, None),
+	349: ('EncodedIssuer', str, None),
+	107: ('SecurityDesc', str, None),
+	350: ('EncodedSecurityDescLen', str, None),
+	351: ('EncodedSecurityDesc', str, None),
+	691: ('Pool', str, None),
+	667: ('ContractSettlMonth', str, None),
+	875: ('CPProgram', int, None),
+	876: ('CPRegType', str, None),
+	864: ('NoEvents', int, _decode_grp_NoEvents),
+	873: ('DatedDate', str, None),
+	874: ('InterestAccrualDate', str, None),
+	913: ('AgreementDesc', str, None),
+	914: ('AgreementID', str, None),
+	915: ('AgreementDate', str, None),
+	918: ('AgreementCurrency', str, None),
+	788: ('TerminationType', int, None),
+	916: ('StartDate', str, None),
+	917: ('EndDate', str, None),
+	919: ('DeliveryType', int, None),
+	898: ('MarginRatio', float, None),
+	64: ('SettlDate', str, None),
+	53: ('Quantity', float, None),
+	854: ('QtyType', int, None),
+	15: ('Currency', str, None),
+	555: ('NoLegs', int, _decode_grp_NoLegs),
+	600: ('LegSymbol', str, None),
+	601: ('LegSymbolSfx', str, None),
+	602: ('LegSecurityID', str, None),
+	603: ('LegSecurityIDSource', str, None),
+	604: ('NoLegSecurityAltID', str, None),
+	607: ('LegProduct', int, None),
+	608: ('LegCFICode', str, None),
+	609: ('LegSecurityType', str, None),
+	764: ('LegSecuritySubType', str, None),
+	610: ('LegMaturityMonthYear', str, None),
+	611: ('LegMaturityDate', str, None),
+	248: ('LegCouponPaymentDate', str, None),
+	249: ('LegIssueDate', str, None),
+	250: ('LegRepoCollateralSecurityType', int, None),
+	251: ('LegRepurchaseTerm', int, None),
+	252: ('LegRepurchaseRate', float, None),
+	253: ('LegFactor', float, None),
+	257: ('LegCreditRating', str, None),
+	599: ('LegInstrRegistry', str, None),
+	596: ('LegCountryOfIssue', str, None),
+	597: ('LegStateOrProvinceOfIssue', str, None),
+	598: ('LegLocaleOfIssue', str, None),
+	254: ('LegRedemptionDate', str, None),
+	612: ('LegStrikePrice', float, None),
+	942: ('LegStrikeCurrency', str, None),
+	613: ('LegOptAttribute', str, None),
+	614: ('LegContractMultiplier', float, None),
+	615: ('LegCouponRate', float, None),
+	616: ('LegSecurityExchange', str, None),
+	617: ('LegIssuer', str, None),
+	618: ('EncodedLegIssuerLen', str, None),
+	619: ('EncodedLegIssuer', str, None),
+	620: ('LegSecurityDesc', str, None),
+	621: ('EncodedLegSecurityDescLen', str, None),
+	622: ('EncodedLegSecurityDesc', str, None),
+	623: ('LegRatioQty', float, None),
+	624: ('LegSide', str, None),
+	556: ('LegCurrency', str, None),
+	740: ('LegPool', str, None),
+	739: ('LegDatedDate', str, None),
+	955: ('LegContractSettlMonth', str, None),
+	956: ('LegInterestAccrualDate', str, None),
+	711: ('NoUnderlyings', int, _decode_grp_NoUnderlyings),
+	899: ('MarginExcess', float, None),
+	900: ('TotalNetValue', float, None),
+	901: ('CashOutstanding', float, None),
+	768: ('NoTrdRegTimestamps', int, _decode_grp_NoTrdRegTimestamps),
+	54: ('Side', str, None),
+	136: ('NoMiscFees', int, _decode_grp_NoMiscFees),
+	44: ('Price', float, None),
+	423: ('PriceType', int, None),
+	159: ('AccruedInterestAmt', float, None),
+	920: ('EndAccruedInterestAmt', float, None),
+	921: ('StartCash', float, None),
+	922: ('EndCash', float, None),
+	218: ('Spread', float, None),
+	220: ('BenchmarkCurveCurrency', str, None),
+	221: ('BenchmarkCurveName', str, None),
+	222: ('BenchmarkCurvePoint', str, None),
+	662: ('BenchmarkPrice', float, None),
+	663: ('BenchmarkPriceType', int, None),
+	699: ('BenchmarkSecurityID', str, None),
+	761: ('BenchmarkSecurityIDSource', str, None),
+	232: ('NoStipulations', int, _decode_grp_NoStipulations),
+	336: ('TradingSessionID', str, None),
+	625: ('TradingSessionSubID', str, None),
+	716: ('SettlSessID', str, None),
+	717: ('SettlSessSubID', str, None),
+	715: ('ClearingBusinessDate', str, None),
+	58: ('Text', str, None),
+	354: ('EncodedTextLen', str, None),
+	355: ('EncodedText', str, None),
+}
+
+def _encode_CollateralRequest(obj, fixm):
+	d = obj.__dict__
+	add = fixm.append
+	n = 1
+	if 'CollReqID' in d:
+		add('894=' + str(d['CollReqID']))
+		n += 1
+	if 'CollAsgnReason' in d:
+		add('895=' + str(d['CollAsgnReason']))
+		n += 1
+	if 'TransactTime' in d:
+		add('60=' + str(d['TransactTime']))
+		n += 1
+	if 'ExpireTime' in d:
+		add('126=' + str(d['ExpireTime']))
+		n += 1
+	if 'NoPartyIDs' in d:
+		grp = d['NoPartyIDs']
+		add('453=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoPartyIDs(entry, fixm)
+		n += 1
+	if 'Account' in d:
+		add('1=' + str(d['Account']))
+		n += 1
+	if 'AccountType' in d:
+		add('581=' + str(d['AccountType']))
+		n += 1
+	if 'ClOrdID' in d:
+		add('11=' + str(d['ClOrdID']))
+		n += 1
+	if 'OrderID' in d:
+		add('37=' + str(d['OrderID']))
+		n += 1
+	if 'SecondaryOrderID' in d:
+		add('198=' + str(d['SecondaryOrderID']))
+		n += 1
+	if 'SecondaryClOrdID' in d:
+		add('526=' + str(d['SecondaryClOrdID']))
+		n += 1
+	if 'NoExecs' in d:
+		grp = d['NoExecs']
+		add('124=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoExecs(entry, fixm)
+		n += 1
+	if 'NoTrades' in d:
+		grp = d['NoTrades']
+		add('897=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoTrades(entry, fixm)
+		n += 1
+	if 'Symbol' in d:
+		add('55=' + str(d['Symbol']))
+		n += 1
+	if 'SymbolSfx' in d:
+		add('65=' + str(d['SymbolSfx']))
+		n += 1
+	if 'SecurityID' in d:
+		add('48=' + str(d['SecurityID']))
+		n += 1
+	if 'SecurityIDSource' in d:
+		add('22=' + str(d['SecurityIDSource']))
+		n += 1
+	if 'NoSecurityAltID' in d:
+		grp = d['NoSecurityAltID']
+		add('454=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoSecurityAltID(entry, fixm)
+		n += 1
+	if 'Product' in d:
+		add('460=' + str(d['Product']))
+		n += 1
+	if 'CFICode' in d:
+		add('461=' + str(d['CFICode']))
+		n += 1
+	if 'SecurityType' in d:
+		add('167=' + str(d['SecurityType']))
+		n += 1
+	if 'SecuritySubType' in d:
+		add('762=' + str(d['SecuritySubType']))
+		n += 1
+	if 'MaturityMonthYear' in d:
+		add('200=' + str(d['MaturityMonthYear']))
+		n += 1
+	if 'MaturityDate' in d:
+		add('541=' + str(d['MaturityDate']))
+		n += 1
+	if 'CouponPaymentDate' in d:
+		add('224=' + str(d['CouponPaymentDate']))
+		n += 1
+	if 'IssueDate' in d:
+		add('225=' + str(d['IssueDate']))
+		n += 1
+	if 'RepoCollateralSecurityType' in d:
+		add('239=' + str(d['RepoCollateralSecurityType']))
+		n += 1
+	if 'RepurchaseTerm' in d:
+		add('226=' + str(d['RepurchaseTerm']))
+		n += 1
+	if 'RepurchaseRate' in d:
+		add('227=' + str(d['RepurchaseRate']))
+		n += 1
+	if 'Factor' in d:
+		add('228=' + str(d['Factor']))
+		n += 1
+	if 'CreditRating' in d:
+		add('255=' + str(d['CreditRating']))
+		n += 1
+	if 'InstrRegistry' in d:
+		add('543=' + str(d['InstrRegistry']))
+		n += 1
+	if 'CountryOfIssue' in d:
+		add('470=' + str(d['CountryOfIssue']))
+		n += 1
+	if 'StateOrProvinceOfIssue' in d:
+		add('471=' + str(d['StateOrProvinceOfIssue']))
+		n += 1
+	if 'LocaleOfIssue' in d:
+		add('472=' + str(d['LocaleOfIssue']))
+		n += 1
+	if 'RedemptionDate' in d:
+		add('240=' + str(d['RedemptionDate']))
+		n += 1
+	if 'StrikePrice' in d:
+		add('202=' + str(d['StrikePrice']))
+		n += 1
+	if 'StrikeCurrency' in d:
+		add('947=' + str(d['StrikeCurrency']))
+		n += 1
+	if 'OptAttribute' in d:
+		add('206=' + str(d['OptAttribute']))
+		n += 1
+	if 'ContractMultiplier' in d:
+		add('231=' + str(d['ContractMultiplier']))
+		n += 1
+	if 'CouponRate' in d:
+		add('223=' + str(d['CouponRate']))
+		n += 1
+	if 'SecurityExchange' in d:
+		add('207=' + str(d['SecurityExchange']))
+		n += 1
+	if 'Issuer' in d:
+		add('106=' + str(d['Issuer']))
+		n += 1
+	if 'EncodedIssuerLen' in d:
+		add('348=' + str(d['EncodedIssuerLen']))
+		n += 1
+	if 'EncodedIssuer' in d:
+		add('349=' + str(d['EncodedIssuer']))
+		n += 1
+	if 'SecurityDesc' in d:
+		add('107=' + str(d['SecurityDesc']))
+		n += 1
+	if 'EncodedSecurityDescLen' in d:
+		add('350=' + str(d['EncodedSecurityDescLen']))
+		n += 1
+	if 'EncodedSecurityDesc' in d:
+		add('351=' + str(d['EncodedSecurityDesc']))
+		n += 1
+	if 'Pool' in d:
+		add('691=' + str(d['Pool']))
+		n += 1
+	if 'ContractSettlMonth' in d:
+		add('667=' + str(d['ContractSettlMonth']))
+		n += 1
+	if 'CPProgram' in d:
+		add('875=' + str(d['CPProgram']))
+		n += 1
+	if 'CPRegType' in d:
+		add('876=' + str(d['CPRegType']))
+		n += 1
+	if 'NoEvents' in d:
+		grp = d['NoEvents']
+		add('864=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoEvents(entry, fixm)
+		n += 1
+	if 'DatedDate' in d:
+		add('873=' + str(d['DatedDate']))
+		n += 1
+	if 'InterestAccrualDate' in d:
+		add('874=' + str(d['InterestAccrualDate']))
+		n += 1
+	if 'AgreementDesc' in d:
+		add('913=' + str(d['AgreementDesc']))
+		n += 1
+	if 'AgreementID' in d:
+		add('914=' + str(d['AgreementID']))
+		n += 1
+	if 'AgreementDate' in d:
+		add('915=' + str(d['AgreementDate']))
+		n += 1
+	if 'AgreementCurrency' in d:
+		add('918=' + str(d['AgreementCurrency']))
+		n += 1
+	if 'TerminationType' in d:
+		add('788=' + str(d['TerminationType']))
+		n += 1
+	if 'StartDate' in d:
+		add('916=' + str(d['StartDate']))
+		n += 1
+	if 'EndDate' in d:
+		add('917=' + str(d['EndDate']))
+		n += 1
+	if 'DeliveryType' in d:
+		add('919=' + str(d['DeliveryType']))
+		n += 1
+	if 'MarginRatio' in d:
+		add('898=' + str(d['MarginRatio']))
+		n += 1
+	if 'SettlDate' in d:
+		add('64=' + str(d['SettlDate']))
+		n += 1
+	if 'Quantity' in d:
+		add('53=' + str(d['Quantity']))
+		n += 1
+	if 'QtyType' in d:
+		add('854=' + str(d['QtyType']))
+		n += 1
+	if 'Currency' in d:
+		add('15=' + str(d['Currency']))
+		n += 1
+	if 'NoLegs' in d:
+		grp = d['NoLegs']
+		add('555=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoLegs(entry, fixm)
+		n += 1
+	if 'LegSymbol' in d:
+		add('600=' + str(d['LegSymbol']))
+		n += 1
+	if 'LegSymbolSfx' in d:
+		add('601=' + str(d['LegSymbolSfx']))
+		n += 1
+	if 'LegSecurityID' in d:
+		add('602=' + str(d['LegSecurityID']))
+		n += 1
+	if 'LegSecurityIDSource' in d:
+		add('603=' + str(d['LegSecurityIDSource']))
+		n += 1
+	if 'NoLegSecurityAltID' in d:
+		add('604=' + str(d['NoLegSecurityAltID']))
+		n += 1
+	if 'LegProduct' in d:
+		add('607=' + str(d['LegProduct']))
+		n += 1
+	if 'LegCFICode' in d:
+		add('608=' + str(d['LegCFICode']))
+		n += 1
+	if 'LegSecurityType' in d:
+		add('609=' + str(d['LegSecurityType']))
+		n += 1
+	if 'LegSecuritySubType' in d:
+		add('764=' + str(d['LegSecuritySubType']))
+		n += 1
+	if 'LegMaturityMonthYear' in d:
+		add('610=' + str(d['LegMaturityMonthYear']))
+		n += 1
+	if 'LegMaturityDate' in d:
+		add('611=' + str(d['LegMaturityDate']))
+		n += 1
+	if 'LegCouponPaymentDate' in d:
+		add('248=' + str(d['LegCouponPaymentDate']))
+		n += 1
+	if 'LegIssueDate' in d:
+		add('249=' + str(d['LegIssueDate']))
+		n += 1
+	if 'LegRepoCollateralSecurityType' in d:
+		add('250=' + str(d['LegRepoCollateralSecurityType']))
+		n += 1
+	if 'LegRepurchaseTerm' in d:
+		add('251=' + str(d['LegRepurchaseTerm']))
+		n += 1
+	if 'LegRepurchaseRate' in d:
+		add('252=' + str(d['LegRepurchaseRate']))
+		n += 1
+	if 'LegFactor' in d:
+		add('253=' + str(d['LegFactor']))
+		n += 1
+	if 'LegCreditRating' in d:
+		add('257=' + str(d['LegCreditRating']))
+		n += 1
+	if 'LegInstrRegistry' in d:
+		add('599=' + str(d['LegInstrRegistry']))
+		n += 1
+	if 'LegCountryOfIssue' in d:
+		add('596=' + str(d['LegCountryOfIssue']))
+		n += 1
+	if 'LegStateOrProvinceOfIssue' in d:
+		add('597=' + str(d['LegStateOrProvinceOfIssue']))
+		n += 1
+	if 'LegLocaleOfIssue' in d:
+		add('598=' + str(d['LegLocaleOfIssue']))
+		n += 1
+	if 'LegRedemptionDate' in d:
+		add('254=' + str(d['LegRedemptionDate']))
+		n += 1
+	if 'LegStrikePrice' in d:
+		add('612=' + str(d['LegStrikePrice']))
+		n += 1
+	if 'LegStrikeCurrency' in d:
+		add('942=' + str(d['LegStrikeCurrency']))
+		n += 1
+	if 'LegOptAttribute' in d:
+		add('613=' + str(d['LegOptAttribute']))
+		n += 1
+	if 'LegContractMultiplier' in d:
+		add('614=' + str(d['LegContractMultiplier']))
+		n += 1
+	if 'LegCouponRate' in d:
+		add('615=' + str(d['LegCouponRate']))
+		n += 1
+	if 'LegSecurityExchange' in d:
+		add('616=' + str(d['LegSecurityExchange']))
+		n += 1
+	if 'LegIssuer' in d:
+		add('617=' + str(d['LegIssuer']))
+		n += 1
+	if 'EncodedLegIssuerLen' in d:
+		add('618=' + str(d['EncodedLegIssuerLen']))
+		n += 1
+	if 'EncodedLegIssuer' in d:
+		add('619=' + str(d['EncodedLegIssuer']))
+		n += 1
+	if 'LegSecurityDesc' in d:
+		add('620=' + str(d['LegSecurityDesc']))
+		n += 1
+	if 'EncodedLegSecurityDescLen' in d:
+		add('621=' + str(d['EncodedLegSecurityDescLen']))
+		n += 1
+	if 'EncodedLegSecurityDesc' in d:
+		add('622=' + str(d['EncodedLegSecurityDesc']))
+		n += 1
+	if 'LegRatioQty' in d:
+		add('623=' + str(d['LegRatioQty']))
+		n += 1
+	if 'LegSide' in d:
+		add('624=' + str(d['LegSide']))
+		n += 1
+	if 'LegCurrency' in d:
+		add('556=' + str(d['LegCurrency']))
+		n += 1
+	if 'LegPool' in d:
+		add('740=' + str(d['LegPool']))
+		n += 1
+	if 'LegDatedDate' in d:
+		add('739=' + str(d['LegDatedDate']))
+		n += 1
+	if 'LegContractSettlMonth' in d:
+		add('955=' + str(d['LegContractSettlMonth']))
+		n += 1
+	if 'LegInterestAccrualDate' in d:
+		add('956=' + str(d['LegInterestAccrualDate']))
+		n += 1
+	if 'NoUnderlyings' in d:
+		grp = d['NoUnderlyings']
+		add('711=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoUnderlyings(entry, fixm)
+		n += 1
+	if 'MarginExcess' in d:
+		add('899=' + str(d['MarginExcess']))
+		n += 1
+	if 'TotalNetValue' in d:
+		add('900=' + str(d['TotalNetValue']))
+		n += 1
+	if 'CashOutstanding' in d:
+		add('901=' + str(d['CashOutstanding']))
+		n += 1
+	if 'NoTrdRegTimestamps' in d:
+		grp = d['NoTrdRegTimestamps']
+		add('768=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoTrdRegTimestamps(entry, fixm)
+		n += 1
+	if 'Side' in d:
+		add('54=' + str(d['Side']))
+		n += 1
+	if 'NoMiscFees' in d:
+		grp = d['NoMiscFees']
+		add('136=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoMiscFees(entry, fixm)
+		n += 1
+	if 'Price' in d:
+		add('44=' + str(d['Price']))
+		n += 1
+	if 'PriceType' in d:
+		add('423=' + str(d['PriceType']))
+		n += 1
+	if 'AccruedInterestAmt' in d:
+		add('159=' + str(d['AccruedInterestAmt']))
+		n += 1
+	if 'EndAccruedInterestAmt' in d:
+		add('920=' + str(d['EndAccruedInterestAmt']))
+		n += 1
+	if 'StartCash' in d:
+		add('921=' + str(d['StartCash']))
+		n += 1
+	if 'EndCash' in d:
+		add('922=' + str(d['EndCash']))
+		n += 1
+	if 'Spread' in d:
+		add('218=' + str(d['Spread']))
+		n += 1
+	if 'BenchmarkCurveCurrency' in d:
+		add('220=' + str(d['BenchmarkCurveCurrency']))
+		n += 1
+	if 'BenchmarkCurveName' in d:
+		add('221=' + str(d['BenchmarkCurveName']))
+		n += 1
+	if 'BenchmarkCurvePoint' in d:
+		add('222=' + str(d['BenchmarkCurvePoint']))
+		n += 1
+	if 'BenchmarkPrice' in d:
+		add('662=' + str(d['BenchmarkPrice']))
+		n += 1
+	if 'BenchmarkPriceType' in d:
+		add('663=' + str(d['BenchmarkPriceType']))
+		n += 1
+	if 'BenchmarkSecurityID' in d:
+		add('699=' + str(d['BenchmarkSecurityID']))
+		n += 1
+	if 'BenchmarkSecurityIDSource' in d:
+		add('761=' + str(d['BenchmarkSecurityIDSource']))
+		n += 1
+	if 'NoStipulations' in d:
+		grp = d['NoStipulations']
+		add('232=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoStipulations(entry, fixm)
+		n += 1
+	if 'TradingSessionID' in d:
+		add('336=' + str(d['TradingSessionID']))
+		n += 1
+	if 'TradingSessionSubID' in d:
+		add('625=' + str(d['TradingSessionSubID']))
+		n += 1
+	if 'SettlSessID' in d:
+		add('716=' + str(d['SettlSessID']))
+		n += 1
+	if 'SettlSessSubID' in d:
+		add('717=' + str(d['SettlSessSubID']))
+		n += 1
+	if 'ClearingBusinessDate' in d:
+		add('715=' + str(d['ClearingBusinessDate']))
+		n += 1
+	if 'Text' in d:
+		add('58=' + str(d['Text']))
+		n += 1
+	if 'EncodedTextLen' in d:
+		add('354=' + str(d['EncodedTextLen']))
+		n += 1
+	if 'EncodedText' in d:
+		add('355=' + str(d['EncodedText']))
+		n += 1
+	if len(d) > n:
+		_make_mbody(obj, obj._context, fixm, _msg_CollateralRequest_names)
+	return fixm
+
+def _decode_CollateralRequest(obj, fields, index, context):
+	d = obj.__dict__
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _msg_CollateralRequest_tags.get(num)
+		if spec is None:
+			# not a field of this message, continue with generic decoder
+			body, index = _extract_body(fields, index, context, obj)
+			return index
+		name, pytype, decode_grp = spec
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	return index
+
+class CollateralRequest(FixObject):
+	_encode = staticmethod(_encode_CollateralRequest)
+	_decode = staticmethod(_decode_CollateralRequest)
+
+_msg_CollateralResponse_names = frozenset(['CollRespID', 'CollAsgnID', 'CollReqID', 'CollAsgnReason', 'CollAsgnTransType', 'CollAsgnRespType', 'CollAsgnRejectReason', 'TransactTime', 'NoPartyIDs', 'Account', 'AccountType', 'ClOrdID', 'OrderID', 'SecondaryOrderID', 'SecondaryClOrdID', 'NoExecs', 'NoTrades', 'Symbol', 'SymbolSfx', 'SecurityID', 'SecurityIDSource', 'NoSecurityAltID', 'Product', 'CFICode', 'SecurityType', 'SecuritySubType', 'MaturityMonthYear', 'MaturityDate', 'CouponPaymentDate', 'IssueDate', 'RepoCollateralSecurityType', 'RepurchaseTerm', 'RepurchaseRate', 'Factor', 'CreditRating', 'InstrRegistry', 'CountryOfIssue', 'StateOrProvinceOfIssue', 'LocaleOfIssue', 'RedemptionDate', 'StrikePrice', 'StrikeCurrency', 'OptAttribute', 'ContractMultiplier', 'CouponRate', 'SecurityExchange', 'Issuer', 'EncodedIssuerLen', 'EncodedIssuer', 'SecurityDesc', 'EncodedSecurityDescLen', 'EncodedSecurityDesc', 'Pool', 'ContractSettlMonth', 'CPProgram', 'CPRegType', 'NoEvents', 'DatedDate', 'InterestAccrualDate', 'AgreementDesc', 'AgreementID', 'AgreementDate', 'AgreementCurrency', 'TerminationType', 'StartDate', 'EndDate', 'DeliveryType', 'MarginRatio', 'SettlDate', 'Quantity', 'QtyType', 'Currency', 'NoLegs', 'LegSymbol', 'LegSymbolSfx', 'LegSecurityID', 'LegSecurityIDSource', 'NoLegSecurityAltID', 'LegProduct', 'LegCFICode', 'LegSecurityType', 'LegSecuritySubType', 'LegMaturityMonthYear', 'LegMaturityDate', 'LegCouponPaymentDate', 'LegIssueDate', 'LegRepoCollateralSecurityType', 'LegRepurchaseTerm', 'LegRepurchaseRate', 'LegFactor', 'LegCreditRating', 'LegInstrRegistry', 'LegCountryOfIssue', 'LegStateOrProvinceOfIssue', 'LegLocaleOfIssue', 'LegRedemptionDate', 'LegStrikePrice', 'LegStrikeCurrency', 'LegOptAttribute', 'LegContractMultiplier', 'LegCouponRate', 'LegSecurityExchange', 'LegIssuer', 'EncodedLegIssuerLen', 'EncodedLegIssuer', 'LegSecurityDesc', 'EncodedLegSecurityDescLen', 'EncodedLegSecurityDesc', 'LegRatioQty', 'LegSide', 'LegCurrency', 'LegPool', 'LegDatedDate', 'LegContractSettlMonth', 'LegInterestAccrualDate', 'NoUnderlyings', 'MarginExcess', 'TotalNetValue', 'CashOutstanding', 'NoTrdRegTimestamps', 'Side', 'NoMiscFees', 'Price', 'PriceType', 'AccruedInterestAmt', 'EndAccruedInterestAmt', 'StartCash', 'EndCash', 'Spread', 'BenchmarkCurveCurrency', 'BenchmarkCurveName', 'BenchmarkCurvePoint', 'BenchmarkPrice', 'BenchmarkPriceType', 'BenchmarkSecurityID', 'BenchmarkSecurityIDSource', 'NoStipulations', 'Text', 'EncodedTextLen', 'EncodedText'])
+
+_msg_CollateralResponse_tags = {
+	904: ('CollRespID', str, None),
+	902: ('CollAsgnID', str, None),
+	894: ('CollReqID', str, None),
+	895: ('CollAsgnReason', int, None),
+	903: ('CollAsgnTransType', int, None),
+	905: ('CollAsgnRespType', int, None),
+	906: ('CollAsgnRejectReason', int, None),
+	60: ('TransactTime', str, None),
+	453: ('NoPartyIDs', int, _decode_grp_NoPartyIDs),
+	1: ('Account', str, None),
+	581: ('AccountType', int, None),
+	11: ('ClOrdID', str, None),
+	37: ('OrderID', str, None),
+	198: ('SecondaryOrderID', str, None),
+	526: ('SecondaryClOrdID', str, None),
+	124: ('NoExecs', int, _decode_grp_NoExecs),
+	897: ('NoTrades', int, _decode_grp_NoTrades),
+	55: ('Symbol', str, None),
+	65: ('SymbolSfx', str, None),
+	48: ('SecurityID', str, None),
+	22: ('SecurityIDSource', str, None),
+	454: ('NoSecurityAltID', int, _decode_grp_NoSecurityAltID),
+	460: ('Product', int, None),
+	461: ('CFICode', str, None),
+	167: ('SecurityType', str, None),
+	762: ('SecuritySubType', str, None),
+	200: ('MaturityMonthYear', str, None),
+	541: ('MaturityDate', str, None),
+	224: ('CouponPaymentDate', str, None),
+	225: ('IssueDate', str, None),
+	239: ('RepoCollateralSecurityType', int, None),
+	226: ('RepurchaseTerm', int, None),
+	227: ('RepurchaseRate', float, None),
+	228: ('Factor', float, None),
+	255: ('CreditRating', str, None),
+	543: ('InstrRegistry', str, None),
+	470: ('CountryOfIssue', str, None),
+	471: ('StateOrProvinceOfIssue', str, None),
+	472: ('LocaleOfIssue', str, None),
+	240: ('RedemptionDate', str, None),
+	202: ('StrikePrice', float, None),
+	947: ('StrikeCurrency', str, None),
+	206: ('OptAttribute', str, None),
+	231: ('ContractMultiplier', float, None),
+	223: ('CouponRate', float, None),
+	207: ('SecurityExchange', str, None),
+	106: ('Issuer', str, None),
+	348: ('EncodedIssuerLen', str, None),
+	349: ('EncodedIssuer', str, None),
+	107: ('SecurityDesc', str, None),
+	350: ('EncodedSecurityDescLen', str, None),
+	351: ('EncodedSecurityDesc', str, None),
+	691: ('Pool', str, None),
+	667: ('ContractSettlMonth', str, None),
+	875: ('CPProgram', int, None),
+	876: ('CPRegType', str, None),
+	864: ('NoEvents', int, _decode_grp_NoEvents),
+	873: ('DatedDate', str, None),
+	874: ('InterestAccrualDate', str, None),
+	913: ('AgreementDesc', str, None),
+	914: ('AgreementID', str, None),
+	915: ('AgreementDate', str, None),
+	918: ('AgreementCurrency', str, None),
+	788: ('TerminationType', int, None),
+	916: ('StartDate', str, None),
+	917: ('EndDate', str, None),
+	919: ('DeliveryType', int, None),
+	898: ('MarginRatio', float, None),
+	64: ('SettlDate', str, None),
+	53: ('Quantity', float, None),
+	854: ('QtyType', int, None),
+	15: ('Currency', str, None),
+	555: ('NoLegs', int, _decode_grp_NoLegs),
+	600: ('LegSymbol', str, None),
+	601: ('LegSymbolSfx', str, None),
+	602: ('LegSecurityID', str, None),
+	603: ('LegSecurityIDSource', str, None),
+	604: ('NoLegSecurityAltID', str, None),
+	607: ('LegProduct', int, None),
+	608: ('LegCFICode', str, None),
+	609: ('LegSecurityType', str, None),
+	764: ('LegSecuritySubType', str, None),
+	610: ('LegMaturityMonthYear', str, None),
+	611: ('LegMaturityDate', str, None),
+	248: ('LegCouponPaymentDate', str, None),
+	249: ('LegIssueDate', str, None),
+	250: ('LegRepoCollateralSecurityType', int, None),
+	251: ('LegRepurchaseTerm', int, None),
+	252: ('LegRepurchaseRate', float, None),
+	253: ('LegFactor', float, None),
+	257: ('LegCreditRating', str, None),
+	599: ('LegInstrRegistry', str, None),
+	596: ('LegCountryOfIssue', str, None),
+	597: ('LegStateOrProvinceOfIssue', str, None),
+	598: ('LegLocaleOfIssue', str, None),
+	254: ('LegRedemptionDate', str, None),
+	612: ('LegStrikePrice', float, None),
+	942: ('LegStrikeCurrency', str, None),
+	613: ('LegOptAttribute', str, None),
+	614: ('LegContractMultiplier', float, None),
+	615: ('LegCouponRate', float, None),
+	616: ('LegSecurityExchange', str, None),
+	617: ('LegIssuer', str, None),
+	618: ('EncodedLegIssuerLen', str, None),
+	619: ('EncodedLegIssuer', str, None),
+	620: ('LegSecurityDesc', str, None),
+	621: ('EncodedLegSecurityDescLen', str, None),
+	622: ('EncodedLegSecurityDesc', str, None),
+	623: ('LegRatioQty', float, None),
+	624: ('LegSide', str, None),
+	556: ('LegCurrency', str, None),
+	740: ('LegPool', str, None),
+	739: ('LegDatedDate', str, None),
+	955: ('LegContractSettlMonth', str, None),
+	956: ('LegInterestAccrualDate', str, None),
+	711: ('NoUnderlyings', int, _decode_grp_NoUnderlyings),
+	899: ('MarginExcess', float, None),
+	900: ('TotalNetValue', float, None),
+	901: ('CashOutstanding', float, None),
+	768: ('NoTrdRegTimestamps', int, _decode_grp_NoTrdRegTimestamps),
+	54: ('Side', str, None),
+	136: ('NoMiscFees', int, _decode_grp_NoMiscFees),
+	44: ('Price', float, None),
+	423: ('PriceType', int, None),
+	159: ('AccruedInterestAmt', float, None),
+	920: ('EndAccruedInterestAmt', float, None),
+	921: ('StartCash', float, None),
+	922: ('EndCash', float, None),
+	218: ('Spread', float, None),
+	220: ('BenchmarkCurveCurrency', str, None),
+	221: ('BenchmarkCurveName', str, None),
+	222: ('BenchmarkCurvePoint', str, None),
+	662: ('BenchmarkPrice', float, None),
+	663: ('BenchmarkPriceType', int, None),
+	699: ('BenchmarkSecurityID', str, None),
+	761: ('BenchmarkSecurityIDSource', str, None),
+	232: ('NoStipulations', int, _decode_grp_NoStipulations),
+	58: ('Text', str, None),
+	354: ('EncodedTextLen', str, None),
+	355: ('EncodedText', str, None),
+}
+
+def _encode_CollateralResponse(obj, fixm):
+	d = obj.__dict__
+	add = fixm.append
+	n = 1
+	if 'CollRespID' in d:
+		add('904=' + str(d['CollRespID']))
+		n += 1
+	if 'CollAsgnID' in d:
+		add('902=' + str(d['CollAsgnID']))
+		n += 1
+	if 'CollReqID' in d:
+		add('894=' + str(d['CollReqID']))
+		n += 1
+	if 'CollAsgnReason' in d:
+		add('895=' + str(d['CollAsgnReason']))
+		n += 1
+	if 'CollAsgnTransType' in d:
+		add('903=' + str(d['CollAsgnTransType']))
+		n += 1
+	if 'CollAsgnRespType' in d:
+		add('905=' + str(d['CollAsgnRespType']))
+		n += 1
+	if 'CollAsgnRejectReason' in d:
+		add('906=' + str(d['CollAsgnRejectReason']))
+		n += 1
+	if 'TransactTime' in d:
+		add('60=' + str(d['TransactTime']))
+		n += 1
+	if 'NoPartyIDs' in d:
+		grp = d['NoPartyIDs']
+		add('453=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoPartyIDs(entry, fixm)
+		n += 1
+	if 'Account' in d:
+		add('1=' + str(d['Account']))
+		n += 1
+	if 'AccountType' in d:
+		add('581=' + str(d['AccountType']))
+		n += 1
+	if 'ClOrdID' in d:
+		add('11=' + str(d['ClOrdID']))
+		n += 1
+	if 'OrderID' in d:
+		add('37=' + str(d['OrderID']))
+		n += 1
+	if 'SecondaryOrderID' in d:
+		add('198=' + str(d['SecondaryOrderID']))
+		n += 1
+	if 'SecondaryClOrdID' in d:
+		add('526=' + str(d['SecondaryClOrdID']))
+		n += 1
+	if 'NoExecs' in d:
+		grp = d['NoExecs']
+		add('124=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoExecs(entry, fixm)
+		n += 1
+	if 'NoTrades' in d:
+		grp = d['NoTrades']
+		add('897=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoTrades(entry, fixm)
+		n += 1
+	if 'Symbol' in d:
+		add('55=' + str(d['Symbol']))
+		n += 1
+	if 'SymbolSfx' in d:
+		add('65=' + str(d['SymbolSfx']))
+		n += 1
+	if 'SecurityID' in d:
+		add('48=' + str(d['SecurityID']))
+		n += 1
+	if 'SecurityIDSource' in d:
+		add('22=' + str(d['SecurityIDSource']))
+		n += 1
+	if 'NoSecurityAltID' in d:
+		grp = d['NoSecurityAltID']
+		add('454=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoSecurityAltID(entry, fixm)
+		n += 1
+	if 'Product' in d:
+		add('460=' + str(d['Product']))
+		n += 1
+	if 'CFICode' in d:
+		add('461=' + str(d['CFICode']))
+		n += 1
+	if 'SecurityType' in d:
+		add('167=' + str(d['SecurityType']))
+		n += 1
+	if 'SecuritySubType' in d:
+		add('762=' + str(d['SecuritySubType']))
+		n += 1
+	if 'MaturityMonthYear' in d:
+		add('200=' + str(d['MaturityMonthYear']))
+		n += 1
+	if 'MaturityDate' in d:
+		add('541=' + str(d['MaturityDate']))
+		n += 1
+	if 'CouponPaymentDate' in d:
+		add('224=' + str(d['CouponPaymentDate']))
+		n += 1
+	if 'IssueDate' in d:
+		add('225=' + str(d['IssueDate']))
+		n += 1
+	if 'RepoCollateralSecurityType' in d:
+		add('239=' + str(d['RepoCollateralSecurityType']))
+		n += 1
+	if 'RepurchaseTerm' in d:
+		add('226=' + str(d['RepurchaseTerm']))
+		n += 1
+	if 'RepurchaseRate' in d:
+		add('227=' + str(d['RepurchaseRate']))
+		n += 1
+	if 'Factor' in d:
+		add('228=' + str(d['Factor']))
+		n += 1
+	if 'CreditRating' in d:
+		add('255=' + str(d['CreditRating']))
+		n += 1
+	if 'InstrRegistry' in d:
+		add('543=' + str(d['InstrRegistry']))
+		n += 1
+	if 'CountryOfIssue' in d:
+		add('470=' + str(d['CountryOfIssue']))
+		n += 1
+	if 'StateOrProvinceOfIssue' in d:
+		add('471=' + str(d['StateOrProvinceOfIssue']))
+		n += 1
+	if 'LocaleOfIssue' in d:
+		add('472=' + str(d['LocaleOfIssue']))
+		n += 1
+	if 'RedemptionDate' in d:
+		add('240=' + str(d['RedemptionDate']))
+		n += 1
+	if 'StrikePrice' in d:
+		add('202=' + str(d['StrikePrice']))
+		n += 1
+	if 'StrikeCurrency' in d:
+		add('947=' + str(d['StrikeCurrency']))
+		n += 1
+	if 'OptAttribute' in d:
+		add('206=' + str(d['OptAttribute']))
+		n += 1
+	if 'ContractMultiplier' in d:
+		add('231=' + str(d['ContractMultiplier']))
+		n += 1
+	if 'CouponRate' in d:
+		add('223=' + str(d['CouponRate']))
+		n += 1
+	if 'SecurityExchange' in d:
+		add('207=' + str(d['SecurityExchange']))
+		n += 1
+	if 'Issuer' in d:
+		add('106=' + str(d['Issuer']))
+		n += 1
+	if 'EncodedIssuerLen' in d:
+		add('348=' + str(d['EncodedIssuerLen']))
+		n += 1
+	if 'EncodedIssuer' in d:
+		add('349=' + str(d['EncodedIssuer']))
+		n += 1
+	if 'SecurityDesc' in d:
+		add('107=' + str(d['SecurityDesc']))
+		n += 1
+	if 'EncodedSecurityDescLen' in d:
+		add('350=' + str(d['EncodedSecurityDescLen']))
+		n += 1
+	if 'EncodedSecurityDesc' in d:
+		add('351=' + str(d['EncodedSecurityDesc']))
+		n += 1
+	if 'Pool' in d:
+		add('691=' + str(d['Pool']))
+		n += 1
+	if 'ContractSettlMonth' in d:
+		add('667=' + str(d['ContractSettlMonth']))
+		n += 1
+	if 'CPProgram' in d:
+		add('875=' + str(d['CPProgram']))
+		n += 1
+	if 'CPRegType' in d:
+		add('876=' + str(d['CPRegType']))
+		n += 1
+	if 'NoEvents' in d:
+		grp = d['NoEvents']
+		add('864=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoEvents(entry, fixm)
+		n += 1
+	if 'DatedDate' in d:
+		add('873=' + str(d['DatedDate']))
+		n += 1
+	if 'InterestAccrualDate' in d:
+		add('874=' + str(d['InterestAccrualDate']))
+		n += 1
+	if 'AgreementDesc' in d:
+		add('913=' + str(d['AgreementDesc']))
+		n += 1
+	if 'AgreementID' in d:
+		add('914=' + str(d['AgreementID']))
+		n += 1
+	if 'AgreementDate' in d:
+		add('915=' + str(d['AgreementDate']))
+		n += 1
+	if 'AgreementCurrency' in d:
+		add('918=' + str(d['AgreementCurrency']))
+		n += 1
+	if 'TerminationType' in d:
+		add('788=' + str(d['TerminationType']))
+		n += 1
+	if 'StartDate' in d:
+		add('916=' + str(d['StartDate']))
+		n += 1
+	if 'EndDate' in d:
+		add('917=' + str(d['EndDate']))
+		n += 1
+	if 'DeliveryType' in d:
+		add('919=' + str(d['DeliveryType']))
+		n += 1
+	if 'MarginRatio' in d:
+		add('898=' + str(d['MarginRatio']))
+		n += 1
+	if 'SettlDate' in d:
+		add('64=' + str(d['SettlDate']))
+		n += 1
+	if 'Quantity' in d:
+		add('53=' + str(d['Quantity']))
+		n += 1
+	if 'QtyType' in d:
+		add('854=' + str(d['QtyType']))
+		n += 1
+	if 'Currency' in d:
+		add('15=' + str(d['Currency']))
+		n += 1
+	if 'NoLegs' in d:
+		grp = d['NoLegs']
+		add('555=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoLegs(entry, fixm)
+		n += 1
+	if 'LegSymbol' in d:
+		add('600=' + str(d['LegSymbol']))
+		n += 1
+	if 'LegSymbolSfx' in d:
+		add('601=' + str(d['LegSymbolSfx']))
+		n += 1
+	if 'LegSecurityID' in d:
+		add('602=' + str(d['LegSecurityID']))
+		n += 1
+	if 'LegSecurityIDSource' in d:
+		add('603=' + str(d['LegSecurityIDSource']))
+		n += 1
+	if 'NoLegSecurityAltID' in d:
+		add('604=' + str(d['NoLegSecurityAltID']))
+		n += 1
+	if 'LegProduct' in d:
+		add('607=' + str(d['LegProduct']))
+		n += 1
+	if 'LegCFICode' in d:
+		add('608=' + str(d['LegCFICode']))
+		n += 1
+	if 'LegSecurityType' in d:
+		add('609=' + str(d['LegSecurityType']))
+		n += 1
+	if 'LegSecuritySubType' in d:
+		add('764=' + str(d['LegSecuritySubType']))
+		n += 1
+	if 'LegMaturityMonthYear' in d:
+		add('610=' + str(d['LegMaturityMonthYear']))
+		n += 1
+	if 'LegMaturityDate' in d:
+		add('611=' + str(d['LegMaturityDate']))
+		n += 1
+	if 'LegCouponPaymentDate' in d:
+		add('248=' + str(d['LegCouponPaymentDate']))
+		n += 1
+	if 'LegIssueDate' in d:
+		add('249=' + str(d['LegIssueDate']))
+		n += 1
+	if 'LegRepoCollateralSecurityType' in d:
+		add('250=' + str(d['LegRepoCollateralSecurityType']))
+		n += 1
+	if 'LegRepurchaseTerm' in d:
+		add('251=' + str(d['LegRepurchaseTerm']))
+		n += 1
+	if 'LegRepurchaseRate' in d:
+		add('252=' + str(d['LegRepurchaseRate']))
+		n += 1
+	if 'LegFactor' in d:
+		add('253=' + str(d['LegFactor']))
+		n += 1
+	if 'LegCreditRating' in d:
+		add('257=' + str(d['LegCreditRating']))
+		n += 1
+	if 'LegInstrRegistry' in d:
+		add('599=' + str(d['LegInstrRegistry']))
+		n += 1
+	if 'LegCountryOfIssue' in d:
+		add('596=' + str(d['LegCountryOfIssue']))
+		n += 1
+	if 'LegStateOrProvinceOfIssue' in d:
+		add('597=' + str(d['LegStateOrProvinceOfIssue']))
+		n += 1
+	if 'LegLocaleOfIssue' in d:
+		add('598=' + str(d['LegLocaleOfIssue']))
+		n += 1
+	if 'LegRedemptionDate' in d:
+		add('254=' + str(d['LegRedemptionDate']))
+		n += 1
+	if 'LegStrikePrice' in d:
+		add('612=' + str(d['LegStrikePrice']))
+		n += 1
+	if 'LegStrikeCurrency' in d:
+		add('942=' + str(d['LegStrikeCurrency']))
+		n += 1
+	if 'LegOptAttribute' in d:
+		add('613=' + str(d['LegOptAttribute']))
+		n += 1
+	if 'LegContractMultiplier' in d:
+		add('614=' + str(d['LegContractMultiplier']))
+		n += 1
+	if 'LegCouponRate' in d:
+		add('615=' + str(d['LegCouponRate']))
+		n += 1
+	if 'LegSecurityExchange' in d:
+		add('616=' + str(d['LegSecurityExchange']))
+		n += 1
+	if 'LegIssuer' in d:
+		add('617=' + str(d['LegIssuer']))
+		n += 1
+	if 'EncodedLegIssuerLen' in d:
+		add('618=' + str(d['EncodedLegIssuerLen']))
+		n += 1
+	if 'EncodedLegIssuer' in d:
+		add('619=' + str(d['EncodedLegIssuer']))
+		n += 1
+	if 'LegSecurityDesc' in d:
+		add('620=' + str(d['LegSecurityDesc']))
+		n += 1
+	if 'EncodedLegSecurityDescLen' in d:
+		add('621=' + str(d['EncodedLegSecurityDescLen']))
+		n += 1
+	if 'EncodedLegSecurityDesc' in d:
+		add('622=' + str(d['EncodedLegSecurityDesc']))
+		n += 1
+	if 'LegRatioQty' in d:
+		add('623=' + str(d['LegRatioQty']))
+		n += 1
+	if 'LegSide' in d:
+		add('624=' + str(d['LegSide']))
+		n += 1
+	if 'LegCurrency' in d:
+		add('556=' + str(d['LegCurrency']))
+		n += 1
+	if 'LegPool' in d:
+		add('740=' + str(d['LegPool']))
+		n += 1
+	if 'LegDatedDate' in d:
+		add('739=' + str(d['LegDatedDate']))
+		n += 1
+	if 'LegContractSettlMonth' in d:
+		add('955=' + str(d['LegContractSettlMonth']))
+		n += 1
+	if 'LegInterestAccrualDate' in d:
+		add('956=' + str(d['LegInterestAccrualDate']))
+		n += 1
+	if 'NoUnderlyings' in d:
+		grp = d['NoUnderlyings']
+		add('711=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoUnderlyings(entry, fixm)
+		n += 1
+	if 'MarginExcess' in d:
+		add('899=' + str(d['MarginExcess']))
+		n += 1
+	if 'TotalNetValue' in d:
+		add('900=' + str(d['TotalNetValue']))
+		n += 1
+	if 'CashOutstanding' in d:
+		add('901=' + str(d['CashOutstanding']))
+		n += 1
+	if 'NoTrdRegTimestamps' in d:
+		grp = d['NoTrdRegTimestamps']
+		add('768=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoTrdRegTimestamps(entry, fixm)
+		n += 1
+	if 'Side' in d:
+		add('54=' + str(d['Side']))
+		n += 1
+	if 'NoMiscFees' in d:
+		grp = d['NoMiscFees']
+		add('136=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoMiscFees(entry, fixm)
+		n += 1
+	if 'Price' in d:
+		add('44=' + str(d['Price']))
+		n += 1
+	if 'PriceType' in d:
+		add('423=' + str(d['PriceType']))
+		n += 1
+	if 'AccruedInterestAmt' in d:
+		add('159=' + str(d['AccruedInterestAmt']))
+		n += 1
+	if 'EndAccruedInterestAmt' in d:
+		add('920=' + str(d['EndAccruedInterestAmt']))
+		n += 1
+	if 'StartCash' in d:
+		add('921=' + str(d['StartCash']))
+		n += 1
+	if 'EndCash' in d:
+		add('922=' + str(d['EndCash']))
+		n += 1
+	if 'Spread' in d:
+		add('218=' + str(d['Spread']))
+		n += 1
+	if 'BenchmarkCurveCurrency' in d:
+		add('220=' + str(d['BenchmarkCurveCurrency']))
+		n += 1
+	if 'BenchmarkCurveName' in d:
+		add('221=' + str(d['BenchmarkCurveName']))
+		n += 1
+	if 'BenchmarkCurvePoint' in d:
+		add('222=' + str(d['BenchmarkCurvePoint']))
+		n += 1
+	if 'BenchmarkPrice' in d:
+		add('662=' + str(d['BenchmarkPrice']))
+		n += 1
+	if 'BenchmarkPriceType' in d:
+		add('663=' + str(d['BenchmarkPriceType']))
+		n += 1
+	if 'BenchmarkSecurityID' in d:
+		add('699=' + str(d['BenchmarkSecurityID']))
+		n += 1
+	if 'BenchmarkSecurityIDSource' in d:
+		add('761=' + str(d['BenchmarkSecurityIDSource']))
+		n += 1
+	if 'NoStipulations' in d:
+		grp = d['NoStipulations']
+		add('232=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoStipulations(entry, fixm)
+		n += 1
+	if 'Text' in d:
+		add('58=' + str(d['Text']))
+		n += 1
+	if 'EncodedTextLen' in d:
+		add('354=' + str(d['EncodedTextLen']))
+		n += 1
+	if 'EncodedText' in d:
+		add('355=' + str(d['EncodedText']))
+		n += 1
+	if len(d) > n:
+		_make_mbody(obj, obj._context, fixm, _msg_CollateralResponse_names)
+	return fixm
+
+def _decode_CollateralResponse(obj, fields, index, context):
+	d = obj.__dict__
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _msg_CollateralResponse_tags.get(num)
+		if spec is None:
+			# not a field of this message, continue with generic decoder
+			body, index = _extract_body(fields, index, context, obj)
+			return index
+		name, pytype, decode_grp = spec
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	return index
+
+class CollateralResponse(FixObject):
+	_encode = staticmethod(_encode_CollateralResponse)
+	_decode = staticmethod(_decode_CollateralResponse)
+
+_msg_Confirmation_names = frozenset(['ConfirmID', 'ConfirmRefID', 'ConfirmReqID', 'ConfirmTransType', 'ConfirmType', 'CopyMsgIndicator', 'LegalConfirm', 'ConfirmStatus', 'NoPartyIDs', 'NoOrders', 'AllocID', 'SecondaryAllocID', 'IndividualAllocID', 'TransactTime', 'TradeDate', 'NoTrdRegTimestamps', 'Symbol', 'SymbolSfx', 'SecurityID', 'SecurityIDSource', 'NoSecurityAltID', 'Product', 'CFICode', 'SecurityType', 'SecuritySubType', 'MaturityMonthYear', 'MaturityDate', 'CouponPaymentDate', 'IssueDate', 'RepoCollateralSecurityType', 'RepurchaseTerm', 'RepurchaseRate', 'Factor', 'CreditRating', 'InstrRegistry', 'CountryOfIssue', 'StateOrProvinceOfIssue', 'LocaleOfIssue', 'RedemptionDate', 'StrikePrice', 'StrikeCurrency', 'OptAttribute', 'ContractMultiplier', 'CouponRate', 'SecurityExchange', 'Issuer', 'EncodedIssuerLen', 'EncodedIssuer', 'SecurityDesc', 'EncodedSecurityDescLen', 'EncodedSecurityDesc', 'Pool', 'ContractSettlMonth', 'CPProgram', 'CPRegType', 'NoEvents', 'DatedDate', 'InterestAccrualDate', 'DeliveryForm', 'PctAtRisk', 'NoInstrAttrib', 'AgreementDesc', 'AgreementID', 'AgreementDate', 'AgreementCurrency', 'TerminationType', 'StartDate', 'EndDate', 'DeliveryType', 'MarginRatio', 'NoUnderlyings', 'NoLegs', 'YieldType', 'Yield', 'YieldCalcDate', 'YieldRedemptionDate', 'YieldRedemptionPrice', 'YieldRedemptionPriceType', 'AllocQty', 'QtyType', 'Side', 'Currency', 'LastMkt', 'NoCapacities', 'AllocAccount', 'AllocAcctIDSource', 'AllocAccountType', 'AvgPx', 'AvgPxPrecision', 'PriceType', 'AvgParPx', 'Spread', 'BenchmarkCurveCurrency', 'BenchmarkCurveName', 'BenchmarkCurvePoint', 'BenchmarkPrice', 'BenchmarkPriceType', 'BenchmarkSecurityID', 'BenchmarkSecurityIDSource', 'ReportedPx', 'Text', 'EncodedTextLen', 'EncodedText', 'ProcessCode', 'GrossTradeAmt', 'NumDaysInterest', 'ExDate', 'AccruedInterestRate', 'AccruedInterestAmt', 'InterestAtMaturity', 'EndAccruedInterestAmt', 'StartCash', 'EndCash', 'Concession', 'TotalTakedown', 'NetMoney', 'MaturityNetMoney', 'SettlCurrAmt', 'SettlCurrency', 'SettlCurrFxRate', 'SettlCurrFxRateCalc', 'SettlType', 'SettlDate', 'SettlDeliveryType', 'StandInstDbType', 'StandInstDbName', 'StandInstDbID', 'NoDlvyInst', 'Commission', 'CommType', 'CommCurrency', 'FundRenewWaiv', 'SharedCommission', 'NoStipulations', 'NoMiscFees'])
+
+_msg_Confirmation_tags = {
+	664: ('ConfirmID', str, None),
+	772: ('ConfirmRefID', str, None),
+	859: ('ConfirmReqID', str, None),
+	666: ('ConfirmTransType', int, None),
+	773: ('ConfirmType', int, None),
+	797: ('CopyMsgIndicator', str, None),
+	650: ('LegalConfirm', str, None),
+	665: ('ConfirmStatus', int, None),
+	453: ('NoPartyIDs', int, _decode_grp_NoPartyIDs),
+	73: ('NoOrders', int, _decode_grp_NoOrders),
+	70: ('AllocID', str, None),
+	793: ('SecondaryAllocID', str, None),
+	467: ('IndividualAllocID', str, None),
+	60: ('TransactTime', str, None),
+	75: ('TradeDate', str, None),
+	768: ('NoTrdRegTimestamps', int, _decode_grp_NoTrdRegTimestamps),
+	55: ('Symbol', str, None),
+	65: ('SymbolSfx', str, None),
+	48: ('SecurityID', str, None),
+	22: ('SecurityIDSource', str, None),
+	454: ('NoSecurityAltID', int, _decode_grp_NoSecurityAltID),
+	460: ('Product', int, None),
+	461: ('CFICode', str, None),
+	167: ('SecurityType', str, None),
+	762: ('SecuritySubType', str, None),
+	200: ('MaturityMonthYear', str, None),
+	541: ('MaturityDate', str, None),
+	224: ('CouponPaymentDate', str, None),
+	225: ('IssueDate', str, None),
+	239: ('RepoCollateralSecurityType', int, None),
+	226: ('RepurchaseTerm', int, None),
+	227: ('RepurchaseRate', float, None),
+	228: ('Factor', float, None),
+	255: ('CreditRating', str, None),
+	543: ('InstrRegistry', str, None),
+	470: ('CountryOfIssue', str, None),
+	471: ('StateOrProvinceOfIssue', str, None),
+	472: ('LocaleOfIssue', str, None),
+	240: ('RedemptionDate', str, None),
+	202: ('StrikePrice', float, None),
+	947: ('StrikeCurrency', str, None),
+	206: ('OptAttribute', str, None),
+	231: ('ContractMultiplier', float, None),
+	223: ('CouponRate', float, None),
+	207: ('SecurityExchange', str, None),
+	106: ('Issuer', str, None),
+	348: ('EncodedIssuerLen', str, None),
+	349: ('EncodedIssuer', str, None),
+	107: ('SecurityDesc', str, None),
+	350: ('EncodedSecurityDescLen', str, None),
+	351: ('EncodedSecurityDesc', str, None),
+	691: ('Pool', str, None),
+	667: ('ContractSettlMonth', str, None),
+	875: ('CPProgram', int, None),
+	876: ('CPRegType', str, None),
+	864: ('NoEvents', int, _decode_grp_NoEvents),
+	873: ('DatedDate', str, None),
+	874: ('InterestAccrualDate', str, None),
+	668: ('DeliveryForm', int, None),
+	869: ('PctAtRisk', float, None),
+	870: ('NoInstrAttrib', int, _decode_grp_NoInstrAttrib),
+	913: ('AgreementDesc', str, None),
+	914: ('AgreementID', str, None),
+	915: ('AgreementDate', str, None),
+	918: ('AgreementCurrency', str, None),
+	788: ('TerminationType', int, None),
+	916: ('StartDate', str, None),
+	917: ('EndDate', str, None),
+	919: ('DeliveryType', int, None),
+	898: ('MarginRatio', float, None),
+	711: ('NoUnderlyings', int, _decode_grp_NoUnderlyings),
+	555: ('NoLegs', int, _decode_grp_NoLegs),
+	235: ('YieldType', str, None),
+	236: ('Yield', float, None),
+	701: ('YieldCalcDate', str, None),
+	696: ('YieldRedemptionDate', str, None),
+	697: ('YieldRedemptionPrice', float, None),
+	698: ('YieldRedemptionPriceType', int, None),
+	80: ('AllocQty', float, None),
+	854: ('QtyType', int, None),
+	54: ('Side', str, None),
+	15: ('Currency', str, None),
+	30: ('LastMkt', str, None),
+	862: ('NoCapacities', int, _decode_grp_NoCapacities),
+	79: ('AllocAccount', str, None),
+	661: ('AllocAcctIDSource', int, None),
+	798: ('AllocAccountType', int, None),
+	6: ('AvgPx', float, None),
+	74: ('AvgPxPrecision', int, None),
+	423: ('PriceType', int, None),
+	860: ('AvgParPx', float, None),
+	218: ('Spread', float, None),
+	220: ('BenchmarkCurveCurrency', str, None),
+	221: ('BenchmarkCurveName', str, None),
+	222: ('BenchmarkCurvePoint', str, None),
+	662: ('BenchmarkPrice', float, None),
+	663: ('BenchmarkPriceType', int, None),
+	699: ('BenchmarkSecurityID', str, None),
+	761: ('BenchmarkSecurityIDSource', str, None),
+	861: ('ReportedPx', float, None),
+	58: ('Text', str, None),
+	354: ('EncodedTextLen', str, None),
+	355: ('EncodedText', str, None),
+	81: ('ProcessCode', str, None),
+	381: ('GrossTradeAmt', float, None),
+	157: ('NumDaysInterest', int, None),
+	230: ('ExDate', str, None),
+	158: ('AccruedInterestRate', float, None),
+	159: ('AccruedInterestAmt', float, None),
+	738: ('InterestAtMaturity', float, None),
+	920: ('EndAccruedInterestAmt', float, None),
+	921: ('StartCash', float, None),
+	922: ('EndCash', float, None),
+	238: ('Concession', float, None),
+	237: ('TotalTakedown', float, None),
+	118: ('NetMoney', float, None),
+	890: ('MaturityNetMoney', float, None),
+	119: ('SettlCurrAmt', float, None),
+	120: ('SettlCurrency', str, None),
+	155: ('SettlCurrFxRate', float, None),
+	156: ('SettlCurrFxRateCalc', str, None),
+	63: ('SettlType', str, None),
+	64: ('SettlDate', str, None),
+	172: ('SettlDeliveryType', int, None),
+	169: ('StandInstDbType', int, None),
+	170: ('StandInstDbName', str, None),
+	171: ('StandInstDbID', str, None),
+	85: ('NoDlvyInst', int, _decode_grp_NoDlvyInst),
+	12: ('Commission', float, None),
+	13: ('CommType', str, None),
+	479: ('CommCurrency', str, None),
+	497: ('FundRenewWaiv', str, None),
+	858: ('SharedCommission', float, None),
+	232: ('NoStipulations', int, _decode_grp_NoStipulations),
+	136: ('NoMiscFees', int, _decode_grp_NoMiscFees),
+}
+
+def _encode_Confirmation(obj, fixm):
+	d = obj.__dict__
+	add = fixm.append
+	n = 1
+	if 'ConfirmID' in d:
+		add('664=' + str(d['ConfirmID']))
+		n += 1
+	if 'ConfirmRefID' in d:
+		add('772=' + str(d['ConfirmRefID']))
+		n += 1
+	if 'ConfirmReqID' in d:
+		add('859=' + str(d['ConfirmReqID']))
+		n += 1
+	if 'ConfirmTransType' in d:
+		add('666=' + str(d['ConfirmTransType']))
+		n += 1
+	if 'ConfirmType' in d:
+		add('773=' + str(d['ConfirmType']))
+		n += 1
+	if 'CopyMsgIndicator' in d:
+		add('797=' + str(d['CopyMsgIndicator']))
+		n += 1
+	if 'LegalConfirm' in d:
+		add('650=' + str(d['LegalConfirm']))
+		n += 1
+	if 'ConfirmStatus' in d:
+		add('665=' + str(d['ConfirmStatus']))
+		n += 1
+	if 'NoPartyIDs' in d:
+		grp = d['NoPartyIDs']
+		add('453=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoPartyIDs(entry, fixm)
+		n += 1
+	if 'NoOrders' in d:
+		grp = d['NoOrders']
+		add('73=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoOrders(entry, fixm)
+		n += 1
+	if 'AllocID' in d:
+		add('70=' + str(d['AllocID']))
+		n += 1
+	if 'SecondaryAllocID' in d:
+		add('793=' + str(d['SecondaryAllocID']))
+		n += 1
+	if 'IndividualAllocID' in d:
+		add('467=' + str(d['IndividualAllocID']))
+		n += 1
+	if 'TransactTime' in d:
+		add('60=' + str(d['TransactTime']))
+		n += 1
+	if 'TradeDate' in d:
+		add('75=' + str(d['TradeDate']))
+		n += 1
+	if 'NoTrdRegTimestamps' in d:
+		grp = d['NoTrdRegTimestamps']
+		add('768=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoTrdRegTimestamps(entry, fixm)
+		n += 1
+	if 'Symbol' in d:
+		add('55=' + str(d['Symbol']))
+		n += 1
+	if 'SymbolSfx' in d:
+		add('65=' + str(d['SymbolSfx']))
+		n += 1
+	if 'SecurityID' in d:
+		add('48=' + str(d['SecurityID']))
+		n += 1
+	if 'SecurityIDSource' in d:
+		add('22=' + str(d['SecurityIDSource']))
+		n += 1
+	if 'NoSecurityAltID' in d:
+		grp = d['NoSecurityAltID']
+		add('454=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoSecurityAltID(entry, fixm)
+		n += 1
+	if 'Product' in d:
+		add('460=' + str(d['Product']))
+		n += 1
+	if 'CFICode' in d:
+		add('461=' + str(d['CFICode']))
+		n += 1
+	if 'SecurityType' in d:
+		add('167=' + str(d['SecurityType']))
+		n += 1
+	if 'SecuritySubType' in d:
+		add('762=' + str(d['SecuritySubType']))
+		n += 1
+	if 'MaturityMonthYear' in d:
+		add('200=' + str(d['MaturityMonthYear']))
+		n += 1
+	if 'MaturityDate' in d:
+		add('541=' + str(d['MaturityDate']))
+		n += 1
+	if 'CouponPaymentDate' in d:
+		add('224=' + str(d['CouponPaymentDate']))
+		n += 1
+	if 'IssueDate' in d:
+		add('225=' + str(d['IssueDate']))
+		n += 1
+	if 'RepoCollateralSecurityType' in d:
+		add('239=' + str(d['RepoCollateralSecurityType']))
+		n += 1
+	if 'RepurchaseTerm' in d:
+		add('226=' + str(d['RepurchaseTerm']))
+		n += 1
+	if 'RepurchaseRate' in d:
+		add('227=' + str(d['RepurchaseRate']))
+		n += 1
+	if 'Factor' in d:
+		add('228=' + str(d['Factor']))
+		n += 1
+	if 'CreditRating' in d:
+		add('255=' + str(d['CreditRating']))
+		n += 1
+	if 'InstrRegistry' in d:
+		add('543=' + str(d['InstrRegistry']))
+		n += 1
+	if 'CountryOfIssue' in d:
+		add('470=' + str(d['CountryOfIssue']))
+		n += 1
+	if 'StateOrProvinceOfIssue' in d:
+		add('471=' + str(d['StateOrProvinceOfIssue']))
+		n += 1
+	if 'LocaleOfIssue' in d:
+		add('472=' + str(d['LocaleOfIssue']))
+		n += 1
+	if 'RedemptionDate' in d:
+		add('240=' + str(d['RedemptionDate']))
+		n += 1
+	if 'StrikePrice' in d:
+		add('202=' + str(d['StrikePrice']))
+		n += 1
+	if 'StrikeCurrency' in d:
+		add('947=' + str(d['StrikeCurrency']))
+		n += 1
+	if 'OptAttribute' in d:
+		add('206=' + str(d['OptAttribute']))
+		n += 1
+	if 'ContractMultiplier' in d:
+		add('231=' + str(d['ContractMultiplier']))
+		n += 1
+	if 'CouponRate' in d:
+		add('223=' + str(d['CouponRate']))
+		n += 1
+	if 'SecurityExchange' in d:
+		add('207=' + str(d['SecurityExchange']))
+		n += 1
+	if 'Issuer' in d:
+		add('106=' + str(d['Issuer']))
+		n += 1
+	if 'EncodedIssuerLen' in d:
+		add('348=' + str(d['EncodedIssuerLen']))
+		n += 1
+	if 'EncodedIssuer' in d:
+		add('349=' + str(d['EncodedIssuer']))
+		n += 1
+	if 'SecurityDesc' in d:
+		add('107=' + str(d['SecurityDesc']))
+		n += 1
+	if 'EncodedSecurityDescLen' in d:
+		add('350=' + str(d['EncodedSecurityDescLen']))
+		n += 1
+	if 'EncodedSecurityDesc' in d:
+		add('351=' + str(d['EncodedSecurityDesc']))
+		n += 1
+	if 'Pool' in d:
+		add('691=' + str(d['Pool']))
+		n += 1
+	if 'ContractSettlMonth' in d:
+		add('667=' + str(d['ContractSettlMonth']))
+		n += 1
+	if 'CPProgram' in d:
+		add('875=' + str(d['CPProgram']))
+		n += 1
+	if 'CPRegType' in d:
+		add('876=' + str(d['CPRegType']))
+		n += 1
+	if 'NoEvents' in d:
+		grp = d['NoEvents']
+		add('864=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoEvents(entry, fixm)
+		n += 1
+	if 'DatedDate' in d:
+		add('873=' + str(d['DatedDate']))
+		n += 1
+	if 'InterestAccrualDate' in d:
+		add('874=' + str(d['InterestAccrualDate']))
+		n += 1
+	if 'DeliveryForm' in d:
+		add('668=' + str(d['DeliveryForm']))
+		n += 1
+	if 'PctAtRisk' in d:
+		add('869=' + str(d['PctAtRisk']))
+		n += 1
+	if 'NoInstrAttrib' in d:
+		grp = d['NoInstrAttrib']
+		add('870=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoInstrAttrib(entry, fixm)
+		n += 1
+	if 'AgreementDesc' in d:
+		add('913=' + str(d['AgreementDesc']))
+		n += 1
+	if 'AgreementID' in d:
+		add('914=' + str(d['AgreementID']))
+		n += 1
+	if 'AgreementDate' in d:
+		add('915=' + str(d['AgreementDate']))
+		n += 1
+	if 'AgreementCurrency' in d:
+		add('918=' + str(d['AgreementCurrency']))
+		n += 1
+	if 'TerminationType' in d:
+		add('788=' + str(d['TerminationType']))
+		n += 1
+	if 'StartDate' in d:
+		add('916=' + str(d['StartDate']))
+		n += 1
+	if 'EndDate' in d:
+		add('917=' + str(d['EndDate']))
+		n += 1
+	if 'DeliveryType' in d:
+		add('919=' + str(d['DeliveryType']))
+		n += 1
+	if 'MarginRatio' in d:
+		add('898=' + str(d['MarginRatio']))
+		n += 1
+	if 'NoUnderlyings' in d:
+		grp = d['NoUnderlyings']
+		add('711=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoUnderlyings(entry, fixm)
+		n += 1
+	if 'NoLegs' in d:
+		grp = d['NoLegs']
+		add('555=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoLegs(entry, fixm)
+		n += 1
+	if 'YieldType' in d:
+		add('235=' + str(d['YieldType']))
+		n += 1
+	if 'Yield' in d:
+		add('236=' + str(d['Yield']))
+		n += 1
+	if 'YieldCalcDate' in d:
+		add('701=' + str(d['YieldCalcDate']))
+		n += 1
+	if 'YieldRedemptionDate' in d:
+		add('696=' + str(d['YieldRedemptionDate']))
+		n += 1
+	if 'YieldRedemptionPrice' in d:
+		add('697=' + str(d['YieldRedemptionPrice']))
+		n += 1
+	if 'YieldRedemptionPriceType' in d:
+		add('698=' + str(d['YieldRedemptionPriceType']))
+		n += 1
+	if 'AllocQty' in d:
+		add('80=' + str(d['AllocQty']))
+		n += 1
+	if 'QtyType' in d:
+		add('854=' + str(d['QtyType']))
+		n += 1
+	if 'Side' in d:
+		add('54=' + str(d['Side']))
+		n += 1
+	if 'Currency' in d:
+		add('15=' + str(d['Currency']))
+		n += 1
+	if 'LastMkt' in d:
+		add('30=' + str(d['LastMkt']))
+		n += 1
+	if 'NoCapacities' in d:
+		grp = d['NoCapacities']
+		add('862=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoCapacities(entry, fixm)
+		n += 1
+	if 'AllocAccount' in d:
+		add('79=' + str(d['AllocAccount']))
+		n += 1
+	if 'AllocAcctIDSource' in d:
+		add('661=' + str(d['AllocAcctIDSource']))
+		n += 1
+	if 'AllocAccountType' in d:
+		add('798=' + str(d['AllocAccountType']))
+		n += 1
+	if 'AvgPx' in d:
+		add('6=' + str(d['AvgPx']))
+		n += 1
+	if 'AvgPxPrecision' in d:
+		add('74=' + str(d['AvgPxPrecision']))
+		n += 1
+	if 'PriceType' in d:
+		add('423=' + str(d['PriceType']))
+		n += 1
+	if 'AvgParPx' in d:
+		add('860=' + str(d['AvgParPx']))
+		n += 1
+	if 'Spread' in d:
+		add('218=' + str(d['Spread']))
+		n += 1
+	if 'BenchmarkCurveCurrency' in d:
+		add('220=' + str(d['BenchmarkCurveCurrency']))
+		n += 1
+	if 'BenchmarkCurveName' in d:
+		add('221=' + str(d['BenchmarkCurveName']))
+		n += 1
+	if 'BenchmarkCurvePoint' in d:
+		add('222=' + str(d['BenchmarkCurvePoint']))
+		n += 1
+	if 'BenchmarkPrice' in d:
+		add('662=' + str(d['BenchmarkPrice']))
+		n += 1
+	if 'BenchmarkPriceType' in d:
+		add('663=' + str(d['BenchmarkPriceType']))
+		n += 1
+	if 'BenchmarkSecurityID' in d:
+		add('699=' + str(d['BenchmarkSecurityID']))
+		n += 1
+	if 'BenchmarkSecurityIDSource' in d:
+		add('761=' + str(d['BenchmarkSecurityIDSource']))
+		n += 1
+	if 'ReportedPx' in d:
+		add('861=' + str(d['ReportedPx']))
+		n += 1
+	if 'Text' in d:
+		add('58=' + str(d['Text']))
+		n += 1
+	if 'EncodedTextLen' in d:
+		add('354=' + str(d['EncodedTextLen']))
+		n += 1
+	if 'EncodedText' in d:
+		add('355=' + str(d['EncodedText']))
+		n += 1
+	if 'ProcessCode' in d:
+		add('81=' + str(d['ProcessCode']))
+		n += 1
+	if 'GrossTradeAmt' in d:
+		add('381=' + str(d['GrossTradeAmt']))
+		n += 1
+	if 'NumDaysInterest' in d:
+		add('157=' + str(d['NumDaysInterest']))
+		n += 1
+	if 'ExDate' in d:
+		add('230=' + str(d['ExDate']))
+		n += 1
+	if 'AccruedInterestRate' in d:
+		add('158=' + str(d['AccruedInterestRate']))
+		n += 1
+	if 'AccruedInterestAmt' in d:
+		add('159=' + str(d['AccruedInterestAmt']))
+		n += 1
+	if 'InterestAtMaturity' in d:
+		add('738=' + str(d['InterestAtMaturity']))
+		n += 1
+	if 'EndAccruedInterestAmt' in d:
+		add('920=' + str(d['EndAccruedInterestAmt']))
+		n += 1
+	if 'StartCash' in d:
+		add('921=' + str(d['StartCash']))
+		n += 1
+	if 'EndCash' in d:
+		add('922=' + str(d['EndCash']))
+		n += 1
+	if 'Concession' in d:
+		add('238=' + str(d['Concession']))
+		n += 1
+	if 'TotalTakedown' in d:
+		add('237=' + str(d['TotalTakedown']))
+		n += 1
+	if 'NetMoney' in d:
+		add('118=' + str(d['NetMoney']))
+		n += 1
+	if 'MaturityNetMoney' in d:
+		add('890=' + str(d['MaturityNetMoney']))
+		n += 1
+	if 'SettlCurrAmt' in d:
+		add('119=' + str(d['SettlCurrAmt']))
+		n += 1
+	if 'SettlCurrency' in d:
+		add('120=' + str(d['SettlCurrency']))
+		n += 1
+	if 'SettlCurrFxRate' in d:
+		add('155=' + str(d['SettlCurrFxRate']))
+		n += 1
+	if 'SettlCurrFxRateCalc' in d:
+		add('156=' + str(d['SettlCurrFxRateCalc']))
+		n += 1
+	if 'SettlType' in d:
+		add('63=' + str(d['SettlType']))
+		n += 1
+	if 'SettlDate' in d:
+		add('64=' + str(d['SettlDate']))
+		n += 1
+	if 'SettlDeliveryType' in d:
+		add('172=' + str(d['SettlDeliveryType']))
+		n += 1
+	if 'StandInstDbType' in d:
+		add('169=' + str(d['StandInstDbType']))
+		n += 1
+	if 'StandInstDbName' in d:
+		add('170=' + str(d['StandInstDbName']))
+		n += 1
+	if 'StandInstDbID' in d:
+		add('171=' + str(d['StandInstDbID']))
+		n += 1
+	if 'NoDlvyInst' in d:
+		grp = d['NoDlvyInst']
+		add('85=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoDlvyInst(entry, fixm)
+		n += 1
+	if 'Commission' in d:
+		add('12=' + str(d['Commission']))
+		n += 1
+	if 'CommType' in d:
+		add('13=' + str(d['CommType']))
+		n += 1
+	if 'CommCurrency' in d:
+		add('479=' + str(d['CommCurrency']))
+		n += 1
+	if 'FundRenewWaiv' in d:
+		add('497=' + str(d['FundRenewWaiv']))
+		n += 1
+	if 'SharedCommission' in d:
+		add('858=' + str(d['SharedCommission']))
+		n += 1
+	if 'NoStipulations' in d:
+		grp = d['NoStipulations']
+		add('232=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoStipulations(entry, fixm)
+		n += 1
+	if 'NoMiscFees' in d:
+		grp = d['NoMiscFees']
+		add('136=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoMiscFees(entry, fixm)
+		n += 1
+	if len(d) > n:
+		_make_mbody(obj, obj._context, fixm, _msg_Confirmation_names)
+	return fixm
+
+def _decode_Confirmation(obj, fields, index, context):
+	d = obj.__dict__
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _msg_Confirmation_tags.get(num)
+		if spec is None:
+			# not a field of this message, continue with generic decoder
+			body, index = _extract_body(fields, index, context, obj)
+			return index
+		name, pytype, decode_grp = spec
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	return index
+
+class Confirmation(FixObject):
+	_encode = staticmethod(_encode_Confirmation)
+	_decode = staticmethod(_decode_Confirmation)
+
+_msg_ConfirmationAck_names = frozenset(['ConfirmID', 'TradeDate', 'TransactTime', 'AffirmStatus', 'ConfirmRejReason', 'MatchStatus', 'Text', 'EncodedTextLen', 'EncodedText'])
+
+_msg_ConfirmationAck_tags = {
+	664: ('ConfirmID', str, None),
+	75: ('TradeDate', str, None),
+	60: ('TransactTime', str, None),
+	940: ('AffirmStatus', int, None),
+	774: ('ConfirmRejReason', int, None),
+	573: ('MatchStatus', str, None),
+	58: ('Text', str, None),
+	354: ('EncodedTextLen', str, None),
+	355: ('EncodedText', str, None),
+}
+
+def _encode_ConfirmationAck(obj, fixm):
+	d = obj.__dict__
+	add = fixm.append
+	n = 1
+	if 'ConfirmID' in d:
+		add('664=' + str(d['ConfirmID']))
+		n += 1
+	if 'TradeDate' in d:
+		add('75=' + str(d['TradeDate']))
+		n += 1
+	if 'TransactTime' in d:
+		add('60=' + str(d['TransactTime']))
+		n += 1
+	if 'AffirmStatus' in d:
+		add('940=' + str(d['AffirmStatus']))
+		n += 1
+	if 'ConfirmRejReason' in d:
+		add('774=' + str(d['ConfirmRejReason']))
+		n += 1
+	if 'MatchStatus' in d:
+		add('573=' + str(d['MatchStatus']))
+		n += 1
+	if 'Text' in d:
+		add('58=' + str(d['Text']))
+		n += 1
+	if 'EncodedTextLen' in d:
+		add('354=' + str(d['EncodedTextLen']))
+		n += 1
+	if 'EncodedText' in d:
+		add('355=' + str(d['EncodedText']))
+		n += 1
+	if len(d) > n:
+		_make_mbody(obj, obj._context, fixm, _msg_ConfirmationAck_names)
+	return fixm
+
+def _decode_ConfirmationAck(obj, fields, index, context):
+	d = obj.__dict__
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _msg_ConfirmationAck_tags.get(num)
+		if spec is None:
+			# not a field of this message, continue with generic decoder
+			body, index = _extract_body(fields, index, context, obj)
+			return index
+		name, pytype, decode_grp = spec
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	return index
+
+class ConfirmationAck(FixObject):
+	_encode = staticmethod(_encode_ConfirmationAck)
+	_decode = staticmethod(_decode_ConfirmationAck)
+
+_msg_ConfirmationRequest_names = frozenset(['ConfirmReqID', 'ConfirmType', 'NoOrders', 'AllocID', 'SecondaryAllocID', 'IndividualAllocID', 'TransactTime', 'AllocAccount', 'AllocAcctIDSource', 'AllocAccountType', 'Text', 'EncodedTextLen', 'EncodedText'])
+
+_msg_ConfirmationRequest_tags = {
+	859: ('ConfirmReqID', str, None),
+	773: ('ConfirmType', int, None),
+	73: ('NoOrders', int, _decode_grp_NoOrders),
+	70: ('AllocID', str, None),
+	793: ('SecondaryAllocID', str, None),
+	467: ('IndividualAllocID', str, None),
+	60: ('TransactTime', str, None),
+	79: ('AllocAccount', str, None),
+	661: ('AllocAcctIDSource', int, None),
+	798: ('AllocAccountType', int, None),
+	58: ('Text', str, None),
+	354: ('EncodedTextLen', str, None),
+	355: ('EncodedText', str, None),
+}
+
+def _encode_ConfirmationRequest(obj, fixm):
+	d = obj.__dict__
+	add = fixm.append
+	n = 1
+	if 'ConfirmReqID' in d:
+		add('859=' + str(d['ConfirmReqID']))
+		n += 1
+	if 'ConfirmType' in d:
+		add('773=' + str(d['ConfirmType']))
+		n += 1
+	if 'NoOrders' in d:
+		grp = d['NoOrders']
+		add('73=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoOrders(entry, fixm)
+		n += 1
+	if 'AllocID' in d:
+		add('70=' + str(d['AllocID']))
+		n += 1
+	if 'SecondaryAllocID' in d:
+		add('793=' + str(d['SecondaryAllocID']))
+		n += 1
+	if 'IndividualAllocID' in d:
+		add('467=' + str(d['IndividualAllocID']))
+		n += 1
+	if 'TransactTime' in d:
+		add('60=' + str(d['TransactTime']))
+		n += 1
+	if 'AllocAccount' in d:
+		add('79=' + str(d['AllocAccount']))
+		n += 1
+	if 'AllocAcctIDSource' in d:
+		add('661=' + str(d['AllocAcctIDSource']))
+		n += 1
+	if 'AllocAccountType' in d:
+		add('798=' + str(d['AllocAccountType']))
+		n += 1
+	if 'Text' in d:
+		add('58=' + str(d['Text']))
+		n += 1
+	if 'EncodedTextLen' in d:
+		add('354=' + str(d['EncodedTextLen']))
+		n += 1
+	if 'EncodedText' in d:
+		add('355=' + str(d['EncodedText']))
+		n += 1
+	if len(d) > n:
+		_make_mbody(obj, obj._context, fixm, _msg_ConfirmationRequest_names)
+	return fixm
+
+def _decode_ConfirmationRequest(obj, fields, index, context):
+	d = obj.__dict__
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _msg_ConfirmationRequest_tags.get(num)
+		if spec is None:
+			# not a field of this message, continue with generic decoder
+			body, index = _extract_body(fields, index, context, obj)
+			return index
+		name, pytype, decode_grp = spec
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	return index
+
+class ConfirmationRequest(FixObject):
+	_encode = staticmethod(_encode_ConfirmationRequest)
+	_decode = staticmethod(_decode_ConfirmationRequest)
+
+_msg_CrossOrderCancelReplaceRequest_names = frozenset(['OrderID', 'CrossID', 'OrigCrossID', 'CrossType', 'CrossPrioritization', 'NoSides', 'Symbol', 'SymbolSfx', 'SecurityID', 'SecurityIDSource', 'NoSecurityAltID', 'Product', 'CFICode', 'SecurityType', 'SecuritySubType', 'MaturityMonthYear', 'MaturityDate', 'CouponPaymentDate', 'IssueDate', 'RepoCollateralSecurityType', 'RepurchaseTerm', 'RepurchaseRate', 'Factor', 'CreditRating', 'InstrRegistry', 'CountryOfIssue', 'StateOrProvinceOfIssue', 'LocaleOfIssue', 'RedemptionDate', 'StrikePrice', 'StrikeCurrency', 'OptAttribute', 'ContractMultiplier', 'CouponRate', 'SecurityExchange', 'Issuer', 'EncodedIssuerLen', 'EncodedIssuer', 'SecurityDesc', 'EncodedSecurityDescLen', 'EncodedSecurityDesc', 'Pool', 'ContractSettlMonth', 'CPProgram', 'CPRegType', 'NoEvents', 'DatedDate', 'InterestAccrualDate', 'NoUnderlyings', 'NoLegs', 'SettlType', 'SettlDate', 'HandlInst', 'ExecInst', 'MinQty', 'MaxFloor', 'ExDestination', 'NoTradingSessions', 'ProcessCode', 'PrevClosePx', 'LocateReqd', 'TransactTime', 'NoStipulations', 'OrdType', 'PriceType', 'Price', 'StopPx', 'Spread', 'BenchmarkCurveCurrency', 'BenchmarkCurveName', 'BenchmarkCurvePoint', 'BenchmarkPrice', 'BenchmarkPriceType', 'BenchmarkSecurityID', 'BenchmarkSecurityIDSource', 'YieldType', 'Yield', 'YieldCalcDate', 'YieldRedemptionDate', 'YieldRedemptionPrice', 'YieldRedemptionPriceType', 'Currency', 'ComplianceID', 'IOIid', 'QuoteID', 'TimeInForce', 'EffectiveTime', 'ExpireDate', 'ExpireTime', 'GTBookingInst', 'MaxShow', 'PegOffsetValue', 'PegMoveType', 'PegOffsetType', 'PegLimitType', 'PegRoundDirection', 'PegScope', 'DiscretionInst', 'DiscretionOffsetValue', 'DiscretionMoveType', 'DiscretionOffsetType', 'DiscretionLimitType', 'DiscretionRoundDirection', 'DiscretionScope', 'TargetStrategy', 'TargetStrategyParameters', 'ParticipationRate', 'CancellationRights', 'MoneyLaunderingStatus', 'RegistID', 'Designation'])
+
+_msg_CrossOrderCancelReplaceRequest_tags = {
+	37: ('OrderID', str, None),
+	548: ('CrossID', str, None),
+	551: ('OrigCrossID', str, None),
+	549: ('CrossType', int, None),
+	550: ('CrossPrioritization', int, None),
+	552: ('NoSides', int, _decode_grp_NoSides),
+	55: ('Symbol', str, None),
+	65: ('SymbolSfx', str, None),
+	48: ('SecurityID', str, None),
+	22: ('SecurityIDSource', str, None),
+	454: ('NoSecurityAltID', int, _decode_grp_NoSecurityAltID),
+	460: ('Product', int, None),
+	461: ('CFICode', str, None),
+	167: ('SecurityType', str, None),
+	762: ('SecuritySubType', str, None),
+	200: ('MaturityMonthYear', str, None),
+	541: ('MaturityDate', str, None),
+	224: ('CouponPaymentDate', str, None),
+	225: ('IssueDate', str, None),
+	239: ('RepoCollateralSecurityType', int, None),
+	226: ('RepurchaseTerm', int, None),
+	227: ('RepurchaseRate', float, None),
+	228: ('Factor', float, None),
+	255: ('CreditRating', str, None),
+	543: ('InstrRegistry', str, None),
+	470: ('CountryOfIssue', str, None),
+	471: ('StateOrProvinceOfIssue', str, None),
+	472: ('LocaleOfIssue', str, None),
+	240: ('RedemptionDate', str, None),
+	202: ('StrikePrice', float, None),
+	947: ('StrikeCurrency', str, None),
+	206: ('OptAttribute', str, None),
+	231: ('ContractMultiplier', float, None),
+	223: ('CouponRate', float, None),
+	207: ('SecurityExchange', str, None),
+	106: ('Issuer', str, None),
+	348: ('EncodedIssuerLen', str, None),
+	349: ('EncodedIssuer', str, None),
+	107: ('SecurityDesc', str, None),
+	350: ('EncodedSecurityDescLen', str, None),
+	351: ('EncodedSecurityDesc', str, None),
+	691: ('Pool', str, None),
+	667: ('ContractSettlMonth', str, None),
+	875: ('CPProgram', int, None),
+	876: ('CPRegType', str, None),
+	864: ('NoEvents', int, _decode_grp_NoEvents),
+	873: ('DatedDate', str, None),
+	874: ('InterestAccrualDate', str, None),
+	711: ('NoUnderlyings', int, _decode_grp_NoUnderlyings),
+	555: ('NoLegs', int, _decode_grp_NoLegs),
+	63: ('SettlType', str, None),
+	64: ('SettlDate', str, None),
+	21: ('HandlInst', str, None),
+	18: ('ExecInst', str, None),
+	110: ('MinQty', float, None),
+	111: ('MaxFloor', float, None),
+	100: ('ExDestination', str, None),
+	386: ('NoTradingSessions', int, _decode_grp_NoTradingSessions),
+	81: ('ProcessCode', str, None),
+	140: ('PrevClosePx', float, None),
+	114: ('LocateReqd', str, None),
+	60: ('TransactTime', str, None),
+	232: ('NoStipulations', int, _decode_grp_NoStipulations),
+	40: ('OrdType', str, None),
+	423: ('PriceType', int, None),
+	44: ('Price', float, None),
+	99: ('StopPx', float, None),
+	218: ('Spread', float, None),
+	220: ('BenchmarkCurveCurrency', str, None),
+	221: ('BenchmarkCurveName', str, None),
+	222: ('BenchmarkCurvePoint', str, None),
+	662: ('BenchmarkPrice', float, None),
+	663: ('BenchmarkPriceType', int, None),
+	699: ('BenchmarkSecurityID', str, None),
+	761: ('BenchmarkSecurityIDSource', str, None),
+	235: ('YieldType', str, None),
+	236: ('Yield', float, None),
+	701: ('YieldCalcDate', str, None),
+	696: ('YieldRedemptionDate', str, None),
+	697: ('YieldRedemptionPrice', float, None),
+	698: ('YieldRedemptionPriceType', int, None),
+	15: ('Currency', str, None),
+	376: ('ComplianceID', str, None),
+	23: ('IOIid', str, None),
+	117: ('QuoteID', str, None),
+	59: ('TimeInForce', str, None),
+	168: ('EffectiveTime', str, None),
+	432: ('ExpireDate', str, None),
+	126: ('ExpireTime', str, None),
+	427: ('GTBookingInst', int, None),
+	210: ('MaxShow', float, None),
+	211: ('PegOffsetValue', float, None),
+	835: ('PegMoveType', int, None),
+	836: ('PegOffsetType', int, None),
+	837: ('PegLimitType', int, None),
+	838: ('PegRoundDirection', int, None),
+	840: ('PegScope', int, None),
+	388: ('DiscretionInst', str, None),
+	389: ('DiscretionOffsetValue', float, None),
+	841: ('DiscretionMoveType', int, None),
+	842: ('DiscretionOffsetType', int, None),
+	843: ('DiscretionLimitType', int, None),
+	844: ('DiscretionRoundDirection', int, None),
+	846: ('DiscretionScope', int, None),
+	847: ('TargetStrategy', int, None),
+	848: ('TargetStrategyParameters', str, None),
+	849: ('ParticipationRate', float, None),
+	480: ('CancellationRights', str, None),
+	481: ('MoneyLaunderingStatus', str, None),
+	513: ('RegistID', str, None),
+	494: ('Designation', str, None),
+}
+
+def _encode_CrossOrderCancelReplaceRequest(obj, fixm):
+	d = obj.__dict__
+	add = fixm.append
+	n = 1
+	if 'OrderID' in d:
+		add('37=' + str(d['OrderID']))
+		n += 1
+	if 'CrossID' in d:
+		add('548=' + str(d['CrossID']))
+		n += 1
+	if 'OrigCrossID' in d:
+		add('551=' + str(d['OrigCrossID']))
+		n += 1
+	if 'CrossType' in d:
+		add('549=' + str(d['CrossType']))
+		n += 1
+	if 'CrossPrioritization' in d:
+		add('550=' + str(d['CrossPrioritization']))
+		n += 1
+	if 'NoSides' in d:
+		grp = d['NoSides']
+		add('552=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoSides(entry, fixm)
+		n += 1
+	if 'Symbol' in d:
+		add('55=' + str(d['Symbol']))
+		n += 1
+	if 'SymbolSfx' in d:
+		add('65=' + str(d['SymbolSfx']))
+		n += 1
+	if 'SecurityID' in d:
+		add('48=' + str(d['SecurityID']))
+		n += 1
+	if 'SecurityIDSource' in d:
+		add('22=' + str(d['SecurityIDSource']))
+		n += 1
+	if 'NoSecurityAltID' in d:
+		grp = d['NoSecurityAltID']
+		add('454=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoSecurityAltID(entry, fixm)
+		n += 1
+	if 'Product' in d:
+		add('460=' + str(d['Product']))
+		n += 1
+	if 'CFICode' in d:
+		add('461=' + str(d['CFICode']))
+		n += 1
+	if 'SecurityType' in d:
+		add('167=' + str(d['SecurityType']))
+		n += 1
+	if 'SecuritySubType' in d:
+		add('762=' + str(d['SecuritySubType']))
+		n += 1
+	if 'MaturityMonthYear' in d:
+		add('200=' + str(d['MaturityMonthYear']))
+		n += 1
+	if 'MaturityDate' in d:
+		add('541=' + str(d['MaturityDate']))
+		n += 1
+	if 'CouponPaymentDate' in d:
+		add('224=' + str(d['CouponPaymentDate']))
+		n += 1
+	if 'IssueDate' in d:
+		add('225=' + str(d['IssueDate']))
+		n += 1
+	if 'RepoCollateralSecurityType' in d:
+		add('239=' + str(d['RepoCollateralSecurityType']))
+		n += 1
+	if 'RepurchaseTerm' in d:
+		add('226=' + str(d['RepurchaseTerm']))
+		n += 1
+	if 'RepurchaseRate' in d:
+		add('227=' + str(d['RepurchaseRate']))
+		n += 1
+	if 'Factor' in d:
+		add('228=' + str(d['Factor']))
+		n += 1
+	if 'CreditRating' in d:
+		add('255=' + str(d['CreditRating']))
+		n += 1
+	if 'InstrRegistry' in d:
+		add('543=' + str(d['InstrRegistry']))
+		n += 1
+	if 'CountryOfIssue' in d:
+		add('470=' + str(d['CountryOfIssue']))
+		n += 1
+	if 'StateOrProvinceOfIssue' in d:
+		add('471=' + str(d['StateOrProvinceOfIssue']))
+		n += 1
+	if 'LocaleOfIssue' in d:
+		add('472=' + str(d['LocaleOfIssue']))
+		n += 1
+	if 'RedemptionDate' in d:
+		add('240=' + str(d['RedemptionDate']))
+		n += 1
+	if 'StrikePrice' in d:
+		add('202=' + str(d['StrikePrice']))
+		n += 1
+	if 'StrikeCurrency' in d:
+		add('947=' + str(d['StrikeCurrency']))
+		n += 1
+	if 'OptAttribute' in d:
+		add('206=' + str(d['OptAttribute']))
+		n += 1
+	if 'ContractMultiplier' in d:
+		add('231=' + str(d['ContractMultiplier']))
+		n += 1
+	if 'CouponRate' in d:
+		add('223=' + str(d['CouponRate']))
+		n += 1
+	if 'SecurityExchange' in d:
+		add('207=' + str(d['SecurityExchange']))
+		n += 1
+	if 'Issuer' in d:
+		add('106=' + str(d['Issuer']))
+		n += 1
+	if 'EncodedIssuerLen' in d:
+		add('348=' + str(d['EncodedIssuerLen']))
+		n += 1
+	if 'EncodedIssuer' in d:
+		add('349=' + str(d['EncodedIssuer']))
+		n += 1
+	if 'SecurityDesc' in d:
+		add('107=' + str(d['SecurityDesc']))
+		n += 1
+	if 'EncodedSecurityDescLen' in d:
+		add('350=' + str(d['EncodedSecurityDescLen']))
+		n += 1
+	if 'EncodedSecurityDesc' in d:
+		add('351=' + str(d['EncodedSecurityDesc']))
+		n += 1
+	if 'Pool' in d:
+		add('691=' + str(d['Pool']))
+		n += 1
+	if 'ContractSettlMonth' in d:
+		add('667=' + str(d['ContractSettlMonth']))
+		n += 1
+	if 'CPProgram' in d:
+		add('875=' + str(d['CPProgram']))
+		n += 1
+	if 'CPRegType' in d:
+		add('876=' + str(d['CPRegType']))
+		n += 1
+	if 'NoEvents' in d:
+		grp = d['NoEvents']
+		add('864=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoEvents(entry, fixm)
+		n += 1
+	if 'DatedDate' in d:
+		add('873=' + str(d['DatedDate']))
+		n += 1
+	if 'InterestAccrualDate' in d:
+		add('874=' + str(d['InterestAccrualDate']))
+		n += 1
+	if 'NoUnderlyings' in d:
+		grp = d['NoUnderlyings']
+		add('711=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoUnderlyings(entry, fixm)
+		n += 1
+	if 'NoLegs' in d:
+		grp = d['NoLegs']
+		add('555=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoLegs(entry, fixm)
+		n += 1
+	if 'SettlType' in d:
+		add('63=' + str(d['SettlType']))
+		n += 1
+	if 'SettlDate' in d:
+		add('64=' + str(d['SettlDate']))
+		n += 1
+	if 'HandlInst' in d:
+		add('21=' + str(d['HandlInst']))
+		n += 1
+	if 'ExecInst' in d:
+		add('18=' + str(d['ExecInst']))
+		n += 1
+	if 'MinQty' in d:
+		add('110=' + str(d['MinQty']))
+		n += 1
+	if 'MaxFloor' in d:
+		add('111=' + str(d['MaxFloor']))
+		n += 1
+	if 'ExDestination' in d:
+		add('100=' + str(d['ExDestination']))
+		n += 1
+	if 'NoTradingSessions' in d:
+		grp = d['NoTradingSessions']
+		add('386=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoTradingSessions(entry, fixm)
+		n += 1
+	if 'ProcessCode' in d:
+		add('81=' + str(d['ProcessCode']))
+		n += 1
+	if 'PrevClosePx' in d:
+		add('140=' + str(d['PrevClosePx']))
+		n += 1
+	if 'LocateReqd' in d:
+		add('114=' + str(d['LocateReqd']))
+		n += 1
+	if 'TransactTime' in d:
+		add('60=' + str(d['TransactTime']))
+		n += 1
+	if 'NoStipulations' in d:
+		grp = d['NoStipulations']
+		add('232=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoStipulations(entry, fixm)
+		n += 1
+	if 'OrdType' in d:
+		add('40=' + str(d['OrdType']))
+		n += 1
+	if 'PriceType' in d:
+		add('423=' + str(d['PriceType']))
+		n += 1
+	if 'Price' in d:
+		add('44=' + str(d['Price']))
+		n += 1
+	if 'StopPx' in d:
+		add('99=' + str(d['StopPx']))
+		n += 1
+	if 'Spread' in d:
+		add('218=' + str(d['Spread']))
+		n += 1
+	if 'BenchmarkCurveCurrency' in d:
+		add('220=' + str(d['BenchmarkCurveCurrency']))
+		n += 1
+	if 'BenchmarkCurveName' in d:
+		add('221=' + str(d['BenchmarkCurveName']))
+		n += 1
+	if 'BenchmarkCurvePoint' in d:
+		add('222=' + str(d['BenchmarkCurvePoint']))
+		n += 1
+	if 'BenchmarkPrice' in d:
+		add('662=' + str(d['BenchmarkPrice']))
+		n += 1
+	if 'BenchmarkPriceType' in d:
+		add('663=' + str(d['BenchmarkPriceType']))
+		n += 1
+	if 'BenchmarkSecurityID' in d:
+		add('699=' + str(d['BenchmarkSecurityID']))
+		n += 1
+	if 'BenchmarkSecurityIDSource' in d:
+		add('761=' + str(d['BenchmarkSecurityIDSource']))
+		n += 1
+	if 'YieldType' in d:
+		add('235=' + str(d['YieldType']))
+		n += 1
+	if 'Yield' in d:
+		add('236=' + str(d['Yield']))
+		n += 1
+	if 'YieldCalcDate' in d:
+		add('701=' + str(d['YieldCalcDate']))
+		n += 1
+	if 'YieldRedemptionDate' in d:
+		add('696=' + str(d['YieldRedemptionDate']))
+		n += 1
+	if 'YieldRedemptionPrice' in d:
+		add('697=' + str(d['YieldRedemptionPrice']))
+		n += 1
+	if 'YieldRedemptionPriceType' in d:
+		add('698=' + str(d['YieldRedemptionPriceType']))
+		n += 1
+	if 'Currency' in d:
+		add('15=' + str(d['Currency']))
+		n += 1
+	if 'ComplianceID' in d:
+		add('376=' + str(d['ComplianceID']))
+		n += 1
+	if 'IOIid' in d:
+		add('23=' + str(d['IOIid']))
+		n += 1
+	if 'QuoteID' in d:
+		add('117=' + str(d['QuoteID']))
+		n += 1
+	if 'TimeInForce' in d:
+		add('59=' + str(d['TimeInForce']))
+		n += 1
+	if 'EffectiveTime' in d:
+		add('168=' + str(d['EffectiveTime']))
+		n += 1
+	if 'ExpireDate' in d:
+		add('432=' + str(d['ExpireDate']))
+		n += 1
+	if 'ExpireTime' in d:
+		add('126=' + str(d['ExpireTime']))
+		n += 1
+	if 'GTBookingInst' in d:
+		add('427=' + str(d['GTBookingInst']))
+		n += 1
+	if 'MaxShow' in d:
+		add('210=' + str(d['MaxShow']))
+		n += 1
+	if 'PegOffsetValue' in d:
+		add('211=' + str(d['PegOffsetValue']))
+		n += 1
+	if 'PegMoveType' in d:
+		add('835=' + str(d['PegMoveType']))
+		n += 1
+	if 'PegOffsetType' in d:
+		add('836=' + str(d['PegOffsetType']))
+		n += 1
+	if 'PegLimitType' in d:
+		add('837=' + str(d['PegLimitType']))
+		n += 1
+	if 'PegRoundDirection' in d:
+		add('838=' + str(d['PegRoundDirection']))
+		n += 1
+	if 'PegScope' in d:
+		add('840=' + str(d['PegScope']))
+		n += 1
+	if 'DiscretionInst' in d:
+		add('388=' + str(d['DiscretionInst']))
+		n += 1
+	if 'DiscretionOffsetValue' in d:
+		add('389=' + str(d['DiscretionOffsetValue']))
+		n += 1
+	if 'DiscretionMoveType' in d:
+		add('841=' + str(d['DiscretionMoveType']))
+		n += 1
+	if 'DiscretionOffsetType' in d:
+		add('842=' + str(d['DiscretionOffsetType']))
+		n += 1
+	if 'DiscretionLimitType' in d:
+		add('843=' + str(d['DiscretionLimitType']))
+		n += 1
+	if 'DiscretionRoundDirection' in d:
+		add('844=' + str(d['DiscretionRoundDirection']))
+		n += 1
+	if 'DiscretionScope' in d:
+		add('846=' + str(d['DiscretionScope']))
+		n += 1
+	if 'TargetStrategy' in d:
+		add('847=' + str(d['TargetStrategy']))
+		n += 1
+	if 'TargetStrategyParameters' in d:
+		add('848=' + str(d['TargetStrategyParameters']))
+		n += 1
+	if 'ParticipationRate' in d:
+		add('849=' + str(d['ParticipationRate']))
+		n += 1
+	if 'CancellationRights' in d:
+		add('480=' + str(d['CancellationRights']))
+		n += 1
+	if 'MoneyLaunderingStatus' in d:
+		add('481=' + str(d['MoneyLaunderingStatus']))
+		n += 1
+	if 'RegistID' in d:
+		add('513=' + str(d['RegistID']))
+		n += 1
+	if 'Designation' in d:
+		add('494=' + str(d['Designation']))
+		n += 1
+	if len(d) > n:
+		_make_mbody(obj, obj._context, fixm, _msg_CrossOrderCancelReplaceRequest_names)
+	return fixm
+
+def _decode_CrossOrderCancelReplaceRequest(obj, fields, index, context):
+	d = obj.__dict__
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _msg_CrossOrderCancelReplaceRequest_tags.get(num)
+		if spec is None:
+			# not a field of this message, continue with generic decoder
+			body, index = _extract_body(fields, index, context, obj)
+			return index
+		name, pytype, decode_grp = spec
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	return index
+
+class CrossOrderCancelReplaceRequest(FixObject):
+	_encode = staticmethod(_encode_CrossOrderCancelReplaceRequest)
+	_decode = staticmethod(_decode_CrossOrderCancelReplaceRequest)
+
+_msg_CrossOrderCancelRequest_names = frozenset(['OrderID', 'CrossID', 'OrigCrossID', 'CrossType', 'CrossPrioritization', 'NoSides', 'Symbol', 'SymbolSfx', 'SecurityID', 'SecurityIDSource', 'NoSecurityAltID', 'Product', 'CFICode', 'SecurityType', 'SecuritySubType', 'MaturityMonthYear', 'MaturityDate', 'CouponPaymentDate', 'IssueDate', 'RepoCollateralSecurityType', 'RepurchaseTerm', 'RepurchaseRate', 'Factor', 'CreditRating', 'InstrRegistry', 'CountryOfIssue', 'StateOrProvinceOfIssue', 'LocaleOfIssue', 'RedemptionDate', 'StrikePrice', 'StrikeCurrency', 'OptAttribute', 'ContractMultiplier', 'CouponRate', 'SecurityExchange', 'Issuer', 'EncodedIssuerLen', 'EncodedIssuer', 'SecurityDesc', 'EncodedSecurityDescLen', 'EncodedSecurityDesc', 'Pool', 'ContractSettlMonth', 'CPProgram', 'CPRegType', 'NoEvents', 'DatedDate', 'InterestAccrualDate', 'NoUnderlyings', 'NoLegs', 'TransactTime'])
+
+_msg_CrossOrderCancelRequest_tags = {
+	37: ('OrderID', str, None),
+	548: ('CrossID', str, None),
+	551: ('OrigCrossID', str, None),
+	549: ('CrossType', int, None),
+	550: ('CrossPrioritization', int, None),
+	552: ('NoSides', int, _decode_grp_NoSides),
+	55: ('Symbol', str, None),
+	65: ('SymbolSfx', str, None),
+	48: ('SecurityID', str, None),
+	22: ('SecurityIDSource', str, None),
+	454: ('NoSecurityAltID', int, _decode_grp_NoSecurityAltID),
+	460: ('Product', int, None),
+	461: ('CFICode', str, None),
+	167: ('SecurityType', str, None),
+	762: ('SecuritySubType', str, None),
+	200: ('MaturityMonthYear', str, None),
+	541: ('MaturityDate', str, None),
+	224: ('CouponPaymentDate', str, None),
+	225: ('IssueDate', str, None),
+	239: ('RepoCollateralSecurityType', int, None),
+	226: ('RepurchaseTerm', int, None),
+	227: ('RepurchaseRate', float, None),
+	228: ('Factor', float, None),
+	255: ('CreditRating', str, None),
+	543: ('InstrRegistry', str, None),
+	470: ('CountryOfIssue', str, None),
+	471: ('StateOrProvinceOfIssue', str, None),
+	472: ('LocaleOfIssue', str, None),
+	240: ('RedemptionDate', str, None),
+	202: ('StrikePrice', float, None),
+	947: ('StrikeCurrency', str, None),
+	206: ('OptAttribute', str, None),
+	231: ('ContractMultiplier', float, None),
+	223: ('CouponRate', float, None),
+	207: ('SecurityExchange', str, None),
+	106: ('Issuer', str, None),
+	348: ('EncodedIssuerLen', str, None),
+	349: ('EncodedIssuer', str, None),
+	107: ('SecurityDesc', str, None),
+	350: ('EncodedSecurityDescLen', str, None),
+	351: ('EncodedSecurityDesc', str, None),
+	691: ('Pool', str, None),
+	667: ('ContractSettlMonth', str, None),
+	875: ('CPProgram', int, None),
+	876: ('CPRegType', str, None),
+	864: ('NoEvents', int, _decode_grp_NoEvents),
+	873: ('DatedDate', str, None),
+	874: ('InterestAccrualDate', str, None),
+	711: ('NoUnderlyings', int, _decode_grp_NoUnderlyings),
+	555: ('NoLegs', int, _decode_grp_NoLegs),
+	60: ('TransactTime', str, None),
+}
+
+def _encode_CrossOrderCancelRequest(obj, fixm):
+	d = obj.__dict__
+	add = fixm.append
+	n = 1
+	if 'OrderID' in d:
+		add('37=' + str(d['OrderID']))
+		n += 1
+	if 'CrossID' in d:
+		add('548=' + str(d['CrossID']))
+		n += 1
+	if 'OrigCrossID' in d:
+		add('551=' + str(d['OrigCrossID']))
+		n += 1
+	if 'CrossType' in d:
+		add('549=' + str(d['CrossType']))
+		n += 1
+	if 'CrossPrioritization' in d:
+		add('550=' + str(d['CrossPrioritization']))
+		n += 1
+	if 'NoSides' in d:
+		grp = d['NoSides']
+		add('552=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoSides(entry, fixm)
+		n += 1
+	if 'Symbol' in d:
+		add('55=' + str(d['Symbol']))
+		n += 1
+	if 'SymbolSfx' in d:
+		add('65=' + str(d['SymbolSfx']))
+		n += 1
+	if 'SecurityID' in d:
+		add('48=' + str(d['SecurityID']))
+		n += 1
+	if 'SecurityIDSource' in d:
+		add('22=' + str(d['SecurityIDSource']))
+		n += 1
+	if 'NoSecurityAltID' in d:
+		grp = d['NoSecurityAltID']
+		add('454=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoSecurityAltID(entry, fixm)
+		n += 1
+	if 'Product' in d:
+		add('460=' + str(d['Product']))
+		n += 1
+	if 'CFICode' in d:
+		add('461=' + str(d['CFICode']))
+		n += 1
+	if 'SecurityType' in d:
+		add('167=' + str(d['SecurityType']))
+		n += 1
+	if 'SecuritySubType' in d:
+		add('762=' + str(d['SecuritySubType']))
+		n += 1
+	if 'MaturityMonthYear' in d:
+		add('200=' + str(d['MaturityMonthYear']))
+		n += 1
+	if 'MaturityDate' in d:
+		add('541=' + str(d['MaturityDate']))
+		n += 1
+	if 'CouponPaymentDate' in d:
+		add('224=' + str(d['CouponPaymentDate']))
+		n += 1
+	if 'IssueDate' in d:
+		add('225=' + str(d['IssueDate']))
+		n += 1
+	if 'RepoCollateralSecurityType' in d:
+		add('239=' + str(d['RepoCollateralSecurityType']))
+		n += 1
+	if 'RepurchaseTerm' in d:
+		add('226=' + str(d['RepurchaseTerm']))
+		n += 1
+	if 'RepurchaseRate' in d:
+		add('227=' + str(d['RepurchaseRate']))
+		n += 1
+	if 'Factor' in d:
+		add('228=' + str(d['Factor']))
+		n += 1
+	if 'CreditRating' in d:
+		add('255=' + str(d['CreditRating']))
+		n += 1
+	if 'InstrRegistry' in d:
+		add('543=' + str(d['InstrRegistry']))
+		n += 1
+	if 'CountryOfIssue' in d:
+		add('470=' + str(d['CountryOfIssue']))
+		n += 1
+	if 'StateOrProvinceOfIssue' in d:
+		add('471=' + str(d['StateOrProvinceOfIssue']))
+		n += 1
+	if 'LocaleOfIssue' in d:
+		add('472=' + str(d['LocaleOfIssue']))
+		n += 1
+	if 'RedemptionDate' in d:
+		add('240=' + str(d['RedemptionDate']))
+		n += 1
+	if 'StrikePrice' in d:
+		add('202=' + str(d['StrikePrice']))
+		n += 1
+	if 'StrikeCurrency' in d:
+		add('947=' + str(d['StrikeCurrency']))
+		n += 1
+	if 'OptAttribute' in d:
+		add('206=' + str(d['OptAttribute']))
+		n += 1
+	if 'ContractMultiplier' in d:
+		add('231=' + str(d['ContractMultiplier']))
+		n += 1
+	if 'CouponRate' in d:
+		add('223=' + str(d['CouponRate']))
+		n += 1
+	if 'SecurityExchange' in d:
+		add('207=' + str(d['SecurityExchange']))
+		n += 1
+	if 'Issuer' in d:
+		add('106=' + str(d['Issuer']))
+		n += 1
+	if 'EncodedIssuerLen' in d:
+		add('348=' + str(d['EncodedIssuerLen']))
+		n += 1
+	if 'EncodedIssuer' in d:
+		add('349=' + str(d['EncodedIssuer']))
+		n += 1
+	if 'SecurityDesc' in d:
+		add('107=' + str(d['SecurityDesc']))
+		n += 1
+	if 'EncodedSecurityDescLen' in d:
+		add('350=' + str(d['EncodedSecurityDescLen']))
+		n += 1
+	if 'EncodedSecurityDesc' in d:
+		add('351=' + str(d['EncodedSecurityDesc']))
+		n += 1
+	if 'Pool' in d:
+		add('691=' + str(d['Pool']))
+		n += 1
+	if 'ContractSettlMonth' in d:
+		add('667=' + str(d['ContractSettlMonth']))
+		n += 1
+	if 'CPProgram' in d:
+		add('875=' + str(d['CPProgram']))
+		n += 1
+	if 'CPRegType' in d:
+		add('876=' + str(d['CPRegType']))
+		n += 1
+	if 'NoEvents' in d:
+		grp = d['NoEvents']
+		add('864=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoEvents(entry, fixm)
+		n += 1
+	if 'DatedDate' in d:
+		add('873=' + str(d['DatedDate']))
+		n += 1
+	if 'InterestAccrualDate' in d:
+		add('874=' + str(d['InterestAccrualDate']))
+		n += 1
+	if 'NoUnderlyings' in d:
+		grp = d['NoUnderlyings']
+		add('711=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoUnderlyings(entry, fixm)
+		n += 1
+	if 'NoLegs' in d:
+		grp = d['NoLegs']
+		add('555=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoLegs(entry, fixm)
+		n += 1
+	if 'TransactTime' in d:
+		add('60=' + str(d['TransactTime']))
+		n += 1
+	if len(d) > n:
+		_make_mbody(obj, obj._context, fixm, _msg_CrossOrderCancelRequest_names)
+	return fixm
+
+def _decode_CrossOrderCancelRequest(obj, fields, index, context):
+	d = obj.__dict__
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _msg_CrossOrderCancelRequest_tags.get(num)
+		if spec is None:
+			# not a field of this message, continue with generic decoder
+			body, index = _extract_body(fields, index, context, obj)
+			return index
+		name, pytype, decode_grp = spec
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	return index
+
+class CrossOrderCancelRequest(FixObject):
+	_encode = staticmethod(_encode_CrossOrderCancelRequest)
+	_decode = staticmethod(_decode_CrossOrderCancelRequest)
+
+_msg_DerivativeSecurityList_names = frozenset(['SecurityReqID', 'SecurityResponseID', 'SecurityRequestResult', 'UnderlyingSymbol', 'UnderlyingSymbolSfx', 'UnderlyingSecurityID', 'UnderlyingSecurityIDSource', 'NoUnderlyingSecurityAltID', 'UnderlyingProduct', 'UnderlyingCFICode', 'UnderlyingSecurityType', 'UnderlyingSecuritySubType', 'UnderlyingMaturityMonthYear', 'UnderlyingMaturityDate', 'UnderlyingCouponPaymentDate', 'UnderlyingIssueDate', 'UnderlyingRepoCollateralSecurityType', 'UnderlyingRepurchaseTerm', 'UnderlyingRepurchaseRate', 'UnderlyingFactor', 'UnderlyingCreditRating', 'UnderlyingInstrRegistry', 'UnderlyingCountryOfIssue', 'UnderlyingStateOrProvinceOfIssue', 'UnderlyingLocaleOfIssue', 'UnderlyingRedemptionDate', 'UnderlyingStrikePrice', 'UnderlyingStrikeCurrency', 'UnderlyingOptAttribute', 'UnderlyingContractMultiplier', 'UnderlyingCouponRate', 'UnderlyingSecurityExchange', 'UnderlyingIssuer', 'EncodedUnderlyingIssuerLen', 'EncodedUnderlyingIssuer', 'UnderlyingSecurityDesc', 'EncodedUnderlyingSecurityDescLen', 'EncodedUnderlyingSecurityDesc', 'UnderlyingCPProgram', 'UnderlyingCPRegType', 'UnderlyingCurrency', 'UnderlyingQty', 'UnderlyingPx', 'UnderlyingDirtyPrice', 'UnderlyingEndPrice', 'UnderlyingStartValue', 'UnderlyingCurrentValue', 'UnderlyingEndValue', 'NoUnderlyingStips', 'TotNoRelatedSym', 'LastFragment', 'NoRelatedSym'])
+
+_msg_DerivativeSecurityList_tags = {
+	320: ('SecurityReqID', str, None),
+	322: ('SecurityResponseID', str, None),
+	560: ('SecurityRequestResult', int, None),
+	311: ('UnderlyingSymbol', str, None),
+	312: ('UnderlyingSymbolSfx', str, None),
+	309: ('UnderlyingSecurityID', str, None),
+	305: ('UnderlyingSecurityIDSource', str, None),
+	457: ('NoUnderlyingSecurityAltID', int, _decode_grp_NoUnderlyingSecurityAltID),
+	462: ('UnderlyingProduct', int, None),
+	463: ('UnderlyingCFICode', str, None),
+	310: ('UnderlyingSecurityType', str, None),
+	763: ('UnderlyingSecuritySubType', str, None),
+	313: ('UnderlyingMaturityMonthYear', str, None),
+	542: ('UnderlyingMaturityDate', str, None),
+	241: ('UnderlyingCouponPaymentDate', str, None),
+	242: ('UnderlyingIssueDate', str, None),
+	243: ('UnderlyingRepoCollateralSecurityType', int, None),
+	244: ('UnderlyingRepurchaseTerm', int, None),
+	245: ('UnderlyingRepurchaseRate', float, None),
+	246: ('UnderlyingFactor', float, None),
+	256: ('UnderlyingCreditRating', str, None),
+	595: ('UnderlyingInstrRegistry', str, None),
+	592: ('UnderlyingCountryOfIssue', str, None),
+	593: ('UnderlyingStateOrProvinceOfIssue', str, None),
+	594: ('UnderlyingLocaleOfIssue', str, None),
+	247: ('UnderlyingRedemptionDate', str, None),
+	316: ('UnderlyingStrikePrice', float, None),
+	941: ('UnderlyingStrikeCurrency', str, None),
+	317: ('UnderlyingOptAttribute', str, None),
+	436: ('UnderlyingContractMultiplier', float, None),
+	435: ('UnderlyingCouponRate', float, None),
+	308: ('UnderlyingSecurityExchange', str, None),
+	306: ('UnderlyingIssuer', str, None),
+	362: ('EncodedUnderlyingIssuerLen', str, None),
+	363: ('EncodedUnderlyingIssuer', str, None),
+	307: ('UnderlyingSecurityDesc', str, None),
+	364: ('EncodedUnderlyingSecurityDescLen', str, None),
+	365: ('EncodedUnderlyingSecurityDesc', str, None),
+	877: ('UnderlyingCPProgram', str, None),
+	878: ('UnderlyingCPRegType', str, None),
+	318: ('UnderlyingCurrency', str, None),
+	879: ('UnderlyingQty', float, None),
+	810: ('UnderlyingPx', float, None),
+	882: ('UnderlyingDirtyPrice', float, None),
+	883: ('UnderlyingEndPrice', float, None),
+	884: ('UnderlyingStartValue', float, None),
+	885: ('UnderlyingCurrentValue', float, None),
+	886: ('UnderlyingEndValue', float, None),
+	887: ('NoUnderlyingStips', int, _decode_grp_NoUnderlyingStips),
+	393: ('TotNoRelatedSym', int, None),
+	893: ('LastFragment', str, None),
+	146: ('NoRelatedSym', int, _decode_grp_NoRelatedSym),
+}
+
+def _encode_DerivativeSecurityList(obj, fixm):
+	d = obj.__dict__
+	add = fixm.append
+	n = 1
+	if 'SecurityReqID' in d:
+		add('320=' + str(d['SecurityReqID']))
+		n += 1
+	if 'SecurityResponseID' in d:
+		add('322=' + str(d['SecurityResponseID']))
+		n += 1
+	if 'SecurityRequestResult' in d:
+		add('560=' + str(d['SecurityRequestResult']))
+		n += 1
+	if 'UnderlyingSymbol' in d:
+		add('311=' + str(d['UnderlyingSymbol']))
+		n += 1
+	if 'UnderlyingSymbolSfx' in d:
+		add('312=' + str(d['UnderlyingSymbolSfx']))
+		n += 1
+	if 'UnderlyingSecurityID' in d:
+		add('309=' + str(d['UnderlyingSecurityID']))
+		n += 1
+	if 'UnderlyingSecurityIDSource' in d:
+		add('305=' + str(d['UnderlyingSecurityIDSource']))
+		n += 1
+	if 'NoUnderlyingSecurityAltID' in d:
+		grp = d['NoUnderlyingSecurityAltID']
+		add('457=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoUnderlyingSecurityAltID(entry, fixm)
+		n += 1
+	if 'UnderlyingProduct' in d:
+		add('462=' + str(d['UnderlyingProduct']))
+		n += 1
+	if 'UnderlyingCFICode' in d:
+		add('463=' + str(d['UnderlyingCFICode']))
+		n += 1
+	if 'UnderlyingSecurityType' in d:
+		add('310=' + str(d['UnderlyingSecurityType']))
+		n += 1
+	if 'UnderlyingSecuritySubType' in d:
+		add('763=' + str(d['UnderlyingSecuritySubType']))
+		n += 1
+	if 'UnderlyingMaturityMonthYear' in d:
+		add('313=' + str(d['UnderlyingMaturityMonthYear']))
+		n += 1
+	if 'UnderlyingMaturityDate' in d:
+		add('542=' + str(d['UnderlyingMaturityDate']))
+		n += 1
+	if 'UnderlyingCouponPaymentDate' in d:
+		add('241=' + str(d['UnderlyingCouponPaymentDate']))
+		n += 1
+	if 'UnderlyingIssueDate' in d:
+		add('242=' + str(d['UnderlyingIssueDate']))
+		n += 1
+	if 'UnderlyingRepoCollateralSecurityType' in d:
+		add('243=' + str(d['UnderlyingRepoCollateralSecurityType']))
+		n += 1
+	if 'UnderlyingRepurchaseTerm' in d:
+		add('244=' + str(d['UnderlyingRepurchaseTerm']))
+		n += 1
+	if 'UnderlyingRepurchaseRate' in d:
+		add('245=' + str(d['UnderlyingRepurchaseRate']))
+		n += 1
+	if 'UnderlyingFactor' in d:
+		add('246=' + str(d['UnderlyingFactor']))
+		n += 1
+	if 'UnderlyingCreditRating' in d:
+		add('256=' + str(d['UnderlyingCreditRating']))
+		n += 1
+	if 'UnderlyingInstrRegistry' in d:
+		add('595=' + str(d['UnderlyingInstrRegistry']))
+		n += 1
+	if 'UnderlyingCountryOfIssue' in d:
+		add('592=' + str(d['UnderlyingCountryOfIssue']))
+		n += 1
+	if 'UnderlyingStateOrProvinceOfIssue' in d:
+		add('593=' + str(d['UnderlyingStateOrProvinceOfIssue']))
+		n += 1
+	if 'UnderlyingLocaleOfIssue' in d:
+		add('594=' + str(d['UnderlyingLocaleOfIssue']))
+		n += 1
+	if 'UnderlyingRedemptionDate' in d:
+		add('247=' + str(d['UnderlyingRedemptionDate']))
+		n += 1
+	if 'UnderlyingStrikePrice' in d:
+		add('316=' + str(d['UnderlyingStrikePrice']))
+		n += 1
+	if 'UnderlyingStrikeCurrency' in d:
+		add('941=' + str(d['UnderlyingStrikeCurrency']))
+		n += 1
+	if 'UnderlyingOptAttribute' in d:
+		add('317=' + str(d['UnderlyingOptAttribute']))
+		n += 1
+	if 'UnderlyingContractMultiplier' in d:
+		add('436=' + str(d['UnderlyingContractMultiplier']))
+		n += 1
+	if 'UnderlyingCouponRate' in d:
+		add('435=' + str(d['UnderlyingCouponRate']))
+		n += 1
+	if 'UnderlyingSecurityExchange' in d:
+		add('308=' + str(d['UnderlyingSecurityExchange']))
+		n += 1
+	if 'UnderlyingIssuer' in d:
+		add('306=' + str(d['UnderlyingIssuer']))
+		n += 1
+	if 'EncodedUnderlyingIssuerLen' in d:
+		add('362=' + str(d['EncodedUnderlyingIssuerLen']))
+		n += 1
+	if 'EncodedUnderlyingIssuer' in d:
+		add('363=' + str(d['EncodedUnderlyingIssuer']))
+		n += 1
+	if 'UnderlyingSecurityDesc' in d:
+		add('307=' + str(d['UnderlyingSecurityDesc']))
+		n += 1
+	if 'EncodedUnderlyingSecurityDescLen' in d:
+		add('364=' + str(d['EncodedUnderlyingSecurityDescLen']))
+		n += 1
+	if 'EncodedUnderlyingSecurityDesc' in d:
+		add('365=' + str(d['EncodedUnderlyingSecurityDesc']))
+		n += 1
+	if 'UnderlyingCPProgram' in d:
+		add('877=' + str(d['UnderlyingCPProgram']))
+		n += 1
+	if 'UnderlyingCPRegType' in d:
+		add('878=' + str(d['UnderlyingCPRegType']))
+		n += 1
+	if 'UnderlyingCurrency' in d:
+		add('318=' + str(d['UnderlyingCurrency']))
+		n += 1
+	if 'UnderlyingQty' in d:
+		add('879=' + str(d['UnderlyingQty']))
+		n += 1
+	if 'UnderlyingPx' in d:
+		add('810=' + str(d['UnderlyingPx']))
+		n += 1
+	if 'UnderlyingDirtyPrice' in d:
+		add('882=' + str(d['UnderlyingDirtyPrice']))
+		n += 1
+	if 'UnderlyingEndPrice' in d:
+		add('883=' + str(d['UnderlyingEndPrice']))
+		n += 1
+	if 'UnderlyingStartValue' in d:
+		add('884=' + str(d['UnderlyingStartValue']))
+		n += 1
+	if 'UnderlyingCurrentValue' in d:
+		add('885=' + str(d['UnderlyingCurrentValue']))
+		n += 1
+	if 'UnderlyingEndValue' in d:
+		add('886=' + str(d['UnderlyingEndValue']))
+		n += 1
+	if 'NoUnderlyingStips' in d:
+		grp = d['NoUnderlyingStips']
+		add('887=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoUnderlyingStips(entry, fixm)
+		n += 1
+	if 'TotNoRelatedSym' in d:
+		add('393=' + str(d['TotNoRelatedSym']))
+		n += 1
+	if 'LastFragment' in d:
+		add('893=' + str(d['LastFragment']))
+		n += 1
+	if 'NoRelatedSym' in d:
+		grp = d['NoRelatedSym']
+		add('146=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoRelatedSym(entry, fixm)
+		n += 1
+	if len(d) > n:
+		_make_mbody(obj, obj._context, fixm, _msg_DerivativeSecurityList_names)
+	return fixm
+
+def _decode_DerivativeSecurityList(obj, fields, index, context):
+	d = obj.__dict__
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _msg_DerivativeSecurityList_tags.get(num)
+		if spec is None:
+			# not a field of this message, continue with generic decoder
+			body, index = _extract_body(fields, index, context, obj)
+			return index
+		name, pytype, decode_grp = spec
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	return index
+
+class DerivativeSecurityList(FixObject):
+	_encode = staticmethod(_encode_DerivativeSecurityList)
+	_decode = staticmethod(_decode_DerivativeSecurityList)
+
+_msg_DerivativeSecurityListRequest_names = frozenset(['SecurityReqID', 'SecurityListRequestType', 'UnderlyingSymbol', 'UnderlyingSymbolSfx', 'UnderlyingSecurityID', 'UnderlyingSecurityIDSource', 'NoUnderlyingSecurityAltID', 'UnderlyingProduct', 'UnderlyingCFICode', 'UnderlyingSecurityType', 'UnderlyingSecuritySubType', 'UnderlyingMaturityMonthYear', 'UnderlyingMaturityDate', 'UnderlyingCouponPaymentDate', 'UnderlyingIssueDate', 'UnderlyingRepoCollateralSecurityType', 'UnderlyingRepurchaseTerm', 'UnderlyingRepurchaseRate', 'UnderlyingFactor', 'UnderlyingCreditRating', 'UnderlyingInstrRegistry', 'UnderlyingCountryOfIssue', 'UnderlyingStateOrProvinceOfIssue', 'UnderlyingLocaleOfIssue', 'UnderlyingRedemptionDate', 'UnderlyingStrikePrice', 'UnderlyingStrikeCurrency', 'UnderlyingOptAttribute', 'UnderlyingContractMultiplier', 'UnderlyingCouponRate', 'UnderlyingSecurityExchange', 'UnderlyingIssuer', 'EncodedUnderlyingIssuerLen', 'EncodedUnderlyingIssuer', 'UnderlyingSecurityDesc', 'EncodedUnderlyingSecurityDescLen', 'EncodedUnderlyingSecurityDesc', 'UnderlyingCPProgram', 'UnderlyingCPRegType', 'UnderlyingCurrency', 'UnderlyingQty', 'UnderlyingPx', 'UnderlyingDirtyPrice', 'UnderlyingEndPrice', 'UnderlyingStartValue', 'UnderlyingCurrentValue', 'UnderlyingEndValue', 'NoUnderlyingStips', 'SecuritySubType', 'Currency', 'Text', 'EncodedTextLen', 'EncodedText', 'TradingSessionID', 'TradingSessionSubID', 'SubscriptionRequestType'])
+
+_msg_DerivativeSecurityListRequest_tags = {
+	320: ('SecurityReqID', str, None),
+	559: ('SecurityListRequestType', int, None),
+	311: ('UnderlyingSymbol', str, None),
+	312: ('UnderlyingSymbolSfx', str, None),
+	309: ('UnderlyingSecurityID', str, None),
+	305: ('UnderlyingSecurityIDSource', str, None),
+	457: ('NoUnderlyingSecurityAltID', int, _decode_grp_NoUnderlyingSecurityAltID),
+	462: ('UnderlyingProduct', int, None),
+	463: ('UnderlyingCFICode', str, None),
+	310: ('UnderlyingSecurityType', str, None),
+	763: ('UnderlyingSecuritySubType', str, None),
+	313: ('UnderlyingMaturityMonthYear', str, None),
+	542: ('UnderlyingMaturityDate', str, None),
+	241: ('UnderlyingCouponPaymentDate', str, None),
+	242: ('UnderlyingIssueDate', str, None),
+	243: ('UnderlyingRepoCollateralSecurityType', int, None),
+	244: ('UnderlyingRepurchaseTerm', int, None),
+	245: ('UnderlyingRepurchaseRate', float, None),
+	246: ('UnderlyingFactor', float, None),
+	256: ('UnderlyingCreditRating', str, None),
+	595: ('UnderlyingInstrRegistry', str, None),
+	592: ('UnderlyingCountryOfIssue', str, None),
+	593: ('UnderlyingStateOrProvinceOfIssue', str, None),
+	594: ('UnderlyingLocaleOfIssue', str, None),
+	247: ('UnderlyingRedemptionDate', str, None),
+	316: ('UnderlyingStrikePrice', float, None),
+	941: ('UnderlyingStrikeCurrency', str, None),
+	317: ('UnderlyingOptAttribute', str, None),
+	436: ('UnderlyingContractMultiplier', float, None),
+	435: ('UnderlyingCouponRate', float, None),
+	308: ('UnderlyingSecurityExchange', str, None),
+	306: ('UnderlyingIssuer', str, None),
+	362: ('EncodedUnderlyingIssuerLen', str, None),
+	363: ('EncodedUnderlyingIssuer', str, None),
+	307: ('UnderlyingSecurityDesc', str, None),
+	364: ('EncodedUnderlyingSecurityDescLen', str, None),
+	365: ('EncodedUnderlyingSecurityDesc', str, None),
+	877: ('UnderlyingCPProgram', str, None),
+	878: ('UnderlyingCPRegType', str, None),
+	318: ('UnderlyingCurrency', str, None),
+	879: ('UnderlyingQty', float, None),
+	810: ('UnderlyingPx', float, None),
+	882: ('UnderlyingDirtyPrice', float, None),
+	883: ('UnderlyingEndPrice', float, None),
+	884: ('UnderlyingStartValue', float, None),
+	885: ('UnderlyingCurrentValue', float, None),
+	886: ('UnderlyingEndValue', float, None),
+	887: ('NoUnderlyingStips', int, _decode_grp_NoUnderlyingStips),
+	762: ('SecuritySubType', str, None),
+	15: ('Currency', str, None),
+	58: ('Text', str, None),
+	354: ('EncodedTextLen', str, None),
+	355: ('EncodedText', str, None),
+	336: ('TradingSessionID', str, None),
+	625: ('TradingSessionSubID', str, None),
+	263: ('SubscriptionRequestType', str, None),
+}
+
+def _encode_DerivativeSecurityListRequest(obj, fixm):
+	d = obj.__dict__
+	add = fixm.append
+	n = 1
+	if 'SecurityReqID' in d:
+		add('320=' + str(d['SecurityReqID']))
+		n += 1
+	if 'SecurityListRequestType' in d:
+		add('559=' + str(d['SecurityListRequestType']))
+		n += 1
+	if 'UnderlyingSymbol' in d:
+		add('311=' + str(d['UnderlyingSymbol']))
+		n += 1
+	if 'UnderlyingSymbolSfx' in d:
+		add('312=' + str(d['UnderlyingSymbolSfx']))
+		n += 1
+	if 'UnderlyingSecurityID' in d:
+		add('309=' + str(d['UnderlyingSecurityID']))
+		n += 1
+	if 'UnderlyingSecurityIDSource' in d:
+		add('305=' + str(d['UnderlyingSecurityIDSource']))
+		n += 1
+	if 'NoUnderlyingSecurityAltID' in d:
+		grp = d['NoUnderlyingSecurityAltID']
+		add('457=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoUnderlyingSecurityAltID(entry, fixm)
+		n += 1
+	if 'UnderlyingProduct' in d:
+		add('462=' + str(d['UnderlyingProduct']))
+		n += 1
+	if 'UnderlyingCFICode' in d:
+		add('463=' + str(d['UnderlyingCFICode']))
+		n += 1
+	if 'UnderlyingSecurityType' in d:
+		add('310=' + str(d['UnderlyingSecurityType']))
+		n += 1
+	if 'UnderlyingSecuritySubType' in d:
+		add('763=' + str(d['UnderlyingSecuritySubType']))
+		n += 1
+	if 'UnderlyingMaturityMonthYear' in d:
+		add('313=' + str(d['UnderlyingMaturityMonthYear']))
+		n += 1
+	if 'UnderlyingMaturityDate' in d:
+		add('542=' + str(d['UnderlyingMaturityDate']))
+		n += 1
+	if 'UnderlyingCouponPaymentDate' in d:
+		add('241=' + str(d['UnderlyingCouponPaymentDate']))
+		n += 1
+	if 'UnderlyingIssueDate' in d:
+		add('242=' + str(d['UnderlyingIssueDate']))
+		n += 1
+	if 'UnderlyingRepoCollateralSecurityType' in d:
+		add('243=' + str(d['UnderlyingRepoCollateralSecurityType']))
+		n += 1
+	if 'UnderlyingRepurchaseTerm' in d:
+		add('244=' + str(d['UnderlyingRepurchaseTerm']))
+		n += 1
+	if 'UnderlyingRepurchaseRate' in d:
+		add('245=' + str(d['UnderlyingRepurchaseRate']))
+		n += 1
+	if 'UnderlyingFactor' in d:
+		add('246=' + str(d['UnderlyingFactor']))
+		n += 1
+	if 'UnderlyingCreditRating' in d:
+		add('256=' + str(d['UnderlyingCreditRating']))
+		n += 1
+	if 'UnderlyingInstrRegistry' in d:
+		add('595=' + str(d['UnderlyingInstrRegistry']))
+		n += 1
+	if 'UnderlyingCountryOfIssue' in d:
+		add('592=' + str(d['UnderlyingCountryOfIssue']))
+		n += 1
+	if 'UnderlyingStateOrProvinceOfIssue' in d:
+		add('593=' + str(d['UnderlyingStateOrProvinceOfIssue']))
+		n += 1
+	if 'UnderlyingLocaleOfIssue' in d:
+		add('594=' + str(d['UnderlyingLocaleOfIssue']))
+		n += 1
+	if 'UnderlyingRedemptionDate' in d:
+		add('247=' + str(d['UnderlyingRedemptionDate']))
+		n += 1
+	if 'UnderlyingStrikePrice' in d:
+		add('316=' + str(d['UnderlyingStrikePrice']))
+		n += 1
+	if 'UnderlyingStrikeCurrency' in d:
+		add('941=' + str(d['UnderlyingStrikeCurrency']))
+		n += 1
+	if 'UnderlyingOptAttribute' in d:
+		add('317=' + str(d['UnderlyingOptAttribute']))
+		n += 1
+	if 'UnderlyingContractMultiplier' in d:
+		add('436=' + str(d['UnderlyingContractMultiplier']))
+		n += 1
+	if 'UnderlyingCouponRate' in d:
+		add('435=' + str(d['UnderlyingCouponRate']))
+		n += 1
+	if 'UnderlyingSecurityExchange' in d:
+		add('308=' + str(d['UnderlyingSecurityExchange']))
+		n += 1
+	if 'UnderlyingIssuer' in d:
+		add('306=' + str(d['UnderlyingIssuer']))
+		n += 1
+	if 'EncodedUnderlyingIssuerLen' in d:
+		add('362=' + str(d['EncodedUnderlyingIssuerLen']))
+		n += 1
+	if 'EncodedUnderlyingIssuer' in d:
+		add('363=' + str(d['EncodedUnderlyingIssuer']))
+		n += 1
+	if 'UnderlyingSecurityDesc' in d:
+		add('307=' + str(d['UnderlyingSecurityDesc']))
+		n += 1
+	if 'EncodedUnderlyingSecurityDescLen' in d:
+		add('364=' + str(d['EncodedUnderlyingSecurityDescLen']))
+		n += 1
+	if 'EncodedUnderlyingSecurityDesc' in d:
+		add('365=' + str(d['EncodedUnderlyingSecurityDesc']))
+		n += 1
+	if 'UnderlyingCPProgram' in d:
+		add('877=' + str(d['UnderlyingCPProgram']))
+		n += 1
+	if 'UnderlyingCPRegType' in d:
+		add('878=' + str(d['UnderlyingCPRegType']))
+		n += 1
+	if 'UnderlyingCurrency' in d:
+		add('318=' + str(d['UnderlyingCurrency']))
+		n += 1
+	if 'UnderlyingQty' in d:
+		add('879=' + str(d['UnderlyingQty']))
+		n += 1
+	if 'UnderlyingPx' in d:
+		add('810=' + str(d['UnderlyingPx']))
+		n += 1
+	if 'UnderlyingDirtyPrice' in d:
+		add('882=' + str(d['UnderlyingDirtyPrice']))
+		n += 1
+	if 'UnderlyingEndPrice' in d:
+		add('883=' + str(d['UnderlyingEndPrice']))
+		n += 1
+	if 'UnderlyingStartValue' in d:
+		add('884=' + str(d['UnderlyingStartValue']))
+		n += 1
+	if 'UnderlyingCurrentValue' in d:
+		add('885=' + str(d['UnderlyingCurrentValue']))
+		n += 1
+	if 'UnderlyingEndValue' in d:
+		add('886=' + str(d['UnderlyingEndValue']))
+		n += 1
+	if 'NoUnderlyingStips' in d:
+		grp = d['NoUnderlyingStips']
+		add('887=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoUnderlyingStips(entry, fixm)
+		n += 1
+	if 'SecuritySubType' in d:
+		add('762=' + str(d['SecuritySubType']))
+		n += 1
+	if 'Currency' in d:
+		add('15=' + str(d['Currency']))
+		n += 1
+	if 'Text' in d:
+		add('58=' + str(d['Text']))
+		n += 1
+	if 'EncodedTextLen' in d:
+		add('354=' + str(d['EncodedTextLen']))
+		n += 1
+	if 'EncodedText' in d:
+		add('355=' + str(d['EncodedText']))
+		n += 1
+	if 'TradingSessionID' in d:
+		add('336=' + str(d['TradingSessionID']))
+		n += 1
+	if 'TradingSessionSubID' in d:
+		add('625=' + str(d['TradingSessionSubID']))
+		n += 1
+	if 'SubscriptionRequestType' in d:
+		add('263=' + str(d['SubscriptionRequestType']))
+		n += 1
+	if len(d) > n:
+		_make_mbody(obj, obj._context, fixm, _msg_DerivativeSecurityListRequest_names)
+	return fixm
+
+def _decode_DerivativeSecurityListRequest(obj, fields, index, context):
+	d = obj.__dict__
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _msg_DerivativeSecurityListRequest_tags.get(num)
+		if spec is None:
+			# not a field of this message, continue with generic decoder
+			body, index = _extract_body(fields, index, context, obj)
+			return index
+		name, pytype, decode_grp = spec
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	return index
+
+class DerivativeSecurityListRequest(FixObject):
+	_encode = staticmethod(_encode_DerivativeSecurityListRequest)
+	_decode = staticmethod(_decode_DerivativeSecurityListRequest)
 
-class AllocationInstructionAck(FixObject):
-	pass
+_msg_DontKnowTrade_names = frozenset(['OrderID', 'SecondaryOrderID', 'ExecID', 'DKReason', 'Symbol', 'SymbolSfx', 'SecurityID', 'SecurityIDSource', 'NoSecurityAltID', 'Product', 'CFICode', 'SecurityType', 'SecuritySubType', 'MaturityMonthYear', 'MaturityDate', 'CouponPaymentDate', 'IssueDate', 'RepoCollateralSecurityType', 'RepurchaseTerm', 'RepurchaseRate', 'Factor', 'CreditRating', 'InstrRegistry', 'CountryOfIssue', 'StateOrProvinceOfIssue', 'LocaleOfIssue', 'RedemptionDate', 'StrikePrice', 'StrikeCurrency', 'OptAttribute', 'ContractMultiplier', 'CouponRate', 'SecurityExchange', 'Issuer', 'EncodedIssuerLen', 'EncodedIssuer', 'SecurityDesc', 'EncodedSecurityDescLen', 'EncodedSecurityDesc', 'Pool', 'ContractSettlMonth', 'CPProgram', 'CPRegType', 'NoEvents', 'DatedDate', 'InterestAccrualDate', 'NoUnderlyings', 'NoLegs', 'Side', 'OrderQty', 'CashOrderQty', 'OrderPercent', 'RoundingDirection', 'RoundingModulus', 'LastQty', 'LastPx', 'Text', 'EncodedTextLen', 'EncodedText'])
 
-class AllocationReport(FixObject):
-	pass
+_msg_DontKnowTrade_tags = {
+	37: ('OrderID', str, None),
+	198: ('SecondaryOrderID', str, None),
+	17: ('ExecID', str, None),
+	127: ('DKReason', str, None),
+	55: ('Symbol', str, None),
+	65: ('SymbolSfx', str, None),
+	48: ('SecurityID', str, None),
+	22: ('SecurityIDSource', str, None),
+	454: ('NoSecurityAltID', int, _decode_grp_NoSecurityAltID),
+	460: ('Product', int, None),
+	461: ('CFICode', str, None),
+	167: ('SecurityType', str, None),
+	762: ('SecuritySubType', str, None),
+	200: ('MaturityMonthYear', str, None),
+	541: ('MaturityDate', str, None),
+	224: ('CouponPaymentDate', str, None),
+	225: ('IssueDate', str, None),
+	239: ('RepoCollateralSecurityType', int, None),
+	226: ('RepurchaseTerm', int, None),
+	227: ('RepurchaseRate', float, None),
+	228: ('Factor', float, None),
+	255: ('CreditRating', str, None),
+	543: ('InstrRegistry', str, None),
+	470: ('CountryOfIssue', str, None),
+	471: ('StateOrProvinceOfIssue', str, None),
+	472: ('LocaleOfIssue', str, None),
+	240: ('RedemptionDate', str, None),
+	202: ('StrikePrice', float, None),
+	947: ('StrikeCurrency', str, None),
+	206: ('OptAttribute', str, None),
+	231: ('ContractMultiplier', float, None),
+	223: ('CouponRate', float, None),
+	207: ('SecurityExchange', str, None),
+	106: ('Issuer', str, None),
+	348: ('EncodedIssuerLen', str, None),
+	349: ('EncodedIssuer', str, None),
+	107: ('SecurityDesc', str, None),
+	350: ('EncodedSecurityDescLen', str, None),
+	351: ('EncodedSecurityDesc', str, None),
+	691: ('Pool', str, None),
+	667: ('ContractSettlMonth', str, None),
+	875: ('CPProgram', int, None),
+	876: ('CPRegType', str, None),
+	864: ('NoEvents', int, _decode_grp_NoEvents),
+	873: ('DatedDate', str, None),
+	874: ('InterestAccrualDate', str, None),
+	711: ('NoUnderlyings', int, _decode_grp_NoUnderlyings),
+	555: ('NoLegs', int, _decode_grp_NoLegs),
+	54: ('Side', str, None),
+	38: ('OrderQty', float, None),
+	152: ('CashOrderQty', float, None),
+	516: ('OrderPercent', float, None),
+	468: ('RoundingDirection', str, None),
+	469: ('RoundingModulus', float, None),
+	32: ('LastQty', float, None),
+	31: ('LastPx', float, None),
+	58: ('Text', str, None),
+	354: ('EncodedTextLen', str, None),
+	355: ('EncodedText', str, None),
+}
 
-class AllocationReportAck(FixObject):
-	pass
+def _encode_DontKnowTrade(obj, fixm):
+	d = obj.__dict__
+	add = fixm.append
+	n = 1
+	if 'OrderID' in d:
+		add('37=' + str(d['OrderID']))
+		n += 1
+	if 'SecondaryOrderID' in d:
+		add('198=' + str(d['SecondaryOrderID']))
+		n += 1
+	if 'ExecID' in d:
+		add('17=' + str(d['ExecID']))
+		n += 1
+	if 'DKReason' in d:
+		add('127=' + str(d['DKReason']))
+		n += 1
+	if 'Symbol' in d:
+		add('55=' + str(d['Symbol']))
+		n += 1
+	if 'SymbolSfx' in d:
+		add('65=' + str(d['SymbolSfx']))
+		n += 1
+	if 'SecurityID' in d:
+		add('48=' + str(d['SecurityID']))
+		n += 1
+	if 'SecurityIDSource' in d:
+		add('22=' + str(d['SecurityIDSource']))
+		n += 1
+	if 'NoSecurityAltID' in d:
+		grp = d['NoSecurityAltID']
+		add('454=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoSecurityAltID(entry, fixm)
+		n += 1
+	if 'Product' in d:
+		add('460=' + str(d['Product']))
+		n += 1
+	if 'CFICode' in d:
+		add('461=' + str(d['CFICode']))
+		n += 1
+	if 'SecurityType' in d:
+		add('167=' + str(d['SecurityType']))
+		n += 1
+	if 'SecuritySubType' in d:
+		add('762=' + str(d['SecuritySubType']))
+		n += 1
+	if 'MaturityMonthYear' in d:
+		add('200=' + str(d['MaturityMonthYear']))
+		n += 1
+	if 'MaturityDate' in d:
+		add('541=' + str(d['MaturityDate']))
+		n += 1
+	if 'CouponPaymentDate' in d:
+		add('224=' + str(d['CouponPaymentDate']))
+		n += 1
+	if 'IssueDate' in d:
+		add('225=' + str(d['IssueDate']))
+		n += 1
+	if 'RepoCollateralSecurityType' in d:
+		add('239=' + str(d['RepoCollateralSecurityType']))
+		n += 1
+	if 'RepurchaseTerm' in d:
+		add('226=' + str(d['RepurchaseTerm']))
+		n += 1
+	if 'RepurchaseRate' in d:
+		add('227=' + str(d['RepurchaseRate']))
+		n += 1
+	if 'Factor' in d:
+		add('228=' + str(d['Factor']))
+		n += 1
+	if 'CreditRating' in d:
+		add('255=' + str(d['CreditRating']))
+		n += 1
+	if 'InstrRegistry' in d:
+		add('543=' + str(d['InstrRegistry']))
+		n += 1
+	if 'CountryOfIssue' in d:
+		add('470=' + str(d['CountryOfIssue']))
+		n += 1
+	if 'StateOrProvinceOfIssue' in d:
+		add('471=' + str(d['StateOrProvinceOfIssue']))
+		n += 1
+	if 'LocaleOfIssue' in d:
+		add('472=' + str(d['LocaleOfIssue']))
+		n += 1
+	if 'RedemptionDate' in d:
+		add('240=' + str(d['RedemptionDate']))
+		n += 1
+	if 'StrikePrice' in d:
+		add('202=' + str(d['StrikePrice']))
+		n += 1
+	if 'StrikeCurrency' in d:
+		add('947=' + str(d['StrikeCurrency']))
+		n += 1
+	if 'OptAttribute' in d:
+		add('206=' + str(d['OptAttribute']))
+		n += 1
+	if 'ContractMultiplier' in d:
+		add('231=' + str(d['ContractMultiplier']))
+		n += 1
+	if 'CouponRate' in d:
+		add('223=' + str(d['CouponRate']))
+		n += 1
+	if 'SecurityExchange' in d:
+		add('207=' + str(d['SecurityExchange']))
+		n += 1
+	if 'Issuer' in d:
+		add('106=' + str(d['Issuer']))
+		n += 1
+	if 'EncodedIssuerLen' in d:
+		add('348=' + str(d['EncodedIssuerLen']))
+		n += 1
+	if 'EncodedIssuer' in d:
+		add('349=' + str(d['EncodedIssuer']))
+		n += 1
+	if 'SecurityDesc' in d:
+		add('107=' + str(d['SecurityDesc']))
+		n += 1
+	if 'EncodedSecurityDescLen' in d:
+		add('350=' + str(d['EncodedSecurityDescLen']))
+		n += 1
+	if 'EncodedSecurityDesc' in d:
+		add('351=' + str(d['EncodedSecurityDesc']))
+		n += 1
+	if 'Pool' in d:
+		add('691=' + str(d['Pool']))
+		n += 1
+	if 'ContractSettlMonth' in d:
+		add('667=' + str(d['ContractSettlMonth']))
+		n += 1
+	if 'CPProgram' in d:
+		add('875=' + str(d['CPProgram']))
+		n += 1
+	if 'CPRegType' in d:
+		add('876=' + str(d['CPRegType']))
+		n += 1
+	if 'NoEvents' in d:
+		grp = d['NoEvents']
+		add('864=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoEvents(entry, fixm)
+		n += 1
+	if 'DatedDate' in d:
+		add('873=' + str(d['DatedDate']))
+		n += 1
+	if 'InterestAccrualDate' in d:
+		add('874=' + str(d['InterestAccrualDate']))
+		n += 1
+	if 'NoUnderlyings' in d:
+		grp = d['NoUnderlyings']
+		add('711=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoUnderlyings(entry, fixm)
+		n += 1
+	if 'NoLegs' in d:
+		grp = d['NoLegs']
+		add('555=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoLegs(entry, fixm)
+		n += 1
+	if 'Side' in d:
+		add('54=' + str(d['Side']))
+		n += 1
+	if 'OrderQty' in d:
+		add('38=' + str(d['OrderQty']))
+		n += 1
+	if 'CashOrderQty' in d:
+		add('152=' + str(d['CashOrderQty']))
+		n += 1
+	if 'OrderPercent' in d:
+		add('516=' + str(d['OrderPercent']))
+		n += 1
+	if 'RoundingDirection' in d:
+		add('468=' + str(d['RoundingDirection']))
+		n += 1
+	if 'RoundingModulus' in d:
+		add('469=' + str(d['RoundingModulus']))
+		n += 1
+	if 'LastQty' in d:
+		add('32=' + str(d['LastQty']))
+		n += 1
+	if 'LastPx' in d:
+		add('31=' + str(d['LastPx']))
+		n += 1
+	if 'Text' in d:
+		add('58=' + str(d['Text']))
+		n += 1
+	if 'EncodedTextLen' in d:
+		add('354=' + str(d['EncodedTextLen']))
+		n += 1
+	if 'EncodedText' in d:
+		add('355=' + str(d['EncodedText']))
+		n += 1
+	if len(d) > n:
+		_make_mbody(obj, obj._context, fixm, _msg_DontKnowTrade_names)
+	return fixm
 
-class AssignmentReport(FixObject):
-	pass
+def _decode_DontKnowTrade(obj, fields, index, context):
+	d = obj.__dict__
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _msg_DontKnowTrade_tags.get(num)
+		if spec is None:
+			# not a field of this message, continue with generic decoder
+			body, index = _extract_body(fields, index, context, obj)
+			return index
+		name, pytype, decode_grp = spec
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	return index
 
-class BidRequest(FixObject):
-	pass
+class DontKnowTrade(FixObject):
+	_encode = staticmethod(_encode_DontKnowTrade)
+	_decode = staticmethod(_decode_DontKnowTrade)
 
-class BidResponse(FixObject):
-	pass
+_msg_Email_names = frozenset(['EmailThreadID', 'EmailType', 'OrigTime', 'Subject', 'EncodedSubjectLen', 'EncodedSubject', 'NoRoutingIDs', 'NoRelatedSym', 'NoUnderlyings', 'NoLegs', 'OrderID', 'ClOrdID', 'LinesOfText', 'RawDataLength', 'RawData'])
 
-class BusinessMessageReject(FixObject):
-	pass
+_msg_Email_tags = {
+	164: ('EmailThreadID', str, None),
+	94: ('EmailType', str, None),
+	42: ('OrigTime', str, None),
+	147: ('Subject', str, None),
+	356: ('EncodedSubjectLen', str, None),
+	357: ('EncodedSubject', str, None),
+	215: ('NoRoutingIDs', int, _decode_grp_NoRoutingIDs),
+	146: ('NoRelatedSym', int, _decode_grp_NoRelatedSym),
+	711: ('NoUnderlyings', int, _decode_grp_NoUnderlyings),
+	555: ('NoLegs', int, _decode_grp_NoLegs),
+	37: ('OrderID', str, None),
+	11: ('ClOrdID', str, None),
+	33: ('LinesOfText', int, _decode_grp_LinesOfText),
+	95: ('RawDataLength', str, None),
+	96: ('RawData', str, None),
+}
 
-class CollateralAssignment(FixObject):
-	pass
+def _encode_Email(obj, fixm):
+	d = obj.__dict__
+	add = fixm.append
+	n = 1
+	if 'EmailThreadID' in d:
+		add('164=' + str(d['EmailThreadID']))
+		n += 1
+	if 'EmailType' in d:
+		add('94=' + str(d['EmailType']))
+		n += 1
+	if 'OrigTime' in d:
+		add('42=' + str(d['OrigTime']))
+		n += 1
+	if 'Subject' in d:
+		add('147=' + str(d['Subject']))
+		n += 1
+	if 'EncodedSubjectLen' in d:
+		add('356=' + str(d['EncodedSubjectLen']))
+		n += 1
+	if 'EncodedSubject' in d:
+		add('357=' + str(d['EncodedSubject']))
+		n += 1
+	if 'NoRoutingIDs' in d:
+		grp = d['NoRoutingIDs']
+		add('215=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoRoutingIDs(entry, fixm)
+		n += 1
+	if 'NoRelatedSym' in d:
+		grp = d['NoRelatedSym']
+		add('146=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoRelatedSym(entry, fixm)
+		n += 1
+	if 'NoUnderlyings' in d:
+		grp = d['NoUnderlyings']
+		add('711=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoUnderlyings(entry, fixm)
+		n += 1
+	if 'NoLegs' in d:
+		grp = d['NoLegs']
+		add('555=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoLegs(entry, fixm)
+		n += 1
+	if 'OrderID' in d:
+		add('37=' + str(d['OrderID']))
+		n += 1
+	if 'ClOrdID' in d:
+		add('11=' + str(d['ClOrdID']))
+		n += 1
+	if 'LinesOfText' in d:
+		grp = d['LinesOfText']
+		add('33=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_LinesOfText(entry, fixm)
+		n += 1
+	if 'RawDataLength' in d:
+		add('95=' + str(d['RawDataLength']))
+		n += 1
+	if 'RawData' in d:
+		add('96=' + str(d['RawData']))
+		n += 1
+	if len(d) > n:
+		_make_mbody(obj, obj._context, fixm, _msg_Email_names)
+	return fixm
 
-class CollateralInquiry(FixObject):
-	pass
+def _decode_Email(obj, fields, index, context):
+	d = obj.__dict__
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _msg_Email_tags.get(num)
+		if spec is None:
+			# not a field of this message, continue with generic decoder
+			body, index = _extract_body(fields, index, context, obj)
+			return index
+		name, pytype, decode_grp = spec
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	return index
 
-class CollateralInquiryAck(FixObject):
-	pass
+class Email(FixObject):
+	_encode = staticmethod(_encode_Email)
+	_decode = staticmethod(_decode_Email)
 
-class CollateralReport(FixObject):
-	pass
+_msg_ExecutionReport_names = frozenset(['OrderID', 'SecondaryOrderID', 'SecondaryClOrdID', 'SecondaryExecID', 'ClOrdID', 'OrigClOrdID', 'ClOrdLinkID', 'QuoteRespID', 'OrdStatusReqID', 'MassStatusReqID', 'TotNumReports', 'LastRptRequested', 'NoPartyIDs', 'TradeOriginationDate', 'NoContraBrokers', 'ListID', 'CrossID', 'OrigCrossID', 'CrossType', 'ExecID', 'ExecRefID', 'ExecType', 'OrdStatus', 'WorkingIndicator', 'OrdRejReason', 'ExecRestatementReason', 'Account', 'AcctIDSource', 'AccountType', 'DayBookingInst', 'BookingUnit', 'PreallocMethod', 'SettlType', 'SettlDate', 'CashMargin', 'ClearingFeeIndicator', 'Symbol', 'SymbolSfx', 'SecurityID', 'SecurityIDSource', 'NoSecurityAltID', 'Product', 'CFICode', 'SecurityType', 'SecuritySubType', 'MaturityMonthYear', 'MaturityDate', 'CouponPaymentDate', 'IssueDate', 'RepoCollateralSecurityType', 'RepurchaseTerm', 'RepurchaseRate', 'Factor', 'CreditRating', 'InstrRegistry', 'CountryOfIssue', 'StateOrProvinceOfIssue', 'LocaleOfIssue', 'RedemptionDate', 'StrikePrice', 'StrikeCurrency', 'OptAttribute', 'ContractMultiplier', 'CouponRate', 'SecurityExchange', 'Issuer', 'EncodedIssuerLen', 'EncodedIssuer', 'SecurityDesc', 'EncodedSecurityDescLen', 'EncodedSecurityDesc', 'Pool', 'ContractSettlMonth', 'CPProgram', 'CPRegType', 'NoEvents', 'DatedDate', 'InterestAccrualDate', 'AgreementDesc', 'AgreementID', 'AgreementDate', 'AgreementCurrency', 'TerminationType', 'StartDate', 'EndDate', 'DeliveryType', 'MarginRatio', 'NoUnderlyings', 'Side', 'NoStipulations', 'QtyType', 'OrderQty', 'CashOrderQty', 'OrderPercent', 'RoundingDirection', 'RoundingModulus', 'OrdType', 'PriceType', 'Price', 'StopPx', 'PegOffsetValue', 'PegMoveType', 'PegOffsetType', 'PegLimitType', 'PegRoundDirection', 'PegScope', 'DiscretionInst', 'DiscretionOffsetValue', 'DiscretionMoveType', 'DiscretionOffsetType', 'DiscretionLimitType', 'DiscretionRoundDirection', 'DiscretionScope', 'PeggedPrice', 'DiscretionPrice', 'TargetStrategy', 'TargetStrategyParameters', 'ParticipationRate', 'TargetStrategyPerformance', 'Currency', 'ComplianceID', 'SolicitedFlag', 'TimeInForce', 'EffectiveTime', 'ExpireDate', 'ExpireTime', 'ExecInst', 'OrderCapacity', 'OrderRestrictions', 'CustOrderCapacity', 'LastQty', 'UnderlyingLastQty', 'LastPx', 'UnderlyingLastPx', 'LastParPx', 'LastSpotRate', 'LastForwardPoints', 'LastMkt', 'TradingSessionID', 'TradingSessionSubID', 'TimeBracket', 'LastCapacity', 'LeavesQty', 'CumQty', 'AvgPx', 'DayOrderQty', 'DayCumQty', 'DayAvgPx', 'GTBookingInst', 'TradeDate', 'TransactTime', 'ReportToExch', 'Commission', 'CommType', 'CommCurrency', 'FundRenewWaiv', 'Spread', 'BenchmarkCurveCurrency', 'BenchmarkCurveName', 'BenchmarkCurvePoint', 'BenchmarkPrice', 'BenchmarkPriceType', 'BenchmarkSecurityID', 'BenchmarkSecurityIDSource', 'YieldType', 'Yield', 'YieldCalcDate', 'YieldRedemptionDate', 'YieldRedemptionPrice', 'YieldRedemptionPriceType', 'GrossTradeAmt', 'NumDaysInterest', 'ExDate', 'AccruedInterestRate', 'AccruedInterestAmt', 'InterestAtMaturity', 'EndAccruedInterestAmt', 'StartCash', 'EndCash', 'TradedFlatSwitch', 'BasisFeatureDate', 'BasisFeaturePrice', 'Concession', 'TotalTakedown', 'NetMoney', 'SettlCurrAmt', 'SettlCurrency', 'SettlCurrFxRate', 'SettlCurrFxRateCalc', 'HandlInst', 'MinQty', 'MaxFloor', 'PositionEffect', 'MaxShow', 'BookingType', 'Text', 'EncodedTextLen', 'EncodedText', 'SettlDate2', 'OrderQty2', 'LastForwardPoints2', 'MultiLegReportingType', 'CancellationRights', 'MoneyLaunderingStatus', 'RegistID', 'Designation', 'TransBkdTime', 'ExecValuationPoint', 'ExecPriceType', 'ExecPriceAdjustment', 'PriorityIndicator', 'PriceImprovement', 'LastLiquidityInd', 'NoContAmts', 'NoLegs', 'CopyMsgIndicator', 'NoMiscFees'])
 
-class CollateralRequest(FixObject):
-	pass
+_msg_ExecutionReport_tags = {
+	37: ('OrderID', str, None),
+	198: ('SecondaryOrderID', str, None),
+	526: ('SecondaryClOrdID', str, None),
+	527: ('SecondaryExecID', str, None),
+	11: ('ClOrdID', str, None),
+	41: ('OrigClOrdID', str, None),
+	583: ('ClOrdLinkID', str, None),
+	693: ('QuoteRespID', str, None),
+	790: ('OrdStatusReqID', str, None),
+	584: ('MassStatusReqID', str, None),
+	911: ('TotNumReports', int, None),
+	912: ('LastRptRequested', str, None),
+	453: ('NoPartyIDs', int, _decode_grp_NoPartyIDs),
+	229: ('TradeOriginationDate', str, None),
+	382: ('NoContraBrokers', int, _decode_grp_NoContraBrokers),
+	66: ('ListID', str, None),
+	548: ('CrossID', str, None),
+	551: ('OrigCrossID', str, None),
+	549: ('CrossType', int, None),
+	17: ('ExecID', str, None),
+	19: ('ExecRefID', str, None),
+	150: ('ExecType', str, None),
+	39: ('OrdStatus', str, None),
+	636: ('WorkingIndicator', str, None),
+	103: ('OrdRejReason', int, None),
+	378: ('ExecRestatementReason', int, None),
+	1: ('Account', str, None),
+	660: ('AcctIDSource', int, None),
+	581: ('AccountType', int, None),
+	589: ('DayBookingInst', str, None),
+	590: ('BookingUnit', str, None),
+	591: ('PreallocMethod', str, None),
+	63: ('SettlType', str, None),
+	64: ('SettlDate', str, None),
+	544: ('CashMargin', str, None),
+	635: ('ClearingFeeIndicator', str, None),
+	55: ('Symbol', str, None),
+	65: ('SymbolSfx', str, None),
+	48: ('SecurityID', str, None),
+	22: ('SecurityIDSource', str, None),
+	454: ('NoSecurityAltID', int, _decode_grp_NoSecurityAltID),
+	460: ('Product', int, None),
+	461: ('CFICode', str, None),
+	167: ('SecurityType', str, None),
+	762: ('SecuritySubType', str, None),
+	200: ('MaturityMonthYear', str, None),
+	541: ('MaturityDate', str, None),
+	224: ('CouponPaymentDate', str, None),
+	225: ('IssueDate', str, None),
+	239: ('RepoCollateralSecurityType', int, None),
+	226: ('RepurchaseTerm', int, None),
+	227: ('RepurchaseRate', float, None),
+	228: ('Factor', float, None),
+	255: ('CreditRating', str, None),
+	543: ('InstrRegistry', str, None),
+	470: ('CountryOfIssue', str, None),
+	471: ('StateOrProvinceOfIssue', str, None),
+	472: ('LocaleOfIssue', str, None),
+	240: ('RedemptionDate', str, None),
+	202: ('StrikePrice', float, None),
+	947: ('StrikeCurrency', str, None),
+	206: ('OptAttribute', str, None),
+	231: ('ContractMultiplier', float, None),
+	223: ('CouponRate', float, None),
+	207: ('SecurityExchange', str, None),
+	106: ('Issuer', str, None),
+	348: ('EncodedIssuerLen', str, None),
+	349: ('EncodedIssuer', str, None),
+	107: ('SecurityDesc', str, None),
+	350: ('EncodedSecurityDescLen', str, None),
+	351: ('EncodedSecurityDesc', str, None),
+	691: ('Pool', str, None),
+	667: ('ContractSettlMonth', str, None),
+	875: ('CPProgram', int, None),
+	876: ('CPRegType', str, None),
+	864: ('NoEvents', int, _decode_grp_NoEvents),
+	873: ('DatedDate', str, None),
+	874: ('InterestAccrualDate', str, None),
+	913: ('AgreementDesc', str, None),
+	914: ('AgreementID', str, None),
+	915: ('AgreementDate', str, None),
+	918: ('AgreementCurrency', str, None),
+	788: ('TerminationType', int, None),
+	916: ('StartDate', str, None),
+	917: ('EndDate', str, None),
+	919: ('DeliveryType', int, None),
+	898: ('MarginRatio', float, None),
+	711: ('NoUnderlyings', int, _decode_grp_NoUnderlyings),
+	54: ('Side', str, None),
+	232: ('NoStipulations', int, _decode_grp_NoStipulations),
+	854: ('QtyType', int, None),
+	38: ('OrderQty', float, None),
+	152: ('CashOrderQty', float, None),
+	516: ('OrderPercent', float, None),
+	468: ('RoundingDirection', str, None),
+	469: ('RoundingModulus', float, None),
+	40: ('OrdType', str, None),
+	423: ('PriceType', int, None),
+	44: ('Price', float, None),
+	99: ('StopPx', float, None),
+	211: ('PegOffsetValue', float, None),
+	835: ('PegMoveType', int, None),
+	836: ('PegOffsetType', int, None),
+	837: ('PegLimitType', int, None),
+	838: ('PegRoundDirection', int, None),
+	840: ('PegScope', int, None),
+	388: ('DiscretionInst', str, None),
+	389: ('DiscretionOffsetValue', float, None),
+	841: ('DiscretionMoveType', int, None),
+	842: ('DiscretionOffsetType', int, None),
+	843: ('DiscretionLimitType', int, None),
+	844: ('DiscretionRoundDirection', int, None),
+	846: ('DiscretionScope', int, None),
+	839: ('PeggedPrice', float, None),
+	845: ('DiscretionPrice', float, None),
+	847: ('TargetStrategy', int, None),
+	848: ('TargetStrategyParameters', str, None),
+	849: ('ParticipationRate', float, None),
+	850: ('TargetStrategyPerformance', float, None),
+	15: ('Currency', str, None),
+	376: ('ComplianceID', str, None),
+	377: ('SolicitedFlag', str, None),
+	59: ('TimeInForce', str, None),
+	168: ('EffectiveTime', str, None),
+	432: ('ExpireDate', str, None),
+	126: ('ExpireTime', str, None),
+	18: ('ExecInst', str, None),
+	528: ('OrderCapacity', str, None),
+	529: ('OrderRestrictions', str, None),
+	582: ('CustOrderCapacity', int, None),
+	32: ('LastQty', float, None),
+	652: ('UnderlyingLastQty', float, None),
+	31: ('LastPx', float, None),
+	651: ('UnderlyingLastPx', float, None),
+	669: ('LastParPx', float, None),
+	194: ('LastSpotRate', float, None),
+	195: ('LastForwardPoints', float, None),
+	30: ('LastMkt', str, None),
+	336: ('TradingSessionID', str, None),
+	625: ('TradingSessionSubID', str, None),
+	943: ('TimeBracket', str, None),
+	29: ('LastCapacity', str, None),
+	151: ('LeavesQty', float, None),
+	14: ('CumQty', float, None),
+	6: ('AvgPx', float, None),
+	424: ('DayOrderQty', float, None),
+	425: ('DayCumQty', float, None),
+	426: ('DayAvgPx', float, None),
+	427: ('GTBookingInst', int, None),
+	75: ('TradeDate', str, None),
+	60: ('TransactTime', str, None),
+	113: ('ReportToExch', str, None),
+	12: ('Commission', float, None),
+	13: ('CommType', str, None),
+	479: ('CommCurrency', str, None),
+	497: ('FundRenewWaiv', str, None),
+	218: ('Spread', float, None),
+	220: ('BenchmarkCurveCurrency', str, None),
+	221: ('BenchmarkCurveName', str, None),
+	222: ('BenchmarkCurvePoint', str, None),
+	662: ('BenchmarkPrice', float, None),
+	663: ('BenchmarkPriceType', int, None),
+	699: ('BenchmarkSecurityID', str, None),
+	761: ('BenchmarkSecurityIDSource', str, None),
+	235: ('YieldType', str, None),
+	236: ('Yield', float, None),
+	701: ('YieldCalcDate', str, None),
+	696: ('YieldRedemptionDate', str, None),
+	697: ('YieldRedemptionPrice', float, None),
+	698: ('YieldRedemptionPriceType', int, None),
+	381: ('GrossTradeAmt', float, None),
+	157: ('NumDaysInterest', int, None),
+	230: ('ExDate', str, None),
+	158: ('AccruedInterestRate', float, None),
+	159: ('AccruedInterestAmt', float, None),
+	738: ('InterestAtMaturity', float, None),
+	920: ('EndAccruedInterestAmt', float, None),
+	921: ('StartCash', float, None),
+	922: ('EndCash', float, None),
+	258: ('TradedFlatSwitch', str, None),
+	259: ('BasisFeatureDate', str, None),
+	260: ('BasisFeaturePrice', float, None),
+	238: ('Concession', float, None),
+	237: ('TotalTakedown', float, None),
+	118: ('NetMoney', float, None),
+	119: ('SettlCurrAmt', float, None),
+	120: ('SettlCurrency', str, None),
+	155: ('SettlCurrFxRate', float, None),
+	156: ('SettlCurrFxRateCalc', str, None),
+	21: ('HandlInst', str, None),
+	110: ('MinQty', float, None),
+	111: ('MaxFloor', float, None),
+	77: ('PositionEffect', str, None),
+	210: ('MaxShow', float, None),
+	775: ('BookingType', int, None),
+	58: ('Text', str, None),
+	354: ('EncodedTextLen', str, None),
+	355: ('EncodedText', str, None),
+	193: ('SettlDate2', str, None),
+	192: ('OrderQty2', float, None),
+	641: ('LastForwardPoints2', float, None),
+	442: ('MultiLegReportingType', str, None),
+	480: ('CancellationRights', str, None),
+	481: ('MoneyLaunderingStatus', str, None),
+	513: ('RegistID', str, None),
+	494: ('Designation', str, None),
+	483: ('TransBkdTime', str, None),
+	515: ('ExecValuationPoint', str, None),
+	484: ('ExecPriceType', str, None),
+	485: ('ExecPriceAdjustment', float, None),
+	638: ('PriorityIndicator', int, None),
+	639: ('PriceImprovement', float, None),
+	851: ('LastLiquidityInd', int, None),
+	518: ('NoContAmts', int, _decode_grp_NoContAmts),
+	555: ('NoLegs', int, _decode_grp_NoLegs),
+	797: ('CopyMsgIndicator', str, None),
+	136: ('NoMiscFees', int, _decode_grp_NoMiscFees),
+}
 
-class CollateralResponse(FixObject):
-	pass
+def _encode_ExecutionReport(obj, fixm):
+	d = obj.__dict__
+	add = fixm.append
+	n = 1
+	if 'OrderID' in d:
+		add('37=' + str(d['OrderID']))
+		n += 1
+	if 'SecondaryOrderID' in d:
+		add('198=' + str(d['SecondaryOrderID']))
+		n += 1
+	if 'SecondaryClOrdID' in d:
+		add('526=' + str(d['SecondaryClOrdID']))
+		n += 1
+	if 'SecondaryExecID' in d:
+		add('527=' + str(d['SecondaryExecID']))
+		n += 1
+	if 'ClOrdID' in d:
+		add('11=' + str(d['ClOrdID']))
+		n += 1
+	if 'OrigClOrdID' in d:
+		add('41=' + str(d['OrigClOrdID']))
+		n += 1
+	if 'ClOrdLinkID' in d:
+		add('583=' + str(d['ClOrdLinkID']))
+		n += 1
+	if 'QuoteRespID' in d:
+		add('693=' + str(d['QuoteRespID']))
+		n += 1
+	if 'OrdStatusReqID' in d:
+		add('790=' + str(d['OrdStatusReqID']))
+		n += 1
+	if 'MassStatusReqID' in d:
+		add('584=' + str(d['MassStatusReqID']))
+		n += 1
+	if 'TotNumReports' in d:
+		add('911=' + str(d['TotNumReports']))
+		n += 1
+	if 'LastRptRequested' in d:
+		add('912=' + str(d['LastRptRequested']))
+		n += 1
+	if 'NoPartyIDs' in d:
+		grp = d['NoPartyIDs']
+		add('453=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoPartyIDs(entry, fixm)
+		n += 1
+	if 'TradeOriginationDate' in d:
+		add('229=' + str(d['TradeOriginationDate']))
+		n += 1
+	if 'NoContraBrokers' in d:
+		grp = d['NoContraBrokers']
+		add('382=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoContraBrokers(entry, fixm)
+		n += 1
+	if 'ListID' in d:
+		add('66=' + str(d['ListID']))
+		n += 1
+	if 'CrossID' in d:
+		add('548=' + str(d['CrossID']))
+		n += 1
+	if 'OrigCrossID' in d:
+		add('551=' + str(d['OrigCrossID']))
+		n += 1
+	if 'CrossType' in d:
+		add('549=' + str(d['CrossType']))
+		n += 1
+	if 'ExecID' in d:
+		add('17=' + str(d['ExecID']))
+		n += 1
+	if 'ExecRefID' in d:
+		add('19=' + str(d['ExecRefID']))
+		n += 1
+	if 'ExecType' in d:
+		add('150=' + str(d['ExecType']))
+		n += 1
+	if 'OrdStatus' in d:
+		add('39=' + str(d['OrdStatus']))
+		n += 1
+	if 'WorkingIndicator' in d:
+		add('636=' + str(d['WorkingIndicator']))
+		n += 1
+	if 'OrdRejReason' in d:
+		add('103=' + str(d['OrdRejReason']))
+		n += 1
+	if 'ExecRestatementReason' in d:
+		add('378=' + str(d['ExecRestatementReason']))
+		n += 1
+	if 'Account' in d:
+		add('1=' + str(d['Account']))
+		n += 1
+	if 'AcctIDSource' in d:
+		add('660=' + str(d['AcctIDSource']))
+		n += 1
+	if 'AccountType' in d:
+		add('581=' + str(d['AccountType']))
+		n += 1
+	if 'DayBookingInst' in d:
+		add('589=' + str(d['DayBookingInst']))
+		n += 1
+	if 'BookingUnit' in d:
+		add('590=' + str(d['BookingUnit']))
+		n += 1
+	if 'PreallocMethod' in d:
+		add('591=' + str(d['PreallocMethod']))
+		n += 1
+	if 'SettlType' in d:
+		add('63=' + str(d['SettlType']))
+		n += 1
+	if 'SettlDate' in d:
+		add('64=' + str(d['SettlDate']))
+		n += 1
+	if 'CashMargin' in d:
+		add('544=' + str(d['CashMargin']))
+		n += 1
+	if 'ClearingFeeIndicator' in d:
+		add('635=' + str(d['ClearingFeeIndicator']))
+		n += 1
+	if 'Symbol' in d:
+		add('55=' + str(d['Symbol']))
+		n += 1
+	if 'SymbolSfx' in d:
+		add('65=' + str(d['SymbolSfx']))
+		n += 1
+	if 'SecurityID' in d:
+		add('48=' + str(d['SecurityID']))
+		n += 1
+	if 'SecurityIDSource' in d:
+		add('22=' + str(d['SecurityIDSource']))
+		n += 1
+	if 'NoSecurityAltID' in d:
+		grp = d['NoSecurityAltID']
+		add('454=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoSecurityAltID(entry, fixm)
+		n += 1
+	if 'Product' in d:
+		add('460=' + str(d['Product']))
+		n += 1
+	if 'CFICode' in d:
+		add('461=' + str(d['CFICode']))
+		n += 1
+	if 'SecurityType' in d:
+		add('167=' + str(d['SecurityType']))
+		n += 1
+	if 'SecuritySubType' in d:
+		add('762=' + str(d['SecuritySubType']))
+		n += 1
+	if 'MaturityMonthYear' in d:
+		add('200=' + str(d['MaturityMonthYear']))
+		n += 1
+	if 'MaturityDate' in d:
+		add('541=' + str(d['MaturityDate']))
+		n += 1
+	if 'CouponPaymentDate' in d:
+		add('224=' + str(d['CouponPaymentDate']))
+		n += 1
+	if 'IssueDate' in d:
+		add('225=' + str(d['IssueDate']))
+		n += 1
+	if 'RepoCollateralSecurityType' in d:
+		add('239=' + str(d['RepoCollateralSecurityType']))
+		n += 1
+	if 'RepurchaseTerm' in d:
+		add('226=' + str(d['RepurchaseTerm']))
+		n += 1
+	if 'RepurchaseRate' in d:
+		add('227=' + str(d['RepurchaseRate']))
+		n += 1
+	if 'Factor' in d:
+		add('228=' + str(d['Factor']))
+		n += 1
+	if 'CreditRating' in d:
+		add('255=' + str(d['CreditRating']))
+		n += 1
+	if 'InstrRegistry' in d:
+		add('543=' + str(d['InstrRegistry']))
+		n += 1
+	if 'CountryOfIssue' in d:
+		add('470=' + str(d['CountryOfIssue']))
+		n += 1
+	if 'StateOrProvinceOfIssue' in d:
+		add('471=' + str(d['StateOrProvinceOfIssue']))
+		n += 1
+	if 'LocaleOfIssue' in d:
+		add('472=' + str(d['LocaleOfIssue']))
+		n += 1
+	if 'RedemptionDate' in d:
+		add('240=' + str(d['RedemptionDate']))
+		n += 1
+	if 'StrikePrice' in d:
+		add('202=' + str(d['StrikePrice']))
+		n += 1
+	if 'StrikeCurrency' in d:
+		add('947=' + str(d['StrikeCurrency']))
+		n += 1
+	if 'OptAttribute' in d:
+		add('206=' + str(d['OptAttribute']))
+		n += 1
+	if 'ContractMultiplier' in d:
+		add('231=' + str(d['ContractMultiplier']))
+		n += 1
+	if 'CouponRate' in d:
+		add('223=' + str(d['CouponRate']))
+		n += 1
+	if 'SecurityExchange' in d:
+		add('207=' + str(d['SecurityExchange']))
+		n += 1
+	if 'Issuer' in d:
+		add('106=' + str(d['Issuer']))
+		n += 1
+	if 'EncodedIssuerLen' in d:
+		add('348=' + str(d['EncodedIssuerLen']))
+		n += 1
+	if 'EncodedIssuer' in d:
+		add('349=' + str(d['EncodedIssuer']))
+		n += 1
+	if 'SecurityDesc' in d:
+		add('107=' + str(d['SecurityDesc']))
+		n += 1
+	if 'EncodedSecurityDescLen' in d:
+		add('350=' + str(d['EncodedSecurityDescLen']))
+		n += 1
+	if 'EncodedSecurityDesc' in d:
+		add('351=' + str(d['EncodedSecurityDesc']))
+		n += 1
+	if 'Pool' in d:
+		add('691=' + str(d['Pool']))
+		n += 1
+	if 'ContractSettlMonth' in d:
+		add('667=' + str(d['ContractSettlMonth']))
+		n += 1
+	if 'CPProgram' in d:
+		add('875=' + str(d['CPProgram']))
+		n += 1
+	if 'CPRegType' in d:
+		add('876=' + str(d['CPRegType']))
+		n += 1
+	if 'NoEvents' in d:
+		grp = d['NoEvents']
+		add('864=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoEvents(entry, fixm)
+		n += 1
+	if 'DatedDate' in d:
+		add('873=' + str(d['DatedDate']))
+		n += 1
+	if 'InterestAccrualDate' in d:
+		add('874=' + str(d['InterestAccrualDate']))
+		n += 1
+	if 'AgreementDesc' in d:
+		add('913=' + str(d['AgreementDesc']))
+		n += 1
+	if 'AgreementID' in d:
+		add('914=' + str(d['AgreementID']))
+		n += 1
+	if 'AgreementDate' in d:
+		add('915=' + str(d['AgreementDate']))
+		n += 1
+	if 'AgreementCurrency' in d:
+		add('918=' + str(d['AgreementCurrency']))
+		n += 1
+	if 'TerminationType' in d:
+		add('788=' + str(d['TerminationType']))
+		n += 1
+	if 'StartDate' in d:
+		add('916=' + str(d['StartDate']))
+		n += 1
+	if 'EndDate' in d:
+		add('917=' + str(d['EndDate']))
+		n += 1
+	if 'DeliveryType' in d:
+		add('919=' + str(d['DeliveryType']))
+		n += 1
+	if 'MarginRatio' in d:
+		add('898=' + str(d['MarginRatio']))
+		n += 1
+	if 'NoUnderlyings' in d:
+		grp = d['NoUnderlyings']
+		add('711=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoUnderlyings(entry, fixm)
+		n += 1
+	if 'Side' in d:
+		add('54=' + str(d['Side']))
+		n += 1
+	if 'NoStipulations' in d:
+		grp = d['NoStipulations']
+		add('232=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoStipulations(entry, fixm)
+		n += 1
+	if 'QtyType' in d:
+		add('854=' + str(d['QtyType']))
+		n += 1
+	if 'OrderQty' in d:
+		add('38=' + str(d['OrderQty']))
+		n += 1
+	if 'CashOrderQty' in d:
+		add('152=' + str(d['CashOrderQty']))
+		n += 1
+	if 'OrderPercent' in d:
+		add('516=' + str(d['OrderPercent']))
+		n += 1
+	if 'RoundingDirection' in d:
+		add('468=' + str(d['RoundingDirection']))
+		n += 1
+	if 'RoundingModulus' in d:
+		add('469=' + str(d['RoundingModulus']))
+		n += 1
+	if 'OrdType' in d:
+		add('40=' + str(d['OrdType']))
+		n += 1
+	if 'PriceType' in d:
+		add('423=' + str(d['PriceType']))
+		n += 1
+	if 'Price' in d:
+		add('44=' + str(d['Price']))
+		n += 1
+	if 'StopPx' in d:
+		add('99=' + str(d['StopPx']))
+		n += 1
+	if 'PegOffsetValue' in d:
+		add('211=' + str(d['PegOffsetValue']))
+		n += 1
+	if 'PegMoveType' in d:
+		add('835=' + str(d['PegMoveType']))
+		n += 1
+	if 'PegOffsetType' in d:
+		add('836=' + str(d['PegOffsetType']))
+		n += 1
+	if 'PegLimitType' in d:
+		add('837=' + str(d['PegLimitType']))
+		n += 1
+	if 'PegRoundDirection' in d:
+		add('838=' + str(d['PegRoundDirection']))
+		n += 1
+	if 'PegScope' in d:
+		add('840=' + str(d['PegScope']))
+		n += 1
+	if 'DiscretionInst' in d:
+		add('388=' + str(d['DiscretionInst']))
+		n += 1
+	if 'DiscretionOffsetValue' in d:
+		add('389=' + str(d['DiscretionOffsetValue']))
+		n += 1
+	if 'DiscretionMoveType' in d:
+		add('841=' + str(d['DiscretionMoveType']))
+		n += 1
+	if 'DiscretionOffsetType' in d:
+		add('842=' + str(d['DiscretionOffsetType']))
+		n += 1
+	if 'DiscretionLimitType' in d:
+		add('843=' + str(d['DiscretionLimitType']))
+		n += 1
+	if 'DiscretionRoundDirection' in d:
+		add('844=' + str(d['DiscretionRoundDirection']))
+		n += 1
+	if 'DiscretionScope' in d:
+		add('846=' + str(d['DiscretionScope']))
+		n += 1
+	if 'PeggedPrice' in d:
+		add('839=' + str(d['PeggedPrice']))
+		n += 1
+	if 'DiscretionPrice' in d:
+		add('845=' + str(d['DiscretionPrice']))
+		n += 1
+	if 'TargetStrategy' in d:
+		add('847=' + str(d['TargetStrategy']))
+		n += 1
+	if 'TargetStrategyParameters' in d:
+		add('848=' + str(d['TargetStrategyParameters']))
+		n += 1
+	if 'ParticipationRate' in d:
+		add('849=' + str(d['ParticipationRate']))
+		n += 1
+	if 'TargetStrategyPerformance' in d:
+		add('850=' + str(d['TargetStrategyPerformance']))
+		n += 1
+	if 'Currency' in d:
+		add('15=' + str(d['Currency']))
+		n += 1
+	if 'ComplianceID' in d:
+		add('376=' + str(d['ComplianceID']))
+		n += 1
+	if 'SolicitedFlag' in d:
+		add('377=' + str(d['SolicitedFlag']))
+		n += 1
+	if 'TimeInForce' in d:
+		add('59=' + str(d['TimeInForce']))
+		n += 1
+	if 'EffectiveTime' in d:
+		add('168=' + str(d['EffectiveTime']))
+		n += 1
+	if 'ExpireDate' in d:
+		add('432=' + str(d['ExpireDate']))
+		n += 1
+	if 'ExpireTime' in d:
+		add('126=' + str(d['ExpireTime']))
+		n += 1
+	if 'ExecInst' in d:
+		add('18=' + str(d['ExecInst']))
+		n += 1
+	if 'OrderCapacity' in d:
+		add('528=' + str(d['OrderCapacity']))
+		n += 1
+	if 'OrderRestrictions' in d:
+		add('529=' + str(d['OrderRestrictions']))
+		n += 1
+	if 'CustOrderCapacity' in d:
+		add('582=' + str(d['CustOrderCapacity']))
+		n += 1
+	if 'LastQty' in d:
+		add('32=' + str(d['LastQty']))
+		n += 1
+	if 'UnderlyingLastQty' in d:
+		add('652=' + str(d['UnderlyingLastQty']))
+		n += 1
+	if 'LastPx' in d:
+		add('31=' + str(d['LastPx']))
+		n += 1
+	if 'UnderlyingLastPx' in d:
+		add('651=' + str(d['UnderlyingLastPx']))
+		n += 1
+	if 'LastParPx' in d:
+		add('669=' + str(d['LastParPx']))
+		n += 1
+	if 'LastSpotRate' in d:
+		add('194=' + str(d['LastSpotRate']))
+		n += 1
+	if 'LastForwardPoints' in d:
+		add('195=' + str(d['LastForwardPoints']))
+		n += 1
+	if 'LastMkt' in d:
+		add('30=' + str(d['LastMkt']))
+		n += 1
+	if 'TradingSessionID' in d:
+		add('336=' + str(d['TradingSessionID']))
+		n += 1
+	if 'TradingSessionSubID' in d:
+		add('625=' + str(d['TradingSessionSubID']))
+		n += 1
+	if 'TimeBracket' in d:
+		add('943=' + str(d['TimeBracket']))
+		n += 1
+	if 'LastCapacity' in d:
+		add('29=' + str(d['LastCapacity']))
+		n += 1
+	if 'LeavesQty' in d:
+		add('151=' + str(d['LeavesQty']))
+		n += 1
+	if 'CumQty' in d:
+		add('14=' + str(d['CumQty']))
+		n += 1
+	if 'AvgPx' in d:
+		add('6=' + str(d['AvgPx']))
+		n += 1
+	if 'DayOrderQty' in d:
+		add('424=' + str(d['DayOrderQty']))
+		n += 1
+	if 'DayCumQty' in d:
+		add('425=' + str(d['DayCumQty']))
+		n += 1
+	if 'DayAvgPx' in d:
+		add('426=' + str(d['DayAvgPx']))
+		n += 1
+	if 'GTBookingInst' in d:
+		add('427=' + str(d['GTBookingInst']))
+		n += 1
+	if 'TradeDate' in d:
+		add('75=' + str(d['TradeDate']))
+		n += 1
+	if 'TransactTime' in d:
+		add('60=' + str(d['TransactTime']))
+		n += 1
+	if 'ReportToExch' in d:
+		add('113=' + str(d['ReportToExch']))
+		n += 1
+	if 'Commission' in d:
+		add('12=' + str(d['Commission']))
+		n += 1
+	if 'CommType' in d:
+		add('13=' + str(d['CommType']))
+		n += 1
+	if 'CommCurrency' in d:
+		add('479=' + str(d['CommCurrency']))
+		n += 1
+	if 'FundRenewWaiv' in d:
+		add('497=' + str(d['FundRenewWaiv']))
+		n += 1
+	if 'Spread' in d:
+		add('218=' + str(d['Spread']))
+		n += 1
+	if 'BenchmarkCurveCurrency' in d:
+		add('220=' + str(d['BenchmarkCurveCurrency']))
+		n += 1
+	if 'BenchmarkCurveName' in d:
+		add('221=' + str(d['BenchmarkCurveName']))
+		n += 1
+	if 'BenchmarkCurvePoint' in d:
+		add('222=' + str(d['BenchmarkCurvePoint']))
+		n += 1
+	if 'BenchmarkPrice' in d:
+		add('662=' + str(d['BenchmarkPrice']))
+		n += 1
+	if 'BenchmarkPriceType' in d:
+		add('663=' + str(d['BenchmarkPriceType']))
+		n += 1
+	if 'BenchmarkSecurityID' in d:
+		add('699=' + str(d['BenchmarkSecurityID']))
+		n += 1
+	if 'BenchmarkSecurityIDSource' in d:
+		add('761=' + str(d['BenchmarkSecurityIDSource']))
+		n += 1
+	if 'YieldType' in d:
+		add('235=' + str(d['YieldType']))
+		n += 1
+	if 'Yield' in d:
+		add('236=' + str(d['Yield']))
+		n += 1
+	if 'YieldCalcDate' in d:
+		add('701=' + str(d['YieldCalcDate']))
+		n += 1
+	if 'YieldRedemptionDate' in d:
+		add('696=' + str(d['YieldRedemptionDate']))
+		n += 1
+	if 'YieldRedemptionPrice' in d:
+		add('697=' + str(d['YieldRedemptionPrice']))
+		n += 1
+	if 'YieldRedemptionPriceType' in d:
+		add('698=' + str(d['YieldRedemptionPriceType']))
+		n += 1
+	if 'GrossTradeAmt' in d:
+		add('381=' + str(d['GrossTradeAmt']))
+		n += 1
+	if 'NumDaysInterest' in d:
+		add('157=' + str(d['NumDaysInterest']))
+		n += 1
+	if 'ExDate' in d:
+		add('230=' + str(d['ExDate']))
+		n += 1
+	if 'AccruedInterestRate' in d:
+		add('158=' + str(d['AccruedInterestRate']))
+		n += 1
+	if 'AccruedInterestAmt' in d:
+		add('159=' + str(d['AccruedInterestAmt']))
+		n += 1
+	if 'InterestAtMaturity' in d:
+		add('738=' + str(d['InterestAtMaturity']))
+		n += 1
+	if 'EndAccruedInterestAmt' in d:
+		add('920=' + str(d['EndAccruedInterestAmt']))
+		n += 1
+	if 'StartCash' in d:
+		add('921=' + str(d['StartCash']))
+		n += 1
+	if 'EndCash' in d:
+		add('922=' + str(d['EndCash']))
+		n += 1
+	if 'TradedFlatSwitch' in d:
+		add('258=' + str(d['TradedFlatSwitch']))
+		n += 1
+	if 'BasisFeatureDate' in d:
+		add('259=' + str(d['BasisFeatureDate']))
+		n += 1
+	if 'BasisFeaturePrice' in d:
+		add('260=' + str(d['BasisFeaturePrice']))
+		n += 1
+	if 'Concession' in d:
+		add('238=' + str(d['Concession']))
+		n += 1
+	if 'TotalTakedown' in d:
+		add('237=' + str(d['TotalTakedown']))
+		n += 1
+	if 'NetMoney' in d:
+		add('118=' + str(d['NetMoney']))
+		n += 1
+	if 'SettlCurrAmt' in d:
+		add('119=' + str(d['SettlCurrAmt']))
+		n += 1
+	if 'SettlCurrency' in d:
+		add('120=' + str(d['SettlCurrency']))
+		n += 1
+	if 'SettlCurrFxRate' in d:
+		add('155=' + str(d['SettlCurrFxRate']))
+		n += 1
+	if 'SettlCurrFxRateCalc' in d:
+		add('156=' + str(d['SettlCurrFxRateCalc']))
+		n += 1
+	if 'HandlInst' in d:
+		add('21=' + str(d['HandlInst']))
+		n += 1
+	if 'MinQty' in d:
+		add('110=' + str(d['MinQty']))
+		n += 1
+	if 'MaxFloor' in d:
+		add('111=' + str(d['MaxFloor']))
+		n += 1
+	if 'PositionEffect' in d:
+		add('77=' + str(d['PositionEffect']))
+		n += 1
+	if 'MaxShow' in d:
+		add('210=' + str(d['MaxShow']))
+		n += 1
+	if 'BookingType' in d:
+		add('775=' + str(d['BookingType']))
+		n += 1
+	if 'Text' in d:
+		add('58=' + str(d['Text']))
+		n += 1
+	if 'EncodedTextLen' in d:
+		add('354=' + str(d['EncodedTextLen']))
+		n += 1
+	if 'EncodedText' in d:
+		add('355=' + str(d['EncodedText']))
+		n += 1
+	if 'SettlDate2' in d:
+		add('193=' + str(d['SettlDate2']))
+		n += 1
+	if 'OrderQty2' in d:
+		add('192=' + str(d['OrderQty2']))
+		n += 1
+	if 'LastForwardPoints2' in d:
+		add('641=' + str(d['LastForwardPoints2']))
+		n += 1
+	if 'MultiLegReportingType' in d:
+		add('442=' + str(d['MultiLegReportingType']))
+		n += 1
+	if 'CancellationRights' in d:
+		add('480=' + str(d['CancellationRights']))
+		n += 1
+	if 'MoneyLaunderingStatus' in d:
+		add('481=' + str(d['MoneyLaunderingStatus']))
+		n += 1
+	if 'RegistID' in d:
+		add('513=' + str(d['RegistID']))
+		n += 1
+	if 'Designation' in d:
+		add('494=' + str(d['Designation']))
+		n += 1
+	if 'TransBkdTime' in d:
+		add('483=' + str(d['TransBkdTime']))
+		n += 1
+	if 'ExecValuationPoint' in d:
+		add('515=' + str(d['ExecValuationPoint']))
+		n += 1
+	if 'ExecPriceType' in d:
+		add('484=' + str(d['ExecPriceType']))
+		n += 1
+	if 'ExecPriceAdjustment' in d:
+		add('485=' + str(d['ExecPriceAdjustment']))
+		n += 1
+	if 'PriorityIndicator' in d:
+		add('638=' + str(d['PriorityIndicator']))
+		n += 1
+	if 'PriceImprovement' in d:
+		add('639=' + str(d['PriceImprovement']))
+		n += 1
+	if 'LastLiquidityInd' in d:
+		add('851=' + str(d['LastLiquidityInd']))
+		n += 1
+	if 'NoContAmts' in d:
+		grp = d['NoContAmts']
+		add('518=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoContAmts(entry, fixm)
+		n += 1
+	if 'NoLegs' in d:
+		grp = d['NoLegs']
+		add('555=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoLegs(entry, fixm)
+		n += 1
+	if 'CopyMsgIndicator' in d:
+		add('797=' + str(d['CopyMsgIndicator']))
+		n += 1
+	if 'NoMiscFees' in d:
+		grp = d['NoMiscFees']
+		add('136=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoMiscFees(entry, fixm)
+		n += 1
+	if len(d) > n:
+		_make_mbody(obj, obj._context, fixm, _msg_ExecutionReport_names)
+	return fixm
 
-class Confirmation(FixObject):
-	pass
+def _decode_ExecutionReport(obj, fields, index, context):
+	d = obj.__dict__
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _msg_ExecutionReport_tags.get(num)
+		if spec is None:
+			# not a field of this message, continue with generic decoder
+			body, index = _extract_body(fields, index, context, obj)
+			return index
+		name, pytype, decode_grp = spec
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	return index
 
-class ConfirmationAck(FixObject):
-	pass
+class ExecutionReport(FixObject):
+	_encode = staticmethod(_encode_ExecutionReport)
+	_decode = staticmethod(_decode_ExecutionReport)
 
-class ConfirmationRequest(FixObject):
-	pass
+_msg_IndicationOfInterest_names = frozenset(['IOIid', 'IOITransType', 'IOIRefID', 'Symbol', 'SymbolSfx', 'SecurityID', 'SecurityIDSource', 'NoSecurityAltID', 'Product', 'CFICode', 'SecurityType', 'SecuritySubType', 'MaturityMonthYear', 'MaturityDate', 'CouponPaymentDate', 'IssueDate', 'RepoCollateralSecurityType', 'RepurchaseTerm', 'RepurchaseRate', 'Factor', 'CreditRating', 'InstrRegistry', 'CountryOfIssue', 'StateOrProvinceOfIssue', 'LocaleOfIssue', 'RedemptionDate', 'StrikePrice', 'StrikeCurrency', 'OptAttribute', 'ContractMultiplier', 'CouponRate', 'SecurityExchange', 'Issuer', 'EncodedIssuerLen', 'EncodedIssuer', 'SecurityDesc', 'EncodedSecurityDescLen', 'EncodedSecurityDesc', 'Pool', 'ContractSettlMonth', 'CPProgram', 'CPRegType', 'NoEvents', 'DatedDate', 'InterestAccrualDate', 'AgreementDesc', 'AgreementID', 'AgreementDate', 'AgreementCurrency', 'TerminationType', 'StartDate', 'EndDate', 'DeliveryType', 'MarginRatio', 'NoUnderlyings', 'Side', 'QtyType', 'OrderQty', 'CashOrderQty', 'OrderPercent', 'RoundingDirection', 'RoundingModulus', 'IOIQty', 'Currency', 'NoStipulations', 'NoLegs', 'PriceType', 'Price', 'ValidUntilTime', 'IOIQltyInd', 'IOINaturalFlag', 'NoIOIQualifiers', 'Text', 'EncodedTextLen', 'EncodedText', 'TransactTime', 'URLLink', 'NoRoutingIDs', 'Spread', 'BenchmarkCurveCurrency', 'BenchmarkCurveName', 'BenchmarkCurvePoint', 'BenchmarkPrice', 'BenchmarkPriceType', 'BenchmarkSecurityID', 'BenchmarkSecurityIDSource', 'YieldType', 'Yield', 'YieldCalcDate', 'YieldRedemptionDate', 'YieldRedemptionPrice', 'YieldRedemptionPriceType'])
 
-class CrossOrderCancelReplaceRequest(FixObject):
-	pass
+_msg_IndicationOfInterest_tags = {
+	23: ('IOIid', str, None),
+	28: ('IOITransType', str, None),
+	26: ('IOIRefID', str, None),
+	55: ('Symbol', str, None),
+	65: ('SymbolSfx', str, None),
+	48: ('SecurityID', str, None),
+	22: ('SecurityIDSource', str, None),
+	454: ('NoSecurityAltID', int, _decode_grp_NoSecurityAltID),
+	460: ('Product', int, None),
+	461: ('CFICode', str, None),
+	167: ('SecurityType', str, None),
+	762: ('SecuritySubType', str, None),
+	200: ('MaturityMonthYear', str, None),
+	541: ('MaturityDate', str, None),
+	224: ('CouponPaymentDate', str, None),
+	225: ('IssueDate', str, None),
+	239: ('RepoCollateralSecurityType', int, None),
+	226: ('RepurchaseTerm', int, None),
+	227: ('RepurchaseRate', float, None),
+	228: ('Factor', float, None),
+	255: ('CreditRating', str, None),
+	543: ('InstrRegistry', str, None),
+	470: ('CountryOfIssue', str, None),
+	471: ('StateOrProvinceOfIssue', str, None),
+	472: ('LocaleOfIssue', str, None),
+	240: ('RedemptionDate', str, None),
+	202: ('StrikePrice', float, None),
+	947: ('StrikeCurrency', str, None),
+	206: ('OptAttribute', str, None),
+	231: ('ContractMultiplier', float, None),
+	223: ('CouponRate', float, None),
+	207: ('SecurityExchange', str, None),
+	106: ('Issuer', str, None),
+	348: ('EncodedIssuerLen', str, None),
+	349: ('EncodedIssuer', str, None),
+	107: ('SecurityDesc', str, None),
+	350: ('EncodedSecurityDescLen', str, None),
+	351: ('EncodedSecurityDesc', str, None),
+	691: ('Pool', str, None),
+	667: ('ContractSettlMonth', str, None),
+	875: ('CPProgram', int, None),
+	876: ('CPRegType', str, None),
+	864: ('NoEvents', int, _decode_grp_NoEvents),
+	873: ('DatedDate', str, None),
+	874: ('InterestAccrualDate', str, None),
+	913: ('AgreementDesc', str, None),
+	914: ('AgreementID', str, None),
+	915: ('AgreementDate', str, None),
+	918: ('AgreementCurrency', str, None),
+	788: ('TerminationType', int, None),
+	916: ('StartDate', str, None),
+	917: ('EndDate', str, None),
+	919: ('DeliveryType', int, None),
+	898: ('MarginRatio', float, None),
+	711: ('NoUnderlyings', int, _decode_grp_NoUnderlyings),
+	54: ('Side', str, None),
+	854: ('QtyType', int, None),
+	38: ('OrderQty', float, None),
+	152: ('CashOrderQty', float, None),
+	516: ('OrderPercent', float, None),
+	468: ('RoundingDirection', str, None),
+	469: ('RoundingModulus', float, None),
+	27: ('IOIQty', str, None),
+	15: ('Currency', str, None),
+	232: ('NoStipulations', int, _decode_grp_NoStipulations),
+	555: ('NoLegs', int, _decode_grp_NoLegs),
+	423: ('PriceType', int, None),
+	44: ('Price', float, None),
+	62: ('ValidUntilTime', str, None),
+	25: ('IOIQltyInd', str, None),
+	130: ('IOINaturalFlag', str, None),
+	199: ('NoIOIQualifiers', int, _decode_grp_NoIOIQualifiers),
+	58: ('Text', str, None),
+	354: ('EncodedTextLen', str, None),
+	355: ('EncodedText', str, None),
+	60: ('TransactTime', str, None),
+	149: ('URLLink', str, None),
+	215: ('NoRoutingIDs', int, _decode_grp_NoRoutingIDs),
+	218: ('Spread', float, None),
+	220: ('BenchmarkCurveCurrency', str, None),
+	221: ('BenchmarkCurveName', str, None),
+	222: ('BenchmarkCurvePoint', str, None),
+	662: ('BenchmarkPrice', float, None),
+	663: ('BenchmarkPriceType', int, None),
+	699: ('BenchmarkSecurityID', str, None),
+	761: ('BenchmarkSecurityIDSource', str, None),
+	235: ('YieldType', str, None),
+	236: ('Yield', float, None),
+	701: ('YieldCalcDate', str, None),
+	696: ('YieldRedemptionDate', str, None),
+	697: ('YieldRedemptionPrice', float, None),
+	698: ('YieldRedemptionPriceType', int, None),
+}
 
-class CrossOrderCancelRequest(FixObject):
-	pass
+def _encode_IndicationOfInterest(obj, fixm):
+	d = obj.__dict__
+	add = fixm.append
+	n = 1
+	if 'IOIid' in d:
+		add('23=' + str(d['IOIid']))
+		n += 1
+	if 'IOITransType' in d:
+		add('28=' + str(d['IOITransType']))
+		n += 1
+	if 'IOIRefID' in d:
+		add('26=' + str(d['IOIRefID']))
+		n += 1
+	if 'Symbol' in d:
+		add('55=' + str(d['Symbol']))
+		n += 1
+	if 'SymbolSfx' in d:
+		add('65=' + str(d['SymbolSfx']))
+		n += 1
+	if 'SecurityID' in d:
+		add('48=' + str(d['SecurityID']))
+		n += 1
+	if 'SecurityIDSource' in d:
+		add('22=' + str(d['SecurityIDSource']))
+		n += 1
+	if 'NoSecurityAltID' in d:
+		grp = d['NoSecurityAltID']
+		add('454=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoSecurityAltID(entry, fixm)
+		n += 1
+	if 'Product' in d:
+		add('460=' + str(d['Product']))
+		n += 1
+	if 'CFICode' in d:
+		add('461=' + str(d['CFICode']))
+		n += 1
+	if 'SecurityType' in d:
+		add('167=' + str(d['SecurityType']))
+		n += 1
+	if 'SecuritySubType' in d:
+		add('762=' + str(d['SecuritySubType']))
+		n += 1
+	if 'MaturityMonthYear' in d:
+		add('200=' + str(d['MaturityMonthYear']))
+		n += 1
+	if 'MaturityDate' in d:
+		add('541=' + str(d['MaturityDate']))
+		n += 1
+	if 'CouponPaymentDate' in d:
+		add('224=' + str(d['CouponPaymentDate']))
+		n += 1
+	if 'IssueDate' in d:
+		add('225=' + str(d['IssueDate']))
+		n += 1
+	if 'RepoCollateralSecurityType' in d:
+		add('239=' + str(d['RepoCollateralSecurityType']))
+		n += 1
+	if 'RepurchaseTerm' in d:
+		add('226=' + str(d['RepurchaseTerm']))
+		n += 1
+	if 'RepurchaseRate' in d:
+		add('227=' + str(d['RepurchaseRate']))
+		n += 1
+	if 'Factor' in d:
+		add('228=' + str(d['Factor']))
+		n += 1
+	if 'CreditRating' in d:
+		add('255=' + str(d['CreditRating']))
+		n += 1
+	if 'InstrRegistry' in d:
+		add('543=' + str(d['InstrRegistry']))
+		n += 1
+	if 'CountryOfIssue' in d:
+		add('470=' + str(d['CountryOfIssue']))
+		n += 1
+	if 'StateOrProvinceOfIssue' in d:
+		add('471=' + str(d['StateOrProvinceOfIssue']))
+		n += 1
+	if 'LocaleOfIssue' in d:
+		add('472=' + str(d['LocaleOfIssue']))
+		n += 1
+	if 'RedemptionDate' in d:
+		add('240=' + str(d['RedemptionDate']))
+		n += 1
+	if 'StrikePrice' in d:
+		add('202=' + str(d['StrikePrice']))
+		n += 1
+	if 'StrikeCurrency' in d:
+		add('947=' + str(d['StrikeCurrency']))
+		n += 1
+	if 'OptAttribute' in d:
+		add('206=' + str(d['OptAttribute']))
+		n += 1
+	if 'ContractMultiplier' in d:
+		add('231=' + str(d['ContractMultiplier']))
+		n += 1
+	if 'CouponRate' in d:
+		add('223=' + str(d['CouponRate']))
+		n += 1
+	if 'SecurityExchange' in d:
+		add('207=' + str(d['SecurityExchange']))
+		n += 1
+	if 'Issuer' in d:
+		add('106=' + str(d['Issuer']))
+		n += 1
+	if 'EncodedIssuerLen' in d:
+		add('348=' + str(d['EncodedIssuerLen']))
+		n += 1
+	if 'EncodedIssuer' in d:
+		add('349=' + str(d['EncodedIssuer']))
+		n += 1
+	if 'SecurityDesc' in d:
+		add('107=' + str(d['SecurityDesc']))
+		n += 1
+	if 'EncodedSecurityDescLen' in d:
+		add('350=' + str(d['EncodedSecurityDescLen']))
+		n += 1
+	if 'EncodedSecurityDesc' in d:
+		add('351=' + str(d['EncodedSecurityDesc']))
+		n += 1
+	if 'Pool' in d:
+		add('691=' + str(d['Pool']))
+		n += 1
+	if 'ContractSettlMonth' in d:
+		add('667=' + str(d['ContractSettlMonth']))
+		n += 1
+	if 'CPProgram' in d:
+		add('875=' + str(d['CPProgram']))
+		n += 1
+	if 'CPRegType' in d:
+		add('876=' + str(d['CPRegType']))
+		n += 1
+	if 'NoEvents' in d:
+		grp = d['NoEvents']
+		add('864=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoEvents(entry, fixm)
+		n += 1
+	if 'DatedDate' in d:
+		add('873=' + str(d['DatedDate']))
+		n += 1
+	if 'InterestAccrualDate' in d:
+		add('874=' + str(d['InterestAccrualDate']))
+		n += 1
+	if 'AgreementDesc' in d:
+		add('913=' + str(d['AgreementDesc']))
+		n += 1
+	if 'AgreementID' in d:
+		add('914=' + str(d['AgreementID']))
+		n += 1
+	if 'AgreementDate' in d:
+		add('915=' + str(d['AgreementDate']))
+		n += 1
+	if 'AgreementCurrency' in d:
+		add('918=' + str(d['AgreementCurrency']))
+		n += 1
+	if 'TerminationType' in d:
+		add('788=' + str(d['TerminationType']))
+		n += 1
+	if 'StartDate' in d:
+		add('916=' + str(d['StartDate']))
+		n += 1
+	if 'EndDate' in d:
+		add('917=' + str(d['EndDate']))
+		n += 1
+	if 'DeliveryType' in d:
+		add('919=' + str(d['DeliveryType']))
+		n += 1
+	if 'MarginRatio' in d:
+		add('898=' + str(d['MarginRatio']))
+		n += 1
+	if 'NoUnderlyings' in d:
+		grp = d['NoUnderlyings']
+		add('711=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoUnderlyings(entry, fixm)
+		n += 1
+	if 'Side' in d:
+		add('54=' + str(d['Side']))
+		n += 1
+	if 'QtyType' in d:
+		add('854=' + str(d['QtyType']))
+		n += 1
+	if 'OrderQty' in d:
+		add('38=' + str(d['OrderQty']))
+		n += 1
+	if 'CashOrderQty' in d:
+		add('152=' + str(d['CashOrderQty']))
+		n += 1
+	if 'OrderPercent' in d:
+		add('516=' + str(d['OrderPercent']))
+		n += 1
+	if 'RoundingDirection' in d:
+		add('468=' + str(d['RoundingDirection']))
+		n += 1
+	if 'RoundingModulus' in d:
+		add('469=' + str(d['RoundingModulus']))
+		n += 1
+	if 'IOIQty' in d:
+		add('27=' + str(d['IOIQty']))
+		n += 1
+	if 'Currency' in d:
+		add('15=' + str(d['Currency']))
+		n += 1
+	if 'NoStipulations' in d:
+		grp = d['NoStipulations']
+		add('232=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoStipulations(entry, fixm)
+		n += 1
+	if 'NoLegs' in d:
+		grp = d['NoLegs']
+		add('555=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoLegs(entry, fixm)
+		n += 1
+	if 'PriceType' in d:
+		add('423=' + str(d['PriceType']))
+		n += 1
+	if 'Price' in d:
+		add('44=' + str(d['Price']))
+		n += 1
+	if 'ValidUntilTime' in d:
+		add('62=' + str(d['ValidUntilTime']))
+		n += 1
+	if 'IOIQltyInd' in d:
+		add('25=' + str(d['IOIQltyInd']))
+		n += 1
+	if 'IOINaturalFlag' in d:
+		add('130=' + str(d['IOINaturalFlag']))
+		n += 1
+	if 'NoIOIQualifiers' in d:
+		grp = d['NoIOIQualifiers']
+		add('199=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoIOIQualifiers(entry, fixm)
+		n += 1
+	if 'Text' in d:
+		add('58=' + str(d['Text']))
+		n += 1
+	if 'EncodedTextLen' in d:
+		add('354=' + str(d['EncodedTextLen']))
+		n += 1
+	if 'EncodedText' in d:
+		add('355=' + str(d['EncodedText']))
+		n += 1
+	if 'TransactTime' in d:
+		add('60=' + str(d['TransactTime']))
+		n += 1
+	if 'URLLink' in d:
+		add('149=' + str(d['URLLink']))
+		n += 1
+	if 'NoRoutingIDs' in d:
+		grp = d['NoRoutingIDs']
+		add('215=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoRoutingIDs(entry, fixm)
+		n += 1
+	if 'Spread' in d:
+		add('218=' + str(d['Spread']))
+		n += 1
+	if 'BenchmarkCurveCurrency' in d:
+		add('220=' + str(d['BenchmarkCurveCurrency']))
+		n += 1
+	if 'BenchmarkCurveName' in d:
+		add('221=' + str(d['BenchmarkCurveName']))
+		n += 1
+	if 'BenchmarkCurvePoint' in d:
+		add('222=' + str(d['BenchmarkCurvePoint']))
+		n += 1
+	if 'BenchmarkPrice' in d:
+		add('662=' + str(d['BenchmarkPrice']))
+		n += 1
+	if 'BenchmarkPriceType' in d:
+		add('663=' + str(d['BenchmarkPriceType']))
+		n += 1
+	if 'BenchmarkSecurityID' in d:
+		add('699=' + str(d['BenchmarkSecurityID']))
+		n += 1
+	if 'BenchmarkSecurityIDSource' in d:
+		add('761=' + str(d['BenchmarkSecurityIDSource']))
+		n += 1
+	if 'YieldType' in d:
+		add('235=' + str(d['YieldType']))
+		n += 1
+	if 'Yield' in d:
+		add('236=' + str(d['Yield']))
+		n += 1
+	if 'YieldCalcDate' in d:
+		add('701=' + str(d['YieldCalcDate']))
+		n += 1
+	if 'YieldRedemptionDate' in d:
+		add('696=' + str(d['YieldRedemptionDate']))
+		n += 1
+	if 'YieldRedemptionPrice' in d:
+		add('697=' + str(d['YieldRedemptionPrice']))
+		n += 1
+	if 'YieldRedemptionPriceType' in d:
+		add('698=' + str(d['YieldRedemptionPriceType']))
+		n += 1
+	if len(d) > n:
+		_make_mbody(obj, obj._context, fixm, _msg_IndicationOfInterest_names)
+	return fixm
 
-class DerivativeSecurityList(FixObject):
-	pass
+def _decode_IndicationOfInterest(obj, fields, index, context):
+	d = obj.__dict__
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _msg_IndicationOfInterest_tags.get(num)
+		if spec is None:
+			# not a field of this message, continue with generic decoder
+			body, index = _extract_body(fields, index, context, obj)
+			return index
+		name, pytype, decode_grp = spec
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	return index
 
-class DerivativeSecurityListRequest(FixObject):
-	pass
+class IndicationOfInterest(FixObject):
+	_encode = staticmethod(_encode_IndicationOfInterest)
+	_decode = staticmethod(_decode_IndicationOfInterest)
 
-class DontKnowTrade(FixObject):
-	pass
+_msg_ListCancelRequest_names = frozenset(['ListID', 'TransactTime', 'TradeOriginationDate', 'TradeDate', 'Text', 'EncodedTextLen', 'EncodedText'])
 
-class Email(FixObject):
-	pass
+_msg_ListCancelRequest_tags = {
+	66: ('ListID', str, None),
+	60: ('TransactTime', str, None),
+	229: ('TradeOriginationDate', str, None),
+	75: ('TradeDate', str, None),
+	58: ('Text', str, None),
+	354: ('EncodedTextLen', str, None),
+	355: ('EncodedText', str, None),
+}
 
-class ExecutionReport(FixObject):
-	pass
+def _encode_ListCancelRequest(obj, fixm):
+	d = obj.__dict__
+	add = fixm.append
+	n = 1
+	if 'ListID' in d:
+		add('66=' + str(d['ListID']))
+		n += 1
+	if 'TransactTime' in d:
+		add('60=' + str(d['TransactTime']))
+		n += 1
+	if 'TradeOriginationDate' in d:
+		add('229=' + str(d['TradeOriginationDate']))
+		n += 1
+	if 'TradeDate' in d:
+		add('75=' + str(d['TradeDate']))
+		n += 1
+	if 'Text' in d:
+		add('58=' + str(d['Text']))
+		n += 1
+	if 'EncodedTextLen' in d:
+		add('354=' + str(d['EncodedTextLen']))
+		n += 1
+	if 'EncodedText' in d:
+		add('355=' + str(d['EncodedText']))
+		n += 1
+	if len(d) > n:
+		_make_mbody(obj, obj._context, fixm, _msg_ListCancelRequest_names)
+	return fixm
 
-class IndicationOfInterest(FixObject):
-	pass
+def _decode_ListCancelRequest(obj, fields, index, context):
+	d = obj.__dict__
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _msg_ListCancelRequest_tags.get(num)
+		if spec is None:
+			# not a field of this message, continue with generic decoder
+			body, index = _extract_body(fields, index, context, obj)
+			return index
+		name, pytype, decode_grp = spec
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	return index
 
 class ListCancelRequest(FixObject):
-	pass
+	_encode = staticmethod(_encode_ListCancelRequest)
+	_decode = staticmethod(_decode_ListCancelRequest)
+
+_msg_ListExecute_names = frozenset(['ListID', 'ClientBidID', 'BidID', 'TransactTime', 'Text', 'EncodedTextLen', 'EncodedText'])
+
+_msg_ListExecute_tags = {
+	66: ('ListID', str, None),
+	391: ('ClientBidID', str, None),
+	390: ('BidID', str, None),
+	60: ('TransactTime', str, None),
+	58: ('Text', str, None),
+	354: ('EncodedTextLen', str, None),
+	355: ('EncodedText', str, None),
+}
+
+def _encode_ListExecute(obj, fixm):
+	d = obj.__dict__
+	add = fixm.append
+	n = 1
+	if 'ListID' in d:
+		add('66=' + str(d['ListID']))
+		n += 1
+	if 'ClientBidID' in d:
+		add('391=' + str(d['ClientBidID']))
+		n += 1
+	if 'BidID' in d:
+		add('390=' + str(d['BidID']))
+		n += 1
+	if 'TransactTime' in d:
+		add('60=' + str(d['TransactTime']))
+		n += 1
+	if 'Text' in d:
+		add('58=' + str(d['Text']))
+		n += 1
+	if 'EncodedTextLen' in d:
+		add('354=' + str(d['EncodedTextLen']))
+		n += 1
+	if 'EncodedText' in d:
+		add('355=' + str(d['EncodedText']))
+		n += 1
+	if len(d) > n:
+		_make_mbody(obj, obj._context, fixm, _msg_ListExecute_names)
+	return fixm
+
+def _decode_ListExecute(obj, fields, index, context):
+	d = obj.__dict__
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _msg_ListExecute_tags.get(num)
+		if spec is None:
+			# not a field of this message, continue with generic decoder
+			body, index = _extract_body(fields, index, context, obj)
+			return index
+		name, pytype, decode_grp = spec
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	return index
 
 class ListExecute(FixObject):
-	pass
+	_encode = staticmethod(_encode_ListExecute)
+	_decode = staticmethod(_decode_ListExecute)
+
+_msg_ListStatus_names = frozenset(['ListID', 'ListStatusType', 'NoRpts', 'ListOrderStatus', 'RptSeq', 'ListStatusText', 'EncodedListStatusTextLen', 'EncodedListStatusText', 'TransactTime', 'TotNoOrders', 'LastFragment', 'NoOrders'])
+
+_msg_ListStatus_tags = {
+	66: ('ListID', str, None),
+	429: ('ListStatusType', int, None),
+	82: ('NoRpts', int, None),
+	431: ('ListOrderStatus', int, None),
+	83: ('RptSeq', int, None),
+	444: ('ListStatusText', str, None),
+	445: ('EncodedListStatusTextLen', str, None),
+	446: ('EncodedListStatusText', str, None),
+	60: ('TransactTime', str, None),
+	68: ('TotNoOrders', int, None),
+	893: ('LastFragment', str, None),
+	73: ('NoOrders', int, _decode_grp_NoOrders),
+}
+
+def _encode_ListStatus(obj, fixm):
+	d = obj.__dict__
+	add = fixm.append
+	n = 1
+	if 'ListID' in d:
+		add('66=' + str(d['ListID']))
+		n += 1
+	if 'ListStatusType' in d:
+		add('429=' + str(d['ListStatusType']))
+		n += 1
+	if 'NoRpts' in d:
+		add('82=' + str(d['NoRpts']))
+		n += 1
+	if 'ListOrderStatus' in d:
+		add('431=' + str(d['ListOrderStatus']))
+		n += 1
+	if 'RptSeq' in d:
+		add('83=' + str(d['RptSeq']))
+		n += 1
+	if 'ListStatusText' in d:
+		add('444=' + str(d['ListStatusText']))
+		n += 1
+	if 'EncodedListStatusTextLen' in d:
+		add('445=' + str(d['EncodedListStatusTextLen']))
+		n += 1
+	if 'EncodedListStatusText' in d:
+		add('446=' + str(d['EncodedListStatusText']))
+		n += 1
+	if 'TransactTime' in d:
+		add('60=' + str(d['TransactTime']))
+		n += 1
+	if 'TotNoOrders' in d:
+		add('68=' + str(d['TotNoOrders']))
+		n += 1
+	if 'LastFragment' in d:
+		add('893=' + str(d['LastFragment']))
+		n += 1
+	if 'NoOrders' in d:
+		grp = d['NoOrders']
+		add('73=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoOrders(entry, fixm)
+		n += 1
+	if len(d) > n:
+		_make_mbody(obj, obj._context, fixm, _msg_ListStatus_names)
+	return fixm
+
+def _decode_ListStatus(obj, fields, index, context):
+	d = obj.__dict__
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _msg_ListStatus_tags.get(num)
+		if spec is None:
+			# not a field of this message, continue with generic decoder
+			body, index = _extract_body(fields, index, context, obj)
+			return index
+		name, pytype, decode_grp = spec
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	return index
 
 class ListStatus(FixObject):
-	pass
+	_encode = staticmethod(_encode_ListStatus)
+	_decode = staticmethod(_decode_ListStatus)
+
+_msg_ListStatusRequest_names = frozenset(['ListID', 'Text', 'EncodedTextLen', 'EncodedText'])
+
+_msg_ListStatusRequest_tags = {
+	66: ('ListID', str, None),
+	58: ('Text', str, None),
+	354: ('EncodedTextLen', str, None),
+	355: ('EncodedText', str, None),
+}
+
+def _encode_ListStatusRequest(obj, fixm):
+	d = obj.__dict__
+	add = fixm.append
+	n = 1
+	if 'ListID' in d:
+		add('66=' + str(d['ListID']))
+		n += 1
+	if 'Text' in d:
+		add('58=' + str(d['Text']))
+		n += 1
+	if 'EncodedTextLen' in d:
+		add('354=' + str(d['EncodedTextLen']))
+		n += 1
+	if 'EncodedText' in d:
+		add('355=' + str(d['EncodedText']))
+		n += 1
+	if len(d) > n:
+		_make_mbody(obj, obj._context, fixm, _msg_ListStatusRequest_names)
+	return fixm
+
+def _decode_ListStatusRequest(obj, fields, index, context):
+	d = obj.__dict__
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _msg_ListStatusRequest_tags.get(num)
+		if spec is None:
+			# not a field of this message, continue with generic decoder
+			body, index = _extract_body(fields, index, context, obj)
+			return index
+		name, pytype, decode_grp = spec
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	return index
 
 class ListStatusRequest(FixObject):
-	pass
+	_encode = staticmethod(_encode_ListStatusRequest)
+	_decode = staticmethod(_decode_ListStatusRequest)
+
+_msg_ListStrikePrice_names = frozenset(['ListID', 'TotNoStrikes', 'LastFragment', 'NoStrikes', 'NoUnderlyings'])
+
+_msg_ListStrikePrice_tags = {
+	66: ('ListID', str, None),
+	422: ('TotNoStrikes', int, None),
+	893: ('LastFragment', str, None),
+	428: ('NoStrikes', int, _decode_grp_NoStrikes),
+	711: ('NoUnderlyings', int, _decode_grp_NoUnderlyings),
+}
+
+def _encode_ListStrikePrice(obj, fixm):
+	d = obj.__dict__
+	add = fixm.append
+	n = 1
+	if 'ListID' in d:
+		add('66=' + str(d['ListID']))
+		n += 1
+	if 'TotNoStrikes' in d:
+		add('422=' + str(d['TotNoStrikes']))
+		n += 1
+	if 'LastFragment' in d:
+		add('893=' + str(d['LastFragment']))
+		n += 1
+	if 'NoStrikes' in d:
+		grp = d['NoStrikes']
+		add('428=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoStrikes(entry, fixm)
+		n += 1
+	if 'NoUnderlyings' in d:
+		grp = d['NoUnderlyings']
+		add('711=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoUnderlyings(entry, fixm)
+		n += 1
+	if len(d) > n:
+		_make_mbody(obj, obj._context, fixm, _msg_ListStrikePrice_names)
+	return fixm
+
+def _decode_ListStrikePrice(obj, fields, index, context):
+	d = obj.__dict__
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _msg_ListStrikePrice_tags.get(num)
+		if spec is None:
+			# not a field of this message, continue with generic decoder
+			body, index = _extract_body(fields, index, context, obj)
+			return index
+		name, pytype, decode_grp = spec
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	return index
 
 class ListStrikePrice(FixObject):
-	pass
+	_encode = staticmethod(_encode_ListStrikePrice)
+	_decode = staticmethod(_decode_ListStrikePrice)
+
+_msg_MarketDataIncrementalRefresh_names = frozenset(['MDReqID', 'NoMDEntries', 'ApplQueueDepth', 'ApplQueueResolution'])
+
+_msg_MarketDataIncrementalRefresh_tags = {
+	262: ('MDReqID', str, None),
+	268: ('NoMDEntries', int, _decode_grp_NoMDEntries),
+	813: ('ApplQueueDepth', int, None),
+	814: ('ApplQueueResolution', int, None),
+}
+
+def _encode_MarketDataIncrementalRefresh(obj, fixm):
+	d = obj.__dict__
+	add = fixm.append
+	n = 1
+	if 'MDReqID' in d:
+		add('262=' + str(d['MDReqID']))
+		n += 1
+	if 'NoMDEntries' in d:
+		grp = d['NoMDEntries']
+		add('268=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoMDEntries(entry, fixm)
+		n += 1
+	if 'ApplQueueDepth' in d:
+		add('813=' + str(d['ApplQueueDepth']))
+		n += 1
+	if 'ApplQueueResolution' in d:
+		add('814=' + str(d['ApplQueueResolution']))
+		n += 1
+	if len(d) > n:
+		_make_mbody(obj, obj._context, fixm, _msg_MarketDataIncrementalRefresh_names)
+	return fixm
+
+def _decode_MarketDataIncrementalRefresh(obj, fields, index, context):
+	d = obj.__dict__
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _msg_MarketDataIncrementalRefresh_tags.get(num)
+		if spec is None:
+			# not a field of this message, continue with generic decoder
+			body, index = _extract_body(fields, index, context, obj)
+			return index
+		name, pytype, decode_grp = spec
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	return index
 
 class MarketDataIncrementalRefresh(FixObject):
-	pass
+	_encode = staticmethod(_encode_MarketDataIncrementalRefresh)
+	_decode = staticmethod(_decode_MarketDataIncrementalRefresh)
+
+_msg_MarketDataRequest_names = frozenset(['MDReqID', 'SubscriptionRequestType', 'MarketDepth', 'MDUpdateType', 'AggregatedBook', 'OpenCloseSettlFlag', 'Scope', 'MDImplicitDelete', 'NoMDEntryTypes', 'NoRelatedSym', 'NoTradingSessions', 'ApplQueueAction', 'ApplQueueMax'])
+
+_msg_MarketDataRequest_tags = {
+	262: ('MDReqID', str, None),
+	263: ('SubscriptionRequestType', str, None),
+	264: ('MarketDepth', int, None),
+	265: ('MDUpdateType', int, None),
+	266: ('AggregatedBook', str, None),
+	286: ('OpenCloseSettlFlag', str, None),
+	546: ('Scope', str, None),
+	547: ('MDImplicitDelete', str, None),
+	267: ('NoMDEntryTypes', int, _decode_grp_NoMDEntryTypes),
+	146: ('NoRelatedSym', int, _decode_grp_NoRelatedSym),
+	386: ('NoTradingSessions', int, _decode_grp_NoTradingSessions),
+	815: ('ApplQueueAction', int, None),
+	812: ('ApplQueueMax', int, None),
+}
+
+def _encode_MarketDataRequest(obj, fixm):
+	d = obj.__dict__
+	add = fixm.append
+	n = 1
+	if 'MDReqID' in d:
+		add('262=' + str(d['MDReqID']))
+		n += 1
+	if 'SubscriptionRequestType' in d:
+		add('263=' + str(d['SubscriptionRequestType']))
+		n += 1
+	if 'MarketDepth' in d:
+		add('264=' + str(d['MarketDepth']))
+		n += 1
+	if 'MDUpdateType' in d:
+		add('265=' + str(d['MDUpdateType']))
+		n += 1
+	if 'AggregatedBook' in d:
+		add('266=' + str(d['AggregatedBook']))
+		n += 1
+	if 'OpenCloseSettlFlag' in d:
+		add('286=' + str(d['OpenCloseSettlFlag']))
+		n += 1
+	if 'Scope' in d:
+		add('546=' + str(d['Scope']))
+		n += 1
+	if 'MDImplicitDelete' in d:
+		add('547=' + str(d['MDImplicitDelete']))
+		n += 1
+	if 'NoMDEntryTypes' in d:
+		grp = d['NoMDEntryTypes']
+		add('267=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoMDEntryTypes(entry, fixm)
+		n += 1
+	if 'NoRelatedSym' in d:
+		grp = d['NoRelatedSym']
+		add('146=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoRelatedSym(entry, fixm)
+		n += 1
+	if 'NoTradingSessions' in d:
+		grp = d['NoTradingSessions']
+		add('386=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoTradingSessions(entry, fixm)
+		n += 1
+	if 'ApplQueueAction' in d:
+		add('815=' + str(d['ApplQueueAction']))
+		n += 1
+	if 'ApplQueueMax' in d:
+		add('812=' + str(d['ApplQueueMax']))
+		n += 1
+	if len(d) > n:
+		_make_mbody(obj, obj._context, fixm, _msg_MarketDataRequest_names)
+	return fixm
+
+def _decode_MarketDataRequest(obj, fields, index, context):
+	d = obj.__dict__
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _msg_MarketDataRequest_tags.get(num)
+		if spec is None:
+			# not a field of this message, continue with generic decoder
+			body, index = _extract_body(fields, index, context, obj)
+			return index
+		name, pytype, decode_grp = spec
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	return index
 
 class MarketDataRequest(FixObject):
-	pass
+	_encode = staticmethod(_encode_MarketDataRequest)
+	_decode = staticmethod(_decode_MarketDataRequest)
+
+_msg_MarketDataRequestReject_names = frozenset(['MDReqID', 'MDReqRejReason', 'NoAltMDSource', 'Text', 'EncodedTextLen', 'EncodedText'])
+
+_msg_MarketDataRequestReject_tags = {
+	262: ('MDReqID', str, None),
+	281: ('MDReqRejReason', str, None),
+	816: ('NoAltMDSource', int, _decode_grp_NoAltMDSource),
+	58: ('Text', str, None),
+	354: ('EncodedTextLen', str, None),
+	355: ('EncodedText', str, None),
+}
+
+def _encode_MarketDataRequestReject(obj, fixm):
+	d = obj.__dict__
+	add = fixm.append
+	n = 1
+	if 'MDReqID' in d:
+		add('262=' + str(d['MDReqID']))
+		n += 1
+	if 'MDReqRejReason' in d:
+		add('281=' + str(d['MDReqRejReason']))
+		n += 1
+	if 'NoAltMDSource' in d:
+		grp = d['NoAltMDSource']
+		add('816=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoAltMDSource(entry, fixm)
+		n += 1
+	if 'Text' in d:
+		add('58=' + str(d['Text']))
+		n += 1
+	if 'EncodedTextLen' in d:
+		add('354=' + str(d['EncodedTextLen']))
+		n += 1
+	if 'EncodedText' in d:
+		add('355=' + str(d['EncodedText']))
+		n += 1
+	if len(d) > n:
+		_make_mbody(obj, obj._context, fixm, _msg_MarketDataRequestReject_names)
+	return fixm
+
+def _decode_MarketDataRequestReject(obj, fields, index, context):
+	d = obj.__dict__
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _msg_MarketDataRequestReject_tags.get(num)
+		if spec is None:
+			# not a field of this message, continue with generic decoder
+			body, index = _extract_body(fields, index, context, obj)
+			return index
+		name, pytype, decode_grp = spec
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	return index
 
 class MarketDataRequestReject(FixObject):
-	pass
+	_encode = staticmethod(_encode_MarketDataRequestReject)
+	_decode = staticmethod(_decode_MarketDataRequestReject)
+
+_msg_MarketDataSnapshotFullRefresh_names = frozenset(['MDReqID', 'Symbol', 'SymbolSfx', 'SecurityID', 'SecurityIDSource', 'NoSecurityAltID', 'Product', 'CFICode', 'SecurityType', 'SecuritySubType', 'MaturityMonthYear', 'MaturityDate', 'CouponPaymentDate', 'IssueDate', 'RepoCollateralSecurityType', 'RepurchaseTerm', 'RepurchaseRate', 'Factor', 'CreditRating', 'InstrRegistry', 'CountryOfIssue', 'StateOrProvinceOfIssue', 'LocaleOfIssue', 'RedemptionDate', 'StrikePrice', 'StrikeCurrency', 'OptAttribute', 'ContractMultiplier', 'CouponRate', 'SecurityExchange', 'Issuer', 'EncodedIssuerLen', 'EncodedIssuer', 'SecurityDesc', 'EncodedSecurityDescLen', 'EncodedSecurityDesc', 'Pool', 'ContractSettlMonth', 'CPProgram', 'CPRegType', 'NoEvents', 'DatedDate', 'InterestAccrualDate', 'NoUnderlyings', 'NoLegs', 'FinancialStatus', 'CorporateAction', 'NetChgPrevDay', 'NoMDEntries', 'ApplQueueDepth', 'ApplQueueResolution'])
+
+_msg_MarketDataSnapshotFullRefresh_tags = {
+	262: ('MDReqID', str, None),
+	55: ('Symbol', str, None),
+	65: ('SymbolSfx', str, None),
+	48: ('SecurityID', str, None),
+	22: ('SecurityIDSource', str, None),
+	454: ('NoSecurityAltID', int, _decode_grp_NoSecurityAltID),
+	460: ('Product', int, None),
+	461: ('CFICode', str, None),
+	167: ('SecurityType', str, None),
+	762: ('SecuritySubType', str, None),
+	200: ('MaturityMonthYear', str, None),
+	541: ('MaturityDate', str, None),
+	224: ('CouponPaymentDate', str, None),
+	225: ('IssueDate', str, None),
+	239: ('RepoCollateralSecurityType', int, None),
+	226: ('RepurchaseTerm', int, None),
+	227: ('RepurchaseRate', float, None),
+	228: ('Factor', float, None),
+	255: ('CreditRating', str, None),
+	543: ('InstrRegistry', str, None),
+	470: ('CountryOfIssue', str, None),
+	471: ('StateOrProvinceOfIssue', str, None),
+	472: ('LocaleOfIssue', str, None),
+	240: ('RedemptionDate', str, None),
+	202: ('StrikePrice', float, None),
+	947: ('StrikeCurrency', str, None),
+	206: ('OptAttribute', str, None),
+	231: ('ContractMultiplier', float, None),
+	223: ('CouponRate', float, None),
+	207: ('SecurityExchange', str, None),
+	106: ('Issuer', str, None),
+	348: ('EncodedIssuerLen', str, None),
+	349: ('EncodedIssuer', str, None),
+	107: ('SecurityDesc', str, None),
+	350: ('EncodedSecurityDescLen', str, None),
+	351: ('EncodedSecurityDesc', str, None),
+	691: ('Pool', str, None),
+	667: ('ContractSettlMonth', str, None),
+	875: ('CPProgram', int, None),
+	876: ('CPRegType', str, None),
+	864: ('NoEvents', int, _decode_grp_NoEvents),
+	873: ('DatedDate', str, None),
+	874: ('InterestAccrualDate', str, None),
+	711: ('NoUnderlyings', int, _decode_grp_NoUnderlyings),
+	555: ('NoLegs', int, _decode_grp_NoLegs),
+	291: ('FinancialStatus', str, None),
+	292: ('CorporateAction', str, None),
+	451: ('NetChgPrevDay', float, None),
+	268: ('NoMDEntries', int, _decode_grp_NoMDEntries),
+	813: ('ApplQueueDepth', int, None),
+	814: ('ApplQueueResolution', int, None),
+}
+
+def _encode_MarketDataSnapshotFullRefresh(obj, fixm):
+	d = obj.__dict__
+	add = fixm.append
+	n = 1
+	if 'MDReqID' in d:
+		add('262=' + str(d['MDReqID']))
+		n += 1
+	if 'Symbol' in d:
+		add('55=' + str(d['Symbol']))
+		n += 1
+	if 'SymbolSfx' in d:
+		add('65=' + str(d['SymbolSfx']))
+		n += 1
+	if 'SecurityID' in d:
+		add('48=' + str(d['SecurityID']))
+		n += 1
+	if 'SecurityIDSource' in d:
+		add('22=' + str(d['SecurityIDSource']))
+		n += 1
+	if 'NoSecurityAltID' in d:
+		grp = d['NoSecurityAltID']
+		add('454=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoSecurityAltID(entry, fixm)
+		n += 1
+	if 'Product' in d:
+		add('460=' + str(d['Product']))
+		n += 1
+	if 'CFICode' in d:
+		add('461=' + str(d['CFICode']))
+		n += 1
+	if 'SecurityType' in d:
+		add('167=' + str(d['SecurityType']))
+		n += 1
+	if 'SecuritySubType' in d:
+		add('762=' + str(d['SecuritySubType']))
+		n += 1
+	if 'MaturityMonthYear' in d:
+		add('200=' + str(d['MaturityMonthYear']))
+		n += 1
+	if 'MaturityDate' in d:
+		add('541=' + str(d['MaturityDate']))
+		n += 1
+	if 'CouponPaymentDate' in d:
+		add('224=' + str(d['CouponPaymentDate']))
+		n += 1
+	if 'IssueDate' in d:
+		add('225=' + str(d['IssueDate']))
+		n += 1
+	if 'RepoCollateralSecurityType' in d:
+		add('239=' + str(d['RepoCollateralSecurityType']))
+		n += 1
+	if 'RepurchaseTerm' in d:
+		add('226=' + str(d['RepurchaseTerm']))
+		n += 1
+	if 'RepurchaseRate' in d:
+		add('227=' + str(d['RepurchaseRate']))
+		n += 1
+	if 'Factor' in d:
+		add('228=' + str(d['Factor']))
+		n += 1
+	if 'CreditRating' in d:
+		add('255=' + str(d['CreditRating']))
+		n += 1
+	if 'InstrRegistry' in d:
+		add('543=' + str(d['InstrRegistry']))
+		n += 1
+	if 'CountryOfIssue' in d:
+		add('470=' + str(d['CountryOfIssue']))
+		n += 1
+	if 'StateOrProvinceOfIssue' in d:
+		add('471=' + str(d['StateOrProvinceOfIssue']))
+		n += 1
+	if 'LocaleOfIssue' in d:
+		add('472=' + str(d['LocaleOfIssue']))
+		n += 1
+	if 'RedemptionDate' in d:
+		add('240=' + str(d['RedemptionDate']))
+		n += 1
+	if 'StrikePrice' in d:
+		add('202=' + str(d['StrikePrice']))
+		n += 1
+	if 'StrikeCurrency' in d:
+		add('947=' + str(d['StrikeCurrency']))
+		n += 1
+	if 'OptAttribute' in d:
+		add('206=' + str(d['OptAttribute']))
+		n += 1
+	if 'ContractMultiplier' in d:
+		add('231=' + str(d['ContractMultiplier']))
+		n += 1
+	if 'CouponRate' in d:
+		add('223=' + str(d['CouponRate']))
+		n += 1
+	if 'SecurityExchange' in d:
+		add('207=' + str(d['SecurityExchange']))
+		n += 1
+	if 'Issuer' in d:
+		add('106=' + str(d['Issuer']))
+		n += 1
+	if 'EncodedIssuerLen' in d:
+		add('348=' + str(d['EncodedIssuerLen']))
+		n += 1
+	if 'EncodedIssuer' in d:
+		add('349=' + str(d['EncodedIssuer']))
+		n += 1
+	if 'SecurityDesc' in d:
+		add('107=' + str(d['SecurityDesc']))
+		n += 1
+	if 'EncodedSecurityDescLen' in d:
+		add('350=' + str(d['EncodedSecurityDescLen']))
+		n += 1
+	if 'EncodedSecurityDesc' in d:
+		add('351=' + str(d['EncodedSecurityDesc']))
+		n += 1
+	if 'Pool' in d:
+		add('691=' + str(d['Pool']))
+		n += 1
+	if 'ContractSettlMonth' in d:
+		add('667=' + str(d['ContractSettlMonth']))
+		n += 1
+	if 'CPProgram' in d:
+		add('875=' + str(d['CPProgram']))
+		n += 1
+	if 'CPRegType' in d:
+		add('876=' + str(d['CPRegType']))
+		n += 1
+	if 'NoEvents' in d:
+		grp = d['NoEvents']
+		add('864=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoEvents(entry, fixm)
+		n += 1
+	if 'DatedDate' in d:
+		add('873=' + str(d['DatedDate']))
+		n += 1
+	if 'InterestAccrualDate' in d:
+		add('874=' + str(d['InterestAccrualDate']))
+		n += 1
+	if 'NoUnderlyings' in d:
+		grp = d['NoUnderlyings']
+		add('711=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoUnderlyings(entry, fixm)
+		n += 1
+	if 'NoLegs' in d:
+		grp = d['NoLegs']
+		add('555=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoLegs(entry, fixm)
+		n += 1
+	if 'FinancialStatus' in d:
+		add('291=' + str(d['FinancialStatus']))
+		n += 1
+	if 'CorporateAction' in d:
+		add('292=' + str(d['CorporateAction']))
+		n += 1
+	if 'NetChgPrevDay' in d:
+		add('451=' + str(d['NetChgPrevDay']))
+		n += 1
+	if 'NoMDEntries' in d:
+		grp = d['NoMDEntries']
+		add('268=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoMDEntries(entry, fixm)
+		n += 1
+	if 'ApplQueueDepth' in d:
+		add('813=' + str(d['ApplQueueDepth']))
+		n += 1
+	if 'ApplQueueResolution' in d:
+		add('814=' + str(d['ApplQueueResolution']))
+		n += 1
+	if len(d) > n:
+		_make_mbody(obj, obj._context, fixm, _msg_MarketDataSnapshotFullRefresh_names)
+	return fixm
+
+def _decode_MarketDataSnapshotFullRefresh(obj, fields, index, context):
+	d = obj.__dict__
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _msg_MarketDataSnapshotFullRefresh_tags.get(num)
+		if spec is None:
+			# not a field of this message, continue with generic decoder
+			body, index = _extract_body(fields, index, context, obj)
+			return index
+		name, pytype, decode_grp = spec
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	return index
 
 class MarketDataSnapshotFullRefresh(FixObject):
-	pass
+	_encode = staticmethod(_encode_MarketDataSnapshotFullRefresh)
+	_decode = staticmethod(_decode_MarketDataSnapshotFullRefresh)
+
+_msg_MassQuote_names = frozenset(['QuoteReqID', 'QuoteID', 'QuoteType', 'QuoteResponseLevel', 'NoPartyIDs', 'Account', 'AcctIDSource', 'AccountType', 'DefBidSize', 'DefOfferSize', 'NoQuoteSets'])
+
+_msg_MassQuote_tags = {
+	131: ('QuoteReqID', str, None),
+	117: ('QuoteID', str, None),
+	537: ('QuoteType', int, None),
+	301: ('QuoteResponseLevel', int, None),
+	453: ('NoPartyIDs', int, _decode_grp_NoPartyIDs),
+	1: ('Account', str, None),
+	660: ('AcctIDSource', int, None),
+	581: ('AccountType', int, None),
+	293: ('DefBidSize', float, None),
+	294: ('DefOfferSize', float, None),
+	296: ('NoQuoteSets', int, _decode_grp_NoQuoteSets),
+}
+
+def _encode_MassQuote(obj, fixm):
+	d = obj.__dict__
+	add = fixm.append
+	n = 1
+	if 'QuoteReqID' in d:
+		add('131=' + str(d['QuoteReqID']))
+		n += 1
+	if 'QuoteID' in d:
+		add('117=' + str(d['QuoteID']))
+		n += 1
+	if 'QuoteType' in d:
+		add('537=' + str(d['QuoteType']))
+		n += 1
+	if 'QuoteResponseLevel' in d:
+		add('301=' + str(d['QuoteResponseLevel']))
+		n += 1
+	if 'NoPartyIDs' in d:
+		grp = d['NoPartyIDs']
+		add('453=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoPartyIDs(entry, fixm)
+		n += 1
+	if 'Account' in d:
+		add('1=' + str(d['Account']))
+		n += 1
+	if 'AcctIDSource' in d:
+		add('660=' + str(d['AcctIDSource']))
+		n += 1
+	if 'AccountType' in d:
+		add('581=' + str(d['AccountType']))
+		n += 1
+	if 'DefBidSize' in d:
+		add('293=' + str(d['DefBidSize']))
+		n += 1
+	if 'DefOfferSize' in d:
+		add('294=' + str(d['DefOfferSize']))
+		n += 1
+	if 'NoQuoteSets' in d:
+		grp = d['NoQuoteSets']
+		add('296=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoQuoteSets(entry, fixm)
+		n += 1
+	if len(d) > n:
+		_make_mbody(obj, obj._context, fixm, _msg_MassQuote_names)
+	return fixm
+
+def _decode_MassQuote(obj, fields, index, context):
+	d = obj.__dict__
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _msg_MassQuote_tags.get(num)
+		if spec is None:
+			# not a field of this message, continue with generic decoder
+			body, index = _extract_body(fields, index, context, obj)
+			return index
+		name, pytype, decode_grp = spec
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	return index
 
 class MassQuote(FixObject):
-	pass
+	_encode = staticmethod(_encode_MassQuote)
+	_decode = staticmethod(_decode_MassQuote)
+
+_msg_MassQuoteAcknowledgement_names = frozenset(['QuoteReqID', 'QuoteID', 'QuoteStatus', 'QuoteRejectReason', 'QuoteResponseLevel', 'QuoteType', 'NoPartyIDs', 'Account', 'AcctIDSource', 'AccountType', 'Text', 'EncodedTextLen', 'EncodedText', 'NoQuoteSets'])
+
+_msg_MassQuoteAcknowledgement_tags = {
+	131: ('QuoteReqID', str, None),
+	117: ('QuoteID', str, None),
+	297: ('QuoteStatus', int, None),
+	300: ('QuoteRejectReason', int, None),
+	301: ('QuoteResponseLevel', int, None),
+	537: ('QuoteType', int, None),
+	453: ('NoPartyIDs', int, _decode_grp_NoPartyIDs),
+	1: ('Account', str, None),
+	660: ('AcctIDSource', int, None),
+	581: ('AccountType', int, None),
+	58: ('Text', str, None),
+	354: ('EncodedTextLen', str, None),
+	355: ('EncodedText', str, None),
+	296: ('NoQuoteSets', int, _decode_grp_NoQuoteSets),
+}
+
+def _encode_MassQuoteAcknowledgement(obj, fixm):
+	d = obj.__dict__
+	add = fixm.append
+	n = 1
+	if 'QuoteReqID' in d:
+		add('131=' + str(d['QuoteReqID']))
+		n += 1
+	if 'QuoteID' in d:
+		add('117=' + str(d['QuoteID']))
+		n += 1
+	if 'QuoteStatus' in d:
+		add('297=' + str(d['QuoteStatus']))
+		n += 1
+	if 'QuoteRejectReason' in d:
+		add('300=' + str(d['QuoteRejectReason']))
+		n += 1
+	if 'QuoteResponseLevel' in d:
+		add('301=' + str(d['QuoteResponseLevel']))
+		n += 1
+	if 'QuoteType' in d:
+		add('537=' + str(d['QuoteType']))
+		n += 1
+	if 'NoPartyIDs' in d:
+		grp = d['NoPartyIDs']
+		add('453=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoPartyIDs(entry, fixm)
+		n += 1
+	if 'Account' in d:
+		add('1=' + str(d['Account']))
+		n += 1
+	if 'AcctIDSource' in d:
+		add('660=' + str(d['AcctIDSource']))
+		n += 1
+	if 'AccountType' in d:
+		add('581=' + str(d['AccountType']))
+		n += 1
+	if 'Text' in d:
+		add('58=' + str(d['Text']))
+		n += 1
+	if 'EncodedTextLen' in d:
+		add('354=' + str(d['EncodedTextLen']))
+		n += 1
+	if 'EncodedText' in d:
+		add('355=' + str(d['EncodedText']))
+		n += 1
+	if 'NoQuoteSets' in d:
+		grp = d['NoQuoteSets']
+		add('296=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoQuoteSets(entry, fixm)
+		n += 1
+	if len(d) > n:
+		_make_mbody(obj, obj._context, fixm, _msg_MassQuoteAcknowledgement_names)
+	return fixm
+
+def _decode_MassQuoteAcknowledgement(obj, fields, index, context):
+	d = obj.__dict__
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _msg_MassQuoteAcknowledgement_tags.get(num)
+		if spec is None:
+			# not a field of this message, continue with generic decoder
+			body, index = _extract_body(fields, index, context, obj)
+			return index
+		name, pytype, decode_grp = spec
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	return index
 
 class MassQuoteAcknowledgement(FixObject):
-	pass
+	_encode = staticmethod(_encode_MassQuoteAcknowledgement)
+	_decode = staticmethod(_decode_MassQuoteAcknowledgement)
+
+_msg_MultilegOrderCancelReplaceRequest_names = frozenset(['OrderID', 'OrigClOrdID', 'ClOrdID', 'SecondaryClOrdID', 'ClOrdLinkID', 'OrigOrdModTime', 'NoPartyIDs', 'TradeOriginationDate', 'TradeDate', 'Account', 'AcctIDSource', 'AccountType', 'DayBookingInst', 'BookingUnit', 'PreallocMethod', 'AllocID', 'NoAllocs', 'SettlType', 'SettlDate', 'CashMargin', 'ClearingFeeIndicator', 'HandlInst', 'ExecInst', 'MinQty', 'MaxFloor', 'ExDestination', 'NoTradingSessions', 'ProcessCode', 'Side', 'Symbol', 'SymbolSfx', 'SecurityID', 'SecurityIDSource', 'NoSecurityAltID', 'Product', 'CFICode', 'SecurityType', 'SecuritySubType', 'MaturityMonthYear', 'MaturityDate', 'CouponPaymentDate', 'IssueDate', 'RepoCollateralSecurityType', 'RepurchaseTerm', 'RepurchaseRate', 'Factor', 'CreditRating', 'InstrRegistry', 'CountryOfIssue', 'StateOrProvinceOfIssue', 'LocaleOfIssue', 'RedemptionDate', 'StrikePrice', 'StrikeCurrency', 'OptAttribute', 'ContractMultiplier', 'CouponRate', 'SecurityExchange', 'Issuer', 'EncodedIssuerLen', 'EncodedIssuer', 'SecurityDesc', 'EncodedSecurityDescLen', 'EncodedSecurityDesc', 'Pool', 'ContractSettlMonth', 'CPProgram', 'CPRegType', 'NoEvents', 'DatedDate', 'InterestAccrualDate', 'NoUnderlyings', 'PrevClosePx', 'NoLegs', 'LocateReqd', 'TransactTime', 'QtyType', 'OrderQty', 'CashOrderQty', 'OrderPercent', 'RoundingDirection', 'RoundingModulus', 'OrdType', 'PriceType', 'Price', 'StopPx', 'Currency', 'ComplianceID', 'SolicitedFlag', 'IOIid', 'QuoteID', 'TimeInForce', 'EffectiveTime', 'ExpireDate', 'ExpireTime', 'GTBookingInst', 'Commission', 'CommType', 'CommCurrency', 'FundRenewWaiv', 'OrderCapacity', 'OrderRestrictions', 'CustOrderCapacity', 'ForexReq', 'SettlCurrency', 'BookingType', 'Text', 'EncodedTextLen', 'EncodedText', 'PositionEffect', 'CoveredOrUncovered', 'MaxShow', 'PegOffsetValue', 'PegMoveType', 'PegOffsetType', 'PegLimitType', 'PegRoundDirection', 'PegScope', 'DiscretionInst', 'DiscretionOffsetValue', 'DiscretionMoveType', 'DiscretionOffsetType', 'DiscretionLimitType', 'DiscretionRoundDirection', 'DiscretionScope', 'TargetStrategy', 'TargetStrategyParameters', 'ParticipationRate', 'CancellationRights', 'MoneyLaunderingStatus', 'RegistID', 'Designation', 'MultiLegRptTypeReq'])
+
+_msg_MultilegOrderCancelReplaceRequest_tags = {
+	37: ('OrderID', str, None),
+	41: ('OrigClOrdID', str, None),
+	11: ('ClOrdID', str, None),
+	526: ('SecondaryClOrdID', str, None),
+	583: ('ClOrdLinkID', str, None),
+	586: ('OrigOrdModTime', str, None),
+	453: ('NoPartyIDs', int, _decode_grp_NoPartyIDs),
+	229: ('TradeOriginationDate', str, None),
+	75: ('TradeDate', str, None),
+	1: ('Account', str, None),
+	660: ('AcctIDSource', int, None),
+	581: ('AccountType', int, None),
+	589: ('DayBookingInst', str, None),
+	590: ('BookingUnit', str, None),
+	591: ('PreallocMethod', str, None),
+	70: ('AllocID', str, None),
+	78: ('NoAllocs', int, _decode_grp_NoAllocs),
+	63: ('SettlType', str, None),
+	64: ('SettlDate', str, None),
+	544: ('CashMargin', str, None),
+	635: ('ClearingFeeIndicator', str, None),
+	21: ('HandlInst', str, None),
+	18: ('ExecInst', str, None),
+	110: ('MinQty', float, None),
+	111: ('MaxFloor', float, None),
+	100: ('ExDestination', str, None),
+	386: ('NoTradingSessions', int, _decode_grp_NoTradingSessions),
+	81: ('ProcessCode', str, None),
+	54: ('Side', str, None),
+	55: ('Symbol', str, None),
+	65: ('SymbolSfx', str, None),
+	48: ('SecurityID', str, None),
+	22: ('SecurityIDSource', str, None),
+	454: ('NoSecurityAltID', int, _decode_grp_NoSecurityAltID),
+	460: ('Product', int, None),
+	461: ('CFICode', str, None),
+	167: ('SecurityType', str, None),
+	762: ('SecuritySubType', str, None),
+	200: ('MaturityMonthYear', str, None),
+	541: ('MaturityDate', str, None),
+	224: ('CouponPaymentDate', str, None),
+	225: ('IssueDate', str, None),
+	239: ('RepoCollateralSecurityType', int, None),
+	226: ('RepurchaseTerm', int, None),
+	227: ('RepurchaseRate', float, None),
+	228: ('Factor', float, None),
+	255: ('CreditRating', str, None),
+	543: ('InstrRegistry', str, None),
+	470: ('CountryOfIssue', str, None),
+	471: ('StateOrProvinceOfIssue', str, None),
+	472: ('LocaleOfIssue', str, None),
+	240: ('RedemptionDate', str, None),
+	202: ('StrikePrice', float, None),
+	947: ('StrikeCurrency', str, None),
+	206: ('OptAttribute', str, None),
+	231: ('ContractMultiplier', float, None),
+	223: ('CouponRate', float, None),
+	207: ('SecurityExchange', str, None),
+	106: ('Issuer', str, None),
+	348: ('EncodedIssuerLen', str, None),
+	349: ('EncodedIssuer', str, None),
+	107: ('SecurityDesc', str, None),
+	350: ('EncodedSecurityDescLen', str, None),
+	351: ('EncodedSecurityDesc', str, None),
+	691: ('Pool', str, None),
+	667: ('ContractSettlMonth', str, None),
+	875: ('CPProgram', int, None),
+	876: ('CPRegType', str, None),
+	864: ('NoEvents', int, _decode_grp_NoEvents),
+	873: ('DatedDate', str, None),
+	874: ('InterestAccrualDate', str, None),
+	711: ('NoUnderlyings', int, _decode_grp_NoUnderlyings),
+	140: ('PrevClosePx', float, None),
+	555: ('NoLegs', int, _decode_grp_NoLegs),
+	114: ('LocateReqd', str, None),
+	60: ('TransactTime', str, None),
+	854: ('QtyType', int, None),
+	38: ('OrderQty', float, None),
+	152: ('CashOrderQty', float, None),
+	516: ('OrderPercent', float, None),
+	468: ('RoundingDirection', str, None),
+	469: ('RoundingModulus', float, None),
+	40: ('OrdType', str, None),
+	423: ('PriceType', int, None),
+	44: ('Price', float, None),
+	99: ('StopPx', float, None),
+	15: ('Currency', str, None),
+	376: ('ComplianceID', str, None),
+	377: ('SolicitedFlag', str, None),
+	23: ('IOIid', str, None),
+	117: ('QuoteID', str, None),
+	59: ('TimeInForce', str, None),
+	168: ('EffectiveTime', str, None),
+	432: ('ExpireDate', str, None),
+	126: ('ExpireTime', str, None),
+	427: ('GTBookingInst', int, None),
+	12: ('Commission', float, None),
+	13: ('CommType', str, None),
+	479: ('CommCurrency', str, None),
+	497: ('FundRenewWaiv', str, None),
+	528: ('OrderCapacity', str, None),
+	529: ('OrderRestrictions', str, None),
+	582: ('CustOrderCapacity', int, None),
+	121: ('ForexReq', str, None),
+	120: ('SettlCurrency', str, None),
+	775: ('BookingType', int, None),
+	58: ('Text', str, None),
+	354: ('EncodedTextLen', str, None),
+	355: ('EncodedText', str, None),
+	77: ('PositionEffect', str, None),
+	203: ('CoveredOrUncovered', int, None),
+	210: ('MaxShow', float, None),
+	211: ('PegOffsetValue', float, None),
+	835: ('PegMoveType', int, None),
+	836: ('PegOffsetType', int, None),
+	837: ('PegLimitType', int, None),
+	838: ('PegRoundDirection', int, None),
+	840: ('PegScope', int, None),
+	388: ('DiscretionInst', str, None),
+	389: ('DiscretionOffsetValue', float, None),
+	841: ('DiscretionMoveType', int, None),
+	842: ('DiscretionOffsetType', int, None),
+	843: ('DiscretionLimitType', int, None),
+	844: ('DiscretionRoundDirection', int, None),
+	846: ('DiscretionScope', int, None),
+	847: ('TargetStrategy', int, None),
+	848: ('TargetStrategyParameters', str, None),
+	849: ('ParticipationRate', float, None),
+	480: ('CancellationRights', str, None),
+	481: ('MoneyLaunderingStatus', str, None),
+	513: ('RegistID', str, None),
+	494: ('Designation', str, None),
+	563: ('MultiLegRptTypeReq', int, None),
+}
+
+def _encode_MultilegOrderCancelReplaceRequest(obj, fixm):
+	d = obj.__dict__
+	add = fixm.append
+	n = 1
+	if 'OrderID' in d:
+		add('37=' + str(d['OrderID']))
+		n += 1
+	if 'OrigClOrdID' in d:
+		add('41=' + str(d['OrigClOrdID']))
+		n += 1
+	if 'ClOrdID' in d:
+		add('11=' + str(d['ClOrdID']))
+		n += 1
+	if 'SecondaryClOrdID' in d:
+		add('526=' + str(d['SecondaryClOrdID']))
+		n += 1
+	if 'ClOrdLinkID' in d:
+		add('583=' + str(d['ClOrdLinkID']))
+		n += 1
+	if 'OrigOrdModTime' in d:
+		add('586=' + str(d['OrigOrdModTime']))
+		n += 1
+	if 'NoPartyIDs' in d:
+		grp = d['NoPartyIDs']
+		add('453=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoPartyIDs(entry, fixm)
+		n += 1
+	if 'TradeOriginationDate' in d:
+		add('229=' + str(d['TradeOriginationDate']))
+		n += 1
+	if 'TradeDate' in d:
+		add('75=' + str(d['TradeDate']))
+		n += 1
+	if 'Account' in d:
+		add('1=' + str(d['Account']))
+		n += 1
+	if 'AcctIDSource' in d:
+		add('660=' + str(d['AcctIDSource']))
+		n += 1
+	if 'AccountType' in d:
+		add('581=' + str(d['AccountType']))
+		n += 1
+	if 'DayBookingInst' in d:
+		add('589=' + str(d['DayBookingInst']))
+		n += 1
+	if 'BookingUnit' in d:
+		add('590=' + str(d['BookingUnit']))
+		n += 1
+	if 'PreallocMethod' in d:
+		add('591=' + str(d['PreallocMethod']))
+		n += 1
+	if 'AllocID' in d:
+		add('70=' + str(d['AllocID']))
+		n += 1
+	if 'NoAllocs' in d:
+		grp = d['NoAllocs']
+		add('78=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoAllocs(entry, fixm)
+		n += 1
+	if 'SettlType' in d:
+		add('63=' + str(d['SettlType']))
+		n += 1
+	if 'SettlDate' in d:
+		add('64=' + str(d['SettlDate']))
+		n += 1
+	if 'CashMargin' in d:
+		add('544=' + str(d['CashMargin']))
+		n += 1
+	if 'ClearingFeeIndicator' in d:
+		add('635=' + str(d['ClearingFeeIndicator']))
+		n += 1
+	if 'HandlInst' in d:
+		add('21=' + str(d['HandlInst']))
+		n += 1
+	if 'ExecInst' in d:
+		add('18=' + str(d['ExecInst']))
+		n += 1
+	if 'MinQty' in d:
+		add('110=' + str(d['MinQty']))
+		n += 1
+	if 'MaxFloor' in d:
+		add('111=' + str(d['MaxFloor']))
+		n += 1
+	if 'ExDestination' in d:
+		add('100=' + str(d['ExDestination']))
+		n += 1
+	if 'NoTradingSessions' in d:
+		grp = d['NoTradingSessions']
+		add('386=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoTradingSessions(entry, fixm)
+		n += 1
+	if 'ProcessCode' in d:
+		add('81=' + str(d['ProcessCode']))
+		n += 1
+	if 'Side' in d:
+		add('54=' + str(d['Side']))
+		n += 1
+	if 'Symbol' in d:
+		add('55=' + str(d['Symbol']))
+		n += 1
+	if 'SymbolSfx' in d:
+		add('65=' + str(d['SymbolSfx']))
+		n += 1
+	if 'SecurityID' in d:
+		add('48=' + str(d['SecurityID']))
+		n += 1
+	if 'SecurityIDSource' in d:
+		add('22=' + str(d['SecurityIDSource']))
+		n += 1
+	if 'NoSecurityAltID' in d:
+		grp = d['NoSecurityAltID']
+		add('454=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoSecurityAltID(entry, fixm)
+		n += 1
+	if 'Product' in d:
+		add('460=' + str(d['Product']))
+		n += 1
+	if 'CFICode' in d:
+		add('461=' + str(d['CFICode']))
+		n += 1
+	if 'SecurityType' in d:
+		add('167=' + str(d['SecurityType']))
+		n += 1
+	if 'SecuritySubType' in d:
+		add('762=' + str(d['SecuritySubType']))
+		n += 1
+	if 'MaturityMonthYear' in d:
+		add('200=' + str(d['MaturityMonthYear']))
+		n += 1
+	if 'MaturityDate' in d:
+		add('541=' + str(d['MaturityDate']))
+		n += 1
+	if 'CouponPaymentDate' in d:
+		add('224=' + str(d['CouponPaymentDate']))
+		n += 1
+	if 'IssueDate' in d:
+		add('225=' + str(d['IssueDate']))
+		n += 1
+	if 'RepoCollateralSecurityType' in d:
+		add('239=' + str(d['RepoCollateralSecurityType']))
+		n += 1
+	if 'RepurchaseTerm' in d:
+		add('226=' + str(d['RepurchaseTerm']))
+		n += 1
+	if 'RepurchaseRate' in d:
+		add('227=' + str(d['RepurchaseRate']))
+		n += 1
+	if 'Factor' in d:
+		add('228=' + str(d['Factor']))
+		n += 1
+	if 'CreditRating' in d:
+		add('255=' + str(d['CreditRating']))
+		n += 1
+	if 'InstrRegistry' in d:
+		add('543=' + str(d['InstrRegistry']))
+		n += 1
+	if 'CountryOfIssue' in d:
+		add('470=' + str(d['CountryOfIssue']))
+		n += 1
+	if 'StateOrProvinceOfIssue' in d:
+		add('471=' + str(d['StateOrProvinceOfIssue']))
+		n += 1
+	if 'LocaleOfIssue' in d:
+		add('472=' + str(d['LocaleOfIssue']))
+		n += 1
+	if 'RedemptionDate' in d:
+		add('240=' + str(d['RedemptionDate']))
+		n += 1
+	if 'StrikePrice' in d:
+		add('202=' + str(d['StrikePrice']))
+		n += 1
+	if 'StrikeCurrency' in d:
+		add('947=' + str(d['StrikeCurrency']))
+		n += 1
+	if 'OptAttribute' in d:
+		add('206=' + str(d['OptAttribute']))
+		n += 1
+	if 'ContractMultiplier' in d:
+		add('231=' + str(d['ContractMultiplier']))
+		n += 1
+	if 'CouponRate' in d:
+		add('223=' + str(d['CouponRate']))
+		n += 1
+	if 'SecurityExchange' in d:
+		add('207=' + str(d['SecurityExchange']))
+		n += 1
+	if 'Issuer' in d:
+		add('106=' + str(d['Issuer']))
+		n += 1
+	if 'EncodedIssuerLen' in d:
+		add('348=' + str(d['EncodedIssuerLen']))
+		n += 1
+	if 'EncodedIssuer' in d:
+		add('349=' + str(d['EncodedIssuer']))
+		n += 1
+	if 'SecurityDesc' in d:
+		add('107=' + str(d['SecurityDesc']))
+		n += 1
+	if 'EncodedSecurityDescLen' in d:
+		add('350=' + str(d['EncodedSecurityDescLen']))
+		n += 1
+	if 'EncodedSecurityDesc' in d:
+		add('351=' + str(d['EncodedSecurityDesc']))
+		n += 1
+	if 'Pool' in d:
+		add('691=' + str(d['Pool']))
+		n += 1
+	if 'ContractSettlMonth' in d:
+		add('667=' + str(d['ContractSettlMonth']))
+		n += 1
+	if 'CPProgram' in d:
+		add('875=' + str(d['CPProgram']))
+		n += 1
+	if 'CPRegType' in d:
+		add('876=' + str(d['CPRegType']))
+		n += 1
+	if 'NoEvents' in d:
+		grp = d['NoEvents']
+		add('864=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoEvents(entry, fixm)
+		n += 1
+	if 'DatedDate' in d:
+		add('873=' + str(d['DatedDate']))
+		n += 1
+	if 'InterestAccrualDate' in d:
+		add('874=' + str(d['InterestAccrualDate']))
+		n += 1
+	if 'NoUnderlyings' in d:
+		grp = d['NoUnderlyings']
+		add('711=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoUnderlyings(entry, fixm)
+		n += 1
+	if 'PrevClosePx' in d:
+		add('140=' + str(d['PrevClosePx']))
+		n += 1
+	if 'NoLegs' in d:
+		grp = d['NoLegs']
+		add('555=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoLegs(entry, fixm)
+		n += 1
+	if 'LocateReqd' in d:
+		add('114=' + str(d['LocateReqd']))
+		n += 1
+	if 'TransactTime' in d:
+		add('60=' + str(d['TransactTime']))
+		n += 1
+	if 'QtyType' in d:
+		add('854=' + str(d['QtyType']))
+		n += 1
+	if 'OrderQty' in d:
+		add('38=' + str(d['OrderQty']))
+		n += 1
+	if 'CashOrderQty' in d:
+		add('152=' + str(d['CashOrderQty']))
+		n += 1
+	if 'OrderPercent' in d:
+		add('516=' + str(d['OrderPercent']))
+		n += 1
+	if 'RoundingDirection' in d:
+		add('468=' + str(d['RoundingDirection']))
+		n += 1
+	if 'RoundingModulus' in d:
+		add('469=' + str(d['RoundingModulus']))
+		n += 1
+	if 'OrdType' in d:
+		add('40=' + str(d['OrdType']))
+		n += 1
+	if 'PriceType' in d:
+		add('423=' + str(d['PriceType']))
+		n += 1
+	if 'Price' in d:
+		add('44=' + str(d['Price']))
+		n += 1
+	if 'StopPx' in d:
+		add('99=' + str(d['StopPx']))
+		n += 1
+	if 'Currency' in d:
+		add('15=' + str(d['Currency']))
+		n += 1
+	if 'ComplianceID' in d:
+		add('376=' + str(d['ComplianceID']))
+		n += 1
+	if 'SolicitedFlag' in d:
+		add('377=' + str(d['SolicitedFlag']))
+		n += 1
+	if 'IOIid' in d:
+		add('23=' + str(d['IOIid']))
+		n += 1
+	if 'QuoteID' in d:
+		add('117=' + str(d['QuoteID']))
+		n += 1
+	if 'TimeInForce' in d:
+		add('59=' + str(d['TimeInForce']))
+		n += 1
+	if 'EffectiveTime' in d:
+		add('168=' + str(d['EffectiveTime']))
+		n += 1
+	if 'ExpireDate' in d:
+		add('432=' + str(d['ExpireDate']))
+		n += 1
+	if 'ExpireTime' in d:
+		add('126=' + str(d['ExpireTime']))
+		n += 1
+	if 'GTBookingInst' in d:
+		add('427=' + str(d['GTBookingInst']))
+		n += 1
+	if 'Commission' in d:
+		add('12=' + str(d['Commission']))
+		n += 1
+	if 'CommType' in d:
+		add('13=' + str(d['CommType']))
+		n += 1
+	if 'CommCurrency' in d:
+		add('479=' + str(d['CommCurrency']))
+		n += 1
+	if 'FundRenewWaiv' in d:
+		add('497=' + str(d['FundRenewWaiv']))
+		n += 1
+	if 'OrderCapacity' in d:
+		add('528=' + str(d['OrderCapacity']))
+		n += 1
+	if 'OrderRestrictions' in d:
+		add('529=' + str(d['OrderRestrictions']))
+		n += 1
+	if 'CustOrderCapacity' in d:
+		add('582=' + str(d['CustOrderCapacity']))
+		n += 1
+	if 'ForexReq' in d:
+		add('121=' + str(d['ForexReq']))
+		n += 1
+	if 'SettlCurrency' in d:
+		add('120=' + str(d['SettlCurrency']))
+		n += 1
+	if 'BookingType' in d:
+		add('775=' + str(d['BookingType']))
+		n += 1
+	if 'Text' in d:
+		add('58=' + str(d['Text']))
+		n += 1
+	if 'EncodedTextLen' in d:
+		add('354=' + str(d['EncodedTextLen']))
+		n += 1
+	if 'EncodedText' in d:
+		add('355=' + str(d['EncodedText']))
+		n += 1
+	if 'PositionEffect' in d:
+		add('77=' + str(d['PositionEffect']))
+		n += 1
+	if 'CoveredOrUncovered' in d:
+		add('203=' + str(d['CoveredOrUncovered']))
+		n += 1
+	if 'MaxShow' in d:
+		add('210=' + str(d['MaxShow']))
+		n += 1
+	if 'PegOffsetValue' in d:
+		add('211=' + str(d['PegOffsetValue']))
+		n += 1
+	if 'PegMoveType' in d:
+		add('835=' + str(d['PegMoveType']))
+		n += 1
+	if 'PegOffsetType' in d:
+		add('836=' + str(d['PegOffsetType']))
+		n += 1
+	if 'PegLimitType' in d:
+		add('837=' + str(d['PegLimitType']))
+		n += 1
+	if 'PegRoundDirection' in d:
+		add('838=' + str(d['PegRoundDirection']))
+		n += 1
+	if 'PegScope' in d:
+		add('840=' + str(d['PegScope']))
+		n += 1
+	if 'DiscretionInst' in d:
+		add('388=' + str(d['DiscretionInst']))
+		n += 1
+	if 'DiscretionOffsetValue' in d:
+		add('389=' + str(d['DiscretionOffsetValue']))
+		n += 1
+	if 'DiscretionMoveType' in d:
+		add('841=' + str(d['DiscretionMoveType']))
+		n += 1
+	if 'DiscretionOffsetType' in d:
+		add('842=' + str(d['DiscretionOffsetType']))
+		n += 1
+	if 'DiscretionLimitType' in d:
+		add('843=' + str(d['DiscretionLimitType']))
+		n += 1
+	if 'DiscretionRoundDirection' in d:
+		add('844=' + str(d['DiscretionRoundDirection']))
+		n += 1
+	if 'DiscretionScope' in d:
+		add('846=' + str(d['DiscretionScope']))
+		n += 1
+	if 'TargetStrategy' in d:
+		add('847=' + str(d['TargetStrategy']))
+		n += 1
+	if 'TargetStrategyParameters' in d:
+		add('848=' + str(d['TargetStrategyParameters']))
+		n += 1
+	if 'ParticipationRate' in d:
+		add('849=' + str(d['ParticipationRate']))
+		n += 1
+	if 'CancellationRights' in d:
+		add('480=' + str(d['CancellationRights']))
+		n += 1
+	if 'MoneyLaunderingStatus' in d:
+		add('481=' + str(d['MoneyLaunderingStatus']))
+		n += 1
+	if 'RegistID' in d:
+		add('513=' + str(d['RegistID']))
+		n += 1
+	if 'Designation' in d:
+		add('494=' + str(d['Designation']))
+		n += 1
+	if 'MultiLegRptTypeReq' in d:
+		add('563=' + str(d['MultiLegRptTypeReq']))
+		n += 1
+	if len(d) > n:
+		_make_mbody(obj, obj._context, fixm, _msg_MultilegOrderCancelReplaceRequest_names)
+	return fixm
+
+def _decode_MultilegOrderCancelReplaceRequest(obj, fields, index, context):
+	d = obj.__dict__
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _msg_MultilegOrderCancelReplaceRequest_tags.get(num)
+		if spec is None:
+			# not a field of this message, continue with generic decoder
+			body, index = _extract_body(fields, index, context, obj)
+			return index
+		name, pytype, decode_grp = spec
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	return index
 
 class MultilegOrderCancelReplaceRequest(FixObject):
-	pass
+	_encode = staticmethod(_encode_MultilegOrderCancelReplaceRequest)
+	_decode = staticmethod(_decode_MultilegOrderCancelReplaceRequest)
+
+_msg_NetworkStatusRequest_names = frozenset(['NetworkStatusResponseType', 'NetworkRequestID', 'NetworkResponseID', 'LastNetworkResponseID', 'NoCompIDs'])
+
+_msg_NetworkStatusRequest_tags = {
+	937: ('NetworkStatusResponseType', int, None),
+	933: ('NetworkRequestID', str, None),
+	932: ('NetworkResponseID', str, None),
+	934: ('LastNetworkResponseID', str, None),
+	936: ('NoCompIDs', int, _decode_grp_NoCompIDs),
+}
+
+def _encode_NetworkStatusRequest(obj, fixm):
+	d = obj.__dict__
+	add = fixm.append
+	n = 1
+	if 'NetworkStatusResponseType' in d:
+		add('937=' + str(d['NetworkStatusResponseType']))
+		n += 1
+	if 'NetworkRequestID' in d:
+		add('933=' + str(d['NetworkRequestID']))
+		n += 1
+	if 'NetworkResponseID' in d:
+		add('932=' + str(d['NetworkResponseID']))
+		n += 1
+	if 'LastNetworkResponseID' in d:
+		add('934=' + str(d['LastNetworkResponseID']))
+		n += 1
+	if 'NoCompIDs' in d:
+		grp = d['NoCompIDs']
+		add('936=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoCompIDs(entry, fixm)
+		n += 1
+	if len(d) > n:
+		_make_mbody(obj, obj._context, fixm, _msg_NetworkStatusRequest_names)
+	return fixm
+
+def _decode_NetworkStatusRequest(obj, fields, index, context):
+	d = obj.__dict__
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _msg_NetworkStatusRequest_tags.get(num)
+		if spec is None:
+			# not a field of this message, continue with generic decoder
+			body, index = _extract_body(fields, index, context, obj)
+			return index
+		name, pytype, decode_grp = spec
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	return index
 
 class NetworkStatusRequest(FixObject):
-	pass
+	_encode = staticmethod(_encode_NetworkStatusRequest)
+	_decode = staticmethod(_decode_NetworkStatusRequest)
+
+_msg_NewOrderCross_names = frozenset(['CrossID', 'CrossType', 'CrossPrioritization', 'NoSides', 'Symbol', 'SymbolSfx', 'SecurityID', 'SecurityIDSource', 'NoSecurityAltID', 'Product', 'CFICode', 'SecurityType', 'SecuritySubType', 'MaturityMonthYear', 'MaturityDate', 'CouponPaymentDate', 'IssueDate', 'RepoCollateralSecurityType', 'RepurchaseTerm', 'RepurchaseRate', 'Factor', 'CreditRating', 'InstrRegistry', 'CountryOfIssue', 'StateOrProvinceOfIssue', 'LocaleOfIssue', 'RedemptionDate', 'StrikePrice', 'StrikeCurrency', 'OptAttribute', 'ContractMultiplier', 'CouponRate', 'SecurityExchange', 'Issuer', 'EncodedIssuerLen', 'EncodedIssuer', 'SecurityDesc', 'EncodedSecurityDescLen', 'EncodedSecurityDesc', 'Pool', 'ContractSettlMonth', 'CPProgram', 'CPRegType', 'NoEvents', 'DatedDate', 'InterestAccrualDate', 'NoUnderlyings', 'NoLegs', 'SettlType', 'SettlDate', 'HandlInst', 'ExecInst', 'MinQty', 'MaxFloor', 'ExDestination', 'NoTradingSessions', 'ProcessCode', 'PrevClosePx', 'LocateReqd', 'TransactTime', 'NoStipulations', 'OrdType', 'PriceType', 'Price', 'StopPx', 'Spread', 'BenchmarkCurveCurrency', 'BenchmarkCurveName', 'BenchmarkCurvePoint', 'BenchmarkPrice', 'BenchmarkPriceType', 'BenchmarkSecurityID', 'BenchmarkSecurityIDSource', 'YieldType', 'Yield', 'YieldCalcDate', 'YieldRedemptionDate', 'YieldRedemptionPrice', 'YieldRedemptionPriceType', 'Currency', 'ComplianceID', 'IOIid', 'QuoteID', 'TimeInForce', 'EffectiveTime', 'ExpireDate', 'ExpireTime', 'GTBookingInst', 'MaxShow', 'PegOffsetValue', 'PegMoveType', 'PegOffsetType', 'PegLimitType', 'PegRoundDirection', 'PegScope', 'DiscretionInst', 'DiscretionOffsetValue', 'DiscretionMoveType', 'DiscretionOffsetType', 'DiscretionLimitType', 'DiscretionRoundDirection', 'DiscretionScope', 'TargetStrategy', 'TargetStrategyParameters', 'ParticipationRate', 'CancellationRights', 'MoneyLaunderingStatus', 'RegistID', 'Designation'])
+
+_msg_NewOrderCross_tags = {
+	548: ('CrossID', str, None),
+	549: ('CrossType', int, None),
+	550: ('CrossPrioritization', int, None),
+	552: ('NoSides', int, _decode_grp_NoSides),
+	55: ('Symbol', str, None),
+	65: ('SymbolSfx', str, None),
+	48: ('SecurityID', str, None),
+	22: ('SecurityIDSource', str, None),
+	454: ('NoSecurityAltID', int, _decode_grp_NoSecurityAltID),
+	460: ('Product', int, None),
+	461: ('CFICode', str, None),
+	167: ('SecurityType', str, None),
+	762: ('SecuritySubType', str, None),
+	200: ('MaturityMonthYear', str, None),
+	541: ('MaturityDate', str, None),
+	224: ('CouponPaymentDate', str, None),
+	225: ('IssueDate', str, None),
+	239: ('RepoCollateralSecurityType', int, None),
+	226: ('RepurchaseTerm', int, None),
+	227: ('RepurchaseRate', float, None),
+	228: ('Factor', float, None),
+	255: ('CreditRating', str, None),
+	543: ('InstrRegistry', str, None),
+	470: ('CountryOfIssue', str, None),
+	471: ('StateOrProvinceOfIssue', str, None),
+	472: ('LocaleOfIssue', str, None),
+	240: ('RedemptionDate', str, None),
+	202: ('StrikePrice', float, None),
+	947: ('StrikeCurrency', str, None),
+	206: ('OptAttribute', str, None),
+	231: ('ContractMultiplier', float, None),
+	223: ('CouponRate', float, None),
+	207: ('SecurityExchange', str, None),
+	106: ('Issuer', str, None),
+	348: ('EncodedIssuerLen', str, None),
+	349: ('EncodedIssuer', str, None),
+	107: ('SecurityDesc', str, None),
+	350: ('EncodedSecurityDescLen', str, None),
+	351: ('EncodedSecurityDesc', str, None),
+	691: ('Pool', str, None),
+	667: ('ContractSettlMonth', str, None),
+	875: ('CPProgram', int, None),
+	876: ('CPRegType', str, None),
+	864: ('NoEvents', int, _decode_grp_NoEvents),
+	873: ('DatedDate', str, None),
+	874: ('InterestAccrualDate', str, None),
+	711: ('NoUnderlyings', int, _decode_grp_NoUnderlyings),
+	555: ('NoLegs', int, _decode_grp_NoLegs),
+	63: ('SettlType', str, None),
+	64: ('SettlDate', str, None),
+	21: ('HandlInst', str, None),
+	18: ('ExecInst', str, None),
+	110: ('MinQty', float, None),
+	111: ('MaxFloor', float, None),
+	100: ('ExDestination', str, None),
+	386: ('NoTradingSessions', int, _decode_grp_NoTradingSessions),
+	81: ('ProcessCode', str, None),
+	140: ('PrevClosePx', float, None),
+	114: ('LocateReqd', str, None),
+	60: ('TransactTime', str, None),
+	232: ('NoStipulations', int, _decode_grp_NoStipulations),
+	40: ('OrdType', str, None),
+	423: ('PriceType', int, None),
+	44: ('Price', float, None),
+	99: ('StopPx', float, None),
+	218: ('Spread', float, None),
+	220: ('BenchmarkCurveCurrency', str, None),
+	221: ('BenchmarkCurveName', str, None),
+	222: ('BenchmarkCurvePoint', str, None),
+	662: ('BenchmarkPrice', float, None),
+	663: ('BenchmarkPriceType', int, None),
+	699: ('BenchmarkSecurityID', str, None),
+	761: ('BenchmarkSecurityIDSource', str, None),
+	235: ('YieldType', str, None),
+	236: ('Yield', float, None),
+	701: ('YieldCalcDate', str, None),
+	696: ('YieldRedemptionDate', str, None),
+	697: ('YieldRedemptionPrice', float, None),
+	698: ('YieldRedemptionPriceType', int, None),
+	15: ('Currency', str, None),
+	376: ('ComplianceID', str, None),
+	23: ('IOIid', str, None),
+	117: ('QuoteID', str, None),
+	59: ('TimeInForce', str, None),
+	168: ('EffectiveTime', str, None),
+	432: ('ExpireDate', str, None),
+	126: ('ExpireTime', str, None),
+	427: ('GTBookingInst', int, None),
+	210: ('MaxShow', float, None),
+	211: ('PegOffsetValue', float, None),
+	835: ('PegMoveType', int, None),
+	836: ('PegOffsetType', int, None),
+	837: ('PegLimitType', int, None),
+	838: ('PegRoundDirection', int, None),
+	840: ('PegScope', int, None),
+	388: ('DiscretionInst', str, None),
+	389: ('DiscretionOffsetValue', float, None),
+	841: ('DiscretionMoveType', int, None),
+	842: ('DiscretionOffsetType', int, None),
+	843: ('DiscretionLimitType', int, None),
+	844: ('DiscretionRoundDirection', int, None),
+	846: ('DiscretionScope', int, None),
+	847: ('TargetStrategy', int, None),
+	848: ('TargetStrategyParameters', str, None),
+	849: ('ParticipationRate', float, None),
+	480: ('CancellationRights', str, None),
+	481: ('MoneyLaunderingStatus', str, None),
+	513: ('RegistID', str, None),
+	494: ('Designation', str, None),
+}
+
+def _encode_NewOrderCross(obj, fixm):
+	d = obj.__dict__
+	add = fixm.append
+	n = 1
+	if 'CrossID' in d:
+		add('548=' + str(d['CrossID']))
+		n += 1
+	if 'CrossType' in d:
+		add('549=' + str(d['CrossType']))
+		n += 1
+	if 'CrossPrioritization' in d:
+		add('550=' + str(d['CrossPrioritization']))
+		n += 1
+	if 'NoSides' in d:
+		grp = d['NoSides']
+		add('552=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoSides(entry, fixm)
+		n += 1
+	if 'Symbol' in d:
+		add('55=' + str(d['Symbol']))
+		n += 1
+	if 'SymbolSfx' in d:
+		add('65=' + str(d['SymbolSfx']))
+		n += 1
+	if 'SecurityID' in d:
+		add('48=' + str(d['SecurityID']))
+		n += 1
+	if 'SecurityIDSource' in d:
+		add('22=' + str(d['SecurityIDSource']))
+		n += 1
+	if 'NoSecurityAltID' in d:
+		grp = d['NoSecurityAltID']
+		add('454=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoSecurityAltID(entry, fixm)
+		n += 1
+	if 'Product' in d:
+		add('460=' + str(d['Product']))
+		n += 1
+	if 'CFICode' in d:
+		add('461=' + str(d['CFICode']))
+		n += 1
+	if 'SecurityType' in d:
+		add('167=' + str(d['SecurityType']))
+		n += 1
+	if 'SecuritySubType' in d:
+		add('762=' + str(d['SecuritySubType']))
+		n += 1
+	if 'MaturityMonthYear' in d:
+		add('200=' + str(d['MaturityMonthYear']))
+		n += 1
+	if 'MaturityDate' in d:
+		add('541=' + str(d['MaturityDate']))
+		n += 1
+	if 'CouponPaymentDate' in d:
+		add('224=' + str(d['CouponPaymentDate']))
+		n += 1
+	if 'IssueDate' in d:
+		add('225=' + str(d['IssueDate']))
+		n += 1
+	if 'RepoCollateralSecurityType' in d:
+		add('239=' + str(d['RepoCollateralSecurityType']))
+		n += 1
+	if 'RepurchaseTerm' in d:
+		add('226=' + str(d['RepurchaseTerm']))
+		n += 1
+	if 'RepurchaseRate' in d:
+		add('227=' + str(d['RepurchaseRate']))
+		n += 1
+	if 'Factor' in d:
+		add('228=' + str(d['Factor']))
+		n += 1
+	if 'CreditRating' in d:
+		add('255=' + str(d['CreditRating']))
+		n += 1
+	if 'InstrRegistry' in d:
+		add('543=' + str(d['InstrRegistry']))
+		n += 1
+	if 'CountryOfIssue' in d:
+		add('470=' + str(d['CountryOfIssue']))
+		n += 1
+	if 'StateOrProvinceOfIssue' in d:
+		add('471=' + str(d['StateOrProvinceOfIssue']))
+		n += 1
+	if 'LocaleOfIssue' in d:
+		add('472=' + str(d['LocaleOfIssue']))
+		n += 1
+	if 'RedemptionDate' in d:
+		add('240=' + str(d['RedemptionDate']))
+		n += 1
+	if 'StrikePrice' in d:
+		add('202=' + str(d['StrikePrice']))
+		n += 1
+	if 'StrikeCurrency' in d:
+		add('947=' + str(d['StrikeCurrency']))
+		n += 1
+	if 'OptAttribute' in d:
+		add('206=' + str(d['OptAttribute']))
+		n += 1
+	if 'ContractMultiplier' in d:
+		add('231=' + str(d['ContractMultiplier']))
+		n += 1
+	if 'CouponRate' in d:
+		add('223=' + str(d['CouponRate']))
+		n += 1
+	if 'SecurityExchange' in d:
+		add('207=' + str(d['SecurityExchange']))
+		n += 1
+	if 'Issuer' in d:
+		add('106=' + str(d['Issuer']))
+		n += 1
+	if 'EncodedIssuerLen' in d:
+		add('348=' + str(d['EncodedIssuerLen']))
+		n += 1
+	if 'EncodedIssuer' in d:
+		add('349=' + str(d['EncodedIssuer']))
+		n += 1
+	if 'SecurityDesc' in d:
+		add('107=' + str(d['SecurityDesc']))
+		n += 1
+	if 'EncodedSecurityDescLen' in d:
+		add('350=' + str(d['EncodedSecurityDescLen']))
+		n += 1
+	if 'EncodedSecurityDesc' in d:
+		add('351=' + str(d['EncodedSecurityDesc']))
+		n += 1
+	if 'Pool' in d:
+		add('691=' + str(d['Pool']))
+		n += 1
+	if 'ContractSettlMonth' in d:
+		add('667=' + str(d['ContractSettlMonth']))
+		n += 1
+	if 'CPProgram' in d:
+		add('875=' + str(d['CPProgram']))
+		n += 1
+	if 'CPRegType' in d:
+		add('876=' + str(d['CPRegType']))
+		n += 1
+	if 'NoEvents' in d:
+		grp = d['NoEvents']
+		add('864=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoEvents(entry, fixm)
+		n += 1
+	if 'DatedDate' in d:
+		add('873=' + str(d['DatedDate']))
+		n += 1
+	if 'InterestAccrualDate' in d:
+		add('874=' + str(d['InterestAccrualDate']))
+		n += 1
+	if 'NoUnderlyings' in d:
+		grp = d['NoUnderlyings']
+		add('711=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoUnderlyings(entry, fixm)
+		n += 1
+	if 'NoLegs' in d:
+		grp = d['NoLegs']
+		add('555=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoLegs(entry, fixm)
+		n += 1
+	if 'SettlType' in d:
+		add('63=' + str(d['SettlType']))
+		n += 1
+	if 'SettlDate' in d:
+		add('64=' + str(d['SettlDate']))
+		n += 1
+	if 'HandlInst' in d:
+		add('21=' + str(d['HandlInst']))
+		n += 1
+	if 'ExecInst' in d:
+		add('18=' + str(d['ExecInst']))
+		n += 1
+	if 'MinQty' in d:
+		add('110=' + str(d['MinQty']))
+		n += 1
+	if 'MaxFloor' in d:
+		add('111=' + str(d['MaxFloor']))
+		n += 1
+	if 'ExDestination' in d:
+		add('100=' + str(d['ExDestination']))
+		n += 1
+	if 'NoTradingSessions' in d:
+		grp = d['NoTradingSessions']
+		add('386=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoTradingSessions(entry, fixm)
+		n += 1
+	if 'ProcessCode' in d:
+		add('81=' + str(d['ProcessCode']))
+		n += 1
+	if 'PrevClosePx' in d:
+		add('140=' + str(d['PrevClosePx']))
+		n += 1
+	if 'LocateReqd' in d:
+		add('114=' + str(d['LocateReqd']))
+		n += 1
+	if 'TransactTime' in d:
+		add('60=' + str(d['TransactTime']))
+		n += 1
+	if 'NoStipulations' in d:
+		grp = d['NoStipulations']
+		add('232=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoStipulations(entry, fixm)
+		n += 1
+	if 'OrdType' in d:
+		add('40=' + str(d['OrdType']))
+		n += 1
+	if 'PriceType' in d:
+		add('423=' + str(d['PriceType']))
+		n += 1
+	if 'Price' in d:
+		add('44=' + str(d['Price']))
+		n += 1
+	if 'StopPx' in d:
+		add('99=' + str(d['StopPx']))
+		n += 1
+	if 'Spread' in d:
+		add('218=' + str(d['Spread']))
+		n += 1
+	if 'BenchmarkCurveCurrency' in d:
+		add('220=' + str(d['BenchmarkCurveCurrency']))
+		n += 1
+	if 'BenchmarkCurveName' in d:
+		add('221=' + str(d['BenchmarkCurveName']))
+		n += 1
+	if 'BenchmarkCurvePoint' in d:
+		add('222=' + str(d['BenchmarkCurvePoint']))
+		n += 1
+	if 'BenchmarkPrice' in d:
+		add('662=' + str(d['BenchmarkPrice']))
+		n += 1
+	if 'BenchmarkPriceType' in d:
+		add('663=' + str(d['BenchmarkPriceType']))
+		n += 1
+	if 'BenchmarkSecurityID' in d:
+		add('699=' + str(d['BenchmarkSecurityID']))
+		n += 1
+	if 'BenchmarkSecurityIDSource' in d:
+		add('761=' + str(d['BenchmarkSecurityIDSource']))
+		n += 1
+	if 'YieldType' in d:
+		add('235=' + str(d['YieldType']))
+		n += 1
+	if 'Yield' in d:
+		add('236=' + str(d['Yield']))
+		n += 1
+	if 'YieldCalcDate' in d:
+		add('701=' + str(d['YieldCalcDate']))
+		n += 1
+	if 'YieldRedemptionDate' in d:
+		add('696=' + str(d['YieldRedemptionDate']))
+		n += 1
+	if 'YieldRedemptionPrice' in d:
+		add('697=' + str(d['YieldRedemptionPrice']))
+		n += 1
+	if 'YieldRedemptionPriceType' in d:
+		add('698=' + str(d['YieldRedemptionPriceType']))
+		n += 1
+	if 'Currency' in d:
+		add('15=' + str(d['Currency']))
+		n += 1
+	if 'ComplianceID' in d:
+		add('376=' + str(d['ComplianceID']))
+		n += 1
+	if 'IOIid' in d:
+		add('23=' + str(d['IOIid']))
+		n += 1
+	if 'QuoteID' in d:
+		add('117=' + str(d['QuoteID']))
+		n += 1
+	if 'TimeInForce' in d:
+		add('59=' + str(d['TimeInForce']))
+		n += 1
+	if 'EffectiveTime' in d:
+		add('168=' + str(d['EffectiveTime']))
+		n += 1
+	if 'ExpireDate' in d:
+		add('432=' + str(d['ExpireDate']))
+		n += 1
+	if 'ExpireTime' in d:
+		add('126=' + str(d['ExpireTime']))
+		n += 1
+	if 'GTBookingInst' in d:
+		add('427=' + str(d['GTBookingInst']))
+		n += 1
+	if 'MaxShow' in d:
+		add('210=' + str(d['MaxShow']))
+		n += 1
+	if 'PegOffsetValue' in d:
+		add('211=' + str(d['PegOffsetValue']))
+		n += 1
+	if 'PegMoveType' in d:
+		add('835=' + str(d['PegMoveType']))
+		n += 1
+	if 'PegOffsetType' in d:
+		add('836=' + str(d['PegOffsetType']))
+		n += 1
+	if 'PegLimitType' in d:
+		add('837=' + str(d['PegLimitType']))
+		n += 1
+	if 'PegRoundDirection' in d:
+		add('838=' + str(d['PegRoundDirection']))
+		n += 1
+	if 'PegScope' in d:
+		add('840=' + str(d['PegScope']))
+		n += 1
+	if 'DiscretionInst' in d:
+		add('388=' + str(d['DiscretionInst']))
+		n += 1
+	if 'DiscretionOffsetValue' in d:
+		add('389=' + str(d['DiscretionOffsetValue']))
+		n += 1
+	if 'DiscretionMoveType' in d:
+		add('841=' + str(d['DiscretionMoveType']))
+		n += 1
+	if 'DiscretionOffsetType' in d:
+		add('842=' + str(d['DiscretionOffsetType']))
+		n += 1
+	if 'DiscretionLimitType' in d:
+		add('843=' + str(d['DiscretionLimitType']))
+		n += 1
+	if 'DiscretionRoundDirection' in d:
+		add('844=' + str(d['DiscretionRoundDirection']))
+		n += 1
+	if 'DiscretionScope' in d:
+		add('846=' + str(d['DiscretionScope']))
+		n += 1
+	if 'TargetStrategy' in d:
+		add('847=' + str(d['TargetStrategy']))
+		n += 1
+	if 'TargetStrategyParameters' in d:
+		add('848=' + str(d['TargetStrategyParameters']))
+		n += 1
+	if 'ParticipationRate' in d:
+		add('849=' + str(d['ParticipationRate']))
+		n += 1
+	if 'CancellationRights' in d:
+		add('480=' + str(d['CancellationRights']))
+		n += 1
+	if 'MoneyLaunderingStatus' in d:
+		add('481=' + str(d['MoneyLaunderingStatus']))
+		n += 1
+	if 'RegistID' in d:
+		add('513=' + str(d['RegistID']))
+		n += 1
+	if 'Designation' in d:
+		add('494=' + str(d['Designation']))
+		n += 1
+	if len(d) > n:
+		_make_mbody(obj, obj._context, fixm, _msg_NewOrderCross_names)
+	return fixm
+
+def _decode_NewOrderCross(obj, fields, index, context):
+	d = obj.__dict__
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _msg_NewOrderCross_tags.get(num)
+		if spec is None:
+			# not a field of this message, continue with generic decoder
+			body, index = _extract_body(fields, index, context, obj)
+			return index
+		name, pytype, decode_grp = spec
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	return index
 
 class NewOrderCross(FixObject):
-	pass
+	_encode = staticmethod(_encode_NewOrderCross)
+	_decode = staticmethod(_decode_NewOrderCross)
+
+_msg_NewOrderList_names = frozenset(['ListID', 'BidID', 'ClientBidID', 'ProgRptReqs', 'BidType', 'ProgPeriodInterval', 'CancellationRights', 'MoneyLaunderingStatus', 'RegistID', 'ListExecInstType', 'ListExecInst', 'EncodedListExecInstLen', 'EncodedListExecInst', 'AllowableOneSidednessPct', 'AllowableOneSidednessValue', 'AllowableOneSidednessCurr', 'TotNoOrders', 'LastFragment', 'NoOrders'])
+
+_msg_NewOrderList_tags = {
+	66: ('ListID', str, None),
+	390: ('BidID', str, None),
+	391: ('ClientBidID', str, None),
+	414: ('ProgRptReqs', int, None),
+	394: ('BidType', int, None),
+	415: ('ProgPeriodInterval', int, None),
+	480: ('CancellationRights', str, None),
+	481: ('MoneyLaunderingStatus', str, None),
+	513: ('RegistID', str, None),
+	433: ('ListExecInstType', str, None),
+	69: ('ListExecInst', str, None),
+	352: ('EncodedListExecInstLen', str, None),
+	353: ('EncodedListExecInst', str, None),
+	765: ('AllowableOneSidednessPct', float, None),
+	766: ('AllowableOneSidednessValue', float, None),
+	767: ('AllowableOneSidednessCurr', str, None),
+	68: ('TotNoOrders', int, None),
+	893: ('LastFragment', str, None),
+	73: ('NoOrders', int, _decode_grp_NoOrders),
+}
+
+def _encode_NewOrderList(obj, fixm):
+	d = obj.__dict__
+	add = fixm.append
+	n = 1
+	if 'ListID' in d:
+		add('66=' + str(d['ListID']))
+		n += 1
+	if 'BidID' in d:
+		add('390=' + str(d['BidID']))
+		n += 1
+	if 'ClientBidID' in d:
+		add('391=' + str(d['ClientBidID']))
+		n += 1
+	if 'ProgRptReqs' in d:
+		add('414=' + str(d['ProgRptReqs']))
+		n += 1
+	if 'BidType' in d:
+		add('394=' + str(d['BidType']))
+		n += 1
+	if 'ProgPeriodInterval' in d:
+		add('415=' + str(d['ProgPeriodInterval']))
+		n += 1
+	if 'CancellationRights' in d:
+		add('480=' + str(d['CancellationRights']))
+		n += 1
+	if 'MoneyLaunderingStatus' in d:
+		add('481=' + str(d['MoneyLaunderingStatus']))
+		n += 1
+	if 'RegistID' in d:
+		add('513=' + str(d['RegistID']))
+		n += 1
+	if 'ListExecInstType' in d:
+		add('433=' + str(d['ListExecInstType']))
+		n += 1
+	if 'ListExecInst' in d:
+		add('69=' + str(d['ListExecInst']))
+		n += 1
+	if 'EncodedListExecInstLen' in d:
+		add('352=' + str(d['EncodedListExecInstLen']))
+		n += 1
+	if 'EncodedListExecInst' in d:
+		add('353=' + str(d['EncodedListExecInst']))
+		n += 1
+	if 'AllowableOneSidednessPct' in d:
+		add('765=' + str(d['AllowableOneSidednessPct']))
+		n += 1
+	if 'AllowableOneSidednessValue' in d:
+		add('766=' + str(d['AllowableOneSidednessValue']))
+		n += 1
+	if 'AllowableOneSidednessCurr' in d:
+		add('767=' + str(d['AllowableOneSidednessCurr']))
+		n += 1
+	if 'TotNoOrders' in d:
+		add('68=' + str(d['TotNoOrders']))
+		n += 1
+	if 'LastFragment' in d:
+		add('893=' + str(d['LastFragment']))
+		n += 1
+	if 'NoOrders' in d:
+		grp = d['NoOrders']
+		add('73=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoOrders(entry, fixm)
+		n += 1
+	if len(d) > n:
+		_make_mbody(obj, obj._context, fixm, _msg_NewOrderList_names)
+	return fixm
+
+def _decode_NewOrderList(obj, fields, index, context):
+	d = obj.__dict__
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _msg_NewOrderList_tags.get(num)
+		if spec is None:
+			# not a field of this message, continue with generic decoder
+			body, index = _extract_body(fields, index, context, obj)
+			return index
+		name, pytype, decode_grp = spec
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	return index
 
 class NewOrderList(FixObject):
-	pass
+	_encode = staticmethod(_encode_NewOrderList)
+	_decode = staticmethod(_decode_NewOrderList)
+
+_msg_NewOrderMultileg_names = frozenset(['ClOrdID', 'SecondaryClOrdID', 'ClOrdLinkID', 'NoPartyIDs', 'TradeOriginationDate', 'TradeDate', 'Account', 'AcctIDSource', 'AccountType', 'DayBookingInst', 'BookingUnit', 'PreallocMethod', 'AllocID', 'NoAllocs', 'SettlType', 'SettlDate', 'CashMargin', 'ClearingFeeIndicator', 'HandlInst', 'ExecInst', 'MinQty', 'MaxFloor', 'ExDestination', 'NoTradingSessions', 'ProcessCode', 'Side', 'Symbol', 'SymbolSfx', 'SecurityID', 'SecurityIDSource', 'NoSecurityAltID', 'Product', 'CFICode', 'SecurityType', 'SecuritySubType', 'MaturityMonthYear', 'MaturityDate', 'CouponPaymentDate', 'IssueDate', 'RepoCollateralSecurityType', 'RepurchaseTerm', 'RepurchaseRate', 'Factor', 'CreditRating', 'InstrRegistry', 'CountryOfIssue', 'StateOrProvinceOfIssue', 'LocaleOfIssue', 'RedemptionDate', 'StrikePrice', 'StrikeCurrency', 'OptAttribute', 'ContractMultiplier', 'CouponRate', 'SecurityExchange', 'Issuer', 'EncodedIssuerLen', 'EncodedIssuer', 'SecurityDesc', 'EncodedSecurityDescLen', 'EncodedSecurityDesc', 'Pool', 'ContractSettlMonth', 'CPProgram', 'CPRegType', 'NoEvents', 'DatedDate', 'InterestAccrualDate', 'NoUnderlyings', 'PrevClosePx', 'NoLegs', 'LocateReqd', 'TransactTime', 'QtyType', 'OrderQty', 'CashOrderQty', 'OrderPercent', 'RoundingDirection', 'RoundingModulus', 'OrdType', 'PriceType', 'Price', 'StopPx', 'Currency', 'ComplianceID', 'SolicitedFlag', 'IOIid', 'QuoteID', 'TimeInForce', 'EffectiveTime', 'ExpireDate', 'ExpireTime', 'GTBookingInst', 'Commission', 'CommType', 'CommCurrency', 'FundRenewWaiv', 'OrderCapacity', 'OrderRestrictions', 'CustOrderCapacity', 'ForexReq', 'SettlCurrency', 'BookingType', 'Text', 'EncodedTextLen', 'EncodedText', 'PositionEffect', 'CoveredOrUncovered', 'MaxShow', 'PegOffsetValue', 'PegMoveType', 'PegOffsetType', 'PegLimitType', 'PegRoundDirection', 'PegScope', 'DiscretionInst', 'DiscretionOffsetValue', 'DiscretionMoveType', 'DiscretionOffsetType', 'DiscretionLimitType', 'DiscretionRoundDirection', 'DiscretionScope', 'TargetStrategy', 'TargetStrategyParameters', 'ParticipationRate', 'CancellationRights', 'MoneyLaunderingStatus', 'RegistID', 'Designation', 'MultiLegRptTypeReq'])
+
+_msg_NewOrderMultileg_tags = {
+	11: ('ClOrdID', str, None),
+	526: ('SecondaryClOrdID', str, None),
+	583: ('ClOrdLinkID', str, None),
+	453: ('NoPartyIDs', int, _decode_grp_NoPartyIDs),
+	229: ('TradeOriginationDate', str, None),
+	75: ('TradeDate', str, None),
+	1: ('Account', str, None),
+	660: ('AcctIDSource', int, None),
+	581: ('AccountType', int, None),
+	589: ('DayBookingInst', str, None),
+	590: ('BookingUnit', str, None),
+	591: ('PreallocMethod', str, None),
+	70: ('AllocID', str, None),
+	78: ('NoAllocs', int, _decode_grp_NoAllocs),
+	63: ('SettlType', str, None),
+	64: ('SettlDate', str, None),
+	544: ('CashMargin', str, None),
+	635: ('ClearingFeeIndicator', str, None),
+	21: ('HandlInst', str, None),
+	18: ('ExecInst', str, None),
+	110: ('MinQty', float, None),
+	111: ('MaxFloor', float, None),
+	100: ('ExDestination', str, None),
+	386: ('NoTradingSessions', int, _decode_grp_NoTradingSessions),
+	81: ('ProcessCode', str, None),
+	54: ('Side', str, None),
+	55: ('Symbol', str, None),
+	65: ('SymbolSfx', str, None),
+	48: ('SecurityID', str, None),
+	22: ('SecurityIDSource', str, None),
+	454: ('NoSecurityAltID', int, _decode_grp_NoSecurityAltID),
+	460: ('Product', int, None),
+	461: ('CFICode', str, None),
+	167: ('SecurityType', str, None),
+	762: ('SecuritySubType', str, None),
+	200: ('MaturityMonthYear', str, None),
+	541: ('MaturityDate', str, None),
+	224: ('CouponPaymentDate', str, None),
+	225: ('IssueDate', str, None),
+	239: ('RepoCollateralSecurityType', int, None),
+	226: ('RepurchaseTerm', int, None),
+	227: ('RepurchaseRate', float, None),
+	228: ('Factor', float, None),
+	255: ('CreditRating', str, None),
+	543: ('InstrRegistry', str, None),
+	470: ('CountryOfIssue', str, None),
+	471: ('StateOrProvinceOfIssue', str, None),
+	472: ('LocaleOfIssue', str, None),
+	240: ('RedemptionDate', str, None),
+	202: ('StrikePrice', float, None),
+	947: ('StrikeCurrency', str, None),
+	206: ('OptAttribute', str, None),
+	231: ('ContractMultiplier', float, None),
+	223: ('CouponRate', float, None),
+	207: ('SecurityExchange', str, None),
+	106: ('Issuer', str, None),
+	348: ('EncodedIssuerLen', str, None),
+	349: ('EncodedIssuer', str, None),
+	107: ('SecurityDesc', str, None),
+	350: ('EncodedSecurityDescLen', str, None),
+	351: ('EncodedSecurityDesc', str, None),
+	691: ('Pool', str, None),
+	667: ('ContractSettlMonth', str, None),
+	875: ('CPProgram', int, None),
+	876: ('CPRegType', str, None),
+	864: ('NoEvents', int, _decode_grp_NoEvents),
+	873: ('DatedDate', str, None),
+	874: ('InterestAccrualDate', str, None),
+	711: ('NoUnderlyings', int, _decode_grp_NoUnderlyings),
+	140: ('PrevClosePx', float, None),
+	555: ('NoLegs', int, _decode_grp_NoLegs),
+	114: ('LocateReqd', str, None),
+	60: ('TransactTime', str, None),
+	854: ('QtyType', int, None),
+	38: ('OrderQty', float, None),
+	152: ('CashOrderQty', float, None),
+	516: ('OrderPercent', float, None),
+	468: ('RoundingDirection', str, None),
+	469: ('RoundingModulus', float, None),
+	40: ('OrdType', str, None),
+	423: ('PriceType', int, None),
+	44: ('Price', float, None),
+	99: ('StopPx', float, None),
+	15: ('Currency', str, None),
+	376: ('ComplianceID', str, None),
+	377: ('SolicitedFlag', str, None),
+	23: ('IOIid', str, None),
+	117: ('QuoteID', str, None),
+	59: ('TimeInForce', str, None),
+	168: ('EffectiveTime', str, None),
+	432: ('ExpireDate', str, None),
+	126: ('ExpireTime', str, None),
+	427: ('GTBookingInst', int, None),
+	12: ('Commission', float, None),
+	13: ('CommType', str, None),
+	479: ('CommCurrency', str, None),
+	497: ('FundRenewWaiv', str, None),
+	528: ('OrderCapacity', str, None),
+	529: ('OrderRestrictions', str, None),
+	582: ('CustOrderCapacity', int, None),
+	121: ('ForexReq', str, None),
+	120: ('SettlCurrency', str, None),
+	775: ('BookingType', int, None),
+	58: ('Text', str, None),
+	354: ('EncodedTextLen', str, None),
+	355: ('EncodedText', str, None),
+	77: ('PositionEffect', str, None),
+	203: ('CoveredOrUncovered', int, None),
+	210: ('MaxShow', float, None),
+	211: ('PegOffsetValue', float, None),
+	835: ('PegMoveType', int, None),
+	836: ('PegOffsetType', int, None),
+	837: ('PegLimitType', int, None),
+	838: ('PegRoundDirection', int, None),
+	840: ('PegScope', int, None),
+	388: ('DiscretionInst', str, None),
+	389: ('DiscretionOffsetValue', float, None),
+	841: ('DiscretionMoveType', int, None),
+	842: ('DiscretionOffsetType', int, None),
+	843: ('DiscretionLimitType', int, None),
+	844: ('DiscretionRoundDirection', int, None),
+	846: ('DiscretionScope', int, None),
+	847: ('TargetStrategy', int, None),
+	848: ('TargetStrategyParameters', str, None),
+	849: ('ParticipationRate', float, None),
+	480: ('CancellationRights', str, None),
+	481: ('MoneyLaunderingStatus', str, None),
+	513: ('RegistID', str, None),
+	494: ('Designation', str, None),
+	563: ('MultiLegRptTypeReq', int, None),
+}
+
+def _encode_NewOrderMultileg(obj, fixm):
+	d = obj.__dict__
+	add = fixm.append
+	n = 1
+	if 'ClOrdID' in d:
+		add('11=' + str(d['ClOrdID']))
+		n += 1
+	if 'SecondaryClOrdID' in d:
+		add('526=' + str(d['SecondaryClOrdID']))
+		n += 1
+	if 'ClOrdLinkID' in d:
+		add('583=' + str(d['ClOrdLinkID']))
+		n += 1
+	if 'NoPartyIDs' in d:
+		grp = d['NoPartyIDs']
+		add('453=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoPartyIDs(entry, fixm)
+		n += 1
+	if 'TradeOriginationDate' in d:
+		add('229=' + str(d['TradeOriginationDate']))
+		n += 1
+	if 'TradeDate' in d:
+		add('75=' + str(d['TradeDate']))
+		n += 1
+	if 'Account' in d:
+		add('1=' + str(d['Account']))
+		n += 1
+	if 'AcctIDSource' in d:
+		add('660=' + str(d['AcctIDSource']))
+		n += 1
+	if 'AccountType' in d:
+		add('581=' + str(d['AccountType']))
+		n += 1
+	if 'DayBookingInst' in d:
+		add('589=' + str(d['DayBookingInst']))
+		n += 1
+	if 'BookingUnit' in d:
+		add('590=' + str(d['BookingUnit']))
+		n += 1
+	if 'PreallocMethod' in d:
+		add('591=' + str(d['PreallocMethod']))
+		n += 1
+	if 'AllocID' in d:
+		add('70=' + str(d['AllocID']))
+		n += 1
+	if 'NoAllocs' in d:
+		grp = d['NoAllocs']
+		add('78=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoAllocs(entry, fixm)
+		n += 1
+	if 'SettlType' in d:
+		add('63=' + str(d['SettlType']))
+		n += 1
+	if 'SettlDate' in d:
+		add('64=' + str(d['SettlDate']))
+		n += 1
+	if 'CashMargin' in d:
+		add('544=' + str(d['CashMargin']))
+		n += 1
+	if 'ClearingFeeIndicator' in d:
+		add('635=' + str(d['ClearingFeeIndicator']))
+		n += 1
+	if 'HandlInst' in d:
+		add('21=' + str(d['HandlInst']))
+		n += 1
+	if 'ExecInst' in d:
+		add('18=' + str(d['ExecInst']))
+		n += 1
+	if 'MinQty' in d:
+		add('110=' + str(d['MinQty']))
+		n += 1
+	if 'MaxFloor' in d:
+		add('111=' + str(d['MaxFloor']))
+		n += 1
+	if 'ExDestination' in d:
+		add('100=' + str(d['ExDestination']))
+		n += 1
+	if 'NoTradingSessions' in d:
+		grp = d['NoTradingSessions']
+		add('386=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoTradingSessions(entry, fixm)
+		n += 1
+	if 'ProcessCode' in d:
+		add('81=' + str(d['ProcessCode']))
+		n += 1
+	if 'Side' in d:
+		add('54=' + str(d['Side']))
+		n += 1
+	if 'Symbol' in d:
+		add('55=' + str(d['Symbol']))
+		n += 1
+	if 'SymbolSfx' in d:
+		add('65=' + str(d['SymbolSfx']))
+		n += 1
+	if 'SecurityID' in d:
+		add('48=' + str(d['SecurityID']))
+		n += 1
+	if 'SecurityIDSource' in d:
+		add('22=' + str(d['SecurityIDSource']))
+		n += 1
+	if 'NoSecurityAltID' in d:
+		grp = d['NoSecurityAltID']
+		add('454=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoSecurityAltID(entry, fixm)
+		n += 1
+	if 'Product' in d:
+		add('460=' + str(d['Product']))
+		n += 1
+	if 'CFICode' in d:
+		add('461=' + str(d['CFICode']))
+		n += 1
+	if 'SecurityType' in d:
+		add('167=' + str(d['SecurityType']))
+		n += 1
+	if 'SecuritySubType' in d:
+		add('762=' + str(d['SecuritySubType']))
+		n += 1
+	if 'MaturityMonthYear' in d:
+		add('200=' + str(d['MaturityMonthYear']))
+		n += 1
+	if 'MaturityDate' in d:
+		add('541=' + str(d['MaturityDate']))
+		n += 1
+	if 'CouponPaymentDate' in d:
+		add('224=' + str(d['CouponPaymentDate']))
+		n += 1
+	if 'IssueDate' in d:
+		add('225=' + str(d['IssueDate']))
+		n += 1
+	if 'RepoCollateralSecurityType' in d:
+		add('239=' + str(d['RepoCollateralSecurityType']))
+		n += 1
+	if 'RepurchaseTerm' in d:
+		add('226=' + str(d['RepurchaseTerm']))
+		n += 1
+	if 'RepurchaseRate' in d:
+		add('227=' + str(d['RepurchaseRate']))
+		n += 1
+	if 'Factor' in d:
+		add('228=' + str(d['Factor']))
+		n += 1
+	if 'CreditRating' in d:
+		add('255=' + str(d['CreditRating']))
+		n += 1
+	if 'InstrRegistry' in d:
+		add('543=' + str(d['InstrRegistry']))
+		n += 1
+	if 'CountryOfIssue' in d:
+		add('470=' + str(d['CountryOfIssue']))
+		n += 1
+	if 'StateOrProvinceOfIssue' in d:
+		add('471=' + str(d['StateOrProvinceOfIssue']))
+		n += 1
+	if 'LocaleOfIssue' in d:
+		add('472=' + str(d['LocaleOfIssue']))
+		n += 1
+	if 'RedemptionDate' in d:
+		add('240=' + str(d['RedemptionDate']))
+		n += 1
+	if 'StrikePrice' in d:
+		add('202=' + str(d['StrikePrice']))
+		n += 1
+	if 'StrikeCurrency' in d:
+		add('947=' + str(d['StrikeCurrency']))
+		n += 1
+	if 'OptAttribute' in d:
+		add('206=' + str(d['OptAttribute']))
+		n += 1
+	if 'ContractMultiplier' in d:
+		add('231=' + str(d['ContractMultiplier']))
+		n += 1
+	if 'CouponRate' in d:
+		add('223=' + str(d['CouponRate']))
+		n += 1
+	if 'SecurityExchange' in d:
+		add('207=' + str(d['SecurityExchange']))
+		n += 1
+	if 'Issuer' in d:
+		add('106=' + str(d['Issuer']))
+		n += 1
+	if 'EncodedIssuerLen' in d:
+		add('348=' + str(d['EncodedIssuerLen']))
+		n += 1
+	if 'EncodedIssuer' in d:
+		add('349=' + str(d['EncodedIssuer']))
+		n += 1
+	if 'SecurityDesc' in d:
+		add('107=' + str(d['SecurityDesc']))
+		n += 1
+	if 'EncodedSecurityDescLen' in d:
+		add('350=' + str(d['EncodedSecurityDescLen']))
+		n += 1
+	if 'EncodedSecurityDesc' in d:
+		add('351=' + str(d['EncodedSecurityDesc']))
+		n += 1
+	if 'Pool' in d:
+		add('691=' + str(d['Pool']))
+		n += 1
+	if 'ContractSettlMonth' in d:
+		add('667=' + str(d['ContractSettlMonth']))
+		n += 1
+	if 'CPProgram' in d:
+		add('875=' + str(d['CPProgram']))
+		n += 1
+	if 'CPRegType' in d:
+		add('876=' + str(d['CPRegType']))
+		n += 1
+	if 'NoEvents' in d:
+		grp = d['NoEvents']
+		add('864=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoEvents(entry, fixm)
+		n += 1
+	if 'DatedDate' in d:
+		add('873=' + str(d['DatedDate']))
+		n += 1
+	if 'InterestAccrualDate' in d:
+		add('874=' + str(d['InterestAccrualDate']))
+		n += 1
+	if 'NoUnderlyings' in d:
+		grp = d['NoUnderlyings']
+		add('711=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoUnderlyings(entry, fixm)
+		n += 1
+	if 'PrevClosePx' in d:
+		add('140=' + str(d['PrevClosePx']))
+		n += 1
+	if 'NoLegs' in d:
+		grp = d['NoLegs']
+		add('555=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoLegs(entry, fixm)
+		n += 1
+	if 'LocateReqd' in d:
+		add('114=' + str(d['LocateReqd']))
+		n += 1
+	if 'TransactTime' in d:
+		add('60=' + str(d['TransactTime']))
+		n += 1
+	if 'QtyType' in d:
+		add('854=' + str(d['QtyType']))
+		n += 1
+	if 'OrderQty' in d:
+		add('38=' + str(d['OrderQty']))
+		n += 1
+	if 'CashOrderQty' in d:
+		add('152=' + str(d['CashOrderQty']))
+		n += 1
+	if 'OrderPercent' in d:
+		add('516=' + str(d['OrderPercent']))
+		n += 1
+	if 'RoundingDirection' in d:
+		add('468=' + str(d['RoundingDirection']))
+		n += 1
+	if 'RoundingModulus' in d:
+		add('469=' + str(d['RoundingModulus']))
+		n += 1
+	if 'OrdType' in d:
+		add('40=' + str(d['OrdType']))
+		n += 1
+	if 'PriceType' in d:
+		add('423=' + str(d['PriceType']))
+		n += 1
+	if 'Price' in d:
+		add('44=' + str(d['Price']))
+		n += 1
+	if 'StopPx' in d:
+		add('99=' + str(d['StopPx']))
+		n += 1
+	if 'Currency' in d:
+		add('15=' + str(d['Currency']))
+		n += 1
+	if 'ComplianceID' in d:
+		add('376=' + str(d['ComplianceID']))
+		n += 1
+	if 'SolicitedFlag' in d:
+		add('377=' + str(d['SolicitedFlag']))
+		n += 1
+	if 'IOIid' in d:
+		add('23=' + str(d['IOIid']))
+		n += 1
+	if 'QuoteID' in d:
+		add('117=' + str(d['QuoteID']))
+		n += 1
+	if 'TimeInForce' in d:
+		add('59=' + str(d['TimeInForce']))
+		n += 1
+	if 'EffectiveTime' in d:
+		add('168=' + str(d['EffectiveTime']))
+		n += 1
+	if 'ExpireDate' in d:
+		add('432=' + str(d['ExpireDate']))
+		n += 1
+	if 'ExpireTime' in d:
+		add('126=' + str(d['ExpireTime']))
+		n += 1
+	if 'GTBookingInst' in d:
+		add('427=' + str(d['GTBookingInst']))
+		n += 1
+	if 'Commission' in d:
+		add('12=' + str(d['Commission']))
+		n += 1
+	if 'CommType' in d:
+		add('13=' + str(d['CommType']))
+		n += 1
+	if 'CommCurrency' in d:
+		add('479=' + str(d['CommCurrency']))
+		n += 1
+	if 'FundRenewWaiv' in d:
+		add('497=' + str(d['FundRenewWaiv']))
+		n += 1
+	if 'OrderCapacity' in d:
+		add('528=' + str(d['OrderCapacity']))
+		n += 1
+	if 'OrderRestrictions' in d:
+		add('529=' + str(d['OrderRestrictions']))
+		n += 1
+	if 'CustOrderCapacity' in d:
+		add('582=' + str(d['CustOrderCapacity']))
+		n += 1
+	if 'ForexReq' in d:
+		add('121=' + str(d['ForexReq']))
+		n += 1
+	if 'SettlCurrency' in d:
+		add('120=' + str(d['SettlCurrency']))
+		n += 1
+	if 'BookingType' in d:
+		add('775=' + str(d['BookingType']))
+		n += 1
+	if 'Text' in d:
+		add('58=' + str(d['Text']))
+		n += 1
+	if 'EncodedTextLen' in d:
+		add('354=' + str(d['EncodedTextLen']))
+		n += 1
+	if 'EncodedText' in d:
+		add('355=' + str(d['EncodedText']))
+		n += 1
+	if 'PositionEffect' in d:
+		add('77=' + str(d['PositionEffect']))
+		n += 1
+	if 'CoveredOrUncovered' in d:
+		add('203=' + str(d['CoveredOrUncovered']))
+		n += 1
+	if 'MaxShow' in d:
+		add('210=' + str(d['MaxShow']))
+		n += 1
+	if 'PegOffsetValue' in d:
+		add('211=' + str(d['PegOffsetValue']))
+		n += 1
+	if 'PegMoveType' in d:
+		add('835=' + str(d['PegMoveType']))
+		n += 1
+	if 'PegOffsetType' in d:
+		add('836=' + str(d['PegOffsetType']))
+		n += 1
+	if 'PegLimitType' in d:
+		add('837=' + str(d['PegLimitType']))
+		n += 1
+	if 'PegRoundDirection' in d:
+		add('838=' + str(d['PegRoundDirection']))
+		n += 1
+	if 'PegScope' in d:
+		add('840=' + str(d['PegScope']))
+		n += 1
+	if 'DiscretionInst' in d:
+		add('388=' + str(d['DiscretionInst']))
+		n += 1
+	if 'DiscretionOffsetValue' in d:
+		add('389=' + str(d['DiscretionOffsetValue']))
+		n += 1
+	if 'DiscretionMoveType' in d:
+		add('841=' + str(d['DiscretionMoveType']))
+		n += 1
+	if 'DiscretionOffsetType' in d:
+		add('842=' + str(d['DiscretionOffsetType']))
+		n += 1
+	if 'DiscretionLimitType' in d:
+		add('843=' + str(d['DiscretionLimitType']))
+		n += 1
+	if 'DiscretionRoundDirection' in d:
+		add('844=' + str(d['DiscretionRoundDirection']))
+		n += 1
+	if 'DiscretionScope' in d:
+		add('846=' + str(d['DiscretionScope']))
+		n += 1
+	if 'TargetStrategy' in d:
+		add('847=' + str(d['TargetStrategy']))
+		n += 1
+	if 'TargetStrategyParameters' in d:
+		add('848=' + str(d['TargetStrategyParameters']))
+		n += 1
+	if 'ParticipationRate' in d:
+		add('849=' + str(d['ParticipationRate']))
+		n += 1
+	if 'CancellationRights' in d:
+		add('480=' + str(d['CancellationRights']))
+		n += 1
+	if 'MoneyLaunderingStatus' in d:
+		add('481=' + str(d['MoneyLaunderingStatus']))
+		n += 1
+	if 'RegistID' in d:
+		add('513=' + str(d['RegistID']))
+		n += 1
+	if 'Designation' in d:
+		add('494=' + str(d['Designation']))
+		n += 1
+	if 'MultiLegRptTypeReq' in d:
+		add('563=' + str(d['MultiLegRptTypeReq']))
+		n += 1
+	if len(d) > n:
+		_make_mbody(obj, obj._context, fixm, _msg_NewOrderMultileg_names)
+	return fixm
+
+def _decode_NewOrderMultileg(obj, fields, index, context):
+	d = obj.__dict__
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _msg_NewOrderMultileg_tags.get(num)
+		if spec is None:
+			# not a field of this message, continue with generic decoder
+			body, index = _extract_body(fields, index, context, obj)
+			return index
+		name, pytype, decode_grp = spec
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	return index
 
 class NewOrderMultileg(FixObject):
-	pass
+	_encode = staticmethod(_encode_NewOrderMultileg)
+	_decode = staticmethod(_decode_NewOrderMultileg)
+
+_msg_NewOrderSingle_names = frozenset(['ClOrdID', 'SecondaryClOrdID', 'ClOrdLinkID', 'NoPartyIDs', 'TradeOriginationDate', 'TradeDate', 'Account', 'AcctIDSource', 'AccountType', 'DayBookingInst', 'BookingUnit', 'PreallocMethod', 'AllocID', 'NoAllocs', 'SettlType', 'SettlDate', 'CashMargin', 'ClearingFeeIndicator', 'HandlInst', 'ExecInst', 'MinQty', 'MaxFloor', 'ExDestination', 'NoTradingSessions', 'ProcessCode', 'Symbol', 'SymbolSfx', 'SecurityID', 'SecurityIDSource', 'NoSecurityAltID', 'Product', 'CFICode', 'SecurityType', 'SecuritySubType', 'MaturityMonthYear', 'MaturityDate', 'CouponPaymentDate', 'IssueDate', 'RepoCollateralSecurityType', 'RepurchaseTerm', 'RepurchaseRate', 'Factor', 'CreditRating', 'InstrRegistry', 'CountryOfIssue', 'StateOrProvinceOfIssue', 'LocaleOfIssue', 'RedemptionDate', 'StrikePrice', 'StrikeCurrency', 'OptAttribute', 'ContractMultiplier', 'CouponRate', 'SecurityExchange', 'Issuer', 'EncodedIssuerLen', 'EncodedIssuer', 'SecurityDesc', 'EncodedSecurityDescLen', 'EncodedSecurityDesc', 'Pool', 'ContractSettlMonth', 'CPProgram', 'CPRegType', 'NoEvents', 'DatedDate', 'InterestAccrualDate', 'AgreementDesc', 'AgreementID', 'AgreementDate', 'AgreementCurrency', 'TerminationType', 'StartDate', 'EndDate', 'DeliveryType', 'MarginRatio', 'NoUnderlyings', 'PrevClosePx', 'Side', 'LocateReqd', 'TransactTime', 'NoStipulations', 'QtyType', 'OrderQty', 'CashOrderQty', 'OrderPercent', 'RoundingDirection', 'RoundingModulus', 'OrdType', 'PriceType', 'Price', 'StopPx', 'Spread', 'BenchmarkCurveCurrency', 'BenchmarkCurveName', 'BenchmarkCurvePoint', 'BenchmarkPrice', 'BenchmarkPriceType', 'BenchmarkSecurityID', 'BenchmarkSecurityIDSource', 'YieldType', 'Yield', 'YieldCalcDate', 'YieldRedemptionDate', 'YieldRedemptionPrice', 'YieldRedemptionPriceType', 'Currency', 'ComplianceID', 'SolicitedFlag', 'IOIid', 'QuoteID', 'TimeInForce', 'EffectiveTime', 'ExpireDate', 'ExpireTime', 'GTBookingInst', 'Commission', 'CommType', 'CommCurrency', 'FundRenewWaiv', 'OrderCapacity', 'OrderRestrictions', 'CustOrderCapacity', 'ForexReq', 'SettlCurrency', 'BookingType', 'Text', 'EncodedTextLen', 'EncodedText', 'SettlDate2', 'OrderQty2', 'Price2', 'PositionEffect', 'CoveredOrUncovered', 'MaxShow', 'PegOffsetValue', 'PegMoveType', 'PegOffsetType', 'PegLimitType', 'PegRoundDirection', 'PegScope', 'DiscretionInst', 'DiscretionOffsetValue', 'DiscretionMoveType', 'DiscretionOffsetType', 'DiscretionLimitType', 'DiscretionRoundDirection', 'DiscretionScope', 'TargetStrategy', 'TargetStrategyParameters', 'ParticipationRate', 'CancellationRights', 'MoneyLaunderingStatus', 'RegistID', 'Designation'])
+
+_msg_NewOrderSingle_tags = {
+	11: ('ClOrdID', str, None),
+	526: ('SecondaryClOrdID', str, None),
+	583: ('ClOrdLinkID', str, None),
+	453: ('NoPartyIDs', int, _decode_grp_NoPartyIDs),
+	229: ('TradeOriginationDate', str, None),
+	75: ('TradeDate', str, None),
+	1: ('Account', str, None),
+	660: ('AcctIDSource', int, None),
+	581: ('AccountType', int, None),
+	589: ('DayBookingInst', str, None),
+	590: ('BookingUnit', str, None),
+	591: ('PreallocMethod', str, None),
+	70: ('AllocID', str, None),
+	78: ('NoAllocs', int, _decode_grp_NoAllocs),
+	63: ('SettlType', str, None),
+	64: ('SettlDate', str, None),
+	544: ('CashMargin', str, None),
+	635: ('ClearingFeeIndicator', str, None),
+	21: ('HandlInst', str, None),
+	18: ('ExecInst', str, None),
+	110: ('MinQty', float, None),
+	111: ('MaxFloor', float, None),
+	100: ('ExDestination', str, None),
+	386: ('NoTradingSessions', int, _decode_grp_NoTradingSessions),
+	81: ('ProcessCode', str, None),
+	55: ('Symbol', str, None),
+	65: ('SymbolSfx', str, None),
+	48: ('SecurityID', str, None),
+	22: ('SecurityIDSource', str, None),
+	454: ('NoSecurityAltID', int, _decode_grp_NoSecurityAltID),
+	460: ('Product', int, None),
+	461: ('CFICode', str, None),
+	167: ('SecurityType', str, None),
+	762: ('SecuritySubType', str, None),
+	200: ('MaturityMonthYear', str, None),
+	541: ('MaturityDate', str, None),
+	224: ('CouponPaymentDate', str, None),
+	225: ('IssueDate', str, None),
+	239: ('RepoCollateralSecurityType', int, None),
+	226: ('RepurchaseTerm', int, None),
+	227: ('RepurchaseRate', float, None),
+	228: ('Factor', float, None),
+	255: ('CreditRating', str, None),
+	543: ('InstrRegistry', str, None),
+	470: ('CountryOfIssue', str, None),
+	471: ('StateOrProvinceOfIssue', str, None),
+	472: ('LocaleOfIssue', str, None),
+	240: ('RedemptionDate', str, None),
+	202: ('StrikePrice', float, None),
+	947: ('StrikeCurrency', str, None),
+	206: ('OptAttribute', str, None),
+	231: ('ContractMultiplier', float, None),
+	223: ('CouponRate', float, None),
+	207: ('SecurityExchange', str, None),
+	106: ('Issuer', str, None),
+	348: ('EncodedIssuerLen', str, None),
+	349: ('EncodedIssuer', str, None),
+	107: ('SecurityDesc', str, None),
+	350: ('EncodedSecurityDescLen', str, None),
+	351: ('EncodedSecurityDesc', str, None),
+	691: ('Pool', str, None),
+	667: ('ContractSettlMonth', str, None),
+	875: ('CPProgram', int, None),
+	876: ('CPRegType', str, None),
+	864: ('NoEvents', int, _decode_grp_NoEvents),
+	873: ('DatedDate', str, None),
+	874: ('InterestAccrualDate', str, None),
+	913: ('AgreementDesc', str, None),
+	914: ('AgreementID', str, None),
+	915: ('AgreementDate', str, None),
+	918: ('AgreementCurrency', str, None),
+	788: ('TerminationType', int, None),
+	916: ('StartDate', str, None),
+	917: ('EndDate', str, None),
+	919: ('DeliveryType', int, None),
+	898: ('MarginRatio', float, None),
+	711: ('NoUnderlyings', int, _decode_grp_NoUnderlyings),
+	140: ('PrevClosePx', float, None),
+	54: ('Side', str, None),
+	114: ('LocateReqd', str, None),
+	60: ('TransactTime', str, None),
+	232: ('NoStipulations', int, _decode_grp_NoStipulations),
+	854: ('QtyType', int, None),
+	38: ('OrderQty', float, None),
+	152: ('CashOrderQty', float, None),
+	516: ('OrderPercent', float, None),
+	468: ('RoundingDirection', str, None),
+	469: ('RoundingModulus', float, None),
+	40: ('OrdType', str, None),
+	423: ('PriceType', int, None),
+	44: ('Price', float, None),
+	99: ('StopPx', float, None),
+	218: ('Spread', float, None),
+	220: ('BenchmarkCurveCurrency', str, None),
+	221: ('BenchmarkCurveName', str, None),
+	222: ('BenchmarkCurvePoint', str, None),
+	662: ('BenchmarkPrice', float, None),
+	663: ('BenchmarkPriceType', int, None),
+	699: ('BenchmarkSecurityID', str, None),
+	761: ('BenchmarkSecurityIDSource', str, None),
+	235: ('YieldType', str, None),
+	236: ('Yield', float, None),
+	701: ('YieldCalcDate', str, None),
+	696: ('YieldRedemptionDate', str, None),
+	697: ('YieldRedemptionPrice', float, None),
+	698: ('YieldRedemptionPriceType', int, None),
+	15: ('Currency', str, None),
+	376: ('ComplianceID', str, None),
+	377: ('SolicitedFlag', str, None),
+	23: ('IOIid', str, None),
+	117: ('QuoteID', str, None),
+	59: ('TimeInForce', str, None),
+	168: ('EffectiveTime', str, None),
+	432: ('ExpireDate', str, None),
+	126: ('ExpireTime', str, None),
+	427: ('GTBookingInst', int, None),
+	12: ('Commission', float, None),
+	13: ('CommType', str, None),
+	479: ('CommCurrency', str, None),
+	497: ('FundRenewWaiv', str, None),
+	528: ('OrderCapacity', str, None),
+	529: ('OrderRestrictions', str, None),
+	582: ('CustOrderCapacity', int, None),
+	121: ('ForexReq', str, None),
+	120: ('SettlCurrency', str, None),
+	775: ('BookingType', int, None),
+	58: ('Text', str, None),
+	354: ('EncodedTextLen', str, None),
+	355: ('EncodedText', str, None),
+	193: ('SettlDate2', str, None),
+	192: ('OrderQty2', float, None),
+	640: ('Price2', float, None),
+	77: ('PositionEffect', str, None),
+	203: ('CoveredOrUncovered', int, None),
+	210: ('MaxShow', float, None),
+	211: ('PegOffsetValue', float, None),
+	835: ('PegMoveType', int, None),
+	836: ('PegOffsetType', int, None),
+	837: ('PegLimitType', int, None),
+	838: ('PegRoundDirection', int, None),
+	840: ('PegScope', int, None),
+	388: ('DiscretionInst', str, None),
+	389: ('DiscretionOffsetValue', float, None),
+	841: ('DiscretionMoveType', int, None),
+	842: ('DiscretionOffsetType', int, None),
+	843: ('DiscretionLimitType', int, None),
+	844: ('DiscretionRoundDirection', int, None),
+	846: ('DiscretionScope', int, None),
+	847: ('TargetStrategy', int, None),
+	848: ('TargetStrategyParameters', str, None),
+	849: ('ParticipationRate', float, None),
+	480: ('CancellationRights', str, None),
+	481: ('MoneyLaunderingStatus', str, None),
+	513: ('RegistID', str, None),
+	494: ('Designation', str, None),
+}
+
+def _encode_NewOrderSingle(obj, fixm):
+	d = obj.__dict__
+	add = fixm.append
+	n = 1
+	if 'ClOrdID' in d:
+		add('11=' + str(d['ClOrdID']))
+		n += 1
+	if 'SecondaryClOrdID' in d:
+		add('526=' + str(d['SecondaryClOrdID']))
+		n += 1
+	if 'ClOrdLinkID' in d:
+		add('583=' + str(d['ClOrdLinkID']))
+		n += 1
+	if 'NoPartyIDs' in d:
+		grp = d['NoPartyIDs']
+		add('453=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoPartyIDs(entry, fixm)
+		n += 1
+	if 'TradeOriginationDate' in d:
+		add('229=' + str(d['TradeOriginationDate']))
+		n += 1
+	if 'TradeDate' in d:
+		add('75=' + str(d['TradeDate']))
+		n += 1
+	if 'Account' in d:
+		add('1=' + str(d['Account']))
+		n += 1
+	if 'AcctIDSource' in d:
+		add('660=' + str(d['AcctIDSource']))
+		n += 1
+	if 'AccountType' in d:
+		add('581=' + str(d['AccountType']))
+		n += 1
+	if 'DayBookingInst' in d:
+		add('589=' + str(d['DayBookingInst']))
+		n += 1
+	if 'BookingUnit' in d:
+		add('590=' + str(d['BookingUnit']))
+		n += 1
+	if 'PreallocMethod' in d:
+		add('591=' + str(d['PreallocMethod']))
+		n += 1
+	if 'AllocID' in d:
+		add('70=' + str(d['AllocID']))
+		n += 1
+	if 'NoAllocs' in d:
+		grp = d['NoAllocs']
+		add('78=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoAllocs(entry, fixm)
+		n += 1
+	if 'SettlType' in d:
+		add('63=' + str(d['SettlType']))
+		n += 1
+	if 'SettlDate' in d:
+		add('64=' + str(d['SettlDate']))
+		n += 1
+	if 'CashMargin' in d:
+		add('544=' + str(d['CashMargin']))
+		n += 1
+	if 'ClearingFeeIndicator' in d:
+		add('635=' + str(d['ClearingFeeIndicator']))
+		n += 1
+	if 'HandlInst' in d:
+		add('21=' + str(d['HandlInst']))
+		n += 1
+	if 'ExecInst' in d:
+		add('18=' + str(d['ExecInst']))
+		n += 1
+	if 'MinQty' in d:
+		add('110=' + str(d['MinQty']))
+		n += 1
+	if 'MaxFloor' in d:
+		add('111=' + str(d['MaxFloor']))
+		n += 1
+	if 'ExDestination' in d:
+		add('100=' + str(d['ExDestination']))
+		n += 1
+	if 'NoTradingSessions' in d:
+		grp = d['NoTradingSessions']
+		add('386=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoTradingSessions(entry, fixm)
+		n += 1
+	if 'ProcessCode' in d:
+		add('81=' + str(d['ProcessCode']))
+		n += 1
+	if 'Symbol' in d:
+		add('55=' + str(d['Symbol']))
+		n += 1
+	if 'SymbolSfx' in d:
+		add('65=' + str(d['SymbolSfx']))
+		n += 1
+	if 'SecurityID' in d:
+		add('48=' + str(d['SecurityID']))
+		n += 1
+	if 'SecurityIDSource' in d:
+		add('22=' + str(d['SecurityIDSource']))
+		n += 1
+	if 'NoSecurityAltID' in d:
+		grp = d['NoSecurityAltID']
+		add('454=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoSecurityAltID(entry, fixm)
+		n += 1
+	if 'Product' in d:
+		add('460=' + str(d['Product']))
+		n += 1
+	if 'CFICode' in d:
+		add('461=' + str(d['CFICode']))
+		n += 1
+	if 'SecurityType' in d:
+		add('167=' + str(d['SecurityType']))
+		n += 1
+	if 'SecuritySubType' in d:
+		add('762=' + str(d['SecuritySubType']))
+		n += 1
+	if 'MaturityMonthYear' in d:
+		add('200=' + str(d['MaturityMonthYear']))
+		n += 1
+	if 'MaturityDate' in d:
+		add('541=' + str(d['MaturityDate']))
+		n += 1
+	if 'CouponPaymentDate' in d:
+		add('224=' + str(d['CouponPaymentDate']))
+		n += 1
+	if 'IssueDate' in d:
+		add('225=' + str(d['IssueDate']))
+		n += 1
+	if 'RepoCollateralSecurityType' in d:
+		add('239=' + str(d['RepoCollateralSecurityType']))
+		n += 1
+	if 'RepurchaseTerm' in d:
+		add('226=' + str(d['RepurchaseTerm']))
+		n += 1
+	if 'RepurchaseRate' in d:
+		add('227=' + str(d['RepurchaseRate']))
+		n += 1
+	if 'Factor' in d:
+		add('228=' + str(d['Factor']))
+		n += 1
+	if 'CreditRating' in d:
+		add('255=' + str(d['CreditRating']))
+		n += 1
+	if 'InstrRegistry' in d:
+		add('543=' + str(d['InstrRegistry']))
+		n += 1
+	if 'CountryOfIssue' in d:
+		add('470=' + str(d['CountryOfIssue']))
+		n += 1
+	if 'StateOrProvinceOfIssue' in d:
+		add('471=' + str(d['StateOrProvinceOfIssue']))
+		n += 1
+	if 'LocaleOfIssue' in d:
+		add('472=' + str(d['LocaleOfIssue']))
+		n += 1
+	if 'RedemptionDate' in d:
+		add('240=' + str(d['RedemptionDate']))
+		n += 1
+	if 'StrikePrice' in d:
+		add('202=' + str(d['StrikePrice']))
+		n += 1
+	if 'StrikeCurrency' in d:
+		add('947=' + str(d['StrikeCurrency']))
+		n += 1
+	if 'OptAttribute' in d:
+		add('206=' + str(d['OptAttribute']))
+		n += 1
+	if 'ContractMultiplier' in d:
+		add('231=' + str(d['ContractMultiplier']))
+		n += 1
+	if 'CouponRate' in d:
+		add('223=' + str(d['CouponRate']))
+		n += 1
+	if 'SecurityExchange' in d:
+		add('207=' + str(d['SecurityExchange']))
+		n += 1
+	if 'Issuer' in d:
+		add('106=' + str(d['Issuer']))
+		n += 1
+	if 'EncodedIssuerLen' in d:
+		add('348=' + str(d['EncodedIssuerLen']))
+		n += 1
+	if 'EncodedIssuer' in d:
+		add('349=' + str(d['EncodedIssuer']))
+		n += 1
+	if 'SecurityDesc' in d:
+		add('107=' + str(d['SecurityDesc']))
+		n += 1
+	if 'EncodedSecurityDescLen' in d:
+		add('350=' + str(d['EncodedSecurityDescLen']))
+		n += 1
+	if 'EncodedSecurityDesc' in d:
+		add('351=' + str(d['EncodedSecurityDesc']))
+		n += 1
+	if 'Pool' in d:
+		add('691=' + str(d['Pool']))
+		n += 1
+	if 'ContractSettlMonth' in d:
+		add('667=' + str(d['ContractSettlMonth']))
+		n += 1
+	if 'CPProgram' in d:
+		add('875=' + str(d['CPProgram']))
+		n += 1
+	if 'CPRegType' in d:
+		add('876=' + str(d['CPRegType']))
+		n += 1
+	if 'NoEvents' in d:
+		grp = d['NoEvents']
+		add('864=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoEvents(entry, fixm)
+		n += 1
+	if 'DatedDate' in d:
+		add('873=' + str(d['DatedDate']))
+		n += 1
+	if 'InterestAccrualDate' in d:
+		add('874=' + str(d['InterestAccrualDate']))
+		n += 1
+	if 'AgreementDesc' in d:
+		add('913=' + str(d['AgreementDesc']))
+		n += 1
+	if 'AgreementID' in d:
+		add('914=' + str(d['AgreementID']))
+		n += 1
+	if 'AgreementDate' in d:
+		add('915=' + str(d['AgreementDate']))
+		n += 1
+	if 'AgreementCurrency' in d:
+		add('918=' + str(d['AgreementCurrency']))
+		n += 1
+	if 'TerminationType' in d:
+		add('788=' + str(d['TerminationType']))
+		n += 1
+	if 'StartDate' in d:
+		add('916=' + str(d['StartDate']))
+		n += 1
+	if 'EndDate' in d:
+		add('917=' + str(d['EndDate']))
+		n += 1
+	if 'DeliveryType' in d:
+		add('919=' + str(d['DeliveryType']))
+		n += 1
+	if 'MarginRatio' in d:
+		add('898=' + str(d['MarginRatio']))
+		n += 1
+	if 'NoUnderlyings' in d:
+		grp = d['NoUnderlyings']
+		add('711=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoUnderlyings(entry, fixm)
+		n += 1
+	if 'PrevClosePx' in d:
+		add('140=' + str(d['PrevClosePx']))
+		n += 1
+	if 'Side' in d:
+		add('54=' + str(d['Side']))
+		n += 1
+	if 'LocateReqd' in d:
+		add('114=' + str(d['LocateReqd']))
+		n += 1
+	if 'TransactTime' in d:
+		add('60=' + str(d['TransactTime']))
+		n += 1
+	if 'NoStipulations' in d:
+		grp = d['NoStipulations']
+		add('232=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoStipulations(entry, fixm)
+		n += 1
+	if 'QtyType' in d:
+		add('854=' + str(d['QtyType']))
+		n += 1
+	if 'OrderQty' in d:
+		add('38=' + str(d['OrderQty']))
+		n += 1
+	if 'CashOrderQty' in d:
+		add('152=' + str(d['CashOrderQty']))
+		n += 1
+	if 'OrderPercent' in d:
+		add('516=' + str(d['OrderPercent']))
+		n += 1
+	if 'RoundingDirection' in d:
+		add('468=' + str(d['RoundingDirection']))
+		n += 1
+	if 'RoundingModulus' in d:
+		add('469=' + str(d['RoundingModulus']))
+		n += 1
+	if 'OrdType' in d:
+		add('40=' + str(d['OrdType']))
+		n += 1
+	if 'PriceType' in d:
+		add('423=' + str(d['PriceType']))
+		n += 1
+	if 'Price' in d:
+		add('44=' + str(d['Price']))
+		n += 1
+	if 'StopPx' in d:
+		add('99=' + str(d['StopPx']))
+		n += 1
+	if 'Spread' in d:
+		add('218=' + str(d['Spread']))
+		n += 1
+	if 'BenchmarkCurveCurrency' in d:
+		add('220=' + str(d['BenchmarkCurveCurrency']))
+		n += 1
+	if 'BenchmarkCurveName' in d:
+		add('221=' + str(d['BenchmarkCurveName']))
+		n += 1
+	if 'BenchmarkCurvePoint' in d:
+		add('222=' + str(d['BenchmarkCurvePoint']))
+		n += 1
+	if 'BenchmarkPrice' in d:
+		add('662=' + str(d['BenchmarkPrice']))
+		n += 1
+	if 'BenchmarkPriceType' in d:
+		add('663=' + str(d['BenchmarkPriceType']))
+		n += 1
+	if 'BenchmarkSecurityID' in d:
+		add('699=' + str(d['BenchmarkSecurityID']))
+		n += 1
+	if 'BenchmarkSecurityIDSource' in d:
+		add('761=' + str(d['BenchmarkSecurityIDSource']))
+		n += 1
+	if 'YieldType' in d:
+		add('235=' + str(d['YieldType']))
+		n += 1
+	if 'Yield' in d:
+		add('236=' + str(d['Yield']))
+		n += 1
+	if 'YieldCalcDate' in d:
+		add('701=' + str(d['YieldCalcDate']))
+		n += 1
+	if 'YieldRedemptionDate' in d:
+		add('696=' + str(d['YieldRedemptionDate']))
+		n += 1
+	if 'YieldRedemptionPrice' in d:
+		add('697=' + str(d['YieldRedemptionPrice']))
+		n += 1
+	if 'YieldRedemptionPriceType' in d:
+		add('698=' + str(d['YieldRedemptionPriceType']))
+		n += 1
+	if 'Currency' in d:
+		add('15=' + str(d['Currency']))
+		n += 1
+	if 'ComplianceID' in d:
+		add('376=' + str(d['ComplianceID']))
+		n += 1
+	if 'SolicitedFlag' in d:
+		add('377=' + str(d['SolicitedFlag']))
+		n += 1
+	if 'IOIid' in d:
+		add('23=' + str(d['IOIid']))
+		n += 1
+	if 'QuoteID' in d:
+		add('117=' + str(d['QuoteID']))
+		n += 1
+	if 'TimeInForce' in d:
+		add('59=' + str(d['TimeInForce']))
+		n += 1
+	if 'EffectiveTime' in d:
+		add('168=' + str(d['EffectiveTime']))
+		n += 1
+	if 'ExpireDate' in d:
+		add('432=' + str(d['ExpireDate']))
+		n += 1
+	if 'ExpireTime' in d:
+		add('126=' + str(d['ExpireTime']))
+		n += 1
+	if 'GTBookingInst' in d:
+		add('427=' + str(d['GTBookingInst']))
+		n += 1
+	if 'Commission' in d:
+		add('12=' + str(d['Commission']))
+		n += 1
+	if 'CommType' in d:
+		add('13=' + str(d['CommType']))
+		n += 1
+	if 'CommCurrency' in d:
+		add('479=' + str(d['CommCurrency']))
+		n += 1
+	if 'FundRenewWaiv' in d:
+		add('497=' + str(d['FundRenewWaiv']))
+		n += 1
+	if 'OrderCapacity' in d:
+		add('528=' + str(d['OrderCapacity']))
+		n += 1
+	if 'OrderRestrictions' in d:
+		add('529=' + str(d['OrderRestrictions']))
+		n += 1
+	if 'CustOrderCapacity' in d:
+		add('582=' + str(d['CustOrderCapacity']))
+		n += 1
+	if 'ForexReq' in d:
+		add('121=' + str(d['ForexReq']))
+		n += 1
+	if 'SettlCurrency' in d:
+		add('120=' + str(d['SettlCurrency']))
+		n += 1
+	if 'BookingType' in d:
+		add('775=' + str(d['BookingType']))
+		n += 1
+	if 'Text' in d:
+		add('58=' + str(d['Text']))
+		n += 1
+	if 'EncodedTextLen' in d:
+		add('354=' + str(d['EncodedTextLen']))
+		n += 1
+	if 'EncodedText' in d:
+		add('355=' + str(d['EncodedText']))
+		n += 1
+	if 'SettlDate2' in d:
+		add('193=' + str(d['SettlDate2']))
+		n += 1
+	if 'OrderQty2' in d:
+		add('192=' + str(d['OrderQty2']))
+		n += 1
+	if 'Price2' in d:
+		add('640=' + str(d['Price2']))
+		n += 1
+	if 'PositionEffect' in d:
+		add('77=' + str(d['PositionEffect']))
+		n += 1
+	if 'CoveredOrUncovered' in d:
+		add('203=' + str(d['CoveredOrUncovered']))
+		n += 1
+	if 'MaxShow' in d:
+		add('210=' + str(d['MaxShow']))
+		n += 1
+	if 'PegOffsetValue' in d:
+		add('211=' + str(d['PegOffsetValue']))
+		n += 1
+	if 'PegMoveType' in d:
+		add('835=' + str(d['PegMoveType']))
+		n += 1
+	if 'PegOffsetType' in d:
+		add('836=' + str(d['PegOffsetType']))
+		n += 1
+	if 'PegLimitType' in d:
+		add('837=' + str(d['PegLimitType']))
+		n += 1
+	if 'PegRoundDirection' in d:
+		add('838=' + str(d['PegRoundDirection']))
+		n += 1
+	if 'PegScope' in d:
+		add('840=' + str(d['PegScope']))
+		n += 1
+	if 'DiscretionInst' in d:
+		add('388=' + str(d['DiscretionInst']))
+		n += 1
+	if 'DiscretionOffsetValue' in d:
+		add('389=' + str(d['DiscretionOffsetValue']))
+		n += 1
+	if 'DiscretionMoveType' in d:
+		add('841=' + str(d['DiscretionMoveType']))
+		n += 1
+	if 'DiscretionOffsetType' in d:
+		add('842=' + str(d['DiscretionOffsetType']))
+		n += 1
+	if 'DiscretionLimitType' in d:
+		add('843=' + str(d['DiscretionLimitType']))
+		n += 1
+	if 'DiscretionRoundDirection' in d:
+		add('844=' + str(d['DiscretionRoundDirection']))
+		n += 1
+	if 'DiscretionScope' in d:
+		add('846=' + str(d['DiscretionScope']))
+		n += 1
+	if 'TargetStrategy' in d:
+		add('847=' + str(d['TargetStrategy']))
+		n += 1
+	if 'TargetStrategyParameters' in d:
+		add('848=' + str(d['TargetStrategyParameters']))
+		n += 1
+	if 'ParticipationRate' in d:
+		add('849=' + str(d['ParticipationRate']))
+		n += 1
+	if 'CancellationRights' in d:
+		add('480=' + str(d['CancellationRights']))
+		n += 1
+	if 'MoneyLaunderingStatus' in d:
+		add('481=' + str(d['MoneyLaunderingStatus']))
+		n += 1
+	if 'RegistID' in d:
+		add('513=' + str(d['RegistID']))
+		n += 1
+	if 'Designation' in d:
+		add('494=' + str(d['Designation']))
+		n += 1
+	if len(d) > n:
+		_make_mbody(obj, obj._context, fixm, _msg_NewOrderSingle_names)
+	return fixm
+
+def _decode_NewOrderSingle(obj, fields, index, context):
+	d = obj.__dict__
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _msg_NewOrderSingle_tags.get(num)
+		if spec is None:
+			# not a field of this message, continue with generic decoder
+			body, index = _extract_body(fields, index, context, obj)
+			return index
+		name, pytype, decode_grp = spec
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	return index
 
 class NewOrderSingle(FixObject):
-	pass
+	_encode = staticmethod(_encode_NewOrderSingle)
+	_decode = staticmethod(_decode_NewOrderSingle)
+
+_msg_News_names = frozenset(['OrigTime', 'Urgency', 'Headline', 'EncodedHeadlineLen', 'EncodedHeadline', 'NoRoutingIDs', 'NoRelatedSym', 'NoLegs', 'NoUnderlyings', 'LinesOfText', 'URLLink', 'RawDataLength', 'RawData'])
+
+_msg_News_tags = {
+	42: ('OrigTime', str, None),
+	61: ('Urgency', str, None),
+	148: ('Headline', str, None),
+	358: ('EncodedHeadlineLen', str, None),
+	359: ('EncodedHeadline', str, None),
+	215: ('NoRoutingIDs', int, _decode_grp_NoRoutingIDs),
+	146: ('NoRelatedSym', int, _decode_grp_NoRelatedSym),
+	555: ('NoLegs', int, _decode_grp_NoLegs),
+	711: ('NoUnderlyings', int, _decode_grp_NoUnderlyings),
+	33: ('LinesOfText', int, _decode_grp_LinesOfText),
+	149: ('URLLink', str, None),
+	95: ('RawDataLength', str, None),
+	96: ('RawData', str, None),
+}
+
+def _encode_News(obj, fixm):
+	d = obj.__dict__
+	add = fixm.append
+	n = 1
+	if 'OrigTime' in d:
+		add('42=' + str(d['OrigTime']))
+		n += 1
+	if 'Urgency' in d:
+		add('61=' + str(d['Urgency']))
+		n += 1
+	if 'Headline' in d:
+		add('148=' + str(d['Headline']))
+		n += 1
+	if 'EncodedHeadlineLen' in d:
+		add('358=' + str(d['EncodedHeadlineLen']))
+		n += 1
+	if 'EncodedHeadline' in d:
+		add('359=' + str(d['EncodedHeadline']))
+		n += 1
+	if 'NoRoutingIDs' in d:
+		grp = d['NoRoutingIDs']
+		add('215=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoRoutingIDs(entry, fixm)
+		n += 1
+	if 'NoRelatedSym' in d:
+		grp = d['NoRelatedSym']
+		add('146=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoRelatedSym(entry, fixm)
+		n += 1
+	if 'NoLegs' in d:
+		grp = d['NoLegs']
+		add('555=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoLegs(entry, fixm)
+		n += 1
+	if 'NoUnderlyings' in d:
+		grp = d['NoUnderlyings']
+		add('711=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoUnderlyings(entry, fixm)
+		n += 1
+	if 'LinesOfText' in d:
+		grp = d['LinesOfText']
+		add('33=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_LinesOfText(entry, fixm)
+		n += 1
+	if 'URLLink' in d:
+		add('149=' + str(d['URLLink']))
+		n += 1
+	if 'RawDataLength' in d:
+		add('95=' + str(d['RawDataLength']))
+		n += 1
+	if 'RawData' in d:
+		add('96=' + str(d['RawData']))
+		n += 1
+	if len(d) > n:
+		_make_mbody(obj, obj._context, fixm, _msg_News_names)
+	return fixm
+
+def _decode_News(obj, fields, index, context):
+	d = obj.__dict__
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _msg_News_tags.get(num)
+		if spec is None:
+			# not a field of this message, continue with generic decoder
+			body, index = _extract_body(fields, index, context, obj)
+			return index
+		name, pytype, decode_grp = spec
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	return index
 
 class News(FixObject):
-	pass
+	_encode = staticmethod(_encode_News)
+	_decode = staticmethod(_decode_News)
+
+_msg_OrderCancelReject_names = frozenset(['OrderID', 'SecondaryOrderID', 'SecondaryClOrdID', 'ClOrdID', 'ClOrdLinkID', 'OrigClOrdID', 'OrdStatus', 'WorkingIndicator', 'OrigOrdModTime', 'ListID', 'Account', 'AcctIDSource', 'AccountType', 'TradeOriginationDate', 'TradeDate', 'TransactTime', 'CxlRejResponseTo', 'CxlRejReason', 'Text', 'EncodedTextLen', 'EncodedText'])
+
+_msg_OrderCancelReject_tags = {
+	37: ('OrderID', str, None),
+	198: ('SecondaryOrderID', str, None),
+	526: ('SecondaryClOrdID', str, None),
+	11: ('ClOrdID', str, None),
+	583: ('ClOrdLinkID', str, None),
+	41: ('OrigClOrdID', str, None),
+	39: ('OrdStatus', str, None),
+	636: ('WorkingIndicator', str, None),
+	586: ('OrigOrdModTime', str, None),
+	66: ('ListID', str, None),
+	1: ('Account', str, None),
+	660: ('AcctIDSource', int, None),
+	581: ('AccountType', int, None),
+	229: ('TradeOriginationDate', str, None),
+	75: ('TradeDate', str, None),
+	60: ('TransactTime', str, None),
+	434: ('CxlRejResponseTo', str, None),
+	102: ('CxlRejReason', int, None),
+	58: ('Text', str, None),
+	354: ('EncodedTextLen', str, None),
+	355: ('EncodedText', str, None),
+}
+
+def _encode_OrderCancelReject(obj, fixm):
+	d = obj.__dict__
+	add = fixm.append
+	n = 1
+	if 'OrderID' in d:
+		add('37=' + str(d['OrderID']))
+		n += 1
+	if 'SecondaryOrderID' in d:
+		add('198=' + str(d['SecondaryOrderID']))
+		n += 1
+	if 'SecondaryClOrdID' in d:
+		add('526=' + str(d['SecondaryClOrdID']))
+		n += 1
+	if 'ClOrdID' in d:
+		add('11=' + str(d['ClOrdID']))
+		n += 1
+	if 'ClOrdLinkID' in d:
+		add('583=' + str(d['ClOrdLinkID']))
+		n += 1
+	if 'OrigClOrdID' in d:
+		add('41=' + str(d['OrigClOrdID']))
+		n += 1
+	if 'OrdStatus' in d:
+		add('39=' + str(d['OrdStatus']))
+		n += 1
+	if 'WorkingIndicator' in d:
+		add('636=' + str(d['WorkingIndicator']))
+		n += 1
+	if 'OrigOrdModTime' in d:
+		add('586=' + str(d['OrigOrdModTime']))
+		n += 1
+	if 'ListID' in d:
+		add('66=' + str(d['ListID']))
+		n += 1
+	if 'Account' in d:
+		add('1=' + str(d['Account']))
+		n += 1
+	if 'AcctIDSource' in d:
+		add('660=' + str(d['AcctIDSource']))
+		n += 1
+	if 'AccountType' in d:
+		add('581=' + str(d['AccountType']))
+		n += 1
+	if 'TradeOriginationDate' in d:
+		add('229=' + str(d['TradeOriginationDate']))
+		n += 1
+	if 'TradeDate' in d:
+		add('75=' + str(d['TradeDate']))
+		n += 1
+	if 'TransactTime' in d:
+		add('60=' + str(d['TransactTime']))
+		n += 1
+	if 'CxlRejResponseTo' in d:
+		add('434=' + str(d['CxlRejResponseTo']))
+		n += 1
+	if 'CxlRejReason' in d:
+		add('102=' + str(d['CxlRejReason']))
+		n += 1
+	if 'Text' in d:
+		add('58=' + str(d['Text']))
+		n += 1
+	if 'EncodedTextLen' in d:
+		add('354=' + str(d['EncodedTextLen']))
+		n += 1
+	if 'EncodedText' in d:
+		add('355=' + str(d['EncodedText']))
+		n += 1
+	if len(d) > n:
+		_make_mbody(obj, obj._context, fixm, _msg_OrderCancelReject_names)
+	return fixm
+
+def _decode_OrderCancelReject(obj, fields, index, context):
+	d = obj.__dict__
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _msg_OrderCancelReject_tags.get(num)
+		if spec is None:
+			# not a field of this message, continue with generic decoder
+			body, index = _extract_body(fields, index, context, obj)
+			return index
+		name, pytype, decode_grp = spec
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	return index
 
 class OrderCancelReject(FixObject):
-	pass
+	_encode = staticmethod(_encode_OrderCancelReject)
+	_decode = staticmethod(_decode_OrderCancelReject)
+
+_msg_OrderCancelReplaceRequest_names = frozenset(['OrderID', 'NoPartyIDs', 'TradeOriginationDate', 'TradeDate', 'OrigClOrdID', 'ClOrdID', 'SecondaryClOrdID', 'ClOrdLinkID', 'ListID', 'OrigOrdModTime', 'Account', 'AcctIDSource', 'AccountType', 'DayBookingInst', 'BookingUnit', 'PreallocMethod', 'AllocID', 'NoAllocs', 'SettlType', 'SettlDate', 'CashMargin', 'ClearingFeeIndicator', 'HandlInst', 'ExecInst', 'MinQty', 'MaxFloor', 'ExDestination', 'NoTradingSessions', 'Symbol', 'SymbolSfx', 'SecurityID', 'SecurityIDSource', 'NoSecurityAltID', 'Product', 'CFICode', 'SecurityType', 'SecuritySubType', 'MaturityMonthYear', 'MaturityDate', 'CouponPaymentDate', 'IssueDate', 'RepoCollateralSecurityType', 'RepurchaseTerm', 'RepurchaseRate', 'Factor', 'CreditRating', 'InstrRegistry', 'CountryOfIssue', 'StateOrProvinceOfIssue', 'LocaleOfIssue', 'RedemptionDate', 'StrikePrice', 'StrikeCurrency', 'OptAttribute', 'ContractMultiplier', 'CouponRate', 'SecurityExchange', 'Issuer', 'EncodedIssuerLen', 'EncodedIssuer', 'SecurityDesc', 'EncodedSecurityDescLen', 'EncodedSecurityDesc', 'Pool', 'ContractSettlMonth', 'CPProgram', 'CPRegType', 'NoEvents', 'DatedDate', 'InterestAccrualDate', 'AgreementDesc', 'AgreementID', 'AgreementDate', 'AgreementCurrency', 'TerminationType', 'StartDate', 'EndDate', 'DeliveryType', 'MarginRatio', 'NoUnderlyings', 'Side', 'TransactTime', 'QtyType', 'OrderQty', 'CashOrderQty', 'OrderPercent', 'RoundingDirection', 'RoundingModulus', 'OrdType', 'PriceType', 'Price', 'StopPx', 'Spread', 'BenchmarkCurveCurrency', 'BenchmarkCurveName', 'BenchmarkCurvePoint', 'BenchmarkPrice', 'BenchmarkPriceType', 'BenchmarkSecurityID', 'BenchmarkSecurityIDSource', 'YieldType', 'Yield', 'YieldCalcDate', 'YieldRedemptionDate', 'YieldRedemptionPrice', 'YieldRedemptionPriceType', 'PegOffsetValue', 'PegMoveType', 'PegOffsetType', 'PegLimitType', 'PegRoundDirection', 'PegScope', 'DiscretionInst', 'DiscretionOffsetValue', 'DiscretionMoveType', 'DiscretionOffsetType', 'DiscretionLimitType', 'DiscretionRoundDirection', 'DiscretionScope', 'TargetStrategy', 'TargetStrategyParameters', 'ParticipationRate', 'ComplianceID', 'SolicitedFlag', 'Currency', 'TimeInForce', 'EffectiveTime', 'ExpireDate', 'ExpireTime', 'GTBookingInst', 'Commission', 'CommType', 'CommCurrency', 'FundRenewWaiv', 'OrderCapacity', 'OrderRestrictions', 'CustOrderCapacity', 'ForexReq', 'SettlCurrency', 'BookingType', 'Text', 'EncodedTextLen', 'EncodedText', 'SettlDate2', 'OrderQty2', 'Price2', 'PositionEffect', 'CoveredOrUncovered', 'MaxShow', 'LocateReqd', 'CancellationRights', 'MoneyLaunderingStatus', 'RegistID', 'Designation'])
+
+_msg_OrderCancelReplaceRequest_tags = {
+	37: ('OrderID', str, None),
+	453: ('NoPartyIDs', int, _decode_grp_NoPartyIDs),
+	229: ('TradeOriginationDate', str, None),
+	75: ('TradeDate', str, None),
+	41: ('OrigClOrdID', str, None),
+	11: ('ClOrdID', str, None),
+	526: ('SecondaryClOrdID', str, None),
+	583: ('ClOrdLinkID', str, None),
+	66: ('ListID', str, None),
+	586: ('OrigOrdModTime', str, None),
+	1: ('Account', str, None),
+	660: ('AcctIDSource', int, None),
+	581: ('AccountType', int, None),
+	589: ('DayBookingInst', str, None),
+	590: ('BookingUnit', str, None),
+	591: ('PreallocMethod', str, None),
+	70: ('AllocID', str, None),
+	78: ('NoAllocs', int, _decode_grp_NoAllocs),
+	63: ('SettlType', str, None),
+	64: ('SettlDate', str, None),
+	544: ('CashMargin', str, None),
+	635: ('ClearingFeeIndicator', str, None),
+	21: ('HandlInst', str, None),
+	18: ('ExecInst', str, None),
+	110: ('MinQty', float, None),
+	111: ('MaxFloor', float, None),
+	100: ('ExDestination', str, None),
+	386: ('NoTradingSessions', int, _decode_grp_NoTradingSessions),
+	55: ('Symbol', str, None),
+	65: ('SymbolSfx', str, None),
+	48: ('SecurityID', str, None),
+	22: ('SecurityIDSource', str, None),
+	454: ('NoSecurityAltID', int, _decode_grp_NoSecurityAltID),
+	460: ('Product', int, None),
+	461: ('CFICode', str, None),
+	167: ('SecurityType', str, None),
+	762: ('SecuritySubType', str, None),
+	200: ('MaturityMonthYear', str, None),
+	541: ('MaturityDate', str, None),
+	224: ('CouponPaymentDate', str, None),
+	225: ('IssueDate', str, None),
+	239: ('RepoCollateralSecurityType', int, None),
+	226: ('RepurchaseTerm', int, None),
+	227: ('RepurchaseRate', float, None),
+	228: ('Factor', float, None),
+	255: ('CreditRating', str, None),
+	543: ('InstrRegistry', str, None),
+	470: ('CountryOfIssue', str, None),
+	471: ('StateOrProvinceOfIssue', str, None),
+	472: ('LocaleOfIssue', str, None),
+	240: ('RedemptionDate', str, None),
+	202: ('StrikePrice', float, None),
+	947: ('StrikeCurrency', str, None),
+	206: ('OptAttribute', str, None),
+	231: ('ContractMultiplier', float, None),
+	223: ('CouponRate', float, None),
+	207: ('SecurityExchange', str, None),
+	106: ('Issuer', str, None),
+	348: ('EncodedIssuerLen', str, None),
+	349: ('EncodedIssuer', str, None),
+	107: ('SecurityDesc', str, None),
+	350: ('EncodedSecurityDescLen', str, None),
+	351: ('EncodedSecurityDesc', str, None),
+	691: ('Pool', str, None),
+	667: ('ContractSettlMonth', str, None),
+	875: ('CPProgram', int, None),
+	876: ('CPRegType', str, None),
+	864: ('NoEvents', int, _decode_grp_NoEvents),
+	873: ('DatedDate', str, None),
+	874: ('InterestAccrualDate', str, None),
+	913: ('AgreementDesc', str, None),
+	914: ('AgreementID', str, None),
+	915: ('AgreementDate', str, None),
+	918: ('AgreementCurrency', str, None),
+	788: ('TerminationType', int, None),
+	916: ('StartDate', str, None),
+	917: ('EndDate', str, None),
+	919: ('DeliveryType', int, None),
+	898: ('MarginRatio', float, None),
+	711: ('NoUnderlyings', int, _decode_grp_NoUnderlyings),
+	54: ('Side', str, None),
+	60: ('TransactTime', str, None),
+	854: ('QtyType', int, None),
+	38: ('OrderQty', float, None),
+	152: ('CashOrderQty', float, None),
+	516: ('OrderPercent', float, None),
+	468: ('RoundingDirection', str, None),
+	469: ('RoundingModulus', float, None),
+	40: ('OrdType', str, None),
+	423: ('PriceType', int, None),
+	44: ('Price', float, None),
+	99: ('StopPx', float, None),
+	218: ('Spread', float, None),
+	220: ('BenchmarkCurveCurrency', str, None),
+	221: ('BenchmarkCurveName', str, None),
+	222: ('BenchmarkCurvePoint', str, None),
+	662: ('BenchmarkPrice', float, None),
+	663: ('BenchmarkPriceType', int, None),
+	699: ('BenchmarkSecurityID', str, None),
+	761: ('BenchmarkSecurityIDSource', str, None),
+	235: ('YieldType', str, None),
+	236: ('Yield', float, None),
+	701: ('YieldCalcDate', str, None),
+	696: ('YieldRedemptionDate', str, None),
+	697: ('YieldRedemptionPrice', float, None),
+	698: ('YieldRedemptionPriceType', int, None),
+	211: ('PegOffsetValue', float, None),
+	835: ('PegMoveType', int, None),
+	836: ('PegOffsetType', int, None),
+	837: ('PegLimitType', int, None),
+	838: ('PegRoundDirection', int, None),
+	840: ('PegScope', int, None),
+	388: ('DiscretionInst', str, None),
+	389: ('DiscretionOffsetValue', float, None),
+	841: ('DiscretionMoveType', int, None),
+	842: ('DiscretionOffsetType', int, None),
+	843: ('DiscretionLimitType', int, None),
+	844: ('DiscretionRoundDirection', int, None),
+	846: ('DiscretionScope', int, None),
+	847: ('TargetStrategy', int, None),
+	848: ('TargetStrategyParameters', str, None),
+	849: ('ParticipationRate', float, None),
+	376: ('ComplianceID', str, None),
+	377: ('SolicitedFlag', str, None),
+	15: ('Currency', str, None),
+	59: ('TimeInForce', str, None),
+	168: ('EffectiveTime', str, None),
+	432: ('ExpireDate', str, None),
+	126: ('ExpireTime', str, None),
+	427: ('GTBookingInst', int, None),
+	12: ('Commission', float, None),
+	13: ('CommType', str, None),
+	479: ('CommCurrency', str, None),
+	497: ('FundRenewWaiv', str, None),
+	528: ('OrderCapacity', str, None),
+	529: ('OrderRestrictions', str, None),
+	582: ('CustOrderCapacity', int, None),
+	121: ('ForexReq', str, None),
+	120: ('SettlCurrency', str, None),
+	775: ('BookingType', int, None),
+	58: ('Text', str, None),
+	354: ('EncodedTextLen', str, None),
+	355: ('EncodedText', str, None),
+	193: ('SettlDate2', str, None),
+	192: ('OrderQty2', float, None),
+	640: ('Price2', float, None),
+	77: ('PositionEffect', str, None),
+	203: ('CoveredOrUncovered', int, None),
+	210: ('MaxShow', float, None),
+	114: ('LocateReqd', str, None),
+	480: ('CancellationRights', str, None),
+	481: ('MoneyLaunderingStatus', str, None),
+	513: ('RegistID', str, None),
+	494: ('Designation', str, None),
+}
+
+def _encode_OrderCancelReplaceRequest(obj, fixm):
+	d = obj.__dict__
+	add = fixm.append
+	n = 1
+	if 'OrderID' in d:
+		add('37=' + str(d['OrderID']))
+		n += 1
+	if 'NoPartyIDs' in d:
+		grp = d['NoPartyIDs']
+		add('453=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoPartyIDs(entry, fixm)
+		n += 1
+	if 'TradeOriginationDate' in d:
+		add('229=' + str(d['TradeOriginationDate']))
+		n += 1
+	if 'TradeDate' in d:
+		add('75=' + str(d['TradeDate']))
+		n += 1
+	if 'OrigClOrdID' in d:
+		add('41=' + str(d['OrigClOrdID']))
+		n += 1
+	if 'ClOrdID' in d:
+		add('11=' + str(d['ClOrdID']))
+		n += 1
+	if 'SecondaryClOrdID' in d:
+		add('526=' + str(d['SecondaryClOrdID']))
+		n += 1
+	if 'ClOrdLinkID' in d:
+		add('583=' + str(d['ClOrdLinkID']))
+		n += 1
+	if 'ListID' in d:
+		add('66=' + str(d['ListID']))
+		n += 1
+	if 'OrigOrdModTime' in d:
+		add('586=' + str(d['OrigOrdModTime']))
+		n += 1
+	if 'Account' in d:
+		add('1=' + str(d['Account']))
+		n += 1
+	if 'AcctIDSource' in d:
+		add('660=' + str(d['AcctIDSource']))
+		n += 1
+	if 'AccountType' in d:
+		add('581=' + str(d['AccountType']))
+		n += 1
+	if 'DayBookingInst' in d:
+		add('589=' + str(d['DayBookingInst']))
+		n += 1
+	if 'BookingUnit' in d:
+		add('590=' + str(d['BookingUnit']))
+		n += 1
+	if 'PreallocMethod' in d:
+		add('591=' + str(d['PreallocMethod']))
+		n += 1
+	if 'AllocID' in d:
+		add('70=' + str(d['AllocID']))
+		n += 1
+	if 'NoAllocs' in d:
+		grp = d['NoAllocs']
+		add('78=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoAllocs(entry, fixm)
+		n += 1
+	if 'SettlType' in d:
+		add('63=' + str(d['SettlType']))
+		n += 1
+	if 'SettlDate' in d:
+		add('64=' + str(d['SettlDate']))
+		n += 1
+	if 'CashMargin' in d:
+		add('544=' + str(d['CashMargin']))
+		n += 1
+	if 'ClearingFeeIndicator' in d:
+		add('635=' + str(d['ClearingFeeIndicator']))
+		n += 1
+	if 'HandlInst' in d:
+		add('21=' + str(d['HandlInst']))
+		n += 1
+	if 'ExecInst' in d:
+		add('18=' + str(d['ExecInst']))
+		n += 1
+	if 'MinQty' in d:
+		add('110=' + str(d['MinQty']))
+		n += 1
+	if 'MaxFloor' in d:
+		add('111=' + str(d['MaxFloor']))
+		n += 1
+	if 'ExDestination' in d:
+		add('100=' + str(d['ExDestination']))
+		n += 1
+	if 'NoTradingSessions' in d:
+		grp = d['NoTradingSessions']
+		add('386=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoTradingSessions(entry, fixm)
+		n += 1
+	if 'Symbol' in d:
+		add('55=' + str(d['Symbol']))
+		n += 1
+	if 'SymbolSfx' in d:
+		add('65=' + str(d['SymbolSfx']))
+		n += 1
+	if 'SecurityID' in d:
+		add('48=' + str(d['SecurityID']))
+		n += 1
+	if 'SecurityIDSource' in d:
+		add('22=' + str(d['SecurityIDSource']))
+		n += 1
+	if 'NoSecurityAltID' in d:
+		grp = d['NoSecurityAltID']
+		add('454=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoSecurityAltID(entry, fixm)
+		n += 1
+	if 'Product' in d:
+		add('460=' + str(d['Product']))
+		n += 1
+	if 'CFICode' in d:
+		add('461=' + str(d['CFICode']))
+		n += 1
+	if 'SecurityType' in d:
+		add('167=' + str(d['SecurityType']))
+		n += 1
+	if 'SecuritySubType' in d:
+		add('762=' + str(d['SecuritySubType']))
+		n += 1
+	if 'MaturityMonthYear' in d:
+		add('200=' + str(d['MaturityMonthYear']))
+		n += 1
+	if 'MaturityDate' in d:
+		add('541=' + str(d['MaturityDate']))
+		n += 1
+	if 'CouponPaymentDate' in d:
+		add('224=' + str(d['CouponPaymentDate']))
+		n += 1
+	if 'IssueDate' in d:
+		add('225=' + str(d['IssueDate']))
+		n += 1
+	if 'RepoCollateralSecurityType' in d:
+		add('239=' + str(d['RepoCollateralSecurityType']))
+		n += 1
+	if 'RepurchaseTerm' in d:
+		add('226=' + str(d['RepurchaseTerm']))
+		n += 1
+	if 'RepurchaseRate' in d:
+		add('227=' + str(d['RepurchaseRate']))
+		n += 1
+	if 'Factor' in d:
+		add('228=' + str(d['Factor']))
+		n += 1
+	if 'CreditRating' in d:
+		add('255=' + str(d['CreditRating']))
+		n += 1
+	if 'InstrRegistry' in d:
+		add('543=' + str(d['InstrRegistry']))
+		n += 1
+	if 'CountryOfIssue' in d:
+		add('470=' + str(d['CountryOfIssue']))
+		n += 1
+	if 'StateOrProvinceOfIssue' in d:
+		add('471=' + str(d['StateOrProvinceOfIssue']))
+		n += 1
+	if 'LocaleOfIssue' in d:
+		add('472=' + str(d['LocaleOfIssue']))
+		n += 1
+	if 'RedemptionDate' in d:
+		add('240=' + str(d['RedemptionDate']))
+		n += 1
+	if 'StrikePrice' in d:
+		add('202=' + str(d['StrikePrice']))
+		n += 1
+	if 'StrikeCurrency' in d:
+		add('947=' + str(d['StrikeCurrency']))
+		n += 1
+	if 'OptAttribute' in d:
+		add('206=' + str(d['OptAttribute']))
+		n += 1
+	if 'ContractMultiplier' in d:
+		add('231=' + str(d['ContractMultiplier']))
+		n += 1
+	if 'CouponRate' in d:
+		add('223=' + str(d['CouponRate']))
+		n += 1
+	if 'SecurityExchange' in d:
+		add('207=' + str(d['SecurityExchange']))
+		n += 1
+	if 'Issuer' in d:
+		add('106=' + str(d['Issuer']))
+		n += 1
+	if 'EncodedIssuerLen' in d:
+		add('348=' + str(d['EncodedIssuerLen']))
+		n += 1
+	if 'EncodedIssuer' in d:
+		add('349=' + str(d['EncodedIssuer']))
+		n += 1
+	if 'SecurityDesc' in d:
+		add('107=' + str(d['SecurityDesc']))
+		n += 1
+	if 'EncodedSecurityDescLen' in d:
+		add('350=' + str(d['EncodedSecurityDescLen']))
+		n += 1
+	if 'EncodedSecurityDesc' in d:
+		add('351=' + str(d['EncodedSecurityDesc']))
+		n += 1
+	if 'Pool' in d:
+		add('691=' + str(d['Pool']))
+		n += 1
+	if 'ContractSettlMonth' in d:
+		add('667=' + str(d['ContractSettlMonth']))
+		n += 1
+	if 'CPProgram' in d:
+		add('875=' + str(d['CPProgram']))
+		n += 1
+	if 'CPRegType' in d:
+		add('876=' + str(d['CPRegType']))
+		n += 1
+	if 'NoEvents' in d:
+		grp = d['NoEvents']
+		add('864=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoEvents(entry, fixm)
+		n += 1
+	if 'DatedDate' in d:
+		add('873=' + str(d['DatedDate']))
+		n += 1
+	if 'InterestAccrualDate' in d:
+		add('874=' + str(d['InterestAccrualDate']))
+		n += 1
+	if 'AgreementDesc' in d:
+		add('913=' + str(d['AgreementDesc']))
+		n += 1
+	if 'AgreementID' in d:
+		add('914=' + str(d['AgreementID']))
+		n += 1
+	if 'AgreementDate' in d:
+		add('915=' + str(d['AgreementDate']))
+		n += 1
+	if 'AgreementCurrency' in d:
+		add('918=' + str(d['AgreementCurrency']))
+		n += 1
+	if 'TerminationType' in d:
+		add('788=' + str(d['TerminationType']))
+		n += 1
+	if 'StartDate' in d:
+		add('916=' + str(d['StartDate']))
+		n += 1
+	if 'EndDate' in d:
+		add('917=' + str(d['EndDate']))
+		n += 1
+	if 'DeliveryType' in d:
+		add('919=' + str(d['DeliveryType']))
+		n += 1
+	if 'MarginRatio' in d:
+		add('898=' + str(d['MarginRatio']))
+		n += 1
+	if 'NoUnderlyings' in d:
+		grp = d['NoUnderlyings']
+		add('711=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoUnderlyings(entry, fixm)
+		n += 1
+	if 'Side' in d:
+		add('54=' + str(d['Side']))
+		n += 1
+	if 'TransactTime' in d:
+		add('60=' + str(d['TransactTime']))
+		n += 1
+	if 'QtyType' in d:
+		add('854=' + str(d['QtyType']))
+		n += 1
+	if 'OrderQty' in d:
+		add('38=' + str(d['OrderQty']))
+		n += 1
+	if 'CashOrderQty' in d:
+		add('152=' + str(d['CashOrderQty']))
+		n += 1
+	if 'OrderPercent' in d:
+		add('516=' + str(d['OrderPercent']))
+		n += 1
+	if 'RoundingDirection' in d:
+		add('468=' + str(d['RoundingDirection']))
+		n += 1
+	if 'RoundingModulus' in d:
+		add('469=' + str(d['RoundingModulus']))
+		n += 1
+	if 'OrdType' in d:
+		add('40=' + str(d['OrdType']))
+		n += 1
+	if 'PriceType' in d:
+		add('423=' + str(d['PriceType']))
+		n += 1
+	if 'Price' in d:
+		add('44=' + str(d['Price']))
+		n += 1
+	if 'StopPx' in d:
+		add('99=' + str(d['StopPx']))
+		n += 1
+	if 'Spread' in d:
+		add('218=' + str(d['Spread']))
+		n += 1
+	if 'BenchmarkCurveCurrency' in d:
+		add('220=' + str(d['BenchmarkCurveCurrency']))
+		n += 1
+	if 'BenchmarkCurveName' in d:
+		add('221=' + str(d['BenchmarkCurveName']))
+		n += 1
+	if 'BenchmarkCurvePoint' in d:
+		add('222=' + str(d['BenchmarkCurvePoint']))
+		n += 1
+	if 'BenchmarkPrice' in d:
+		add('662=' + str(d['BenchmarkPrice']))
+		n += 1
+	if 'BenchmarkPriceType' in d:
+		add('663=' + str(d['BenchmarkPriceType']))
+		n += 1
+	if 'BenchmarkSecurityID' in d:
+		add('699=' + str(d['BenchmarkSecurityID']))
+		n += 1
+	if 'BenchmarkSecurityIDSource' in d:
+		add('761=' + str(d['BenchmarkSecurityIDSource']))
+		n += 1
+	if 'YieldType' in d:
+		add('235=' + str(d['YieldType']))
+		n += 1
+	if 'Yield' in d:
+		add('236=' + str(d['Yield']))
+		n += 1
+	if 'YieldCalcDate' in d:
+		add('701=' + str(d['YieldCalcDate']))
+		n += 1
+	if 'YieldRedemptionDate' in d:
+		add('696=' + str(d['YieldRedemptionDate']))
+		n += 1
+	if 'YieldRedemptionPrice' in d:
+		add('697=' + str(d['YieldRedemptionPrice']))
+		n += 1
+	if 'YieldRedemptionPriceType' in d:
+		add('698=' + str(d['YieldRedemptionPriceType']))
+		n += 1
+	if 'PegOffsetValue' in d:
+		add('211=' + str(d['PegOffsetValue']))
+		n += 1
+	if 'PegMoveType' in d:
+		add('835=' + str(d['PegMoveType']))
+		n += 1
+	if 'PegOffsetType' in d:
+		add('836=' + str(d['PegOffsetType']))
+		n += 1
+	if 'PegLimitType' in d:
+		add('837=' + str(d['PegLimitType']))
+		n += 1
+	if 'PegRoundDirection' in d:
+		add('838=' + str(d['PegRoundDirection']))
+		n += 1
+	if 'PegScope' in d:
+		add('840=' + str(d['PegScope']))
+		n += 1
+	if 'DiscretionInst' in d:
+		add('388=' + str(d['DiscretionInst']))
+		n += 1
+	if 'DiscretionOffsetValue' in d:
+		add('389=' + str(d['DiscretionOffsetValue']))
+		n += 1
+	if 'DiscretionMoveType' in d:
+		add('841=' + str(d['DiscretionMoveType']))
+		n += 1
+	if 'DiscretionOffsetType' in d:
+		add('842=' + str(d['DiscretionOffsetType']))
+		n += 1
+	if 'DiscretionLimitType' in d:
+		add('843=' + str(d['DiscretionLimitType']))
+		n += 1
+	if 'DiscretionRoundDirection' in d:
+		add('844=' + str(d['DiscretionRoundDirection']))
+		n += 1
+	if 'DiscretionScope' in d:
+		add('846=' + str(d['DiscretionScope']))
+		n += 1
+	if 'TargetStrategy' in d:
+		add('847=' + str(d['TargetStrategy']))
+		n += 1
+	if 'TargetStrategyParameters' in d:
+		add('848=' + str(d['TargetStrategyParameters']))
+		n += 1
+	if 'ParticipationRate' in d:
+		add('849=' + str(d['ParticipationRate']))
+		n += 1
+	if 'ComplianceID' in d:
+		add('376=' + str(d['ComplianceID']))
+		n += 1
+	if 'SolicitedFlag' in d:
+		add('377=' + str(d['SolicitedFlag']))
+		n += 1
+	if 'Currency' in d:
+		add('15=' + str(d['Currency']))
+		n += 1
+	if 'TimeInForce' in d:
+		add('59=' + str(d['TimeInForce']))
+		n += 1
+	if 'EffectiveTime' in d:
+		add('168=' + str(d['EffectiveTime']))
+		n += 1
+	if 'ExpireDate' in d:
+		add('432=' + str(d['ExpireDate']))
+		n += 1
+	if 'ExpireTime' in d:
+		add('126=' + str(d['ExpireTime']))
+		n += 1
+	if 'GTBookingInst' in d:
+		add('427=' + str(d['GTBookingInst']))
+		n += 1
+	if 'Commission' in d:
+		add('12=' + str(d['Commission']))
+		n += 1
+	if 'CommType' in d:
+		add('13=' + str(d['CommType']))
+		n += 1
+	if 'CommCurrency' in d:
+		add('479=' + str(d['CommCurrency']))
+		n += 1
+	if 'FundRenewWaiv' in d:
+		add('497=' + str(d['FundRenewWaiv']))
+		n += 1
+	if 'OrderCapacity' in d:
+		add('528=' + str(d['OrderCapacity']))
+		n += 1
+	if 'OrderRestrictions' in d:
+		add('529=' + str(d['OrderRestrictions']))
+		n += 1
+	if 'CustOrderCapacity' in d:
+		add('582=' + str(d['CustOrderCapacity']))
+		n += 1
+	if 'ForexReq' in d:
+		add('121=' + str(d['ForexReq']))
+		n += 1
+	if 'SettlCurrency' in d:
+		add('120=' + str(d['SettlCurrency']))
+		n += 1
+	if 'BookingType' in d:
+		add('775=' + str(d['BookingType']))
+		n += 1
+	if 'Text' in d:
+		add('58=' + str(d['Text']))
+		n += 1
+	if 'EncodedTextLen' in d:
+		add('354=' + str(d['EncodedTextLen']))
+		n += 1
+	if 'EncodedText' in d:
+		add('355=' + str(d['EncodedText']))
+		n += 1
+	if 'SettlDate2' in d:
+		add('193=' + str(d['SettlDate2']))
+		n += 1
+	if 'OrderQty2' in d:
+		add('192=' + str(d['OrderQty2']))
+		n += 1
+	if 'Price2' in d:
+		add('640=' + str(d['Price2']))
+		n += 1
+	if 'PositionEffect' in d:
+		add('77=' + str(d['PositionEffect']))
+		n += 1
+	if 'CoveredOrUncovered' in d:
+		add('203=' + str(d['CoveredOrUncovered']))
+		n += 1
+	if 'MaxShow' in d:
+		add('210=' + str(d['MaxShow']))
+		n += 1
+	if 'LocateReqd' in d:
+		add('114=' + str(d['LocateReqd']))
+		n += 1
+	if 'CancellationRights' in d:
+		add('480=' + str(d['CancellationRights']))
+		n += 1
+	if 'MoneyLaunderingStatus' in d:
+		add('481=' + str(d['MoneyLaunderingStatus']))
+		n += 1
+	if 'RegistID' in d:
+		add('513=' + str(d['RegistID']))
+		n += 1
+	if 'Designation' in d:
+		add('494=' + str(d['Designation']))
+		n += 1
+	if len(d) > n:
+		_make_mbody(obj, obj._context, fixm, _msg_OrderCancelReplaceRequest_names)
+	return fixm
+
+def _decode_OrderCancelReplaceRequest(obj, fields, index, context):
+	d = obj.__dict__
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _msg_OrderCancelReplaceRequest_tags.get(num)
+		if spec is None:
+			# not a field of this message, continue with generic decoder
+			body, index = _extract_body(fields, index, context, obj)
+			return index
+		name, pytype, decode_grp = spec
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	return index
 
 class OrderCancelReplaceRequest(FixObject):
-	pass
+	_encode = staticmethod(_encode_OrderCancelReplaceRequest)
+	_decode = staticmethod(_decode_OrderCancelReplaceRequest)
+
+_msg_OrderCancelRequest_names = frozenset(['OrigClOrdID', 'OrderID', 'ClOrdID', 'SecondaryClOrdID', 'ClOrdLinkID', 'ListID', 'OrigOrdModTime', 'Account', 'AcctIDSource', 'AccountType', 'NoPartyIDs', 'Symbol', 'SymbolSfx', 'SecurityID', 'SecurityIDSource', 'NoSecurityAltID', 'Product', 'CFICode', 'SecurityType', 'SecuritySubType', 'MaturityMonthYear', 'MaturityDate', 'CouponPaymentDate', 'IssueDate', 'RepoCollateralSecurityType', 'RepurchaseTerm', 'RepurchaseRate', 'Factor', 'CreditRating', 'InstrRegistry', 'CountryOfIssue', 'StateOrProvinceOfIssue', 'LocaleOfIssue', 'RedemptionDate', 'StrikePrice', 'StrikeCurrency', 'OptAttribute', 'ContractMultiplier', 'CouponRate', 'SecurityExchange', 'Issuer', 'EncodedIssuerLen', 'EncodedIssuer', 'SecurityDesc', 'EncodedSecurityDescLen', 'EncodedSecurityDesc', 'Pool', 'ContractSettlMonth', 'CPProgram', 'CPRegType', 'NoEvents', 'DatedDate', 'InterestAccrualDate', 'AgreementDesc', 'AgreementID', 'AgreementDate', 'AgreementCurrency', 'TerminationType', 'StartDate', 'EndDate', 'DeliveryType', 'MarginRatio', 'NoUnderlyings', 'Side', 'TransactTime', 'OrderQty', 'CashOrderQty', 'OrderPercent', 'RoundingDirection', 'RoundingModulus', 'ComplianceID', 'Text', 'EncodedTextLen', 'EncodedText'])
+
+_msg_OrderCancelRequest_tags = {
+	41: ('OrigClOrdID', str, None),
+	37: ('OrderID', str, None),
+	11: ('ClOrdID', str, None),
+	526: ('SecondaryClOrdID', str, None),
+	583: ('ClOrdLinkID', str, None),
+	66: ('ListID', str, None),
+	586: ('OrigOrdModTime', str, None),
+	1: ('Account', str, None),
+	660: ('AcctIDSource', int, None),
+	581: ('AccountType', int, None),
+	453: ('NoPartyIDs', int, _decode_grp_NoPartyIDs),
+	55: ('Symbol', str, None),
+	65: ('SymbolSfx', str, None),
+	48: ('SecurityID', str, None),
+	22: ('SecurityIDSource', str, None),
+	454: ('NoSecurityAltID', int, _decode_grp_NoSecurityAltID),
+	460: ('Product', int, None),
+	461: ('CFICode', str, None),
+	167: ('SecurityType', str, None),
+	762: ('SecuritySubType', str, None),
+	200: ('MaturityMonthYear', str, None),
+	541: ('MaturityDate', str, None),
+	224: ('CouponPaymentDate', str, None),
+	225: ('IssueDate', str, None),
+	239: ('RepoCollateralSecurityType', int, None),
+	226: ('RepurchaseTerm', int, None),
+	227: ('RepurchaseRate', float, None),
+	228: ('Factor', float, None),
+	255: ('CreditRating', str, None),
+	543: ('InstrRegistry', str, None),
+	470: ('CountryOfIssue', str, None),
+	471: ('StateOrProvinceOfIssue', str, None),
+	472: ('LocaleOfIssue', str, None),
+	240: ('RedemptionDate', str, None),
+	202: ('StrikePrice', float, None),
+	947: ('StrikeCurrency', str, None),
+	206: ('OptAttribute', str, None),
+	231: ('ContractMultiplier', float, None),
+	223: ('CouponRate', float, None),
+	207: ('SecurityExchange', str, None),
+	106: ('Issuer', str, None),
+	348: ('EncodedIssuerLen', str, None),
+	349: ('EncodedIssuer', str, None),
+	107: ('SecurityDesc', str, None),
+	350: ('EncodedSecurityDescLen', str, None),
+	351: ('EncodedSecurityDesc', str, None),
+	691: ('Pool', str, None),
+	667: ('ContractSettlMonth', str, None),
+	875: ('CPProgram', int, None),
+	876: ('CPRegType', str, None),
+	864: ('NoEvents', int, _decode_grp_NoEvents),
+	873: ('DatedDate', str, None),
+	874: ('InterestAccrualDate', str, None),
+	913: ('AgreementDesc', str, None),
+	914: ('AgreementID', str, None),
+	915: ('AgreementDate', str, None),
+	918: ('AgreementCurrency', str, None),
+	788: ('TerminationType', int, None),
+	916: ('StartDate', str, None),
+	917: ('EndDate', str, None),
+	919: ('DeliveryType', int, None),
+	898: ('MarginRatio', float, None),
+	711: ('NoUnderlyings', int, _decode_grp_NoUnderlyings),
+	54: ('Side', str, None),
+	60: ('TransactTime', str, None),
+	38: ('OrderQty', float, None),
+	152: ('CashOrderQty', float, None),
+	516: ('OrderPercent', float, None),
+	468: ('RoundingDirection', str, None),
+	469: ('RoundingModulus', float, None),
+	376: ('ComplianceID', str, None),
+	58: ('Text', str, None),
+	354: ('EncodedTextLen', str, None),
+	355: ('EncodedText', str, None),
+}
+
+def _encode_OrderCancelRequest(obj, fixm):
+	d = obj.__dict__
+	add = fixm.append
+	n = 1
+	if 'OrigClOrdID' in d:
+		add('41=' + str(d['OrigClOrdID']))
+		n += 1
+	if 'OrderID' in d:
+		add('37=' + str(d['OrderID']))
+		n += 1
+	if 'ClOrdID' in d:
+		add('11=' + str(d['ClOrdID']))
+		n += 1
+	if 'SecondaryClOrdID' in d:
+		add('526=' + str(d['SecondaryClOrdID']))
+		n += 1
+	if 'ClOrdLinkID' in d:
+		add('583=' + str(d['ClOrdLinkID']))
+		n += 1
+	if 'ListID' in d:
+		add('66=' + str(d['ListID']))
+		n += 1
+	if 'OrigOrdModTime' in d:
+		add('586=' + str(d['OrigOrdModTime']))
+		n += 1
+	if 'Account' in d:
+		add('1=' + str(d['Account']))
+		n += 1
+	if 'AcctIDSource' in d:
+		add('660=' + str(d['AcctIDSource']))
+		n += 1
+	if 'AccountType' in d:
+		add('581=' + str(d['AccountType']))
+		n += 1
+	if 'NoPartyIDs' in d:
+		grp = d['NoPartyIDs']
+		add('453=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoPartyIDs(entry, fixm)
+		n += 1
+	if 'Symbol' in d:
+		add('55=' + str(d['Symbol']))
+		n += 1
+	if 'SymbolSfx' in d:
+		add('65=' + str(d['SymbolSfx']))
+		n += 1
+	if 'SecurityID' in d:
+		add('48=' + str(d['SecurityID']))
+		n += 1
+	if 'SecurityIDSource' in d:
+		add('22=' + str(d['SecurityIDSource']))
+		n += 1
+	if 'NoSecurityAltID' in d:
+		grp = d['NoSecurityAltID']
+		add('454=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoSecurityAltID(entry, fixm)
+		n += 1
+	if 'Product' in d:
+		add('460=' + str(d['Product']))
+		n += 1
+	if 'CFICode' in d:
+		add('461=' + str(d['CFICode']))
+		n += 1
+	if 'SecurityType' in d:
+		add('167=' + str(d['SecurityType']))
+		n += 1
+	if 'SecuritySubType' in d:
+		add('762=' + str(d['SecuritySubType']))
+		n += 1
+	if 'MaturityMonthYear' in d:
+		add('200=' + str(d['MaturityMonthYear']))
+		n += 1
+	if 'MaturityDate' in d:
+		add('541=' + str(d['MaturityDate']))
+		n += 1
+	if 'CouponPaymentDate' in d:
+		add('224=' + str(d['CouponPaymentDate']))
+		n += 1
+	if 'IssueDate' in d:
+		add('225=' + str(d['IssueDate']))
+		n += 1
+	if 'RepoCollateralSecurityType' in d:
+		add('239=' + str(d['RepoCollateralSecurityType']))
+		n += 1
+	if 'RepurchaseTerm' in d:
+		add('226=' + str(d['RepurchaseTerm']))
+		n += 1
+	if 'RepurchaseRate' in d:
+		add('227=' + str(d['RepurchaseRate']))
+		n += 1
+	if 'Factor' in d:
+		add('228=' + str(d['Factor']))
+		n += 1
+	if 'CreditRating' in d:
+		add('255=' + str(d['CreditRating']))
+		n += 1
+	if 'InstrRegistry' in d:
+		add('543=' + str(d['InstrRegistry']))
+		n += 1
+	if 'CountryOfIssue' in d:
+		add('470=' + str(d['CountryOfIssue']))
+		n += 1
+	if 'StateOrProvinceOfIssue' in d:
+		add('471=' + str(d['StateOrProvinceOfIssue']))
+		n += 1
+	if 'LocaleOfIssue' in d:
+		add('472=' + str(d['LocaleOfIssue']))
+		n += 1
+	if 'RedemptionDate' in d:
+		add('240=' + str(d['RedemptionDate']))
+		n += 1
+	if 'StrikePrice' in d:
+		add('202=' + str(d['StrikePrice']))
+		n += 1
+	if 'StrikeCurrency' in d:
+		add('947=' + str(d['StrikeCurrency']))
+		n += 1
+	if 'OptAttribute' in d:
+		add('206=' + str(d['OptAttribute']))
+		n += 1
+	if 'ContractMultiplier' in d:
+		add('231=' + str(d['ContractMultiplier']))
+		n += 1
+	if 'CouponRate' in d:
+		add('223=' + str(d['CouponRate']))
+		n += 1
+	if 'SecurityExchange' in d:
+		add('207=' + str(d['SecurityExchange']))
+		n += 1
+	if 'Issuer' in d:
+		add('106=' + str(d['Issuer']))
+		n += 1
+	if 'EncodedIssuerLen' in d:
+		add('348=' + str(d['EncodedIssuerLen']))
+		n += 1
+	if 'EncodedIssuer' in d:
+		add('349=' + str(d['EncodedIssuer']))
+		n += 1
+	if 'SecurityDesc' in d:
+		add('107=' + str(d['SecurityDesc']))
+		n += 1
+	if 'EncodedSecurityDescLen' in d:
+		add('350=' + str(d['EncodedSecurityDescLen']))
+		n += 1
+	if 'EncodedSecurityDesc' in d:
+		add('351=' + str(d['EncodedSecurityDesc']))
+		n += 1
+	if 'Pool' in d:
+		add('691=' + str(d['Pool']))
+		n += 1
+	if 'ContractSettlMonth' in d:
+		add('667=' + str(d['ContractSettlMonth']))
+		n += 1
+	if 'CPProgram' in d:
+		add('875=' + str(d['CPProgram']))
+		n += 1
+	if 'CPRegType' in d:
+		add('876=' + str(d['CPRegType']))
+		n += 1
+	if 'NoEvents' in d:
+		grp = d['NoEvents']
+		add('864=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoEvents(entry, fixm)
+		n += 1
+	if 'DatedDate' in d:
+		add('873=' + str(d['DatedDate']))
+		n += 1
+	if 'InterestAccrualDate' in d:
+		add('874=' + str(d['InterestAccrualDate']))
+		n += 1
+	if 'AgreementDesc' in d:
+		add('913=' + str(d['AgreementDesc']))
+		n += 1
+	if 'AgreementID' in d:
+		add('914=' + str(d['AgreementID']))
+		n += 1
+	if 'AgreementDate' in d:
+		add('915=' + str(d['AgreementDate']))
+		n += 1
+	if 'AgreementCurrency' in d:
+		add('918=' + str(d['AgreementCurrency']))
+		n += 1
+	if 'TerminationType' in d:
+		add('788=' + str(d['TerminationType']))
+		n += 1
+	if 'StartDate' in d:
+		add('916=' + str(d['StartDate']))
+		n += 1
+	if 'EndDate' in d:
+		add('917=' + str(d['EndDate']))
+		n += 1
+	if 'DeliveryType' in d:
+		add('919=' + str(d['DeliveryType']))
+		n += 1
+	if 'MarginRatio' in d:
+		add('898=' + str(d['MarginRatio']))
+		n += 1
+	if 'NoUnderlyings' in d:
+		grp = d['NoUnderlyings']
+		add('711=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoUnderlyings(entry, fixm)
+		n += 1
+	if 'Side' in d:
+		add('54=' + str(d['Side']))
+		n += 1
+	if 'TransactTime' in d:
+		add('60=' + str(d['TransactTime']))
+		n += 1
+	if 'OrderQty' in d:
+		add('38=' + str(d['OrderQty']))
+		n += 1
+	if 'CashOrderQty' in d:
+		add('152=' + str(d['CashOrderQty']))
+		n += 1
+	if 'OrderPercent' in d:
+		add('516=' + str(d['OrderPercent']))
+		n += 1
+	if 'RoundingDirection' in d:
+		add('468=' + str(d['RoundingDirection']))
+		n += 1
+	if 'RoundingModulus' in d:
+		add('469=' + str(d['RoundingModulus']))
+		n += 1
+	if 'ComplianceID' in d:
+		add('376=' + str(d['ComplianceID']))
+		n += 1
+	if 'Text' in d:
+		add('58=' + str(d['Text']))
+		n += 1
+	if 'EncodedTextLen' in d:
+		add('354=' + str(d['EncodedTextLen']))
+		n += 1
+	if 'EncodedText' in d:
+		add('355=' + str(d['EncodedText']))
+		n += 1
+	if len(d) > n:
+		_make_mbody(obj, obj._context, fixm, _msg_OrderCancelRequest_names)
+	return fixm
+
+def _decode_OrderCancelRequest(obj, fields, index, context):
+	d = obj.__dict__
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _msg_OrderCancelRequest_tags.get(num)
+		if spec is None:
+			# not a field of this message, continue with generic decoder
+			body, index = _extract_body(fields, index, context, obj)
+			return index
+		name, pytype, decode_grp = spec
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	return index
 
 class OrderCancelRequest(FixObject):
-	pass
+	_encode = staticmethod(_encode_OrderCancelRequest)
+	_decode = staticmethod(_decode_OrderCancelRequest)
+
+_msg_OrderMassCancelReport_names = frozenset(['ClOrdID', 'SecondaryClOrdID', 'OrderID', 'SecondaryOrderID', 'MassCancelRequestType', 'MassCancelResponse', 'MassCancelRejectReason', 'TotalAffectedOrders', 'NoAffectedOrders', 'TradingSessionID', 'TradingSessionSubID', 'Symbol', 'SymbolSfx', 'SecurityID', 'SecurityIDSource', 'NoSecurityAltID', 'Product', 'CFICode', 'SecurityType', 'SecuritySubType', 'MaturityMonthYear', 'MaturityDate', 'CouponPaymentDate', 'IssueDate', 'RepoCollateralSecurityType', 'RepurchaseTerm', 'RepurchaseRate', 'Factor', 'CreditRating', 'InstrRegistry', 'CountryOfIssue', 'StateOrProvinceOfIssue', 'LocaleOfIssue', 'RedemptionDate', 'StrikePrice', 'StrikeCurrency', 'OptAttribute', 'ContractMultiplier', 'CouponRate', 'SecurityExchange', 'Issuer', 'EncodedIssuerLen', 'EncodedIssuer', 'SecurityDesc', 'EncodedSecurityDescLen', 'EncodedSecurityDesc', 'Pool', 'ContractSettlMonth', 'CPProgram', 'CPRegType', 'NoEvents', 'DatedDate', 'InterestAccrualDate', 'UnderlyingSymbol', 'UnderlyingSymbolSfx', 'UnderlyingSecurityID', 'UnderlyingSecurityIDSource', 'NoUnderlyingSecurityAltID', 'UnderlyingProduct', 'UnderlyingCFICode', 'UnderlyingSecurityType', 'UnderlyingSecuritySubType', 'UnderlyingMaturityMonthYear', 'UnderlyingMaturityDate', 'UnderlyingCouponPaymentDate', 'UnderlyingIssueDate', 'UnderlyingRepoCollateralSecurityType', 'UnderlyingRepurchaseTerm', 'UnderlyingRepurchaseRate', 'UnderlyingFactor', 'UnderlyingCreditRating', 'UnderlyingInstrRegistry', 'UnderlyingCountryOfIssue', 'UnderlyingStateOrProvinceOfIssue', 'UnderlyingLocaleOfIssue', 'UnderlyingRedemptionDate', 'UnderlyingStrikePrice', 'UnderlyingStrikeCurrency', 'UnderlyingOptAttribute', 'UnderlyingContractMultiplier', 'UnderlyingCouponRate', 'UnderlyingSecurityExchange', 'UnderlyingIssuer', 'EncodedUnderlyingIssuerLen', 'EncodedUnderlyingIssuer', 'UnderlyingSecurityDesc', 'EncodedUnderlyingSecurityDescLen', 'EncodedUnderlyingSecurityDesc', 'UnderlyingCPProgram', 'UnderlyingCPRegType', 'UnderlyingCurrency', 'UnderlyingQty', 'UnderlyingPx', 'UnderlyingDirtyPrice', 'UnderlyingEndPrice', 'UnderlyingStartValue', 'UnderlyingCurrentValue', 'UnderlyingEndValue', 'NoUnderlyingStips', 'Side', 'TransactTime', 'Text', 'EncodedTextLen', 'EncodedText'])
+
+_msg_OrderMassCancelReport_tags = {
+	11: ('ClOrdID', str, None),
+	526: ('SecondaryClOrdID', str, None),
+	37: ('OrderID', str, None),
+	198: ('SecondaryOrderID', str, None),
+	530: ('MassCancelRequestType', str, None),
+	531: ('MassCancelResponse', str, None),
+	532: ('MassCancelRejectReason', str, None),
+	533: ('TotalAffectedOrders', int, None),
+	534: ('NoAffectedOrders', int, None),
+	336: ('TradingSessionID', str, None),
+	625: ('TradingSessionSubID', str, None),
+	55: ('Symbol', str, None),
+	65: ('SymbolSfx', str, None),
+	48: ('SecurityID', str, None),
+	22: ('SecurityIDSource', str, None),
+	454: ('NoSecurityAltID', int, _decode_grp_NoSecurityAltID),
+	460: ('Product', int, None),
+	461: ('CFICode', str, None),
+	167: ('SecurityType', str, None),
+	762: ('SecuritySubType', str, None),
+	200: ('MaturityMonthYear', str, None),
+	541: ('MaturityDate', str, None),
+	224: ('CouponPaymentDate', str, None),
+	225: ('IssueDate', str, None),
+	239: ('RepoCollateralSecurityType', int, None),
+	226: ('RepurchaseTerm', int, None),
+	227: ('RepurchaseRate', float, None),
+	228: ('Factor', float, None),
+	255: ('CreditRating', str, None),
+	543: ('InstrRegistry', str, None),
+	470: ('CountryOfIssue', str, None),
+	471: ('StateOrProvinceOfIssue', str, None),
+	472: ('LocaleOfIssue', str, None),
+	240: ('RedemptionDate', str, None),
+	202: ('StrikePrice', float, None),
+	947: ('StrikeCurrency', str, None),
+	206: ('OptAttribute', str, None),
+	231: ('ContractMultiplier', float, None),
+	223: ('CouponRate', float, None),
+	207: ('SecurityExchange', str, None),
+	106: ('Issuer', str, None),
+	348: ('EncodedIssuerLen', str, None),
+	349: ('EncodedIssuer', str, None),
+	107: ('SecurityDesc', str, None),
+	350: ('EncodedSecurityDescLen', str, None),
+	351: ('EncodedSecurityDesc', str, None),
+	691: ('Pool', str, None),
+	667: ('ContractSettlMonth', str, None),
+	875: ('CPProgram', int, None),
+	876: ('CPRegType', str, None),
+	864: ('NoEvents', int, _decode_grp_NoEvents),
+	873: ('DatedDate', str, None),
+	874: ('InterestAccrualDate', str, None),
+	311: ('UnderlyingSymbol', str, None),
+	312: ('UnderlyingSymbolSfx', str, None),
+	309: ('UnderlyingSecurityID', str, None),
+	305: ('UnderlyingSecurityIDSource', str, None),
+	457: ('NoUnderlyingSecurityAltID', int, _decode_grp_NoUnderlyingSecurityAltID),
+	462: ('UnderlyingProduct', int, None),
+	463: ('UnderlyingCFICode', str, None),
+	310: ('UnderlyingSecurityType', str, None),
+	763: ('UnderlyingSecuritySubType', str, None),
+	313: ('UnderlyingMaturityMonthYear', str, None),
+	542: ('UnderlyingMaturityDate', str, None),
+	241: ('UnderlyingCouponPaymentDate', str, None),
+	242: ('UnderlyingIssueDate', str, None),
+	243: ('UnderlyingRepoCollateralSecurityType', int, None),
+	244: ('UnderlyingRepurchaseTerm', int, None),
+	245: ('UnderlyingRepurchaseRate', float, None),
+	246: ('UnderlyingFactor', float, None),
+	256: ('UnderlyingCreditRating', str, None),
+	595: ('UnderlyingInstrRegistry', str, None),
+	592: ('UnderlyingCountryOfIssue', str, None),
+	593: ('UnderlyingStateOrProvinceOfIssue', str, None),
+	594: ('UnderlyingLocaleOfIssue', str, None),
+	247: ('UnderlyingRedemptionDate', str, None),
+	316: ('UnderlyingStrikePrice', float, None),
+	941: ('UnderlyingStrikeCurrency', str, None),
+	317: ('UnderlyingOptAttribute', str, None),
+	436: ('UnderlyingContractMultiplier', float, None),
+	435: ('UnderlyingCouponRate', float, None),
+	308: ('UnderlyingSecurityExchange', str, None),
+	306: ('UnderlyingIssuer', str, None),
+	362: ('EncodedUnderlyingIssuerLen', str, None),
+	363: ('EncodedUnderlyingIssuer', str, None),
+	307: ('UnderlyingSecurityDesc', str, None),
+	364: ('EncodedUnderlyingSecurityDescLen', str, None),
+	365: ('EncodedUnderlyingSecurityDesc', str, None),
+	877: ('UnderlyingCPProgram', str, None),
+	878: ('UnderlyingCPRegType', str, None),
+	318: ('UnderlyingCurrency', str, None),
+	879: ('UnderlyingQty', float, None),
+	810: ('UnderlyingPx', float, None),
+	882: ('UnderlyingDirtyPrice', float, None),
+	883: ('UnderlyingEndPrice', float, None),
+	884: ('UnderlyingStartValue', float, None),
+	885: ('UnderlyingCurrentValue', float, None),
+	886: ('UnderlyingEndValue', float, None),
+	887: ('NoUnderlyingStips', int, _decode_grp_NoUnderlyingStips),
+	54: ('Side', str, None),
+	60: ('TransactTime', str, None),
+	58: ('Text', str, None),
+	354: ('EncodedTextLen', str, None),
+	355: ('EncodedText', str, None),
+}
+
+def _encode_OrderMassCancelReport(obj, fixm):
+	d = obj.__dict__
+	add = fixm.append
+	n = 1
+	if 'ClOrdID' in d:
+		add('11=' + str(d['ClOrdID']))
+		n += 1
+	if 'SecondaryClOrdID' in d:
+		add('526=' + str(d['SecondaryClOrdID']))
+		n += 1
+	if 'OrderID' in d:
+		add('37=' + str(d['OrderID']))
+		n += 1
+	if 'SecondaryOrderID' in d:
+		add('198=' + str(d['SecondaryOrderID']))
+		n += 1
+	if 'MassCancelRequestType' in d:
+		add('530=' + str(d['MassCancelRequestType']))
+		n += 1
+	if 'MassCancelResponse' in d:
+		add('531=' + str(d['MassCancelResponse']))
+		n += 1
+	if 'MassCancelRejectReason' in d:
+		add('532=' + str(d['MassCancelRejectReason']))
+		n += 1
+	if 'TotalAffectedOrders' in d:
+		add('533=' + str(d['TotalAffectedOrders']))
+		n += 1
+	if 'NoAffectedOrders' in d:
+		add('534=' + str(d['NoAffectedOrders']))
+		n += 1
+	if 'TradingSessionID' in d:
+		add('336=' + str(d['TradingSessionID']))
+		n += 1
+	if 'TradingSessionSubID' in d:
+		add('625=' + str(d['TradingSessionSubID']))
+		n += 1
+	if 'Symbol' in d:
+		add('55=' + str(d['Symbol']))
+		n += 1
+	if 'SymbolSfx' in d:
+		add('65=' + str(d['SymbolSfx']))
+		n += 1
+	if 'SecurityID' in d:
+		add('48=' + str(d['SecurityID']))
+		n += 1
+	if 'SecurityIDSource' in d:
+		add('22=' + str(d['SecurityIDSource']))
+		n += 1
+	if 'NoSecurityAltID' in d:
+		grp = d['NoSecurityAltID']
+		add('454=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoSecurityAltID(entry, fixm)
+		n += 1
+	if 'Product' in d:
+		add('460=' + str(d['Product']))
+		n += 1
+	if 'CFICode' in d:
+		add('461=' + str(d['CFICode']))
+		n += 1
+	if 'SecurityType' in d:
+		add('167=' + str(d['SecurityType']))
+		n += 1
+	if 'SecuritySubType' in d:
+		add('762=' + str(d['SecuritySubType']))
+		n += 1
+	if 'MaturityMonthYear' in d:
+		add('200=' + str(d['MaturityMonthYear']))
+		n += 1
+	if 'MaturityDate' in d:
+		add('541=' + str(d['MaturityDate']))
+		n += 1
+	if 'CouponPaymentDate' in d:
+		add('224=' + str(d['CouponPaymentDate']))
+		n += 1
+	if 'IssueDate' in d:
+		add('225=' + str(d['IssueDate']))
+		n += 1
+	if 'RepoCollateralSecurityType' in d:
+		add('239=' + str(d['RepoCollateralSecurityType']))
+		n += 1
+	if 'RepurchaseTerm' in d:
+		add('226=' + str(d['RepurchaseTerm']))
+		n += 1
+	if 'RepurchaseRate' in d:
+		add('227=' + str(d['RepurchaseRate']))
+		n += 1
+	if 'Factor' in d:
+		add('228=' + str(d['Factor']))
+		n += 1
+	if 'CreditRating' in d:
+		add('255=' + str(d['CreditRating']))
+		n += 1
+	if 'InstrRegistry' in d:
+		add('543=' + str(d['InstrRegistry']))
+		n += 1
+	if 'CountryOfIssue' in d:
+		add('470=' + str(d['CountryOfIssue']))
+		n += 1
+	if 'StateOrProvinceOfIssue' in d:
+		add('471=' + str(d['StateOrProvinceOfIssue']))
+		n += 1
+	if 'LocaleOfIssue' in d:
+		add('472=' + str(d['LocaleOfIssue']))
+		n += 1
+	if 'RedemptionDate' in d:
+		add('240=' + str(d['RedemptionDate']))
+		n += 1
+	if 'StrikePrice' in d:
+		add('202=' + str(d['StrikePrice']))
+		n += 1
+	if 'StrikeCurrency' in d:
+		add('947=' + str(d['StrikeCurrency']))
+		n += 1
+	if 'OptAttribute' in d:
+		add('206=' + str(d['OptAttribute']))
+		n += 1
+	if 'ContractMultiplier' in d:
+		add('231=' + str(d['ContractMultiplier']))
+		n += 1
+	if 'CouponRate' in d:
+		add('223=' + str(d['CouponRate']))
+		n += 1
+	if 'SecurityExchange' in d:
+		add('207=' + str(d['SecurityExchange']))
+		n += 1
+	if 'Issuer' in d:
+		add('106=' + str(d['Issuer']))
+		n += 1
+	if 'EncodedIssuerLen' in d:
+		add('348=' + str(d['EncodedIssuerLen']))
+		n += 1
+	if 'EncodedIssuer' in d:
+		add('349=' + str(d['EncodedIssuer']))
+		n += 1
+	if 'SecurityDesc' in d:
+		add('107=' + str(d['SecurityDesc']))
+		n += 1
+	if 'EncodedSecurityDescLen' in d:
+		add('350=' + str(d['EncodedSecurityDescLen']))
+		n += 1
+	if 'EncodedSecurityDesc' in d:
+		add('351=' + str(d['EncodedSecurityDesc']))
+		n += 1
+	if 'Pool' in d:
+		add('691=' + str(d['Pool']))
+		n += 1
+	if 'ContractSettlMonth' in d:
+		add('667=' + str(d['ContractSettlMonth']))
+		n += 1
+	if 'CPProgram' in d:
+		add('875=' + str(d['CPProgram']))
+		n += 1
+	if 'CPRegType' in d:
+		add('876=' + str(d['CPRegType']))
+		n += 1
+	if 'NoEvents' in d:
+		grp = d['NoEvents']
+		add('864=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoEvents(entry, fixm)
+		n += 1
+	if 'DatedDate' in d:
+		add('873=' + str(d['DatedDate']))
+		n += 1
+	if 'InterestAccrualDate' in d:
+		add('874=' + str(d['InterestAccrualDate']))
+		n += 1
+	if 'UnderlyingSymbol' in d:
+		add('311=' + str(d['UnderlyingSymbol']))
+		n += 1
+	if 'UnderlyingSymbolSfx' in d:
+		add('312=' + str(d['UnderlyingSymbolSfx']))
+		n += 1
+	if 'UnderlyingSecurityID' in d:
+		add('309=' + str(d['UnderlyingSecurityID']))
+		n += 1
+	if 'UnderlyingSecurityIDSource' in d:
+		add('305=' + str(d['UnderlyingSecurityIDSource']))
+		n += 1
+	if 'NoUnderlyingSecurityAltID' in d:
+		grp = d['NoUnderlyingSecurityAltID']
+		add('457=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoUnderlyingSecurityAltID(entry, fixm)
+		n += 1
+	if 'UnderlyingProduct' in d:
+		add('462=' + str(d['UnderlyingProduct']))
+		n += 1
+	if 'UnderlyingCFICode' in d:
+		add('463=' + str(d['UnderlyingCFICode']))
+		n += 1
+	if 'UnderlyingSecurityType' in d:
+		add('310=' + str(d['UnderlyingSecurityType']))
+		n += 1
+	if 'UnderlyingSecuritySubType' in d:
+		add('763=' + str(d['UnderlyingSecuritySubType']))
+		n += 1
+	if 'UnderlyingMaturityMonthYear' in d:
+		add('313=' + str(d['UnderlyingMaturityMonthYear']))
+		n += 1
+	if 'UnderlyingMaturityDate' in d:
+		add('542=' + str(d['UnderlyingMaturityDate']))
+		n += 1
+	if 'UnderlyingCouponPaymentDate' in d:
+		add('241=' + str(d['UnderlyingCouponPaymentDate']))
+		n += 1
+	if 'UnderlyingIssueDate' in d:
+		add('242=' + str(d['UnderlyingIssueDate']))
+		n += 1
+	if 'UnderlyingRepoCollateralSecurityType' in d:
+		add('243=' + str(d['UnderlyingRepoCollateralSecurityType']))
+		n += 1
+	if 'UnderlyingRepurchaseTerm' in d:
+		add('244=' + str(d['UnderlyingRepurchaseTerm']))
+		n += 1
+	if 'UnderlyingRepurchaseRate' in d:
+		add('245=' + str(d['UnderlyingRepurchaseRate']))
+		n += 1
+	if 'UnderlyingFactor' in d:
+		add('246=' + str(d['UnderlyingFactor']))
+		n += 1
+	if 'UnderlyingCreditRating' in d:
+		add('256=' + str(d['UnderlyingCreditRating']))
+		n += 1
+	if 'UnderlyingInstrRegistry' in d:
+		add('595=' + str(d['UnderlyingInstrRegistry']))
+		n += 1
+	if 'UnderlyingCountryOfIssue' in d:
+		add('592=' + str(d['UnderlyingCountryOfIssue']))
+		n += 1
+	if 'UnderlyingStateOrProvinceOfIssue' in d:
+		add('593=' + str(d['UnderlyingStateOrProvinceOfIssue']))
+		n += 1
+	if 'UnderlyingLocaleOfIssue' in d:
+		add('594=' + str(d['UnderlyingLocaleOfIssue']))
+		n += 1
+	if 'UnderlyingRedemptionDate' in d:
+		add('247=' + str(d['UnderlyingRedemptionDate']))
+		n += 1
+	if 'UnderlyingStrikePrice' in d:
+		add('316=' + str(d['UnderlyingStrikePrice']))
+		n += 1
+	if 'UnderlyingStrikeCurrency' in d:
+		add('941=' + str(d['UnderlyingStrikeCurrency']))
+		n += 1
+	if 'UnderlyingOptAttribute' in d:
+		add('317=' + str(d['UnderlyingOptAttribute']))
+		n += 1
+	if 'UnderlyingContractMultiplier' in d:
+		add('436=' + str(d['UnderlyingContractMultiplier']))
+		n += 1
+	if 'UnderlyingCouponRate' in d:
+		add('435=' + str(d['UnderlyingCouponRate']))
+		n += 1
+	if 'UnderlyingSecurityExchange' in d:
+		add('308=' + str(d['UnderlyingSecurityExchange']))
+		n += 1
+	if 'UnderlyingIssuer' in d:
+		add('306=' + str(d['UnderlyingIssuer']))
+		n += 1
+	if 'EncodedUnderlyingIssuerLen' in d:
+		add('362=' + str(d['EncodedUnderlyingIssuerLen']))
+		n += 1
+	if 'EncodedUnderlyingIssuer' in d:
+		add('363=' + str(d['EncodedUnderlyingIssuer']))
+		n += 1
+	if 'UnderlyingSecurityDesc' in d:
+		add('307=' + str(d['UnderlyingSecurityDesc']))
+		n += 1
+	if 'EncodedUnderlyingSecurityDescLen' in d:
+		add('364=' + str(d['EncodedUnderlyingSecurityDescLen']))
+		n += 1
+	if 'EncodedUnderlyingSecurityDesc' in d:
+		add('365=' + str(d['EncodedUnderlyingSecurityDesc']))
+		n += 1
+	if 'UnderlyingCPProgram' in d:
+		add('877=' + str(d['UnderlyingCPProgram']))
+		n += 1
+	if 'UnderlyingCPRegType' in d:
+		add('878=' + str(d['UnderlyingCPRegType']))
+		n += 1
+	if 'UnderlyingCurrency' in d:
+		add('318=' + str(d['UnderlyingCurrency']))
+		n += 1
+	if 'UnderlyingQty' in d:
+		add('879=' + str(d['UnderlyingQty']))
+		n += 1
+	if 'UnderlyingPx' in d:
+		add('810=' + str(d['UnderlyingPx']))
+		n += 1
+	if 'UnderlyingDirtyPrice' in d:
+		add('882=' + str(d['UnderlyingDirtyPrice']))
+		n += 1
+	if 'UnderlyingEndPrice' in d:
+		add('883=' + str(d['UnderlyingEndPrice']))
+		n += 1
+	if 'UnderlyingStartValue' in d:
+		add('884=' + str(d['UnderlyingStartValue']))
+		n += 1
+	if 'UnderlyingCurrentValue' in d:
+		add('885=' + str(d['UnderlyingCurrentValue']))
+		n += 1
+	if 'UnderlyingEndValue' in d:
+		add('886=' + str(d['UnderlyingEndValue']))
+		n += 1
+	if 'NoUnderlyingStips' in d:
+		grp = d['NoUnderlyingStips']
+		add('887=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoUnderlyingStips(entry, fixm)
+		n += 1
+	if 'Side' in d:
+		add('54=' + str(d['Side']))
+		n += 1
+	if 'TransactTime' in d:
+		add('60=' + str(d['TransactTime']))
+		n += 1
+	if 'Text' in d:
+		add('58=' + str(d['Text']))
+		n += 1
+	if 'EncodedTextLen' in d:
+		add('354=' + str(d['EncodedTextLen']))
+		n += 1
+	if 'EncodedText' in d:
+		add('355=' + str(d['EncodedText']))
+		n += 1
+	if len(d) > n:
+		_make_mbody(obj, obj._context, fixm, _msg_OrderMassCancelReport_names)
+	return fixm
+
+def _decode_OrderMassCancelReport(obj, fields, index, context):
+	d = obj.__dict__
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _msg_OrderMassCancelReport_tags.get(num)
+		if spec is None:
+			# not a field of this message, continue with generic decoder
+			body, index = _extract_body(fields, index, context, obj)
+			return index
+		name, pytype, decode_grp = spec
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	return index
 
 class OrderMassCancelReport(FixObject):
-	pass
+	_encode = staticmethod(_encode_OrderMassCancelReport)
+	_decode = staticmethod(_decode_OrderMassCancelReport)
+
+_msg_OrderMassCancelRequest_names = frozenset(['ClOrdID', 'SecondaryClOrdID', 'MassCancelRequestType', 'TradingSessionID', 'TradingSessionSubID', 'Symbol', 'SymbolSfx', 'SecurityID', 'SecurityIDSource', 'NoSecurityAltID', 'Product', 'CFICode', 'SecurityType', 'SecuritySubType', 'MaturityMonthYear', 'MaturityDate', 'CouponPaymentDate', 'IssueDate', 'RepoCollateralSecurityType', 'RepurchaseTerm', 'RepurchaseRate', 'Factor', 'CreditRating', 'InstrRegistry', 'CountryOfIssue', 'StateOrProvinceOfIssue', 'LocaleOfIssue', 'RedemptionDate', 'StrikePrice', 'StrikeCurrency', 'OptAttribute', 'ContractMultiplier', 'CouponRate', 'SecurityExchange', 'Issuer', 'EncodedIssuerLen', 'EncodedIssuer', 'SecurityDesc', 'EncodedSecurityDescLen', 'EncodedSecurityDesc', 'Pool', 'ContractSettlMonth', 'CPProgram', 'CPRegType', 'NoEvents', 'DatedDate', 'InterestAccrualDate', 'UnderlyingSymbol', 'UnderlyingSymbolSfx', 'UnderlyingSecurityID', 'UnderlyingSecurityIDSource', 'NoUnderlyingSecurityAltID', 'UnderlyingProduct', 'UnderlyingCFICode', 'UnderlyingSecurityType', 'UnderlyingSecuritySubType', 'UnderlyingMaturityMonthYear', 'UnderlyingMaturityDate', 'UnderlyingCouponPaymentDate', 'UnderlyingIssueDate', 'UnderlyingRepoCollateralSecurityType', 'UnderlyingRepurchaseTerm', 'UnderlyingRepurchaseRate', 'UnderlyingFactor', 'UnderlyingCreditRating', 'UnderlyingInstrRegistry', 'UnderlyingCountryOfIssue', 'UnderlyingStateOrProvinceOfIssue', 'UnderlyingLocaleOfIssue', 'UnderlyingRedemptionDate', 'UnderlyingStrikePrice', 'UnderlyingStrikeCurrency', 'UnderlyingOptAttribute', 'UnderlyingContractMultiplier', 'UnderlyingCouponRate', 'UnderlyingSecurityExchange', 'UnderlyingIssuer', 'EncodedUnderlyingIssuerLen', 'EncodedUnderlyingIssuer', 'UnderlyingSecurityDesc', 'EncodedUnderlyingSecurityDescLen', 'EncodedUnderlyingSecurityDesc', 'UnderlyingCPProgram', 'UnderlyingCPRegType', 'UnderlyingCurrency', 'UnderlyingQty', 'UnderlyingPx', 'UnderlyingDirtyPrice', 'UnderlyingEndPrice', 'UnderlyingStartValue', 'UnderlyingCurrentValue', 'UnderlyingEndValue', 'NoUnderlyingStips', 'Side', 'TransactTime', 'Text', 'EncodedTextLen', 'EncodedText'])
+
+_msg_OrderMassCancelRequest_tags = {
+	11: ('ClOrdID', str, None),
+	526: ('SecondaryClOrdID', str, None),
+	530: ('MassCancelRequestType', str, None),
+	336: ('TradingSessionID', str, None),
+	625: ('TradingSessionSubID', str, None),
+	55: ('Symbol', str, None),
+	65: ('SymbolSfx', str, None),
+	48: ('SecurityID', str, None),
+	22: ('SecurityIDSource', str, None),
+	454: ('NoSecurityAltID', int, _decode_grp_NoSecurityAltID),
+	460: ('Product', int, None),
+	461: ('CFICode', str, None),
+	167: ('SecurityType', str, None),
+	762: ('SecuritySubType', str, None),
+	200: ('MaturityMonthYear', str, None),
+	541: ('MaturityDate', str, None),
+	224: ('CouponPaymentDate', str, None),
+	225: ('IssueDate', str, None),
+	239: ('RepoCollateralSecurityType', int, None),
+	226: ('RepurchaseTerm', int, None),
+	227: ('RepurchaseRate', float, None),
+	228: ('Factor', float, None),
+	255: ('CreditRating', str, None),
+	543: ('InstrRegistry', str, None),
+	470: ('CountryOfIssue', str, None),
+	471: ('StateOrProvinceOfIssue', str, None),
+	472: ('LocaleOfIssue', str, None),
+	240: ('RedemptionDate', str, None),
+	202: ('StrikePrice', float, None),
+	947: ('StrikeCurrency', str, None),
+	206: ('OptAttribute', str, None),
+	231: ('ContractMultiplier', float, None),
+	223: ('CouponRate', float, None),
+	207: ('SecurityExchange', str, None),
+	106: ('Issuer', str, None),
+	348: ('EncodedIssuerLen', str, None),
+	349: ('EncodedIssuer', str, None),
+	107: ('SecurityDesc', str, None),
+	350: ('EncodedSecurityDescLen', str, None),
+	351: ('EncodedSecurityDesc', str, None),
+	691: ('Pool', str, None),
+	667: ('ContractSettlMonth', str, None),
+	875: ('CPProgram', int, None),
+	876: ('CPRegType', str, None),
+	864: ('NoEvents', int, _decode_grp_NoEvents),
+	873: ('DatedDate', str, None),
+	874: ('InterestAccrualDate', str, None),
+	311: ('UnderlyingSymbol', str, None),
+	312: ('UnderlyingSymbolSfx', str, None),
+	309: ('UnderlyingSecurityID', str, None),
+	305: ('UnderlyingSecurityIDSource', str, None),
+	457: ('NoUnderlyingSecurityAltID', int, _decode_grp_NoUnderlyingSecurityAltID),
+	462: ('UnderlyingProduct', int, None),
+	463: ('UnderlyingCFICode', str, None),
+	310: ('UnderlyingSecurityType', str, None),
+	763: ('UnderlyingSecuritySubType', str, None),
+	313: ('UnderlyingMaturityMonthYear', str, None),
+	542: ('UnderlyingMaturityDate', str, None),
+	241: ('UnderlyingCouponPaymentDate', str, None),
+	242: ('UnderlyingIssueDate', str, None),
+	243: ('UnderlyingRepoCollateralSecurityType', int, None),
+	244: ('UnderlyingRepurchaseTerm', int, None),
+	245: ('UnderlyingRepurchaseRate', float, None),
+	246: ('UnderlyingFactor', float, None),
+	256: ('UnderlyingCreditRating', str, None),
+	595: ('UnderlyingInstrRegistry', str, None),
+	592: ('UnderlyingCountryOfIssue', str, None),
+	593: ('UnderlyingStateOrProvinceOfIssue', str, None),
+	594: ('UnderlyingLocaleOfIssue', str, None),
+	247: ('UnderlyingRedemptionDate', str, None),
+	316: ('UnderlyingStrikePrice', float, None),
+	941: ('UnderlyingStrikeCurrency', str, None),
+	317: ('UnderlyingOptAttribute', str, None),
+	436: ('UnderlyingContractMultiplier', float, None),
+	435: ('UnderlyingCouponRate', float, None),
+	308: ('UnderlyingSecurityExchange', str, None),
+	306: ('UnderlyingIssuer', str, None),
+	362: ('EncodedUnderlyingIssuerLen', str, None),
+	363: ('EncodedUnderlyingIssuer', str, None),
+	307: ('UnderlyingSecurityDesc', str, None),
+	364: ('EncodedUnderlyingSecurityDescLen', str, None),
+	365: ('EncodedUnderlyingSecurityDesc', str, None),
+	877: ('UnderlyingCPProgram', str, None),
+	878: ('UnderlyingCPRegType', str, None),
+	318: ('UnderlyingCurrency', str, None),
+	879: ('UnderlyingQty', float, None),
+	810: ('UnderlyingPx', float, None),
+	882: ('UnderlyingDirtyPrice', float, None),
+	883: ('UnderlyingEndPrice', float, None),
+	884: ('UnderlyingStartValue', float, None),
+	885: ('UnderlyingCurrentValue', float, None),
+	886: ('UnderlyingEndValue', float, None),
+	887: ('NoUnderlyingStips', int, _decode_grp_NoUnderlyingStips),
+	54: ('Side', str, None),
+	60: ('TransactTime', str, None),
+	58: ('Text', str, None),
+	354: ('EncodedTextLen', str, None),
+	355: ('EncodedText', str, None),
+}
+
+def _encode_OrderMassCancelRequest(obj, fixm):
+	d = obj.__dict__
+	add = fixm.append
+	n = 1
+	if 'ClOrdID' in d:
+		add('11=' + str(d['ClOrdID']))
+		n += 1
+	if 'SecondaryClOrdID' in d:
+		add('526=' + str(d['SecondaryClOrdID']))
+		n += 1
+	if 'MassCancelRequestType' in d:
+		add('530=' + str(d['MassCancelRequestType']))
+		n += 1
+	if 'TradingSessionID' in d:
+		add('336=' + str(d['TradingSessionID']))
+		n += 1
+	if 'TradingSessionSubID' in d:
+		add('625=' + str(d['TradingSessionSubID']))
+		n += 1
+	if 'Symbol' in d:
+		add('55=' + str(d['Symbol']))
+		n += 1
+	if 'SymbolSfx' in d:
+		add('65=' + str(d['SymbolSfx']))
+		n += 1
+	if 'SecurityID' in d:
+		add('48=' + str(d['SecurityID']))
+		n += 1
+	if 'SecurityIDSource' in d:
+		add('22=' + str(d['SecurityIDSource']))
+		n += 1
+	if 'NoSecurityAltID' in d:
+		grp = d['NoSecurityAltID']
+		add('454=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoSecurityAltID(entry, fixm)
+		n += 1
+	if 'Product' in d:
+		add('460=' + str(d['Product']))
+		n += 1
+	if 'CFICode' in d:
+		add('461=' + str(d['CFICode']))
+		n += 1
+	if 'SecurityType' in d:
+		add('167=' + str(d['SecurityType']))
+		n += 1
+	if 'SecuritySubType' in d:
+		add('762=' + str(d['SecuritySubType']))
+		n += 1
+	if 'MaturityMonthYear' in d:
+		add('200=' + str(d['MaturityMonthYear']))
+		n += 1
+	if 'MaturityDate' in d:
+		add('541=' + str(d['MaturityDate']))
+		n += 1
+	if 'CouponPaymentDate' in d:
+		add('224=' + str(d['CouponPaymentDate']))
+		n += 1
+	if 'IssueDate' in d:
+		add('225=' + str(d['IssueDate']))
+		n += 1
+	if 'RepoCollateralSecurityType' in d:
+		add('239=' + str(d['RepoCollateralSecurityType']))
+		n += 1
+	if 'RepurchaseTerm' in d:
+		add('226=' + str(d['RepurchaseTerm']))
+		n += 1
+	if 'RepurchaseRate' in d:
+		add('227=' + str(d['RepurchaseRate']))
+		n += 1
+	if 'Factor' in d:
+		add('228=' + str(d['Factor']))
+		n += 1
+	if 'CreditRating' in d:
+		add('255=' + str(d['CreditRating']))
+		n += 1
+	if 'InstrRegistry' in d:
+		add('543=' + str(d['InstrRegistry']))
+		n += 1
+	if 'CountryOfIssue' in d:
+		add('470=' + str(d['CountryOfIssue']))
+		n += 1
+	if 'StateOrProvinceOfIssue' in d:
+		add('471=' + str(d['StateOrProvinceOfIssue']))
+		n += 1
+	if 'LocaleOfIssue' in d:
+		add('472=' + str(d['LocaleOfIssue']))
+		n += 1
+	if 'RedemptionDate' in d:
+		add('240=' + str(d['RedemptionDate']))
+		n += 1
+	if 'StrikePrice' in d:
+		add('202=' + str(d['StrikePrice']))
+		n += 1
+	if 'StrikeCurrency' in d:
+		add('947=' + str(d['StrikeCurrency']))
+		n += 1
+	if 'OptAttribute' in d:
+		add('206=' + str(d['OptAttribute']))
+		n += 1
+	if 'ContractMultiplier' in d:
+		add('231=' + str(d['ContractMultiplier']))
+		n += 1
+	if 'CouponRate' in d:
+		add('223=' + str(d['CouponRate']))
+		n += 1
+	if 'SecurityExchange' in d:
+		add('207=' + str(d['SecurityExchange']))
+		n += 1
+	if 'Issuer' in d:
+		add('106=' + str(d['Issuer']))
+		n += 1
+	if 'EncodedIssuerLen' in d:
+		add('348=' + str(d['EncodedIssuerLen']))
+		n += 1
+	if 'EncodedIssuer' in d:
+		add('349=' + str(d['EncodedIssuer']))
+		n += 1
+	if 'SecurityDesc' in d:
+		add('107=' + str(d['SecurityDesc']))
+		n += 1
+	if 'EncodedSecurityDescLen' in d:
+		add('350=' + str(d['EncodedSecurityDescLen']))
+		n += 1
+	if 'EncodedSecurityDesc' in d:
+		add('351=' + str(d['EncodedSecurityDesc']))
+		n += 1
+	if 'Pool' in d:
+		add('691=' + str(d['Pool']))
+		n += 1
+	if 'ContractSettlMonth' in d:
+		add('667=' + str(d['ContractSettlMonth']))
+		n += 1
+	if 'CPProgram' in d:
+		add('875=' + str(d['CPProgram']))
+		n += 1
+	if 'CPRegType' in d:
+		add('876=' + str(d['CPRegType']))
+		n += 1
+	if 'NoEvents' in d:
+		grp = d['NoEvents']
+		add('864=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoEvents(entry, fixm)
+		n += 1
+	if 'DatedDate' in d:
+		add('873=' + str(d['DatedDate']))
+		n += 1
+	if 'InterestAccrualDate' in d:
+		add('874=' + str(d['InterestAccrualDate']))
+		n += 1
+	if 'UnderlyingSymbol' in d:
+		add('311=' + str(d['UnderlyingSymbol']))
+		n += 1
+	if 'UnderlyingSymbolSfx' in d:
+		add('312=' + str(d['UnderlyingSymbolSfx']))
+		n += 1
+	if 'UnderlyingSecurityID' in d:
+		add('309=' + str(d['UnderlyingSecurityID']))
+		n += 1
+	if 'UnderlyingSecurityIDSource' in d:
+		add('305=' + str(d['UnderlyingSecurityIDSource']))
+		n += 1
+	if 'NoUnderlyingSecurityAltID' in d:
+		grp = d['NoUnderlyingSecurityAltID']
+		add('457=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoUnderlyingSecurityAltID(entry, fixm)
+		n += 1
+	if 'UnderlyingProduct' in d:
+		add('462=' + str(d['UnderlyingProduct']))
+		n += 1
+	if 'UnderlyingCFICode' in d:
+		add('463=' + str(d['UnderlyingCFICode']))
+		n += 1
+	if 'UnderlyingSecurityType' in d:
+		add('310=' + str(d['UnderlyingSecurityType']))
+		n += 1
+	if 'UnderlyingSecuritySubType' in d:
+		add('763=' + str(d['UnderlyingSecuritySubType']))
+		n += 1
+	if 'UnderlyingMaturityMonthYear' in d:
+		add('313=' + str(d['UnderlyingMaturityMonthYear']))
+		n += 1
+	if 'UnderlyingMaturityDate' in d:
+		add('542=' + str(d['UnderlyingMaturityDate']))
+		n += 1
+	if 'UnderlyingCouponPaymentDate' in d:
+		add('241=' + str(d['UnderlyingCouponPaymentDate']))
+		n += 1
+	if 'UnderlyingIssueDate' in d:
+		add('242=' + str(d['UnderlyingIssueDate']))
+		n += 1
+	if 'UnderlyingRepoCollateralSecurityType' in d:
+		add('243=' + str(d['UnderlyingRepoCollateralSecurityType']))
+		n += 1
+	if 'UnderlyingRepurchaseTerm' in d:
+		add('244=' + str(d['UnderlyingRepurchaseTerm']))
+		n += 1
+	if 'UnderlyingRepurchaseRate' in d:
+		add('245=' + str(d['UnderlyingRepurchaseRate']))
+		n += 1
+	if 'UnderlyingFactor' in d:
+		add('246=' + str(d['UnderlyingFactor']))
+		n += 1
+	if 'UnderlyingCreditRating' in d:
+		add('256=' + str(d['UnderlyingCreditRating']))
+		n += 1
+	if 'UnderlyingInstrRegistry' in d:
+		add('595=' + str(d['UnderlyingInstrRegistry']))
+		n += 1
+	if 'UnderlyingCountryOfIssue' in d:
+		add('592=' + str(d['UnderlyingCountryOfIssue']))
+		n += 1
+	if 'UnderlyingStateOrProvinceOfIssue' in d:
+		add('593=' + str(d['UnderlyingStateOrProvinceOfIssue']))
+		n += 1
+	if 'UnderlyingLocaleOfIssue' in d:
+		add('594=' + str(d['UnderlyingLocaleOfIssue']))
+		n += 1
+	if 'UnderlyingRedemptionDate' in d:
+		add('247=' + str(d['UnderlyingRedemptionDate']))
+		n += 1
+	if 'UnderlyingStrikePrice' in d:
+		add('316=' + str(d['UnderlyingStrikePrice']))
+		n += 1
+	if 'UnderlyingStrikeCurrency' in d:
+		add('941=' + str(d['UnderlyingStrikeCurrency']))
+		n += 1
+	if 'UnderlyingOptAttribute' in d:
+		add('317=' + str(d['UnderlyingOptAttribute']))
+		n += 1
+	if 'UnderlyingContractMultiplier' in d:
+		add('436=' + str(d['UnderlyingContractMultiplier']))
+		n += 1
+	if 'UnderlyingCouponRate' in d:
+		add('435=' + str(d['UnderlyingCouponRate']))
+		n += 1
+	if 'UnderlyingSecurityExchange' in d:
+		add('308=' + str(d['UnderlyingSecurityExchange']))
+		n += 1
+	if 'UnderlyingIssuer' in d:
+		add('306=' + str(d['UnderlyingIssuer']))
+		n += 1
+	if 'EncodedUnderlyingIssuerLen' in d:
+		add('362=' + str(d['EncodedUnderlyingIssuerLen']))
+		n += 1
+	if 'EncodedUnderlyingIssuer' in d:
+		add('363=' + str(d['EncodedUnderlyingIssuer']))
+		n += 1
+	if 'UnderlyingSecurityDesc' in d:
+		add('307=' + str(d['UnderlyingSecurityDesc']))
+		n += 1
+	if 'EncodedUnderlyingSecurityDescLen' in d:
+		add('364=' + str(d['EncodedUnderlyingSecurityDescLen']))
+		n += 1
+	if 'EncodedUnderlyingSecurityDesc' in d:
+		add('365=' + str(d['EncodedUnderlyingSecurityDesc']))
+		n += 1
+	if 'UnderlyingCPProgram' in d:
+		add('877=' + str(d['UnderlyingCPProgram']))
+		n += 1
+	if 'UnderlyingCPRegType' in d:
+		add('878=' + str(d['UnderlyingCPRegType']))
+		n += 1
+	if 'UnderlyingCurrency' in d:
+		add('318=' + str(d['UnderlyingCurrency']))
+		n += 1
+	if 'UnderlyingQty' in d:
+		add('879=' + str(d['UnderlyingQty']))
+		n += 1
+	if 'UnderlyingPx' in d:
+		add('810=' + str(d['UnderlyingPx']))
+		n += 1
+	if 'UnderlyingDirtyPrice' in d:
+		add('882=' + str(d['UnderlyingDirtyPrice']))
+		n += 1
+	if 'UnderlyingEndPrice' in d:
+		add('883=' + str(d['UnderlyingEndPrice']))
+		n += 1
+	if 'UnderlyingStartValue' in d:
+		add('884=' + str(d['UnderlyingStartValue']))
+		n += 1
+	if 'UnderlyingCurrentValue' in d:
+		add('885=' + str(d['UnderlyingCurrentValue']))
+		n += 1
+	if 'UnderlyingEndValue' in d:
+		add('886=' + str(d['UnderlyingEndValue']))
+		n += 1
+	if 'NoUnderlyingStips' in d:
+		grp = d['NoUnderlyingStips']
+		add('887=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoUnderlyingStips(entry, fixm)
+		n += 1
+	if 'Side' in d:
+		add('54=' + str(d['Side']))
+		n += 1
+	if 'TransactTime' in d:
+		add('60=' + str(d['TransactTime']))
+		n += 1
+	if 'Text' in d:
+		add('58=' + str(d['Text']))
+		n += 1
+	if 'EncodedTextLen' in d:
+		add('354=' + str(d['EncodedTextLen']))
+		n += 1
+	if 'EncodedText' in d:
+		add('355=' + str(d['EncodedText']))
+		n += 1
+	if len(d) > n:
+		_make_mbody(obj, obj._context, fixm, _msg_OrderMassCancelRequest_names)
+	return fixm
+
+def _decode_OrderMassCancelRequest(obj, fields, index, context):
+	d = obj.__dict__
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _msg_OrderMassCancelRequest_tags.get(num)
+		if spec is None:
+			# not a field of this message, continue with generic decoder
+			body, index = _extract_body(fields, index, context, obj)
+			return index
+		name, pytype, decode_grp = spec
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	return index
 
 class OrderMassCancelRequest(FixObject):
-	pass
+	_encode = staticmethod(_encode_OrderMassCancelRequest)
+	_decode = staticmethod(_decode_OrderMassCancelRequest)
+
+_msg_OrderMassStatusRequest_names = frozenset(['MassStatusReqID', 'MassStatusReqType', 'NoPartyIDs', 'Account', 'AcctIDSource', 'TradingSessionID', 'TradingSessionSubID', 'Symbol', 'SymbolSfx', 'SecurityID', 'SecurityIDSource', 'NoSecurityAltID', 'Product', 'CFICode', 'SecurityType', 'SecuritySubType', 'MaturityMonthYear', 'MaturityDate', 'CouponPaymentDate', 'IssueDate', 'RepoCollateralSecurityType', 'RepurchaseTerm', 'RepurchaseRate', 'Factor', 'CreditRating', 'InstrRegistry', 'CountryOfIssue', 'StateOrProvinceOfIssue', 'LocaleOfIssue', 'RedemptionDate', 'StrikePrice', 'StrikeCurrency', 'OptAttribute', 'ContractMultiplier', 'CouponRate', 'SecurityExchange', 'Issuer', 'EncodedIssuerLen', 'EncodedIssuer', 'SecurityDesc', 'EncodedSecurityDescLen', 'EncodedSecurityDesc', 'Pool', 'ContractSettlMonth', 'CPProgram', 'CPRegType', 'NoEvents', 'DatedDate', 'InterestAccrualDate', 'UnderlyingSymbol', 'UnderlyingSymbolSfx', 'UnderlyingSecurityID', 'UnderlyingSecurityIDSource', 'NoUnderlyingSecurityAltID', 'UnderlyingProduct', 'UnderlyingCFICode', 'UnderlyingSecurityType', 'UnderlyingSecuritySubType', 'UnderlyingMaturityMonthYear', 'UnderlyingMaturityDate', 'UnderlyingCouponPaymentDate', 'UnderlyingIssueDate', 'UnderlyingRepoCollateralSecurityType', 'UnderlyingRepurchaseTerm', 'UnderlyingRepurchaseRate', 'UnderlyingFactor', 'UnderlyingCreditRating', 'UnderlyingInstrRegistry', 'UnderlyingCountryOfIssue', 'UnderlyingStateOrProvinceOfIssue', 'UnderlyingLocaleOfIssue', 'UnderlyingRedemptionDate', 'UnderlyingStrikePrice', 'UnderlyingStrikeCurrency', 'UnderlyingOptAttribute', 'UnderlyingContractMultiplier', 'UnderlyingCouponRate', 'UnderlyingSecurityExchange', 'UnderlyingIssuer', 'EncodedUnderlyingIssuerLen', 'EncodedUnderlyingIssuer', 'UnderlyingSecurityDesc', 'EncodedUnderlyingSecurityDescLen', 'EncodedUnderlyingSecurityDesc', 'UnderlyingCPProgram', 'UnderlyingCPRegType', 'UnderlyingCurrency', 'UnderlyingQty', 'UnderlyingPx', 'UnderlyingDirtyPrice', 'UnderlyingEndPrice', 'UnderlyingStartValue', 'UnderlyingCurrentValue', 'UnderlyingEndValue', 'NoUnderlyingStips', 'Side'])
+
+_msg_OrderMassStatusRequest_tags = {
+	584: ('MassStatusReqID', str, None),
+	585: ('MassStatusReqType', int, None),
+	453: ('NoPartyIDs', int, _decode_grp_NoPartyIDs),
+	1: ('Account', str, None),
+	660: ('AcctIDSource', int, None),
+	336: ('TradingSessionID', str, None),
+	625: ('TradingSessionSubID', str, None),
+	55: ('Symbol', str, None),
+	65: ('SymbolSfx', str, None),
+	48: ('SecurityID', str, None),
+	22: ('SecurityIDSource', str, None),
+	454: ('NoSecurityAltID', int, _decode_grp_NoSecurityAltID),
+	460: ('Product', int, None),
+	461: ('CFICode', str, None),
+	167: ('SecurityType', str, None),
+	762: ('SecuritySubType', str, None),
+	200: ('MaturityMonthYear', str, None),
+	541: ('MaturityDate', str, None),
+	224: ('CouponPaymentDate', str, None),
+	225: ('IssueDate', str, None),
+	239: ('RepoCollateralSecurityType', int, None),
+	226: ('RepurchaseTerm', int, None),
+	227: ('RepurchaseRate', float, None),
+	228: ('Factor', float, None),
+	255: ('CreditRating', str, None),
+	543: ('InstrRegistry', str, None),
+	470: ('CountryOfIssue', str, None),
+	471: ('StateOrProvinceOfIssue', str, None),
+	472: ('LocaleOfIssue', str, None),
+	240: ('RedemptionDate', str, None),
+	202: ('StrikePrice', float, None),
+	947: ('StrikeCurrency', str, None),
+	206: ('OptAttribute', str, None),
+	231: ('ContractMultiplier', float, None),
+	223: ('CouponRate', float, None),
+	207: ('SecurityExchange', str, None),
+	106: ('Issuer', str, None),
+	348: ('EncodedIssuerLen', str, None),
+	349: ('EncodedIssuer', str, None),
+	107: ('SecurityDesc', str, None),
+	350: ('EncodedSecurityDescLen', str, None),
+	351: ('EncodedSecurityDesc', str, None),
+	691: ('Pool', str, None),
+	667: ('ContractSettlMonth', str, None),
+	875: ('CPProgram', int, None),
+	876: ('CPRegType', str, None),
+	864: ('NoEvents', int, _decode_grp_NoEvents),
+	873: ('DatedDate', str, None),
+	874: ('InterestAccrualDate', str, None),
+	311: ('UnderlyingSymbol', str, None),
+	312: ('UnderlyingSymbolSfx', str, None),
+	309: ('UnderlyingSecurityID', str, None),
+	305: ('UnderlyingSecurityIDSource', str, None),
+	457: ('NoUnderlyingSecurityAltID', int, _decode_grp_NoUnderlyingSecurityAltID),
+	462: ('UnderlyingProduct', int, None),
+	463: ('UnderlyingCFICode', str, None),
+	310: ('UnderlyingSecurityType', str, None),
+	763: ('UnderlyingSecuritySubType', str, None),
+	313: ('UnderlyingMaturityMonthYear', str, None),
+	542: ('UnderlyingMaturityDate', str, None),
+	241: ('UnderlyingCouponPaymentDate', str, None),
+	242: ('UnderlyingIssueDate', str, None),
+	243: ('UnderlyingRepoCollateralSecurityType', int, None),
+	244: ('UnderlyingRepurchaseTerm', int, None),
+	245: ('UnderlyingRepurchaseRate', float, None),
+	246: ('UnderlyingFactor', float, None),
+	256: ('UnderlyingCreditRating', str, None),
+	595: ('UnderlyingInstrRegistry', str, None),
+	592: ('UnderlyingCountryOfIssue', str, None),
+	593: ('UnderlyingStateOrProvinceOfIssue', str, None),
+	594: ('UnderlyingLocaleOfIssue', str, None),
+	247: ('UnderlyingRedemptionDate', str, None),
+	316: ('UnderlyingStrikePrice', float, None),
+	941: ('UnderlyingStrikeCurrency', str, None),
+	317: ('UnderlyingOptAttribute', str, None),
+	436: ('UnderlyingContractMultiplier', float, None),
+	435: ('UnderlyingCouponRate', float, None),
+	308: ('UnderlyingSecurityExchange', str, None),
+	306: ('UnderlyingIssuer', str, None),
+	362: ('EncodedUnderlyingIssuerLen', str, None),
+	363: ('EncodedUnderlyingIssuer', str, None),
+	307: ('UnderlyingSecurityDesc', str, None),
+	364: ('EncodedUnderlyingSecurityDescLen', str, None),
+	365: ('EncodedUnderlyingSecurityDesc', str, None),
+	877: ('UnderlyingCPProgram', str, None),
+	878: ('UnderlyingCPRegType', str, None),
+	318: ('UnderlyingCurrency', str, None),
+	879: ('UnderlyingQty', float, None),
+	810: ('UnderlyingPx', float, None),
+	882: ('UnderlyingDirtyPrice', float, None),
+	883: ('UnderlyingEndPrice', float, None),
+	884: ('UnderlyingStartValue', float, None),
+	885: ('UnderlyingCurrentValue', float, None),
+	886: ('UnderlyingEndValue', float, None),
+	887: ('NoUnderlyingStips', int, _decode_grp_NoUnderlyingStips),
+	54: ('Side', str, None),
+}
+
+def _encode_OrderMassStatusRequest(obj, fixm):
+	d = obj.__dict__
+	add = fixm.append
+	n = 1
+	if 'MassStatusReqID' in d:
+		add('584=' + str(d['MassStatusReqID']))
+		n += 1
+	if 'MassStatusReqType' in d:
+		add('585=' + str(d['MassStatusReqType']))
+		n += 1
+	if 'NoPartyIDs' in d:
+		grp = d['NoPartyIDs']
+		add('453=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoPartyIDs(entry, fixm)
+		n += 1
+	if 'Account' in d:
+		add('1=' + str(d['Account']))
+		n += 1
+	if 'AcctIDSource' in d:
+		add('660=' + str(d['AcctIDSource']))
+		n += 1
+	if 'TradingSessionID' in d:
+		add('336=' + str(d['TradingSessionID']))
+		n += 1
+	if 'TradingSessionSubID' in d:
+		add('625=' + str(d['TradingSessionSubID']))
+		n += 1
+	if 'Symbol' in d:
+		add('55=' + str(d['Symbol']))
+		n += 1
+	if 'SymbolSfx' in d:
+		add('65=' + str(d['SymbolSfx']))
+		n += 1
+	if 'SecurityID' in d:
+		add('48=' + str(d['SecurityID']))
+		n += 1
+	if 'SecurityIDSource' in d:
+		add('22=' + str(d['SecurityIDSource']))
+		n += 1
+	if 'NoSecurityAltID' in d:
+		grp = d['NoSecurityAltID']
+		add('454=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoSecurityAltID(entry, fixm)
+		n += 1
+	if 'Product' in d:
+		add('460=' + str(d['Product']))
+		n += 1
+	if 'CFICode' in d:
+		add('461=' + str(d['CFICode']))
+		n += 1
+	if 'SecurityType' in d:
+		add('167=' + str(d['SecurityType']))
+		n += 1
+	if 'SecuritySubType' in d:
+		add('762=' + str(d['SecuritySubType']))
+		n += 1
+	if 'MaturityMonthYear' in d:
+		add('200=' + str(d['MaturityMonthYear']))
+		n += 1
+	if 'MaturityDate' in d:
+		add('541=' + str(d['MaturityDate']))
+		n += 1
+	if 'CouponPaymentDate' in d:
+		add('224=' + str(d['CouponPaymentDate']))
+		n += 1
+	if 'IssueDate' in d:
+		add('225=' + str(d['IssueDate']))
+		n += 1
+	if 'RepoCollateralSecurityType' in d:
+		add('239=' + str(d['RepoCollateralSecurityType']))
+		n += 1
+	if 'RepurchaseTerm' in d:
+		add('226=' + str(d['RepurchaseTerm']))
+		n += 1
+	if 'RepurchaseRate' in d:
+		add('227=' + str(d['RepurchaseRate']))
+		n += 1
+	if 'Factor' in d:
+		add('228=' + str(d['Factor']))
+		n += 1
+	if 'CreditRating' in d:
+		add('255=' + str(d['CreditRating']))
+		n += 1
+	if 'InstrRegistry' in d:
+		add('543=' + str(d['InstrRegistry']))
+		n += 1
+	if 'CountryOfIssue' in d:
+		add('470=' + str(d['CountryOfIssue']))
+		n += 1
+	if 'StateOrProvinceOfIssue' in d:
+		add('471=' + str(d['StateOrProvinceOfIssue']))
+		n += 1
+	if 'LocaleOfIssue' in d:
+		add('472=' + str(d['LocaleOfIssue']))
+		n += 1
+	if 'RedemptionDate' in d:
+		add('240=' + str(d['RedemptionDate']))
+		n += 1
+	if 'StrikePrice' in d:
+		add('202=' + str(d['StrikePrice']))
+		n += 1
+	if 'StrikeCurrency' in d:
+		add('947=' + str(d['StrikeCurrency']))
+		n += 1
+	if 'OptAttribute' in d:
+		add('206=' + str(d['OptAttribute']))
+		n += 1
+	if 'ContractMultiplier' in d:
+		add('231=' + str(d['ContractMultiplier']))
+		n += 1
+	if 'CouponRate' in d:
+		add('223=' + str(d['CouponRate']))
+		n += 1
+	if 'SecurityExchange' in d:
+		add('207=' + str(d['SecurityExchange']))
+		n += 1
+	if 'Issuer' in d:
+		add('106=' + str(d['Issuer']))
+		n += 1
+	if 'EncodedIssuerLen' in d:
+		add('348=' + str(d['EncodedIssuerLen']))
+		n += 1
+	if 'EncodedIssuer' in d:
+		add('349=' + str(d['EncodedIssuer']))
+		n += 1
+	if 'SecurityDesc' in d:
+		add('107=' + str(d['SecurityDesc']))
+		n += 1
+	if 'EncodedSecurityDescLen' in d:
+		add('350=' + str(d['EncodedSecurityDescLen']))
+		n += 1
+	if 'EncodedSecurityDesc' in d:
+		add('351=' + str(d['EncodedSecurityDesc']))
+		n += 1
+	if 'Pool' in d:
+		add('691=' + str(d['Pool']))
+		n += 1
+	if 'ContractSettlMonth' in d:
+		add('667=' + str(d['ContractSettlMonth']))
+		n += 1
+	if 'CPProgram' in d:
+		add('875=' + str(d['CPProgram']))
+		n += 1
+	if 'CPRegType' in d:
+		add('876=' + str(d['CPRegType']))
+		n += 1
+	if 'NoEvents' in d:
+		grp = d['NoEvents']
+		add('864=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoEvents(entry, fixm)
+		n += 1
+	if 'DatedDate' in d:
+		add('873=' + str(d['DatedDate']))
+		n += 1
+	if 'InterestAccrualDate' in d:
+		add('874=' + str(d['InterestAccrualDate']))
+		n += 1
+	if 'UnderlyingSymbol' in d:
+		add('311=' + str(d['UnderlyingSymbol']))
+		n += 1
+	if 'UnderlyingSymbolSfx' in d:
+		add('312=' + str(d['UnderlyingSymbolSfx']))
+		n += 1
+	if 'UnderlyingSecurityID' in d:
+		add('309=' + str(d['UnderlyingSecurityID']))
+		n += 1
+	if 'UnderlyingSecurityIDSource' in d:
+		add('305=' + str(d['UnderlyingSecurityIDSource']))
+		n += 1
+	if 'NoUnderlyingSecurityAltID' in d:
+		grp = d['NoUnderlyingSecurityAltID']
+		add('457=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoUnderlyingSecurityAltID(entry, fixm)
+		n += 1
+	if 'UnderlyingProduct' in d:
+		add('462=' + str(d['UnderlyingProduct']))
+		n += 1
+	if 'UnderlyingCFICode' in d:
+		add('463=' + str(d['UnderlyingCFICode']))
+		n += 1
+	if 'UnderlyingSecurityType' in d:
+		add('310=' + str(d['UnderlyingSecurityType']))
+		n += 1
+	if 'UnderlyingSecuritySubType' in d:
+		add('763=' + str(d['UnderlyingSecuritySubType']))
+		n += 1
+	if 'UnderlyingMaturityMonthYear' in d:
+		add('313=' + str(d['UnderlyingMaturityMonthYear']))
+		n += 1
+	if 'UnderlyingMaturityDate' in d:
+		add('542=' + str(d['UnderlyingMaturityDate']))
+		n += 1
+	if 'UnderlyingCouponPaymentDate' in d:
+		add('241=' + str(d['UnderlyingCouponPaymentDate']))
+		n += 1
+	if 'UnderlyingIssueDate' in d:
+		add('242=' + str(d['UnderlyingIssueDate']))
+		n += 1
+	if 'UnderlyingRepoCollateralSecurityType' in d:
+		add('243=' + str(d['UnderlyingRepoCollateralSecurityType']))
+		n += 1
+	if 'UnderlyingRepurchaseTerm' in d:
+		add('244=' + str(d['UnderlyingRepurchaseTerm']))
+		n += 1
+	if 'UnderlyingRepurchaseRate' in d:
+		add('245=' + str(d['UnderlyingRepurchaseRate']))
+		n += 1
+	if 'UnderlyingFactor' in d:
+		add('246=' + str(d['UnderlyingFactor']))
+		n += 1
+	if 'UnderlyingCreditRating' in d:
+		add('256=' + str(d['UnderlyingCreditRating']))
+		n += 1
+	if 'UnderlyingInstrRegistry' in d:
+		add('595=' + str(d['UnderlyingInstrRegistry']))
+		n += 1
+	if 'UnderlyingCountryOfIssue' in d:
+		add('592=' + str(d['UnderlyingCountryOfIssue']))
+		n += 1
+	if 'UnderlyingStateOrProvinceOfIssue' in d:
+		add('593=' + str(d['UnderlyingStateOrProvinceOfIssue']))
+		n += 1
+	if 'UnderlyingLocaleOfIssue' in d:
+		add('594=' + str(d['UnderlyingLocaleOfIssue']))
+		n += 1
+	if 'UnderlyingRedemptionDate' in d:
+		add('247=' + str(d['UnderlyingRedemptionDate']))
+		n += 1
+	if 'UnderlyingStrikePrice' in d:
+		add('316=' + str(d['UnderlyingStrikePrice']))
+		n += 1
+	if 'UnderlyingStrikeCurrency' in d:
+		add('941=' + str(d['UnderlyingStrikeCurrency']))
+		n += 1
+	if 'UnderlyingOptAttribute' in d:
+		add('317=' + str(d['UnderlyingOptAttribute']))
+		n += 1
+	if 'UnderlyingContractMultiplier' in d:
+		add('436=' + str(d['UnderlyingContractMultiplier']))
+		n += 1
+	if 'UnderlyingCouponRate' in d:
+		add('435=' + str(d['UnderlyingCouponRate']))
+		n += 1
+	if 'UnderlyingSecurityExchange' in d:
+		add('308=' + str(d['UnderlyingSecurityExchange']))
+		n += 1
+	if 'UnderlyingIssuer' in d:
+		add('306=' + str(d['UnderlyingIssuer']))
+		n += 1
+	if 'EncodedUnderlyingIssuerLen' in d:
+		add('362=' + str(d['EncodedUnderlyingIssuerLen']))
+		n += 1
+	if 'EncodedUnderlyingIssuer' in d:
+		add('363=' + str(d['EncodedUnderlyingIssuer']))
+		n += 1
+	if 'UnderlyingSecurityDesc' in d:
+		add('307=' + str(d['UnderlyingSecurityDesc']))
+		n += 1
+	if 'EncodedUnderlyingSecurityDescLen' in d:
+		add('364=' + str(d['EncodedUnderlyingSecurityDescLen']))
+		n += 1
+	if 'EncodedUnderlyingSecurityDesc' in d:
+		add('365=' + str(d['EncodedUnderlyingSecurityDesc']))
+		n += 1
+	if 'UnderlyingCPProgram' in d:
+		add('877=' + str(d['UnderlyingCPProgram']))
+		n += 1
+	if 'UnderlyingCPRegType' in d:
+		add('878=' + str(d['UnderlyingCPRegType']))
+		n += 1
+	if 'UnderlyingCurrency' in d:
+		add('318=' + str(d['UnderlyingCurrency']))
+		n += 1
+	if 'UnderlyingQty' in d:
+		add('879=' + str(d['UnderlyingQty']))
+		n += 1
+	if 'UnderlyingPx' in d:
+		add('810=' + str(d['UnderlyingPx']))
+		n += 1
+	if 'UnderlyingDirtyPrice' in d:
+		add('882=' + str(d['UnderlyingDirtyPrice']))
+		n += 1
+	if 'UnderlyingEndPrice' in d:
+		add('883=' + str(d['UnderlyingEndPrice']))
+		n += 1
+	if 'UnderlyingStartValue' in d:
+		add('884=' + str(d['UnderlyingStartValue']))
+		n += 1
+	if 'UnderlyingCurrentValue' in d:
+		add('885=' + str(d['UnderlyingCurrentValue']))
+		n += 1
+	if 'UnderlyingEndValue' in d:
+		add('886=' + str(d['UnderlyingEndValue']))
+		n += 1
+	if 'NoUnderlyingStips' in d:
+		grp = d['NoUnderlyingStips']
+		add('887=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoUnderlyingStips(entry, fixm)
+		n += 1
+	if 'Side' in d:
+		add('54=' + str(d['Side']))
+		n += 1
+	if len(d) > n:
+		_make_mbody(obj, obj._context, fixm, _msg_OrderMassStatusRequest_names)
+	return fixm
+
+def _decode_OrderMassStatusRequest(obj, fields, index, context):
+	d = obj.__dict__
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _msg_OrderMassStatusRequest_tags.get(num)
+		if spec is None:
+			# not a field of this message, continue with generic decoder
+			body, index = _extract_body(fields, index, context, obj)
+			return index
+		name, pytype, decode_grp = spec
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	return index
 
 class OrderMassStatusRequest(FixObject):
-	pass
+	_encode = staticmethod(_encode_OrderMassStatusRequest)
+	_decode = staticmethod(_decode_OrderMassStatusRequest)
+
+_msg_OrderStatusRequest_names = frozenset(['OrderID', 'ClOrdID', 'SecondaryClOrdID', 'ClOrdLinkID', 'NoPartyIDs', 'OrdStatusReqID', 'Account', 'AcctIDSource', 'Symbol', 'SymbolSfx', 'SecurityID', 'SecurityIDSource', 'NoSecurityAltID', 'Product', 'CFICode', 'SecurityType', 'SecuritySubType', 'MaturityMonthYear', 'MaturityDate', 'CouponPaymentDate', 'IssueDate', 'RepoCollateralSecurityType', 'RepurchaseTerm', 'RepurchaseRate', 'Factor', 'CreditRating', 'InstrRegistry', 'CountryOfIssue', 'StateOrProvinceOfIssue', 'LocaleOfIssue', 'RedemptionDate', 'StrikePrice', 'StrikeCurrency', 'OptAttribute', 'ContractMultiplier', 'CouponRate', 'SecurityExchange', 'Issuer', 'EncodedIssuerLen', 'EncodedIssuer', 'SecurityDesc', 'EncodedSecurityDescLen', 'EncodedSecurityDesc', 'Pool', 'ContractSettlMonth', 'CPProgram', 'CPRegType', 'NoEvents', 'DatedDate', 'InterestAccrualDate', 'AgreementDesc', 'AgreementID', 'AgreementDate', 'AgreementCurrency', 'TerminationType', 'StartDate', 'EndDate', 'DeliveryType', 'MarginRatio', 'NoUnderlyings', 'Side'])
+
+_msg_OrderStatusRequest_tags = {
+	37: ('OrderID', str, None),
+	11: ('ClOrdID', str, None),
+	526: ('SecondaryClOrdID', str, None),
+	583: ('ClOrdLinkID', str, None),
+	453: ('NoPartyIDs', int, _decode_grp_NoPartyIDs),
+	790: ('OrdStatusReqID', str, None),
+	1: ('Account', str, None),
+	660: ('AcctIDSource', int, None),
+	55: ('Symbol', str, None),
+	65: ('SymbolSfx', str, None),
+	48: ('SecurityID', str, None),
+	22: ('SecurityIDSource', str, None),
+	454: ('NoSecurityAltID', int, _decode_grp_NoSecurityAltID),
+	460: ('Product', int, None),
+	461: ('CFICode', str, None),
+	167: ('SecurityType', str, None),
+	762: ('SecuritySubType', str, None),
+	200: ('MaturityMonthYear', str, None),
+	541: ('MaturityDate', str, None),
+	224: ('CouponPaymentDate', str, None),
+	225: ('IssueDate', str, None),
+	239: ('RepoCollateralSecurityType', int, None),
+	226: ('RepurchaseTerm', int, None),
+	227: ('RepurchaseRate', float, None),
+	228: ('Factor', float, None),
+	255: ('CreditRating', str, None),
+	543: ('InstrRegistry', str, None),
+	470: ('CountryOfIssue', str, None),
+	471: ('StateOrProvinceOfIssue', str, None),
+	472: ('LocaleOfIssue', str, None),
+	240: ('RedemptionDate', str, None),
+	202: ('StrikePrice', float, None),
+	947: ('StrikeCurrency', str, None),
+	206: ('OptAttribute', str, None),
+	231: ('ContractMultiplier', float, None),
+	223: ('CouponRate', float, None),
+	207: ('SecurityExchange', str, None),
+	106: ('Issuer', str, None),
+	348: ('EncodedIssuerLen', str, None),
+	349: ('EncodedIssuer', str, None),
+	107: ('SecurityDesc', str, None),
+	350: ('EncodedSecurityDescLen', str, None),
+	351: ('EncodedSecurityDesc', str, None),
+	691: ('Pool', str, None),
+	667: ('ContractSettlMonth', str, None),
+	875: ('CPProgram', int, None),
+	876: ('CPRegType', str, None),
+	864: ('NoEvents', int, _decode_grp_NoEvents),
+	873: ('DatedDate', str, None),
+	874: ('InterestAccrualDate', str, None),
+	913: ('AgreementDesc', str, None),
+	914: ('AgreementID', str, None),
+	915: ('AgreementDate', str, None),
+	918: ('AgreementCurrency', str, None),
+	788: ('TerminationType', int, None),
+	916: ('StartDate', str, None),
+	917: ('EndDate', str, None),
+	919: ('DeliveryType', int, None),
+	898: ('MarginRatio', float, None),
+	711: ('NoUnderlyings', int, _decode_grp_NoUnderlyings),
+	54: ('Side', str, None),
+}
+
+def _encode_OrderStatusRequest(obj, fixm):
+	d = obj.__dict__
+	add = fixm.append
+	n = 1
+	if 'OrderID' in d:
+		add('37=' + str(d['OrderID']))
+		n += 1
+	if 'ClOrdID' in d:
+		add('11=' + str(d['ClOrdID']))
+		n += 1
+	if 'SecondaryClOrdID' in d:
+		add('526=' + str(d['SecondaryClOrdID']))
+		n += 1
+	if 'ClOrdLinkID' in d:
+		add('583=' + str(d['ClOrdLinkID']))
+		n += 1
+	if 'NoPartyIDs' in d:
+		grp = d['NoPartyIDs']
+		add('453=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoPartyIDs(entry, fixm)
+		n += 1
+	if 'OrdStatusReqID' in d:
+		add('790=' + str(d['OrdStatusReqID']))
+		n += 1
+	if 'Account' in d:
+		add('1=' + str(d['Account']))
+		n += 1
+	if 'AcctIDSource' in d:
+		add('660=' + str(d['AcctIDSource']))
+		n += 1
+	if 'Symbol' in d:
+		add('55=' + str(d['Symbol']))
+		n += 1
+	if 'SymbolSfx' in d:
+		add('65=' + str(d['SymbolSfx']))
+		n += 1
+	if 'SecurityID' in d:
+		add('48=' + str(d['SecurityID']))
+		n += 1
+	if 'SecurityIDSource' in d:
+		add('22=' + str(d['SecurityIDSource']))
+		n += 1
+	if 'NoSecurityAltID' in d:
+		grp = d['NoSecurityAltID']
+		add('454=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoSecurityAltID(entry, fixm)
+		n += 1
+	if 'Product' in d:
+		add('460=' + str(d['Product']))
+		n += 1
+	if 'CFICode' in d:
+		add('461=' + str(d['CFICode']))
+		n += 1
+	if 'SecurityType' in d:
+		add('167=' + str(d['SecurityType']))
+		n += 1
+	if 'SecuritySubType' in d:
+		add('762=' + str(d['SecuritySubType']))
+		n += 1
+	if 'MaturityMonthYear' in d:
+		add('200=' + str(d['MaturityMonthYear']))
+		n += 1
+	if 'MaturityDate' in d:
+		add('541=' + str(d['MaturityDate']))
+		n += 1
+	if 'CouponPaymentDate' in d:
+		add('224=' + str(d['CouponPaymentDate']))
+		n += 1
+	if 'IssueDate' in d:
+		add('225=' + str(d['IssueDate']))
+		n += 1
+	if 'RepoCollateralSecurityType' in d:
+		add('239=' + str(d['RepoCollateralSecurityType']))
+		n += 1
+	if 'RepurchaseTerm' in d:
+		add('226=' + str(d['RepurchaseTerm']))
+		n += 1
+	if 'RepurchaseRate' in d:
+		add('227=' + str(d['RepurchaseRate']))
+		n += 1
+	if 'Factor' in d:
+		add('228=' + str(d['Factor']))
+		n += 1
+	if 'CreditRating' in d:
+		add('255=' + str(d['CreditRating']))
+		n += 1
+	if 'InstrRegistry' in d:
+		add('543=' + str(d['InstrRegistry']))
+		n += 1
+	if 'CountryOfIssue' in d:
+		add('470=' + str(d['CountryOfIssue']))
+		n += 1
+	if 'StateOrProvinceOfIssue' in d:
+		add('471=' + str(d['StateOrProvinceOfIssue']))
+		n += 1
+	if 'LocaleOfIssue' in d:
+		add('472=' + str(d['LocaleOfIssue']))
+		n += 1
+	if 'RedemptionDate' in d:
+		add('240=' + str(d['RedemptionDate']))
+		n += 1
+	if 'StrikePrice' in d:
+		add('202=' + str(d['StrikePrice']))
+		n += 1
+	if 'StrikeCurrency' in d:
+		add('947=' + str(d['StrikeCurrency']))
+		n += 1
+	if 'OptAttribute' in d:
+		add('206=' + str(d['OptAttribute']))
+		n += 1
+	if 'ContractMultiplier' in d:
+		add('231=' + str(d['ContractMultiplier']))
+		n += 1
+	if 'CouponRate' in d:
+		add('223=' + str(d['CouponRate']))
+		n += 1
+	if 'SecurityExchange' in d:
+		add('207=' + str(d['SecurityExchange']))
+		n += 1
+	if 'Issuer' in d:
+		add('106=' + str(d['Issuer']))
+		n += 1
+	if 'EncodedIssuerLen' in d:
+		add('348=' + str(d['EncodedIssuerLen']))
+		n += 1
+	if 'EncodedIssuer' in d:
+		add('349=' + str(d['EncodedIssuer']))
+		n += 1
+	if 'SecurityDesc' in d:
+		add('107=' + str(d['SecurityDesc']))
+		n += 1
+	if 'EncodedSecurityDescLen' in d:
+		add('350=' + str(d['EncodedSecurityDescLen']))
+		n += 1
+	if 'EncodedSecurityDesc' in d:
+		add('351=' + str(d['EncodedSecurityDesc']))
+		n += 1
+	if 'Pool' in d:
+		add('691=' + str(d['Pool']))
+		n += 1
+	if 'ContractSettlMonth' in d:
+		add('667=' + str(d['ContractSettlMonth']))
+		n += 1
+	if 'CPProgram' in d:
+		add('875=' + str(d['CPProgram']))
+		n += 1
+	if 'CPRegType' in d:
+		add('876=' + str(d['CPRegType']))
+		n += 1
+	if 'NoEvents' in d:
+		grp = d['NoEvents']
+		add('864=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoEvents(entry, fixm)
+		n += 1
+	if 'DatedDate' in d:
+		add('873=' + str(d['DatedDate']))
+		n += 1
+	if 'InterestAccrualDate' in d:
+		add('874=' + str(d['InterestAccrualDate']))
+		n += 1
+	if 'AgreementDesc' in d:
+		add('913=' + str(d['AgreementDesc']))
+		n += 1
+	if 'AgreementID' in d:
+		add('914=' + str(d['AgreementID']))
+		n += 1
+	if 'AgreementDate' in d:
+		add('915=' + str(d['AgreementDate']))
+		n += 1
+	if 'AgreementCurrency' in d:
+		add('918=' + str(d['AgreementCurrency']))
+		n += 1
+	if 'TerminationType' in d:
+		add('788=' + str(d['TerminationType']))
+		n += 1
+	if 'StartDate' in d:
+		add('916=' + str(d['StartDate']))
+		n += 1
+	if 'EndDate' in d:
+		add('917=' + str(d['EndDate']))
+		n += 1
+	if 'DeliveryType' in d:
+		add('919=' + str(d['DeliveryType']))
+		n += 1
+	if 'MarginRatio' in d:
+		add('898=' + str(d['MarginRatio']))
+		n += 1
+	if 'NoUnderlyings' in d:
+		grp = d['NoUnderlyings']
+		add('711=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoUnderlyings(entry, fixm)
+		n += 1
+	if 'Side' in d:
+		add('54=' + str(d['Side']))
+		n += 1
+	if len(d) > n:
+		_make_mbody(obj, obj._context, fixm, _msg_OrderStatusRequest_names)
+	return fixm
+
+def _decode_OrderStatusRequest(obj, fields, index, context):
+	d = obj.__dict__
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _msg_OrderStatusRequest_tags.get(num)
+		if spec is None:
+			# not a field of this message, continue with generic decoder
+			body, index = _extract_body(fields, index, context, obj)
+			return index
+		name, pytype, decode_grp = spec
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	return index
 
 class OrderStatusRequest(FixObject):
-	pass
+	_encode = staticmethod(_encode_OrderStatusRequest)
+	_decode = staticmethod(_decode_OrderStatusRequest)
+
+_msg_PositionMaintenanceReport_names = frozenset(['PosMaintRptID', 'PosTransType', 'PosReqID', 'PosMaintAction', 'OrigPosReqRefID', 'PosMaintStatus', 'PosMaintResult', 'ClearingBusinessDate', 'SettlSessID', 'SettlSessSubID', 'NoPartyIDs', 'Account', 'AcctIDSource', 'AccountType', 'Symbol', 'SymbolSfx', 'SecurityID', 'SecurityIDSource', 'NoSecurityAltID', 'Product', 'CFICode', 'SecurityType', 'SecuritySubType', 'MaturityMonthYear', 'MaturityDate', 'CouponPaymentDate', 'IssueDate', 'RepoCollateralSecurityType', 'RepurchaseTerm', 'RepurchaseRate', 'Factor', 'CreditRating', 'InstrRegistry', 'CountryOfIssue', 'StateOrProvinceOfIssue', 'LocaleOfIssue', 'RedemptionDate', 'StrikePrice', 'StrikeCurrency', 'OptAttribute', 'ContractMultiplier', 'CouponRate', 'SecurityExchange', 'Issuer', 'EncodedIssuerLen', 'EncodedIssuer', 'SecurityDesc', 'EncodedSecurityDescLen', 'EncodedSecurityDesc', 'Pool', 'ContractSettlMonth', 'CPProgram', 'CPRegType', 'NoEvents', 'DatedDate', 'InterestAccrualDate', 'Currency', 'NoLegs', 'NoUnderlyings', 'NoTradingSessions', 'TransactTime', 'NoPositions', 'NoPosAmt', 'AdjustmentType', 'ThresholdAmount', 'Text', 'EncodedTextLen', 'EncodedText'])
+
+_msg_PositionMaintenanceReport_tags = {
+	721: ('PosMaintRptID', str, None),
+	709: ('PosTransType', int, None),
+	710: ('PosReqID', str, None),
+	712: ('PosMaintAction', int, None),
+	713: ('OrigPosReqRefID', str, None),
+	722: ('PosMaintStatus', int, None),
+	723: ('PosMaintResult', int, None),
+	715: ('ClearingBusinessDate', str, None),
+	716: ('SettlSessID', str, None),
+	717: ('SettlSessSubID', str, None),
+	453: ('NoPartyIDs', int, _decode_grp_NoPartyIDs),
+	1: ('Account', str, None),
+	660: ('AcctIDSource', int, None),
+	581: ('AccountType', int, None),
+	55: ('Symbol', str, None),
+	65: ('SymbolSfx', str, None),
+	48: ('SecurityID', str, None),
+	22: ('SecurityIDSource', str, None),
+	454: ('NoSecurityAltID', int, _decode_grp_NoSecurityAltID),
+	460: ('Product', int, None),
+	461: ('CFICode', str, None),
+	167: ('SecurityType', str, None),
+	762: ('SecuritySubType', str, None),
+	200: ('MaturityMonthYear', str, None),
+	541: ('MaturityDate', str, None),
+	224: ('CouponPaymentDate', str, None),
+	225: ('IssueDate', str, None),
+	239: ('RepoCollateralSecurityType', int, None),
+	226: ('RepurchaseTerm', int, None),
+	227: ('RepurchaseRate', float, None),
+	228: ('Factor', float, None),
+	255: ('CreditRating', str, None),
+	543: ('InstrRegistry', str, None),
+	470: ('CountryOfIssue', str, None),
+	471: ('StateOrProvinceOfIssue', str, None),
+	472: ('LocaleOfIssue', str, None),
+	240: ('RedemptionDate', str, None),
+	202: ('StrikePrice', float, None),
+	947: ('StrikeCurrency', str, None),
+	206: ('OptAttribute', str, None),
+	231: ('ContractMultiplier', float, None),
+	223: ('CouponRate', float, None),
+	207: ('SecurityExchange', str, None),
+	106: ('Issuer', str, None),
+	348: ('EncodedIssuerLen', str, None),
+	349: ('EncodedIssuer', str, None),
+	107: ('SecurityDesc', str, None),
+	350: ('EncodedSecurityDescLen', str, None),
+	351: ('EncodedSecurityDesc', str, None),
+	691: ('Pool', str, None),
+	667: ('ContractSettlMonth', str, None),
+	875: ('CPProgram', int, None),
+	876: ('CPRegType', str, None),
+	864: ('NoEvents', int, _decode_grp_NoEvents),
+	873: ('DatedDate', str, None),
+	874: ('InterestAccrualDate', str, None),
+	15: ('Currency', str, None),
+	555: ('NoLegs', int, _decode_grp_NoLegs),
+	711: ('NoUnderlyings', int, _decode_grp_NoUnderlyings),
+	386: ('NoTradingSessions', int, _decode_grp_NoTradingSessions),
+	60: ('TransactTime', str, None),
+	702: ('NoPositions', int, _decode_grp_NoPositions),
+	753: ('NoPosAmt', int, _decode_grp_NoPosAmt),
+	718: ('AdjustmentType', int, None),
+	834: ('ThresholdAmount', float, None),
+	58: ('Text', str, None),
+	354: ('EncodedTextLen', str, None),
+	355: ('EncodedText', str, None),
+}
+
+def _encode_PositionMaintenanceReport(obj, fixm):
+	d = obj.__dict__
+	add = fixm.append
+	n = 1
+	if 'PosMaintRptID' in d:
+		add('721=' + str(d['PosMaintRptID']))
+		n += 1
+	if 'PosTransType' in d:
+		add('709=' + str(d['PosTransType']))
+		n += 1
+	if 'PosReqID' in d:
+		add('710=' + str(d['PosReqID']))
+		n += 1
+	if 'PosMaintAction' in d:
+		add('712=' + str(d['PosMaintAction']))
+		n += 1
+	if 'OrigPosReqRefID' in d:
+		add('713=' + str(d['OrigPosReqRefID']))
+		n += 1
+	if 'PosMaintStatus' in d:
+		add('722=' + str(d['PosMaintStatus']))
+		n += 1
+	if 'PosMaintResult' in d:
+		add('723=' + str(d['PosMaintResult']))
+		n += 1
+	if 'ClearingBusinessDate' in d:
+		add('715=' + str(d['ClearingBusinessDate']))
+		n += 1
+	if 'SettlSessID' in d:
+		add('716=' + str(d['SettlSessID']))
+		n += 1
+	if 'SettlSessSubID' in d:
+		add('717=' + str(d['SettlSessSubID']))
+		n += 1
+	if 'NoPartyIDs' in d:
+		grp = d['NoPartyIDs']
+		add('453=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoPartyIDs(entry, fixm)
+		n += 1
+	if 'Account' in d:
+		add('1=' + str(d['Account']))
+		n += 1
+	if 'AcctIDSource' in d:
+		add('660=' + str(d['AcctIDSource']))
+		n += 1
+	if 'AccountType' in d:
+		add('581=' + str(d['AccountType']))
+		n += 1
+	if 'Symbol' in d:
+		add('55=' + str(d['Symbol']))
+		n += 1
+	if 'SymbolSfx' in d:
+		add('65=' + str(d['SymbolSfx']))
+		n += 1
+	if 'SecurityID' in d:
+		add('48=' + str(d['SecurityID']))
+		n += 1
+	if 'SecurityIDSource' in d:
+		add('22=' + str(d['SecurityIDSource']))
+		n += 1
+	if 'NoSecurityAltID' in d:
+		grp = d['NoSecurityAltID']
+		add('454=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoSecurityAltID(entry, fixm)
+		n += 1
+	if 'Product' in d:
+		add('460=' + str(d['Product']))
+		n += 1
+	if 'CFICode' in d:
+		add('461=' + str(d['CFICode']))
+		n += 1
+	if 'SecurityType' in d:
+		add('167=' + str(d['SecurityType']))
+		n += 1
+	if 'SecuritySubType' in d:
+		add('762=' + str(d['SecuritySubType']))
+		n += 1
+	if 'MaturityMonthYear' in d:
+		add('200=' + str(d['MaturityMonthYear']))
+		n += 1
+	if 'MaturityDate' in d:
+		add('541=' + str(d['MaturityDate']))
+		n += 1
+	if 'CouponPaymentDate' in d:
+		add('224=' + str(d['CouponPaymentDate']))
+		n += 1
+	if 'IssueDate' in d:
+		add('225=' + str(d['IssueDate']))
+		n += 1
+	if 'RepoCollateralSecurityType' in d:
+		add('239=' + str(d['RepoCollateralSecurityType']))
+		n += 1
+	if 'RepurchaseTerm' in d:
+		add('226=' + str(d['RepurchaseTerm']))
+		n += 1
+	if 'RepurchaseRate' in d:
+		add('227=' + str(d['RepurchaseRate']))
+		n += 1
+	if 'Factor' in d:
+		add('228=' + str(d['Factor']))
+		n += 1
+	if 'CreditRating' in d:
+		add('255=' + str(d['CreditRating']))
+		n += 1
+	if 'InstrRegistry' in d:
+		add('543=' + str(d['InstrRegistry']))
+		n += 1
+	if 'CountryOfIssue' in d:
+		add('470=' + str(d['CountryOfIssue']))
+		n += 1
+	if 'StateOrProvinceOfIssue' in d:
+		add('471=' + str(d['StateOrProvinceOfIssue']))
+		n += 1
+	if 'LocaleOfIssue' in d:
+		add('472=' + str(d['LocaleOfIssue']))
+		n += 1
+	if 'RedemptionDate' in d:
+		add('240=' + str(d['RedemptionDate']))
+		n += 1
+	if 'StrikePrice' in d:
+		add('202=' + str(d['StrikePrice']))
+		n += 1
+	if 'StrikeCurrency' in d:
+		add('947=' + str(d['StrikeCurrency']))
+		n += 1
+	if 'OptAttribute' in d:
+		add('206=' + str(d['OptAttribute']))
+		n += 1
+	if 'ContractMultiplier' in d:
+		add('231=' + str(d['ContractMultiplier']))
+		n += 1
+	if 'CouponRate' in d:
+		add('223=' + str(d['CouponRate']))
+		n += 1
+	if 'SecurityExchange' in d:
+		add('207=' + str(d['SecurityExchange']))
+		n += 1
+	if 'Issuer' in d:
+		add('106=' + str(d['Issuer']))
+		n += 1
+	if 'EncodedIssuerLen' in d:
+		add('348=' + str(d['EncodedIssuerLen']))
+		n += 1
+	if 'EncodedIssuer' in d:
+		add('349=' + str(d['EncodedIssuer']))
+		n += 1
+	if 'SecurityDesc' in d:
+		add('107=' + str(d['SecurityDesc']))
+		n += 1
+	if 'EncodedSecurityDescLen' in d:
+		add('350=' + str(d['EncodedSecurityDescLen']))
+		n += 1
+	if 'EncodedSecurityDesc' in d:
+		add('351=' + str(d['EncodedSecurityDesc']))
+		n += 1
+	if 'Pool' in d:
+		add('691=' + str(d['Pool']))
+		n += 1
+	if 'ContractSettlMonth' in d:
+		add('667=' + str(d['ContractSettlMonth']))
+		n += 1
+	if 'CPProgram' in d:
+		add('875=' + str(d['CPProgram']))
+		n += 1
+	if 'CPRegType' in d:
+		add('876=' + str(d['CPRegType']))
+		n += 1
+	if 'NoEvents' in d:
+		grp = d['NoEvents']
+		add('864=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoEvents(entry, fixm)
+		n += 1
+	if 'DatedDate' in d:
+		add('873=' + str(d['DatedDate']))
+		n += 1
+	if 'InterestAccrualDate' in d:
+		add('874=' + str(d['InterestAccrualDate']))
+		n += 1
+	if 'Currency' in d:
+		add('15=' + str(d['Currency']))
+		n += 1
+	if 'NoLegs' in d:
+		grp = d['NoLegs']
+		add('555=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoLegs(entry, fixm)
+		n += 1
+	if 'NoUnderlyings' in d:
+		grp = d['NoUnderlyings']
+		add('711=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoUnderlyings(entry, fixm)
+		n += 1
+	if 'NoTradingSessions' in d:
+		grp = d['NoTradingSessions']
+		add('386=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoTradingSessions(entry, fixm)
+		n += 1
+	if 'TransactTime' in d:
+		add('60=' + str(d['TransactTime']))
+		n += 1
+	if 'NoPositions' in d:
+		grp = d['NoPositions']
+		add('702=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoPositions(entry, fixm)
+		n += 1
+	if 'NoPosAmt' in d:
+		grp = d['NoPosAmt']
+		add('753=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoPosAmt(entry, fixm)
+		n += 1
+	if 'AdjustmentType' in d:
+		add('718=' + str(d['AdjustmentType']))
+		n += 1
+	if 'ThresholdAmount' in d:
+		add('834=' + str(d['ThresholdAmount']))
+		n += 1
+	if 'Text' in d:
+		add('58=' + str(d['Text']))
+		n += 1
+	if 'EncodedTextLen' in d:
+		add('354=' + str(d['EncodedTextLen']))
+		n += 1
+	if 'EncodedText' in d:
+		add('355=' + str(d['EncodedText']))
+		n += 1
+	if len(d) > n:
+		_make_mbody(obj, obj._context, fixm, _msg_PositionMaintenanceReport_names)
+	return fixm
+
+def _decode_PositionMaintenanceReport(obj, fields, index, context):
+	d = obj.__dict__
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _msg_PositionMaintenanceReport_tags.get(num)
+		if spec is None:
+			# not a field of this message, continue with generic decoder
+			body, index = _extract_body(fields, index, context, obj)
+			return index
+		name, pytype, decode_grp = spec
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	return index
 
 class PositionMaintenanceReport(FixObject):
-	pass
+	_encode = staticmethod(_encode_PositionMaintenanceReport)
+	_decode = staticmethod(_decode_PositionMaintenanceReport)
+
+_msg_PositionMaintenanceRequest_names = frozenset(['PosReqID', 'PosTransType', 'PosMaintAction', 'OrigPosReqRefID', 'PosMaintRptRefID', 'ClearingBusinessDate', 'SettlSessID', 'SettlSessSubID', 'NoPartyIDs', 'Account', 'AcctIDSource', 'AccountType', 'Symbol', 'SymbolSfx', 'SecurityID', 'SecurityIDSource', 'NoSecurityAltID', 'Product', 'CFICode', 'SecurityType', 'SecuritySubType', 'MaturityMonthYear', 'MaturityDate', 'CouponPaymentDate', 'IssueDate', 'RepoCollateralSecurityType', 'RepurchaseTerm', 'RepurchaseRate', 'Factor', 'CreditRating', 'InstrRegistry', 'CountryOfIssue', 'StateOrProvinceOfIssue', 'LocaleOfIssue', 'RedemptionDate', 'StrikePrice', 'StrikeCurrency', 'OptAttribute', 'ContractMultiplier', 'CouponRate', 'SecurityExchange', 'Issuer', 'EncodedIssuerLen', 'EncodedIssuer', 'SecurityDesc', 'EncodedSecurityDescLen', 'EncodedSecurityDesc', 'Pool', 'ContractSettlMonth', 'CPProgram', 'CPRegType', 'NoEvents', 'DatedDate', 'InterestAccrualDate', 'Currency', 'NoLegs', 'NoUnderlyings', 'NoTradingSessions', 'TransactTime', 'NoPositions', 'AdjustmentType', 'ContraryInstructionIndicator', 'PriorSpreadIndicator', 'ThresholdAmount', 'Text', 'EncodedTextLen', 'EncodedText'])
+
+_msg_PositionMaintenanceRequest_tags = {
+	710: ('PosReqID', str, None),
+	709: ('PosTransType', int, None),
+	712: ('PosMaintAction', int, None),
+	713: ('OrigPosReqRefID', str, None),
+	714: ('PosMaintRptRefID', str, None),
+	715: ('ClearingBusinessDate', str, None),
+	716: ('SettlSessID', str, None),
+	717: ('SettlSessSubID', str, None),
+	453: ('NoPartyIDs', int, _decode_grp_NoPartyIDs),
+	1: ('Account', str, None),
+	660: ('AcctIDSource', int, None),
+	581: ('AccountType', int, None),
+	55: ('Symbol', str, None),
+	65: ('SymbolSfx', str, None),
+	48: ('SecurityID', str, None),
+	22: ('SecurityIDSource', str, None),
+	454: ('NoSecurityAltID', int, _decode_grp_NoSecurityAltID),
+	460: ('Product', int, None),
+	461: ('CFICode', str, None),
+	167: ('SecurityType', str, None),
+	762: ('SecuritySubType', str, None),
+	200: ('MaturityMonthYear', str, None),
+	541: ('MaturityDate', str, None),
+	224: ('CouponPaymentDate', str, None),
+	225: ('IssueDate', str, None),
+	239: ('RepoCollateralSecurityType', int, None),
+	226: ('RepurchaseTerm', int, None),
+	227: ('RepurchaseRate', float, None),
+	228: ('Factor', float, None),
+	255: ('CreditRating', str, None),
+	543: ('InstrRegistry', str, None),
+	470: ('CountryOfIssue', str, None),
+	471: ('StateOrProvinceOfIssue', str, None),
+	472: ('LocaleOfIssue', str, None),
+	240: ('RedemptionDate', str, None),
+	202: ('StrikePrice', float, None),
+	947: ('StrikeCurrency', str, None),
+	206: ('OptAttribute', str, None),
+	231: ('ContractMultiplier', float, None),
+	223: ('CouponRate', float, None),
+	207: ('SecurityExchange', str, None),
+	106: ('Issuer', str, None),
+	348: ('EncodedIssuerLen', str, None),
+	349: ('EncodedIssuer', str, None),
+	107: ('SecurityDesc', str, None),
+	350: ('EncodedSecurityDescLen', str, None),
+	351: ('EncodedSecurityDesc', str, None),
+	691: ('Pool', str, None),
+	667: ('ContractSettlMonth', str, None),
+	875: ('CPProgram', int, None),
+	876: ('CPRegType', str, None),
+	864: ('NoEvents', int, _decode_grp_NoEvents),
+	873: ('DatedDate', str, None),
+	874: ('InterestAccrualDate', str, None),
+	15: ('Currency', str, None),
+	555: ('NoLegs', int, _decode_grp_NoLegs),
+	711: ('NoUnderlyings', int, _decode_grp_NoUnderlyings),
+	386: ('NoTradingSessions', int, _decode_grp_NoTradingSessions),
+	60: ('TransactTime', str, None),
+	702: ('NoPositions', int, _decode_grp_NoPositions),
+	718: ('AdjustmentType', int, None),
+	719: ('ContraryInstructionIndicator', str, None),
+	720: ('PriorSpreadIndicator', str, None),
+	834: ('ThresholdAmount', float, None),
+	58: ('Text', str, None),
+	354: ('EncodedTextLen', str, None),
+	355: ('EncodedText', str, None),
+}
+
+def _encode_PositionMaintenanceRequest(obj, fixm):
+	d = obj.__dict__
+	add = fixm.append
+	n = 1
+	if 'PosReqID' in d:
+		add('710=' + str(d['PosReqID']))
+		n += 1
+	if 'PosTransType' in d:
+		add('709=' + str(d['PosTransType']))
+		n += 1
+	if 'PosMaintAction' in d:
+		add('712=' + str(d['PosMaintAction']))
+		n += 1
+	if 'OrigPosReqRefID' in d:
+		add('713=' + str(d['OrigPosReqRefID']))
+		n += 1
+	if 'PosMaintRptRefID' in d:
+		add('714=' + str(d['PosMaintRptRefID']))
+		n += 1
+	if 'ClearingBusinessDate' in d:
+		add('715=' + str(d['ClearingBusinessDate']))
+		n += 1
+	if 'SettlSessID' in d:
+		add('716=' + str(d['SettlSessID']))
+		n += 1
+	if 'SettlSessSubID' in d:
+		add('717=' + str(d['SettlSessSubID']))
+		n += 1
+	if 'NoPartyIDs' in d:
+		grp = d['NoPartyIDs']
+		add('453=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoPartyIDs(entry, fixm)
+		n += 1
+	if 'Account' in d:
+		add('1=' + str(d['Account']))
+		n += 1
+	if 'AcctIDSource' in d:
+		add('660=' + str(d['AcctIDSource']))
+		n += 1
+	if 'AccountType' in d:
+		add('581=' + str(d['AccountType']))
+		n += 1
+	if 'Symbol' in d:
+		add('55=' + str(d['Symbol']))
+		n += 1
+	if 'SymbolSfx' in d:
+		add('65=' + str(d['SymbolSfx']))
+		n += 1
+	if 'SecurityID' in d:
+		add('48=' + str(d['SecurityID']))
+		n += 1
+	if 'SecurityIDSource' in d:
+		add('22=' + str(d['SecurityIDSource']))
+		n += 1
+	if 'NoSecurityAltID' in d:
+		grp = d['NoSecurityAltID']
+		add('454=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoSecurityAltID(entry, fixm)
+		n += 1
+	if 'Product' in d:
+		add('460=' + str(d['Product']))
+		n += 1
+	if 'CFICode' in d:
+		add('461=' + str(d['CFICode']))
+		n += 1
+	if 'SecurityType' in d:
+		add('167=' + str(d['SecurityType']))
+		n += 1
+	if 'SecuritySubType' in d:
+		add('762=' + str(d['SecuritySubType']))
+		n += 1
+	if 'MaturityMonthYear' in d:
+		add('200=' + str(d['MaturityMonthYear']))
+		n += 1
+	if 'MaturityDate' in d:
+		add('541=' + str(d['MaturityDate']))
+		n += 1
+	if 'CouponPaymentDate' in d:
+		add('224=' + str(d['CouponPaymentDate']))
+		n += 1
+	if 'IssueDate' in d:
+		add('225=' + str(d['IssueDate']))
+		n += 1
+	if 'RepoCollateralSecurityType' in d:
+		add('239=' + str(d['RepoCollateralSecurityType']))
+		n += 1
+	if 'RepurchaseTerm' in d:
+		add('226=' + str(d['RepurchaseTerm']))
+		n += 1
+	if 'RepurchaseRate' in d:
+		add('227=' + str(d['RepurchaseRate']))
+		n += 1
+	if 'Factor' in d:
+		add('228=' + str(d['Factor']))
+		n += 1
+	if 'CreditRating' in d:
+		add('255=' + str(d['CreditRating']))
+		n += 1
+	if 'InstrRegistry' in d:
+		add('543=' + str(d['InstrRegistry']))
+		n += 1
+	if 'CountryOfIssue' in d:
+		add('470=' + str(d['CountryOfIssue']))
+		n += 1
+	if 'StateOrProvinceOfIssue' in d:
+		add('471=' + str(d['StateOrProvinceOfIssue']))
+		n += 1
+	if 'LocaleOfIssue' in d:
+		add('472=' + str(d['LocaleOfIssue']))
+		n += 1
+	if 'RedemptionDate' in d:
+		add('240=' + str(d['RedemptionDate']))
+		n += 1
+	if 'StrikePrice' in d:
+		add('202=' + str(d['StrikePrice']))
+		n += 1
+	if 'StrikeCurrency' in d:
+		add('947=' + str(d['StrikeCurrency']))
+		n += 1
+	if 'OptAttribute' in d:
+		add('206=' + str(d['OptAttribute']))
+		n += 1
+	if 'ContractMultiplier' in d:
+		add('231=' + str(d['ContractMultiplier']))
+		n += 1
+	if 'CouponRate' in d:
+		add('223=' + str(d['CouponRate']))
+		n += 1
+	if 'SecurityExchange' in d:
+		add('207=' + str(d['SecurityExchange']))
+		n += 1
+	if 'Issuer' in d:
+		add('106=' + str(d['Issuer']))
+		n += 1
+	if 'EncodedIssuerLen' in d:
+		add('348=' + str(d['EncodedIssuerLen']))
+		n += 1
+	if 'EncodedIssuer' in d:
+		add('349=' + str(d['EncodedIssuer']))
+		n += 1
+	if 'SecurityDesc' in d:
+		add('107=' + str(d['SecurityDesc']))
+		n += 1
+	if 'EncodedSecurityDescLen' in d:
+		add('350=' + str(d['EncodedSecurityDescLen']))
+		n += 1
+	if 'EncodedSecurityDesc' in d:
+		add('351=' + str(d['EncodedSecurityDesc']))
+		n += 1
+	if 'Pool' in d:
+		add('691=' + str(d['Pool']))
+		n += 1
+	if 'ContractSettlMonth' in d:
+		add('667=' + str(d['ContractSettlMonth']))
+		n += 1
+	if 'CPProgram' in d:
+		add('875=' + str(d['CPProgram']))
+		n += 1
+	if 'CPRegType' in d:
+		add('876=' + str(d['CPRegType']))
+		n += 1
+	if 'NoEvents' in d:
+		grp = d['NoEvents']
+		add('864=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoEvents(entry, fixm)
+		n += 1
+	if 'DatedDate' in d:
+		add('873=' + str(d['DatedDate']))
+		n += 1
+	if 'InterestAccrualDate' in d:
+		add('874=' + str(d['InterestAccrualDate']))
+		n += 1
+	if 'Currency' in d:
+		add('15=' + str(d['Currency']))
+		n += 1
+	if 'NoLegs' in d:
+		grp = d['NoLegs']
+		add('555=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoLegs(entry, fixm)
+		n += 1
+	if 'NoUnderlyings' in d:
+		grp = d['NoUnderlyings']
+		add('711=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoUnderlyings(entry, fixm)
+		n += 1
+	if 'NoTradingSessions' in d:
+		grp = d['NoTradingSessions']
+		add('386=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoTradingSessions(entry, fixm)
+		n += 1
+	if 'TransactTime' in d:
+		add('60=' + str(d['TransactTime']))
+		n += 1
+	if 'NoPositions' in d:
+		grp = d['NoPositions']
+		add('702=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoPositions(entry, fixm)
+		n += 1
+	if 'AdjustmentType' in d:
+		add('718=' + str(d['AdjustmentType']))
+		n += 1
+	if 'ContraryInstructionIndicator' in d:
+		add('719=' + str(d['ContraryInstructionIndicator']))
+		n += 1
+	if 'PriorSpreadIndicator' in d:
+		add('720=' + str(d['PriorSpreadIndicator']))
+		n += 1
+	if 'ThresholdAmount' in d:
+		add('834=' + str(d['ThresholdAmount']))
+		n += 1
+	if 'Text' in d:
+		add('58=' + str(d['Text']))
+		n += 1
+	if 'EncodedTextLen' in d:
+		add('354=' + str(d['EncodedTextLen']))
+		n += 1
+	if 'EncodedText' in d:
+		add('355=' + str(d['EncodedText']))
+		n += 1
+	if len(d) > n:
+		_make_mbody(obj, obj._context, fixm, _msg_PositionMaintenanceRequest_names)
+	return fixm
+
+def _decode_PositionMaintenanceRequest(obj, fields, index, context):
+	d = obj.__dict__
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _msg_PositionMaintenanceRequest_tags.get(num)
+		if spec is None:
+			# not a field of this message, continue with generic decoder
+			body, index = _extract_body(fields, index, context, obj)
+			return index
+		name, pytype, decode_grp = spec
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	return index
 
 class PositionMaintenanceRequest(FixObject):
-	pass
+	_encode = staticmethod(_encode_PositionMaintenanceRequest)
+	_decode = staticmethod(_decode_PositionMaintenanceRequest)
+
+_msg_PositionReport_names = frozenset(['PosMaintRptID', 'PosReqID', 'PosReqType', 'SubscriptionRequestType', 'TotalNumPosReports', 'UnsolicitedIndicator', 'PosReqResult', 'ClearingBusinessDate', 'SettlSessID', 'SettlSessSubID', 'NoPartyIDs', 'Account', 'AcctIDSource', 'AccountType', 'Symbol', 'SymbolSfx', 'SecurityID', 'SecurityIDSource', 'NoSecurityAltID', 'Product', 'CFICode', 'SecurityType', 'SecuritySubType', 'MaturityMonthYear', 'MaturityDate', 'CouponPaymentDate', 'IssueDate', 'RepoCollateralSecurityType', 'RepurchaseTerm', 'RepurchaseRate', 'Factor', 'CreditRating', 'InstrRegistry', 'CountryOfIssue', 'StateOrProvinceOfIssue', 'LocaleOfIssue', 'RedemptionDate', 'StrikePrice', 'StrikeCurrency', 'OptAttribute', 'ContractMultiplier', 'CouponRate', 'SecurityExchange', 'Issuer', 'EncodedIssuerLen', 'EncodedIssuer', 'SecurityDesc', 'EncodedSecurityDescLen', 'EncodedSecurityDesc', 'Pool', 'ContractSettlMonth', 'CPProgram', 'CPRegType', 'NoEvents', 'DatedDate', 'InterestAccrualDate', 'Currency', 'SettlPrice', 'SettlPriceType', 'PriorSettlPrice', 'NoLegs', 'NoUnderlyings', 'NoPositions', 'NoPosAmt', 'RegistStatus', 'DeliveryDate', 'Text', 'EncodedTextLen', 'EncodedText'])
+
+_msg_PositionReport_tags = {
+	721: ('PosMaintRptID', str, None),
+	710: ('PosReqID', str, None),
+	724: ('PosReqType', int, None),
+	263: ('SubscriptionRequestType', str, None),
+	727: ('TotalNumPosReports', int, None),
+	325: ('UnsolicitedIndicator', str, None),
+	728: ('PosReqResult', int, None),
+	715: ('ClearingBusinessDate', str, None),
+	716: ('SettlSessID', str, None),
+	717: ('SettlSessSubID', str, None),
+	453: ('NoPartyIDs', int, _decode_grp_NoPartyIDs),
+	1: ('Account', str, None),
+	660: ('AcctIDSource', int, None),
+	581: ('AccountType', int, None),
+	55: ('Symbol', str, None),
+	65: ('SymbolSfx', str, None),
+	48: ('SecurityID', str, None),
+	22: ('SecurityIDSource', str, None),
+	454: ('NoSecurityAltID', int, _decode_grp_NoSecurityAltID),
+	460: ('Product', int, None),
+	461: ('CFICode', str, None),
+	167: ('SecurityType', str, None),
+	762: ('SecuritySubType', str, None),
+	200: ('MaturityMonthYear', str, None),
+	541: ('MaturityDate', str, None),
+	224: ('CouponPaymentDate', str, None),
+	225: ('IssueDate', str, None),
+	239: ('RepoCollateralSecurityType', int, None),
+	226: ('RepurchaseTerm', int, None),
+	227: ('RepurchaseRate', float, None),
+	228: ('Factor', float, None),
+	255: ('CreditRating', str, None),
+	543: ('InstrRegistry', str, None),
+	470: ('CountryOfIssue', str, None),
+	471: ('StateOrProvinceOfIssue', str, None),
+	472: ('LocaleOfIssue', str, None),
+	240: ('RedemptionDate', str, None),
+	202: ('StrikePrice', float, None),
+	947: ('StrikeCurrency', str, None),
+	206: ('OptAttribute', str, None),
+	231: ('ContractMultiplier', float, None),
+	223: ('CouponRate', float, None),
+	207: ('SecurityExchange', str, None),
+	106: ('Issuer', str, None),
+	348: ('EncodedIssuerLen', str, None),
+	349: ('EncodedIssuer', str, None),
+	107: ('SecurityDesc', str, None),
+	350: ('EncodedSecurityDescLen', str, None),
+	351: ('EncodedSecurityDesc', str, None),
+	691: ('Pool', str, None),
+	667: ('ContractSettlMonth', str, None),
+	875: ('CPProgram', int, None),
+	876: ('CPRegType', str, None),
+	864: ('NoEvents', int, _decode_grp_NoEvents),
+	873: ('DatedDate', str, None),
+	874: ('InterestAccrualDate', str, None),
+	15: ('Currency', str, None),
+	730: ('SettlPrice', float, None),
+	731: ('SettlPriceType', int, None),
+	734: ('PriorSettlPrice', float, None),
+	555: ('NoLegs', int, _decode_grp_NoLegs),
+	711: ('NoUnderlyings', int, _decode_grp_NoUnderlyings),
+	702: ('NoPositions', int, _decode_grp_NoPositions),
+	753: ('NoPosAmt', int, _decode_grp_NoPosAmt),
+	506: ('RegistStatus', str, None),
+	743: ('DeliveryDate', str, None),
+	58: ('Text', str, None),
+	354: ('EncodedTextLen', str, None),
+	355: ('EncodedText', str, None),
+}
+
+def _encode_PositionReport(obj, fixm):
+	d = obj.__dict__
+	add = fixm.append
+	n = 1
+	if 'PosMaintRptID' in d:
+		add('721=' + str(d['PosMaintRptID']))
+		n += 1
+	if 'PosReqID' in d:
+		add('710=' + str(d['PosReqID']))
+		n += 1
+	if 'PosReqType' in d:
+		add('724=' + str(d['PosReqType']))
+		n += 1
+	if 'SubscriptionRequestType' in d:
+		add('263=' + str(d['SubscriptionRequestType']))
+		n += 1
+	if 'TotalNumPosReports' in d:
+		add('727=' + str(d['TotalNumPosReports']))
+		n += 1
+	if 'UnsolicitedIndicator' in d:
+		add('325=' + str(d['UnsolicitedIndicator']))
+		n += 1
+	if 'PosReqResult' in d:
+		add('728=' + str(d['PosReqResult']))
+		n += 1
+	if 'ClearingBusinessDate' in d:
+		add('715=' + str(d['ClearingBusinessDate']))
+		n += 1
+	if 'SettlSessID' in d:
+		add('716=' + str(d['SettlSessID']))
+		n += 1
+	if 'SettlSessSubID' in d:
+		add('717=' + str(d['SettlSessSubID']))
+		n += 1
+	if 'NoPartyIDs' in d:
+		grp = d['NoPartyIDs']
+		add('453=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoPartyIDs(entry, fixm)
+		n += 1
+	if 'Account' in d:
+		add('1=' + str(d['Account']))
+		n += 1
+	if 'AcctIDSource' in d:
+		add('660=' + str(d['AcctIDSource']))
+		n += 1
+	if 'AccountType' in d:
+		add('581=' + str(d['AccountType']))
+		n += 1
+	if 'Symbol' in d:
+		add('55=' + str(d['Symbol']))
+		n += 1
+	if 'SymbolSfx' in d:
+		add('65=' + str(d['SymbolSfx']))
+		n += 1
+	if 'SecurityID' in d:
+		add('48=' + str(d['SecurityID']))
+		n += 1
+	if 'SecurityIDSource' in d:
+		add('22=' + str(d['SecurityIDSource']))
+		n += 1
+	if 'NoSecurityAltID' in d:
+		grp = d['NoSecurityAltID']
+		add('454=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoSecurityAltID(entry, fixm)
+		n += 1
+	if 'Product' in d:
+		add('460=' + str(d['Product']))
+		n += 1
+	if 'CFICode' in d:
+		add('461=' + str(d['CFICode']))
+		n += 1
+	if 'SecurityType' in d:
+		add('167=' + str(d['SecurityType']))
+		n += 1
+	if 'SecuritySubType' in d:
+		add('762=' + str(d['SecuritySubType']))
+		n += 1
+	if 'MaturityMonthYear' in d:
+		add('200=' + str(d['MaturityMonthYear']))
+		n += 1
+	if 'MaturityDate' in d:
+		add('541=' + str(d['MaturityDate']))
+		n += 1
+	if 'CouponPaymentDate' in d:
+		add('224=' + str(d['CouponPaymentDate']))
+		n += 1
+	if 'IssueDate' in d:
+		add('225=' + str(d['IssueDate']))
+		n += 1
+	if 'RepoCollateralSecurityType' in d:
+		add('239=' + str(d['RepoCollateralSecurityType']))
+		n += 1
+	if 'RepurchaseTerm' in d:
+		add('226=' + str(d['RepurchaseTerm']))
+		n += 1
+	if 'RepurchaseRate' in d:
+		add('227=' + str(d['RepurchaseRate']))
+		n += 1
+	if 'Factor' in d:
+		add('228=' + str(d['Factor']))
+		n += 1
+	if 'CreditRating' in d:
+		add('255=' + str(d['CreditRating']))
+		n += 1
+	if 'InstrRegistry' in d:
+		add('543=' + str(d['InstrRegistry']))
+		n += 1
+	if 'CountryOfIssue' in d:
+		add('470=' + str(d['CountryOfIssue']))
+		n += 1
+	if 'StateOrProvinceOfIssue' in d:
+		add('471=' + str(d['StateOrProvinceOfIssue']))
+		n += 1
+	if 'LocaleOfIssue' in d:
+		add('472=' + str(d['LocaleOfIssue']))
+		n += 1
+	if 'RedemptionDate' in d:
+		add('240=' + str(d['RedemptionDate']))
+		n += 1
+	if 'StrikePrice' in d:
+		add('202=' + str(d['StrikePrice']))
+		n += 1
+	if 'StrikeCurrency' in d:
+		add('947=' + str(d['StrikeCurrency']))
+		n += 1
+	if 'OptAttribute' in d:
+		add('206=' + str(d['OptAttribute']))
+		n += 1
+	if 'ContractMultiplier' in d:
+		add('231=' + str(d['ContractMultiplier']))
+		n += 1
+	if 'CouponRate' in d:
+		add('223=' + str(d['CouponRate']))
+		n += 1
+	if 'SecurityExchange' in d:
+		add('207=' + str(d['SecurityExchange']))
+		n += 1
+	if 'Issuer' in d:
+		add('106=' + str(d['Issuer']))
+		n += 1
+	if 'EncodedIssuerLen' in d:
+		add('348=' + str(d['EncodedIssuerLen']))
+		n += 1
+	if 'EncodedIssuer' in d:
+		add('349=' + str(d['EncodedIssuer']))
+		n += 1
+	if 'SecurityDesc' in d:
+		add('107=' + str(d['SecurityDesc']))
+		n += 1
+	if 'EncodedSecurityDescLen' in d:
+		add('350=' + str(d['EncodedSecurityDescLen']))
+		n += 1
+	if 'EncodedSecurityDesc' in d:
+		add('351=' + str(d['EncodedSecurityDesc']))
+		n += 1
+	if 'Pool' in d:
+		add('691=' + str(d['Pool']))
+		n += 1
+	if 'ContractSettlMonth' in d:
+		add('667=' + str(d['ContractSettlMonth']))
+		n += 1
+	if 'CPProgram' in d:
+		add('875=' + str(d['CPProgram']))
+		n += 1
+	if 'CPRegType' in d:
+		add('876=' + str(d['CPRegType']))
+		n += 1
+	if 'NoEvents' in d:
+		grp = d['NoEvents']
+		add('864=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoEvents(entry, fixm)
+		n += 1
+	if 'DatedDate' in d:
+		add('873=' + str(d['DatedDate']))
+		n += 1
+	if 'InterestAccrualDate' in d:
+		add('874=' + str(d['InterestAccrualDate']))
+		n += 1
+	if 'Currency' in d:
+		add('15=' + str(d['Currency']))
+		n += 1
+	if 'SettlPrice' in d:
+		add('730=' + str(d['SettlPrice']))
+		n += 1
+	if 'SettlPriceType' in d:
+		add('731=' + str(d['SettlPriceType']))
+		n += 1
+	if 'PriorSettlPrice' in d:
+		add('734=' + str(d['PriorSettlPrice']))
+		n += 1
+	if 'NoLegs' in d:
+		grp = d['NoLegs']
+		add('555=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoLegs(entry, fixm)
+		n += 1
+	if 'NoUnderlyings' in d:
+		grp = d['NoUnderlyings']
+		add('711=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoUnderlyings(entry, fixm)
+		n += 1
+	if 'NoPositions' in d:
+		grp = d['NoPositions']
+		add('702=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoPositions(entry, fixm)
+		n += 1
+	if 'NoPosAmt' in d:
+		grp = d['NoPosAmt']
+		add('753=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoPosAmt(entry, fixm)
+		n += 1
+	if 'RegistStatus' in d:
+		add('506=' + str(d['RegistStatus']))
+		n += 1
+	if 'DeliveryDate' in d:
+		add('743=' + str(d['DeliveryDate']))
+		n += 1
+	if 'Text' in d:
+		add('58=' + str(d['Text']))
+		n += 1
+	if 'EncodedTextLen' in d:
+		add('354=' + str(d['EncodedTextLen']))
+		n += 1
+	if 'EncodedText' in d:
+		add('355=' + str(d['EncodedText']))
+		n += 1
+	if len(d) > n:
+		_make_mbody(obj, obj._context, fixm, _msg_PositionReport_names)
+	return fixm
+
+def _decode_PositionReport(obj, fields, index, context):
+	d = obj.__dict__
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _msg_PositionReport_tags.get(num)
+		if spec is None:
+			# not a field of this message, continue with generic decoder
+			body, index = _extract_body(fields, index, context, obj)
+			return index
+		name, pytype, decode_grp = spec
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	return index
 
 class PositionReport(FixObject):
-	pass
+	_encode = staticmethod(_encode_PositionReport)
+	_decode = staticmethod(_decode_PositionReport)
+
+_msg_Quote_names = frozenset(['QuoteReqID', 'QuoteID', 'QuoteRespID', 'QuoteType', 'NoQuoteQualifiers', 'QuoteResponseLevel', 'NoPartyIDs', 'TradingSessionID', 'TradingSessionSubID', 'Symbol', 'SymbolSfx', 'SecurityID', 'SecurityIDSource', 'NoSecurityAltID', 'Product', 'CFICode', 'SecurityType', 'SecuritySubType', 'MaturityMonthYear', 'MaturityDate', 'CouponPaymentDate', 'IssueDate', 'RepoCollateralSecurityType', 'RepurchaseTerm', 'RepurchaseRate', 'Factor', 'CreditRating', 'InstrRegistry', 'CountryOfIssue', 'StateOrProvinceOfIssue', 'LocaleOfIssue', 'RedemptionDate', 'StrikePrice', 'StrikeCurrency', 'OptAttribute', 'ContractMultiplier', 'CouponRate', 'SecurityExchange', 'Issuer', 'EncodedIssuerLen', 'EncodedIssuer', 'SecurityDesc', 'EncodedSecurityDescLen', 'EncodedSecurityDesc', 'Pool', 'ContractSettlMonth', 'CPProgram', 'CPRegType', 'NoEvents', 'DatedDate', 'InterestAccrualDate', 'AgreementDesc', 'AgreementID', 'AgreementDate', 'AgreementCurrency', 'TerminationType', 'StartDate', 'EndDate', 'DeliveryType', 'MarginRatio', 'NoUnderlyings', 'Side', 'OrderQty', 'CashOrderQty', 'OrderPercent', 'RoundingDirection', 'RoundingModulus', 'SettlType', 'SettlDate', 'SettlDate2', 'OrderQty2', 'Currency', 'NoStipulations', 'Account', 'AcctIDSource', 'AccountType', 'NoLegs', 'BidPx', 'OfferPx', 'MktBidPx', 'MktOfferPx', 'MinBidSize', 'BidSize', 'MinOfferSize', 'OfferSize', 'ValidUntilTime', 'BidSpotRate', 'OfferSpotRate', 'BidForwardPoints', 'OfferForwardPoints', 'MidPx', 'BidYield', 'MidYield', 'OfferYield', 'TransactTime', 'OrdType', 'BidForwardPoints2', 'OfferForwardPoints2', 'SettlCurrBidFxRate', 'SettlCurrOfferFxRate', 'SettlCurrFxRateCalc', 'CommType', 'Commission', 'CustOrderCapacity', 'ExDestination', 'OrderCapacity', 'PriceType', 'Spread', 'BenchmarkCurveCurrency', 'BenchmarkCurveName', 'BenchmarkCurvePoint', 'BenchmarkPrice', 'BenchmarkPriceType', 'BenchmarkSecurityID', 'BenchmarkSecurityIDSource', 'YieldType', 'Yield', 'YieldCalcDate', 'YieldRedemptionDate', 'YieldRedemptionPrice', 'YieldRedemptionPriceType', 'Text', 'EncodedTextLen', 'EncodedText'])
+
+_msg_Quote_tags = {
+	131: ('QuoteReqID', str, None),
+	117: ('QuoteID', str, None),
+	693: ('QuoteRespID', str, None),
+	537: ('QuoteType', int, None),
+	735: ('NoQuoteQualifiers', int, _decode_grp_NoQuoteQualifiers),
+	301: ('QuoteResponseLevel', int, None),
+	453: ('NoPartyIDs', int, _decode_grp_NoPartyIDs),
+	336: ('TradingSessionID', str, None),
+	625: ('TradingSessionSubID', str, None),
+	55: ('Symbol', str, None),
+	65: ('SymbolSfx', str, None),
+	48: ('SecurityID', str, None),
+	22: ('SecurityIDSource', str, None),
+	454: ('NoSecurityAltID', int, _decode_grp_NoSecurityAltID),
+	460: ('Product', int, None),
+	461: ('CFICode', str, None),
+	167: ('SecurityType', str, None),
+	762: ('SecuritySubType', str, None),
+	200: ('MaturityMonthYear', str, None),
+	541: ('MaturityDate', str, None),
+	224: ('CouponPaymentDate', str, None),
+	225: ('IssueDate', str, None),
+	239: ('RepoCollateralSecurityType', int, None),
+	226: ('RepurchaseTerm', int, None),
+	227: ('RepurchaseRate', float, None),
+	228: ('Factor', float, None),
+	255: ('CreditRating', str, None),
+	543: ('InstrRegistry', str, None),
+	470: ('CountryOfIssue', str, None),
+	471: ('StateOrProvinceOfIssue', str, None),
+	472: ('LocaleOfIssue', str, None),
+	240: ('RedemptionDate', str, None),
+	202: ('StrikePrice', float, None),
+	947: ('StrikeCurrency', str, None),
+	206: ('OptAttribute', str, None),
+	231: ('ContractMultiplier', float, None),
+	223: ('CouponRate', float, None),
+	207: ('SecurityExchange', str, None),
+	106: ('Issuer', str, None),
+	348: ('EncodedIssuerLen', str, None),
+	349: ('EncodedIssuer', str, None),
+	107: ('SecurityDesc', str, None),
+	350: ('EncodedSecurityDescLen', str, None),
+	351: ('EncodedSecurityDesc', str, None),
+	691: ('Pool', str, None),
+	667: ('ContractSettlMonth', str, None),
+	875: ('CPProgram', int, None),
+	876: ('CPRegType', str, None),
+	864: ('NoEvents', int, _decode_grp_NoEvents),
+	873: ('DatedDate', str, None),
+	874: ('InterestAccrualDate', str, None),
+	913: ('AgreementDesc', str, None),
+	914: ('AgreementID', str, None),
+	915: ('AgreementDate', str, None),
+	918: ('AgreementCurrency', str, None),
+	788: ('TerminationType', int, None),
+	916: ('StartDate', str, None),
+	917: ('EndDate', str, None),
+	919: ('DeliveryType', int, None),
+	898: ('MarginRatio', float, None),
+	711: ('NoUnderlyings', int, _decode_grp_NoUnderlyings),
+	54: ('Side', str, None),
+	38: ('OrderQty', float, None),
+	152: ('CashOrderQty', float, None),
+	516: ('OrderPercent', float, None),
+	468: ('RoundingDirection', str, None),
+	469: ('RoundingModulus', float, None),
+	63: ('SettlType', str, None),
+	64: ('SettlDate', str, None),
+	193: ('SettlDate2', str, None),
+	192: ('OrderQty2', float, None),
+	15: ('Currency', str, None),
+	232: ('NoStipulations', int, _decode_grp_NoStipulations),
+	1: ('Account', str, None),
+	660: ('AcctIDSource', int, None),
+	581: ('AccountType', int, None),
+	555: ('NoLegs', int, _decode_grp_NoLegs),
+	132: ('BidPx', float, None),
+	133: ('OfferPx', float, None),
+	645: ('MktBidPx', float, None),
+	646: ('MktOfferPx', float, None),
+	647: ('MinBidSize', float, None),
+	134: ('BidSize', float, None),
+	648: ('MinOfferSize', float, None),
+	135: ('OfferSize', float, None),
+	62: ('ValidUntilTime', str, None),
+	188: ('BidSpotRate', float, None),
+	190: ('OfferSpotRate', float, None),
+	189: ('BidForwardPoints', float, None),
+	191: ('OfferForwardPoints', float, None),
+	631: ('MidPx', float, None),
+	632: ('BidYield', float, None),
+	633: ('MidYield', float, None),
+	634: ('OfferYield', float, None),
+	60: ('TransactTime', str, None),
+	40: ('OrdType', str, None),
+	642: ('BidForwardPoints2', float, None),
+	643: ('OfferForwardPoints2', float, None),
+	656: ('SettlCurrBidFxRate', float, None),
+	657: ('SettlCurrOfferFxRate', float, None),
+	156: ('SettlCurrFxRateCalc', str, None),
+	13: ('CommType', str, None),
+	12: ('Commission', float, None),
+	582: ('CustOrderCapacity', int, None),
+	100: ('ExDestination', str, None),
+	528: ('OrderCapacity', str, None),
+	423: ('PriceType', int, None),
+	218: ('Spread', float, None),
+	220: ('BenchmarkCurveCurrency', str, None),
+	221: ('BenchmarkCurveName', str, None),
+	222: ('BenchmarkCurvePoint', str, None),
+	662: ('BenchmarkPrice', float, None),
+	663: ('BenchmarkPriceType', int, None),
+	699: ('BenchmarkSecurityID', str, None),
+	761: ('BenchmarkSecurityIDSource', str, None),
+	235: ('YieldType', str, None),
+	236: ('Yield', float, None),
+	701: ('YieldCalcDate', str, None),
+	696: ('YieldRedemptionDate', str, None),
+	697: ('YieldRedemptionPrice', float, None),
+	698: ('YieldRedemptionPriceType', int, None),
+	58: ('Text', str, None),
+	354: ('EncodedTextLen', str, None),
+	355: ('EncodedText', str, None),
+}
+
+def _encode_Quote(obj, fixm):
+	d = obj.__dict__
+	add = fixm.append
+	n = 1
+	if 'QuoteReqID' in d:
+		add('131=' + str(d['QuoteReqID']))
+		n += 1
+	if 'QuoteID' in d:
+		add('117=' + str(d['QuoteID']))
+		n += 1
+	if 'QuoteRespID' in d:
+		add('693=' + str(d['QuoteRespID']))
+		n += 1
+	if 'QuoteType' in d:
+		add('537=' + str(d['QuoteType']))
+		n += 1
+	if 'NoQuoteQualifiers' in d:
+		grp = d['NoQuoteQualifiers']
+		add('735=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoQuoteQualifiers(entry, fixm)
+		n += 1
+	if 'QuoteResponseLevel' in d:
+		add('301=' + str(d['QuoteResponseLevel']))
+		n += 1
+	if 'NoPartyIDs' in d:
+		grp = d['NoPartyIDs']
+		add('453=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoPartyIDs(entry, fixm)
+		n += 1
+	if 'TradingSessionID' in d:
+		add('336=' + str(d['TradingSessionID']))
+		n += 1
+	if 'TradingSessionSubID' in d:
+		add('625=' + str(d['TradingSessionSubID']))
+		n += 1
+	if 'Symbol' in d:
+		add('55=' + str(d['Symbol']))
+		n += 1
+	if 'SymbolSfx' in d:
+		add('65=' + str(d['SymbolSfx']))
+		n += 1
+	if 'SecurityID' in d:
+		add('48=' + str(d['SecurityID']))
+		n += 1
+	if 'SecurityIDSource' in d:
+		add('22=' + str(d['SecurityIDSource']))
+		n += 1
+	if 'NoSecurityAltID' in d:
+		grp = d['NoSecurityAltID']
+		add('454=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoSecurityAltID(entry, fixm)
+		n += 1
+	if 'Product' in d:
+		add('460=' + str(d['Product']))
+		n += 1
+	if 'CFICode' in d:
+		add('461=' + str(d['CFICode']))
+		n += 1
+	if 'SecurityType' in d:
+		add('167=' + str(d['SecurityType']))
+		n += 1
+	if 'SecuritySubType' in d:
+		add('762=' + str(d['SecuritySubType']))
+		n += 1
+	if 'MaturityMonthYear' in d:
+		add('200=' + str(d['MaturityMonthYear']))
+		n += 1
+	if 'MaturityDate' in d:
+		add('541=' + str(d['MaturityDate']))
+		n += 1
+	if 'CouponPaymentDate' in d:
+		add('224=' + str(d['CouponPaymentDate']))
+		n += 1
+	if 'IssueDate' in d:
+		add('225=' + str(d['IssueDate']))
+		n += 1
+	if 'RepoCollateralSecurityType' in d:
+		add('239=' + str(d['RepoCollateralSecurityType']))
+		n += 1
+	if 'RepurchaseTerm' in d:
+		add('226=' + str(d['RepurchaseTerm']))
+		n += 1
+	if 'RepurchaseRate' in d:
+		add('227=' + str(d['RepurchaseRate']))
+		n += 1
+	if 'Factor' in d:
+		add('228=' + str(d['Factor']))
+		n += 1
+	if 'CreditRating' in d:
+		add('255=' + str(d['CreditRating']))
+		n += 1
+	if 'InstrRegistry' in d:
+		add('543=' + str(d['InstrRegistry']))
+		n += 1
+	if 'CountryOfIssue' in d:
+		add('470=' + str(d['CountryOfIssue']))
+		n += 1
+	if 'StateOrProvinceOfIssue' in d:
+		add('471=' + str(d['StateOrProvinceOfIssue']))
+		n += 1
+	if 'LocaleOfIssue' in d:
+		add('472=' + str(d['LocaleOfIssue']))
+		n += 1
+	if 'RedemptionDate' in d:
+		add('240=' + str(d['RedemptionDate']))
+		n += 1
+	if 'StrikePrice' in d:
+		add('202=' + str(d['StrikePrice']))
+		n += 1
+	if 'StrikeCurrency' in d:
+		add('947=' + str(d['StrikeCurrency']))
+		n += 1
+	if 'OptAttribute' in d:
+		add('206=' + str(d['OptAttribute']))
+		n += 1
+	if 'ContractMultiplier' in d:
+		add('231=' + str(d['ContractMultiplier']))
+		n += 1
+	if 'CouponRate' in d:
+		add('223=' + str(d['CouponRate']))
+		n += 1
+	if 'SecurityExchange' in d:
+		add('207=' + str(d['SecurityExchange']))
+		n += 1
+	if 'Issuer' in d:
+		add('106=' + str(d['Issuer']))
+		n += 1
+	if 'EncodedIssuerLen' in d:
+		add('348=' + str(d['EncodedIssuerLen']))
+		n += 1
+	if 'EncodedIssuer' in d:
+		add('349=' + str(d['EncodedIssuer']))
+		n += 1
+	if 'SecurityDesc' in d:
+		add('107=' + str(d['SecurityDesc']))
+		n += 1
+	if 'EncodedSecurityDescLen' in d:
+		add('350=' + str(d['EncodedSecurityDescLen']))
+		n += 1
+	if 'EncodedSecurityDesc' in d:
+		add('351=' + str(d['EncodedSecurityDesc']))
+		n += 1
+	if 'Pool' in d:
+		add('691=' + str(d['Pool']))
+		n += 1
+	if 'ContractSettlMonth' in d:
+		add('667=' + str(d['ContractSettlMonth']))
+		n += 1
+	if 'CPProgram' in d:
+		add('875=' + str(d['CPProgram']))
+		n += 1
+	if 'CPRegType' in d:
+		add('876=' + str(d['CPRegType']))
+		n += 1
+	if 'NoEvents' in d:
+		grp = d['NoEvents']
+		add('864=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoEvents(entry, fixm)
+		n += 1
+	if 'DatedDate' in d:
+		add('873=' + str(d['DatedDate']))
+		n += 1
+	if 'InterestAccrualDate' in d:
+		add('874=' + str(d['InterestAccrualDate']))
+		n += 1
+	if 'AgreementDesc' in d:
+		add('913=' + str(d['AgreementDesc']))
+		n += 1
+	if 'AgreementID' in d:
+		add('914=' + str(d['AgreementID']))
+		n += 1
+	if 'AgreementDate' in d:
+		add('915=' + str(d['AgreementDate']))
+		n += 1
+	if 'AgreementCurrency' in d:
+		add('918=' + str(d['AgreementCurrency']))
+		n += 1
+	if 'TerminationType' in d:
+		add('788=' + str(d['TerminationType']))
+		n += 1
+	if 'StartDate' in d:
+		add('916=' + str(d['StartDate']))
+		n += 1
+	if 'EndDate' in d:
+		add('917=' + str(d['EndDate']))
+		n += 1
+	if 'DeliveryType' in d:
+		add('919=' + str(d['DeliveryType']))
+		n += 1
+	if 'MarginRatio' in d:
+		add('898=' + str(d['MarginRatio']))
+		n += 1
+	if 'NoUnderlyings' in d:
+		grp = d['NoUnderlyings']
+		add('711=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoUnderlyings(entry, fixm)
+		n += 1
+	if 'Side' in d:
+		add('54=' + str(d['Side']))
+		n += 1
+	if 'OrderQty' in d:
+		add('38=' + str(d['OrderQty']))
+		n += 1
+	if 'CashOrderQty' in d:
+		add('152=' + str(d['CashOrderQty']))
+		n += 1
+	if 'OrderPercent' in d:
+		add('516=' + str(d['OrderPercent']))
+		n += 1
+	if 'RoundingDirection' in d:
+		add('468=' + str(d['RoundingDirection']))
+		n += 1
+	if 'RoundingModulus' in d:
+		add('469=' + str(d['RoundingModulus']))
+		n += 1
+	if 'SettlType' in d:
+		add('63=' + str(d['SettlType']))
+		n += 1
+	if 'SettlDate' in d:
+		add('64=' + str(d['SettlDate']))
+		n += 1
+	if 'SettlDate2' in d:
+		add('193=' + str(d['SettlDate2']))
+		n += 1
+	if 'OrderQty2' in d:
+		add('192=' + str(d['OrderQty2']))
+		n += 1
+	if 'Currency' in d:
+		add('15=' + str(d['Currency']))
+		n += 1
+	if 'NoStipulations' in d:
+		grp = d['NoStipulations']
+		add('232=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoStipulations(entry, fixm)
+		n += 1
+	if 'Account' in d:
+		add('1=' + str(d['Account']))
+		n += 1
+	if 'AcctIDSource' in d:
+		add('660=' + str(d['AcctIDSource']))
+		n += 1
+	if 'AccountType' in d:
+		add('581=' + str(d['AccountType']))
+		n += 1
+	if 'NoLegs' in d:
+		grp = d['NoLegs']
+		add('555=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoLegs(entry, fixm)
+		n += 1
+	if 'BidPx' in d:
+		add('132=' + str(d['BidPx']))
+		n += 1
+	if 'OfferPx' in d:
+		add('133=' + str(d['OfferPx']))
+		n += 1
+	if 'MktBidPx' in d:
+		add('645=' + str(d['MktBidPx']))
+		n += 1
+	if 'MktOfferPx' in d:
+		add('646=' + str(d['MktOfferPx']))
+		n += 1
+	if 'MinBidSize' in d:
+		add('647=' + str(d['MinBidSize']))
+		n += 1
+	if 'BidSize' in d:
+		add('134=' + str(d['BidSize']))
+		n += 1
+	if 'MinOfferSize' in d:
+		add('648=' + str(d['MinOfferSize']))
+		n += 1
+	if 'OfferSize' in d:
+		add('135=' + str(d['OfferSize']))
+		n += 1
+	if 'ValidUntilTime' in d:
+		add('62=' + str(d['ValidUntilTime']))
+		n += 1
+	if 'BidSpotRate' in d:
+		add('188=' + str(d['BidSpotRate']))
+		n += 1
+	if 'OfferSpotRate' in d:
+		add('190=' + str(d['OfferSpotRate']))
+		n += 1
+	if 'BidForwardPoints' in d:
+		add('189=' + str(d['BidForwardPoints']))
+		n += 1
+	if 'OfferForwardPoints' in d:
+		add('191=' + str(d['OfferForwardPoints']))
+		n += 1
+	if 'MidPx' in d:
+		add('631=' + str(d['MidPx']))
+		n += 1
+	if 'BidYield' in d:
+		add('632=' + str(d['BidYield']))
+		n += 1
+	if 'MidYield' in d:
+		add('633=' + str(d['MidYield']))
+		n += 1
+	if 'OfferYield' in d:
+		add('634=' + str(d['OfferYield']))
+		n += 1
+	if 'TransactTime' in d:
+		add('60=' + str(d['TransactTime']))
+		n += 1
+	if 'OrdType' in d:
+		add('40=' + str(d['OrdType']))
+		n += 1
+	if 'BidForwardPoints2' in d:
+		add('642=' + str(d['BidForwardPoints2']))
+		n += 1
+	if 'OfferForwardPoints2' in d:
+		add('643=' + str(d['OfferForwardPoints2']))
+		n += 1
+	if 'SettlCurrBidFxRate' in d:
+		add('656=' + str(d['SettlCurrBidFxRate']))
+		n += 1
+	if 'SettlCurrOfferFxRate' in d:
+		add('657=' + str(d['SettlCurrOfferFxRate']))
+		n += 1
+	if 'SettlCurrFxRateCalc' in d:
+		add('156=' + str(d['SettlCurrFxRateCalc']))
+		n += 1
+	if 'CommType' in d:
+		add('13=' + str(d['CommType']))
+		n += 1
+	if 'Commission' in d:
+		add('12=' + str(d['Commission']))
+		n += 1
+	if 'CustOrderCapacity' in d:
+		add('582=' + str(d['CustOrderCapacity']))
+		n += 1
+	if 'ExDestination' in d:
+		add('100=' + str(d['ExDestination']))
+		n += 1
+	if 'OrderCapacity' in d:
+		add('528=' + str(d['OrderCapacity']))
+		n += 1
+	if 'PriceType' in d:
+		add('423=' + str(d['PriceType']))
+		n += 1
+	if 'Spread' in d:
+		add('218=' + str(d['Spread']))
+		n += 1
+	if 'BenchmarkCurveCurrency' in d:
+		add('220=' + str(d['BenchmarkCurveCurrency']))
+		n += 1
+	if 'BenchmarkCurveName' in d:
+		add('221=' + str(d['BenchmarkCurveName']))
+		n += 1
+	if 'BenchmarkCurvePoint' in d:
+		add('222=' + str(d['BenchmarkCurvePoint']))
+		n += 1
+	if 'BenchmarkPrice' in d:
+		add('662=' + str(d['BenchmarkPrice']))
+		n += 1
+	if 'BenchmarkPriceType' in d:
+		add('663=' + str(d['BenchmarkPriceType']))
+		n += 1
+	if 'BenchmarkSecurityID' in d:
+		add('699=' + str(d['BenchmarkSecurityID']))
+		n += 1
+	if 'BenchmarkSecurityIDSource' in d:
+		add('761=' + str(d['BenchmarkSecurityIDSource']))
+		n += 1
+	if 'YieldType' in d:
+		add('235=' + str(d['YieldType']))
+		n += 1
+	if 'Yield' in d:
+		add('236=' + str(d['Yield']))
+		n += 1
+	if 'YieldCalcDate' in d:
+		add('701=' + str(d['YieldCalcDate']))
+		n += 1
+	if 'YieldRedemptionDate' in d:
+		add('696=' + str(d['YieldRedemptionDate']))
+		n += 1
+	if 'YieldRedemptionPrice' in d:
+		add('697=' + str(d['YieldRedemptionPrice']))
+		n += 1
+	if 'YieldRedemptionPriceType' in d:
+		add('698=' + str(d['YieldRedemptionPriceType']))
+		n += 1
+	if 'Text' in d:
+		add('58=' + str(d['Text']))
+		n += 1
+	if 'EncodedTextLen' in d:
+		add('354=' + str(d['EncodedTextLen']))
+		n += 1
+	if 'EncodedText' in d:
+		add('355=' + str(d['EncodedText']))
+		n += 1
+	if len(d) > n:
+		_make_mbody(obj, obj._context, fixm, _msg_Quote_names)
+	return fixm
+
+def _decode_Quote(obj, fields, index, context):
+	d = obj.__dict__
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _msg_Quote_tags.get(num)
+		if spec is None:
+			# not a field of this message, continue with generic decoder
+			body, index = _extract_body(fields, index, context, obj)
+			return index
+		name, pytype, decode_grp = spec
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	return index
 
 class Quote(FixObject):
-	pass
+	_encode = staticmethod(_encode_Quote)
+	_decode = staticmethod(_decode_Quote)
+
+_msg_QuoteCancel_names = frozenset(['QuoteReqID', 'QuoteID', 'QuoteCancelType', 'QuoteResponseLevel', 'NoPartyIDs', 'Account', 'AcctIDSource', 'AccountType', 'TradingSessionID', 'TradingSessionSubID', 'NoQuoteEntries'])
+
+_msg_QuoteCancel_tags = {
+	131: ('QuoteReqID', str, None),
+	117: ('QuoteID', str, None),
+	298: ('QuoteCancelType', int, None),
+	301: ('QuoteResponseLevel', int, None),
+	453: ('NoPartyIDs', int, _decode_grp_NoPartyIDs),
+	1: ('Account', str, None),
+	660: ('AcctIDSource', int, None),
+	581: ('AccountType', int, None),
+	336: ('TradingSessionID', str, None),
+	625: ('TradingSessionSubID', str, None),
+	295: ('NoQuoteEntries', int, _decode_grp_NoQuoteEntries),
+}
+
+def _encode_QuoteCancel(obj, fixm):
+	d = obj.__dict__
+	add = fixm.append
+	n = 1
+	if 'QuoteReqID' in d:
+		add('131=' + str(d['QuoteReqID']))
+		n += 1
+	if 'QuoteID' in d:
+		add('117=' + str(d['QuoteID']))
+		n += 1
+	if 'QuoteCancelType' in d:
+		add('298=' + str(d['QuoteCancelType']))
+		n += 1
+	if 'QuoteResponseLevel' in d:
+		add('301=' + str(d['QuoteResponseLevel']))
+		n += 1
+	if 'NoPartyIDs' in d:
+		grp = d['NoPartyIDs']
+		add('453=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoPartyIDs(entry, fixm)
+		n += 1
+	if 'Account' in d:
+		add('1=' + str(d['Account']))
+		n += 1
+	if 'AcctIDSource' in d:
+		add('660=' + str(d['AcctIDSource']))
+		n += 1
+	if 'AccountType' in d:
+		add('581=' + str(d['AccountType']))
+		n += 1
+	if 'TradingSessionID' in d:
+		add('336=' + str(d['TradingSessionID']))
+		n += 1
+	if 'TradingSessionSubID' in d:
+		add('625=' + str(d['TradingSessionSubID']))
+		n += 1
+	if 'NoQuoteEntries' in d:
+		grp = d['NoQuoteEntries']
+		add('295=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoQuoteEntries(entry, fixm)
+		n += 1
+	if len(d) > n:
+		_make_mbody(obj, obj._context, fixm, _msg_QuoteCancel_names)
+	return fixm
+
+def _decode_QuoteCancel(obj, fields, index, context):
+	d = obj.__dict__
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _msg_QuoteCancel_tags.get(num)
+		if spec is None:
+			# not a field of this message, continue with generic decoder
+			body, index = _extract_body(fields, index, context, obj)
+			return index
+		name, pytype, decode_grp = spec
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	return index
 
 class QuoteCancel(FixObject):
-	pass
+	_encode = staticmethod(_encode_QuoteCancel)
+	_decode = staticmethod(_decode_QuoteCancel)
+
+_msg_QuoteRequest_names = frozenset(['QuoteReqID', 'RFQReqID', 'ClOrdID', 'OrderCapacity', 'NoRelatedSym', 'Text', 'EncodedTextLen', 'EncodedText'])
+
+_msg_QuoteRequest_tags = {
+	131: ('QuoteReqID', str, None),
+	644: ('RFQReqID', str, None),
+	11: ('ClOrdID', str, None),
+	528: ('OrderCapacity', str, None),
+	146: ('NoRelatedSym', int, _decode_grp_NoRelatedSym),
+	58: ('Text', str, None),
+	354: ('EncodedTextLen', str, None),
+	355: ('EncodedText', str, None),
+}
+
+def _encode_QuoteRequest(obj, fixm):
+	d = obj.__dict__
+	add = fixm.append
+	n = 1
+	if 'QuoteReqID' in d:
+		add('131=' + str(d['QuoteReqID']))
+		n += 1
+	if 'RFQReqID' in d:
+		add('644=' + str(d['RFQReqID']))
+		n += 1
+	if 'ClOrdID' in d:
+		add('11=' + str(d['ClOrdID']))
+		n += 1
+	if 'OrderCapacity' in d:
+		add('528=' + str(d['OrderCapacity']))
+		n += 1
+	if 'NoRelatedSym' in d:
+		grp = d['NoRelatedSym']
+		add('146=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoRelatedSym(entry, fixm)
+		n += 1
+	if 'Text' in d:
+		add('58=' + str(d['Text']))
+		n += 1
+	if 'EncodedTextLen' in d:
+		add('354=' + str(d['EncodedTextLen']))
+		n += 1
+	if 'EncodedText' in d:
+		add('355=' + str(d['EncodedText']))
+		n += 1
+	if len(d) > n:
+		_make_mbody(obj, obj._context, fixm, _msg_QuoteRequest_names)
+	return fixm
+
+def _decode_QuoteRequest(obj, fields, index, context):
+	d = obj.__dict__
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _msg_QuoteRequest_tags.get(num)
+		if spec is None:
+			# not a field of this message, continue with generic decoder
+			body, index = _extract_body(fields, index, context, obj)
+			return index
+		name, pytype, decode_grp = spec
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	return index
 
 class QuoteRequest(FixObject):
-	pass
+	_encode = staticmethod(_encode_QuoteRequest)
+	_decode = staticmethod(_decode_QuoteRequest)
+
+_msg_QuoteRequestReject_names = frozenset(['QuoteReqID', 'RFQReqID', 'QuoteRequestRejectReason', 'NoRelatedSym', 'NoQuoteQualifiers', 'QuotePriceType', 'OrdType', 'ExpireTime', 'TransactTime', 'Spread', 'BenchmarkCurveCurrency', 'BenchmarkCurveName', 'BenchmarkCurvePoint', 'BenchmarkPrice', 'BenchmarkPriceType', 'BenchmarkSecurityID', 'BenchmarkSecurityIDSource', 'PriceType', 'Price', 'Price2', 'YieldType', 'Yield', 'YieldCalcDate', 'YieldRedemptionDate', 'YieldRedemptionPrice', 'YieldRedemptionPriceType', 'NoPartyIDs', 'Text', 'EncodedTextLen', 'EncodedText'])
+
+_msg_QuoteRequestReject_tags = {
+	131: ('QuoteReqID', str, None),
+	644: ('RFQReqID', str, None),
+	658: ('QuoteRequestRejectReason', int, None),
+	146: ('NoRelatedSym', int, _decode_grp_NoRelatedSym),
+	735: ('NoQuoteQualifiers', int, _decode_grp_NoQuoteQualifiers),
+	692: ('QuotePriceType', int, None),
+	40: ('OrdType', str, None),
+	126: ('ExpireTime', str, None),
+	60: ('TransactTime', str, None),
+	218: ('Spread', float, None),
+	220: ('BenchmarkCurveCurrency', str, None),
+	221: ('BenchmarkCurveName', str, None),
+	222: ('BenchmarkCurvePoint', str, None),
+	662: ('BenchmarkPrice', float, None),
+	663: ('BenchmarkPriceType', int, None),
+	699: ('BenchmarkSecurityID', str, None),
+	761: ('BenchmarkSecurityIDSource', str, None),
+	423: ('PriceType', int, None),
+	44: ('Price', float, None),
+	640: ('Price2', float, None),
+	235: ('YieldType', str, None),
+	236: ('Yield', float, None),
+	701: ('YieldCalcDate', str, None),
+	696: ('YieldRedemptionDate', str, None),
+	697: ('YieldRedemptionPrice', float, None),
+	698: ('YieldRedemptionPriceType', int, None),
+	453: ('NoPartyIDs', int, _decode_grp_NoPartyIDs),
+	58: ('Text', str, None),
+	354: ('EncodedTextLen', str, None),
+	355: ('EncodedText', str, None),
+}
+
+def _encode_QuoteRequestReject(obj, fixm):
+	d = obj.__dict__
+	add = fixm.append
+	n = 1
+	if 'QuoteReqID' in d:
+		add('131=' + str(d['QuoteReqID']))
+		n += 1
+	if 'RFQReqID' in d:
+		add('644=' + str(d['RFQReqID']))
+		n += 1
+	if 'QuoteRequestRejectReason' in d:
+		add('658=' + str(d['QuoteRequestRejectReason']))
+		n += 1
+	if 'NoRelatedSym' in d:
+		grp = d['NoRelatedSym']
+		add('146=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoRelatedSym(entry, fixm)
+		n += 1
+	if 'NoQuoteQualifiers' in d:
+		grp = d['NoQuoteQualifiers']
+		add('735=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoQuoteQualifiers(entry, fixm)
+		n += 1
+	if 'QuotePriceType' in d:
+		add('692=' + str(d['QuotePriceType']))
+		n += 1
+	if 'OrdType' in d:
+		add('40=' + str(d['OrdType']))
+		n += 1
+	if 'ExpireTime' in d:
+		add('126=' + str(d['ExpireTime']))
+		n += 1
+	if 'TransactTime' in d:
+		add('60=' + str(d['TransactTime']))
+		n += 1
+	if 'Spread' in d:
+		add('218=' + str(d['Spread']))
+		n += 1
+	if 'BenchmarkCurveCurrency' in d:
+		add('220=' + str(d['BenchmarkCurveCurrency']))
+		n += 1
+	if 'BenchmarkCurveName' in d:
+		add('221=' + str(d['BenchmarkCurveName']))
+		n += 1
+	if 'BenchmarkCurvePoint' in d:
+		add('222=' + str(d['BenchmarkCurvePoint']))
+		n += 1
+	if 'BenchmarkPrice' in d:
+		add('662=' + str(d['BenchmarkPrice']))
+		n += 1
+	if 'BenchmarkPriceType' in d:
+		add('663=' + str(d['BenchmarkPriceType']))
+		n += 1
+	if 'BenchmarkSecurityID' in d:
+		add('699=' + str(d['BenchmarkSecurityID']))
+		n += 1
+	if 'BenchmarkSecurityIDSource' in d:
+		add('761=' + str(d['BenchmarkSecurityIDSource']))
+		n += 1
+	if 'PriceType' in d:
+		add('423=' + str(d['PriceType']))
+		n += 1
+	if 'Price' in d:
+		add('44=' + str(d['Price']))
+		n += 1
+	if 'Price2' in d:
+		add('640=' + str(d['Price2']))
+		n += 1
+	if 'YieldType' in d:
+		add('235=' + str(d['YieldType']))
+		n += 1
+	if 'Yield' in d:
+		add('236=' + str(d['Yield']))
+		n += 1
+	if 'YieldCalcDate' in d:
+		add('701=' + str(d['YieldCalcDate']))
+		n += 1
+	if 'YieldRedemptionDate' in d:
+		add('696=' + str(d['YieldRedemptionDate']))
+		n += 1
+	if 'YieldRedemptionPrice' in d:
+		add('697=' + str(d['YieldRedemptionPrice']))
+		n += 1
+	if 'YieldRedemptionPriceType' in d:
+		add('698=' + str(d['YieldRedemptionPriceType']))
+		n += 1
+	if 'NoPartyIDs' in d:
+		grp = d['NoPartyIDs']
+		add('453=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoPartyIDs(entry, fixm)
+		n += 1
+	if 'Text' in d:
+		add('58=' + str(d['Text']))
+		n += 1
+	if 'EncodedTextLen' in d:
+		add('354=' + str(d['EncodedTextLen']))
+		n += 1
+	if 'EncodedText' in d:
+		add('355=' + str(d['EncodedText']))
+		n += 1
+	if len(d) > n:
+		_make_mbody(obj, obj._context, fixm, _msg_QuoteRequestReject_names)
+	return fixm
+
+def _decode_QuoteRequestReject(obj, fields, index, context):
+	d = obj.__dict__
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _msg_QuoteRequestReject_tags.get(num)
+		if spec is None:
+			# not a field of this message, continue with generic decoder
+			body, index = _extract_body(fields, index, context, obj)
+			return index
+		name, pytype, decode_grp = spec
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	return index
 
 class QuoteRequestReject(FixObject):
-	pass
+	_encode = staticmethod(_encode_QuoteRequestReject)
+	_decode = staticmethod(_decode_QuoteRequestReject)
+
+_msg_QuoteResponse_names = frozenset(['QuoteRespID', 'QuoteID', 'QuoteRespType', 'ClOrdID', 'OrderCapacity', 'IOIid', 'QuoteType', 'NoQuoteQualifiers', 'NoPartyIDs', 'TradingSessionID', 'TradingSessionSubID', 'Symbol', 'SymbolSfx', 'SecurityID', 'SecurityIDSource', 'NoSecurityAltID', 'Product', 'CFICode', 'SecurityType', 'SecuritySubType', 'MaturityMonthYear', 'MaturityDate', 'CouponPaymentDate', 'IssueDate', 'RepoCollateralSecurityType', 'RepurchaseTerm', 'RepurchaseRate', 'Factor', 'CreditRating', 'InstrRegistry', 'CountryOfIssue', 'StateOrProvinceOfIssue', 'LocaleOfIssue', 'RedemptionDate', 'StrikePrice', 'StrikeCurrency', 'OptAttribute', 'ContractMultiplier', 'CouponRate', 'SecurityExchange', 'Issuer', 'EncodedIssuerLen', 'EncodedIssuer', 'SecurityDesc', 'EncodedSecurityDescLen', 'EncodedSecurityDesc', 'Pool', 'ContractSettlMonth', 'CPProgram', 'CPRegType', 'NoEvents', 'DatedDate', 'InterestAccrualDate', 'AgreementDesc', 'AgreementID', 'AgreementDate', 'AgreementCurrency', 'TerminationType', 'StartDate', 'EndDate', 'DeliveryType', 'MarginRatio', 'NoUnderlyings', 'Side', 'OrderQty', 'CashOrderQty', 'OrderPercent', 'RoundingDirection', 'RoundingModulus', 'SettlType', 'SettlDate', 'SettlDate2', 'OrderQty2', 'Currency', 'NoStipulations', 'Account', 'AcctIDSource', 'AccountType', 'NoLegs', 'BidPx', 'OfferPx', 'MktBidPx', 'MktOfferPx', 'MinBidSize', 'BidSize', 'MinOfferSize', 'OfferSize', 'ValidUntilTime', 'BidSpotRate', 'OfferSpotRate', 'BidForwardPoints', 'OfferForwardPoints', 'MidPx', 'BidYield', 'MidYield', 'OfferYield', 'TransactTime', 'OrdType', 'BidForwardPoints2', 'OfferForwardPoints2', 'SettlCurrBidFxRate', 'SettlCurrOfferFxRate', 'SettlCurrFxRateCalc', 'Commission', 'CommType', 'CustOrderCapacity', 'ExDestination', 'Text', 'EncodedTextLen', 'EncodedText', 'Price', 'PriceType', 'Spread', 'BenchmarkCurveCurrency', 'BenchmarkCurveName', 'BenchmarkCurvePoint', 'BenchmarkPrice', 'BenchmarkPriceType', 'BenchmarkSecurityID', 'BenchmarkSecurityIDSource', 'YieldType', 'Yield', 'YieldCalcDate', 'YieldRedemptionDate', 'YieldRedemptionPrice', 'YieldRedemptionPriceType'])
+
+_msg_QuoteResponse_tags = {
+	693: ('QuoteRespID', str, None),
+	117: ('QuoteID', str, None),
+	694: ('QuoteRespType', int, None),
+	11: ('ClOrdID', str, None),
+	528: ('OrderCapacity', str, None),
+	23: ('IOIid', str, None),
+	537: ('QuoteType', int, None),
+	735: ('NoQuoteQualifiers', int, _decode_grp_NoQuoteQualifiers),
+	453: ('NoPartyIDs', int, _decode_grp_NoPartyIDs),
+	336: ('TradingSessionID', str, None),
+	625: ('TradingSessionSubID', str, None),
+	55: ('Symbol', str, None),
+	65: ('SymbolSfx', str, None),
+	48: ('SecurityID', str, None),
+	22: ('SecurityIDSource', str, None),
+	454: ('NoSecurityAltID', int, _decode_grp_NoSecurityAltID),
+	460: ('Product', int, None),
+	461: ('CFICode', str, None),
+	167: ('SecurityType', str, None),
+	762: ('SecuritySubType', str, None),
+	200: ('MaturityMonthYear', str, None),
+	541: ('MaturityDate', str, None),
+	224: ('CouponPaymentDate', str, None),
+	225: ('IssueDate', str, None),
+	239: ('RepoCollateralSecurityType', int, None),
+	226: ('RepurchaseTerm', int, None),
+	227: ('RepurchaseRate', float, None),
+	228: ('Factor', float, None),
+	255: ('CreditRating', str, None),
+	543: ('InstrRegistry', str, None),
+	470: ('CountryOfIssue', str, None),
+	471: ('StateOrProvinceOfIssue', str, None),
+	472: ('LocaleOfIssue', str, None),
+	240: ('RedemptionDate', str, None),
+	202: ('StrikePrice', float, None),
+	947: ('StrikeCurrency', str, None),
+	206: ('OptAttribute', str, None),
+	231: ('ContractMultiplier', float, None),
+	223: ('CouponRate', float, None),
+	207: ('SecurityExchange', str, None),
+	106: ('Issuer', str, None),
+	348: ('EncodedIssuerLen', str, None),
+	349: ('EncodedIssuer', str, None),
+	107: ('SecurityDesc', str, None),
+	350: ('EncodedSecurityDescLen', str, None),
+	351: ('EncodedSecurityDesc', str, None),
+	691: ('Pool', str, None),
+	667: ('ContractSettlMonth', str, None),
+	875: ('CPProgram', int, None),
+	876: ('CPRegType', str, None),
+	864: ('NoEvents', int, _decode_grp_NoEvents),
+	873: ('DatedDate', str, None),
+	874: ('InterestAccrualDate', str, None),
+	913: ('AgreementDesc', str, None),
+	914: ('AgreementID', str, None),
+	915: ('AgreementDate', str, None),
+	918: ('AgreementCurrency', str, None),
+	788: ('TerminationType', int, None),
+	916: ('StartDate', str, None),
+	917: ('EndDate', str, None),
+	919: ('DeliveryType', int, None),
+	898: ('MarginRatio', float, None),
+	711: ('NoUnderlyings', int, _decode_grp_NoUnderlyings),
+	54: ('Side', str, None),
+	38: ('OrderQty', float, None),
+	152: ('CashOrderQty', float, None),
+	516: ('OrderPercent', float, None),
+	468: ('RoundingDirection', str, None),
+	469: ('RoundingModulus', float, None),
+	63: ('SettlType', str, None),
+	64: ('SettlDate', str, None),
+	193: ('SettlDate2', str, None),
+	192: ('OrderQty2', float, None),
+	15: ('Currency', str, None),
+	232: ('NoStipulations', int, _decode_grp_NoStipulations),
+	1: ('Account', str, None),
+	660: ('AcctIDSource', int, None),
+	581: ('AccountType', int, None),
+	555: ('NoLegs', int, _decode_grp_NoLegs),
+	132: ('BidPx', float, None),
+	133: ('OfferPx', float, None),
+	645: ('MktBidPx', float, None),
+	646: ('MktOfferPx', float, None),
+	647: ('MinBidSize', float, None),
+	134: ('BidSize', float, None),
+	648: ('MinOfferSize', float, None),
+	135: ('OfferSize', float, None),
+	62: ('ValidUntilTime', str, None),
+	188: ('BidSpotRate', float, None),
+	190: ('OfferSpotRate', float, None),
+	189: ('BidForwardPoints', float, None),
+	191: ('OfferForwardPoints', float, None),
+	631: ('MidPx', float, None),
+	632: ('BidYield', float, None),
+	633: ('MidYield', float, None),
+	634: ('OfferYield', float, None),
+	60: ('TransactTime', str, None),
+	40: ('OrdType', str, None),
+	642: ('BidForwardPoints2', float, None),
+	643: ('OfferForwardPoints2', float, None),
+	656: ('SettlCurrBidFxRate', float, None),
+	657: ('SettlCurrOfferFxRate', float, None),
+	156: ('SettlCurrFxRateCalc', str, None),
+	12: ('Commission', float, None),
+	13: ('CommType', str, None),
+	582: ('CustOrderCapacity', int, None),
+	100: ('ExDestination', str, None),
+	58: ('Text', str, None),
+	354: ('EncodedTextLen', str, None),
+	355: ('EncodedText', str, None),
+	44: ('Price', float, None),
+	423: ('PriceType', int, None),
+	218: ('Spread', float, None),
+	220: ('BenchmarkCurveCurrency', str, None),
+	221: ('BenchmarkCurveName', str, None),
+	222: ('BenchmarkCurvePoint', str, None),
+	662: ('BenchmarkPrice', float, None),
+	663: ('BenchmarkPriceType', int, None),
+	699: ('BenchmarkSecurityID', str, None),
+	761: ('BenchmarkSecurityIDSource', str, None),
+	235: ('YieldType', str, None),
+	236: ('Yield', float, None),
+	701: ('YieldCalcDate', str, None),
+	696: ('YieldRedemptionDate', str, None),
+	697: ('YieldRedemptionPrice', float, None),
+	698: ('YieldRedemptionPriceType', int, None),
+}
+
+def _encode_QuoteResponse(obj, fixm):
+	d = obj.__dict__
+	add = fixm.append
+	n = 1
+	if 'QuoteRespID' in d:
+		add('693=' + str(d['QuoteRespID']))
+		n += 1
+	if 'QuoteID' in d:
+		add('117=' + str(d['QuoteID']))
+		n += 1
+	if 'QuoteRespType' in d:
+		add('694=' + str(d['QuoteRespType']))
+		n += 1
+	if 'ClOrdID' in d:
+		add('11=' + str(d['ClOrdID']))
+		n += 1
+	if 'OrderCapacity' in d:
+		add('528=' + str(d['OrderCapacity']))
+		n += 1
+	if 'IOIid' in d:
+		add('23=' + str(d['IOIid']))
+		n += 1
+	if 'QuoteType' in d:
+		add('537=' + str(d['QuoteType']))
+		n += 1
+	if 'NoQuoteQualifiers' in d:
+		grp = d['NoQuoteQualifiers']
+		add('735=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoQuoteQualifiers(entry, fixm)
+		n += 1
+	if 'NoPartyIDs' in d:
+		grp = d['NoPartyIDs']
+		add('453=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoPartyIDs(entry, fixm)
+		n += 1
+	if 'TradingSessionID' in d:
+		add('336=' + str(d['TradingSessionID']))
+		n += 1
+	if 'TradingSessionSubID' in d:
+		add('625=' + str(d['TradingSessionSubID']))
+		n += 1
+	if 'Symbol' in d:
+		add('55=' + str(d['Symbol']))
+		n += 1
+	if 'SymbolSfx' in d:
+		add('65=' + str(d['SymbolSfx']))
+		n += 1
+	if 'SecurityID' in d:
+		add('48=' + str(d['SecurityID']))
+		n += 1
+	if 'SecurityIDSource' in d:
+		add('22=' + str(d['SecurityIDSource']))
+		n += 1
+	if 'NoSecurityAltID' in d:
+		grp = d['NoSecurityAltID']
+		add('454=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoSecurityAltID(entry, fixm)
+		n += 1
+	if 'Product' in d:
+		add('460=' + str(d['Product']))
+		n += 1
+	if 'CFICode' in d:
+		add('461=' + str(d['CFICode']))
+		n += 1
+	if 'SecurityType' in d:
+		add('167=' + str(d['SecurityType']))
+		n += 1
+	if 'SecuritySubType' in d:
+		add('762=' + str(d['SecuritySubType']))
+		n += 1
+	if 'MaturityMonthYear' in d:
+		add('200=' + str(d['MaturityMonthYear']))
+		n += 1
+	if 'MaturityDate' in d:
+		add('541=' + str(d['MaturityDate']))
+		n += 1
+	if 'CouponPaymentDate' in d:
+		add('224=' + str(d['CouponPaymentDate']))
+		n += 1
+	if 'IssueDate' in d:
+		add('225=' + str(d['IssueDate']))
+		n += 1
+	if 'RepoCollateralSecurityType' in d:
+		add('239=' + str(d['RepoCollateralSecurityType']))
+		n += 1
+	if 'RepurchaseTerm' in d:
+		add('226=' + str(d['RepurchaseTerm']))
+		n += 1
+	if 'RepurchaseRate' in d:
+		add('227=' + str(d['RepurchaseRate']))
+		n += 1
+	if 'Factor' in d:
+		add('228=' + str(d['Factor']))
+		n += 1
+	if 'CreditRating' in d:
+		add('255=' + str(d['CreditRating']))
+		n += 1
+	if 'InstrRegistry' in d:
+		add('543=' + str(d['InstrRegistry']))
+		n += 1
+	if 'CountryOfIssue' in d:
+		add('470=' + str(d['CountryOfIssue']))
+		n += 1
+	if 'StateOrProvinceOfIssue' in d:
+		add('471=' + str(d['StateOrProvinceOfIssue']))
+		n += 1
+	if 'LocaleOfIssue' in d:
+		add('472=' + str(d['LocaleOfIssue']))
+		n += 1
+	if 'RedemptionDate' in d:
+		add('240=' + str(d['RedemptionDate']))
+		n += 1
+	if 'StrikePrice' in d:
+		add('202=' + str(d['StrikePrice']))
+		n += 1
+	if 'StrikeCurrency' in d:
+		add('947=' + str(d['StrikeCurrency']))
+		n += 1
+	if 'OptAttribute' in d:
+		add('206=' + str(d['OptAttribute']))
+		n += 1
+	if 'ContractMultiplier' in d:
+		add('231=' + str(d['ContractMultiplier']))
+		n += 1
+	if 'CouponRate' in d:
+		add('223=' + str(d['CouponRate']))
+		n += 1
+	if 'SecurityExchange' in d:
+		add('207=' + str(d['SecurityExchange']))
+		n += 1
+	if 'Issuer' in d:
+		add('106=' + str(d['Issuer']))
+		n += 1
+	if 'EncodedIssuerLen' in d:
+		add('348=' + str(d['EncodedIssuerLen']))
+		n += 1
+	if 'EncodedIssuer' in d:
+		add('349=' + str(d['EncodedIssuer']))
+		n += 1
+	if 'SecurityDesc' in d:
+		add('107=' + str(d['SecurityDesc']))
+		n += 1
+	if 'EncodedSecurityDescLen' in d:
+		add('350=' + str(d['EncodedSecurityDescLen']))
+		n += 1
+	if 'EncodedSecurityDesc' in d:
+		add('351=' + str(d['EncodedSecurityDesc']))
+		n += 1
+	if 'Pool' in d:
+		add('691=' + str(d['Pool']))
+		n += 1
+	if 'ContractSettlMonth' in d:
+		add('667=' + str(d['ContractSettlMonth']))
+		n += 1
+	if 'CPProgram' in d:
+		add('875=' + str(d['CPProgram']))
+		n += 1
+	if 'CPRegType' in d:
+		add('876=' + str(d['CPRegType']))
+		n += 1
+	if 'NoEvents' in d:
+		grp = d['NoEvents']
+		add('864=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoEvents(entry, fixm)
+		n += 1
+	if 'DatedDate' in d:
+		add('873=' + str(d['DatedDate']))
+		n += 1
+	if 'InterestAccrualDate' in d:
+		add('874=' + str(d['InterestAccrualDate']))
+		n += 1
+	if 'AgreementDesc' in d:
+		add('913=' + str(d['AgreementDesc']))
+		n += 1
+	if 'AgreementID' in d:
+		add('914=' + str(d['AgreementID']))
+		n += 1
+	if 'AgreementDate' in d:
+		add('915=' + str(d['AgreementDate']))
+		n += 1
+	if 'AgreementCurrency' in d:
+		add('918=' + str(d['AgreementCurrency']))
+		n += 1
+	if 'TerminationType' in d:
+		add('788=' + str(d['TerminationType']))
+		n += 1
+	if 'StartDate' in d:
+		add('916=' + str(d['StartDate']))
+		n += 1
+	if 'EndDate' in d:
+		add('917=' + str(d['EndDate']))
+		n += 1
+	if 'DeliveryType' in d:
+		add('919=' + str(d['DeliveryType']))
+		n += 1
+	if 'MarginRatio' in d:
+		add('898=' + str(d['MarginRatio']))
+		n += 1
+	if 'NoUnderlyings' in d:
+		grp = d['NoUnderlyings']
+		add('711=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoUnderlyings(entry, fixm)
+		n += 1
+	if 'Side' in d:
+		add('54=' + str(d['Side']))
+		n += 1
+	if 'OrderQty' in d:
+		add('38=' + str(d['OrderQty']))
+		n += 1
+	if 'CashOrderQty' in d:
+		add('152=' + str(d['CashOrderQty']))
+		n += 1
+	if 'OrderPercent' in d:
+		add('516=' + str(d['OrderPercent']))
+		n += 1
+	if 'RoundingDirection' in d:
+		add('468=' + str(d['RoundingDirection']))
+		n += 1
+	if 'RoundingModulus' in d:
+		add('469=' + str(d['RoundingModulus']))
+		n += 1
+	if 'SettlType' in d:
+		add('63=' + str(d['SettlType']))
+		n += 1
+	if 'SettlDate' in d:
+		add('64=' + str(d['SettlDate']))
+		n += 1
+	if 'SettlDate2' in d:
+		add('193=' + str(d['SettlDate2']))
+		n += 1
+	if 'OrderQty2' in d:
+		add('192=' + str(d['OrderQty2']))
+		n += 1
+	if 'Currency' in d:
+		add('15=' + str(d['Currency']))
+		n += 1
+	if 'NoStipulations' in d:
+		grp = d['NoStipulations']
+		add('232=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoStipulations(entry, fixm)
+		n += 1
+	if 'Account' in d:
+		add('1=' + str(d['Account']))
+		n += 1
+	if 'AcctIDSource' in d:
+		add('660=' + str(d['AcctIDSource']))
+		n += 1
+	if 'AccountType' in d:
+		add('581=' + str(d['AccountType']))
+		n += 1
+	if 'NoLegs' in d:
+		grp = d['NoLegs']
+		add('555=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoLegs(entry, fixm)
+		n += 1
+	if 'BidPx' in d:
+		add('132=' + str(d['BidPx']))
+		n += 1
+	if 'OfferPx' in d:
+		add('133=' + str(d['OfferPx']))
+		n += 1
+	if 'MktBidPx' in d:
+		add('645=' + str(d['MktBidPx']))
+		n += 1
+	if 'MktOfferPx' in d:
+		add('646=' + str(d['MktOfferPx']))
+		n += 1
+	if 'MinBidSize' in d:
+		add('647=' + str(d['MinBidSize']))
+		n += 1
+	if 'BidSize' in d:
+		add('134=' + str(d['BidSize']))
+		n += 1
+	if 'MinOfferSize' in d:
+		add('648=' + str(d['MinOfferSize']))
+		n += 1
+	if 'OfferSize' in d:
+		add('135=' + str(d['OfferSize']))
+		n += 1
+	if 'ValidUntilTime' in d:
+		add('62=' + str(d['ValidUntilTime']))
+		n += 1
+	if 'BidSpotRate' in d:
+		add('188=' + str(d['BidSpotRate']))
+		n += 1
+	if 'OfferSpotRate' in d:
+		add('190=' + str(d['OfferSpotRate']))
+		n += 1
+	if 'BidForwardPoints' in d:
+		add('189=' + str(d['BidForwardPoints']))
+		n += 1
+	if 'OfferForwardPoints' in d:
+		add('191=' + str(d['OfferForwardPoints']))
+		n += 1
+	if 'MidPx' in d:
+		add('631=' + str(d['MidPx']))
+		n += 1
+	if 'BidYield' in d:
+		add('632=' + str(d['BidYield']))
+		n += 1
+	if 'MidYield' in d:
+		add('633=' + str(d['MidYield']))
+		n += 1
+	if 'OfferYield' in d:
+		add('634=' + str(d['OfferYield']))
+		n += 1
+	if 'TransactTime' in d:
+		add('60=' + str(d['TransactTime']))
+		n += 1
+	if 'OrdType' in d:
+		add('40=' + str(d['OrdType']))
+		n += 1
+	if 'BidForwardPoints2' in d:
+		add('642=' + str(d['BidForwardPoints2']))
+		n += 1
+	if 'OfferForwardPoints2' in d:
+		add('643=' + str(d['OfferForwardPoints2']))
+		n += 1
+	if 'SettlCurrBidFxRate' in d:
+		add('656=' + str(d['SettlCurrBidFxRate']))
+		n += 1
+	if 'SettlCurrOfferFxRate' in d:
+		add('657=' + str(d['SettlCurrOfferFxRate']))
+		n += 1
+	if 'SettlCurrFxRateCalc' in d:
+		add('156=' + str(d['SettlCurrFxRateCalc']))
+		n += 1
+	if 'Commission' in d:
+		add('12=' + str(d['Commission']))
+		n += 1
+	if 'CommType' in d:
+		add('13=' + str(d['CommType']))
+		n += 1
+	if 'CustOrderCapacity' in d:
+		add('582=' + str(d['CustOrderCapacity']))
+		n += 1
+	if 'ExDestination' in d:
+		add('100=' + str(d['ExDestination']))
+		n += 1
+	if 'Text' in d:
+		add('58=' + str(d['Text']))
+		n += 1
+	if 'EncodedTextLen' in d:
+		add('354=' + str(d['EncodedTextLen']))
+		n += 1
+	if 'EncodedText' in d:
+		add('355=' + str(d['EncodedText']))
+		n += 1
+	if 'Price' in d:
+		add('44=' + str(d['Price']))
+		n += 1
+	if 'PriceType' in d:
+		add('423=' + str(d['PriceType']))
+		n += 1
+	if 'Spread' in d:
+		add('218=' + str(d['Spread']))
+		n += 1
+	if 'BenchmarkCurveCurrency' in d:
+		add('220=' + str(d['BenchmarkCurveCurrency']))
+		n += 1
+	if 'BenchmarkCurveName' in d:
+		add('221=' + str(d['BenchmarkCurveName']))
+		n += 1
+	if 'BenchmarkCurvePoint' in d:
+		add('222=' + str(d['BenchmarkCurvePoint']))
+		n += 1
+	if 'BenchmarkPrice' in d:
+		add('662=' + str(d['BenchmarkPrice']))
+		n += 1
+	if 'BenchmarkPriceType' in d:
+		add('663=' + str(d['BenchmarkPriceType']))
+		n += 1
+	if 'BenchmarkSecurityID' in d:
+		add('699=' + str(d['BenchmarkSecurityID']))
+		n += 1
+	if 'BenchmarkSecurityIDSource' in d:
+		add('761=' + str(d['BenchmarkSecurityIDSource']))
+		n += 1
+	if 'YieldType' in d:
+		add('235=' + str(d['YieldType']))
+		n += 1
+	if 'Yield' in d:
+		add('236=' + str(d['Yield']))
+		n += 1
+	if 'YieldCalcDate' in d:
+		add('701=' + str(d['YieldCalcDate']))
+		n += 1
+	if 'YieldRedemptionDate' in d:
+		add('696=' + str(d['YieldRedemptionDate']))
+		n += 1
+	if 'YieldRedemptionPrice' in d:
+		add('697=' + str(d['YieldRedemptionPrice']))
+		n += 1
+	if 'YieldRedemptionPriceType' in d:
+		add('698=' + str(d['YieldRedemptionPriceType']))
+		n += 1
+	if len(d) > n:
+		_make_mbody(obj, obj._context, fixm, _msg_QuoteResponse_names)
+	return fixm
+
+def _decode_QuoteResponse(obj, fields, index, context):
+	d = obj.__dict__
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _msg_QuoteResponse_tags.get(num)
+		if spec is None:
+			# not a field of this message, continue with generic decoder
+			body, index = _extract_body(fields, index, context, obj)
+			return index
+		name, pytype, decode_grp = spec
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	return index
 
 class QuoteResponse(FixObject):
-	pass
+	_encode = staticmethod(_encode_QuoteResponse)
+	_decode = staticmethod(_decode_QuoteResponse)
+
+_msg_QuoteStatusReport_names = frozenset(['QuoteStatusReqID', 'QuoteReqID', 'QuoteID', 'QuoteRespID', 'QuoteType', 'NoPartyIDs', 'TradingSessionID', 'TradingSessionSubID', 'Symbol', 'SymbolSfx', 'SecurityID', 'SecurityIDSource', 'NoSecurityAltID', 'Product', 'CFICode', 'SecurityType', 'SecuritySubType', 'MaturityMonthYear', 'MaturityDate', 'CouponPaymentDate', 'IssueDate', 'RepoCollateralSecurityType', 'RepurchaseTerm', 'RepurchaseRate', 'Factor', 'CreditRating', 'InstrRegistry', 'CountryOfIssue', 'StateOrProvinceOfIssue', 'LocaleOfIssue', 'RedemptionDate', 'StrikePrice', 'StrikeCurrency', 'OptAttribute', 'ContractMultiplier', 'CouponRate', 'SecurityExchange', 'Issuer', 'EncodedIssuerLen', 'EncodedIssuer', 'SecurityDesc', 'EncodedSecurityDescLen', 'EncodedSecurityDesc', 'Pool', 'ContractSettlMonth', 'CPProgram', 'CPRegType', 'NoEvents', 'DatedDate', 'InterestAccrualDate', 'AgreementDesc', 'AgreementID', 'AgreementDate', 'AgreementCurrency', 'TerminationType', 'StartDate', 'EndDate', 'DeliveryType', 'MarginRatio', 'NoUnderlyings', 'Side', 'OrderQty', 'CashOrderQty', 'OrderPercent', 'RoundingDirection', 'RoundingModulus', 'SettlType', 'SettlDate', 'SettlDate2', 'OrderQty2', 'Currency', 'NoStipulations', 'Account', 'AcctIDSource', 'AccountType', 'NoLegs', 'NoQuoteQualifiers', 'ExpireTime', 'Price', 'PriceType', 'Spread', 'BenchmarkCurveCurrency', 'BenchmarkCurveName', 'BenchmarkCurvePoint', 'BenchmarkPrice', 'BenchmarkPriceType', 'BenchmarkSecurityID', 'BenchmarkSecurityIDSource', 'YieldType', 'Yield', 'YieldCalcDate', 'YieldRedemptionDate', 'YieldRedemptionPrice', 'YieldRedemptionPriceType', 'BidPx', 'OfferPx', 'MktBidPx', 'MktOfferPx', 'MinBidSize', 'BidSize', 'MinOfferSize', 'OfferSize', 'ValidUntilTime', 'BidSpotRate', 'OfferSpotRate', 'BidForwardPoints', 'OfferForwardPoints', 'MidPx', 'BidYield', 'MidYield', 'OfferYield', 'TransactTime', 'OrdType', 'BidForwardPoints2', 'OfferForwardPoints2', 'SettlCurrBidFxRate', 'SettlCurrOfferFxRate', 'SettlCurrFxRateCalc', 'CommType', 'Commission', 'CustOrderCapacity', 'ExDestination', 'QuoteStatus', 'Text', 'EncodedTextLen', 'EncodedText'])
+
+_msg_QuoteStatusReport_tags = {
+	649: ('QuoteStatusReqID', str, None),
+	131: ('QuoteReqID', str, None),
+	117: ('QuoteID', str, None),
+	693: ('QuoteRespID', str, None),
+	537: ('QuoteType', int, None),
+	453: ('NoPartyIDs', int, _decode_grp_NoPartyIDs),
+	336: ('TradingSessionID', str, None),
+	625: ('TradingSessionSubID', str, None),
+	55: ('Symbol', str, None),
+	65: ('SymbolSfx', str, None),
+	48: ('SecurityID', str, None),
+	22: ('SecurityIDSource', str, None),
+	454: ('NoSecurityAltID', int, _decode_grp_NoSecurityAltID),
+	460: ('Product', int, None),
+	461: ('CFICode', str, None),
+	167: ('SecurityType', str, None),
+	762: ('SecuritySubType', str, None),
+	200: ('MaturityMonthYear', str, None),
+	541: ('MaturityDate', str, None),
+	224: ('CouponPaymentDate', str, None),
+	225: ('IssueDate', str, None),
+	239: ('RepoCollateralSecurityType', int, None),
+	226: ('RepurchaseTerm', int, None),
+	227: ('RepurchaseRate', float, None),
+	228: ('Factor', float, None),
+	255: ('CreditRating', str, None),
+	543: ('InstrRegistry', str, None),
+	470: ('CountryOfIssue', str, None),
+	471: ('StateOrProvinceOfIssue', str, None),
+	472: ('LocaleOfIssue', str, None),
+	240: ('RedemptionDate', str, None),
+	202: ('StrikePrice', float, None),
+	947: ('StrikeCurrency', str, None),
+	206: ('OptAttribute', str, None),
+	231: ('ContractMultiplier', float, None),
+	223: ('CouponRate', float, None),
+	207: ('SecurityExchange', str, None),
+	106: ('Issuer', str, None),
+	348: ('EncodedIssuerLen', str, None),
+	349: ('EncodedIssuer', str, None),
+	107: ('SecurityDesc', str, None),
+	350: ('EncodedSecurityDescLen', str, None),
+	351: ('EncodedSecurityDesc', str, None),
+	691: ('Pool', str, None),
+	667: ('ContractSettlMonth', str, None),
+	875: ('CPProgram', int, None),
+	876: ('CPRegType', str, None),
+	864: ('NoEvents', int, _decode_grp_NoEvents),
+	873: ('DatedDate', str, None),
+	874: ('InterestAccrualDate', str, None),
+	913: ('AgreementDesc', str, None),
+	914: ('AgreementID', str, None),
+	915: ('AgreementDate', str, None),
+	918: ('AgreementCurrency', str, None),
+	788: ('TerminationType', int, None),
+	916: ('StartDate', str, None),
+	917: ('EndDate', str, None),
+	919: ('DeliveryType', int, None),
+	898: ('MarginRatio', float, None),
+	711: ('NoUnderlyings', int, _decode_grp_NoUnderlyings),
+	54: ('Side', str, None),
+	38: ('OrderQty', float, None),
+	152: ('CashOrderQty', float, None),
+	516: ('OrderPercent', float, None),
+	468: ('RoundingDirection', str, None),
+	469: ('RoundingModulus', float, None),
+	63: ('SettlType', str, None),
+	64: ('SettlDate', str, None),
+	193: ('SettlDate2', str, None),
+	192: ('OrderQty2', float, None),
+	15: ('Currency', str, None),
+	232: ('NoStipulations', int, _decode_grp_NoStipulations),
+	1: ('Account', str, None),
+	660: ('AcctIDSource', int, None),
+	581: ('AccountType', int, None),
+	555: ('NoLegs', int, _decode_grp_NoLegs),
+	735: ('NoQuoteQualifiers', int, _decode_grp_NoQuoteQualifiers),
+	126: ('ExpireTime', str, None),
+	44: ('Price', float, None),
+	423: ('PriceType', int, None),
+	218: ('Spread', float, None),
+	220: ('BenchmarkCurveCurrency', str, None),
+	221: ('BenchmarkCurveName', str, None),
+	222: ('BenchmarkCurvePoint', str, None),
+	662: ('BenchmarkPrice', float, None),
+	663: ('BenchmarkPriceType', int, None),
+	699: ('BenchmarkSecurityID', str, None),
+	761: ('BenchmarkSecurityIDSource', str, None),
+	235: ('YieldType', str, None),
+	236: ('Yield', float, None),
+	701: ('YieldCalcDate', str, None),
+	696: ('YieldRedemptionDate', str, None),
+	697: ('YieldRedemptionPrice', float, None),
+	698: ('YieldRedemptionPriceType', int, None),
+	132: ('BidPx', float, None),
+	133: ('OfferPx', float, None),
+	645: ('MktBidPx', float, None),
+	646: ('MktOfferPx', float, None),
+	647: ('MinBidSize', float, None),
+	134: ('BidSize', float, None),
+	648: ('MinOfferSize', float, None),
+	135: ('OfferSize', float, None),
+	62: ('ValidUntilTime', str, None),
+	188: ('BidSpotRate', float, None),
+	190: ('OfferSpotRate', float, None),
+	189: ('BidForwardPoints', float, None),
+	191: ('OfferForwardPoints', float, None),
+	631: ('MidPx', float, None),
+	632: ('BidYield', float, None),
+	633: ('MidYield', float, None),
+	634: ('OfferYield', float, None),
+	60: ('TransactTime', str, None),
+	40: ('OrdType', str, None),
+	642: ('BidForwardPoints2', float, None),
+	643: ('OfferForwardPoints2', float, None),
+	656: ('SettlCurrBidFxRate', float, None),
+	657: ('SettlCurrOfferFxRate', float, None),
+	156: ('SettlCurrFxRateCalc', str, None),
+	13: ('CommType', str, None),
+	12: ('Commission', float, None),
+	582: ('CustOrderCapacity', int, None),
+	100: ('ExDestination', str, None),
+	297: ('QuoteStatus', int, None),
+	58: ('Text', str, None),
+	354: ('EncodedTextLen', str, None),
+	355: ('EncodedText', str, None),
+}
+
+def _encode_QuoteStatusReport(obj, fixm):
+	d = obj.__dict__
+	add = fixm.append
+	n = 1
+	if 'QuoteStatusReqID' in d:
+		add('649=' + str(d['QuoteStatusReqID']))
+		n += 1
+	if 'QuoteReqID' in d:
+		add('131=' + str(d['QuoteReqID']))
+		n += 1
+	if 'QuoteID' in d:
+		add('117=' + str(d['QuoteID']))
+		n += 1
+	if 'QuoteRespID' in d:
+		add('693=' + str(d['QuoteRespID']))
+		n += 1
+	if 'QuoteType' in d:
+		add('537=' + str(d['QuoteType']))
+		n += 1
+	if 'NoPartyIDs' in d:
+		grp = d['NoPartyIDs']
+		add('453=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoPartyIDs(entry, fixm)
+		n += 1
+	if 'TradingSessionID' in d:
+		add('336=' + str(d['TradingSessionID']))
+		n += 1
+	if 'TradingSessionSubID' in d:
+		add('625=' + str(d['TradingSessionSubID']))
+		n += 1
+	if 'Symbol' in d:
+		add('55=' + str(d['Symbol']))
+		n += 1
+	if 'SymbolSfx' in d:
+		add('65=' + str(d['SymbolSfx']))
+		n += 1
+	if 'SecurityID' in d:
+		add('48=' + str(d['SecurityID']))
+		n += 1
+	if 'SecurityIDSource' in d:
+		add('22=' + str(d['SecurityIDSource']))
+		n += 1
+	if 'NoSecurityAltID' in d:
+		grp = d['NoSecurityAltID']
+		add('454=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoSecurityAltID(entry, fixm)
+		n += 1
+	if 'Product' in d:
+		add('460=' + str(d['Product']))
+		n += 1
+	if 'CFICode' in d:
+		add('461=' + str(d['CFICode']))
+		n += 1
+	if 'SecurityType' in d:
+		add('167=' + str(d['SecurityType']))
+		n += 1
+	if 'SecuritySubType' in d:
+		add('762=' + str(d['SecuritySubType']))
+		n += 1
+	if 'MaturityMonthYear' in d:
+		add('200=' + str(d['MaturityMonthYear']))
+		n += 1
+	if 'MaturityDate' in d:
+		add('541=' + str(d['MaturityDate']))
+		n += 1
+	if 'CouponPaymentDate' in d:
+		add('224=' + str(d['CouponPaymentDate']))
+		n += 1
+	if 'IssueDate' in d:
+		add('225=' + str(d['IssueDate']))
+		n += 1
+	if 'RepoCollateralSecurityType' in d:
+		add('239=' + str(d['RepoCollateralSecurityType']))
+		n += 1
+	if 'RepurchaseTerm' in d:
+		add('226=' + str(d['RepurchaseTerm']))
+		n += 1
+	if 'RepurchaseRate' in d:
+		add('227=' + str(d['RepurchaseRate']))
+		n += 1
+	if 'Factor' in d:
+		add('228=' + str(d['Factor']))
+		n += 1
+	if 'CreditRating' in d:
+		add('255=' + str(d['CreditRating']))
+		n += 1
+	if 'InstrRegistry' in d:
+		add('543=' + str(d['InstrRegistry']))
+		n += 1
+	if 'CountryOfIssue' in d:
+		add('470=' + str(d['CountryOfIssue']))
+		n += 1
+	if 'StateOrProvinceOfIssue' in d:
+		add('471=' + str(d['StateOrProvinceOfIssue']))
+		n += 1
+	if 'LocaleOfIssue' in d:
+		add('472=' + str(d['LocaleOfIssue']))
+		n += 1
+	if 'RedemptionDate' in d:
+		add('240=' + str(d['RedemptionDate']))
+		n += 1
+	if 'StrikePrice' in d:
+		add('202=' + str(d['StrikePrice']))
+		n += 1
+	if 'StrikeCurrency' in d:
+		add('947=' + str(d['StrikeCurrency']))
+		n += 1
+	if 'OptAttribute' in d:
+		add('206=' + str(d['OptAttribute']))
+		n += 1
+	if 'ContractMultiplier' in d:
+		add('231=' + str(d['ContractMultiplier']))
+		n += 1
+	if 'CouponRate' in d:
+		add('223=' + str(d['CouponRate']))
+		n += 1
+	if 'SecurityExchange' in d:
+		add('207=' + str(d['SecurityExchange']))
+		n += 1
+	if 'Issuer' in d:
+		add('106=' + str(d['Issuer']))
+		n += 1
+	if 'EncodedIssuerLen' in d:
+		add('348=' + str(d['EncodedIssuerLen']))
+		n += 1
+	if 'EncodedIssuer' in d:
+		add('349=' + str(d['EncodedIssuer']))
+		n += 1
+	if 'SecurityDesc' in d:
+		add('107=' + str(d['SecurityDesc']))
+		n += 1
+	if 'EncodedSecurityDescLen' in d:
+		add('350=' + str(d['EncodedSecurityDescLen']))
+		n += 1
+	if 'EncodedSecurityDesc' in d:
+		add('351=' + str(d['EncodedSecurityDesc']))
+		n += 1
+	if 'Pool' in d:
+		add('691=' + str(d['Pool']))
+		n += 1
+	if 'ContractSettlMonth' in d:
+		add('667=' + str(d['ContractSettlMonth']))
+		n += 1
+	if 'CPProgram' in d:
+		add('875=' + str(d['CPProgram']))
+		n += 1
+	if 'CPRegType' in d:
+		add('876=' + str(d['CPRegType']))
+		n += 1
+	if 'NoEvents' in d:
+		grp = d['NoEvents']
+		add('864=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoEvents(entry, fixm)
+		n += 1
+	if 'DatedDate' in d:
+		add('873=' + str(d['DatedDate']))
+		n += 1
+	if 'InterestAccrualDate' in d:
+		add('874=' + str(d['InterestAccrualDate']))
+		n += 1
+	if 'AgreementDesc' in d:
+		add('913=' + str(d['AgreementDesc']))
+		n += 1
+	if 'AgreementID' in d:
+		add('914=' + str(d['AgreementID']))
+		n += 1
+	if 'AgreementDate' in d:
+		add('915=' + str(d['AgreementDate']))
+		n += 1
+	if 'AgreementCurrency' in d:
+		add('918=' + str(d['AgreementCurrency']))
+		n += 1
+	if 'TerminationType' in d:
+		add('788=' + str(d['TerminationType']))
+		n += 1
+	if 'StartDate' in d:
+		add('916=' + str(d['StartDate']))
+		n += 1
+	if 'EndDate' in d:
+		add('917=' + str(d['EndDate']))
+		n += 1
+	if 'DeliveryType' in d:
+		add('919=' + str(d['DeliveryType']))
+		n += 1
+	if 'MarginRatio' in d:
+		add('898=' + str(d['MarginRatio']))
+		n += 1
+	if 'NoUnderlyings' in d:
+		grp = d['NoUnderlyings']
+		add('711=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoUnderlyings(entry, fixm)
+		n += 1
+	if 'Side' in d:
+		add('54=' + str(d['Side']))
+		n += 1
+	if 'OrderQty' in d:
+		add('38=' + str(d['OrderQty']))
+		n += 1
+	if 'CashOrderQty' in d:
+		add('152=' + str(d['CashOrderQty']))
+		n += 1
+	if 'OrderPercent' in d:
+		add('516=' + str(d['OrderPercent']))
+		n += 1
+	if 'RoundingDirection' in d:
+		add('468=' + str(d['RoundingDirection']))
+		n += 1
+	if 'RoundingModulus' in d:
+		add('469=' + str(d['RoundingModulus']))
+		n += 1
+	if 'SettlType' in d:
+		add('63=' + str(d['SettlType']))
+		n += 1
+	if 'SettlDate' in d:
+		add('64=' + str(d['SettlDate']))
+		n += 1
+	if 'SettlDate2' in d:
+		add('193=' + str(d['SettlDate2']))
+		n += 1
+	if 'OrderQty2' in d:
+		add('192=' + str(d['OrderQty2']))
+		n += 1
+	if 'Currency' in d:
+		add('15=' + str(d['Currency']))
+		n += 1
+	if 'NoStipulations' in d:
+		grp = d['NoStipulations']
+		add('232=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoStipulations(entry, fixm)
+		n += 1
+	if 'Account' in d:
+		add('1=' + str(d['Account']))
+		n += 1
+	if 'AcctIDSource' in d:
+		add('660=' + str(d['AcctIDSource']))
+		n += 1
+	if 'AccountType' in d:
+		add('581=' + str(d['AccountType']))
+		n += 1
+	if 'NoLegs' in d:
+		grp = d['NoLegs']
+		add('555=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoLegs(entry, fixm)
+		n += 1
+	if 'NoQuoteQualifiers' in d:
+		grp = d['NoQuoteQualifiers']
+		add('735=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoQuoteQualifiers(entry, fixm)
+		n += 1
+	if 'ExpireTime' in d:
+		add('126=' + str(d['ExpireTime']))
+		n += 1
+	if 'Price' in d:
+		add('44=' + str(d['Price']))
+		n += 1
+	if 'PriceType' in d:
+		add('423=' + str(d['PriceType']))
+		n += 1
+	if 'Spread' in d:
+		add('218=' + str(d['Spread']))
+		n += 1
+	if 'BenchmarkCurveCurrency' in d:
+		add('220=' + str(d['BenchmarkCurveCurrency']))
+		n += 1
+	if 'BenchmarkCurveName' in d:
+		add('221=' + str(d['BenchmarkCurveName']))
+		n += 1
+	if 'BenchmarkCurvePoint' in d:
+		add('222=' + str(d['BenchmarkCurvePoint']))
+		n += 1
+	if 'BenchmarkPrice' in d:
+		add('662=' + str(d['BenchmarkPrice']))
+		n += 1
+	if 'BenchmarkPriceType' in d:
+		add('663=' + str(d['BenchmarkPriceType']))
+		n += 1
+	if 'BenchmarkSecurityID' in d:
+		add('699=' + str(d['BenchmarkSecurityID']))
+		n += 1
+	if 'BenchmarkSecurityIDSource' in d:
+		add('761=' + str(d['BenchmarkSecurityIDSource']))
+		n += 1
+	if 'YieldType' in d:
+		add('235=' + str(d['YieldType']))
+		n += 1
+	if 'Yield' in d:
+		add('236=' + str(d['Yield']))
+		n += 1
+	if 'YieldCalcDate' in d:
+		add('701=' + str(d['YieldCalcDate']))
+		n += 1
+	if 'YieldRedemptionDate' in d:
+		add('696=' + str(d['YieldRedemptionDate']))
+		n += 1
+	if 'YieldRedemptionPrice' in d:
+		add('697=' + str(d['YieldRedemptionPrice']))
+		n += 1
+	if 'YieldRedemptionPriceType' in d:
+		add('698=' + str(d['YieldRedemptionPriceType']))
+		n += 1
+	if 'BidPx' in d:
+		add('132=' + str(d['BidPx']))
+		n += 1
+	if 'OfferPx' in d:
+		add('133=' + str(d['OfferPx']))
+		n += 1
+	if 'MktBidPx' in d:
+		add('645=' + str(d['MktBidPx']))
+		n += 1
+	if 'MktOfferPx' in d:
+		add('646=' + str(d['MktOfferPx']))
+		n += 1
+	if 'MinBidSize' in d:
+		add('647=' + str(d['MinBidSize']))
+		n += 1
+	if 'BidSize' in d:
+		add('134=' + str(d['BidSize']))
+		n += 1
+	if 'MinOfferSize' in d:
+		add('648=' + str(d['MinOfferSize']))
+		n += 1
+	if 'OfferSize' in d:
+		add('135=' + str(d['OfferSize']))
+		n += 1
+	if 'ValidUntilTime' in d:
+		add('62=' + str(d['ValidUntilTime']))
+		n += 1
+	if 'BidSpotRate' in d:
+		add('188=' + str(d['BidSpotRate']))
+		n += 1
+	if 'OfferSpotRate' in d:
+		add('190=' + str(d['OfferSpotRate']))
+		n += 1
+	if 'BidForwardPoints' in d:
+		add('189=' + str(d['BidForwardPoints']))
+		n += 1
+	if 'OfferForwardPoints' in d:
+		add('191=' + str(d['OfferForwardPoints']))
+		n += 1
+	if 'MidPx' in d:
+		add('631=' + str(d['MidPx']))
+		n += 1
+	if 'BidYield' in d:
+		add('632=' + str(d['BidYield']))
+		n += 1
+	if 'MidYield' in d:
+		add('633=' + str(d['MidYield']))
+		n += 1
+	if 'OfferYield' in d:
+		add('634=' + str(d['OfferYield']))
+		n += 1
+	if 'TransactTime' in d:
+		add('60=' + str(d['TransactTime']))
+		n += 1
+	if 'OrdType' in d:
+		add('40=' + str(d['OrdType']))
+		n += 1
+	if 'BidForwardPoints2' in d:
+		add('642=' + str(d['BidForwardPoints2']))
+		n += 1
+	if 'OfferForwardPoints2' in d:
+		add('643=' + str(d['OfferForwardPoints2']))
+		n += 1
+	if 'SettlCurrBidFxRate' in d:
+		add('656=' + str(d['SettlCurrBidFxRate']))
+		n += 1
+	if 'SettlCurrOfferFxRate' in d:
+		add('657=' + str(d['SettlCurrOfferFxRate']))
+		n += 1
+	if 'SettlCurrFxRateCalc' in d:
+		add('156=' + str(d['SettlCurrFxRateCalc']))
+		n += 1
+	if 'CommType' in d:
+		add('13=' + str(d['CommType']))
+		n += 1
+	if 'Commission' in d:
+		add('12=' + str(d['Commission']))
+		n += 1
+	if 'CustOrderCapacity' in d:
+		add('582=' + str(d['CustOrderCapacity']))
+		n += 1
+	if 'ExDestination' in d:
+		add('100=' + str(d['ExDestination']))
+		n += 1
+	if 'QuoteStatus' in d:
+		add('297=' + str(d['QuoteStatus']))
+		n += 1
+	if 'Text' in d:
+		add('58=' + str(d['Text']))
+		n += 1
+	if 'EncodedTextLen' in d:
+		add('354=' + str(d['EncodedTextLen']))
+		n += 1
+	if 'EncodedText' in d:
+		add('355=' + str(d['EncodedText']))
+		n += 1
+	if len(d) > n:
+		_make_mbody(obj, obj._context, fixm, _msg_QuoteStatusReport_names)
+	return fixm
+
+def _decode_QuoteStatusReport(obj, fields, index, context):
+	d = obj.__dict__
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _msg_QuoteStatusReport_tags.get(num)
+		if spec is None:
+			# not a field of this message, continue with generic decoder
+			body, index = _extract_body(fields, index, context, obj)
+			return index
+		name, pytype, decode_grp = spec
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	return index
 
 class QuoteStatusReport(FixObject):
-	pass
+	_encode = staticmethod(_encode_QuoteStatusReport)
+	_decode = staticmethod(_decode_QuoteStatusReport)
+
+_msg_QuoteStatusRequest_names = frozenset(['QuoteStatusReqID', 'QuoteID', 'Symbol', 'SymbolSfx', 'SecurityID', 'SecurityIDSource', 'NoSecurityAltID', 'Product', 'CFICode', 'SecurityType', 'SecuritySubType', 'MaturityMonthYear', 'MaturityDate', 'CouponPaymentDate', 'IssueDate', 'RepoCollateralSecurityType', 'RepurchaseTerm', 'RepurchaseRate', 'Factor', 'CreditRating', 'InstrRegistry', 'CountryOfIssue', 'StateOrProvinceOfIssue', 'LocaleOfIssue', 'RedemptionDate', 'StrikePrice', 'StrikeCurrency', 'OptAttribute', 'ContractMultiplier', 'CouponRate', 'SecurityExchange', 'Issuer', 'EncodedIssuerLen', 'EncodedIssuer', 'SecurityDesc', 'EncodedSecurityDescLen', 'EncodedSecurityDesc', 'Pool', 'ContractSettlMonth', 'CPProgram', 'CPRegType', 'NoEvents', 'DatedDate', 'InterestAccrualDate', 'AgreementDesc', 'AgreementID', 'AgreementDate', 'AgreementCurrency', 'TerminationType', 'StartDate', 'EndDate', 'DeliveryType', 'MarginRatio', 'NoUnderlyings', 'NoLegs', 'NoPartyIDs', 'Account', 'AcctIDSource', 'AccountType', 'TradingSessionID', 'TradingSessionSubID', 'SubscriptionRequestType'])
+
+_msg_QuoteStatusRequest_tags = {
+	649: ('QuoteStatusReqID', str, None),
+	117: ('QuoteID', str, None),
+	55: ('Symbol', str, None),
+	65: ('SymbolSfx', str, None),
+	48: ('SecurityID', str, None),
+	22: ('SecurityIDSource', str, None),
+	454: ('NoSecurityAltID', int, _decode_grp_NoSecurityAltID),
+	460: ('Product', int, None),
+	461: ('CFICode', str, None),
+	167: ('SecurityType', str, None),
+	762: ('SecuritySubType', str, None),
+	200: ('MaturityMonthYear', str, None),
+	541: ('MaturityDate', str, None),
+	224: ('CouponPaymentDate', str, None),
+	225: ('IssueDate', str, None),
+	239: ('RepoCollateralSecurityType', int, None),
+	226: ('RepurchaseTerm', int, None),
+	227: ('RepurchaseRate', float, None),
+	228: ('Factor', float, None),
+	255: ('CreditRating', str, None),
+	543: ('InstrRegistry', str, None),
+	470: ('CountryOfIssue', str, None),
+	471: ('StateOrProvinceOfIssue', str, None),
+	472: ('LocaleOfIssue', str, None),
+	240: ('RedemptionDate', str, None),
+	202: ('StrikePrice', float, None),
+	947: ('StrikeCurrency', str, None),
+	206: ('OptAttribute', str, None),
+	231: ('ContractMultiplier', float, None),
+	223: ('CouponRate', float, None),
+	207: ('SecurityExchange', str, None),
+	106: ('Issuer', str, None),
+	348: ('EncodedIssuerLen', str, None),
+	349: ('EncodedIssuer', str, None),
+	107: ('SecurityDesc', str, None),
+	350: ('EncodedSecurityDescLen', str, None),
+	351: ('EncodedSecurityDesc', str, None),
+	691: ('Pool', str, None),
+	667: ('ContractSettlMonth', str, None),
+	875: ('CPProgram', int, None),
+	876: ('CPRegType', str, None),
+	864: ('NoEvents', int, _decode_grp_NoEvents),
+	873: ('DatedDate', str, None),
+	874: ('InterestAccrualDate', str, None),
+	913: ('AgreementDesc', str, None),
+	914: ('AgreementID', str, None),
+	915: ('AgreementDate', str, None),
+	918: ('AgreementCurrency', str, None),
+	788: ('TerminationType', int, None),
+	916: ('StartDate', str, None),
+	917: ('EndDate', str, None),
+	919: ('DeliveryType', int, None),
+	898: ('MarginRatio', float, None),
+	711: ('NoUnderlyings', int, _decode_grp_NoUnderlyings),
+	555: ('NoLegs', int, _decode_grp_NoLegs),
+	453: ('NoPartyIDs', int, _decode_grp_NoPartyIDs),
+	1: ('Account', str, None),
+	660: ('AcctIDSource', int, None),
+	581: ('AccountType', int, None),
+	336: ('TradingSessionID', str, None),
+	625: ('TradingSessionSubID', str, None),
+	263: ('SubscriptionRequestType', str, None),
+}
+
+def _encode_QuoteStatusRequest(obj, fixm):
+	d = obj.__dict__
+	add = fixm.append
+	n = 1
+	if 'QuoteStatusReqID' in d:
+		add('649=' + str(d['QuoteStatusReqID']))
+		n += 1
+	if 'QuoteID' in d:
+		add('117=' + str(d['QuoteID']))
+		n += 1
+	if 'Symbol' in d:
+		add('55=' + str(d['Symbol']))
+		n += 1
+	if 'SymbolSfx' in d:
+		add('65=' + str(d['SymbolSfx']))
+		n += 1
+	if 'SecurityID' in d:
+		add('48=' + str(d['SecurityID']))
+		n += 1
+	if 'SecurityIDSource' in d:
+		add('22=' + str(d['SecurityIDSource']))
+		n += 1
+	if 'NoSecurityAltID' in d:
+		grp = d['NoSecurityAltID']
+		add('454=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoSecurityAltID(entry, fixm)
+		n += 1
+	if 'Product' in d:
+		add('460=' + str(d['Product']))
+		n += 1
+	if 'CFICode' in d:
+		add('461=' + str(d['CFICode']))
+		n += 1
+	if 'SecurityType' in d:
+		add('167=' + str(d['SecurityType']))
+		n += 1
+	if 'SecuritySubType' in d:
+		add('762=' + str(d['SecuritySubType']))
+		n += 1
+	if 'MaturityMonthYear' in d:
+		add('200=' + str(d['MaturityMonthYear']))
+		n += 1
+	if 'MaturityDate' in d:
+		add('541=' + str(d['MaturityDate']))
+		n += 1
+	if 'CouponPaymentDate' in d:
+		add('224=' + str(d['CouponPaymentDate']))
+		n += 1
+	if 'IssueDate' in d:
+		add('225=' + str(d['IssueDate']))
+		n += 1
+	if 'RepoCollateralSecurityType' in d:
+		add('239=' + str(d['RepoCollateralSecurityType']))
+		n += 1
+	if 'RepurchaseTerm' in d:
+		add('226=' + str(d['RepurchaseTerm']))
+		n += 1
+	if 'RepurchaseRate' in d:
+		add('227=' + str(d['RepurchaseRate']))
+		n += 1
+	if 'Factor' in d:
+		add('228=' + str(d['Factor']))
+		n += 1
+	if 'CreditRating' in d:
+		add('255=' + str(d['CreditRating']))
+		n += 1
+	if 'InstrRegistry' in d:
+		add('543=' + str(d['InstrRegistry']))
+		n += 1
+	if 'CountryOfIssue' in d:
+		add('470=' + str(d['CountryOfIssue']))
+		n += 1
+	if 'StateOrProvinceOfIssue' in d:
+		add('471=' + str(d['StateOrProvinceOfIssue']))
+		n += 1
+	if 'LocaleOfIssue' in d:
+		add('472=' + str(d['LocaleOfIssue']))
+		n += 1
+	if 'RedemptionDate' in d:
+		add('240=' + str(d['RedemptionDate']))
+		n += 1
+	if 'StrikePrice' in d:
+		add('202=' + str(d['StrikePrice']))
+		n += 1
+	if 'StrikeCurrency' in d:
+		add('947=' + str(d['StrikeCurrency']))
+		n += 1
+	if 'OptAttribute' in d:
+		add('206=' + str(d['OptAttribute']))
+		n += 1
+	if 'ContractMultiplier' in d:
+		add('231=' + str(d['ContractMultiplier']))
+		n += 1
+	if 'CouponRate' in d:
+		add('223=' + str(d['CouponRate']))
+		n += 1
+	if 'SecurityExchange' in d:
+		add('207=' + str(d['SecurityExchange']))
+		n += 1
+	if 'Issuer' in d:
+		add('106=' + str(d['Issuer']))
+		n += 1
+	if 'EncodedIssuerLen' in d:
+		add('348=' + str(d['EncodedIssuerLen']))
+		n += 1
+	if 'EncodedIssuer' in d:
+		add('349=' + str(d['EncodedIssuer']))
+		n += 1
+	if 'SecurityDesc' in d:
+		add('107=' + str(d['SecurityDesc']))
+		n += 1
+	if 'EncodedSecurityDescLen' in d:
+		add('350=' + str(d['EncodedSecurityDescLen']))
+		n += 1
+	if 'EncodedSecurityDesc' in d:
+		add('351=' + str(d['EncodedSecurityDesc']))
+		n += 1
+	if 'Pool' in d:
+		add('691=' + str(d['Pool']))
+		n += 1
+	if 'ContractSettlMonth' in d:
+		add('667=' + str(d['ContractSettlMonth']))
+		n += 1
+	if 'CPProgram' in d:
+		add('875=' + str(d['CPProgram']))
+		n += 1
+	if 'CPRegType' in d:
+		add('876=' + str(d['CPRegType']))
+		n += 1
+	if 'NoEvents' in d:
+		grp = d['NoEvents']
+		add('864=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoEvents(entry, fixm)
+		n += 1
+	if 'DatedDate' in d:
+		add('873=' + str(d['DatedDate']))
+		n += 1
+	if 'InterestAccrualDate' in d:
+		add('874=' + str(d['InterestAccrualDate']))
+		n += 1
+	if 'AgreementDesc' in d:
+		add('913=' + str(d['AgreementDesc']))
+		n += 1
+	if 'AgreementID' in d:
+		add('914=' + str(d['AgreementID']))
+		n += 1
+	if 'AgreementDate' in d:
+		add('915=' + str(d['AgreementDate']))
+		n += 1
+	if 'AgreementCurrency' in d:
+		add('918=' + str(d['AgreementCurrency']))
+		n += 1
+	if 'TerminationType' in d:
+		add('788=' + str(d['TerminationType']))
+		n += 1
+	if 'StartDate' in d:
+		add('916=' + str(d['StartDate']))
+		n += 1
+	if 'EndDate' in d:
+		add('917=' + str(d['EndDate']))
+		n += 1
+	if 'DeliveryType' in d:
+		add('919=' + str(d['DeliveryType']))
+		n += 1
+	if 'MarginRatio' in d:
+		add('898=' + str(d['MarginRatio']))
+		n += 1
+	if 'NoUnderlyings' in d:
+		grp = d['NoUnderlyings']
+		add('711=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoUnderlyings(entry, fixm)
+		n += 1
+	if 'NoLegs' in d:
+		grp = d['NoLegs']
+		add('555=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoLegs(entry, fixm)
+		n += 1
+	if 'NoPartyIDs' in d:
+		grp = d['NoPartyIDs']
+		add('453=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoPartyIDs(entry, fixm)
+		n += 1
+	if 'Account' in d:
+		add('1=' + str(d['Account']))
+		n += 1
+	if 'AcctIDSource' in d:
+		add('660=' + str(d['AcctIDSource']))
+		n += 1
+	if 'AccountType' in d:
+		add('581=' + str(d['AccountType']))
+		n += 1
+	if 'TradingSessionID' in d:
+		add('336=' + str(d['TradingSessionID']))
+		n += 1
+	if 'TradingSessionSubID' in d:
+		add('625=' + str(d['TradingSessionSubID']))
+		n += 1
+	if 'SubscriptionRequestType' in d:
+		add('263=' + str(d['SubscriptionRequestType']))
+		n += 1
+	if len(d) > n:
+		_make_mbody(obj, obj._context, fixm, _msg_QuoteStatusRequest_names)
+	return fixm
+
+def _decode_QuoteStatusRequest(obj, fields, index, context):
+	d = obj.__dict__
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _msg_QuoteStatusRequest_tags.get(num)
+		if spec is None:
+			# not a field of this message, continue with generic decoder
+			body, index = _extract_body(fields, index, context, obj)
+			return index
+		name, pytype, decode_grp = spec
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	return index
 
 class QuoteStatusRequest(FixObject):
-	pass
+	_encode = staticmethod(_encode_QuoteStatusRequest)
+	_decode = staticmethod(_decode_QuoteStatusRequest)
+
+_msg_RFQRequest_names = frozenset(['RFQReqID', 'NoRelatedSym', 'SubscriptionRequestType'])
+
+_msg_RFQRequest_tags = {
+	644: ('RFQReqID', str, None),
+	146: ('NoRelatedSym', int, _decode_grp_NoRelatedSym),
+	263: ('SubscriptionRequestType', str, None),
+}
+
+def _encode_RFQRequest(obj, fixm):
+	d = obj.__dict__
+	add = fixm.append
+	n = 1
+	if 'RFQReqID' in d:
+		add('644=' + str(d['RFQReqID']))
+		n += 1
+	if 'NoRelatedSym' in d:
+		grp = d['NoRelatedSym']
+		add('146=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoRelatedSym(entry, fixm)
+		n += 1
+	if 'SubscriptionRequestType' in d:
+		add('263=' + str(d['SubscriptionRequestType']))
+		n += 1
+	if len(d) > n:
+		_make_mbody(obj, obj._context, fixm, _msg_RFQRequest_names)
+	return fixm
+
+def _decode_RFQRequest(obj, fields, index, context):
+	d = obj.__dict__
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _msg_RFQRequest_tags.get(num)
+		if spec is None:
+			# not a field of this message, continue with generic decoder
+			body, index = _extract_body(fields, index, context, obj)
+			return index
+		name, pytype, decode_grp = spec
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	return index
 
 class RFQRequest(FixObject):
-	pass
+	_encode = staticmethod(_encode_RFQRequest)
+	_decode = staticmethod(_decode_RFQRequest)
+
+_msg_RegistrationInstructions_names = frozenset(['RegistID', 'RegistTransType', 'RegistRefID', 'ClOrdID', 'NoPartyIDs', 'Account', 'AcctIDSource', 'RegistAcctType', 'TaxAdvantageType', 'OwnershipType', 'NoRegistDtls', 'NoDistribInsts'])
+
+_msg_RegistrationInstructions_tags = {
+	513: ('RegistID', str, None),
+	514: ('RegistTransType', str, None),
+	508: ('RegistRefID', str, None),
+	11: ('ClOrdID', str, None),
+	453: ('NoPartyIDs', int, _decode_grp_NoPartyIDs),
+	1: ('Account', str, None),
+	660: ('AcctIDSource', int, None),
+	493: ('RegistAcctType', str, None),
+	495: ('TaxAdvantageType', int, None),
+	517: ('OwnershipType', str, None),
+	473: ('NoRegistDtls', int, _decode_grp_NoRegistDtls),
+	510: ('NoDistribInsts', int, _decode_grp_NoDistribInsts),
+}
+
+def _encode_RegistrationInstructions(obj, fixm):
+	d = obj.__dict__
+	add = fixm.append
+	n = 1
+	if 'RegistID' in d:
+		add('513=' + str(d['RegistID']))
+		n += 1
+	if 'RegistTransType' in d:
+		add('514=' + str(d['RegistTransType']))
+		n += 1
+	if 'RegistRefID' in d:
+		add('508=' + str(d['RegistRefID']))
+		n += 1
+	if 'ClOrdID' in d:
+		add('11=' + str(d['ClOrdID']))
+		n += 1
+	if 'NoPartyIDs' in d:
+		grp = d['NoPartyIDs']
+		add('453=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoPartyIDs(entry, fixm)
+		n += 1
+	if 'Account' in d:
+		add('1=' + str(d['Account']))
+		n += 1
+	if 'AcctIDSource' in d:
+		add('660=' + str(d['AcctIDSource']))
+		n += 1
+	if 'RegistAcctType' in d:
+		add('493=' + str(d['RegistAcctType']))
+		n += 1
+	if 'TaxAdvantageType' in d:
+		add('495=' + str(d['TaxAdvantageType']))
+		n += 1
+	if 'OwnershipType' in d:
+		add('517=' + str(d['OwnershipType']))
+		n += 1
+	if 'NoRegistDtls' in d:
+		grp = d['NoRegistDtls']
+		add('473=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoRegistDtls(entry, fixm)
+		n += 1
+	if 'NoDistribInsts' in d:
+		grp = d['NoDistribInsts']
+		add('510=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoDistribInsts(entry, fixm)
+		n += 1
+	if len(d) > n:
+		_make_mbody(obj, obj._context, fixm, _msg_RegistrationInstructions_names)
+	return fixm
+
+def _decode_RegistrationInstructions(obj, fields, index, context):
+	d = obj.__dict__
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _msg_RegistrationInstructions_tags.get(num)
+		if spec is None:
+			# not a field of this message, continue with generic decoder
+			body, index = _extract_body(fields, index, context, obj)
+			return index
+		name, pytype, decode_grp = spec
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	return index
 
 class RegistrationInstructions(FixObject):
-	pass
+	_encode = staticmethod(_encode_RegistrationInstructions)
+	_decode = staticmethod(_decode_RegistrationInstructions)
+
+_msg_RegistrationInstructionsResponse_names = frozenset(['RegistID', 'RegistTransType', 'RegistRefID', 'ClOrdID', 'NoPartyIDs', 'Account', 'AcctIDSource', 'RegistStatus', 'RegistRejReasonCode', 'RegistRejReasonText'])
+
+_msg_RegistrationInstructionsResponse_tags = {
+	513: ('RegistID', str, None),
+	514: ('RegistTransType', str, None),
+	508: ('RegistRefID', str, None),
+	11: ('ClOrdID', str, None),
+	453: ('NoPartyIDs', int, _decode_grp_NoPartyIDs),
+	1: ('Account', str, None),
+	660: ('AcctIDSource', int, None),
+	506: ('RegistStatus', str, None),
+	507: ('RegistRejReasonCode', int, None),
+	496: ('RegistRejReasonText', str, None),
+}
+
+def _encode_RegistrationInstructionsResponse(obj, fixm):
+	d = obj.__dict__
+	add = fixm.append
+	n = 1
+	if 'RegistID' in d:
+		add('513=' + str(d['RegistID']))
+		n += 1
+	if 'RegistTransType' in d:
+		add('514=' + str(d['RegistTransType']))
+		n += 1
+	if 'RegistRefID' in d:
+		add('508=' + str(d['RegistRefID']))
+		n += 1
+	if 'ClOrdID' in d:
+		add('11=' + str(d['ClOrdID']))
+		n += 1
+	if 'NoPartyIDs' in d:
+		grp = d['NoPartyIDs']
+		add('453=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoPartyIDs(entry, fixm)
+		n += 1
+	if 'Account' in d:
+		add('1=' + str(d['Account']))
+		n += 1
+	if 'AcctIDSource' in d:
+		add('660=' + str(d['AcctIDSource']))
+		n += 1
+	if 'RegistStatus' in d:
+		add('506=' + str(d['RegistStatus']))
+		n += 1
+	if 'RegistRejReasonCode' in d:
+		add('507=' + str(d['RegistRejReasonCode']))
+		n += 1
+	if 'RegistRejReasonText' in d:
+		add('496=' + str(d['RegistRejReasonText']))
+		n += 1
+	if len(d) > n:
+		_make_mbody(obj, obj._context, fixm, _msg_RegistrationInstructionsResponse_names)
+	return fixm
+
+def _decode_RegistrationInstructionsResponse(obj, fields, index, context):
+	d = obj.__dict__
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _msg_RegistrationInstructionsResponse_tags.get(num)
+		if spec is None:
+			# not a field of this message, continue with generic decoder
+			body, index = _extract_body(fields, index, context, obj)
+			return index
+		name, pytype, decode_grp = spec
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	return index
 
 class RegistrationInstructionsResponse(FixObject):
-	pass
+	_encode = staticmethod(_encode_RegistrationInstructionsResponse)
+	_decode = staticmethod(_decode_RegistrationInstructionsResponse)
+
+_msg_RequestForPositions_names = frozenset(['PosReqID', 'PosReqType', 'MatchStatus', 'SubscriptionRequestType', 'NoPartyIDs', 'Account', 'AcctIDSource', 'AccountType', 'Symbol', 'SymbolSfx', 'SecurityID', 'SecurityIDSource', 'NoSecurityAltID', 'Product', 'CFICode', 'SecurityType', 'SecuritySubType', 'MaturityMonthYear', 'MaturityDate', 'CouponPaymentDate', 'IssueDate', 'RepoCollateralSecurityType', 'RepurchaseTerm', 'RepurchaseRate', 'Factor', 'CreditRating', 'InstrRegistry', 'CountryOfIssue', 'StateOrProvinceOfIssue', 'LocaleOfIssue', 'RedemptionDate', 'StrikePrice', 'StrikeCurrency', 'OptAttribute', 'ContractMultiplier', 'CouponRate', 'SecurityExchange', 'Issuer', 'EncodedIssuerLen', 'EncodedIssuer', 'SecurityDesc', 'EncodedSecurityDescLen', 'EncodedSecurityDesc', 'Pool', 'ContractSettlMonth', 'CPProgram', 'CPRegType', 'NoEvents', 'DatedDate', 'InterestAccrualDate', 'Currency', 'NoLegs', 'NoUnderlyings', 'ClearingBusinessDate', 'SettlSessID', 'SettlSessSubID', 'NoTradingSessions', 'TransactTime', 'ResponseTransportType', 'ResponseDestination', 'Text', 'EncodedTextLen', 'EncodedText'])
+
+_msg_RequestForPositions_tags = {
+	710: ('PosReqID', str, None),
+	724: ('PosReqType', int, None),
+	573: ('MatchStatus', str, None),
+	263: ('SubscriptionRequestType', str, None),
+	453: ('NoPartyIDs', int, _decode_grp_NoPartyIDs),
+	1: ('Account', str, None),
+	660: ('AcctIDSource', int, None),
+	581: ('AccountType', int, None),
+	55: ('Symbol', str, None),
+	65: ('SymbolSfx', str, None),
+	48: ('SecurityID', str, None),
+	22: ('SecurityIDSource', str, None),
+	454: ('NoSecurityAltID', int, _decode_grp_NoSecurityAltID),
+	460: ('Product', int, None),
+	461: ('CFICode', str, None),
+	167: ('SecurityType', str, None),
+	762: ('SecuritySubType', str, None),
+	200: ('MaturityMonthYear', str, None),
+	541: ('MaturityDate', str, None),
+	224: ('CouponPaymentDate', str, None),
+	225: ('IssueDate', str, None),
+	239: ('RepoCollateralSecurityType', int, None),
+	226: ('RepurchaseTerm', int, None),
+	227: ('RepurchaseRate', float, None),
+	228: ('Factor', float, None),
+	255: ('CreditRating', str, None),
+	543: ('InstrRegistry', str, None),
+	470: ('CountryOfIssue', str, None),
+	471: ('StateOrProvinceOfIssue', str, None),
+	472: ('LocaleOfIssue', str, None),
+	240: ('RedemptionDate', str, None),
+	202: ('StrikePrice', float, None),
+	947: ('StrikeCurrency', str, None),
+	206: ('OptAttribute', str, None),
+	231: ('ContractMultiplier', float, None),
+	223: ('CouponRate', float, None),
+	207: ('SecurityExchange', str, None),
+	106: ('Issuer', str, None),
+	348: ('EncodedIssuerLen', str, None),
+	349: ('EncodedIssuer', str, None),
+	107: ('SecurityDesc', str, None),
+	350: ('EncodedSecurityDescLen', str, None),
+	351: ('EncodedSecurityDesc', str, None),
+	691: ('Pool', str, None),
+	667: ('ContractSettlMonth', str, None),
+	875: ('CPProgram', int, None),
+	876: ('CPRegType', str, None),
+	864: ('NoEvents', int, _decode_grp_NoEvents),
+	873: ('DatedDate', str, None),
+	874: ('InterestAccrualDate', str, None),
+	15: ('Currency', str, None),
+	555: ('NoLegs', int, _decode_grp_NoLegs),
+	711: ('NoUnderlyings', int, _decode_grp_NoUnderlyings),
+	715: ('ClearingBusinessDate', str, None),
+	716: ('SettlSessID', str, None),
+	717: ('SettlSessSubID', str, None),
+	386: ('NoTradingSessions', int, _decode_grp_NoTradingSessions),
+	60: ('TransactTime', str, None),
+	725: ('ResponseTransportType', int, None),
+	726: ('ResponseDestination', str, None),
+	58: ('Text', str, None),
+	354: ('EncodedTextLen', str, None),
+	355: ('EncodedText', str, None),
+}
+
+def _encode_RequestForPositions(obj, fixm):
+	d = obj.__dict__
+	add = fixm.append
+	n = 1
+	if 'PosReqID' in d:
+		add('710=' + str(d['PosReqID']))
+		n += 1
+	if 'PosReqType' in d:
+		add('724=' + str(d['PosReqType']))
+		n += 1
+	if 'MatchStatus' in d:
+		add('573=' + str(d['MatchStatus']))
+		n += 1
+	if 'SubscriptionRequestType' in d:
+		add('263=' + str(d['SubscriptionRequestType']))
+		n += 1
+	if 'NoPartyIDs' in d:
+		grp = d['NoPartyIDs']
+		add('453=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoPartyIDs(entry, fixm)
+		n += 1
+	if 'Account' in d:
+		add('1=' + str(d['Account']))
+		n += 1
+	if 'AcctIDSource' in d:
+		add('660=' + str(d['AcctIDSource']))
+		n += 1
+	if 'AccountType' in d:
+		add('581=' + str(d['AccountType']))
+		n += 1
+	if 'Symbol' in d:
+		add('55=' + str(d['Symbol']))
+		n += 1
+	if 'SymbolSfx' in d:
+		add('65=' + str(d['SymbolSfx']))
+		n += 1
+	if 'SecurityID' in d:
+		add('48=' + str(d['SecurityID']))
+		n += 1
+	if 'SecurityIDSource' in d:
+		add('22=' + str(d['SecurityIDSource']))
+		n += 1
+	if 'NoSecurityAltID' in d:
+		grp = d['NoSecurityAltID']
+		add('454=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoSecurityAltID(entry, fixm)
+		n += 1
+	if 'Product' in d:
+		add('460=' + str(d['Product']))
+		n += 1
+	if 'CFICode' in d:
+		add('461=' + str(d['CFICode']))
+		n += 1
+	if 'SecurityType' in d:
+		add('167=' + str(d['SecurityType']))
+		n += 1
+	if 'SecuritySubType' in d:
+		add('762=' + str(d['SecuritySubType']))
+		n += 1
+	if 'MaturityMonthYear' in d:
+		add('200=' + str(d['MaturityMonthYear']))
+		n += 1
+	if 'MaturityDate' in d:
+		add('541=' + str(d['MaturityDate']))
+		n += 1
+	if 'CouponPaymentDate' in d:
+		add('224=' + str(d['CouponPaymentDate']))
+		n += 1
+	if 'IssueDate' in d:
+		add('225=' + str(d['IssueDate']))
+		n += 1
+	if 'RepoCollateralSecurityType' in d:
+		add('239=' + str(d['RepoCollateralSecurityType']))
+		n += 1
+	if 'RepurchaseTerm' in d:
+		add('226=' + str(d['RepurchaseTerm']))
+		n += 1
+	if 'RepurchaseRate' in d:
+		add('227=' + str(d['RepurchaseRate']))
+		n += 1
+	if 'Factor' in d:
+		add('228=' + str(d['Factor']))
+		n += 1
+	if 'CreditRating' in d:
+		add('255=' + str(d['CreditRating']))
+		n += 1
+	if 'InstrRegistry' in d:
+		add('543=' + str(d['InstrRegistry']))
+		n += 1
+	if 'CountryOfIssue' in d:
+		add('470=' + str(d['CountryOfIssue']))
+		n += 1
+	if 'StateOrProvinceOfIssue' in d:
+		add('471=' + str(d['StateOrProvinceOfIssue']))
+		n += 1
+	if 'LocaleOfIssue' in d:
+		add('472=' + str(d['LocaleOfIssue']))
+		n += 1
+	if 'RedemptionDate' in d:
+		add('240=' + str(d['RedemptionDate']))
+		n += 1
+	if 'StrikePrice' in d:
+		add('202=' + str(d['StrikePrice']))
+		n += 1
+	if 'StrikeCurrency' in d:
+		add('947=' + str(d['StrikeCurrency']))
+		n += 1
+	if 'OptAttribute' in d:
+		add('206=' + str(d['OptAttribute']))
+		n += 1
+	if 'ContractMultiplier' in d:
+		add('231=' + str(d['ContractMultiplier']))
+		n += 1
+	if 'CouponRate' in d:
+		add('223=' + str(d['CouponRate']))
+		n += 1
+	if 'SecurityExchange' in d:
+		add('207=' + str(d['SecurityExchange']))
+		n += 1
+	if 'Issuer' in d:
+		add('106=' + str(d['Issuer']))
+		n += 1
+	if 'EncodedIssuerLen' in d:
+		add('348=' + str(d['EncodedIssuerLen']))
+		n += 1
+	if 'EncodedIssuer' in d:
+		add('349=' + str(d['EncodedIssuer']))
+		n += 1
+	if 'SecurityDesc' in d:
+		add('107=' + str(d['SecurityDesc']))
+		n += 1
+	if 'EncodedSecurityDescLen' in d:
+		add('350=' + str(d['EncodedSecurityDescLen']))
+		n += 1
+	if 'EncodedSecurityDesc' in d:
+		add('351=' + str(d['EncodedSecurityDesc']))
+		n += 1
+	if 'Pool' in d:
+		add('691=' + str(d['Pool']))
+		n += 1
+	if 'ContractSettlMonth' in d:
+		add('667=' + str(d['ContractSettlMonth']))
+		n += 1
+	if 'CPProgram' in d:
+		add('875=' + str(d['CPProgram']))
+		n += 1
+	if 'CPRegType' in d:
+		add('876=' + str(d['CPRegType']))
+		n += 1
+	if 'NoEvents' in d:
+		grp = d['NoEvents']
+		add('864=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoEvents(entry, fixm)
+		n += 1
+	if 'DatedDate' in d:
+		add('873=' + str(d['DatedDate']))
+		n += 1
+	if 'InterestAccrualDate' in d:
+		add('874=' + str(d['InterestAccrualDate']))
+		n += 1
+	if 'Currency' in d:
+		add('15=' + str(d['Currency']))
+		n += 1
+	if 'NoLegs' in d:
+		grp = d['NoLegs']
+		add('555=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoLegs(entry, fixm)
+		n += 1
+	if 'NoUnderlyings' in d:
+		grp = d['NoUnderlyings']
+		add('711=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoUnderlyings(entry, fixm)
+		n += 1
+	if 'ClearingBusinessDate' in d:
+		add('715=' + str(d['ClearingBusinessDate']))
+		n += 1
+	if 'SettlSessID' in d:
+		add('716=' + str(d['SettlSessID']))
+		n += 1
+	if 'SettlSessSubID' in d:
+		add('717=' + str(d['SettlSessSubID']))
+		n += 1
+	if 'NoTradingSessions' in d:
+		grp = d['NoTradingSessions']
+		add('386=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoTradingSessions(entry, fixm)
+		n += 1
+	if 'TransactTime' in d:
+		add('60=' + str(d['TransactTime']))
+		n += 1
+	if 'ResponseTransportType' in d:
+		add('725=' + str(d['ResponseTransportType']))
+		n += 1
+	if 'ResponseDestination' in d:
+		add('726=' + str(d['ResponseDestination']))
+		n += 1
+	if 'Text' in d:
+		add('58=' + str(d['Text']))
+		n += 1
+	if 'EncodedTextLen' in d:
+		add('354=' + str(d['EncodedTextLen']))
+		n += 1
+	if 'EncodedText' in d:
+		add('355=' + str(d['EncodedText']))
+		n += 1
+	if len(d) > n:
+		_make_mbody(obj, obj._context, fixm, _msg_RequestForPositions_names)
+	return fixm
+
+def _decode_RequestForPositions(obj, fields, index, context):
+	d = obj.__dict__
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _msg_RequestForPositions_tags.get(num)
+		if spec is None:
+			# not a field of this message, continue with generic decoder
+			body, index = _extract_body(fields, index, context, obj)
+			return index
+		name, pytype, decode_grp = spec
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	return index
 
 class RequestForPositions(FixObject):
-	pass
+	_encode = staticmethod(_encode_RequestForPositions)
+	_decode = staticmethod(_decode_RequestForPositions)
+
+_msg_RequestForPositionsAck_names = frozenset(['PosMaintRptID', 'PosReqID', 'TotalNumPosReports', 'UnsolicitedIndicator', 'PosReqResult', 'PosReqStatus', 'NoPartyIDs', 'Account', 'AcctIDSource', 'AccountType', 'Symbol', 'SymbolSfx', 'SecurityID', 'SecurityIDSource', 'NoSecurityAltID', 'Product', 'CFICode', 'SecurityType', 'SecuritySubType', 'MaturityMonthYear', 'MaturityDate', 'CouponPaymentDate', 'IssueDate', 'RepoCollateralSecurityType', 'RepurchaseTerm', 'RepurchaseRate', 'Factor', 'CreditRating', 'InstrRegistry', 'CountryOfIssue', 'StateOrProvinceOfIssue', 'LocaleOfIssue', 'RedemptionDate', 'StrikePrice', 'StrikeCurrency', 'OptAttribute', 'ContractMultiplier', 'CouponRate', 'SecurityExchange', 'Issuer', 'EncodedIssuerLen', 'EncodedIssuer', 'SecurityDesc', 'EncodedSecurityDescLen', 'EncodedSecurityDesc', 'Pool', 'ContractSettlMonth', 'CPProgram', 'CPRegType', 'NoEvents', 'DatedDate', 'InterestAccrualDate', 'Currency', 'NoLegs', 'NoUnderlyings', 'ResponseTransportType', 'ResponseDestination', 'Text', 'EncodedTextLen', 'EncodedText'])
+
+_msg_RequestForPositionsAck_tags = {
+	721: ('PosMaintRptID', str, None),
+	710: ('PosReqID', str, None),
+	727: ('TotalNumPosReports', int, None),
+	325: ('UnsolicitedIndicator', str, None),
+	728: ('PosReqResult', int, None),
+	729: ('PosReqStatus', int, None),
+	453: ('NoPartyIDs', int, _decode_grp_NoPartyIDs),
+	1: ('Account', str, None),
+	660: ('AcctIDSource', int, None),
+	581: ('AccountType', int, None),
+	55: ('Symbol', str, None),
+	65: ('SymbolSfx', str, None),
+	48: ('SecurityID', str, None),
+	22: ('SecurityIDSource', str, None),
+	454: ('NoSecurityAltID', int, _decode_grp_NoSecurityAltID),
+	460: ('Product', int, None),
+	461: ('CFICode', str, None),
+	167: ('SecurityType', str, None),
+	762: ('SecuritySubType', str, None),
+	200: ('MaturityMonthYear', str, None),
+	541: ('MaturityDate', str, None),
+	224: ('CouponPaymentDate', str, None),
+	225: ('IssueDate', str, None),
+	239: ('RepoCollateralSecurityType', int, None),
+	226: ('RepurchaseTerm', int, None),
+	227: ('RepurchaseRate', float, None),
+	228: ('Factor', float, None),
+	255: ('CreditRating', str, None),
+	543: ('InstrRegistry', str, None),
+	470: ('CountryOfIssue', str, None),
+	471: ('StateOrProvinceOfIssue', str, None),
+	472: ('LocaleOfIssue', str, None),
+	240: ('RedemptionDate', str, None),
+	202: ('StrikePrice', float, None),
+	947: ('StrikeCurrency', str, None),
+	206: ('OptAttribute', str, None),
+	231: ('ContractMultiplier', float, None),
+	223: ('CouponRate', float, None),
+	207: ('SecurityExchange', str, None),
+	106: ('Issuer', str, None),
+	348: ('EncodedIssuerLen', str, None),
+	349: ('EncodedIssuer', str, None),
+	107: ('SecurityDesc', str, None),
+	350: ('EncodedSecurityDescLen', str, None),
+	351: ('EncodedSecurityDesc', str, None),
+	691: ('Pool', str, None),
+	667: ('ContractSettlMonth', str, None),
+	875: ('CPProgram', int, None),
+	876: ('CPRegType', str, None),
+	864: ('NoEvents', int, _decode_grp_NoEvents),
+	873: ('DatedDate', str, None),
+	874: ('InterestAccrualDate', str, None),
+	15: ('Currency', str, None),
+	555: ('NoLegs', int, _decode_grp_NoLegs),
+	711: ('NoUnderlyings', int, _decode_grp_NoUnderlyings),
+	725: ('ResponseTransportType', int, None),
+	726: ('ResponseDestination', str, None),
+	58: ('Text', str, None),
+	354: ('EncodedTextLen', str, None),
+	355: ('EncodedText', str, None),
+}
+
+def _encode_RequestForPositionsAck(obj, fixm):
+	d = obj.__dict__
+	add = fixm.append
+	n = 1
+	if 'PosMaintRptID' in d:
+		add('721=' + str(d['PosMaintRptID']))
+		n += 1
+	if 'PosReqID' in d:
+		add('710=' + str(d['PosReqID']))
+		n += 1
+	if 'TotalNumPosReports' in d:
+		add('727=' + str(d['TotalNumPosReports']))
+		n += 1
+	if 'UnsolicitedIndicator' in d:
+		add('325=' + str(d['UnsolicitedIndicator']))
+		n += 1
+	if 'PosReqResult' in d:
+		add('728=' + str(d['PosReqResult']))
+		n += 1
+	if 'PosReqStatus' in d:
+		add('729=' + str(d['PosReqStatus']))
+		n += 1
+	if 'NoPartyIDs' in d:
+		grp = d['NoPartyIDs']
+		add('453=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoPartyIDs(entry, fixm)
+		n += 1
+	if 'Account' in d:
+		add('1=' + str(d['Account']))
+		n += 1
+	if 'AcctIDSource' in d:
+		add('660=' + str(d['AcctIDSource']))
+		n += 1
+	if 'AccountType' in d:
+		add('581=' + str(d['AccountType']))
+		n += 1
+	if 'Symbol' in d:
+		add('55=' + str(d['Symbol']))
+		n += 1
+	if 'SymbolSfx' in d:
+		add('65=' + str(d['SymbolSfx']))
+		n += 1
+	if 'SecurityID' in d:
+		add('48=' + str(d['SecurityID']))
+		n += 1
+	if 'SecurityIDSource' in d:
+		add('22=' + str(d['SecurityIDSource']))
+		n += 1
+	if 'NoSecurityAltID' in d:
+		grp = d['NoSecurityAltID']
+		add('454=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoSecurityAltID(entry, fixm)
+		n += 1
+	if 'Product' in d:
+		add('460=' + str(d['Product']))
+		n += 1
+	if 'CFICode' in d:
+		add('461=' + str(d['CFICode']))
+		n += 1
+	if 'SecurityType' in d:
+		add('167=' + str(d['SecurityType']))
+		n += 1
+	if 'SecuritySubType' in d:
+		add('762=' + str(d['SecuritySubType']))
+		n += 1
+	if 'MaturityMonthYear' in d:
+		add('200=' + str(d['MaturityMonthYear']))
+		n += 1
+	if 'MaturityDate' in d:
+		add('541=' + str(d['MaturityDate']))
+		n += 1
+	if 'CouponPaymentDate' in d:
+		add('224=' + str(d['CouponPaymentDate']))
+		n += 1
+	if 'IssueDate' in d:
+		add('225=' + str(d['IssueDate']))
+		n += 1
+	if 'RepoCollateralSecurityType' in d:
+		add('239=' + str(d['RepoCollateralSecurityType']))
+		n += 1
+	if 'RepurchaseTerm' in d:
+		add('226=' + str(d['RepurchaseTerm']))
+		n += 1
+	if 'RepurchaseRate' in d:
+		add('227=' + str(d['RepurchaseRate']))
+		n += 1
+	if 'Factor' in d:
+		add('228=' + str(d['Factor']))
+		n += 1
+	if 'CreditRating' in d:
+		add('255=' + str(d['CreditRating']))
+		n += 1
+	if 'InstrRegistry' in d:
+		add('543=' + str(d['InstrRegistry']))
+		n += 1
+	if 'CountryOfIssue' in d:
+		add('470=' + str(d['CountryOfIssue']))
+		n += 1
+	if 'StateOrProvinceOfIssue' in d:
+		add('471=' + str(d['StateOrProvinceOfIssue']))
+		n += 1
+	if 'LocaleOfIssue' in d:
+		add('472=' + str(d['LocaleOfIssue']))
+		n += 1
+	if 'RedemptionDate' in d:
+		add('240=' + str(d['RedemptionDate']))
+		n += 1
+	if 'StrikePrice' in d:
+		add('202=' + str(d['StrikePrice']))
+		n += 1
+	if 'StrikeCurrency' in d:
+		add('947=' + str(d['StrikeCurrency']))
+		n += 1
+	if 'OptAttribute' in d:
+		add('206=' + str(d['OptAttribute']))
+		n += 1
+	if 'ContractMultiplier' in d:
+		add('231=' + str(d['ContractMultiplier']))
+		n += 1
+	if 'CouponRate' in d:
+		add('223=' + str(d['CouponRate']))
+		n += 1
+	if 'SecurityExchange' in d:
+		add('207=' + str(d['SecurityExchange']))
+		n += 1
+	if 'Issuer' in d:
+		add('106=' + str(d['Issuer']))
+		n += 1
+	if 'EncodedIssuerLen' in d:
+		add('348=' + str(d['EncodedIssuerLen']))
+		n += 1
+	if 'EncodedIssuer' in d:
+		add('349=' + str(d['EncodedIssuer']))
+		n += 1
+	if 'SecurityDesc' in d:
+		add('107=' + str(d['SecurityDesc']))
+		n += 1
+	if 'EncodedSecurityDescLen' in d:
+		add('350=' + str(d['EncodedSecurityDescLen']))
+		n += 1
+	if 'EncodedSecurityDesc' in d:
+		add('351=' + str(d['EncodedSecurityDesc']))
+		n += 1
+	if 'Pool' in d:
+		add('691=' + str(d['Pool']))
+		n += 1
+	if 'ContractSettlMonth' in d:
+		add('667=' + str(d['ContractSettlMonth']))
+		n += 1
+	if 'CPProgram' in d:
+		add('875=' + str(d['CPProgram']))
+		n += 1
+	if 'CPRegType' in d:
+		add('876=' + str(d['CPRegType']))
+		n += 1
+	if 'NoEvents' in d:
+		grp = d['NoEvents']
+		add('864=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoEvents(entry, fixm)
+		n += 1
+	if 'DatedDate' in d:
+		add('873=' + str(d['DatedDate']))
+		n += 1
+	if 'InterestAccrualDate' in d:
+		add('874=' + str(d['InterestAccrualDate']))
+		n += 1
+	if 'Currency' in d:
+		add('15=' + str(d['Currency']))
+		n += 1
+	if 'NoLegs' in d:
+		grp = d['NoLegs']
+		add('555=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoLegs(entry, fixm)
+		n += 1
+	if 'NoUnderlyings' in d:
+		grp = d['NoUnderlyings']
+		add('711=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoUnderlyings(entry, fixm)
+		n += 1
+	if 'ResponseTransportType' in d:
+		add('725=' + str(d['ResponseTransportType']))
+		n += 1
+	if 'ResponseDestination' in d:
+		add('726=' + str(d['ResponseDestination']))
+		n += 1
+	if 'Text' in d:
+		add('58=' + str(d['Text']))
+		n += 1
+	if 'EncodedTextLen' in d:
+		add('354=' + str(d['EncodedTextLen']))
+		n += 1
+	if 'EncodedText' in d:
+		add('355=' + str(d['EncodedText']))
+		n += 1
+	if len(d) > n:
+		_make_mbody(obj, obj._context, fixm, _msg_RequestForPositionsAck_names)
+	return fixm
+
+def _decode_RequestForPositionsAck(obj, fields, index, context):
+	d = obj.__dict__
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _msg_RequestForPositionsAck_tags.get(num)
+		if spec is None:
+			# not a field of this message, continue with generic decoder
+			body, index = _extract_body(fields, index, context, obj)
+			return index
+		name, pytype, decode_grp = spec
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	return index
 
 class RequestForPositionsAck(FixObject):
-	pass
+	_encode = staticmethod(_encode_RequestForPositionsAck)
+	_decode = staticmethod(_decode_RequestForPositionsAck)
+
+_msg_SecurityDefinition_names = frozenset(['SecurityReqID', 'SecurityResponseID', 'SecurityResponseType', 'Symbol', 'SymbolSfx', 'SecurityID', 'SecurityIDSource', 'NoSecurityAltID', 'Product', 'CFICode', 'SecurityType', 'SecuritySubType', 'MaturityMonthYear', 'MaturityDate', 'CouponPaymentDate', 'IssueDate', 'RepoCollateralSecurityType', 'RepurchaseTerm', 'RepurchaseRate', 'Factor', 'CreditRating', 'InstrRegistry', 'CountryOfIssue', 'StateOrProvinceOfIssue', 'LocaleOfIssue', 'RedemptionDate', 'StrikePrice', 'StrikeCurrency', 'OptAttribute', 'ContractMultiplier', 'CouponRate', 'SecurityExchange', 'Issuer', 'EncodedIssuerLen', 'EncodedIssuer', 'SecurityDesc', 'EncodedSecurityDescLen', 'EncodedSecurityDesc', 'Pool', 'ContractSettlMonth', 'CPProgram', 'CPRegType', 'NoEvents', 'DatedDate', 'InterestAccrualDate', 'DeliveryForm', 'PctAtRisk', 'NoInstrAttrib', 'NoUnderlyings', 'Currency', 'TradingSessionID', 'TradingSessionSubID', 'Text', 'EncodedTextLen', 'EncodedText', 'NoLegs', 'ExpirationCycle', 'RoundLot', 'MinTradeVol'])
+
+_msg_SecurityDefinition_tags = {
+	320: ('SecurityReqID', str, None),
+	322: ('SecurityResponseID', str, None),
+	323: ('SecurityResponseType', int, None),
+	55: ('Symbol', str, None),
+	65: ('SymbolSfx', str, None),
+	48: ('SecurityID', str, None),
+	22: ('SecurityIDSource', str, None),
+	454: ('NoSecurityAltID', int, _decode_grp_NoSecurityAltID),
+	460: ('Product', int, None),
+	461: ('CFICode', str, None),
+	167: ('SecurityType', str, None),
+	762: ('SecuritySubType', str, None),
+	200: ('MaturityMonthYear', str, None),
+	541: ('MaturityDate', str, None),
+	224: ('CouponPaymentDate', str, None),
+	225: ('IssueDate', str, None),
+	239: ('RepoCollateralSecurityType', int, None),
+	226: ('RepurchaseTerm', int, None),
+	227: ('RepurchaseRate', float, None),
+	228: ('Factor', float, None),
+	255: ('CreditRating', str, None),
+	543: ('InstrRegistry', str, None),
+	470: ('CountryOfIssue', str, None),
+	471: ('StateOrProvinceOfIssue', str, None),
+	472: ('LocaleOfIssue', str, None),
+	240: ('RedemptionDate', str, None),
+	202: ('StrikePrice', float, None),
+	947: ('StrikeCurrency', str, None),
+	206: ('OptAttribute', str, None),
+	231: ('ContractMultiplier', float, None),
+	223: ('CouponRate', float, None),
+	207: ('SecurityExchange', str, None),
+	106: ('Issuer', str, None),
+	348: ('EncodedIssuerLen', str, None),
+	349: ('EncodedIssuer', str, None),
+	107: ('SecurityDesc', str, None),
+	350: ('EncodedSecurityDescLen', str, None),
+	351: ('EncodedSecurityDesc', str, None),
+	691: ('Pool', str, None),
+	667: ('ContractSettlMonth', str, None),
+	875: ('CPProgram', int, None),
+	876: ('CPRegType', str, None),
+	864: ('NoEvents', int, _decode_grp_NoEvents),
+	873: ('DatedDate', str, None),
+	874: ('InterestAccrualDate', str, None),
+	668: ('DeliveryForm', int, None),
+	869: ('PctAtRisk', float, None),
+	870: ('NoInstrAttrib', int, _decode_grp_NoInstrAttrib),
+	711: ('NoUnderlyings', int, _decode_grp_NoUnderlyings),
+	15: ('Currency', str, None),
+	336: ('TradingSessionID', str, None),
+	625: ('TradingSessionSubID', str, None),
+	58: ('Text', str, None),
+	354: ('EncodedTextLen', str, None),
+	355: ('EncodedText', str, None),
+	555: ('NoLegs', int, _decode_grp_NoLegs),
+	827: ('ExpirationCycle', int, None),
+	561: ('RoundLot', float, None),
+	562: ('MinTradeVol', float, None),
+}
+
+def _encode_SecurityDefinition(obj, fixm):
+	d = obj.__dict__
+	add = fixm.append
+	n = 1
+	if 'SecurityReqID' in d:
+		add('320=' + str(d['SecurityReqID']))
+		n += 1
+	if 'SecurityResponseID' in d:
+		add('322=' + str(d['SecurityResponseID']))
+		n += 1
+	if 'SecurityResponseType' in d:
+		add('323=' + str(d['SecurityResponseType']))
+		n += 1
+	if 'Symbol' in d:
+		add('55=' + str(d['Symbol']))
+		n += 1
+	if 'SymbolSfx' in d:
+		add('65=' + str(d['SymbolSfx']))
+		n += 1
+	if 'SecurityID' in d:
+		add('48=' + str(d['SecurityID']))
+		n += 1
+	if 'SecurityIDSource' in d:
+		add('22=' + str(d['SecurityIDSource']))
+		n += 1
+	if 'NoSecurityAltID' in d:
+		grp = d['NoSecurityAltID']
+		add('454=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoSecurityAltID(entry, fixm)
+		n += 1
+	if 'Product' in d:
+		add('460=' + str(d['Product']))
+		n += 1
+	if 'CFICode' in d:
+		add('461=' + str(d['CFICode']))
+		n += 1
+	if 'SecurityType' in d:
+		add('167=' + str(d['SecurityType']))
+		n += 1
+	if 'SecuritySubType' in d:
+		add('762=' + str(d['SecuritySubType']))
+		n += 1
+	if 'MaturityMonthYear' in d:
+		add('200=' + str(d['MaturityMonthYear']))
+		n += 1
+	if 'MaturityDate' in d:
+		add('541=' + str(d['MaturityDate']))
+		n += 1
+	if 'CouponPaymentDate' in d:
+		add('224=' + str(d['CouponPaymentDate']))
+		n += 1
+	if 'IssueDate' in d:
+		add('225=' + str(d['IssueDate']))
+		n += 1
+	if 'RepoCollateralSecurityType' in d:
+		add('239=' + str(d['RepoCollateralSecurityType']))
+		n += 1
+	if 'RepurchaseTerm' in d:
+		add('226=' + str(d['RepurchaseTerm']))
+		n += 1
+	if 'RepurchaseRate' in d:
+		add('227=' + str(d['RepurchaseRate']))
+		n += 1
+	if 'Factor' in d:
+		add('228=' + str(d['Factor']))
+		n += 1
+	if 'CreditRating' in d:
+		add('255=' + str(d['CreditRating']))
+		n += 1
+	if 'InstrRegistry' in d:
+		add('543=' + str(d['InstrRegistry']))
+		n += 1
+	if 'CountryOfIssue' in d:
+		add('470=' + str(d['CountryOfIssue']))
+		n += 1
+	if 'StateOrProvinceOfIssue' in d:
+		add('471=' + str(d['StateOrProvinceOfIssue']))
+		n += 1
+	if 'LocaleOfIssue' in d:
+		add('472=' + str(d['LocaleOfIssue']))
+		n += 1
+	if 'RedemptionDate' in d:
+		add('240=' + str(d['RedemptionDate']))
+		n += 1
+	if 'StrikePrice' in d:
+		add('202=' + str(d['StrikePrice']))
+		n += 1
+	if 'StrikeCurrency' in d:
+		add('947=' + str(d['StrikeCurrency']))
+		n += 1
+	if 'OptAttribute' in d:
+		add('206=' + str(d['OptAttribute']))
+		n += 1
+	if 'ContractMultiplier' in d:
+		add('231=' + str(d['ContractMultiplier']))
+		n += 1
+	if 'CouponRate' in d:
+		add('223=' + str(d['CouponRate']))
+		n += 1
+	if 'SecurityExchange' in d:
+		add('207=' + str(d['SecurityExchange']))
+		n += 1
+	if 'Issuer' in d:
+		add('106=' + str(d['Issuer']))
+		n += 1
+	if 'EncodedIssuerLen' in d:
+		add('348=' + str(d['EncodedIssuerLen']))
+		n += 1
+	if 'EncodedIssuer' in d:
+		add('349=' + str(d['EncodedIssuer']))
+		n += 1
+	if 'SecurityDesc' in d:
+		add('107=' + str(d['SecurityDesc']))
+		n += 1
+	if 'EncodedSecurityDescLen' in d:
+		add('350=' + str(d['EncodedSecurityDescLen']))
+		n += 1
+	if 'EncodedSecurityDesc' in d:
+		add('351=' + str(d['EncodedSecurityDesc']))
+		n += 1
+	if 'Pool' in d:
+		add('691=' + str(d['Pool']))
+		n += 1
+	if 'ContractSettlMonth' in d:
+		add('667=' + str(d['ContractSettlMonth']))
+		n += 1
+	if 'CPProgram' in d:
+		add('875=' + str(d['CPProgram']))
+		n += 1
+	if 'CPRegType' in d:
+		add('876=' + str(d['CPRegType']))
+		n += 1
+	if 'NoEvents' in d:
+		grp = d['NoEvents']
+		add('864=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoEvents(entry, fixm)
+		n += 1
+	if 'DatedDate' in d:
+		add('873=' + str(d['DatedDate']))
+		n += 1
+	if 'InterestAccrualDate' in d:
+		add('874=' + str(d['InterestAccrualDate']))
+		n += 1
+	if 'DeliveryForm' in d:
+		add('668=' + str(d['DeliveryForm']))
+		n += 1
+	if 'PctAtRisk' in d:
+		add('869=' + str(d['PctAtRisk']))
+		n += 1
+	if 'NoInstrAttrib' in d:
+		grp = d['NoInstrAttrib']
+		add('870=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoInstrAttrib(entry, fixm)
+		n += 1
+	if 'NoUnderlyings' in d:
+		grp = d['NoUnderlyings']
+		add('711=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoUnderlyings(entry, fixm)
+		n += 1
+	if 'Currency' in d:
+		add('15=' + str(d['Currency']))
+		n += 1
+	if 'TradingSessionID' in d:
+		add('336=' + str(d['TradingSessionID']))
+		n += 1
+	if 'TradingSessionSubID' in d:
+		add('625=' + str(d['TradingSessionSubID']))
+		n += 1
+	if 'Text' in d:
+		add('58=' + str(d['Text']))
+		n += 1
+	if 'EncodedTextLen' in d:
+		add('354=' + str(d['EncodedTextLen']))
+		n += 1
+	if 'EncodedText' in d:
+		add('355=' + str(d['EncodedText']))
+		n += 1
+	if 'NoLegs' in d:
+		grp = d['NoLegs']
+		add('555=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoLegs(entry, fixm)
+		n += 1
+	if 'ExpirationCycle' in d:
+		add('827=' + str(d['ExpirationCycle']))
+		n += 1
+	if 'RoundLot' in d:
+		add('561=' + str(d['RoundLot']))
+		n += 1
+	if 'MinTradeVol' in d:
+		add('562=' + str(d['MinTradeVol']))
+		n += 1
+	if len(d) > n:
+		_make_mbody(obj, obj._context, fixm, _msg_SecurityDefinition_names)
+	return fixm
+
+def _decode_SecurityDefinition(obj, fields, index, context):
+	d = obj.__dict__
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _msg_SecurityDefinition_tags.get(num)
+		if spec is None:
+			# not a field of this message, continue with generic decoder
+			body, index = _extract_body(fields, index, context, obj)
+			return index
+		name, pytype, decode_grp = spec
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	return index
 
 class SecurityDefinition(FixObject):
-	pass
+	_encode = staticmethod(_encode_SecurityDefinition)
+	_decode = staticmethod(_decode_SecurityDefinition)
+
+_msg_SecurityDefinitionRequest_names = frozenset(['SecurityReqID', 'SecurityRequestType', 'Symbol', 'SymbolSfx', 'SecurityID', 'SecurityIDSource', 'NoSecurityAltID', 'Product', 'CFICode', 'SecurityType', 'SecuritySubType', 'MaturityMonthYear', 'MaturityDate', 'CouponPaymentDate', 'IssueDate', 'RepoCollateralSecurityType', 'RepurchaseTerm', 'RepurchaseRate', 'Factor', 'CreditRating', 'InstrRegistry', 'CountryOfIssue', 'StateOrProvinceOfIssue', 'LocaleOfIssue', 'RedemptionDate', 'StrikePrice', 'StrikeCurrency', 'OptAttribute', 'ContractMultiplier', 'CouponRate', 'SecurityExchange', 'Issuer', 'EncodedIssuerLen', 'EncodedIssuer', 'SecurityDesc', 'EncodedSecurityDescLen', 'EncodedSecurityDesc', 'Pool', 'ContractSettlMonth', 'CPProgram', 'CPRegType', 'NoEvents', 'DatedDate', 'InterestAccrualDate', 'DeliveryForm', 'PctAtRisk', 'NoInstrAttrib', 'NoUnderlyings', 'Currency', 'Text', 'EncodedTextLen', 'EncodedText', 'TradingSessionID', 'TradingSessionSubID', 'NoLegs', 'ExpirationCycle', 'SubscriptionRequestType'])
+
+_msg_SecurityDefinitionRequest_tags = {
+	320: ('SecurityReqID', str, None),
+	321: ('SecurityRequestType', int, None),
+	55: ('Symbol', str, None),
+	65: ('SymbolSfx', str, None),
+	48: ('SecurityID', str, None),
+	22: ('SecurityIDSource', str, None),
+	454: ('NoSecurityAltID', int, _decode_grp_NoSecurityAltID),
+	460: ('Product', int, None),
+	461: ('CFICode', str, None),
+	167: ('SecurityType', str, None),
+	762: ('SecuritySubType', str, None),
+	200: ('MaturityMonthYear', str, None),
+	541: ('MaturityDate', str, None),
+	224: ('CouponPaymentDate', str, None),
+	225: ('IssueDate', str, None),
+	239: ('RepoCollateralSecurityType', int, None),
+	226: ('RepurchaseTerm', int, None),
+	227: ('RepurchaseRate', float, None),
+	228: ('Factor', float, None),
+	255: ('CreditRating', str, None),
+	543: ('InstrRegistry', str, None),
+	470: ('CountryOfIssue', str, None),
+	471: ('StateOrProvinceOfIssue', str, None),
+	472: ('LocaleOfIssue', str, None),
+	240: ('RedemptionDate', str, None),
+	202: ('StrikePrice', float, None),
+	947: ('StrikeCurrency', str, None),
+	206: ('OptAttribute', str, None),
+	231: ('ContractMultiplier', float, None),
+	223: ('CouponRate', float, None),
+	207: ('SecurityExchange', str, None),
+	106: ('Issuer', str, None),
+	348: ('EncodedIssuerLen', str, None),
+	349: ('EncodedIssuer', str, None),
+	107: ('SecurityDesc', str, None),
+	350: ('EncodedSecurityDescLen', str, None),
+	351: ('EncodedSecurityDesc', str, None),
+	691: ('Pool', str, None),
+	667: ('ContractSettlMonth', str, None),
+	875: ('CPProgram', int, None),
+	876: ('CPRegType', str, None),
+	864: ('NoEvents', int, _decode_grp_NoEvents),
+	873: ('DatedDate', str, None),
+	874: ('InterestAccrualDate', str, None),
+	668: ('DeliveryForm', int, None),
+	869: ('PctAtRisk', float, None),
+	870: ('NoInstrAttrib', int, _decode_grp_NoInstrAttrib),
+	711: ('NoUnderlyings', int, _decode_grp_NoUnderlyings),
+	15: ('Currency', str, None),
+	58: ('Text', str, None),
+	354: ('EncodedTextLen', str, None),
+	355: ('EncodedText', str, None),
+	336: ('TradingSessionID', str, None),
+	625: ('TradingSessionSubID', str, None),
+	555: ('NoLegs', int, _decode_grp_NoLegs),
+	827: ('ExpirationCycle', int, None),
+	263: ('SubscriptionRequestType', str, None),
+}
+
+def _encode_SecurityDefinitionRequest(obj, fixm):
+	d = obj.__dict__
+	add = fixm.append
+	n = 1
+	if 'SecurityReqID' in d:
+		add('320=' + str(d['SecurityReqID']))
+		n += 1
+	if 'SecurityRequestType' in d:
+		add('321=' + str(d['SecurityRequestType']))
+		n += 1
+	if 'Symbol' in d:
+		add('55=' + str(d['Symbol']))
+		n += 1
+	if 'SymbolSfx' in d:
+		add('65=' + str(d['SymbolSfx']))
+		n += 1
+	if 'SecurityID' in d:
+		add('48=' + str(d['SecurityID']))
+		n += 1
+	if 'SecurityIDSource' in d:
+		add('22=' + str(d['SecurityIDSource']))
+		n += 1
+	if 'NoSecurityAltID' in d:
+		grp = d['NoSecurityAltID']
+		add('454=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoSecurityAltID(entry, fixm)
+		n += 1
+	if 'Product' in d:
+		add('460=' + str(d['Product']))
+		n += 1
+	if 'CFICode' in d:
+		add('461=' + str(d['CFICode']))
+		n += 1
+	if 'SecurityType' in d:
+		add('167=' + str(d['SecurityType']))
+		n += 1
+	if 'SecuritySubType' in d:
+		add('762=' + str(d['SecuritySubType']))
+		n += 1
+	if 'MaturityMonthYear' in d:
+		add('200=' + str(d['MaturityMonthYear']))
+		n += 1
+	if 'MaturityDate' in d:
+		add('541=' + str(d['MaturityDate']))
+		n += 1
+	if 'CouponPaymentDate' in d:
+		add('224=' + str(d['CouponPaymentDate']))
+		n += 1
+	if 'IssueDate' in d:
+		add('225=' + str(d['IssueDate']))
+		n += 1
+	if 'RepoCollateralSecurityType' in d:
+		add('239=' + str(d['RepoCollateralSecurityType']))
+		n += 1
+	if 'RepurchaseTerm' in d:
+		add('226=' + str(d['RepurchaseTerm']))
+		n += 1
+	if 'RepurchaseRate' in d:
+		add('227=' + str(d['RepurchaseRate']))
+		n += 1
+	if 'Factor' in d:
+		add('228=' + str(d['Factor']))
+		n += 1
+	if 'CreditRating' in d:
+		add('255=' + str(d['CreditRating']))
+		n += 1
+	if 'InstrRegistry' in d:
+		add('543=' + str(d['InstrRegistry']))
+		n += 1
+	if 'CountryOfIssue' in d:
+		add('470=' + str(d['CountryOfIssue']))
+		n += 1
+	if 'StateOrProvinceOfIssue' in d:
+		add('471=' + str(d['StateOrProvinceOfIssue']))
+		n += 1
+	if 'LocaleOfIssue' in d:
+		add('472=' + str(d['LocaleOfIssue']))
+		n += 1
+	if 'RedemptionDate' in d:
+		add('240=' + str(d['RedemptionDate']))
+		n += 1
+	if 'StrikePrice' in d:
+		add('202=' + str(d['StrikePrice']))
+		n += 1
+	if 'StrikeCurrency' in d:
+		add('947=' + str(d['StrikeCurrency']))
+		n += 1
+	if 'OptAttribute' in d:
+		add('206=' + str(d['OptAttribute']))
+		n += 1
+	if 'ContractMultiplier' in d:
+		add('231=' + str(d['ContractMultiplier']))
+		n += 1
+	if 'CouponRate' in d:
+		add('223=' + str(d['CouponRate']))
+		n += 1
+	if 'SecurityExchange' in d:
+		add('207=' + str(d['SecurityExchange']))
+		n += 1
+	if 'Issuer' in d:
+		add('106=' + str(d['Issuer']))
+		n += 1
+	if 'EncodedIssuerLen' in d:
+		add('348=' + str(d['EncodedIssuerLen']))
+		n += 1
+	if 'EncodedIssuer' in d:
+		add('349=' + str(d['EncodedIssuer']))
+		n += 1
+	if 'SecurityDesc' in d:
+		add('107=' + str(d['SecurityDesc']))
+		n += 1
+	if 'EncodedSecurityDescLen' in d:
+		add('350=' + str(d['EncodedSecurityDescLen']))
+		n += 1
+	if 'EncodedSecurityDesc' in d:
+		add('351=' + str(d['EncodedSecurityDesc']))
+		n += 1
+	if 'Pool' in d:
+		add('691=' + str(d['Pool']))
+		n += 1
+	if 'ContractSettlMonth' in d:
+		add('667=' + str(d['ContractSettlMonth']))
+		n += 1
+	if 'CPProgram' in d:
+		add('875=' + str(d['CPProgram']))
+		n += 1
+	if 'CPRegType' in d:
+		add('876=' + str(d['CPRegType']))
+		n += 1
+	if 'NoEvents' in d:
+		grp = d['NoEvents']
+		add('864=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoEvents(entry, fixm)
+		n += 1
+	if 'DatedDate' in d:
+		add('873=' + str(d['DatedDate']))
+		n += 1
+	if 'InterestAccrualDate' in d:
+		add('874=' + str(d['InterestAccrualDate']))
+		n += 1
+	if 'DeliveryForm' in d:
+		add('668=' + str(d['DeliveryForm']))
+		n += 1
+	if 'PctAtRisk' in d:
+		add('869=' + str(d['PctAtRisk']))
+		n += 1
+	if 'NoInstrAttrib' in d:
+		grp = d['NoInstrAttrib']
+		add('870=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoInstrAttrib(entry, fixm)
+		n += 1
+	if 'NoUnderlyings' in d:
+		grp = d['NoUnderlyings']
+		add('711=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoUnderlyings(entry, fixm)
+		n += 1
+	if 'Currency' in d:
+		add('15=' + str(d['Currency']))
+		n += 1
+	if 'Text' in d:
+		add('58=' + str(d['Text']))
+		n += 1
+	if 'EncodedTextLen' in d:
+		add('354=' + str(d['EncodedTextLen']))
+		n += 1
+	if 'EncodedText' in d:
+		add('355=' + str(d['EncodedText']))
+		n += 1
+	if 'TradingSessionID' in d:
+		add('336=' + str(d['TradingSessionID']))
+		n += 1
+	if 'TradingSessionSubID' in d:
+		add('625=' + str(d['TradingSessionSubID']))
+		n += 1
+	if 'NoLegs' in d:
+		grp = d['NoLegs']
+		add('555=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoLegs(entry, fixm)
+		n += 1
+	if 'ExpirationCycle' in d:
+		add('827=' + str(d['ExpirationCycle']))
+		n += 1
+	if 'SubscriptionRequestType' in d:
+		add('263=' + str(d['SubscriptionRequestType']))
+		n += 1
+	if len(d) > n:
+		_make_mbody(obj, obj._context, fixm, _msg_SecurityDefinitionRequest_names)
+	return fixm
+
+def _decode_SecurityDefinitionRequest(obj, fields, index, context):
+	d = obj.__dict__
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _msg_SecurityDefinitionRequest_tags.get(num)
+		if spec is None:
+			# not a field of this message, continue with generic decoder
+			body, index = _extract_body(fields, index, context, obj)
+			return index
+		name, pytype, decode_grp = spec
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	return index
 
 class SecurityDefinitionRequest(FixObject):
-	pass
+	_encode = staticmethod(_encode_SecurityDefinitionRequest)
+	_decode = staticmethod(_decode_SecurityDefinitionRequest)
+
+_msg_SecurityList_names = frozenset(['SecurityReqID', 'SecurityResponseID', 'SecurityRequestResult', 'TotNoRelatedSym', 'LastFragment', 'NoRelatedSym'])
+
+_msg_SecurityList_tags = {
+	320: ('SecurityReqID', str, None),
+	322: ('SecurityResponseID', str, None),
+	560: ('SecurityRequestResult', int, None),
+	393: ('TotNoRelatedSym', int, None),
+	893: ('LastFragment', str, None),
+	146: ('NoRelatedSym', int, _decode_grp_NoRelatedSym),
+}
+
+def _encode_SecurityList(obj, fixm):
+	d = obj.__dict__
+	add = fixm.append
+	n = 1
+	if 'SecurityReqID' in d:
+		add('320=' + str(d['SecurityReqID']))
+		n += 1
+	if 'SecurityResponseID' in d:
+		add('322=' + str(d['SecurityResponseID']))
+		n += 1
+	if 'SecurityRequestResult' in d:
+		add('560=' + str(d['SecurityRequestResult']))
+		n += 1
+	if 'TotNoRelatedSym' in d:
+		add('393=' + str(d['TotNoRelatedSym']))
+		n += 1
+	if 'LastFragment' in d:
+		add('893=' + str(d['LastFragment']))
+		n += 1
+	if 'NoRelatedSym' in d:
+		grp = d['NoRelatedSym']
+		add('146=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoRelatedSym(entry, fixm)
+		n += 1
+	if len(d) > n:
+		_make_mbody(obj, obj._context, fixm, _msg_SecurityList_names)
+	return fixm
+
+def _decode_SecurityList(obj, fields, index, context):
+	d = obj.__dict__
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _msg_SecurityList_tags.get(num)
+		if spec is None:
+			# not a field of this message, continue with generic decoder
+			body, index = _extract_body(fields, index, context, obj)
+			return index
+		name, pytype, decode_grp = spec
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	return index
 
 class SecurityList(FixObject):
-	pass
+	_encode = staticmethod(_encode_SecurityList)
+	_decode = staticmethod(_decode_SecurityList)
+
+_msg_SecurityListRequest_names = frozenset(['SecurityReqID', 'SecurityListRequestType', 'Symbol', 'SymbolSfx', 'SecurityID', 'SecurityIDSource', 'NoSecurityAltID', 'Product', 'CFICode', 'SecurityType', 'SecuritySubType', 'MaturityMonthYear', 'MaturityDate', 'CouponPaymentDate', 'IssueDate', 'RepoCollateralSecurityType', 'RepurchaseTerm', 'RepurchaseRate', 'Factor', 'CreditRating', 'InstrRegistry', 'CountryOfIssue', 'StateOrProvinceOfIssue', 'LocaleOfIssue', 'RedemptionDate', 'StrikePrice', 'StrikeCurrency', 'OptAttribute', 'ContractMultiplier', 'CouponRate', 'SecurityExchange', 'Issuer', 'EncodedIssuerLen', 'EncodedIssuer', 'SecurityDesc', 'EncodedSecurityDescLen', 'EncodedSecurityDesc', 'Pool', 'ContractSettlMonth', 'CPProgram', 'CPRegType', 'NoEvents', 'DatedDate', 'InterestAccrualDate', 'DeliveryForm', 'PctAtRisk', 'NoInstrAttrib', 'AgreementDesc', 'AgreementID', 'AgreementDate', 'AgreementCurrency', 'TerminationType', 'StartDate', 'EndDate', 'DeliveryType', 'MarginRatio', 'NoUnderlyings', 'NoLegs', 'Currency', 'Text', 'EncodedTextLen', 'EncodedText', 'TradingSessionID', 'TradingSessionSubID', 'SubscriptionRequestType'])
+
+_msg_SecurityListRequest_tags = {
+	320: ('SecurityReqID', str, None),
+	559: ('SecurityListRequestType', int, None),
+	55: ('Symbol', str, None),
+	65: ('SymbolSfx', str, None),
+	48: ('SecurityID', str, None),
+	22: ('SecurityIDSource', str, None),
+	454: ('NoSecurityAltID', int, _decode_grp_NoSecurityAltID),
+	460: ('Product', int, None),
+	461: ('CFICode', str, None),
+	167: ('SecurityType', str, None),
+	762: ('SecuritySubType', str, None),
+	200: ('MaturityMonthYear', str, None),
+	541: ('MaturityDate', str, None),
+	224: ('CouponPaymentDate', str, None),
+	225: ('IssueDate', str, None),
+	239: ('RepoCollateralSecurityType', int, None),
+	226: ('RepurchaseTerm', int, None),
+	227: ('RepurchaseRate', float, None),
+	228: ('Factor', float, None),
+	255: ('CreditRating', str, None),
+	543: ('InstrRegistry', str, None),
+	470: ('CountryOfIssue', str, None),
+	471: ('StateOrProvinceOfIssue', str, None),
+	472: ('LocaleOfIssue', str, None),
+	240: ('RedemptionDate', str, None),
+	202: ('StrikePrice', float, None),
+	947: ('StrikeCurrency', str, None),
+	206: ('OptAttribute', str, None),
+	231: ('ContractMultiplier', float, None),
+	223: ('CouponRate', float, None),
+	207: ('SecurityExchange', str, None),
+	106: ('Issuer', str, None),
+	348: ('EncodedIssuerLen', str, None),
+	349: ('EncodedIssuer', str, None),
+	107: ('SecurityDesc', str, None),
+	350: ('EncodedSecurityDescLen', str, None),
+	351: ('EncodedSecurityDesc', str, None),
+	691: ('Pool', str, None),
+	667: ('ContractSettlMonth', str, None),
+	875: ('CPProgram', int, None),
+	876: ('CPRegType', str, None),
+	864: ('NoEvents', int, _decode_grp_NoEvents),
+	873: ('DatedDate', str, None),
+	874: ('InterestAccrualDate', str, None),
+	668: ('DeliveryForm', int, None),
+	869: ('PctAtRisk', float, None),
+	870: ('NoInstrAttrib', int, _decode_grp_NoInstrAttrib),
+	913: ('AgreementDesc', str, None),
+	914: ('AgreementID', str, None),
+	915: ('AgreementDate', str, None),
+	918: ('AgreementCurrency', str, None),
+	788: ('TerminationType', int, None),
+	916: ('StartDate', str, None),
+	917: ('EndDate', str, None),
+	919: ('DeliveryType', int, None),
+	898: ('MarginRatio', float, None),
+	711: ('NoUnderlyings', int, _decode_grp_NoUnderlyings),
+	555: ('NoLegs', int, _decode_grp_NoLegs),
+	15: ('Currency', str, None),
+	58: ('Text', str, None),
+	354: ('EncodedTextLen', str, None),
+	355: ('EncodedText', str, None),
+	336: ('TradingSessionID', str, None),
+	625: ('TradingSessionSubID', str, None),
+	263: ('SubscriptionRequestType', str, None),
+}
+
+def _encode_SecurityListRequest(obj, fixm):
+	d = obj.__dict__
+	add = fixm.append
+	n = 1
+	if 'SecurityReqID' in d:
+		add('320=' + str(d['SecurityReqID']))
+		n += 1
+	if 'SecurityListRequestType' in d:
+		add('559=' + str(d['SecurityListRequestType']))
+		n += 1
+	if 'Symbol' in d:
+		add('55=' + str(d['Symbol']))
+		n += 1
+	if 'SymbolSfx' in d:
+		add('65=' + str(d['SymbolSfx']))
+		n += 1
+	if 'SecurityID' in d:
+		add('48=' + str(d['SecurityID']))
+		n += 1
+	if 'SecurityIDSource' in d:
+		add('22=' + str(d['SecurityIDSource']))
+		n += 1
+	if 'NoSecurityAltID' in d:
+		grp = d['NoSecurityAltID']
+		add('454=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoSecurityAltID(entry, fixm)
+		n += 1
+	if 'Product' in d:
+		add('460=' + str(d['Product']))
+		n += 1
+	if 'CFICode' in d:
+		add('461=' + str(d['CFICode']))
+		n += 1
+	if 'SecurityType' in d:
+		add('167=' + str(d['SecurityType']))
+		n += 1
+	if 'SecuritySubType' in d:
+		add('762=' + str(d['SecuritySubType']))
+		n += 1
+	if 'MaturityMonthYear' in d:
+		add('200=' + str(d['MaturityMonthYear']))
+		n += 1
+	if 'MaturityDate' in d:
+		add('541=' + str(d['MaturityDate']))
+		n += 1
+	if 'CouponPaymentDate' in d:
+		add('224=' + str(d['CouponPaymentDate']))
+		n += 1
+	if 'IssueDate' in d:
+		add('225=' + str(d['IssueDate']))
+		n += 1
+	if 'RepoCollateralSecurityType' in d:
+		add('239=' + str(d['RepoCollateralSecurityType']))
+		n += 1
+	if 'RepurchaseTerm' in d:
+		add('226=' + str(d['RepurchaseTerm']))
+		n += 1
+	if 'RepurchaseRate' in d:
+		add('227=' + str(d['RepurchaseRate']))
+		n += 1
+	if 'Factor' in d:
+		add('228=' + str(d['Factor']))
+		n += 1
+	if 'CreditRating' in d:
+		add('255=' + str(d['CreditRating']))
+		n += 1
+	if 'InstrRegistry' in d:
+		add('543=' + str(d['InstrRegistry']))
+		n += 1
+	if 'CountryOfIssue' in d:
+		add('470=' + str(d['CountryOfIssue']))
+		n += 1
+	if 'StateOrProvinceOfIssue' in d:
+		add('471=' + str(d['StateOrProvinceOfIssue']))
+		n += 1
+	if 'LocaleOfIssue' in d:
+		add('472=' + str(d['LocaleOfIssue']))
+		n += 1
+	if 'RedemptionDate' in d:
+		add('240=' + str(d['RedemptionDate']))
+		n += 1
+	if 'StrikePrice' in d:
+		add('202=' + str(d['StrikePrice']))
+		n += 1
+	if 'StrikeCurrency' in d:
+		add('947=' + str(d['StrikeCurrency']))
+		n += 1
+	if 'OptAttribute' in d:
+		add('206=' + str(d['OptAttribute']))
+		n += 1
+	if 'ContractMultiplier' in d:
+		add('231=' + str(d['ContractMultiplier']))
+		n += 1
+	if 'CouponRate' in d:
+		add('223=' + str(d['CouponRate']))
+		n += 1
+	if 'SecurityExchange' in d:
+		add('207=' + str(d['SecurityExchange']))
+		n += 1
+	if 'Issuer' in d:
+		add('106=' + str(d['Issuer']))
+		n += 1
+	if 'EncodedIssuerLen' in d:
+		add('348=' + str(d['EncodedIssuerLen']))
+		n += 1
+	if 'EncodedIssuer' in d:
+		add('349=' + str(d['EncodedIssuer']))
+		n += 1
+	if 'SecurityDesc' in d:
+		add('107=' + str(d['SecurityDesc']))
+		n += 1
+	if 'EncodedSecurityDescLen' in d:
+		add('350=' + str(d['EncodedSecurityDescLen']))
+		n += 1
+	if 'EncodedSecurityDesc' in d:
+		add('351=' + str(d['EncodedSecurityDesc']))
+		n += 1
+	if 'Pool' in d:
+		add('691=' + str(d['Pool']))
+		n += 1
+	if 'ContractSettlMonth' in d:
+		add('667=' + str(d['ContractSettlMonth']))
+		n += 1
+	if 'CPProgram' in d:
+		add('875=' + str(d['CPProgram']))
+		n += 1
+	if 'CPRegType' in d:
+		add('876=' + str(d['CPRegType']))
+		n += 1
+	if 'NoEvents' in d:
+		grp = d['NoEvents']
+		add('864=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoEvents(entry, fixm)
+		n += 1
+	if 'DatedDate' in d:
+		add('873=' + str(d['DatedDate']))
+		n += 1
+	if 'InterestAccrualDate' in d:
+		add('874=' + str(d['InterestAccrualDate']))
+		n += 1
+	if 'DeliveryForm' in d:
+		add('668=' + str(d['DeliveryForm']))
+		n += 1
+	if 'PctAtRisk' in d:
+		add('869=' + str(d['PctAtRisk']))
+		n += 1
+	if 'NoInstrAttrib' in d:
+		grp = d['NoInstrAttrib']
+		add('870=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoInstrAttrib(entry, fixm)
+		n += 1
+	if 'AgreementDesc' in d:
+		add('913=' + str(d['AgreementDesc']))
+		n += 1
+	if 'AgreementID' in d:
+		add('914=' + str(d['AgreementID']))
+		n += 1
+	if 'AgreementDate' in d:
+		add('915=' + str(d['AgreementDate']))
+		n += 1
+	if 'AgreementCurrency' in d:
+		add('918=' + str(d['AgreementCurrency']))
+		n += 1
+	if 'TerminationType' in d:
+		add('788=' + str(d['TerminationType']))
+		n += 1
+	if 'StartDate' in d:
+		add('916=' + str(d['StartDate']))
+		n += 1
+	if 'EndDate' in d:
+		add('917=' + str(d['EndDate']))
+		n += 1
+	if 'DeliveryType' in d:
+		add('919=' + str(d['DeliveryType']))
+		n += 1
+	if 'MarginRatio' in d:
+		add('898=' + str(d['MarginRatio']))
+		n += 1
+	if 'NoUnderlyings' in d:
+		grp = d['NoUnderlyings']
+		add('711=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoUnderlyings(entry, fixm)
+		n += 1
+	if 'NoLegs' in d:
+		grp = d['NoLegs']
+		add('555=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoLegs(entry, fixm)
+		n += 1
+	if 'Currency' in d:
+		add('15=' + str(d['Currency']))
+		n += 1
+	if 'Text' in d:
+		add('58=' + str(d['Text']))
+		n += 1
+	if 'EncodedTextLen' in d:
+		add('354=' + str(d['EncodedTextLen']))
+		n += 1
+	if 'EncodedText' in d:
+		add('355=' + str(d['EncodedText']))
+		n += 1
+	if 'TradingSessionID' in d:
+		add('336=' + str(d['TradingSessionID']))
+		n += 1
+	if 'TradingSessionSubID' in d:
+		add('625=' + str(d['TradingSessionSubID']))
+		n += 1
+	if 'SubscriptionRequestType' in d:
+		add('263=' + str(d['SubscriptionRequestType']))
+		n += 1
+	if len(d) > n:
+		_make_mbody(obj, obj._context, fixm, _msg_SecurityListRequest_names)
+	return fixm
+
+def _decode_SecurityListRequest(obj, fields, index, context):
+	d = obj.__dict__
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _msg_SecurityListRequest_tags.get(num)
+		if spec is None:
+			# not a field of this message, continue with generic decoder
+			body, index = _extract_body(fields, index, context, obj)
+			return index
+		name, pytype, decode_grp = spec
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	return index
 
 class SecurityListRequest(FixObject):
-	pass
+	_encode = staticmethod(_encode_SecurityListRequest)
+	_decode = staticmethod(_decode_SecurityListRequest)
+
+_msg_SecurityStatus_names = frozenset(['SecurityStatusReqID', 'Symbol', 'SymbolSfx', 'SecurityID', 'SecurityIDSource', 'NoSecurityAltID', 'Product', 'CFICode', 'SecurityType', 'SecuritySubType', 'MaturityMonthYear', 'MaturityDate', 'CouponPaymentDate', 'IssueDate', 'RepoCollateralSecurityType', 'RepurchaseTerm', 'RepurchaseRate', 'Factor', 'CreditRating', 'InstrRegistry', 'CountryOfIssue', 'StateOrProvinceOfIssue', 'LocaleOfIssue', 'RedemptionDate', 'StrikePrice', 'StrikeCurrency', 'OptAttribute', 'ContractMultiplier', 'CouponRate', 'SecurityExchange', 'Issuer', 'EncodedIssuerLen', 'EncodedIssuer', 'SecurityDesc', 'EncodedSecurityDescLen', 'EncodedSecurityDesc', 'Pool', 'ContractSettlMonth', 'CPProgram', 'CPRegType', 'NoEvents', 'DatedDate', 'InterestAccrualDate', 'DeliveryForm', 'PctAtRisk', 'NoInstrAttrib', 'NoUnderlyings', 'NoLegs', 'Currency', 'TradingSessionID', 'TradingSessionSubID', 'UnsolicitedIndicator', 'SecurityTradingStatus', 'FinancialStatus', 'CorporateAction', 'HaltReason', 'InViewOfCommon', 'DueToRelated', 'BuyVolume', 'SellVolume', 'HighPx', 'LowPx', 'LastPx', 'TransactTime', 'Adjustment', 'Text', 'EncodedTextLen', 'EncodedText'])
+
+_msg_SecurityStatus_tags = {
+	324: ('SecurityStatusReqID', str, None),
+	55: ('Symbol', str, None),
+	65: ('SymbolSfx', str, None),
+	48: ('SecurityID', str, None),
+	22: ('SecurityIDSource', str, None),
+	454: ('NoSecurityAltID', int, _decode_grp_NoSecurityAltID),
+	460: ('Product', int, None),
+	461: ('CFICode', str, None),
+	167: ('SecurityType', str, None),
+	762: ('SecuritySubType', str, None),
+	200: ('MaturityMonthYear', str, None),
+	541: ('MaturityDate', str, None),
+	224: ('CouponPaymentDate', str, None),
+	225: ('IssueDate', str, None),
+	239: ('RepoCollateralSecurityType', int, None),
+	226: ('RepurchaseTerm', int, None),
+	227: ('RepurchaseRate', float, None),
+	228: ('Factor', float, None),
+	255: ('CreditRating', str, None),
+	543: ('InstrRegistry', str, None),
+	470: ('CountryOfIssue', str, None),
+	471: ('StateOrProvinceOfIssue', str, None),
+	472: ('LocaleOfIssue', str, None),
+	240: ('RedemptionDate', str, None),
+	202: ('StrikePrice', float, None),
+	947: ('StrikeCurrency', str, None),
+	206: ('OptAttribute', str, None),
+	231: ('ContractMultiplier', float, None),
+	223: ('CouponRate', float, None),
+	207: ('SecurityExchange', str, None),
+	106: ('Issuer', str, None),
+	348: ('EncodedIssuerLen', str, None),
+	349: ('EncodedIssuer', str, None),
+	107: ('SecurityDesc', str, None),
+	350: ('EncodedSecurityDescLen', str, None),
+	351: ('EncodedSecurityDesc', str, None),
+	691: ('Pool', str, None),
+	667: ('ContractSettlMonth', str, None),
+	875: ('CPProgram', int, None),
+	876: ('CPRegType', str, None),
+	864: ('NoEvents', int, _decode_grp_NoEvents),
+	873: ('DatedDate', str, None),
+	874: ('InterestAccrualDate', str, None),
+	668: ('DeliveryForm', int, None),
+	869: ('PctAtRisk', float, None),
+	870: ('NoInstrAttrib', int, _decode_grp_NoInstrAttrib),
+	711: ('NoUnderlyings', int, _decode_grp_NoUnderlyings),
+	555: ('NoLegs', int, _decode_grp_NoLegs),
+	15: ('Currency', str, None),
+	336: ('TradingSessionID', str, None),
+	625: ('TradingSessionSubID', str, None),
+	325: ('UnsolicitedIndicator', str, None),
+	326: ('SecurityTradingStatus', int, None),
+	291: ('FinancialStatus', str, None),
+	292: ('CorporateAction', str, None),
+	327: ('HaltReason', str, None),
+	328: ('InViewOfCommon', str, None),
+	329: ('DueToRelated', str, None),
+	330: ('BuyVolume', float, None),
+	331: ('SellVolume', float, None),
+	332: ('HighPx', float, None),
+	333: ('LowPx', float, None),
+	31: ('LastPx', float, None),
+	60: ('TransactTime', str, None),
+	334: ('Adjustment', int, None),
+	58: ('Text', str, None),
+	354: ('EncodedTextLen', str, None),
+	355: ('EncodedText', str, None),
+}
+
+def _encode_SecurityStatus(obj, fixm):
+	d = obj.__dict__
+	add = fixm.append
+	n = 1
+	if 'SecurityStatusReqID' in d:
+		add('324=' + str(d['SecurityStatusReqID']))
+		n += 1
+	if 'Symbol' in d:
+		add('55=' + str(d['Symbol']))
+		n += 1
+	if 'SymbolSfx' in d:
+		add('65=' + str(d['SymbolSfx']))
+		n += 1
+	if 'SecurityID' in d:
+		add('48=' + str(d['SecurityID']))
+		n += 1
+	if 'SecurityIDSource' in d:
+		add('22=' + str(d['SecurityIDSource']))
+		n += 1
+	if 'NoSecurityAltID' in d:
+		grp = d['NoSecurityAltID']
+		add('454=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoSecurityAltID(entry, fixm)
+		n += 1
+	if 'Product' in d:
+		add('460=' + str(d['Product']))
+		n += 1
+	if 'CFICode' in d:
+		add('461=' + str(d['CFICode']))
+		n += 1
+	if 'SecurityType' in d:
+		add('167=' + str(d['SecurityType']))
+		n += 1
+	if 'SecuritySubType' in d:
+		add('762=' + str(d['SecuritySubType']))
+		n += 1
+	if 'MaturityMonthYear' in d:
+		add('200=' + str(d['MaturityMonthYear']))
+		n += 1
+	if 'MaturityDate' in d:
+		add('541=' + str(d['MaturityDate']))
+		n += 1
+	if 'CouponPaymentDate' in d:
+		add('224=' + str(d['CouponPaymentDate']))
+		n += 1
+	if 'IssueDate' in d:
+		add('225=' + str(d['IssueDate']))
+		n += 1
+	if 'RepoCollateralSecurityType' in d:
+		add('239=' + str(d['RepoCollateralSecurityType']))
+		n += 1
+	if 'RepurchaseTerm' in d:
+		add('226=' + str(d['RepurchaseTerm']))
+		n += 1
+	if 'RepurchaseRate' in d:
+		add('227=' + str(d['RepurchaseRate']))
+		n += 1
+	if 'Factor' in d:
+		add('228=' + str(d['Factor']))
+		n += 1
+	if 'CreditRating' in d:
+		add('255=' + str(d['CreditRating']))
+		n += 1
+	if 'InstrRegistry' in d:
+		add('543=' + str(d['InstrRegistry']))
+		n += 1
+	if 'CountryOfIssue' in d:
+		add('470=' + str(d['CountryOfIssue']))
+		n += 1
+	if 'StateOrProvinceOfIssue' in d:
+		add('471=' + str(d['StateOrProvinceOfIssue']))
+		n += 1
+	if 'LocaleOfIssue' in d:
+		add('472=' + str(d['LocaleOfIssue']))
+		n += 1
+	if 'RedemptionDate' in d:
+		add('240=' + str(d['RedemptionDate']))
+		n += 1
+	if 'StrikePrice' in d:
+		add('202=' + str(d['StrikePrice']))
+		n += 1
+	if 'StrikeCurrency' in d:
+		add('947=' + str(d['StrikeCurrency']))
+		n += 1
+	if 'OptAttribute' in d:
+		add('206=' + str(d['OptAttribute']))
+		n += 1
+	if 'ContractMultiplier' in d:
+		add('231=' + str(d['ContractMultiplier']))
+		n += 1
+	if 'CouponRate' in d:
+		add('223=' + str(d['CouponRate']))
+		n += 1
+	if 'SecurityExchange' in d:
+		add('207=' + str(d['SecurityExchange']))
+		n += 1
+	if 'Issuer' in d:
+		add('106=' + str(d['Issuer']))
+		n += 1
+	if 'EncodedIssuerLen' in d:
+		add('348=' + str(d['EncodedIssuerLen']))
+		n += 1
+	if 'EncodedIssuer' in d:
+		add('349=' + str(d['EncodedIssuer']))
+		n += 1
+	if 'SecurityDesc' in d:
+		add('107=' + str(d['SecurityDesc']))
+		n += 1
+	if 'EncodedSecurityDescLen' in d:
+		add('350=' + str(d['EncodedSecurityDescLen']))
+		n += 1
+	if 'EncodedSecurityDesc' in d:
+		add('351=' + str(d['EncodedSecurityDesc']))
+		n += 1
+	if 'Pool' in d:
+		add('691=' + str(d['Pool']))
+		n += 1
+	if 'ContractSettlMonth' in d:
+		add('667=' + str(d['ContractSettlMonth']))
+		n += 1
+	if 'CPProgram' in d:
+		add('875=' + str(d['CPProgram']))
+		n += 1
+	if 'CPRegType' in d:
+		add('876=' + str(d['CPRegType']))
+		n += 1
+	if 'NoEvents' in d:
+		grp = d['NoEvents']
+		add('864=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoEvents(entry, fixm)
+		n += 1
+	if 'DatedDate' in d:
+		add('873=' + str(d['DatedDate']))
+		n += 1
+	if 'InterestAccrualDate' in d:
+		add('874=' + str(d['InterestAccrualDate']))
+		n += 1
+	if 'DeliveryForm' in d:
+		add('668=' + str(d['DeliveryForm']))
+		n += 1
+	if 'PctAtRisk' in d:
+		add('869=' + str(d['PctAtRisk']))
+		n += 1
+	if 'NoInstrAttrib' in d:
+		grp = d['NoInstrAttrib']
+		add('870=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoInstrAttrib(entry, fixm)
+		n += 1
+	if 'NoUnderlyings' in d:
+		grp = d['NoUnderlyings']
+		add('711=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoUnderlyings(entry, fixm)
+		n += 1
+	if 'NoLegs' in d:
+		grp = d['NoLegs']
+		add('555=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoLegs(entry, fixm)
+		n += 1
+	if 'Currency' in d:
+		add('15=' + str(d['Currency']))
+		n += 1
+	if 'TradingSessionID' in d:
+		add('336=' + str(d['TradingSessionID']))
+		n += 1
+	if 'TradingSessionSubID' in d:
+		add('625=' + str(d['TradingSessionSubID']))
+		n += 1
+	if 'UnsolicitedIndicator' in d:
+		add('325=' + str(d['UnsolicitedIndicator']))
+		n += 1
+	if 'SecurityTradingStatus' in d:
+		add('326=' + str(d['SecurityTradingStatus']))
+		n += 1
+	if 'FinancialStatus' in d:
+		add('291=' + str(d['FinancialStatus']))
+		n += 1
+	if 'CorporateAction' in d:
+		add('292=' + str(d['CorporateAction']))
+		n += 1
+	if 'HaltReason' in d:
+		add('327=' + str(d['HaltReason']))
+		n += 1
+	if 'InViewOfCommon' in d:
+		add('328=' + str(d['InViewOfCommon']))
+		n += 1
+	if 'DueToRelated' in d:
+		add('329=' + str(d['DueToRelated']))
+		n += 1
+	if 'BuyVolume' in d:
+		add('330=' + str(d['BuyVolume']))
+		n += 1
+	if 'SellVolume' in d:
+		add('331=' + str(d['SellVolume']))
+		n += 1
+	if 'HighPx' in d:
+		add('332=' + str(d['HighPx']))
+		n += 1
+	if 'LowPx' in d:
+		add('333=' + str(d['LowPx']))
+		n += 1
+	if 'LastPx' in d:
+		add('31=' + str(d['LastPx']))
+		n += 1
+	if 'TransactTime' in d:
+		add('60=' + str(d['TransactTime']))
+		n += 1
+	if 'Adjustment' in d:
+		add('334=' + str(d['Adjustment']))
+		n += 1
+	if 'Text' in d:
+		add('58=' + str(d['Text']))
+		n += 1
+	if 'EncodedTextLen' in d:
+		add('354=' + str(d['EncodedTextLen']))
+		n += 1
+	if 'EncodedText' in d:
+		add('355=' + str(d['EncodedText']))
+		n += 1
+	if len(d) > n:
+		_make_mbody(obj, obj._context, fixm, _msg_SecurityStatus_names)
+	return fixm
+
+def _decode_SecurityStatus(obj, fields, index, context):
+	d = obj.__dict__
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _msg_SecurityStatus_tags.get(num)
+		if spec is None:
+			# not a field of this message, continue with generic decoder
+			body, index = _extract_body(fields, index, context, obj)
+			return index
+		name, pytype, decode_grp = spec
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	return index
 
 class SecurityStatus(FixObject):
-	pass
+	_encode = staticmethod(_encode_SecurityStatus)
+	_decode = staticmethod(_decode_SecurityStatus)
+
+_msg_SecurityStatusRequest_names = frozenset(['SecurityStatusReqID', 'Symbol', 'SymbolSfx', 'SecurityID', 'SecurityIDSource', 'NoSecurityAltID', 'Product', 'CFICode', 'SecurityType', 'SecuritySubType', 'MaturityMonthYear', 'MaturityDate', 'CouponPaymentDate', 'IssueDate', 'RepoCollateralSecurityType', 'RepurchaseTerm', 'RepurchaseRate', 'Factor', 'CreditRating', 'InstrRegistry', 'CountryOfIssue', 'StateOrProvinceOfIssue', 'LocaleOfIssue', 'RedemptionDate', 'StrikePrice', 'StrikeCurrency', 'OptAttribute', 'ContractMultiplier', 'CouponRate', 'SecurityExchange', 'Issuer', 'EncodedIssuerLen', 'EncodedIssuer', 'SecurityDesc', 'EncodedSecurityDescLen', 'EncodedSecurityDesc', 'Pool', 'ContractSettlMonth', 'CPProgram', 'CPRegType', 'NoEvents', 'DatedDate', 'InterestAccrualDate', 'DeliveryForm', 'PctAtRisk', 'NoInstrAttrib', 'NoUnderlyings', 'NoLegs', 'Currency', 'SubscriptionRequestType', 'TradingSessionID', 'TradingSessionSubID'])
+
+_msg_SecurityStatusRequest_tags = {
+	324: ('SecurityStatusReqID', str, None),
+	55: ('Symbol', str, None),
+	65: ('SymbolSfx', str, None),
+	48: ('SecurityID', str, None),
+	22: ('SecurityIDSource', str, None),
+	454: ('NoSecurityAltID', int, _decode_grp_NoSecurityAltID),
+	460: ('Product', int, None),
+	461: ('CFICode', str, None),
+	167: ('SecurityType', str, None),
+	762: ('SecuritySubType', str, None),
+	200: ('MaturityMonthYear', str, None),
+	541: ('MaturityDate', str, None),
+	224: ('CouponPaymentDate', str, None),
+	225: ('IssueDate', str, None),
+	239: ('RepoCollateralSecurityType', int, None),
+	226: ('RepurchaseTerm', int, None),
+	227: ('RepurchaseRate', float, None),
+	228: ('Factor', float, None),
+	255: ('CreditRating', str, None),
+	543: ('InstrRegistry', str, None),
+	470: ('CountryOfIssue', str, None),
+	471: ('StateOrProvinceOfIssue', str, None),
+	472: ('LocaleOfIssue', str, None),
+	240: ('RedemptionDate', str, None),
+	202: ('StrikePrice', float, None),
+	947: ('StrikeCurrency', str, None),
+	206: ('OptAttribute', str, None),
+	231: ('ContractMultiplier', float, None),
+	223: ('CouponRate', float, None),
+	207: ('SecurityExchange', str, None),
+	106: ('Issuer', str, None),
+	348: ('EncodedIssuerLen', str, None),
+	349: ('EncodedIssuer', str, None),
+	107: ('SecurityDesc', str, None),
+	350: ('EncodedSecurityDescLen', str, None),
+	351: ('EncodedSecurityDesc', str, None),
+	691: ('Pool', str, None),
+	667: ('ContractSettlMonth', str, None),
+	875: ('CPProgram', int, None),
+	876: ('CPRegType', str, None),
+	864: ('NoEvents', int, _decode_grp_NoEvents),
+	873: ('DatedDate', str, None),
+	874: ('InterestAccrualDate', str, None),
+	668: ('DeliveryForm', int, None),
+	869: ('PctAtRisk', float, None),
+	870: ('NoInstrAttrib', int, _decode_grp_NoInstrAttrib),
+	711: ('NoUnderlyings', int, _decode_grp_NoUnderlyings),
+	555: ('NoLegs', int, _decode_grp_NoLegs),
+	15: ('Currency', str, None),
+	263: ('SubscriptionRequestType', str, None),
+	336: ('TradingSessionID', str, None),
+	625: ('TradingSessionSubID', str, None),
+}
+
+def _encode_SecurityStatusRequest(obj, fixm):
+	d = obj.__dict__
+	add = fixm.append
+	n = 1
+	if 'SecurityStatusReqID' in d:
+		add('324=' + str(d['SecurityStatusReqID']))
+		n += 1
+	if 'Symbol' in d:
+		add('55=' + str(d['Symbol']))
+		n += 1
+	if 'SymbolSfx' in d:
+		add('65=' + str(d['SymbolSfx']))
+		n += 1
+	if 'SecurityID' in d:
+		add('48=' + str(d['SecurityID']))
+		n += 1
+	if 'SecurityIDSource' in d:
+		add('22=' + str(d['SecurityIDSource']))
+		n += 1
+	if 'NoSecurityAltID' in d:
+		grp = d['NoSecurityAltID']
+		add('454=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoSecurityAltID(entry, fixm)
+		n += 1
+	if 'Product' in d:
+		add('460=' + str(d['Product']))
+		n += 1
+	if 'CFICode' in d:
+		add('461=' + str(d['CFICode']))
+		n += 1
+	if 'SecurityType' in d:
+		add('167=' + str(d['SecurityType']))
+		n += 1
+	if 'SecuritySubType' in d:
+		add('762=' + str(d['SecuritySubType']))
+		n += 1
+	if 'MaturityMonthYear' in d:
+		add('200=' + str(d['MaturityMonthYear']))
+		n += 1
+	if 'MaturityDate' in d:
+		add('541=' + str(d['MaturityDate']))
+		n += 1
+	if 'CouponPaymentDate' in d:
+		add('224=' + str(d['CouponPaymentDate']))
+		n += 1
+	if 'IssueDate' in d:
+		add('225=' + str(d['IssueDate']))
+		n += 1
+	if 'RepoCollateralSecurityType' in d:
+		add('239=' + str(d['RepoCollateralSecurityType']))
+		n += 1
+	if 'RepurchaseTerm' in d:
+		add('226=' + str(d['RepurchaseTerm']))
+		n += 1
+	if 'RepurchaseRate' in d:
+		add('227=' + str(d['RepurchaseRate']))
+		n += 1
+	if 'Factor' in d:
+		add('228=' + str(d['Factor']))
+		n += 1
+	if 'CreditRating' in d:
+		add('255=' + str(d['CreditRating']))
+		n += 1
+	if 'InstrRegistry' in d:
+		add('543=' + str(d['InstrRegistry']))
+		n += 1
+	if 'CountryOfIssue' in d:
+		add('470=' + str(d['CountryOfIssue']))
+		n += 1
+	if 'StateOrProvinceOfIssue' in d:
+		add('471=' + str(d['StateOrProvinceOfIssue']))
+		n += 1
+	if 'LocaleOfIssue' in d:
+		add('472=' + str(d['LocaleOfIssue']))
+		n += 1
+	if 'RedemptionDate' in d:
+		add('240=' + str(d['RedemptionDate']))
+		n += 1
+	if 'StrikePrice' in d:
+		add('202=' + str(d['StrikePrice']))
+		n += 1
+	if 'StrikeCurrency' in d:
+		add('947=' + str(d['StrikeCurrency']))
+		n += 1
+	if 'OptAttribute' in d:
+		add('206=' + str(d['OptAttribute']))
+		n += 1
+	if 'ContractMultiplier' in d:
+		add('231=' + str(d['ContractMultiplier']))
+		n += 1
+	if 'CouponRate' in d:
+		add('223=' + str(d['CouponRate']))
+		n += 1
+	if 'SecurityExchange' in d:
+		add('207=' + str(d['SecurityExchange']))
+		n += 1
+	if 'Issuer' in d:
+		add('106=' + str(d['Issuer']))
+		n += 1
+	if 'EncodedIssuerLen' in d:
+		add('348=' + str(d['EncodedIssuerLen']))
+		n += 1
+	if 'EncodedIssuer' in d:
+		add('349=' + str(d['EncodedIssuer']))
+		n += 1
+	if 'SecurityDesc' in d:
+		add('107=' + str(d['SecurityDesc']))
+		n += 1
+	if 'EncodedSecurityDescLen' in d:
+		add('350=' + str(d['EncodedSecurityDescLen']))
+		n += 1
+	if 'EncodedSecurityDesc' in d:
+		add('351=' + str(d['EncodedSecurityDesc']))
+		n += 1
+	if 'Pool' in d:
+		add('691=' + str(d['Pool']))
+		n += 1
+	if 'ContractSettlMonth' in d:
+		add('667=' + str(d['ContractSettlMonth']))
+		n += 1
+	if 'CPProgram' in d:
+		add('875=' + str(d['CPProgram']))
+		n += 1
+	if 'CPRegType' in d:
+		add('876=' + str(d['CPRegType']))
+		n += 1
+	if 'NoEvents' in d:
+		grp = d['NoEvents']
+		add('864=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoEvents(entry, fixm)
+		n += 1
+	if 'DatedDate' in d:
+		add('873=' + str(d['DatedDate']))
+		n += 1
+	if 'InterestAccrualDate' in d:
+		add('874=' + str(d['InterestAccrualDate']))
+		n += 1
+	if 'DeliveryForm' in d:
+		add('668=' + str(d['DeliveryForm']))
+		n += 1
+	if 'PctAtRisk' in d:
+		add('869=' + str(d['PctAtRisk']))
+		n += 1
+	if 'NoInstrAttrib' in d:
+		grp = d['NoInstrAttrib']
+		add('870=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoInstrAttrib(entry, fixm)
+		n += 1
+	if 'NoUnderlyings' in d:
+		grp = d['NoUnderlyings']
+		add('711=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoUnderlyings(entry, fixm)
+		n += 1
+	if 'NoLegs' in d:
+		grp = d['NoLegs']
+		add('555=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoLegs(entry, fixm)
+		n += 1
+	if 'Currency' in d:
+		add('15=' + str(d['Currency']))
+		n += 1
+	if 'SubscriptionRequestType' in d:
+		add('263=' + str(d['SubscriptionRequestType']))
+		n += 1
+	if 'TradingSessionID' in d:
+		add('336=' + str(d['TradingSessionID']))
+		n += 1
+	if 'TradingSessionSubID' in d:
+		add('625=' + str(d['TradingSessionSubID']))
+		n += 1
+	if len(d) > n:
+		_make_mbody(obj, obj._context, fixm, _msg_SecurityStatusRequest_names)
+	return fixm
+
+def _decode_SecurityStatusRequest(obj, fields, index, context):
+	d = obj.__dict__
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _msg_SecurityStatusRequest_tags.get(num)
+		if spec is None:
+			# not a field of this message, continue with generic decoder
+			body, index = _extract_body(fields, index, context, obj)
+			return index
+		name, pytype, decode_grp = spec
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	return index
 
 class SecurityStatusRequest(FixObject):
-	pass
+	_encode = staticmethod(_encode_SecurityStatusRequest)
+	_decode = staticmethod(_decode_SecurityStatusRequest)
+
+_msg_SecurityTypeRequest_names = frozenset(['SecurityReqID', 'Text', 'EncodedTextLen', 'EncodedText', 'TradingSessionID', 'TradingSessionSubID', 'Product', 'SecurityType', 'SecuritySubType'])
+
+_msg_SecurityTypeRequest_tags = {
+	320: ('SecurityReqID', str, None),
+	58: ('Text', str, None),
+	354: ('EncodedTextLen', str, None),
+	355: ('EncodedText', str, None),
+	336: ('TradingSessionID', str, None),
+	625: ('TradingSessionSubID', str, None),
+	460: ('Product', int, None),
+	167: ('SecurityType', str, None),
+	762: ('SecuritySubType', str, None),
+}
+
+def _encode_SecurityTypeRequest(obj, fixm):
+	d = obj.__dict__
+	add = fixm.append
+	n = 1
+	if 'SecurityReqID' in d:
+		add('320=' + str(d['SecurityReqID']))
+		n += 1
+	if 'Text' in d:
+		add('58=' + str(d['Text']))
+		n += 1
+	if 'EncodedTextLen' in d:
+		add('354=' + str(d['EncodedTextLen']))
+		n += 1
+	if 'EncodedText' in d:
+		add('355=' + str(d['EncodedText']))
+		n += 1
+	if 'TradingSessionID' in d:
+		add('336=' + str(d['TradingSessionID']))
+		n += 1
+	if 'TradingSessionSubID' in d:
+		add('625=' + str(d['TradingSessionSubID']))
+		n += 1
+	if 'Product' in d:
+		add('460=' + str(d['Product']))
+		n += 1
+	if 'SecurityType' in d:
+		add('167=' + str(d['SecurityType']))
+		n += 1
+	if 'SecuritySubType' in d:
+		add('762=' + str(d['SecuritySubType']))
+		n += 1
+	if len(d) > n:
+		_make_mbody(obj, obj._context, fixm, _msg_SecurityTypeRequest_names)
+	return fixm
+
+def _decode_SecurityTypeRequest(obj, fields, index, context):
+	d = obj.__dict__
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _msg_SecurityTypeRequest_tags.get(num)
+		if spec is None:
+			# not a field of this message, continue with generic decoder
+			body, index = _extract_body(fields, index, context, obj)
+			return index
+		name, pytype, decode_grp = spec
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	return index
 
 class SecurityTypeRequest(FixObject):
-	pass
+	_encode = staticmethod(_encode_SecurityTypeRequest)
+	_decode = staticmethod(_decode_SecurityTypeRequest)
+
+_msg_SecurityTypes_names = frozenset(['SecurityReqID', 'SecurityResponseID', 'SecurityResponseType', 'TotNoSecurityTypes', 'LastFragment', 'NoSecurityTypes', 'Text', 'EncodedTextLen', 'EncodedText', 'TradingSessionID', 'TradingSessionSubID', 'SubscriptionRequestType'])
+
+_msg_SecurityTypes_tags = {
+	320: ('SecurityReqID', str, None),
+	322: ('SecurityResponseID', str, None),
+	323: ('SecurityResponseType', int, None),
+	557: ('TotNoSecurityTypes', int, None),
+	893: ('LastFragment', str, None),
+	558: ('NoSecurityTypes', int, _decode_grp_NoSecurityTypes),
+	58: ('Text', str, None),
+	354: ('EncodedTextLen', str, None),
+	355: ('EncodedText', str, None),
+	336: ('TradingSessionID', str, None),
+	625: ('TradingSessionSubID', str, None),
+	263: ('SubscriptionRequestType', str, None),
+}
+
+def _encode_SecurityTypes(obj, fixm):
+	d = obj.__dict__
+	add = fixm.append
+	n = 1
+	if 'SecurityReqID' in d:
+		add('320=' + str(d['SecurityReqID']))
+		n += 1
+	if 'SecurityResponseID' in d:
+		add('322=' + str(d['SecurityResponseID']))
+		n += 1
+	if 'SecurityResponseType' in d:
+		add('323=' + str(d['SecurityResponseType']))
+		n += 1
+	if 'TotNoSecurityTypes' in d:
+		add('557=' + str(d['TotNoSecurityTypes']))
+		n += 1
+	if 'LastFragment' in d:
+		add('893=' + str(d['LastFragment']))
+		n += 1
+	if 'NoSecurityTypes' in d:
+		grp = d['NoSecurityTypes']
+		add('558=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoSecurityTypes(entry, fixm)
+		n += 1
+	if 'Text' in d:
+		add('58=' + str(d['Text']))
+		n += 1
+	if 'EncodedTextLen' in d:
+		add('354=' + str(d['EncodedTextLen']))
+		n += 1
+	if 'EncodedText' in d:
+		add('355=' + str(d['EncodedText']))
+		n += 1
+	if 'TradingSessionID' in d:
+		add('336=' + str(d['TradingSessionID']))
+		n += 1
+	if 'TradingSessionSubID' in d:
+		add('625=' + str(d['TradingSessionSubID']))
+		n += 1
+	if 'SubscriptionRequestType' in d:
+		add('263=' + str(d['SubscriptionRequestType']))
+		n += 1
+	if len(d) > n:
+		_make_mbody(obj, obj._context, fixm, _msg_SecurityTypes_names)
+	return fixm
+
+def _decode_SecurityTypes(obj, fields, index, context):
+	d = obj.__dict__
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _msg_SecurityTypes_tags.get(num)
+		if spec is None:
+			# not a field of this message, continue with generic decoder
+			body, index = _extract_body(fields, index, context, obj)
+			return index
+		name, pytype, decode_grp = spec
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	return index
 
 class SecurityTypes(FixObject):
-	pass
+	_encode = staticmethod(_encode_SecurityTypes)
+	_decode = staticmethod(_decode_SecurityTypes)
+
+_msg_SettlementInstructionRequest_names = frozenset(['SettlInstReqID', 'TransactTime', 'NoPartyIDs', 'AllocAccount', 'AllocAcctIDSource', 'Side', 'Product', 'SecurityType', 'CFICode', 'EffectiveTime', 'ExpireTime', 'LastUpdateTime', 'StandInstDbType', 'StandInstDbName', 'StandInstDbID'])
+
+_msg_SettlementInstructionRequest_tags = {
+	791: ('SettlInstReqID', str, None),
+	60: ('TransactTime', str, None),
+	453: ('NoPartyIDs', int, _decode_grp_NoPartyIDs),
+	79: ('AllocAccount', str, None),
+	661: ('AllocAcctIDSource', int, None),
+	54: ('Side', str, None),
+	460: ('Product', int, None),
+	167: ('SecurityType', str, None),
+	461: ('CFICode', str, None),
+	168: ('EffectiveTime', str, None),
+	126: ('ExpireTime', str, None),
+	779: ('LastUpdateTime', str, None),
+	169: ('StandInstDbType', int, None),
+	170: ('StandInstDbName', str, None),
+	171: ('StandInstDbID', str, None),
+}
+
+def _encode_SettlementInstructionRequest(obj, fixm):
+	d = obj.__dict__
+	add = fixm.append
+	n = 1
+	if 'SettlInstReqID' in d:
+		add('791=' + str(d['SettlInstReqID']))
+		n += 1
+	if 'TransactTime' in d:
+		add('60=' + str(d['TransactTime']))
+		n += 1
+	if 'NoPartyIDs' in d:
+		grp = d['NoPartyIDs']
+		add('453=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoPartyIDs(entry, fixm)
+		n += 1
+	if 'AllocAccount' in d:
+		add('79=' + str(d['AllocAccount']))
+		n += 1
+	if 'AllocAcctIDSource' in d:
+		add('661=' + str(d['AllocAcctIDSource']))
+		n += 1
+	if 'Side' in d:
+		add('54=' + str(d['Side']))
+		n += 1
+	if 'Product' in d:
+		add('460=' + str(d['Product']))
+		n += 1
+	if 'SecurityType' in d:
+		add('167=' + str(d['SecurityType']))
+		n += 1
+	if 'CFICode' in d:
+		add('461=' + str(d['CFICode']))
+		n += 1
+	if 'EffectiveTime' in d:
+		add('168=' + str(d['EffectiveTime']))
+		n += 1
+	if 'ExpireTime' in d:
+		add('126=' + str(d['ExpireTime']))
+		n += 1
+	if 'LastUpdateTime' in d:
+		add('779=' + str(d['LastUpdateTime']))
+		n += 1
+	if 'StandInstDbType' in d:
+		add('169=' + str(d['StandInstDbType']))
+		n += 1
+	if 'StandInstDbName' in d:
+		add('170=' + str(d['StandInstDbName']))
+		n += 1
+	if 'StandInstDbID' in d:
+		add('171=' + str(d['StandInstDbID']))
+		n += 1
+	if len(d) > n:
+		_make_mbody(obj, obj._context, fixm, _msg_SettlementInstructionRequest_names)
+	return fixm
+
+def _decode_SettlementInstructionRequest(obj, fields, index, context):
+	d = obj.__dict__
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _msg_SettlementInstructionRequest_tags.get(num)
+		if spec is None:
+			# not a field of this message, continue with generic decoder
+			body, index = _extract_body(fields, index, context, obj)
+			return index
+		name, pytype, decode_grp = spec
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	return index
 
 class SettlementInstructionRequest(FixObject):
-	pass
+	_encode = staticmethod(_encode_SettlementInstructionRequest)
+	_decode = staticmethod(_decode_SettlementInstructionRequest)
+
+_msg_SettlementInstructions_names = frozenset(['SettlInstMsgID', 'SettlInstReqID', 'SettlInstMode', 'SettlInstReqRejCode', 'Text', 'EncodedTextLen', 'EncodedText', 'SettlInstSource', 'ClOrdID', 'TransactTime', 'NoSettlInst'])
+
+_msg_SettlementInstructions_tags = {
+	777: ('SettlInstMsgID', str, None),
+	791: ('SettlInstReqID', str, None),
+	160: ('SettlInstMode', str, None),
+	792: ('SettlInstReqRejCode', int, None),
+	58: ('Text', str, None),
+	354: ('EncodedTextLen', str, None),
+	355: ('EncodedText', str, None),
+	165: ('SettlInstSource', str, None),
+	11: ('ClOrdID', str, None),
+	60: ('TransactTime', str, None),
+	778: ('NoSettlInst', int, _decode_grp_NoSettlInst),
+}
+
+def _encode_SettlementInstructions(obj, fixm):
+	d = obj.__dict__
+	add = fixm.append
+	n = 1
+	if 'SettlInstMsgID' in d:
+		add('777=' + str(d['SettlInstMsgID']))
+		n += 1
+	if 'SettlInstReqID' in d:
+		add('791=' + str(d['SettlInstReqID']))
+		n += 1
+	if 'SettlInstMode' in d:
+		add('160=' + str(d['SettlInstMode']))
+		n += 1
+	if 'SettlInstReqRejCode' in d:
+		add('792=' + str(d['SettlInstReqRejCode']))
+		n += 1
+	if 'Text' in d:
+		add('58=' + str(d['Text']))
+		n += 1
+	if 'EncodedTextLen' in d:
+		add('354=' + str(d['EncodedTextLen']))
+		n += 1
+	if 'EncodedText' in d:
+		add('355=' + str(d['EncodedText']))
+		n += 1
+	if 'SettlInstSource' in d:
+		add('165=' + str(d['SettlInstSource']))
+		n += 1
+	if 'ClOrdID' in d:
+		add('11=' + str(d['ClOrdID']))
+		n += 1
+	if 'TransactTime' in d:
+		add('60=' + str(d['TransactTime']))
+		n += 1
+	if 'NoSettlInst' in d:
+		grp = d['NoSettlInst']
+		add('778=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoSettlInst(entry, fixm)
+		n += 1
+	if len(d) > n:
+		_make_mbody(obj, obj._context, fixm, _msg_SettlementInstructions_names)
+	return fixm
+
+def _decode_SettlementInstructions(obj, fields, index, context):
+	d = obj.__dict__
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _msg_SettlementInstructions_tags.get(num)
+		if spec is None:
+			# not a field of this message, continue with generic decoder
+			body, index = _extract_body(fields, index, context, obj)
+			return index
+		name, pytype, decode_grp = spec
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	return index
 
 class SettlementInstructions(FixObject):
-	pass
+	_encode = staticmethod(_encode_SettlementInstructions)
+	_decode = staticmethod(_decode_SettlementInstructions)
+
+_msg_TradeCaptureReport_names = frozenset(['TradeReportID', 'TradeReportTransType', 'TradeReportType', 'TradeRequestID', 'TrdType', 'TrdSubType', 'SecondaryTrdType', 'TransferReason', 'ExecType', 'TotNumTradeReports', 'LastRptRequested', 'UnsolicitedIndicator', 'SubscriptionRequestType', 'TradeReportRefID', 'SecondaryTradeReportRefID', 'SecondaryTradeReportID', 'TradeLinkID', 'TrdMatchID', 'ExecID', 'OrdStatus', 'SecondaryExecID', 'ExecRestatementReason', 'PreviouslyReported', 'PriceType', 'Symbol', 'SymbolSfx', 'SecurityID', 'SecurityIDSource', 'NoSecurityAltID', 'Product', 'CFICode', 'SecurityType', 'SecuritySubType', 'MaturityMonthYear', 'MaturityDate', 'CouponPaymentDate', 'IssueDate', 'RepoCollateralSecurityType', 'RepurchaseTerm', 'RepurchaseRate', 'Factor', 'CreditRating', 'InstrRegistry', 'CountryOfIssue', 'StateOrProvinceOfIssue', 'LocaleOfIssue', 'RedemptionDate', 'StrikePrice', 'StrikeCurrency', 'OptAttribute', 'ContractMultiplier', 'CouponRate', 'SecurityExchange', 'Issuer', 'EncodedIssuerLen', 'EncodedIssuer', 'SecurityDesc', 'EncodedSecurityDescLen', 'EncodedSecurityDesc', 'Pool', 'ContractSettlMonth', 'CPProgram', 'CPRegType', 'NoEvents', 'DatedDate', 'InterestAccrualDate', 'AgreementDesc', 'AgreementID', 'AgreementDate', 'AgreementCurrency', 'TerminationType', 'StartDate', 'EndDate', 'DeliveryType', 'MarginRatio', 'OrderQty', 'CashOrderQty', 'OrderPercent', 'RoundingDirection', 'RoundingModulus', 'QtyType', 'YieldType', 'Yield', 'YieldCalcDate', 'YieldRedemptionDate', 'YieldRedemptionPrice', 'YieldRedemptionPriceType', 'NoUnderlyings', 'UnderlyingTradingSessionID', 'UnderlyingTradingSessionSubID', 'LastQty', 'LastPx', 'LastParPx', 'LastSpotRate', 'LastForwardPoints', 'LastMkt', 'TradeDate', 'ClearingBusinessDate', 'AvgPx', 'Spread', 'BenchmarkCurveCurrency', 'BenchmarkCurveName', 'BenchmarkCurvePoint', 'BenchmarkPrice', 'BenchmarkPriceType', 'BenchmarkSecurityID', 'BenchmarkSecurityIDSource', 'AvgPxIndicator', 'NoPosAmt', 'MultiLegReportingType', 'TradeLegRefID', 'NoLegs', 'TransactTime', 'NoTrdRegTimestamps', 'SettlType', 'SettlDate', 'MatchStatus', 'MatchType', 'NoSides', 'CopyMsgIndicator', 'PublishTrdIndicator', 'ShortSaleReason'])
+
+_msg_TradeCaptureReport_tags = {
+	571: ('TradeReportID', str, None),
+	487: ('TradeReportTransType', int, None),
+	856: ('TradeReportType', int, None),
+	568: ('TradeRequestID', str, None),
+	828: ('TrdType', int, None),
+	829: ('TrdSubType', int, None),
+	855: ('SecondaryTrdType', int, None),
+	830: ('TransferReason', str, None),
+	150: ('ExecType', str, None),
+	748: ('TotNumTradeReports', int, None),
+	912: ('LastRptRequested', str, None),
+	325: ('UnsolicitedIndicator', str, None),
+	263: ('SubscriptionRequestType', str, None),
+	572: ('TradeReportRefID', str, None),
+	881: ('SecondaryTradeReportRefID', str, None),
+	818: ('SecondaryTradeReportID', str, None),
+	820: ('TradeLinkID', str, None),
+	880: ('TrdMatchID', str, None),
+	17: ('ExecID', str, None),
+	39: ('OrdStatus', str, None),
+	527: ('SecondaryExecID', str, None),
+	378: ('ExecRestatementReason', int, None),
+	570: ('PreviouslyReported', str, None),
+	423: ('PriceType', int, None),
+	55: ('Symbol', str, None),
+	65: ('SymbolSfx', str, None),
+	48: ('SecurityID', str, None),
+	22: ('SecurityIDSource', str, None),
+	454: ('NoSecurityAltID', int, _decode_grp_NoSecurityAltID),
+	460: ('Product', int, None),
+	461: ('CFICode', str, None),
+	167: ('SecurityType', str, None),
+	762: ('SecuritySubType', str, None),
+	200: ('MaturityMonthYear', str, None),
+	541: ('MaturityDate', str, None),
+	224: ('CouponPaymentDate', str, None),
+	225: ('IssueDate', str, None),
+	239: ('RepoCollateralSecurityType', int, None),
+	226: ('RepurchaseTerm', int, None),
+	227: ('RepurchaseRate', float, None),
+	228: ('Factor', float, None),
+	255: ('CreditRating', str, None),
+	543: ('InstrRegistry', str, None),
+	470: ('CountryOfIssue', str, None),
+	471: ('StateOrProvinceOfIssue', str, None),
+	472: ('LocaleOfIssue', str, None),
+	240: ('RedemptionDate', str, None),
+	202: ('StrikePrice', float, None),
+	947: ('StrikeCurrency', str, None),
+	206: ('OptAttribute', str, None),
+	231: ('ContractMultiplier', float, None),
+	223: ('CouponRate', float, None),
+	207: ('SecurityExchange', str, None),
+	106: ('Issuer', str, None),
+	348: ('EncodedIssuerLen', str, None),
+	349: ('EncodedIssuer', str, None),
+	107: ('SecurityDesc', str, None),
+	350: ('EncodedSecurityDescLen', str, None),
+	351: ('EncodedSecurityDesc', str, None),
+	691: ('Pool', str, None),
+	667: ('ContractSettlMonth', str, None),
+	875: ('CPProgram', int, None),
+	876: ('CPRegType', str, None),
+	864: ('NoEvents', int, _decode_grp_NoEvents),
+	873: ('DatedDate', str, None),
+	874: ('InterestAccrualDate', str, None),
+	913: ('AgreementDesc', str, None),
+	914: ('AgreementID', str, None),
+	915: ('AgreementDate', str, None),
+	918: ('AgreementCurrency', str, None),
+	788: ('TerminationType', int, None),
+	916: ('StartDate', str, None),
+	917: ('EndDate', str, None),
+	919: ('DeliveryType', int, None),
+	898: ('MarginRatio', float, None),
+	38: ('OrderQty', float, None),
+	152: ('CashOrderQty', float, None),
+	516: ('OrderPercent', float, None),
+	468: ('RoundingDirection', str, None),
+	469: ('RoundingModulus', float, None),
+	854: ('QtyType', int, None),
+	235: ('YieldType', str, None),
+	236: ('Yield', float, None),
+	701: ('YieldCalcDate', str, None),
+	696: ('YieldRedemptionDate', str, None),
+	697: ('YieldRedemptionPrice', float, None),
+	698: ('YieldRedemptionPriceType', int, None),
+	711: ('NoUnderlyings', int, _decode_grp_NoUnderlyings),
+	822: ('UnderlyingTradingSessionID', str, None),
+	823: ('UnderlyingTradingSessionSubID', str, None),
+	32: ('LastQty', float, None),
+	31: ('LastPx', float, None),
+	669: ('LastParPx', float, None),
+	194: ('LastSpotRate', float, None),
+	195: ('LastForwardPoints', float, None),
+	30: ('LastMkt', str, None),
+	75: ('TradeDate', str, None),
+	715: ('ClearingBusinessDate', str, None),
+	6: ('AvgPx', float, None),
+	218: ('Spread', float, None),
+	220: ('BenchmarkCurveCurrency', str, None),
+	221: ('BenchmarkCurveName', str, None),
+	222: ('BenchmarkCurvePoint', str, None),
+	662: ('BenchmarkPrice', float, None),
+	663: ('BenchmarkPriceType', int, None),
+	699: ('BenchmarkSecurityID', str, None),
+	761: ('BenchmarkSecurityIDSource', str, None),
+	819: ('AvgPxIndicator', int, None),
+	753: ('NoPosAmt', int, _decode_grp_NoPosAmt),
+	442: ('MultiLegReportingType', str, None),
+	824: ('TradeLegRefID', str, None),
+	555: ('NoLegs', int, _decode_grp_NoLegs),
+	60: ('TransactTime', str, None),
+	768: ('NoTrdRegTimestamps', int, _decode_grp_NoTrdRegTimestamps),
+	63: ('SettlType', str, None),
+	64: ('SettlDate', str, None),
+	573: ('MatchStatus', str, None),
+	574: ('MatchType', str, None),
+	552: ('NoSides', int, _decode_grp_NoSides),
+	797: ('CopyMsgIndicator', str, None),
+	852: ('PublishTrdIndicator', str, None),
+	853: ('ShortSaleReason', int, None),
+}
+
+def _encode_TradeCaptureReport(obj, fixm):
+	d = obj.__dict__
+	add = fixm.append
+	n = 1
+	if 'TradeReportID' in d:
+		add('571=' + str(d['TradeReportID']))
+		n += 1
+	if 'TradeReportTransType' in d:
+		add('487=' + str(d['TradeReportTransType']))
+		n += 1
+	if 'TradeReportType' in d:
+		add('856=' + str(d['TradeReportType']))
+		n += 1
+	if 'TradeRequestID' in d:
+		add('568=' + str(d['TradeRequestID']))
+		n += 1
+	if 'TrdType' in d:
+		add('828=' + str(d['TrdType']))
+		n += 1
+	if 'TrdSubType' in d:
+		add('829=' + str(d['TrdSubType']))
+		n += 1
+	if 'SecondaryTrdType' in d:
+		add('855=' + str(d['SecondaryTrdType']))
+		n += 1
+	if 'TransferReason' in d:
+		add('830=' + str(d['TransferReason']))
+		n += 1
+	if 'ExecType' in d:
+		add('150=' + str(d['ExecType']))
+		n += 1
+	if 'TotNumTradeReports' in d:
+		add('748=' + str(d['TotNumTradeReports']))
+		n += 1
+	if 'LastRptRequested' in d:
+		add('912=' + str(d['LastRptRequested']))
+		n += 1
+	if 'UnsolicitedIndicator' in d:
+		add('325=' + str(d['UnsolicitedIndicator']))
+		n += 1
+	if 'SubscriptionRequestType' in d:
+		add('263=' + str(d['SubscriptionRequestType']))
+		n += 1
+	if 'TradeReportRefID' in d:
+		add('572=' + str(d['TradeReportRefID']))
+		n += 1
+	if 'SecondaryTradeReportRefID' in d:
+		add('881=' + str(d['SecondaryTradeReportRefID']))
+		n += 1
+	if 'SecondaryTradeReportID' in d:
+		add('818=' + str(d['SecondaryTradeReportID']))
+		n += 1
+	if 'TradeLinkID' in d:
+		add('820=' + str(d['TradeLinkID']))
+		n += 1
+	if 'TrdMatchID' in d:
+		add('880=' + str(d['TrdMatchID']))
+		n += 1
+	if 'ExecID' in d:
+		add('17=' + str(d['ExecID']))
+		n += 1
+	if 'OrdStatus' in d:
+		add('39=' + str(d['OrdStatus']))
+		n += 1
+	if 'SecondaryExecID' in d:
+		add('527=' + str(d['SecondaryExecID']))
+		n += 1
+	if 'ExecRestatementReason' in d:
+		add('378=' + str(d['ExecRestatementReason']))
+		n += 1
+	if 'PreviouslyReported' in d:
+		add('570=' + str(d['PreviouslyReported']))
+		n += 1
+	if 'PriceType' in d:
+		add('423=' + str(d['PriceType']))
+		n += 1
+	if 'Symbol' in d:
+		add('55=' + str(d['Symbol']))
+		n += 1
+	if 'SymbolSfx' in d:
+		add('65=' + str(d['SymbolSfx']))
+		n += 1
+	if 'SecurityID' in d:
+		add('48=' + str(d['SecurityID']))
+		n += 1
+	if 'SecurityIDSource' in d:
+		add('22=' + str(d['SecurityIDSource']))
+		n += 1
+	if 'NoSecurityAltID' in d:
+		grp = d['NoSecurityAltID']
+		add('454=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoSecurityAltID(entry, fixm)
+		n += 1
+	if 'Product' in d:
+		add('460=' + str(d['Product']))
+		n += 1
+	if 'CFICode' in d:
+		add('461=' + str(d['CFICode']))
+		n += 1
+	if 'SecurityType' in d:
+		add('167=' + str(d['SecurityType']))
+		n += 1
+	if 'SecuritySubType' in d:
+		add('762=' + str(d['SecuritySubType']))
+		n += 1
+	if 'MaturityMonthYear' in d:
+		add('200=' + str(d['MaturityMonthYear']))
+		n += 1
+	if 'MaturityDate' in d:
+		add('541=' + str(d['MaturityDate']))
+		n += 1
+	if 'CouponPaymentDate' in d:
+		add('224=' + str(d['CouponPaymentDate']))
+		n += 1
+	if 'IssueDate' in d:
+		add('225=' + str(d['IssueDate']))
+		n += 1
+	if 'RepoCollateralSecurityType' in d:
+		add('239=' + str(d['RepoCollateralSecurityType']))
+		n += 1
+	if 'RepurchaseTerm' in d:
+		add('226=' + str(d['RepurchaseTerm']))
+		n += 1
+	if 'RepurchaseRate' in d:
+		add('227=' + str(d['RepurchaseRate']))
+		n += 1
+	if 'Factor' in d:
+		add('228=' + str(d['Factor']))
+		n += 1
+	if 'CreditRating' in d:
+		add('255=' + str(d['CreditRating']))
+		n += 1
+	if 'InstrRegistry' in d:
+		add('543=' + str(d['InstrRegistry']))
+		n += 1
+	if 'CountryOfIssue' in d:
+		add('470=' + str(d['CountryOfIssue']))
+		n += 1
+	if 'StateOrProvinceOfIssue' in d:
+		add('471=' + str(d['StateOrProvinceOfIssue']))
+		n += 1
+	if 'LocaleOfIssue' in d:
+		add('472=' + str(d['LocaleOfIssue']))
+		n += 1
+	if 'RedemptionDate' in d:
+		add('240=' + str(d['RedemptionDate']))
+		n += 1
+	if 'StrikePrice' in d:
+		add('202=' + str(d['StrikePrice']))
+		n += 1
+	if 'StrikeCurrency' in d:
+		add('947=' + str(d['StrikeCurrency']))
+		n += 1
+	if 'OptAttribute' in d:
+		add('206=' + str(d['OptAttribute']))
+		n += 1
+	if 'ContractMultiplier' in d:
+		add('231=' + str(d['ContractMultiplier']))
+		n += 1
+	if 'CouponRate' in d:
+		add('223=' + str(d['CouponRate']))
+		n += 1
+	if 'SecurityExchange' in d:
+		add('207=' + str(d['SecurityExchange']))
+		n += 1
+	if 'Issuer' in d:
+		add('106=' + str(d['Issuer']))
+		n += 1
+	if 'EncodedIssuerLen' in d:
+		add('348=' + str(d['EncodedIssuerLen']))
+		n += 1
+	if 'EncodedIssuer' in d:
+		add('349=' + str(d['EncodedIssuer']))
+		n += 1
+	if 'SecurityDesc' in d:
+		add('107=' + str(d['SecurityDesc']))
+		n += 1
+	if 'EncodedSecurityDescLen' in d:
+		add('350=' + str(d['EncodedSecurityDescLen']))
+		n += 1
+	if 'EncodedSecurityDesc' in d:
+		add('351=' + str(d['EncodedSecurityDesc']))
+		n += 1
+	if 'Pool' in d:
+		add('691=' + str(d['Pool']))
+		n += 1
+	if 'ContractSettlMonth' in d:
+		add('667=' + str(d['ContractSettlMonth']))
+		n += 1
+	if 'CPProgram' in d:
+		add('875=' + str(d['CPProgram']))
+		n += 1
+	if 'CPRegType' in d:
+		add('876=' + str(d['CPRegType']))
+		n += 1
+	if 'NoEvents' in d:
+		grp = d['NoEvents']
+		add('864=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoEvents(entry, fixm)
+		n += 1
+	if 'DatedDate' in d:
+		add('873=' + str(d['DatedDate']))
+		n += 1
+	if 'InterestAccrualDate' in d:
+		add('874=' + str(d['InterestAccrualDate']))
+		n += 1
+	if 'AgreementDesc' in d:
+		add('913=' + str(d['AgreementDesc']))
+		n += 1
+	if 'AgreementID' in d:
+		add('914=' + str(d['AgreementID']))
+		n += 1
+	if 'AgreementDate' in d:
+		add('915=' + str(d['AgreementDate']))
+		n += 1
+	if 'AgreementCurrency' in d:
+		add('918=' + str(d['AgreementCurrency']))
+		n += 1
+	if 'TerminationType' in d:
+		add('788=' + str(d['TerminationType']))
+		n += 1
+	if 'StartDate' in d:
+		add('916=' + str(d['StartDate']))
+		n += 1
+	if 'EndDate' in d:
+		add('917=' + str(d['EndDate']))
+		n += 1
+	if 'DeliveryType' in d:
+		add('919=' + str(d['DeliveryType']))
+		n += 1
+	if 'MarginRatio' in d:
+		add('898=' + str(d['MarginRatio']))
+		n += 1
+	if 'OrderQty' in d:
+		add('38=' + str(d['OrderQty']))
+		n += 1
+	if 'CashOrderQty' in d:
+		add('152=' + str(d['CashOrderQty']))
+		n += 1
+	if 'OrderPercent' in d:
+		add('516=' + str(d['OrderPercent']))
+		n += 1
+	if 'RoundingDirection' in d:
+		add('468=' + str(d['RoundingDirection']))
+		n += 1
+	if 'RoundingModulus' in d:
+		add('469=' + str(d['RoundingModulus']))
+		n += 1
+	if 'QtyType' in d:
+		add('854=' + str(d['QtyType']))
+		n += 1
+	if 'YieldType' in d:
+		add('235=' + str(d['YieldType']))
+		n += 1
+	if 'Yield' in d:
+		add('236=' + str(d['Yield']))
+		n += 1
+	if 'YieldCalcDate' in d:
+		add('701=' + str(d['YieldCalcDate']))
+		n += 1
+	if 'YieldRedemptionDate' in d:
+		add('696=' + str(d['YieldRedemptionDate']))
+		n += 1
+	if 'YieldRedemptionPrice' in d:
+		add('697=' + str(d['YieldRedemptionPrice']))
+		n += 1
+	if 'YieldRedemptionPriceType' in d:
+		add('698=' + str(d['YieldRedemptionPriceType']))
+		n += 1
+	if 'NoUnderlyings' in d:
+		grp = d['NoUnderlyings']
+		add('711=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoUnderlyings(entry, fixm)
+		n += 1
+	if 'UnderlyingTradingSessionID' in d:
+		add('822=' + str(d['UnderlyingTradingSessionID']))
+		n += 1
+	if 'UnderlyingTradingSessionSubID' in d:
+		add('823=' + str(d['UnderlyingTradingSessionSubID']))
+		n += 1
+	if 'LastQty' in d:
+		add('32=' + str(d['LastQty']))
+		n += 1
+	if 'LastPx' in d:
+		add('31=' + str(d['LastPx']))
+		n += 1
+	if 'LastParPx' in d:
+		add('669=' + str(d['LastParPx']))
+		n += 1
+	if 'LastSpotRate' in d:
+		add('194=' + str(d['LastSpotRate']))
+		n += 1
+	if 'LastForwardPoints' in d:
+		add('195=' + str(d['LastForwardPoints']))
+		n += 1
+	if 'LastMkt' in d:
+		add('30=' + str(d['LastMkt']))
+		n += 1
+	if 'TradeDate' in d:
+		add('75=' + str(d['TradeDate']))
+		n += 1
+	if 'ClearingBusinessDate' in d:
+		add('715=' + str(d['ClearingBusinessDate']))
+		n += 1
+	if 'AvgPx' in d:
+		add('6=' + str(d['AvgPx']))
+		n += 1
+	if 'Spread' in d:
+		add('218=' + str(d['Spread']))
+		n += 1
+	if 'BenchmarkCurveCurrency' in d:
+		add('220=' + str(d['BenchmarkCurveCurrency']))
+		n += 1
+	if 'BenchmarkCurveName' in d:
+		add('221=' + str(d['BenchmarkCurveName']))
+		n += 1
+	if 'BenchmarkCurvePoint' in d:
+		add('222=' + str(d['BenchmarkCurvePoint']))
+		n += 1
+	if 'BenchmarkPrice' in d:
+		add('662=' + str(d['BenchmarkPrice']))
+		n += 1
+	if 'BenchmarkPriceType' in d:
+		add('663=' + str(d['BenchmarkPriceType']))
+		n += 1
+	if 'BenchmarkSecurityID' in d:
+		add('699=' + str(d['BenchmarkSecurityID']))
+		n += 1
+	if 'BenchmarkSecurityIDSource' in d:
+		add('761=' + str(d['BenchmarkSecurityIDSource']))
+		n += 1
+	if 'AvgPxIndicator' in d:
+		add('819=' + str(d['AvgPxIndicator']))
+		n += 1
+	if 'NoPosAmt' in d:
+		grp = d['NoPosAmt']
+		add('753=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoPosAmt(entry, fixm)
+		n += 1
+	if 'MultiLegReportingType' in d:
+		add('442=' + str(d['MultiLegReportingType']))
+		n += 1
+	if 'TradeLegRefID' in d:
+		add('824=' + str(d['TradeLegRefID']))
+		n += 1
+	if 'NoLegs' in d:
+		grp = d['NoLegs']
+		add('555=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoLegs(entry, fixm)
+		n += 1
+	if 'TransactTime' in d:
+		add('60=' + str(d['TransactTime']))
+		n += 1
+	if 'NoTrdRegTimestamps' in d:
+		grp = d['NoTrdRegTimestamps']
+		add('768=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoTrdRegTimestamps(entry, fixm)
+		n += 1
+	if 'SettlType' in d:
+		add('63=' + str(d['SettlType']))
+		n += 1
+	if 'SettlDate' in d:
+		add('64=' + str(d['SettlDate']))
+		n += 1
+	if 'MatchStatus' in d:
+		add('573=' + str(d['MatchStatus']))
+		n += 1
+	if 'MatchType' in d:
+		add('574=' + str(d['MatchType']))
+		n += 1
+	if 'NoSides' in d:
+		grp = d['NoSides']
+		add('552=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoSides(entry, fixm)
+		n += 1
+	if 'CopyMsgIndicator' in d:
+		add('797=' + str(d['CopyMsgIndicator']))
+		n += 1
+	if 'PublishTrdIndicator' in d:
+		add('852=' + str(d['PublishTrdIndicator']))
+		n += 1
+	if 'ShortSaleReason' in d:
+		add('853=' + str(d['ShortSaleReason']))
+		n += 1
+	if len(d) > n:
+		_make_mbody(obj, obj._context, fixm, _msg_TradeCaptureReport_names)
+	return fixm
+
+def _decode_TradeCaptureReport(obj, fields, index, context):
+	d = obj.__dict__
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _msg_TradeCaptureReport_tags.get(num)
+		if spec is None:
+			# not a field of this message, continue with generic decoder
+			body, index = _extract_body(fields, index, context, obj)
+			return index
+		name, pytype, decode_grp = spec
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	return index
 
 class TradeCaptureReport(FixObject):
-	pass
+	_encode = staticmethod(_encode_TradeCaptureReport)
+	_decode = staticmethod(_decode_TradeCaptureReport)
+
+_msg_TradeCaptureReportAck_names = frozenset(['TradeReportID', 'TradeReportTransType', 'TradeReportType', 'TrdType', 'TrdSubType', 'SecondaryTrdType', 'TransferReason', 'ExecType', 'TradeReportRefID', 'SecondaryTradeReportRefID', 'TrdRptStatus', 'TradeReportRejectReason', 'SecondaryTradeReportID', 'SubscriptionRequestType', 'TradeLinkID', 'TrdMatchID', 'ExecID', 'SecondaryExecID', 'Symbol', 'SymbolSfx', 'SecurityID', 'SecurityIDSource', 'NoSecurityAltID', 'Product', 'CFICode', 'SecurityType', 'SecuritySubType', 'MaturityMonthYear', 'MaturityDate', 'CouponPaymentDate', 'IssueDate', 'RepoCollateralSecurityType', 'RepurchaseTerm', 'RepurchaseRate', 'Factor', 'CreditRating', 'InstrRegistry', 'CountryOfIssue', 'StateOrProvinceOfIssue', 'LocaleOfIssue', 'RedemptionDate', 'StrikePrice', 'StrikeCurrency', 'OptAttribute', 'ContractMultiplier', 'CouponRate', 'SecurityExchange', 'Issuer', 'EncodedIssuerLen', 'EncodedIssuer', 'SecurityDesc', 'EncodedSecurityDescLen', 'EncodedSecurityDesc', 'Pool', 'ContractSettlMonth', 'CPProgram', 'CPRegType', 'NoEvents', 'DatedDate', 'InterestAccrualDate', 'TransactTime', 'NoTrdRegTimestamps', 'ResponseTransportType', 'ResponseDestination', 'Text', 'EncodedTextLen', 'EncodedText', 'NoLegs', 'ClearingFeeIndicator', 'OrderCapacity', 'OrderRestrictions', 'CustOrderCapacity', 'Account', 'AcctIDSource', 'AccountType', 'PositionEffect', 'PreallocMethod', 'NoAllocs'])
+
+_msg_TradeCaptureReportAck_tags = {
+	571: ('TradeReportID', str, None),
+	487: ('TradeReportTransType', int, None),
+	856: ('TradeReportType', int, None),
+	828: ('TrdType', int, None),
+	829: ('TrdSubType', int, None),
+	855: ('SecondaryTrdType', int, None),
+	830: ('TransferReason', str, None),
+	150: ('ExecType', str, None),
+	572: ('TradeReportRefID', str, None),
+	881: ('SecondaryTradeReportRefID', str, None),
+	939: ('TrdRptStatus', int, None),
+	751: ('TradeReportRejectReason', int, None),
+	818: ('SecondaryTradeReportID', str, None),
+	263: ('SubscriptionRequestType', str, None),
+	820: ('TradeLinkID', str, None),
+	880: ('TrdMatchID', str, None),
+	17: ('ExecID', str, None),
+	527: ('SecondaryExecID', str, None),
+	55: ('Symbol', str, None),
+	65: ('SymbolSfx', str, None),
+	48: ('SecurityID', str, None),
+	22: ('SecurityIDSource', str, None),
+	454: ('NoSecurityAltID', int, _decode_grp_NoSecurityAltID),
+	460: ('Product', int, None),
+	461: ('CFICode', str, None),
+	167: ('SecurityType', str, None),
+	762: ('SecuritySubType', str, None),
+	200: ('MaturityMonthYear', str, None),
+	541: ('MaturityDate', str, None),
+	224: ('CouponPaymentDate', str, None),
+	225: ('IssueDate', str, None),
+	239: ('RepoCollateralSecurityType', int, None),
+	226: ('RepurchaseTerm', int, None),
+	227: ('RepurchaseRate', float, None),
+	228: ('Factor', float, None),
+	255: ('CreditRating', str, None),
+	543: ('InstrRegistry', str, None),
+	470: ('CountryOfIssue', str, None),
+	471: ('StateOrProvinceOfIssue', str, None),
+	472: ('LocaleOfIssue', str, None),
+	240: ('RedemptionDate', str, None),
+	202: ('StrikePrice', float, None),
+	947: ('StrikeCurrency', str, None),
+	206: ('OptAttribute', str, None),
+	231: ('ContractMultiplier', float, None),
+	223: ('CouponRate', float, None),
+	207: ('SecurityExchange', str, None),
+	106: ('Issuer', str, None),
+	348: ('EncodedIssuerLen', str, None),
+	349: ('EncodedIssuer', str, None),
+	107: ('SecurityDesc', str, None),
+	350: ('EncodedSecurityDescLen', str, None),
+	351: ('EncodedSecurityDesc', str, None),
+	691: ('Pool', str, None),
+	667: ('ContractSettlMonth', str, None),
+	875: ('CPProgram', int, None),
+	876: ('CPRegType', str, None),
+	864: ('NoEvents', int, _decode_grp_NoEvents),
+	873: ('DatedDate', str, None),
+	874: ('InterestAccrualDate', str, None),
+	60: ('TransactTime', str, None),
+	768: ('NoTrdRegTimestamps', int, _decode_grp_NoTrdRegTimestamps),
+	725: ('ResponseTransportType', int, None),
+	726: ('ResponseDestination', str, None),
+	58: ('Text', str, None),
+	354: ('EncodedTextLen', str, None),
+	355: ('EncodedText', str, None),
+	555: ('NoLegs', int, _decode_grp_NoLegs),
+	635: ('ClearingFeeIndicator', str, None),
+	528: ('OrderCapacity', str, None),
+	529: ('OrderRestrictions', str, None),
+	582: ('CustOrderCapacity', int, None),
+	1: ('Account', str, None),
+	660: ('AcctIDSource', int, None),
+	581: ('AccountType', int, None),
+	77: ('PositionEffect', str, None),
+	591: ('PreallocMethod', str, None),
+	78: ('NoAllocs', int, _decode_grp_NoAllocs),
+}
+
+def _encode_TradeCaptureReportAck(obj, fixm):
+	d = obj.__dict__
+	add = fixm.append
+	n = 1
+	if 'TradeReportID' in d:
+		add('571=' + str(d['TradeReportID']))
+		n += 1
+	if 'TradeReportTransType' in d:
+		add('487=' + str(d['TradeReportTransType']))
+		n += 1
+	if 'TradeReportType' in d:
+		add('856=' + str(d['TradeReportType']))
+		n += 1
+	if 'TrdType' in d:
+		add('828=' + str(d['TrdType']))
+		n += 1
+	if 'TrdSubType' in d:
+		add('829=' + str(d['TrdSubType']))
+		n += 1
+	if 'SecondaryTrdType' in d:
+		add('855=' + str(d['SecondaryTrdType']))
+		n += 1
+	if 'TransferReason' in d:
+		add('830=' + str(d['TransferReason']))
+		n += 1
+	if 'ExecType' in d:
+		add('150=' + str(d['ExecType']))
+		n += 1
+	if 'TradeReportRefID' in d:
+		add('572=' + str(d['TradeReportRefID']))
+		n += 1
+	if 'SecondaryTradeReportRefID' in d:
+		add('881=' + str(d['SecondaryTradeReportRefID']))
+		n += 1
+	if 'TrdRptStatus' in d:
+		add('939=' + str(d['TrdRptStatus']))
+		n += 1
+	if 'TradeReportRejectReason' in d:
+		add('751=' + str(d['TradeReportRejectReason']))
+		n += 1
+	if 'SecondaryTradeReportID' in d:
+		add('818=' + str(d['SecondaryTradeReportID']))
+		n += 1
+	if 'SubscriptionRequestType' in d:
+		add('263=' + str(d['SubscriptionRequestType']))
+		n += 1
+	if 'TradeLinkID' in d:
+		add('820=' + str(d['TradeLinkID']))
+		n += 1
+	if 'TrdMatchID' in d:
+		add('880=' + str(d['TrdMatchID']))
+		n += 1
+	if 'ExecID' in d:
+		add('17=' + str(d['ExecID']))
+		n += 1
+	if 'SecondaryExecID' in d:
+		add('527=' + str(d['SecondaryExecID']))
+		n += 1
+	if 'Symbol' in d:
+		add('55=' + str(d['Symbol']))
+		n += 1
+	if 'SymbolSfx' in d:
+		add('65=' + str(d['SymbolSfx']))
+		n += 1
+	if 'SecurityID' in d:
+		add('48=' + str(d['SecurityID']))
+		n += 1
+	if 'SecurityIDSource' in d:
+		add('22=' + str(d['SecurityIDSource']))
+		n += 1
+	if 'NoSecurityAltID' in d:
+		grp = d['NoSecurityAltID']
+		add('454=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoSecurityAltID(entry, fixm)
+		n += 1
+	if 'Product' in d:
+		add('460=' + str(d['Product']))
+		n += 1
+	if 'CFICode' in d:
+		add('461=' + str(d['CFICode']))
+		n += 1
+	if 'SecurityType' in d:
+		add('167=' + str(d['SecurityType']))
+		n += 1
+	if 'SecuritySubType' in d:
+		add('762=' + str(d['SecuritySubType']))
+		n += 1
+	if 'MaturityMonthYear' in d:
+		add('200=' + str(d['MaturityMonthYear']))
+		n += 1
+	if 'MaturityDate' in d:
+		add('541=' + str(d['MaturityDate']))
+		n += 1
+	if 'CouponPaymentDate' in d:
+		add('224=' + str(d['CouponPaymentDate']))
+		n += 1
+	if 'IssueDate' in d:
+		add('225=' + str(d['IssueDate']))
+		n += 1
+	if 'RepoCollateralSecurityType' in d:
+		add('239=' + str(d['RepoCollateralSecurityType']))
+		n += 1
+	if 'RepurchaseTerm' in d:
+		add('226=' + str(d['RepurchaseTerm']))
+		n += 1
+	if 'RepurchaseRate' in d:
+		add('227=' + str(d['RepurchaseRate']))
+		n += 1
+	if 'Factor' in d:
+		add('228=' + str(d['Factor']))
+		n += 1
+	if 'CreditRating' in d:
+		add('255=' + str(d['CreditRating']))
+		n += 1
+	if 'InstrRegistry' in d:
+		add('543=' + str(d['InstrRegistry']))
+		n += 1
+	if 'CountryOfIssue' in d:
+		add('470=' + str(d['CountryOfIssue']))
+		n += 1
+	if 'StateOrProvinceOfIssue' in d:
+		add('471=' + str(d['StateOrProvinceOfIssue']))
+		n += 1
+	if 'LocaleOfIssue' in d:
+		add('472=' + str(d['LocaleOfIssue']))
+		n += 1
+	if 'RedemptionDate' in d:
+		add('240=' + str(d['RedemptionDate']))
+		n += 1
+	if 'StrikePrice' in d:
+		add('202=' + str(d['StrikePrice']))
+		n += 1
+	if 'StrikeCurrency' in d:
+		add('947=' + str(d['StrikeCurrency']))
+		n += 1
+	if 'OptAttribute' in d:
+		add('206=' + str(d['OptAttribute']))
+		n += 1
+	if 'ContractMultiplier' in d:
+		add('231=' + str(d['ContractMultiplier']))
+		n += 1
+	if 'CouponRate' in d:
+		add('223=' + str(d['CouponRate']))
+		n += 1
+	if 'SecurityExchange' in d:
+		add('207=' + str(d['SecurityExchange']))
+		n += 1
+	if 'Issuer' in d:
+		add('106=' + str(d['Issuer']))
+		n += 1
+	if 'EncodedIssuerLen' in d:
+		add('348=' + str(d['EncodedIssuerLen']))
+		n += 1
+	if 'EncodedIssuer' in d:
+		add('349=' + str(d['EncodedIssuer']))
+		n += 1
+	if 'SecurityDesc' in d:
+		add('107=' + str(d['SecurityDesc']))
+		n += 1
+	if 'EncodedSecurityDescLen' in d:
+		add('350=' + str(d['EncodedSecurityDescLen']))
+		n += 1
+	if 'EncodedSecurityDesc' in d:
+		add('351=' + str(d['EncodedSecurityDesc']))
+		n += 1
+	if 'Pool' in d:
+		add('691=' + str(d['Pool']))
+		n += 1
+	if 'ContractSettlMonth' in d:
+		add('667=' + str(d['ContractSettlMonth']))
+		n += 1
+	if 'CPProgram' in d:
+		add('875=' + str(d['CPProgram']))
+		n += 1
+	if 'CPRegType' in d:
+		add('876=' + str(d['CPRegType']))
+		n += 1
+	if 'NoEvents' in d:
+		grp = d['NoEvents']
+		add('864=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoEvents(entry, fixm)
+		n += 1
+	if 'DatedDate' in d:
+		add('873=' + str(d['DatedDate']))
+		n += 1
+	if 'InterestAccrualDate' in d:
+		add('874=' + str(d['InterestAccrualDate']))
+		n += 1
+	if 'TransactTime' in d:
+		add('60=' + str(d['TransactTime']))
+		n += 1
+	if 'NoTrdRegTimestamps' in d:
+		grp = d['NoTrdRegTimestamps']
+		add('768=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoTrdRegTimestamps(entry, fixm)
+		n += 1
+	if 'ResponseTransportType' in d:
+		add('725=' + str(d['ResponseTransportType']))
+		n += 1
+	if 'ResponseDestination' in d:
+		add('726=' + str(d['ResponseDestination']))
+		n += 1
+	if 'Text' in d:
+		add('58=' + str(d['Text']))
+		n += 1
+	if 'EncodedTextLen' in d:
+		add('354=' + str(d['EncodedTextLen']))
+		n += 1
+	if 'EncodedText' in d:
+		add('355=' + str(d['EncodedText']))
+		n += 1
+	if 'NoLegs' in d:
+		grp = d['NoLegs']
+		add('555=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoLegs(entry, fixm)
+		n += 1
+	if 'ClearingFeeIndicator' in d:
+		add('635=' + str(d['ClearingFeeIndicator']))
+		n += 1
+	if 'OrderCapacity' in d:
+		add('528=' + str(d['OrderCapacity']))
+		n += 1
+	if 'OrderRestrictions' in d:
+		add('529=' + str(d['OrderRestrictions']))
+		n += 1
+	if 'CustOrderCapacity' in d:
+		add('582=' + str(d['CustOrderCapacity']))
+		n += 1
+	if 'Account' in d:
+		add('1=' + str(d['Account']))
+		n += 1
+	if 'AcctIDSource' in d:
+		add('660=' + str(d['AcctIDSource']))
+		n += 1
+	if 'AccountType' in d:
+		add('581=' + str(d['AccountType']))
+		n += 1
+	if 'PositionEffect' in d:
+		add('77=' + str(d['PositionEffect']))
+		n += 1
+	if 'PreallocMethod' in d:
+		add('591=' + str(d['PreallocMethod']))
+		n += 1
+	if 'NoAllocs' in d:
+		grp = d['NoAllocs']
+		add('78=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoAllocs(entry, fixm)
+		n += 1
+	if len(d) > n:
+		_make_mbody(obj, obj._context, fixm, _msg_TradeCaptureReportAck_names)
+	return fixm
+
+def _decode_TradeCaptureReportAck(obj, fields, index, context):
+	d = obj.__dict__
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _msg_TradeCaptureReportAck_tags.get(num)
+		if spec is None:
+			# not a field of this message, continue with generic decoder
+			body, index = _extract_body(fields, index, context, obj)
+			return index
+		name, pytype, decode_grp = spec
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	return index
 
 class TradeCaptureReportAck(FixObject):
-	pass
+	_encode = staticmethod(_encode_TradeCaptureReportAck)
+	_decode = staticmethod(_decode_TradeCaptureReportAck)
+
+_msg_TradeCaptureReportRequest_names = frozenset(['TradeRequestID', 'TradeRequestType', 'SubscriptionRequestType', 'TradeReportID', 'SecondaryTradeReportID', 'ExecID', 'ExecType', 'OrderID', 'ClOrdID', 'MatchStatus', 'TrdType', 'TrdSubType', 'TransferReason', 'SecondaryTrdType', 'TradeLinkID', 'TrdMatchID', 'NoPartyIDs', 'Symbol', 'SymbolSfx', 'SecurityID', 'SecurityIDSource', 'NoSecurityAltID', 'Product', 'CFICode', 'SecurityType', 'SecuritySubType', 'MaturityMonthYear', 'MaturityDate', 'CouponPaymentDate', 'IssueDate', 'RepoCollateralSecurityType', 'RepurchaseTerm', 'RepurchaseRate', 'Factor', 'CreditRating', 'InstrRegistry', 'CountryOfIssue', 'StateOrProvinceOfIssue', 'LocaleOfIssue', 'RedemptionDate', 'StrikePrice', 'StrikeCurrency', 'OptAttribute', 'ContractMultiplier', 'CouponRate', 'SecurityExchange', 'Issuer', 'EncodedIssuerLen', 'EncodedIssuer', 'SecurityDesc', 'EncodedSecurityDescLen', 'EncodedSecurityDesc', 'Pool', 'ContractSettlMonth', 'CPProgram', 'CPRegType', 'NoEvents', 'DatedDate', 'InterestAccrualDate', 'DeliveryForm', 'PctAtRisk', 'NoInstrAttrib', 'AgreementDesc', 'AgreementID', 'AgreementDate', 'AgreementCurrency', 'TerminationType', 'StartDate', 'EndDate', 'DeliveryType', 'MarginRatio', 'NoUnderlyings', 'NoLegs', 'NoDates', 'ClearingBusinessDate', 'TradingSessionID', 'TradingSessionSubID', 'TimeBracket', 'Side', 'MultiLegReportingType', 'TradeInputSource', 'TradeInputDevice', 'ResponseTransportType', 'ResponseDestination', 'Text', 'EncodedTextLen', 'EncodedText'])
+
+_msg_TradeCaptureReportRequest_tags = {
+	568: ('TradeRequestID', str, None),
+	569: ('TradeRequestType', int, None),
+	263: ('SubscriptionRequestType', str, None),
+	571: ('TradeReportID', str, None),
+	818: ('SecondaryTradeReportID', str, None),
+	17: ('ExecID', str, None),
+	150: ('ExecType', str, None),
+	37: ('OrderID', str, None),
+	11: ('ClOrdID', str, None),
+	573: ('MatchStatus', str, None),
+	828: ('TrdType', int, None),
+	829: ('TrdSubType', int, None),
+	830: ('TransferReason', str, None),
+	855: ('SecondaryTrdType', int, None),
+	820: ('TradeLinkID', str, None),
+	880: ('TrdMatchID', str, None),
+	453: ('NoPartyIDs', int, _decode_grp_NoPartyIDs),
+	55: ('Symbol', str, None),
+	65: ('SymbolSfx', str, None),
+	48: ('SecurityID', str, None),
+	22: ('SecurityIDSource', str, None),
+	454: ('NoSecurityAltID', int, _decode_grp_NoSecurityAltID),
+	460: ('Product', int, None),
+	461: ('CFICode', str, None),
+	167: ('SecurityType', str, None),
+	762: ('SecuritySubType', str, None),
+	200: ('MaturityMonthYear', str, None),
+	541: ('MaturityDate', str, None),
+	224: ('CouponPaymentDate', str, None),
+	225: ('IssueDate', str, None),
+	239: ('RepoCollateralSecurityType', int, None),
+	226: ('RepurchaseTerm', int, None),
+	227: ('RepurchaseRate', float, None),
+	228: ('Factor', float, None),
+	255: ('CreditRating', str, None),
+	543: ('InstrRegistry', str, None),
+	470: ('CountryOfIssue', str, None),
+	471: ('StateOrProvinceOfIssue', str, None),
+	472: ('LocaleOfIssue', str, None),
+	240: ('RedemptionDate', str, None),
+	202: ('StrikePrice', float, None),
+	947: ('StrikeCurrency', str, None),
+	206: ('OptAttribute', str, None),
+	231: ('ContractMultiplier', float, None),
+	223: ('CouponRate', float, None),
+	207: ('SecurityExchange', str, None),
+	106: ('Issuer', str, None),
+	348: ('EncodedIssuerLen', str, None),
+	349: ('EncodedIssuer', str, None),
+	107: ('SecurityDesc', str, None),
+	350: ('EncodedSecurityDescLen', str, None),
+	351: ('EncodedSecurityDesc', str, None),
+	691: ('Pool', str, None),
+	667: ('ContractSettlMonth', str, None),
+	875: ('CPProgram', int, None),
+	876: ('CPRegType', str, None),
+	864: ('NoEvents', int, _decode_grp_NoEvents),
+	873: ('DatedDate', str, None),
+	874: ('InterestAccrualDate', str, None),
+	668: ('DeliveryForm', int, None),
+	869: ('PctAtRisk', float, None),
+	870: ('NoInstrAttrib', int, _decode_grp_NoInstrAttrib),
+	913: ('AgreementDesc', str, None),
+	914: ('AgreementID', str, None),
+	915: ('AgreementDate', str, None),
+	918: ('AgreementCurrency', str, None),
+	788: ('TerminationType', int, None),
+	916: ('StartDate', str, None),
+	917: ('EndDate', str, None),
+	919: ('DeliveryType', int, None),
+	898: ('MarginRatio', float, None),
+	711: ('NoUnderlyings', int, _decode_grp_NoUnderlyings),
+	555: ('NoLegs', int, _decode_grp_NoLegs),
+	580: ('NoDates', int, _decode_grp_NoDates),
+	715: ('ClearingBusinessDate', str, None),
+	336: ('TradingSessionID', str, None),
+	625: ('TradingSessionSubID', str, None),
+	943: ('TimeBracket', str, None),
+	54: ('Side', str, None),
+	442: ('MultiLegReportingType', str, None),
+	578: ('TradeInputSource', str, None),
+	579: ('TradeInputDevice', str, None),
+	725: ('ResponseTransportType', int, None),
+	726: ('ResponseDestination', str, None),
+	58: ('Text', str, None),
+	354: ('EncodedTextLen', str, None),
+	355: ('EncodedText', str, None),
+}
+
+def _encode_TradeCaptureReportRequest(obj, fixm):
+	d = obj.__dict__
+	add = fixm.append
+	n = 1
+	if 'TradeRequestID' in d:
+		add('568=' + str(d['TradeRequestID']))
+		n += 1
+	if 'TradeRequestType' in d:
+		add('569=' + str(d['TradeRequestType']))
+		n += 1
+	if 'SubscriptionRequestType' in d:
+		add('263=' + str(d['SubscriptionRequestType']))
+		n += 1
+	if 'TradeReportID' in d:
+		add('571=' + str(d['TradeReportID']))
+		n += 1
+	if 'SecondaryTradeReportID' in d:
+		add('818=' + str(d['SecondaryTradeReportID']))
+		n += 1
+	if 'ExecID' in d:
+		add('17=' + str(d['ExecID']))
+		n += 1
+	if 'ExecType' in d:
+		add('150=' + str(d['ExecType']))
+		n += 1
+	if 'OrderID' in d:
+		add('37=' + str(d['OrderID']))
+		n += 1
+	if 'ClOrdID' in d:
+		add('11=' + str(d['ClOrdID']))
+		n += 1
+	if 'MatchStatus' in d:
+		add('573=' + str(d['MatchStatus']))
+		n += 1
+	if 'TrdType' in d:
+		add('828=' + str(d['TrdType']))
+		n += 1
+	if 'TrdSubType' in d:
+		add('829=' + str(d['TrdSubType']))
+		n += 1
+	if 'TransferReason' in d:
+		add('830=' + str(d['TransferReason']))
+		n += 1
+	if 'SecondaryTrdType' in d:
+		add('855=' + str(d['SecondaryTrdType']))
+		n += 1
+	if 'TradeLinkID' in d:
+		add('820=' + str(d['TradeLinkID']))
+		n += 1
+	if 'TrdMatchID' in d:
+		add('880=' + str(d['TrdMatchID']))
+		n += 1
+	if 'NoPartyIDs' in d:
+		grp = d['NoPartyIDs']
+		add('453=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoPartyIDs(entry, fixm)
+		n += 1
+	if 'Symbol' in d:
+		add('55=' + str(d['Symbol']))
+		n += 1
+	if 'SymbolSfx' in d:
+		add('65=' + str(d['SymbolSfx']))
+		n += 1
+	if 'SecurityID' in d:
+		add('48=' + str(d['SecurityID']))
+		n += 1
+	if 'SecurityIDSource' in d:
+		add('22=' + str(d['SecurityIDSource']))
+		n += 1
+	if 'NoSecurityAltID' in d:
+		grp = d['NoSecurityAltID']
+		add('454=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoSecurityAltID(entry, fixm)
+		n += 1
+	if 'Product' in d:
+		add('460=' + str(d['Product']))
+		n += 1
+	if 'CFICode' in d:
+		add('461=' + str(d['CFICode']))
+		n += 1
+	if 'SecurityType' in d:
+		add('167=' + str(d['SecurityType']))
+		n += 1
+	if 'SecuritySubType' in d:
+		add('762=' + str(d['SecuritySubType']))
+		n += 1
+	if 'MaturityMonthYear' in d:
+		add('200=' + str(d['MaturityMonthYear']))
+		n += 1
+	if 'MaturityDate' in d:
+		add('541=' + str(d['MaturityDate']))
+		n += 1
+	if 'CouponPaymentDate' in d:
+		add('224=' + str(d['CouponPaymentDate']))
+		n += 1
+	if 'IssueDate' in d:
+		add('225=' + str(d['IssueDate']))
+		n += 1
+	if 'RepoCollateralSecurityType' in d:
+		add('239=' + str(d['RepoCollateralSecurityType']))
+		n += 1
+	if 'RepurchaseTerm' in d:
+		add('226=' + str(d['RepurchaseTerm']))
+		n += 1
+	if 'RepurchaseRate' in d:
+		add('227=' + str(d['RepurchaseRate']))
+		n += 1
+	if 'Factor' in d:
+		add('228=' + str(d['Factor']))
+		n += 1
+	if 'CreditRating' in d:
+		add('255=' + str(d['CreditRating']))
+		n += 1
+	if 'InstrRegistry' in d:
+		add('543=' + str(d['InstrRegistry']))
+		n += 1
+	if 'CountryOfIssue' in d:
+		add('470=' + str(d['CountryOfIssue']))
+		n += 1
+	if 'StateOrProvinceOfIssue' in d:
+		add('471=' + str(d['StateOrProvinceOfIssue']))
+		n += 1
+	if 'LocaleOfIssue' in d:
+		add('472=' + str(d['LocaleOfIssue']))
+		n += 1
+	if 'RedemptionDate' in d:
+		add('240=' + str(d['RedemptionDate']))
+		n += 1
+	if 'StrikePrice' in d:
+		add('202=' + str(d['StrikePrice']))
+		n += 1
+	if 'StrikeCurrency' in d:
+		add('947=' + str(d['StrikeCurrency']))
+		n += 1
+	if 'OptAttribute' in d:
+		add('206=' + str(d['OptAttribute']))
+		n += 1
+	if 'ContractMultiplier' in d:
+		add('231=' + str(d['ContractMultiplier']))
+		n += 1
+	if 'CouponRate' in d:
+		add('223=' + str(d['CouponRate']))
+		n += 1
+	if 'SecurityExchange' in d:
+		add('207=' + str(d['SecurityExchange']))
+		n += 1
+	if 'Issuer' in d:
+		add('106=' + str(d['Issuer']))
+		n += 1
+	if 'EncodedIssuerLen' in d:
+		add('348=' + str(d['EncodedIssuerLen']))
+		n += 1
+	if 'EncodedIssuer' in d:
+		add('349=' + str(d['EncodedIssuer']))
+		n += 1
+	if 'SecurityDesc' in d:
+		add('107=' + str(d['SecurityDesc']))
+		n += 1
+	if 'EncodedSecurityDescLen' in d:
+		add('350=' + str(d['EncodedSecurityDescLen']))
+		n += 1
+	if 'EncodedSecurityDesc' in d:
+		add('351=' + str(d['EncodedSecurityDesc']))
+		n += 1
+	if 'Pool' in d:
+		add('691=' + str(d['Pool']))
+		n += 1
+	if 'ContractSettlMonth' in d:
+		add('667=' + str(d['ContractSettlMonth']))
+		n += 1
+	if 'CPProgram' in d:
+		add('875=' + str(d['CPProgram']))
+		n += 1
+	if 'CPRegType' in d:
+		add('876=' + str(d['CPRegType']))
+		n += 1
+	if 'NoEvents' in d:
+		grp = d['NoEvents']
+		add('864=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoEvents(entry, fixm)
+		n += 1
+	if 'DatedDate' in d:
+		add('873=' + str(d['DatedDate']))
+		n += 1
+	if 'InterestAccrualDate' in d:
+		add('874=' + str(d['InterestAccrualDate']))
+		n += 1
+	if 'DeliveryForm' in d:
+		add('668=' + str(d['DeliveryForm']))
+		n += 1
+	if 'PctAtRisk' in d:
+		add('869=' + str(d['PctAtRisk']))
+		n += 1
+	if 'NoInstrAttrib' in d:
+		grp = d['NoInstrAttrib']
+		add('870=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoInstrAttrib(entry, fixm)
+		n += 1
+	if 'AgreementDesc' in d:
+		add('913=' + str(d['AgreementDesc']))
+		n += 1
+	if 'AgreementID' in d:
+		add('914=' + str(d['AgreementID']))
+		n += 1
+	if 'AgreementDate' in d:
+		add('915=' + str(d['AgreementDate']))
+		n += 1
+	if 'AgreementCurrency' in d:
+		add('918=' + str(d['AgreementCurrency']))
+		n += 1
+	if 'TerminationType' in d:
+		add('788=' + str(d['TerminationType']))
+		n += 1
+	if 'StartDate' in d:
+		add('916=' + str(d['StartDate']))
+		n += 1
+	if 'EndDate' in d:
+		add('917=' + str(d['EndDate']))
+		n += 1
+	if 'DeliveryType' in d:
+		add('919=' + str(d['DeliveryType']))
+		n += 1
+	if 'MarginRatio' in d:
+		add('898=' + str(d['MarginRatio']))
+		n += 1
+	if 'NoUnderlyings' in d:
+		grp = d['NoUnderlyings']
+		add('711=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoUnderlyings(entry, fixm)
+		n += 1
+	if 'NoLegs' in d:
+		grp = d['NoLegs']
+		add('555=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoLegs(entry, fixm)
+		n += 1
+	if 'NoDates' in d:
+		grp = d['NoDates']
+		add('580=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoDates(entry, fixm)
+		n += 1
+	if 'ClearingBusinessDate' in d:
+		add('715=' + str(d['ClearingBusinessDate']))
+		n += 1
+	if 'TradingSessionID' in d:
+		add('336=' + str(d['TradingSessionID']))
+		n += 1
+	if 'TradingSessionSubID' in d:
+		add('625=' + str(d['TradingSessionSubID']))
+		n += 1
+	if 'TimeBracket' in d:
+		add('943=' + str(d['TimeBracket']))
+		n += 1
+	if 'Side' in d:
+		add('54=' + str(d['Side']))
+		n += 1
+	if 'MultiLegReportingType' in d:
+		add('442=' + str(d['MultiLegReportingType']))
+		n += 1
+	if 'TradeInputSource' in d:
+		add('578=' + str(d['TradeInputSource']))
+		n += 1
+	if 'TradeInputDevice' in d:
+		add('579=' + str(d['TradeInputDevice']))
+		n += 1
+	if 'ResponseTransportType' in d:
+		add('725=' + str(d['ResponseTransportType']))
+		n += 1
+	if 'ResponseDestination' in d:
+		add('726=' + str(d['ResponseDestination']))
+		n += 1
+	if 'Text' in d:
+		add('58=' + str(d['Text']))
+		n += 1
+	if 'EncodedTextLen' in d:
+		add('354=' + str(d['EncodedTextLen']))
+		n += 1
+	if 'EncodedText' in d:
+		add('355=' + str(d['EncodedText']))
+		n += 1
+	if len(d) > n:
+		_make_mbody(obj, obj._context, fixm, _msg_TradeCaptureReportRequest_names)
+	return fixm
+
+def _decode_TradeCaptureReportRequest(obj, fields, index, context):
+	d = obj.__dict__
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _msg_TradeCaptureReportRequest_tags.get(num)
+		if spec is None:
+			# not a field of this message, continue with generic decoder
+			body, index = _extract_body(fields, index, context, obj)
+			return index
+		name, pytype, decode_grp = spec
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	return index
 
 class TradeCaptureReportRequest(FixObject):
-	pass
+	_encode = staticmethod(_encode_TradeCaptureReportRequest)
+	_decode = staticmethod(_decode_TradeCaptureReportRequest)
+
+_msg_TradeCaptureReportRequestAck_names = frozenset(['TradeRequestID', 'TradeRequestType', 'SubscriptionRequestType', 'TotNumTradeReports', 'TradeRequestResult', 'TradeRequestStatus', 'Symbol', 'SymbolSfx', 'SecurityID', 'SecurityIDSource', 'NoSecurityAltID', 'Product', 'CFICode', 'SecurityType', 'SecuritySubType', 'MaturityMonthYear', 'MaturityDate', 'CouponPaymentDate', 'IssueDate', 'RepoCollateralSecurityType', 'RepurchaseTerm', 'RepurchaseRate', 'Factor', 'CreditRating', 'InstrRegistry', 'CountryOfIssue', 'StateOrProvinceOfIssue', 'LocaleOfIssue', 'RedemptionDate', 'StrikePrice', 'StrikeCurrency', 'OptAttribute', 'ContractMultiplier', 'CouponRate', 'SecurityExchange', 'Issuer', 'EncodedIssuerLen', 'EncodedIssuer', 'SecurityDesc', 'EncodedSecurityDescLen', 'EncodedSecurityDesc', 'Pool', 'ContractSettlMonth', 'CPProgram', 'CPRegType', 'NoEvents', 'DatedDate', 'InterestAccrualDate', 'NoUnderlyings', 'NoLegs', 'MultiLegReportingType', 'ResponseTransportType', 'ResponseDestination', 'Text', 'EncodedTextLen', 'EncodedText'])
+
+_msg_TradeCaptureReportRequestAck_tags = {
+	568: ('TradeRequestID', str, None),
+	569: ('TradeRequestType', int, None),
+	263: ('SubscriptionRequestType', str, None),
+	748: ('TotNumTradeReports', int, None),
+	749: ('TradeRequestResult', int, None),
+	750: ('TradeRequestStatus', int, None),
+	55: ('Symbol', str, None),
+	65: ('SymbolSfx', str, None),
+	48: ('SecurityID', str, None),
+	22: ('SecurityIDSource', str, None),
+	454: ('NoSecurityAltID', int, _decode_grp_NoSecurityAltID),
+	460: ('Product', int, None),
+	461: ('CFICode', str, None),
+	167: ('SecurityType', str, None),
+	762: ('SecuritySubType', str, None),
+	200: ('MaturityMonthYear', str, None),
+	541: ('MaturityDate', str, None),
+	224: ('CouponPaymentDate', str, None),
+	225: ('IssueDate', str, None),
+	239: ('RepoCollateralSecurityType', int, None),
+	226: ('RepurchaseTerm', int, None),
+	227: ('RepurchaseRate', float, None),
+	228: ('Factor', float, None),
+	255: ('CreditRating', str, None),
+	543: ('InstrRegistry', str, None),
+	470: ('CountryOfIssue', str, None),
+	471: ('StateOrProvinceOfIssue', str, None),
+	472: ('LocaleOfIssue', str, None),
+	240: ('RedemptionDate', str, None),
+	202: ('StrikePrice', float, None),
+	947: ('StrikeCurrency', str, None),
+	206: ('OptAttribute', str, None),
+	231: ('ContractMultiplier', float, None),
+	223: ('CouponRate', float, None),
+	207: ('SecurityExchange', str, None),
+	106: ('Issuer', str, None),
+	348: ('EncodedIssuerLen', str, None),
+	349: ('EncodedIssuer', str, None),
+	107: ('SecurityDesc', str, None),
+	350: ('EncodedSecurityDescLen', str, None),
+	351: ('EncodedSecurityDesc', str, None),
+	691: ('Pool', str, None),
+	667: ('ContractSettlMonth', str, None),
+	875: ('CPProgram', int, None),
+	876: ('CPRegType', str, None),
+	864: ('NoEvents', int, _decode_grp_NoEvents),
+	873: ('DatedDate', str, None),
+	874: ('InterestAccrualDate', str, None),
+	711: ('NoUnderlyings', int, _decode_grp_NoUnderlyings),
+	555: ('NoLegs', int, _decode_grp_NoLegs),
+	442: ('MultiLegReportingType', str, None),
+	725: ('ResponseTransportType', int, None),
+	726: ('ResponseDestination', str, None),
+	58: ('Text', str, None),
+	354: ('EncodedTextLen', str, None),
+	355: ('EncodedText', str, None),
+}
+
+def _encode_TradeCaptureReportRequestAck(obj, fixm):
+	d = obj.__dict__
+	add = fixm.append
+	n = 1
+	if 'TradeRequestID' in d:
+		add('568=' + str(d['TradeRequestID']))
+		n += 1
+	if 'TradeRequestType' in d:
+		add('569=' + str(d['TradeRequestType']))
+		n += 1
+	if 'SubscriptionRequestType' in d:
+		add('263=' + str(d['SubscriptionRequestType']))
+		n += 1
+	if 'TotNumTradeReports' in d:
+		add('748=' + str(d['TotNumTradeReports']))
+		n += 1
+	if 'TradeRequestResult' in d:
+		add('749=' + str(d['TradeRequestResult']))
+		n += 1
+	if 'TradeRequestStatus' in d:
+		add('750=' + str(d['TradeRequestStatus']))
+		n += 1
+	if 'Symbol' in d:
+		add('55=' + str(d['Symbol']))
+		n += 1
+	if 'SymbolSfx' in d:
+		add('65=' + str(d['SymbolSfx']))
+		n += 1
+	if 'SecurityID' in d:
+		add('48=' + str(d['SecurityID']))
+		n += 1
+	if 'SecurityIDSource' in d:
+		add('22=' + str(d['SecurityIDSource']))
+		n += 1
+	if 'NoSecurityAltID' in d:
+		grp = d['NoSecurityAltID']
+		add('454=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoSecurityAltID(entry, fixm)
+		n += 1
+	if 'Product' in d:
+		add('460=' + str(d['Product']))
+		n += 1
+	if 'CFICode' in d:
+		add('461=' + str(d['CFICode']))
+		n += 1
+	if 'SecurityType' in d:
+		add('167=' + str(d['SecurityType']))
+		n += 1
+	if 'SecuritySubType' in d:
+		add('762=' + str(d['SecuritySubType']))
+		n += 1
+	if 'MaturityMonthYear' in d:
+		add('200=' + str(d['MaturityMonthYear']))
+		n += 1
+	if 'MaturityDate' in d:
+		add('541=' + str(d['MaturityDate']))
+		n += 1
+	if 'CouponPaymentDate' in d:
+		add('224=' + str(d['CouponPaymentDate']))
+		n += 1
+	if 'IssueDate' in d:
+		add('225=' + str(d['IssueDate']))
+		n += 1
+	if 'RepoCollateralSecurityType' in d:
+		add('239=' + str(d['RepoCollateralSecurityType']))
+		n += 1
+	if 'RepurchaseTerm' in d:
+		add('226=' + str(d['RepurchaseTerm']))
+		n += 1
+	if 'RepurchaseRate' in d:
+		add('227=' + str(d['RepurchaseRate']))
+		n += 1
+	if 'Factor' in d:
+		add('228=' + str(d['Factor']))
+		n += 1
+	if 'CreditRating' in d:
+		add('255=' + str(d['CreditRating']))
+		n += 1
+	if 'InstrRegistry' in d:
+		add('543=' + str(d['InstrRegistry']))
+		n += 1
+	if 'CountryOfIssue' in d:
+		add('470=' + str(d['CountryOfIssue']))
+		n += 1
+	if 'StateOrProvinceOfIssue' in d:
+		add('471=' + str(d['StateOrProvinceOfIssue']))
+		n += 1
+	if 'LocaleOfIssue' in d:
+		add('472=' + str(d['LocaleOfIssue']))
+		n += 1
+	if 'RedemptionDate' in d:
+		add('240=' + str(d['RedemptionDate']))
+		n += 1
+	if 'StrikePrice' in d:
+		add('202=' + str(d['StrikePrice']))
+		n += 1
+	if 'StrikeCurrency' in d:
+		add('947=' + str(d['StrikeCurrency']))
+		n += 1
+	if 'OptAttribute' in d:
+		add('206=' + str(d['OptAttribute']))
+		n += 1
+	if 'ContractMultiplier' in d:
+		add('231=' + str(d['ContractMultiplier']))
+		n += 1
+	if 'CouponRate' in d:
+		add('223=' + str(d['CouponRate']))
+		n += 1
+	if 'SecurityExchange' in d:
+		add('207=' + str(d['SecurityExchange']))
+		n += 1
+	if 'Issuer' in d:
+		add('106=' + str(d['Issuer']))
+		n += 1
+	if 'EncodedIssuerLen' in d:
+		add('348=' + str(d['EncodedIssuerLen']))
+		n += 1
+	if 'EncodedIssuer' in d:
+		add('349=' + str(d['EncodedIssuer']))
+		n += 1
+	if 'SecurityDesc' in d:
+		add('107=' + str(d['SecurityDesc']))
+		n += 1
+	if 'EncodedSecurityDescLen' in d:
+		add('350=' + str(d['EncodedSecurityDescLen']))
+		n += 1
+	if 'EncodedSecurityDesc' in d:
+		add('351=' + str(d['EncodedSecurityDesc']))
+		n += 1
+	if 'Pool' in d:
+		add('691=' + str(d['Pool']))
+		n += 1
+	if 'ContractSettlMonth' in d:
+		add('667=' + str(d['ContractSettlMonth']))
+		n += 1
+	if 'CPProgram' in d:
+		add('875=' + str(d['CPProgram']))
+		n += 1
+	if 'CPRegType' in d:
+		add('876=' + str(d['CPRegType']))
+		n += 1
+	if 'NoEvents' in d:
+		grp = d['NoEvents']
+		add('864=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoEvents(entry, fixm)
+		n += 1
+	if 'DatedDate' in d:
+		add('873=' + str(d['DatedDate']))
+		n += 1
+	if 'InterestAccrualDate' in d:
+		add('874=' + str(d['InterestAccrualDate']))
+		n += 1
+	if 'NoUnderlyings' in d:
+		grp = d['NoUnderlyings']
+		add('711=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoUnderlyings(entry, fixm)
+		n += 1
+	if 'NoLegs' in d:
+		grp = d['NoLegs']
+		add('555=' + str(len(grp)))
+		for entry in grp:
+			_encode_grp_NoLegs(entry, fixm)
+		n += 1
+	if 'MultiLegReportingType' in d:
+		add('442=' + str(d['MultiLegReportingType']))
+		n += 1
+	if 'ResponseTransportType' in d:
+		add('725=' + str(d['ResponseTransportType']))
+		n += 1
+	if 'ResponseDestination' in d:
+		add('726=' + str(d['ResponseDestination']))
+		n += 1
+	if 'Text' in d:
+		add('58=' + str(d['Text']))
+		n += 1
+	if 'EncodedTextLen' in d:
+		add('354=' + str(d['EncodedTextLen']))
+		n += 1
+	if 'EncodedText' in d:
+		add('355=' + str(d['EncodedText']))
+		n += 1
+	if len(d) > n:
+		_make_mbody(obj, obj._context, fixm, _msg_TradeCaptureReportRequestAck_names)
+	return fixm
+
+def _decode_TradeCaptureReportRequestAck(obj, fields, index, context):
+	d = obj.__dict__
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _msg_TradeCaptureReportRequestAck_tags.get(num)
+		if spec is None:
+			# not a field of this message, continue with generic decoder
+			body, index = _extract_body(fields, index, context, obj)
+			return index
+		name, pytype, decode_grp = spec
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	return index
 
 class TradeCaptureReportRequestAck(FixObject):
-	pass
+	_encode = staticmethod(_encode_TradeCaptureReportRequestAck)
+	_decode = staticmethod(_decode_TradeCaptureReportRequestAck)
+
+_msg_TradingSessionStatus_names = frozenset(['TradSesReqID', 'TradingSessionID', 'TradingSessionSubID', 'TradSesMethod', 'TradSesMode', 'UnsolicitedIndicator', 'TradSesStatus', 'TradSesStatusRejReason', 'TradSesStartTime', 'TradSesOpenTime', 'TradSesPreCloseTime', 'TradSesCloseTime', 'TradSesEndTime', 'TotalVolumeTraded', 'Text', 'EncodedTextLen', 'EncodedText'])
+
+_msg_TradingSessionStatus_tags = {
+	335: ('TradSesReqID', str, None),
+	336: ('TradingSessionID', str, None),
+	625: ('TradingSessionSubID', str, None),
+	338: ('TradSesMethod', int, None),
+	339: ('TradSesMode', int, None),
+	325: ('UnsolicitedIndicator', str, None),
+	340: ('TradSesStatus', int, None),
+	567: ('TradSesStatusRejReason', int, None),
+	341: ('TradSesStartTime', str, None),
+	342: ('TradSesOpenTime', str, None),
+	343: ('TradSesPreCloseTime', str, None),
+	344: ('TradSesCloseTime', str, None),
+	345: ('TradSesEndTime', str, None),
+	387: ('TotalVolumeTraded', float, None),
+	58: ('Text', str, None),
+	354: ('EncodedTextLen', str, None),
+	355: ('EncodedText', str, None),
+}
+
+def _encode_TradingSessionStatus(obj, fixm):
+	d = obj.__dict__
+	add = fixm.append
+	n = 1
+	if 'TradSesReqID' in d:
+		add('335=' + str(d['TradSesReqID']))
+		n += 1
+	if 'TradingSessionID' in d:
+		add('336=' + str(d['TradingSessionID']))
+		n += 1
+	if 'TradingSessionSubID' in d:
+		add('625=' + str(d['TradingSessionSubID']))
+		n += 1
+	if 'TradSesMethod' in d:
+		add('338=' + str(d['TradSesMethod']))
+		n += 1
+	if 'TradSesMode' in d:
+		add('339=' + str(d['TradSesMode']))
+		n += 1
+	if 'UnsolicitedIndicator' in d:
+		add('325=' + str(d['UnsolicitedIndicator']))
+		n += 1
+	if 'TradSesStatus' in d:
+		add('340=' + str(d['TradSesStatus']))
+		n += 1
+	if 'TradSesStatusRejReason' in d:
+		add('567=' + str(d['TradSesStatusRejReason']))
+		n += 1
+	if 'TradSesStartTime' in d:
+		add('341=' + str(d['TradSesStartTime']))
+		n += 1
+	if 'TradSesOpenTime' in d:
+		add('342=' + str(d['TradSesOpenTime']))
+		n += 1
+	if 'TradSesPreCloseTime' in d:
+		add('343=' + str(d['TradSesPreCloseTime']))
+		n += 1
+	if 'TradSesCloseTime' in d:
+		add('344=' + str(d['TradSesCloseTime']))
+		n += 1
+	if 'TradSesEndTime' in d:
+		add('345=' + str(d['TradSesEndTime']))
+		n += 1
+	if 'TotalVolumeTraded' in d:
+		add('387=' + str(d['TotalVolumeTraded']))
+		n += 1
+	if 'Text' in d:
+		add('58=' + str(d['Text']))
+		n += 1
+	if 'EncodedTextLen' in d:
+		add('354=' + str(d['EncodedTextLen']))
+		n += 1
+	if 'EncodedText' in d:
+		add('355=' + str(d['EncodedText']))
+		n += 1
+	if len(d) > n:
+		_make_mbody(obj, obj._context, fixm, _msg_TradingSessionStatus_names)
+	return fixm
+
+def _decode_TradingSessionStatus(obj, fields, index, context):
+	d = obj.__dict__
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _msg_TradingSessionStatus_tags.get(num)
+		if spec is None:
+			# not a field of this message, continue with generic decoder
+			body, index = _extract_body(fields, index, context, obj)
+			return index
+		name, pytype, decode_grp = spec
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	return index
 
 class TradingSessionStatus(FixObject):
-	pass
+	_encode = staticmethod(_encode_TradingSessionStatus)
+	_decode = staticmethod(_decode_TradingSessionStatus)
+
+_msg_TradingSessionStatusRequest_names = frozenset(['TradSesReqID', 'TradingSessionID', 'TradingSessionSubID', 'TradSesMethod', 'TradSesMode', 'SubscriptionRequestType'])
+
+_msg_TradingSessionStatusRequest_tags = {
+	335: ('TradSesReqID', str, None),
+	336: ('TradingSessionID', str, None),
+	625: ('TradingSessionSubID', str, None),
+	338: ('TradSesMethod', int, None),
+	339: ('TradSesMode', int, None),
+	263: ('SubscriptionRequestType', str, None),
+}
+
+def _encode_TradingSessionStatusRequest(obj, fixm):
+	d = obj.__dict__
+	add = fixm.append
+	n = 1
+	if 'TradSesReqID' in d:
+		add('335=' + str(d['TradSesReqID']))
+		n += 1
+	if 'TradingSessionID' in d:
+		add('336=' + str(d['TradingSessionID']))
+		n += 1
+	if 'TradingSessionSubID' in d:
+		add('625=' + str(d['TradingSessionSubID']))
+		n += 1
+	if 'TradSesMethod' in d:
+		add('338=' + str(d['TradSesMethod']))
+		n += 1
+	if 'TradSesMode' in d:
+		add('339=' + str(d['TradSesMode']))
+		n += 1
+	if 'SubscriptionRequestType' in d:
+		add('263=' + str(d['SubscriptionRequestType']))
+		n += 1
+	if len(d) > n:
+		_make_mbody(obj, obj._context, fixm, _msg_TradingSessionStatusRequest_names)
+	return fixm
+
+def _decode_TradingSessionStatusRequest(obj, fields, index, context):
+	d = obj.__dict__
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _msg_TradingSessionStatusRequest_tags.get(num)
+		if spec is None:
+			# not a field of this message, continue with generic decoder
+			body, index = _extract_body(fields, index, context, obj)
+			return index
+		name, pytype, decode_grp = spec
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	return index
 
 class TradingSessionStatusRequest(FixObject):
-	pass
+	_encode = staticmethod(_encode_TradingSessionStatusRequest)
+	_decode = staticmethod(_decode_TradingSessionStatusRequest)
+
+_msg_UserRequest_names = frozenset(['UserRequestID', 'UserRequestType', 'Username', 'Password', 'NewPassword', 'RawDataLength', 'RawData'])
+
+_msg_UserRequest_tags = {
+	923: ('UserRequestID', str, None),
+	924: ('UserRequestType', int, None),
+	553: ('Username', str, None),
+	554: ('Password', str, None),
+	925: ('NewPassword', str, None),
+	95: ('RawDataLength', str, None),
+	96: ('RawData', str, None),
+}
+
+def _encode_UserRequest(obj, fixm):
+	d = obj.__dict__
+	add = fixm.append
+	n = 1
+	if 'UserRequestID' in d:
+		add('923=' + str(d['UserRequestID']))
+		n += 1
+	if 'UserRequestType' in d:
+		add('924=' + str(d['UserRequestType']))
+		n += 1
+	if 'Username' in d:
+		add('553=' + str(d['Username']))
+		n += 1
+	if 'Password' in d:
+		add('554=' + str(d['Password']))
+		n += 1
+	if 'NewPassword' in d:
+		add('925=' + str(d['NewPassword']))
+		n += 1
+	if 'RawDataLength' in d:
+		add('95=' + str(d['RawDataLength']))
+		n += 1
+	if 'RawData' in d:
+		add('96=' + str(d['RawData']))
+		n += 1
+	if len(d) > n:
+		_make_mbody(obj, obj._context, fixm, _msg_UserRequest_names)
+	return fixm
+
+def _decode_UserRequest(obj, fields, index, context):
+	d = obj.__dict__
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _msg_UserRequest_tags.get(num)
+		if spec is None:
+			# not a field of this message, continue with generic decoder
+			body, index = _extract_body(fields, index, context, obj)
+			return index
+		name, pytype, decode_grp = spec
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	return index
 
 class UserRequest(FixObject):
-	pass
+	_encode = staticmethod(_encode_UserRequest)
+	_decode = staticmethod(_decode_UserRequest)
+
+_msg_UserResponse_names = frozenset(['UserRequestID', 'Username', 'UserStatus', 'UserStatusText'])
+
+_msg_UserResponse_tags = {
+	923: ('UserRequestID', str, None),
+	553: ('Username', str, None),
+	926: ('UserStatus', int, None),
+	927: ('UserStatusText', str, None),
+}
+
+def _encode_UserResponse(obj, fixm):
+	d = obj.__dict__
+	add = fixm.append
+	n = 1
+	if 'UserRequestID' in d:
+		add('923=' + str(d['UserRequestID']))
+		n += 1
+	if 'Username' in d:
+		add('553=' + str(d['Username']))
+		n += 1
+	if 'UserStatus' in d:
+		add('926=' + str(d['UserStatus']))
+		n += 1
+	if 'UserStatusText' in d:
+		add('927=' + str(d['UserStatusText']))
+		n += 1
+	if len(d) > n:
+		_make_mbody(obj, obj._context, fixm, _msg_UserResponse_names)
+	return fixm
+
+def _decode_UserResponse(obj, fields, index, context):
+	d = obj.__dict__
+	count = len(fields)
+	while index < count:
+		num, val = fields[index]
+		spec = _msg_UserResponse_tags.get(num)
+		if spec is None:
+			# not a field of this message, continue with generic decoder
+			body, index = _extract_body(fields, index, context, obj)
+			return index
+		name, pytype, decode_grp = spec
+		if decode_grp is not None:
+			d[name], index = decode_grp(fields, index+1, context, val)
+			continue
+		try:
+			d[name] = pytype(val)
+		except ValueError:
+			d[name] = _convert_value(pytype, val)
+		index += 1
+	return index
 
 class UserResponse(FixObject):
-	pass
+	_encode = staticmethod(_encode_UserResponse)
+	_decode = staticmethod(_decode_UserResponse)
 
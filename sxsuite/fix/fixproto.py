@@ -7,6 +7,10 @@
 
 import logging
 import json
+import mmap
+import os
+import struct
+import sys
 
 from traceback import print_exc
 from datetime import datetime
@@ -14,10 +18,13 @@ from time import time
 
 import sxsuite.exc as exc
 from sxsuite.exc import SessionError, TransportError
-from sxsuite.session import TCPSession
+from sxsuite.session import Session, TCPSession
+from sxsuite.transport import AcceptorTransport, ConnectedTransport
+from sxsuite.timer import add_timer, del_timer
 from sxsuite.protocol import SessionProtocol
 from sxsuite.store import open_store
 from sxsuite.fix.message import *
+from sxsuite.fix.framer import FixFramer, frame_message
 
 def utc_timestamp(milsecs=False):
     if milsecs:
@@ -37,6 +44,74 @@ def utc_now():
 def fix_message_as_list(data):
     return filter(None, data.split(chr(1)))
 
+class FixStateRecord(object):
+    """Session state record in memory mapped file.
+
+    Record has fixed layout and seqnos are written in place on every
+    change; the kernel keeps written pages if process crashes. Old JSON
+    state files are converted on open.
+    """
+
+    MAGIC = 'SXSR'
+    VERSION = 1
+
+    # magic, version, flags, receive_seqno, send_seqno, session day
+    # (YYYYMMDD), reserved, session start time
+    _REC = struct.Struct('<4sHHIIIId')
+    _U32 = struct.Struct('<I')
+    _F64 = struct.Struct('<d')
+    _RECEIVE = 8
+    _SEND = 12
+    _DAY = 16
+    _START = 24
+
+    def __init__(self, path):
+        self.path = path
+        fd = os.open(path, os.O_RDWR | os.O_CREAT, 0644)
+        try:
+            old = os.read(fd, 10240)
+            if len(old) != self._REC.size:
+                os.ftruncate(fd, self._REC.size)
+            self.mm = mmap.mmap(fd, self._REC.size)
+        finally:
+            os.close(fd)
+        if not old.startswith(self.MAGIC):
+            self._init(old)
+
+    def _init(self, old):
+        receive_seqno = send_seqno = 0
+        if old.strip():
+            try:
+                state = json.loads(old)
+                receive_seqno = state['receive_seqno']
+                send_seqno = state['send_seqno']
+            except Exception, e:
+                logging.error("converting state %s failed: %s", self.path, str(e))
+        self._REC.pack_into(self.mm, 0, self.MAGIC, self.VERSION, 0,
+                            receive_seqno, send_seqno, 0, 0, 0.0)
+
+    def read(self):
+        """Return (receive_seqno, send_seqno, day, start)."""
+        rec = self._REC.unpack_from(self.mm, 0)
+        return rec[3], rec[4], rec[5], rec[7]
+
+    def set_receive_seqno(self, num):
+        self._U32.pack_into(self.mm, self._RECEIVE, num)
+
+    def set_send_seqno(self, num):
+        self._U32.pack_into(self.mm, self._SEND, num)
+
+    def set_day(self, day, start):
+        self._U32.pack_into(self.mm, self._DAY, day)
+        self._F64.pack_into(self.mm, self._START, start)
+
+    def flush(self):
+        self.mm.flush()
+
+    def close(self):
+        self.mm.close()
+
+
 class FixState(object):
 
     INIT = 0
@@ -49,8 +124,11 @@ class FixState(object):
     LOGOUT_SENT = 6
 
     def __init__(self, store_url):
-        self.receive_seqno = 0
-        self.send_seqno = 0
+        self.record = None
+        self._receive_seqno = 0
+        self._send_seqno = 0
+        self.session_day = 0
+        self.session_start = 0.0
         self.recv_state = FixState.INIT
         self.send_state = FixState.INIT
         self.resend_seqno = 0
@@ -59,7 +137,59 @@ class FixState(object):
         if store_url:
             self.mstore = open_store(store_url)
 
+    def _get_receive_seqno(self):
+        return self._receive_seqno
+
+    def _set_receive_seqno(self, num):
+        self._receive_seqno = num
+        if self.record is not None:
+            self.record.set_receive_seqno(num)
+
+    receive_seqno = property(_get_receive_seqno, _set_receive_seqno)
+
+    def _get_send_seqno(self):
+        return self._send_seqno
+
+    def _set_send_seqno(self, num):
+        self._send_seqno = num
+        if self.record is not None:
+            self.record.set_send_seqno(num)
+
+    send_seqno = property(_get_send_seqno, _set_send_seqno)
+
+    def open_record(self, path):
+        """Restore state from record file ``path`` and keep it updated."""
+        self.record = FixStateRecord(path)
+        self._receive_seqno, self._send_seqno, self.session_day, \
+            self.session_start = self.record.read()
+        if self.session_day == 0:
+            self._mark_day()
+
+    def new_day(self):
+        """Start new session day.
+
+        Seqnos start again from one and stored messages are dropped so
+        that messages of earlier day are not resent.
+        """
+        self.receive_seqno = 0
+        self.send_seqno = 0
+        if self.mstore is not None:
+            self.mstore.reset()
+        self._mark_day()
+
+    def _mark_day(self):
+        """Record today as session day."""
+        now = datetime.utcnow()
+        self.session_day = now.year*10000 + now.month*100 + now.day
+        self.session_start = time()
+        if self.record is not None:
+            self.record.set_day(self.session_day, self.session_start)
+
     def save(self, path):
+        if self.record is not None:
+            # record is up to date
+            self.record.flush()
+            return
         state = {'receive_seqno': self.receive_seqno,
                  'send_seqno': self.send_seqno}
         try:
@@ -70,6 +200,8 @@ class FixState(object):
             logging.error("saving state failed: %s", str(e))
             
     def restore(self, path):
+        if self.record is not None:
+            return
         try:
             with open(path, 'r+') as fp:
                 s = fp.read(10240)
@@ -80,6 +212,13 @@ class FixState(object):
         self.receive_seqno = state['receive_seqno']
         self.send_seqno = state['send_seqno']
 
+    def close(self):
+        """Write and close message store and flush state record."""
+        if self.mstore is not None:
+            self.mstore.close()
+        if self.record is not None:
+            self.record.flush()
+
     def store(self, num, msg):
         if self.mstore is not None:
             self.mstore.save(num, msg)
@@ -94,17 +233,25 @@ class FixState(object):
             return self.mstore.next(num)
         return -1, None
 
+    def find_range(self, first, last):
+        """Return list of (num, msg) stored for seqnos ``first`` to ``last``."""
+        if self.mstore is not None:
+            return self.mstore.range(first, last)
+        return []
+
     def log(self, msg, outbound):
         pass
 
 class FixSession(TCPSession):
     def __init__(self, reaktor, protocol, name='', server=False, 
-                 transport=None, state_path='', store_url=''):
+                 transport=None, state_path='', store_url='', listen=True):
         TCPSession.__init__(self, reaktor, protocol, name=name,
-                            transport=transport, server=server)
+                            transport=transport, server=server, listen=listen)
         self.store_url = store_url
         self.state_path = state_path
         self.state = FixState(self.store_url)
+        if state_path:
+            self.state.open_record(state_path)
 
     def login_hook(self, data):
         if not self.server:
@@ -121,8 +268,20 @@ class FixSession(TCPSession):
         return False
 
     def send(self, data):
-        """Send message."""
-        self.protocol.rebuild_and_transmit(data)
+        """Send message.
+
+        Wire-format string starting with MsgType field is sent with
+        header added, full wire-format message (``FixRawMessage``) with
+        header replaced and ``FixMessage`` is rebuilt.
+        """
+        if isinstance(data, str):
+            self.protocol.transmit_raw(data)
+        else:
+            self.protocol.rebuild_and_transmit(data)
+
+    def stop(self):
+        TCPSession.stop(self)
+        self.state.close()
 
     def save(self, path):
         self.state.save(path)
@@ -132,14 +291,172 @@ class FixSession(TCPSession):
 
 
 class FixClient(FixSession):
-    def __init__(self, reaktor, protocol, name='', state_path='', store_url=''):
-        FixSession.__init__(self, reaktor, protocol,
+    def __init__(self, reaktor, protocol, name='', state_path='', store_url='',
+                 transport=None):
+        FixSession.__init__(self, reaktor, protocol, transport=transport,
                             name=name, state_path=state_path, store_url=store_url)
 
 class FixServer(FixSession):
-    def __init__(self, reaktor, protocol, transport=None, name='', state_path='', store_url=''):
-        FixSession.__init__(self, reaktor, protocol, server=True,
-                            name=name, state_path=state_path, store_url=store_url)
+    def __init__(self, reaktor, protocol, transport=None, name='', state_path='', store_url='',
+                 listen=True):
+        FixSession.__init__(self, reaktor, protocol, server=True, transport=transport,
+                            name=name, state_path=state_path, store_url=store_url,
+                            listen=listen)
+
+
+class _LogonWait(object):
+    """Stand-in session of accepted connection until Logon is received."""
+
+    # max bytes to buffer while waiting for Logon
+    MAX_LOGON = 8192
+
+    def __init__(self, acceptor):
+        self.acceptor = acceptor
+        self.transport = None
+        self._data = ''
+        self._tid = None
+
+    def start(self, transport):
+        self.transport = transport
+        timeout_sec = int(self.acceptor.get_conf('login_wait_time', 20))
+        self._tid = add_timer(timeout_sec, self._close)
+
+    def in_state(self, state):
+        return state == Session.LOGIN
+
+    def is_paused(self):
+        return False
+
+    def readable(self):
+        return True
+
+    def writable(self):
+        return False
+
+    def event_readable(self, transport):
+        data = transport.recv(10420)
+        if not data:
+            return
+        self._data += data
+        h_start, m_end = frame_message(self._data, 0, len(self._data))
+        if m_end == -1 or m_end > len(self._data):
+            if len(self._data) > _LogonWait.MAX_LOGON:
+                self.acceptor.log.warning("no Logon from %s", str(transport))
+                self._close()
+            return
+        logon = FixMessage.from_raw(self._data[h_start:m_end])
+        msgtype = logon.get_field(35)
+        session = self.acceptor.session_for(logon.get_field(49), logon.get_field(56))
+        if msgtype != 'A' or session is None:
+            self.acceptor.log.warning("unknown logon from %s: %s",
+                                      str(transport), str(logon))
+            self._close()
+            return
+        if not session.in_state(Session.IDLE):
+            self.acceptor.log.info("%s: ALREADY connected", session.name)
+            self._close()
+            return
+        del_timer(self._tid)
+        session.attach(transport)
+        session.recv(self._data)
+
+    def event_writable(self, transport):
+        pass
+
+    def event_disconnect(self, transport):
+        self._close()
+
+    def event_error(self, transport):
+        typ, ex, tb = sys.exc_info()
+        self.acceptor.log.debug("pending connection error %s: %s", typ, str(ex))
+        self._close()
+
+    def event_stop(self, transport):
+        self._close()
+
+    def _close(self):
+        del_timer(self._tid)
+        self.transport.close()
+        self.transport.del_channel()
+
+
+class FixAcceptor(object):
+    """Accept FIX connections of many counterparties on one port.
+
+    Accepted connection is given to the registered server session
+    matching SenderCompID and TargetCompID of the Logon message.
+    Sessions are created with ``listen=False`` and registered with
+    ``register`` after ``sender_comp_id`` and ``target_comp_id`` are
+    configured.
+    """
+
+    def __init__(self, reaktor, name='acceptor'):
+        self.reaktor = reaktor
+        self.name = name
+        self.config = {}
+        self._sessions = {}
+        self._state = Session.IDLE
+        self.listener = AcceptorTransport(reaktor, self)
+        self.listener.create()
+
+    log = logging
+
+    def __str__(self):
+        return "%s [%d sessions]" % (self.name, len(self._sessions))
+
+    def set_conf(self, key, value):
+        self.config[key] = value
+
+    def get_conf(self, key, default=''):
+        return self.config.get(key, default)
+
+    def register(self, session):
+        """Add server ``session`` to acceptor."""
+        key = (session.get_conf('sender_comp_id'), session.get_conf('target_comp_id'))
+        self._sessions[key] = session
+
+    def unregister(self, session):
+        key = (session.get_conf('sender_comp_id'), session.get_conf('target_comp_id'))
+        if self._sessions.get(key) is session:
+            del self._sessions[key]
+
+    def session_for(self, sender_id, target_id):
+        """Return session for messages from ``sender_id`` to ``target_id``."""
+        return self._sessions.get((target_id, sender_id))
+
+    def in_state(self, state):
+        return self._state == state
+
+    def start(self, address):
+        self.log.debug("LISTEN ON %s", address)
+        self._state = Session.INSESSION
+        self.listener.start(address, int(self.get_conf('listen_backlog', 128)))
+
+    def stop(self):
+        self.listener.close()
+        self.listener.del_channel()
+        self._state = Session.STOPPED
+
+    # TRANSPORT events
+
+    def event_start(self, transport):
+        pass
+
+    def event_stop(self, transport):
+        self.stop()
+
+    def event_accept(self, transport):
+        pair = self.listener.accept()
+        if pair is None:
+            return
+        sock, client_address = pair
+        self.log.debug("ACCEPTED: %s", str(client_address))
+        pending = _LogonWait(self)
+        pending.start(ConnectedTransport(self.reaktor, sock, pending))
+
+    def event_error(self, transport):
+        typ, ex, tb = sys.exc_info()
+        self.log.error("acceptor error %s: %s", typ, str(ex))
 
 
 class FixProtocol(SessionProtocol):
@@ -150,36 +467,30 @@ class FixProtocol(SessionProtocol):
             self.context = context
         else:
             self.context = FixContext(version=version)
+        self._replay = None
+        self._replay_tid = None
 
     log = logging
 
     def parser(self, data):
         lines = []
         c_x = 0
-        while True:
-            # find start of header tag
-            h_start = data.find('8=FIX', c_x)
-            if h_start == -1:
-                break
-
-            # find start of checksum tag
-            c_start = data.find('\x0110=', c_x)
-            if c_start == -1:
-                break
-
-            # scan forward to next SOH
-            try:
-                c_end = c_start + 3
-                while ord(data[c_end]) != 1:
-                    c_end += 1
-                lines.append(data[h_start:c_end+1])
-                c_x = c_end + 1
-            except IndexError, e:
+        end = len(data)
+        while c_x < end:
+            h_start, m_end = frame_message(data, c_x, end)
+            c_x = h_start
+            if m_end == -1 or m_end > end:
                 break
+            lines.append(data[h_start:m_end])
+            c_x = m_end
 
         # return full messages and rest of data
         return lines, data[c_x:]
 
+    def framer(self):
+        """Create incremental BodyLength driven message framer."""
+        return FixFramer()
+
     def transmit(self, data):
         """Handle data going to transport."""
         raw_data = data.to_raw()
@@ -196,7 +507,15 @@ class FixProtocol(SessionProtocol):
         self._transmit(msgtype, body, options=hdr, admin=False)
 
     def validate(self, raw_data):
-        """Convert from raw to internal FixMessage and validate it."""
+        """Convert from raw to internal FixMessage and validate it.
+
+        With session conf ``delivery`` set to ``raw`` application messages
+        are passed on as ``FixRawMessage``.
+        """
+        if self.session.get_conf('delivery') == 'raw':
+            data = self._validate_raw(raw_data)
+            if data is not None:
+                return data
         data = FixMessage.from_raw(raw_data)
         if not data.validate():
             self.log.warning("disgarding message: %s", data)
@@ -207,7 +526,24 @@ class FixProtocol(SessionProtocol):
             raise SessionError, (self.session, exc.S_EVERSION)
 
         return data
-        
+
+    def _validate_raw(self, raw_data):
+        """Return application message as ``FixRawMessage`` or None."""
+        if isinstance(raw_data, memoryview):
+            raw_data = raw_data.tobytes()
+        data = FixRawMessage(raw_data)
+        msgtype = data.find_value(35)
+        try:
+            if not data.startswith('8=FIX') or msgtype is None \
+                    or not self.context.msgtype_is_application(msgtype):
+                # admin and invalid messages go through full validation
+                return None
+        except KeyError:
+            return None
+        if data.find(self.context.version, 0, data.find('\x01')) == -1:
+            raise SessionError, (self.session, exc.S_EVERSION)
+        return data
+
     def client_auth(self, seqno, data):
 
         try:
@@ -281,8 +617,7 @@ class FixProtocol(SessionProtocol):
             self.log.warning("Reseting sequence numbers at logon (r=%d, s=%d)",
                              state.receive_seqno, state.send_seqno)
             lg.set_field('ResetSeqNumFlag', 'Y', self.context)
-            state.send_seqno = 0
-            state.receive_seqno = 0
+            state.new_day()
         lg.set_field('EncryptMethod', 0, self.context)
         self._transmit('Logon', lg, admin=True)
 
@@ -336,10 +671,7 @@ class FixProtocol(SessionProtocol):
             state = self.session.state
             self.log.warning("Reseting sequence numbers at logon (r=%d, s=%d)",
                              state.receive_seqno, state.send_seqno)
-            if state.send_seqno > 0:
-                state.send_seqno = 0
-            if state.receive_seqno > 0:
-                state.receive_seqno = 0
+            state.new_day()
         self._transmit('Logon', lg, admin=True)
 
     def send_hb(self):
@@ -463,9 +795,97 @@ class FixProtocol(SessionProtocol):
             mg = FixMessage()
             # initialize to seqno after this message (seqno is last sent seqno)
             mg.set_field('NewSeqNo', state.send_seqno+2, self.context)
-            self._transmit('SequenceReset', mg, options=opts, admin=True)
-        elif resend_mode:
+            self._transmit('SequenceReset', mg, admin=True)
+        elif resend_mode and resend_mode != 'REPLAY':
             self.log.warning("unknown resend_mode: %s", resend_mode)
+        else:
+            self.replay(start, end)
+
+    def replay(self, start, end):
+        """Replay stored messages from ``start`` to ``end``.
+
+        Stored messages are resent with PossDupFlag and OrigSendingTime
+        and runs of missing (admin) messages are replaced with GapFill.
+        Messages are sent ``resend_batch`` at a time, one batch per
+        reaktor round, so that other sessions are served between batches.
+        Replay waits while outbound queue is over its high water mark.
+        """
+        state = self.session.state
+        if end == 0 or end > state.send_seqno:
+            end = state.send_seqno
+        if self._replay_tid is not None:
+            del_timer(self._replay_tid)
+            self._replay_tid = None
+        # next seqno, last seqno, start of pending gap
+        self._replay = [start, end, 0]
+        self._replay_step()
+
+    def _replay_step(self):
+        self._replay_tid = None
+        session = self.session
+        if self._replay is None:
+            return
+        if session.in_state(Session.IDLE) or session.in_state(Session.INERROR) \
+                or session.in_state(Session.STOPPED):
+            self.log.warning("resend aborted at %d", self._replay[0])
+            self._replay = None
+            return
+        if session.outq_size() >= session.high_water:
+            self._replay_tid = add_timer(0.01, self._replay_step)
+            return
+
+        state = session.state
+        first, end, gap = self._replay
+        last = min(end, first + int(session.get_conf('resend_batch', 100)) - 1)
+        stored = dict(state.find_range(first, last))
+        for num in xrange(first, last+1):
+            raw = stored.get(num)
+            if raw is None:
+                if not gap:
+                    gap = num
+                continue
+            if gap:
+                self._send_gapfill(gap, num)
+                gap = 0
+            self._retransmit(raw)
+
+        if last < end:
+            self._replay = [last+1, end, gap]
+            self._replay_tid = add_timer(0, self._replay_step)
+            return
+        if gap:
+            self._send_gapfill(gap, end+1)
+        self._replay = None
+        state.send_state = FixState.NORMAL
+        self.log.info("resend done up to %d", end)
+
+    def _send_gapfill(self, seqno, new_seqno):
+        """Send SequenceReset-GapFill for seqnos ``seqno`` to ``new_seqno``-1."""
+        opts = FixMessage()
+        opts.set_field('PossDupFlag', 'Y', self.context)
+        opts.set_field('OrigSendingTime', utc_timestamp(), self.context)
+        opts.set_field('MsgSeqNum', seqno, self.context)
+        mg = FixMessage()
+        mg.set_field('GapFillFlag', 'Y', self.context)
+        mg.set_field('NewSeqNo', new_seqno, self.context)
+        self._transmit('SequenceReset', mg, options=opts, admin=True)
+
+    def _retransmit(self, raw):
+        """Resend stored wire-format message as possible duplicate."""
+        fixm = FixMessage.from_raw(raw)
+        msgcode = fixm.get(35)
+        # drop BeginString, BodyLength and MsgType
+        data = FixMessage(fixm[3:])
+        orig_time = data.get(52)
+        data.set(52, utc_timestamp())
+        # header fields go after SendingTime
+        n = data.find_tag('52=') + 1
+        if data.find_tag('122=') == -1:
+            data.ins(122, orig_time, n)
+        if data.find_tag('43=') == -1:
+            data.ins(43, 'Y', n)
+        self.log.debug("OUT: %s", data)
+        self.session.transmit(data.encode(self.context.version, msgcode))
 
     def request_resend(self, start, end):
         """Send  ResendRequest message"""
@@ -519,6 +939,31 @@ class FixProtocol(SessionProtocol):
         header.set_field('SendingTime', utc_timestamp(), self.context)
         return header
 
+    def transmit_raw(self, data):
+        """Send application message given as wire-format string.
+
+        ``data`` starts with MsgType field followed by body fields, or is a
+        full message like ``FixRawMessage`` whose header and trailer are
+        replaced; header and trailer are added.
+        """
+        if data.startswith('8=FIX'):
+            hdr, body = FixMessage.from_raw(str(data)).split_message(self.context)
+            msgtype = hdr.get(35)
+            if msgtype is None:
+                raise ValueError, "raw message has no MsgType"
+            body = ''.join(x + '\x01' for x in body)
+        else:
+            end = data.find('\x01')
+            if not data.startswith('35=') or end == -1:
+                raise ValueError, "raw message does not start with MsgType"
+            msgtype, body = data[3:end], data[end+1:]
+        state = self.session.state
+        header = self._next_header()
+        raw_data = header.encode(self.context.version, msgtype, body)
+        state.store(state.send_seqno, raw_data)
+        self.log.debug("OUT: %s", raw_data)
+        self.session.transmit(raw_data)
+
     def _transmit(self, msgname, msg, options=None, admin=False):
         """Transmit data. Add headers and log message."""
 
@@ -526,14 +971,11 @@ class FixProtocol(SessionProtocol):
         data = self._next_header(options)
             
         data.extend(msg)
-        if len(msgname) <= 2:
-            data.set_prefix(self.context.version, msgname)
-        else:
-            data.add_prefix(msgname, self.context)
-        
-        if not admin:
-            state.store(state.send_seqno, data)
-        self.log.debug("OUT: %s", str(data))
-        self.transmit(data)
-        
+        if len(msgname) > 2:
+            msgname = self.context.msgtype_for_name(msgname)
+        raw_data = data.encode(self.context.version, msgname)
 
+        if not admin:
+            state.store(state.send_seqno, raw_data)
+        self.log.debug("OUT: %s", data)
+        self.session.transmit(raw_data)
@@ -0,0 +1,135 @@
+# (c) Harri Rautila, 2011
+
+# This file is part of sxsuite library. It is free software, distributed
+# under the terms of the GNU Lesser General Public License Version 3,
+# or any later version.
+# See the COPYING file included in this archive
+
+"""
+Incremental framing of FIX wire-format data.
+
+Message boundaries are found from the BodyLength (9) field: after the
+length field is read the end of the message is known without scanning
+the message body for the CheckSum (10) field.
+"""
+
+_SOH = '\x01'
+
+# '10=nnn<SOH>'
+_CHECKSUM_LEN = 7
+
+
+def frame_message(buf, start, end):
+    """Locate next FIX message from ``buf[start:end]``.
+
+    ``buf`` can be a string or a bytearray. Returns tuple (h_start, m_end)
+    where ``h_start`` is the start of message header. If message end is
+    not yet known ``m_end`` is -1. If ``m_end`` is greater than ``end``
+    the message is incomplete and needs ``m_end - h_start`` bytes.
+    """
+    h_start = buf.find('8=FIX', start, end)
+    if h_start == -1:
+        # keep possibly partial begin string at the end of data
+        return max(start, end - 4), -1
+
+    l_start = buf.find(_SOH + '9=', h_start, end)
+    if l_start == -1:
+        return h_start, -1
+    l_end = buf.find(_SOH, l_start + 3, end)
+    if l_end == -1:
+        return h_start, -1
+
+    try:
+        nbytes = int(buf[l_start+3:l_end])
+    except ValueError:
+        nbytes = -1
+
+    if nbytes >= 0:
+        # BodyLength counts bytes after its own SOH up to and including
+        # the SOH immediately preceding the checksum field
+        c_start = l_end + 1 + nbytes
+        if c_start + 3 > end:
+            return h_start, c_start + _CHECKSUM_LEN
+        if buf[c_start:c_start+3] == '10=':
+            return h_start, c_start + _CHECKSUM_LEN
+
+    # invalid BodyLength; fall back to scanning for checksum field
+    c_start = buf.find(_SOH + '10=', l_end, end)
+    if c_start == -1:
+        return h_start, -1
+    c_end = buf.find(_SOH, c_start + 4, end)
+    if c_end == -1:
+        return h_start, -1
+    return h_start, c_end + 1
+
+
+class FixFramer(object):
+    """Incremental FIX message framer.
+
+    Received data is copied into a reusable bytearray and complete messages
+    are returned as memoryview slices of it. Returned views are valid only
+    until the next call of ``feed``.
+    """
+
+    def __init__(self, size=65536):
+        self._buf = bytearray(size)
+        self._view = memoryview(self._buf)
+        self._start = 0
+        self._end = 0
+        self._need = 0
+
+    def reset(self):
+        """Discard all buffered data."""
+        self._start = self._end = self._need = 0
+
+    def pending(self):
+        """Number of buffered bytes not yet returned as messages."""
+        return self._end - self._start
+
+    def feed(self, data):
+        """Add ``data`` to buffer and return list of complete messages."""
+        n = len(data)
+        if self._end + n > len(self._buf):
+            self._reserve(n)
+        self._buf[self._end:self._end+n] = data
+        self._end += n
+        if self._end - self._start < self._need:
+            # known length of pending message not reached yet
+            return []
+        return self._scan()
+
+    def _reserve(self, n):
+        """Make room for ``n`` bytes after pending data."""
+        pending = self._end - self._start
+        size = len(self._buf)
+        if pending + n > size:
+            while size < pending + n:
+                size *= 2
+            # new buffer; old one may still be referenced by returned views
+            buf = bytearray(size)
+            buf[0:pending] = self._buf[self._start:self._end]
+            self._buf = buf
+            self._view = memoryview(buf)
+        elif pending > 0:
+            self._buf[0:pending] = self._buf[self._start:self._end]
+        self._start = 0
+        self._end = pending
+
+    def _scan(self):
+        frames = []
+        end = self._end
+        self._need = 0
+        while self._start < end:
+            h_start, m_end = frame_message(self._buf, self._start, end)
+            self._start = h_start
+            if m_end == -1:
+                break
+            if m_end > end:
+                self._need = m_end - h_start
+                break
+            frames.append(self._view[h_start:m_end])
+            self._start = m_end
+
+        if self._start == end:
+            self._start = self._end = 0
+        return frames
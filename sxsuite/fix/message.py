@@ -10,9 +10,10 @@ import logging as log
 from sxsuite.fix.context import *
 
 
-END_FIELDS = [10, 89, 93]
+END_FIELDS = frozenset([10, 89, 93])
 
-__all__ = ['FixObject', 'FixHeader', 'FixMessage', 'FixContext',
+__all__ = ['FixObjectBase', 'FixObject', 'FixSlotObject', 'FixHeader', 'FixMessage', 'FixRawMessage',
+           'FixContext',
            'Heartbeat', 'Logon', 'Logout', 'Reject', 'ResendRequest',
            'SequenceReset', 'TestRequest',
            'set_default_context', 'get_default_context']
@@ -21,25 +22,156 @@ _SOH = chr(1)
 
 _unknown_field_desc = FixFieldDescriptor('Unknown', 0, 'STRING', str)
 
+# length field -> data field; value of data field may contain SOH
+_DATA_FIELDS = {90: 91, 93: 89, 95: 96, 212: 213, 348: 349, 350: 351,
+                352: 353, 354: 355, 356: 357, 358: 359, 360: 361, 362: 363,
+                364: 365, 445: 446, 618: 619, 621: 622}
+
 class ParseError(Exception):
     pass
 
+def _checksum(s):
+    """FIX checksum of wire-format string ``s``."""
+    return sum(bytearray(s)) & 0xff
+
+def _length(fields, pos=0):
+    """Wire-format length of ``fields`` starting at ``pos``."""
+    return sum(map(len, fields[pos:])) + len(fields) - pos
+
+def _tag(field):
+    """Tag prefix 'num=' of ``field``."""
+    return field[:field.find('=')+1]
+
 class FixMessage(list):
-    """Raw representation of FIX message as list of tagged fields."""
-    
+    """Raw representation of FIX message as list of tagged fields.
+
+    Tag lookups use an index of tag to first position that is built on
+    first lookup. Index is updated by methods of this class and dropped
+    by any other list modification.
+    """
+
+    _index = None
+
+    def __reduce__(self):
+        # do not pickle tag index
+        return (self.__class__, (list(self),))
+
+    def _build_index(self):
+        index = {}
+        n = len(self) - 1
+        for field in reversed(self):
+            index[_tag(field)] = n
+            n -= 1
+        self._index = index
+        return index
+
+    def _invalidate(self):
+        self._index = None
+
+    def append(self, field):
+        list.append(self, field)
+        if self._index is not None:
+            self._index.setdefault(_tag(field), len(self) - 1)
+
+    def extend(self, fields):
+        n = len(self)
+        list.extend(self, fields)
+        if self._index is not None:
+            index = self._index
+            for field in self[n:]:
+                index.setdefault(_tag(field), n)
+                n += 1
+
+    def insert(self, pos, field):
+        n = len(self)
+        list.insert(self, pos, field)
+        if self._index is None:
+            return
+        if pos < 0:
+            pos = max(0, n + pos)
+        if pos >= n:
+            self._index.setdefault(_tag(field), n)
+            return
+        index = self._index
+        for tag, k in index.iteritems():
+            if k >= pos:
+                index[tag] = k + 1
+        tag = _tag(field)
+        if index.get(tag, n) > pos:
+            index[tag] = pos
+
+    def __setitem__(self, key, value):
+        list.__setitem__(self, key, value)
+        self._index = None
+
+    def __delitem__(self, key):
+        list.__delitem__(self, key)
+        self._index = None
+
+    def __setslice__(self, i, j, fields):
+        list.__setslice__(self, i, j, fields)
+        self._index = None
+
+    def __delslice__(self, i, j):
+        list.__delslice__(self, i, j)
+        self._index = None
+
+    def __iadd__(self, fields):
+        self.extend(fields)
+        return self
+
+    def __imul__(self, n):
+        list.__imul__(self, n)
+        self._index = None
+        return self
+
+    def pop(self, *args):
+        self._index = None
+        return list.pop(self, *args)
+
+    def remove(self, field):
+        list.remove(self, field)
+        self._index = None
+
+    def reverse(self):
+        list.reverse(self)
+        self._index = None
+
+    def sort(self, *args, **kwargs):
+        list.sort(self, *args, **kwargs)
+        self._index = None
+
     def to_raw(self):
         """Write message to wire-format."""
-        s = _SOH.join(self)
-        chk = reduce(lambda x,y: x+ord(y), s, 0)
-        chk += 1  # for missing SOH before checksum field
-        return s + _SOH + "10=%03d" % (chk % 256)  + _SOH
-        
+        s = _SOH.join(self) + _SOH
+        return "%s10=%03d%s" % (s, _checksum(s), _SOH)
+
+    def encode(self, vers, msgcode='', tail=''):
+        """Write message to wire-format with standard prefix.
+
+        Version, length and type fields are written directly to the output
+        buffer, the message itself is not modified. ``tail`` is wire-format
+        fields appended after message fields.
+        """
+        if msgcode:
+            body = '35=%s%s%s%s%s' % (msgcode, _SOH, _SOH.join(self), _SOH, tail)
+        else:
+            body = _SOH.join(self) + _SOH + tail
+        s = '8=FIX.%s%s9=%d%s%s' % (vers, _SOH, len(body), _SOH, body)
+        return "%s10=%03d%s" % (s, _checksum(s), _SOH)
+
     @classmethod
     def from_raw(cls, data):
         """Create message from wire-format data.
 
         Assumes ``data`` contains a complete wire format FIX message.
+        ``data`` may also be a memoryview of received data or buffer of
+        stored data.
         """
+        if isinstance(data, memoryview):
+            data = data.tobytes()
+        elif isinstance(data, buffer):
+            data = str(data)
         s = filter(None, data.split(_SOH))
         fixm = cls(s[:-1]) # do not include last checksum fied
         return fixm
@@ -68,13 +200,13 @@ class FixMessage(list):
         the BodyLength field up to, and including, the delimiter
         immediately preceding the CheckSum tag (10=nnn).
         """
+        prefix = ['8=FIX.'+vers, '']
         if msgcode:
-            self.insert(0, '35='+str(msgcode))
-
+            prefix.append('35='+str(msgcode))
+        self[0:0] = prefix
         # calculate length: +1 is for each <SOH>
-        nbytes = reduce(lambda x, y: x+len(y)+1, self, 0) 
-        self.insert(0, "9=%d" % nbytes)
-        self.insert(0, '8=FIX.'+vers)
+        nbytes = _length(self, 2)
+        self[1] = "9=%d" % nbytes
         return self
 
     def set_length(self):
@@ -84,7 +216,7 @@ class FixMessage(list):
         if self[n].startswith('9='):
             pos = 2
         # calculate length: +1 is for each <SOH>
-        nbytes = reduce(lambda x, y: x+len(y)+1, self[pos:], 0)
+        nbytes = _length(self, pos)
         if pos != n:
             # length field was there already
             self[n] = '9=' + str(nbytes)
@@ -154,16 +286,22 @@ class FixMessage(list):
             else:
                 self.insert(0, tag + str(value))
         else:
-            # already exists, overwrite
-            self[n] = tag + str(value)
-        
+            # already exists, overwrite; tag position is unchanged
+            list.__setitem__(self, n, tag + str(value))
+
     def find_tag(self, tag):
-        n = 0
-        for y in self:
-            if y.startswith(tag):
-                return n
-            n += 1
-        return -1
+        """Return position of first field with ``tag`` ('num=') or -1."""
+        if not tag.endswith('='):
+            n = 0
+            for y in self:
+                if y.startswith(tag):
+                    return n
+                n += 1
+            return -1
+        index = self._index
+        if index is None:
+            index = self._build_index()
+        return index.get(tag, -1)
 
     def get(self, num, pytyp=str):
         tag = str(num) + '='
@@ -181,9 +319,9 @@ class FixMessage(list):
             else:
                 self.insert(0, tag + str(val))
         else:
-            # already exists, overwrite
-            self[n] = tag + str(value)
-        
+            # already exists, overwrite; tag position is unchanged
+            list.__setitem__(self, n, tag + str(val))
+
     def add(self, num, val):
         tag = str(num) + '=' + str(val)
         self.append(tag)
@@ -193,15 +331,124 @@ class FixMessage(list):
         self.insert(inx, tag)
 
     def delete(self, num):
-        n = self.find_tag(str(num)+'=')
-        if n != -1:
-            del self[n]
+        tag = str(num) + '='
+        n = self.find_tag(tag)
+        if n == -1:
+            return
+        list.__delitem__(self, n)
+        index = self._index
+        for t, k in index.iteritems():
+            if k > n:
+                index[t] = k - 1
+        # tag may repeat later in message
+        del index[tag]
+        for k in xrange(n, len(self)):
+            if self[k].startswith(tag):
+                index[tag] = k
+                break
+
+class FixRawMessage(str):
+    """Validated wire-format FIX message.
+
+    Fields are looked up from the wire-format data without splitting
+    the message. ``summary`` gives the header fields needed for routing.
+    """
+
+    # position of first data length field, -1 if none
+    _data_pos = None
 
-class FixObject(object):
+    def find_value(self, tag):
+        """Return value of first field ``tag`` as string or None."""
+        key = '%d=' % tag
+        if self.startswith(key):
+            start = len(key)
+        else:
+            start = self.find(_SOH + key)
+            if start == -1:
+                return None
+            start += len(key) + 1
+        if self._data_pos is None:
+            self._data_pos = min([self.find('%s%d=' % (_SOH, x)) for x in _DATA_FIELDS] +
+                                 [len(self)])
+        if start > self._data_pos:
+            # match can be inside value of data field
+            return self._scan(tag, self._data_pos)
+        end = self.find(_SOH, start)
+        if end == -1:
+            end = len(self)
+        return self[start:end]
+
+    def _scan(self, tag, pos):
+        """Find field ``tag`` walking fields from SOH at ``pos``."""
+        count = len(self)
+        datatag = size = None
+        while pos < count:
+            eq = self.find('=', pos + 1)
+            if eq == -1:
+                return None
+            try:
+                num = int(self[pos+1:eq])
+            except ValueError:
+                return None
+            start = eq + 1
+            if num == datatag and size is not None:
+                end = start + size
+            else:
+                end = self.find(_SOH, start)
+                if end == -1:
+                    end = count
+            if num == tag:
+                return self[start:end]
+            datatag = _DATA_FIELDS.get(num)
+            if datatag is not None:
+                try:
+                    size = int(self[start:end])
+                except ValueError:
+                    size = None
+            pos = end
+        return None
+
+    def summary(self):
+        """Return (MsgType, MsgSeqNum, PossDupFlag)."""
+        seqno = self.find_value(34)
+        return (self.find_value(35), int(seqno) if seqno else None,
+                self.find_value(43) == 'Y')
+
+    def get_field(self, name, context=None):
+        """Get field value. ``name`` can be field name or tag number."""
+        if context is not None:
+            try:
+                if not isinstance(name, int):
+                    desc = context.desc_for_name(name)
+                else:
+                    desc = context.desc_for_id(name)
+            except:
+                return None
+            val = self.find_value(desc.number)
+            if val is None:
+                return None
+            return desc.pytype(val)
+        return self.find_value(int(name))
+
+    def to_message(self):
+        """Split to ``FixMessage``."""
+        return FixMessage.from_raw(str(self))
+
+
+class FixObjectBase(object):
     """Base type for FIX message objects.
 
     Represents message as object and fields as normal object attributes.
+    Generated message classes may provide compiled ``_encode`` and ``_decode``
+    functions for the message body. Subclasses decide where fields are
+    stored.
     """
+    __slots__ = ()
+
+    _encode = None
+    _decode = None
+    _lazy = None
+
     def __init__(self, context, values={}):
 
         # called as ({...})
@@ -209,47 +456,78 @@ class FixObject(object):
             values = context
             context = _default_context
             
-        self.__dict__["_context"]  = context
+        object.__setattr__(self, '_context', context)
         if values:
             for k, v in values.items():
                 setattr(self, k, v)
         
-    def __setattr__(self, attr, value):
+    def __getattr__(self, attr):
+        """Decode field of lazily decoded message on first access."""
+        lazy = self._lazy
+        if lazy is None or attr.startswith('__'):
+            raise AttributeError(attr)
+        fixm, index = lazy
         try:
             desc = self._check_attribute(attr)
-            if desc.fixtype == 'NUMINGROUP':
-                if not isinstance(value, list):
-                    raise TypeError('%s: invalid value type for field group' % attr)
-                vl = []
-                for val in value:
-                    if isinstance(val, FixObject):
-                        vl.append(val)
-                    elif isinstance(val, dict):
-                        vl.append(FixObject(self._context, val))
-                    else:
-                        raise TypeError('%s: invalid value type for field group' % attr)
-                self.__dict__[attr] = vl
-            else:
-                self.__dict__[attr] = value
-        except KeyError, e:
+        except KeyError:
             raise AttributeError("%s does not exist." % attr)
+        num = desc.number
+        if desc is _unknown_field_desc:
+            num = int(attr[1:])
+        if num not in index:
+            raise AttributeError(attr)
+        value = _decode_field(fixm, index.pop(num), desc, self._context)
+        self._store(attr, value)
+        return value
 
-    def __str__(self):
-        return "%s" % self.__dict__
-    
     def _check_attribute(self, attr):
         if attr.startswith('_'):
+            # _NNN is field by tag number
+            if not attr[1:].isdigit():
+                raise KeyError(attr)
             try:
-                num = int(attr[1:])
-                return self._context.desc_for_id(num)
-            except ValueError:
+                return self._context.desc_for_id(int(attr[1:]))
+            except KeyError:
                 return _unknown_field_desc
         return self._context.desc_for_name(attr)
-        
-    def attributes(self):
-        """Return list of defined valid fields."""
-        return filter(lambda x: x != '_context', self.__dict__.keys())
-    
+
+    def _check_value(self, attr, value):
+        """Validate ``value`` for field ``attr``. Returns value to store."""
+        try:
+            desc = self._check_attribute(attr)
+        except KeyError, e:
+            raise AttributeError("%s does not exist." % attr)
+        if desc.fixtype != 'NUMINGROUP':
+            return value
+        if not isinstance(value, list):
+            raise TypeError('%s: invalid value type for field group' % attr)
+        vl = []
+        for val in value:
+            if isinstance(val, FixObjectBase):
+                vl.append(val)
+            elif isinstance(val, dict):
+                vl.append(FixObject(self._context, val))
+            else:
+                raise TypeError('%s: invalid value type for field group' % attr)
+        return vl
+
+    def _decode_all(self):
+        """Decode all not yet accessed fields of lazily decoded message."""
+        lazy = self._pop_lazy()
+        if lazy is None:
+            return
+        fixm, index = lazy
+        context = self._context
+        for num, pos in index.iteritems():
+            try:
+                desc = context.desc_for_id(num)
+                name = desc.name
+            except KeyError:
+                desc = _unknown_field_desc
+                name = '_%d' % num
+            if not self._has(name):
+                self._store(name, _decode_field(fixm, pos, desc, context))
+
     def get(self, key, defval):
         return getattr(self, key, defval)
 
@@ -264,30 +542,148 @@ class FixObject(object):
         return hdr_m
         
     @classmethod
-    def from_message(cls, fixm, context):
-        """Split message to request and header objects."""
-
-        # Message fields is 'tag=STRING'. String may contain equal '=' signs and therefore
-        # lambda functions second part joins together parts possibly splited apart by the
-        # split function
-        vfields = map(lambda x: (int(x[0]), '='.join(x[1:])),
-                      [y.split('=') for y in fixm])
+    def from_message(cls, fixm, context, lazy=True):
+        """Split message to request and header objects.
 
+        If ``lazy`` is true returned objects refer to ``fixm`` and decode
+        fields on first attribute access.
+        """
+        if lazy:
+            hdr_index, body_index, msgname = _index_message(fixm, context)
+            hdr = FixHeader(context)
+            object.__setattr__(hdr, '_lazy', (fixm, hdr_index))
+            body = context.class_for_msgname(msgname)(context)
+            object.__setattr__(body, '_lazy', (fixm, body_index))
+            return body, hdr
+
+        vfields = _split_fields(fixm)
         hdr, msgname, index = _extract_header(vfields, 0, context)
         cls = context.class_for_msgname(msgname)
         body = cls(context)
-        body, count = _extract_body(vfields[index:], 0, context, body)
-
-        index += count
+        if cls._decode is not None and not context.has_custom_fields():
+            cls._decode(body, vfields, index, context)
+        else:
+            _extract_body(vfields, index, context, body)
         return body, hdr
 
     def mheader(self, header):
         return _make_mheader(self, header, header._context)
 
     def mbody(self):
+        if self._encode is not None and not self._context.has_custom_fields():
+            self._decode_all()
+            return self._encode(self, FixMessage())
         return _make_mbody(self, self._context)
 
 
+class FixObject(FixObjectBase):
+    """FIX message object storing fields in instance dict."""
+
+    def __setattr__(self, attr, value):
+        self.__dict__[attr] = self._check_value(attr, value)
+
+    def __str__(self):
+        self._decode_all()
+        return "%s" % self.__dict__
+
+    def _store(self, attr, value):
+        """Store already validated field value."""
+        self.__dict__[attr] = value
+
+    def _has(self, attr):
+        return attr in self.__dict__
+
+    def _pop_lazy(self):
+        return self.__dict__.pop('_lazy', None)
+
+    def attributes(self):
+        """Return list of defined valid fields."""
+        self._decode_all()
+        return filter(lambda x: x != '_context', self.__dict__.keys())
+
+
+class FixSlotObject(FixObjectBase):
+    """Base type for FIX message classes storing fields in slots.
+
+    Subclasses list the most used fields of message, like the required
+    ones, as ``__slots__``. Other fields are kept in dict ``_extra`` that
+    is created when first such field is set.
+    """
+    __slots__ = ('_context', '_lazy', '_extra')
+
+    def __init__(self, context, values={}):
+        object.__setattr__(self, '_lazy', None)
+        object.__setattr__(self, '_extra', None)
+        FixObjectBase.__init__(self, context, values)
+
+    def __setattr__(self, attr, value):
+        self._store(attr, self._check_value(attr, value))
+
+    def __getattr__(self, attr):
+        if attr in FixSlotObject.__slots__:
+            # unset internal slot
+            raise AttributeError(attr)
+        extra = self._extra
+        if extra is not None and attr in extra:
+            return extra[attr]
+        return FixObjectBase.__getattr__(self, attr)
+
+    def __delattr__(self, attr):
+        extra = self._extra
+        if extra is not None and attr in extra:
+            del extra[attr]
+        else:
+            object.__delattr__(self, attr)
+
+    def __str__(self):
+        return "%s" % dict((x, getattr(self, x)) for x in self.attributes())
+
+    def __getstate__(self):
+        state = dict((x, getattr(self, x)) for x in self.attributes())
+        state['_context'] = self._context
+        return state
+
+    def __setstate__(self, state):
+        object.__setattr__(self, '_lazy', None)
+        object.__setattr__(self, '_extra', None)
+        for k, v in state.items():
+            self._store(k, v)
+
+    def _store(self, attr, value):
+        try:
+            object.__setattr__(self, attr, value)
+        except AttributeError:
+            # not a slot
+            if self._extra is None:
+                object.__setattr__(self, '_extra', {})
+            self._extra[attr] = value
+
+    def _has(self, attr):
+        try:
+            object.__getattribute__(self, attr)
+        except AttributeError:
+            return self._extra is not None and attr in self._extra
+        return True
+
+    def _pop_lazy(self):
+        lazy = self._lazy
+        object.__setattr__(self, '_lazy', None)
+        return lazy
+
+    def attributes(self):
+        """Return list of defined valid fields."""
+        self._decode_all()
+        names = []
+        for name in self.__slots__:
+            try:
+                object.__getattribute__(self, name)
+                names.append(name)
+            except AttributeError:
+                pass
+        if self._extra is not None:
+            names.extend(self._extra.keys())
+        return names
+
 
 class FixHeader(FixObject):
     """Header part of FIX message."""
@@ -333,6 +729,20 @@ class TestRequest(FixObject):
     """FIX TestRequest message."""
     pass
 
+def _attr_desc(context, name):
+    """Return field descriptor for attribute ``name``.
+
+    Attribute ``_NNN`` is field ``NNN``, also when it is not known in
+    ``context``.
+    """
+    if name[0] == '_':
+        num = int(name[1:])
+        try:
+            return context.desc_for_id(num)
+        except KeyError:
+            return FixFieldDescriptor(name, num, 'STRING', str)
+    return context.desc_for_name(name)
+
 def _make_mheader(obj, header, context):
     """Create ``FixMessage`` header for this ``FixObject`` including
     attributes from ``header``.
@@ -342,7 +752,7 @@ def _make_mheader(obj, header, context):
     fixm = FixMessage()
     hdr_fields = []
     for name in header.attributes():
-        desc = context.desc_for_name(name)
+        desc = _attr_desc(context, name)
         # append all but these 3 that are inserted in the end
         if desc.number not in [8, 9, 35]:
             hdr_fields.append((desc.number, str(getattr(header, name))))
@@ -356,19 +766,25 @@ def _make_mheader(obj, header, context):
     return fixm
 
 
-def _make_mbody(obj, context):
-    """Create message body for this ``FixObject``."""
+def _make_mbody(obj, context, fixm=None, skip=()):
+    """Create message body for this ``FixObject``.
 
-    fixm = FixMessage()
+    Attributes named in ``skip`` are not included. If ``fixm`` is given
+    fields are appended to it.
+    """
+    if fixm is None:
+        fixm = FixMessage()
     for name in obj.attributes():
-        desc = context.desc_for_name(name)
+        if name in skip:
+            continue
+        desc = _attr_desc(context, name)
         #print "desc %s is: %s" % (desc.name, desc.__class__.__name__)
         if not isinstance(desc, FixGroupDescriptor):
             fixm.add(desc.number, str(getattr(obj, name)))
         else:
             grp = getattr(obj, name)
             fixm.add(desc.number, len(grp))
-            gspec = context.group_for_name(name)
+            gspec = context.group_for_name(desc.name)
 
             _build_group(grp, gspec, fixm, context)
     # endfor
@@ -394,6 +810,101 @@ def _build_group(group, gspec, fixm, context):
     # endfor 
 
 
+def _split_fields(fixm):
+    """Split message fields to list of (tagnum, value) tuples."""
+    # Message fields is 'tag=STRING'. String may contain equal '=' signs and therefore
+    # lambda functions second part joins together parts possibly splited apart by the
+    # split function
+    return map(lambda x: (int(x[0]), '='.join(x[1:])),
+               [y.split('=') for y in fixm])
+
+
+def _convert(desc, val):
+    """Convert field value to python type of field descriptor ``desc``."""
+    return _convert_value(desc.pytype, val)
+
+
+def _convert_value(pytype, val):
+    """Convert field value to ``pytype``."""
+    try:
+        return pytype(val)
+    except ValueError, e:
+        # if int field makes an error, try float (may thow
+        if pytype == int:
+            return float(val)
+        return str(val)
+
+
+def _index_message(fixm, context):
+    """Index header and body fields of ``fixm``.
+
+    Returns header and body index dictionaries mapping field number to position
+    in message and message name. Field groups are indexed by the position of
+    their counter field.
+    """
+    hdr_index = {}
+    body_index = {}
+    msgname = 'FixObject'
+    count = len(fixm)
+    n = 0
+    while n < count:
+        field = fixm[n]
+        k = field.find('=')
+        num = int(field[:k])
+        if num not in context.header_ids or num in context.trailer_ids:
+            break
+        hdr_index[num] = n
+        if num == 35:
+            msgname = context.name_for_msgtype(field[k+1:])
+        n += 1
+
+    while n < count:
+        field = fixm[n]
+        num = int(field[:field.find('=')])
+        if num in END_FIELDS:
+            break
+        body_index[num] = n
+        n += 1
+        try:
+            desc = context.desc_for_id(num)
+        except KeyError, e:
+            continue
+        if isinstance(desc, FixGroupDescriptor):
+            n = _skip_group(fixm, n, num, context)
+    return hdr_index, body_index, msgname
+
+
+def _skip_group(fixm, n, num, context):
+    """Return position of first field after group ``num`` starting at ``n``."""
+    delim, group_ids = context.group_tags(num)
+    count = len(fixm)
+    while n < count:
+        field = fixm[n]
+        num = int(field[:field.find('=')])
+        if num not in group_ids or num in END_FIELDS:
+            break
+        n += 1
+        try:
+            desc = context.desc_for_id(num)
+        except KeyError, e:
+            continue
+        if isinstance(desc, FixGroupDescriptor):
+            n = _skip_group(fixm, n, num, context)
+    return n
+
+
+def _decode_field(fixm, pos, desc, context):
+    """Decode field at ``pos`` of ``fixm``. Groups are decoded with all entries."""
+    field = fixm[pos]
+    val = field[field.find('=')+1:]
+    if isinstance(desc, FixGroupDescriptor):
+        end = _skip_group(fixm, pos+1, desc.number, context)
+        val, index = _extract_group(_split_fields(fixm[pos+1:end]), 0,
+                                    context, desc.number, val)
+        return val
+    return _convert(desc, val)
+
+
 def _extract_header(fields, index, context):
     """Extract header part starting at index from message fields."""
 
@@ -408,80 +919,76 @@ def _extract_header(fields, index, context):
             desc = context.desc_for_id(num)
         except KeyError, e:
             desc = FixFieldDescriptor('_%d' % num, num, 'STRING', str)
-        try:
-            setattr(hdr, desc.name, desc.pytype(val))
-        except ValueError, e:
-            # log.debug("%s [tag=%d, name=%s, val=%s]", str(e), num, desc.name, val)
-            if desc.pytype == int:
-                setattr(target, desc.name, float(val))
-            else:
-                setattr(target, desc.name, str(val))
+        setattr(hdr, desc.name, _convert(desc, val))
         if num == 35:
             msgname = context.name_for_msgtype(val)
         index += 1
     # end of loop
     return hdr, msgname, index
 
-def _extract_body(fields, index, context, body, group_ids=[]):
-    """Extract message body part starting at index from fields."""
+def _extract_body(fields, index, context, body):
+    """Extract message body part starting at index from fields.
 
-    if isinstance(body, list):
-        # recursively called with list object as body (in group)
-        target = FixObject(context)
-    else:
-        target = body
-
-    fields_seen = []
+    Returns ``body`` and index of first field not in body.
+    """
     max_index = len(fields)
-
     while index < max_index:
         num, val = fields[index]
-        if group_ids and num not in group_ids:
-            # end of a group here
-            body.append(target)
-            return body, index
-
         if num in END_FIELDS:
-            return body, index
+            break
         try:
             desc = context.desc_for_id(num)
         except KeyError, e:
             desc = FixFieldDescriptor('_%d' % num, num, 'STRING', str)
 
         if isinstance(desc, FixGroupDescriptor):
-            grp_fields = map(lambda x: x[0], context.group_for_id(num))
-            # print "extract group %s: %s" % (desc.name, grp_fields)
-            val, count = _extract_body(fields[index+1:], 0, context, [], grp_fields)
-            index += count
-        elif group_ids:
-            # inside group
-            if num not in fields_seen:
-                fields_seen.append(num)
-            else:
-                # repeating group
-                body.append(target)
-                target = FixObject(context)
-                fields_seen = [num]
-        try:
-            # set the value and convert to python type
-            if isinstance(val, list):
-                setattr(target, desc.name, val)
-            else:
-                setattr(target, desc.name, desc.pytype(val))
-        except ValueError, e:
-            # log.debug("%s [tag=%d, name=%s, val=%s]", str(e), num, desc.name, val)
-            # if int field makes an error, try float (may thow
-            if desc.pytype == int:
-                setattr(target, desc.name, float(val))
-            else:
-                setattr(target, desc.name, str(val))
+            val, index = _extract_group(fields, index+1, context, num, val)
+            setattr(body, desc.name, val)
+            continue
+        setattr(body, desc.name, _convert(desc, val))
         index += 1
     # end of loop
-    if group_ids:
-        # don't forget the last target of a group
-        body.append(target)
     return body, index
 
+def _extract_group(fields, index, context, num, count):
+    """Extract entries of field group ``num`` starting at index from fields.
 
+    New entry is started at group delimiter field or at field already seen
+    in current entry. Returns list of entries and index of first field
+    after the group. Raises ValueError if number of entries is not
+    ``count``.
+    """
+    group_num = num
+    delim, group_ids = context.group_tags(num)
+    entries = []
+    target = None
+    seen = set()
+    max_index = len(fields)
+    while index < max_index:
+        num, val = fields[index]
+        if num not in group_ids or num in END_FIELDS:
+            break
+        if target is None or num == delim or num in seen:
+            target = FixObject(context)
+            entries.append(target)
+            seen.clear()
+        seen.add(num)
+        try:
+            desc = context.desc_for_id(num)
+        except KeyError, e:
+            desc = FixFieldDescriptor('_%d' % num, num, 'STRING', str)
 
+        if isinstance(desc, FixGroupDescriptor):
+            val, index = _extract_group(fields, index+1, context, num, val)
+            setattr(target, desc.name, val)
+            continue
+        setattr(target, desc.name, _convert(desc, val))
+        index += 1
+    # end of loop
+    _check_group(group_num, count, entries)
+    return entries, index
 
+def _check_group(num, count, entries):
+    """Raise ValueError if ``count`` of group ``num`` does not match ``entries``."""
+    if int(count) != len(entries):
+        raise ValueError("group %d: count %s, found %d entries" % (num, count, len(entries)))
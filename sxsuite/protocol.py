@@ -12,6 +12,29 @@ Session protocol interfaces.
 import sxsuite.exc as exc
 from sxsuite.exc import SessionError
 
+
+class StreamFramer(object):
+    """Accumulate transport data and split it with protocol ``parser``."""
+
+    def __init__(self, parser):
+        self.parser = parser
+        self._inb = ''
+
+    def reset(self):
+        """Discard all buffered data."""
+        self._inb = ''
+
+    def pending(self):
+        """Number of buffered bytes not yet returned as messages."""
+        return len(self._inb)
+
+    def feed(self, data):
+        """Add ``data`` to buffer and return list of complete messages."""
+        self._inb += data
+        lines, self._inb = self.parser(self._inb)
+        return lines
+
+
 class SessionProtocol(object):
     def __init__(self, version=None):
         self.session = None
@@ -42,6 +65,10 @@ class SessionProtocol(object):
     def parser(self, data):
         return [data], ''
 
+    def framer(self):
+        """Create framer splitting incoming data to messages."""
+        return StreamFramer(self.parser)
+
     def validate(self, data):
         return data
 
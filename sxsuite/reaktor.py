@@ -7,11 +7,17 @@
 
 import logging
 import asyncore
+import errno
+import select
 import traceback
 
+from math import ceil
+from time import time
+
 from sxsuite.exc import SessionError, TransportError
 from sxsuite.session import Session
-from sxsuite.timer import run_timers, add_timer
+from sxsuite.store import close_stores
+from sxsuite.timer import run_timers, add_timer, next_deadline
 
 class Reaktor(object):
     def __init__(self):
@@ -19,6 +25,17 @@ class Reaktor(object):
         self._savelist = []
         self._stid = None
 
+    def poll(self):
+        """Wait for and dispatch one round of I/O events.
+
+        Waits at most until next timer is due.
+        """
+        timeout = 0.5
+        deadline = next_deadline()
+        if deadline is not None:
+            timeout = min(timeout, max(0.0, deadline - time()))
+        asyncore.loop(timeout, False, self.map, 1)
+
     def run(self, savelist=[], exc_handler=None):
         self._savelist = savelist
         if self._savelist:
@@ -26,7 +43,7 @@ class Reaktor(object):
 
         while self.map and not self.stopped():
             try:
-                asyncore.loop(0.5, False, self.map, 1)
+                self.poll()
                 run_timers()
             except KeyboardInterrupt, ke:
                 for t in self.map.values():
@@ -43,6 +60,7 @@ class Reaktor(object):
                     pass
 
         logging.debug("all sessions stopped")
+        close_stores()
 
     def save_states(self):
         for obj, path in self._savelist:
@@ -64,6 +82,12 @@ class Reaktor(object):
         for t in self.map.values():
             t.stop()
         
+    def update_interest(self, transport):
+        """Tell that readable or writable status of ``transport`` may have
+        changed outside of its own I/O events.
+        """
+        pass
+
     def add_channel(self, fd, obj):
         self.map[fd] = obj
 
@@ -78,3 +102,109 @@ class Reaktor(object):
         for t in self.map.values():
             t.stop()
         #logging.debug("reaktor map after stop: %s", str(self.map))
+
+
+if hasattr(select, 'epoll'):
+
+    class _ChannelMap(dict):
+        """Channel map telling reaktor when channels are added or removed."""
+
+        def __init__(self, reaktor):
+            dict.__init__(self)
+            self._reaktor = reaktor
+
+        def __setitem__(self, fd, obj):
+            dict.__setitem__(self, fd, obj)
+            self._reaktor._changed.add(fd)
+
+        def __delitem__(self, fd):
+            dict.__delitem__(self, fd)
+            if fd in self._reaktor._interest:
+                self._reaktor._unregister(fd)
+
+
+    class EpollReaktor(Reaktor):
+        """Reaktor waiting for I/O events with ``epoll``.
+
+        Interest set is kept in kernel. Event mask of a channel is checked
+        when the channel is added, after its I/O events are handled and
+        when its session calls ``update_interest``. Poll timeout is the
+        time to next timer, at most ``max_wait`` seconds.
+        """
+
+        def __init__(self, max_wait=0.5):
+            Reaktor.__init__(self)
+            self.max_wait = max_wait
+            self._epoll = select.epoll()
+            # fd -> (transport socket, event mask)
+            self._interest = {}
+            # fds whose event mask may have changed
+            self._changed = set()
+            self.map = _ChannelMap(self)
+
+        def update_interest(self, transport):
+            fd = transport._fileno
+            if fd is not None:
+                self._changed.add(fd)
+
+        def _update_interest(self, fd):
+            obj = self.map.get(fd)
+            if obj is None:
+                return
+            mask = 0
+            if obj.readable():
+                mask = select.EPOLLIN | select.EPOLLPRI
+            if obj.writable() and not obj.accepting:
+                mask |= select.EPOLLOUT
+            old = self._interest.get(fd)
+            if old is not None:
+                if old[0] is obj.socket and old[1] == mask:
+                    return
+                self._unregister(fd)
+            if mask:
+                try:
+                    self._epoll.register(fd, mask)
+                except IOError, e:
+                    if e.errno != errno.EEXIST:
+                        raise
+                    self._epoll.modify(fd, mask)
+                self._interest[fd] = (obj.socket, mask)
+
+        def _unregister(self, fd):
+            del self._interest[fd]
+            try:
+                self._epoll.unregister(fd)
+            except (IOError, OSError, ValueError):
+                # already closed
+                pass
+
+        def poll(self):
+            changed, self._changed = self._changed, set()
+            for fd in changed:
+                self._update_interest(fd)
+            timeout = self.max_wait
+            deadline = next_deadline()
+            if deadline is not None:
+                # epoll has millisecond resolution, round up to not wake
+                # before the timer is due
+                timeout = min(timeout, max(0.0, ceil((deadline - time())*1000)/1000.0))
+            try:
+                events = self._epoll.poll(timeout)
+            except IOError, e:
+                if e.errno != errno.EINTR:
+                    raise
+                return
+            for fd, flags in events:
+                obj = self.map.get(fd)
+                if obj is None:
+                    continue
+                asyncore.readwrite(obj, flags)
+                # handlers change status of their own channel
+                self._changed.add(fd)
+
+
+def create_reaktor():
+    """Return best available Reaktor for platform."""
+    if hasattr(select, 'epoll'):
+        return EpollReaktor()
+    return Reaktor()
@@ -12,6 +12,7 @@ import logging
 import traceback
 import ssl
 
+from collections import deque
 from time import time
 
 import sxsuite.exc as exc
@@ -71,6 +72,19 @@ class SessionBase(object):
         else:
             raise ConfigError, (self, exc.S_ENODOWNSTREAM)
 
+    def pause_writing(self):
+        """Downlink outbound queue went over its high water mark.
+
+        Default is to pass the signal to uplink.
+        """
+        if self._uplink is not None:
+            self._uplink.pause_writing()
+
+    def resume_writing(self):
+        """Downlink outbound queue drained below its low water mark."""
+        if self._uplink is not None:
+            self._uplink.resume_writing()
+
     def upstream(self, data):
         """Push data upstream."""
         self.recv(data)
@@ -96,6 +110,10 @@ class Session(SessionBase):
     INERROR = 5
     STOPPED = 6
 
+    # default outbound queue water marks in bytes
+    HIGH_WATER = 4*1024*1024
+    LOW_WATER = 1024*1024
+
     _state_names = {
         IDLE: "IDLE",
         LOGIN: "LOGIN",
@@ -116,8 +134,15 @@ class Session(SessionBase):
         self.hb_interval = 0
         self.watchdog_secs = 0
         self._state = Session.IDLE
-        self._inb = ''
-        self._outq = []
+        self._inb = None
+        if protocol is not None:
+            self._inb = protocol.framer()
+        self._outq = deque()
+        self._outq_size = 0
+        self._outq_full = False
+        self._paused = False
+        self.high_water = Session.HIGH_WATER
+        self.low_water = Session.LOW_WATER
         self._direct = False
         self._tid = None
         if name:
@@ -144,6 +169,10 @@ class Session(SessionBase):
 
     def set_conf(self, key, value):
         self.config[key] = value
+        if key == 'high_water_mark':
+            self.high_water = int(value)
+        elif key == 'low_water_mark':
+            self.low_water = int(value)
 
     def get_conf(self, key, default=''):
         return self.config.get(key, default)
@@ -165,8 +194,7 @@ class Session(SessionBase):
     def recv(self, data):
         """Receive message from downstream."""
         self.last_receive = time()
-        self._inb += data
-        lines, self._inb = self.protocol.parser(self._inb)
+        lines = self._inb.feed(data)
 
         if not lines:
             return
@@ -203,15 +231,53 @@ class Session(SessionBase):
         If this is the bottom layer write it to transport. Data
         is assume to be in ``wire-format``.
         """
-        if self._direct:
+        if self._direct and not self._outq:
             if self.transport is None:
                 raise TransportError, (self, exc.S_ENOTCONN)
-            self.transport.send(data)
+            nbytes = self.transport.send(data)
             self.last_send = time()
-        else:
-            self._outq.append(data)
+            if nbytes is None or nbytes >= len(data):
+                return
+            # queue what was not written
+            data = data[nbytes:]
+        self._outq.append(data)
+        self._outq_size += len(data)
+        if len(self._outq) == 1:
+            self._interest_changed()
+        if self._outq_size > self.high_water and not self._outq_full:
+            self.log.debug("%s: outbound queue over high water mark [%d bytes]",
+                           self.name, self._outq_size)
+            self._outq_full = True
+            if self._uplink is not None:
+                self._uplink.pause_writing()
         #self.log.debug("Out queue length: %d", len(self._outq))
 
+    def pause_writing(self):
+        """Stop reading from own transport until ``resume_writing``."""
+        self._paused = True
+        self._interest_changed()
+        SessionBase.pause_writing(self)
+
+    def resume_writing(self):
+        self._paused = False
+        self._interest_changed()
+        SessionBase.resume_writing(self)
+
+    def set_direct(self, direct):
+        """Write data in ``transmit`` directly to transport when queue is empty.
+
+        Used with transports that buffer writes themselves.
+        """
+        self._direct = direct
+
+    def is_paused(self):
+        """Test if reading is paused by downlink back-pressure."""
+        return self._paused
+
+    def outq_size(self):
+        """Number of bytes in outbound queue."""
+        return self._outq_size
+
     def writable(self):
         return len(self._outq) > 0 or self._state == Session.SSL_INIT
 
@@ -236,6 +302,16 @@ class Session(SessionBase):
     def event_disconnect(self, transport):
         pass
 
+    def event_pause(self, transport):
+        """Transport write buffer went over its high water mark."""
+        if self._uplink is not None:
+            self._uplink.pause_writing()
+
+    def event_resume(self, transport):
+        """Transport write buffer drained."""
+        if self._uplink is not None:
+            self._uplink.resume_writing()
+
     def event_writable(self, transport):
         """Write data to transport."""
         connected = transport.state == Transport.CONNECTED
@@ -243,9 +319,7 @@ class Session(SessionBase):
             raise TransportError, (self, exc.S_ENOTCONN)
         assert(transport == self.transport)
         if connected and len(self._outq) > 0:
-            data = self._outq.pop(0)
-            self.transport.send(data)
-            self.last_send = time()
+            self._flush_outq()
 
     def event_readable(self, transport):
         assert(transport == self.transport)
@@ -276,6 +350,56 @@ class Session(SessionBase):
         
     # Private methods
 
+    def _flush_outq(self):
+        """Write queued data to transport in one write.
+
+        At most ``write_budget`` bytes (at least one message) are written
+        per call. Partially written message is left in front of the queue.
+        """
+        budget = int(self.get_conf('write_budget', 65536))
+        bufs = []
+        size = 0
+        for data in self._outq:
+            bufs.append(data)
+            size += len(data)
+            if size >= budget:
+                break
+        nbytes = self.transport.sendv(bufs)
+        if not nbytes:
+            return
+        self.last_send = time()
+        self._outq_size -= nbytes
+        outq = self._outq
+        while nbytes > 0:
+            data = outq[0]
+            if nbytes < len(data):
+                outq[0] = data[nbytes:]
+                break
+            nbytes -= len(data)
+            outq.popleft()
+        if self._outq_full and self._outq_size <= self.low_water:
+            self.log.debug("%s: outbound queue below low water mark [%d bytes]",
+                           self.name, self._outq_size)
+            self._outq_full = False
+            if self._uplink is not None:
+                self._uplink.resume_writing()
+
+    def _interest_changed(self):
+        """Tell reaktor that transport may wait for different events."""
+        reaktor = getattr(self.transport, 'reaktor', None)
+        if reaktor is not None:
+            reaktor.update_interest(self.transport)
+
+    def _reset_outq(self):
+        """Drop queued data of closed connection and release uplink."""
+        self._outq.clear()
+        self._outq_size = 0
+        self._interest_changed()
+        if self._outq_full:
+            self._outq_full = False
+            if self._uplink is not None:
+                self._uplink.resume_writing()
+
     def _start_hb_watchdog(self):
         del_timer(self._tid)
         self.watchdog_secs = self.get_conf('watchdog_interval', 0)
@@ -307,7 +431,8 @@ class Session(SessionBase):
 
 class TCPSession(Session):
 
-    def __init__(self, reaktor, protocol, name='', server=False, transport=None):
+    def __init__(self, reaktor, protocol, name='', server=False, transport=None,
+                 listen=True):
         Session.__init__(self, protocol, name=name, server=server, transport=transport)
         self.listener = None
         self.transport = transport
@@ -315,6 +440,9 @@ class TCPSession(Session):
         self._ssl = None
         if transport is None:
             if self.server:
+                if not listen:
+                    # connections accepted elsewhere and given with attach()
+                    return
                 self.listener = AcceptorTransport(reaktor, self)
                 self.listener.create()
             else:
@@ -390,6 +518,16 @@ class TCPSession(Session):
         timeout_sec = self.get_conf('login_wait_time', 20)
         self._tid = add_timer(timeout_sec, self._login_timeout)
 
+    def attach(self, transport):
+        """Attach connected client ``transport`` to server side session.
+
+        Used by transports that accept connections themselves.
+        """
+        self.transport = transport
+        transport.set_session(self)
+        self._state = Session.LOGIN
+        self._arm_login_timer()
+
 
     def event_writable(self, transport):
         if self._state == Session.SSL_INIT:
@@ -439,8 +577,8 @@ class TCPSession(Session):
         typ, ex, tb = sys.exc_info()
         self.log.debug("ERROR %s: %s", typ, str(ex))
         error_no = 0
-        if typ == socket.error:
-            error_no, errstr = ex.args
+        if issubclass(typ, socket.error):
+            error_no, errstr = ex.args[:2]
             if self.transport is not None:
                 self.transport.close()
                 self.transport.del_channel()
@@ -501,6 +639,8 @@ class TCPSession(Session):
     def _request_reconnect(self):
         del_timer(self._tid)
         self.log.debug("RECONNECT: %s", self._last_address)
+        self._inb.reset()
+        self._reset_outq()
         self.transport.create()
         if self._ssl is not None:
             self.transport.ssl_wrap(self._ssl)
@@ -512,6 +652,7 @@ class TCPSession(Session):
         self.transport.del_channel()
         self._state = Session.IDLE
         del_timer(self._tid)
+        self._reset_outq()
         if self.server:
             self._disconnect_client()
         else:
@@ -519,6 +660,8 @@ class TCPSession(Session):
         
     def _disconnect_client(self):
         self._state = Session.IDLE
+        self._inb.reset()
+        self._reset_outq()
         del_timer(self._tid)
         if self.listener is not None:
             # delete old client transport
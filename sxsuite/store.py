@@ -5,28 +5,114 @@
 # or any later version.
 # See the COPYING file included in this archive
 
+import atexit
+import logging
+import mmap
 import os
 import pickle
-from urlparse import urlparse
+import Queue
+import sqlite3
+import struct
+import threading
+import weakref
+from time import time
+from urlparse import urlparse, parse_qs
+
+from sxsuite.timer import add_timer, del_timer
+
+# stores opened by open_store, closed at exit
+_stores = weakref.WeakSet()
 
 def open_store(url):
+    """Open message store.
+
+    ``file:///path`` opens pickled message file, ``journal:///path``
+    message journal in directory ``path``, ``mmap:///path`` memory mapped
+    segments in directory ``path`` and ``sqlite:///path?session=name``
+    SQLite database.
+
+    Query parameter ``durability`` (``none``, ``batch`` or ``sync``) wraps
+    store in ``DurableStore``; ``batch_ms`` and ``batch_count`` set the
+    group commit limits of ``batch`` mode.
+    """
     r = urlparse(url)
+    # urlparse of python 2 does not split query of unknown schemes
+    path, _, query = r.path.partition('?')
+    query = dict((k, v[0]) for k, v in parse_qs(query or r.query).items())
     if r.scheme == 'file':
-        return MessageFileStore(r.path)
-    return None
+        store = MessageFileStore(path)
+    elif r.scheme == 'journal':
+        store = MessageJournalStore(path)
+    elif r.scheme == 'mmap':
+        store = MessageMmapStore(path)
+    elif r.scheme == 'sqlite':
+        store = SQLiteStore(path, query.get('session', ''))
+    else:
+        return None
+    if 'durability' in query:
+        store = DurableStore(store, query['durability'],
+                             batch_ms=int(query.get('batch_ms', 5)),
+                             batch_count=int(query.get('batch_count', 100)))
+    _stores.add(store)
+    return store
+
+def close_stores():
+    """Write and close all stores opened with ``open_store``.
+
+    Called by reaktor when it stops and at interpreter exit. Stores are
+    reopened if they are used again.
+    """
+    for store in list(_stores):
+        try:
+            store.close()
+        except Exception, e:
+            logging.error("closing store failed: %s: %s", type(e).__name__, str(e))
+
+atexit.register(close_stores)
 
 class MessageStore(object):
+    # save can run in background writer thread
+    background = True
+
     def save(self, num, msg):
         pass
 
+    def sync(self):
+        """Force saved messages to disk."""
+        pass
+
+    def close(self):
+        pass
+
+    def reset(self):
+        """Drop all stored messages. Called when sequence numbers are reset."""
+        pass
+
     def find(self, num, pos=0):
         pass
 
     def next(self, num):
         pass
 
+    def records(self):
+        """Iterate all stored (num, msg) in save order."""
+        raise NotImplementedError
+
+    def range(self, first, last=0):
+        """Return list of (num, msg) stored for seqnos ``first`` to ``last``.
+
+        If ``last`` is zero returns all from ``first``. Seqnos that are
+        not stored, such as admin messages, are skipped.
+        """
+        found = {}
+        for num, msg in self.records():
+            if num >= first and (last == 0 or num <= last):
+                # later record of same seqno replaces earlier one
+                found[num] = msg
+        return sorted(found.items())
+
     
-class MessageFileStore(object):
+class MessageFileStore(MessageStore):
     def __init__(self, path):
         self.path = path
         self.fd = None
@@ -41,6 +127,29 @@ class MessageFileStore(object):
         pickle.dump([num, msg], self.fd)
         self.fd.flush()
 
+    def sync(self):
+        if self.fd is not None:
+            os.fsync(self.fd.fileno())
+
+    def close(self):
+        if self.fd is not None:
+            self.fd.close()
+            self.fd = None
+
+    def reset(self):
+        self.close()
+        open(self.path, 'w').close()
+
+    def records(self):
+        self.open()
+        self.fd.seek(0, os.SEEK_SET)
+        while True:
+            try:
+                num, msg = pickle.load(self.fd)
+            except EOFError:
+                return
+            yield num, msg
+
     def tell(self):
         if self.fd is None:
             return 0
@@ -71,7 +180,569 @@ class MessageFileStore(object):
         return rec[0], rec[1]
 
 
+class MessageJournalStore(MessageStore):
+    """Append-only message journal.
+
+    Messages are written as length-prefixed records to segment files
+    ``NNNNNNNN.seg`` in directory ``path``. File ``index`` has fixed width
+    (segment, offset) entry for every seqno, so messages are found with
+    one seek to index and one to segment.
+    """
+
+    SEGMENT_SIZE = 64*1024*1024
+
+    # record header: seqno, length
+    _REC = struct.Struct('>II')
+    # index entry: segment, offset; segment 0 is missing entry
+    _IDX = struct.Struct('>IQ')
+
+    def __init__(self, path, segment_size=SEGMENT_SIZE):
+        self.path = path
+        self.segment_size = segment_size
+        self.index = None
+        self.fd = None
+        self.segment = 0
+        self._readers = {}
+        self._last = 0
+
+    def open(self):
+        if self.index is not None:
+            return
+        if not os.path.isdir(self.path):
+            os.makedirs(self.path)
+        index_path = os.path.join(self.path, 'index')
+        if not os.path.exists(index_path):
+            open(index_path, 'wb').close()
+        self.index = open(index_path, 'r+b')
+        segments = [int(x[:-4]) for x in os.listdir(self.path) if x.endswith('.seg')]
+        self._open_segment(max(segments) if segments else 1)
+
+    def close(self):
+        for fd in self._readers.values():
+            fd.close()
+        self._readers = {}
+        if self.index is not None:
+            self.fd.close()
+            self.index.close()
+            self.index = self.fd = None
+
+    def reset(self):
+        self.close()
+        if os.path.isdir(self.path):
+            for name in os.listdir(self.path):
+                if name == 'index' or name.endswith('.seg'):
+                    os.remove(os.path.join(self.path, name))
+        self._last = 0
+
+    def sync(self):
+        if self.index is not None:
+            os.fsync(self.fd.fileno())
+            os.fsync(self.index.fileno())
+
+    def save(self, num, msg):
+        self.open()
+        offset = self.fd.tell()
+        if offset > 0 and offset + len(msg) > self.segment_size:
+            self._open_segment(self.segment + 1)
+            offset = 0
+        self.fd.write(self._REC.pack(num, len(msg)))
+        self.fd.write(msg)
+        self.fd.flush()
+        self.index.seek(num * self._IDX.size, os.SEEK_SET)
+        self.index.write(self._IDX.pack(self.segment, offset))
+        self.index.flush()
+
+    def find(self, num, pos=0):
+        self.open()
+        self.index.seek(num * self._IDX.size, os.SEEK_SET)
+        entry = self.index.read(self._IDX.size)
+        if len(entry) < self._IDX.size:
+            return -1, None
+        segment, offset = self._IDX.unpack(entry)
+        if segment == 0:
+            return -1, None
+        fd = self._reader(segment)
+        fd.seek(offset, os.SEEK_SET)
+        header = fd.read(self._REC.size)
+        if len(header) < self._REC.size:
+            # record cut short by crash
+            return -1, None
+        rec_num, length = self._REC.unpack(header)
+        if rec_num != num:
+            return -1, None
+        msg = fd.read(length)
+        if len(msg) < length:
+            return -1, None
+        self._last = num
+        return num, msg
+
+    def next(self, num):
+        """Return message following last found message."""
+        return self.find(self._last + 1)
+
+    def last_seqno(self):
+        """Return highest seqno in index."""
+        self.open()
+        self.index.seek(0, os.SEEK_END)
+        return max(0, self.index.tell() / self._IDX.size - 1)
+
+    def range(self, first, last=0):
+        if last == 0:
+            last = self.last_seqno()
+        result = []
+        for num in xrange(first, last+1):
+            num, msg = self.find(num)
+            if num != -1:
+                result.append((num, msg))
+        return result
+
+    def _open_segment(self, segment):
+        if self.fd is not None:
+            self.fd.close()
+        self.segment = segment
+        self.fd = open(self._segment_path(segment), 'ab')
+        self.fd.seek(0, os.SEEK_END)
+
+    def _segment_path(self, segment):
+        return os.path.join(self.path, '%08d.seg' % segment)
+
+    def _reader(self, segment):
+        fd = self._readers.get(segment)
+        if fd is None:
+            fd = open(self._segment_path(segment), 'rb')
+            self._readers[segment] = fd
+        return fd
+
+
+class MessageMmapStore(MessageStore):
+    """Message store in memory mapped segment files.
+
+    Segment files ``NNNNNNNN.seg`` in directory ``path`` are preallocated
+    and kept mapped; messages are copied in place as length-prefixed records
+    and returned as read-only buffers into the mapping. Returned buffers
+    are valid until the store is closed. Seqno index is kept in memory and
+    rebuilt from segments on open.
+    """
+
+    SEGMENT_SIZE = 16*1024*1024
+
+    # record header: seqno, length; zero seqno ends segment data
+    _REC = struct.Struct('>II')
+
+    def __init__(self, path, segment_size=SEGMENT_SIZE):
+        self.path = path
+        self.segment_size = segment_size
+        self.maps = None
+        self.segment = 0
+        self.offset = 0
+        self._index = {}
+        self._dirty = set()
+        self._last = 0
+
+    def open(self):
+        if self.maps is not None:
+            return
+        if not os.path.isdir(self.path):
+            os.makedirs(self.path)
+        self.maps = {}
+        segments = sorted(int(x[:-4]) for x in os.listdir(self.path) if x.endswith('.seg'))
+        for segment in segments:
+            self._map_segment(segment)
+            self._scan(segment)
+        if not segments:
+            self._map_segment(1)
+            self.segment, self.offset = 1, 0
+
+    def close(self):
+        if self.maps is not None:
+            self.sync()
+            for mm in self.maps.values():
+                mm.close()
+            self.maps = None
+            self._index = {}
+
+    def reset(self):
+        """Drop all messages; buffers returned by ``find`` become invalid."""
+        self.close()
+        if os.path.isdir(self.path):
+            for name in os.listdir(self.path):
+                if name.endswith('.seg'):
+                    os.remove(os.path.join(self.path, name))
+        self._last = 0
+
+    def sync(self):
+        """Write modified segments to disk."""
+        if self.maps is not None:
+            for segment in sorted(self._dirty):
+                self.maps[segment].flush()
+        self._dirty.clear()
+
+    def save(self, num, msg):
+        self.open()
+        size = self._REC.size + len(msg)
+        mm = self.maps[self.segment]
+        # keep room for terminating zero header
+        if self.offset + size + self._REC.size > len(mm):
+            self._map_segment(self.segment + 1, size + self._REC.size)
+            self.segment += 1
+            self.offset = 0
+            mm = self.maps[self.segment]
+        offset = self.offset
+        mm[offset+self._REC.size:offset+size] = msg
+        self._REC.pack_into(mm, offset, num, len(msg))
+        self.offset += size
+        self._index[num] = (self.segment, offset)
+        self._dirty.add(self.segment)
+
+    def find(self, num, pos=0):
+        self.open()
+        entry = self._index.get(num)
+        if entry is None:
+            return -1, None
+        segment, offset = entry
+        mm = self.maps[segment]
+        rec_num, length = self._REC.unpack_from(mm, offset)
+        self._last = num
+        return num, buffer(mm, offset + self._REC.size, length)
+
+    def next(self, num):
+        """Return message following last found message."""
+        return self.find(self._last + 1)
+
+    def last_seqno(self):
+        """Return highest seqno in store."""
+        self.open()
+        return max(self._index) if self._index else 0
+
+    def range(self, first, last=0):
+        self.open()
+        if last == 0:
+            last = self.last_seqno()
+        result = []
+        for num in xrange(first, last+1):
+            entry = self._index.get(num)
+            if entry is not None:
+                segment, offset = entry
+                mm = self.maps[segment]
+                length = self._REC.unpack_from(mm, offset)[1]
+                result.append((num, buffer(mm, offset + self._REC.size, length)))
+        return result
+
+    def _map_segment(self, segment, need=0):
+        path = os.path.join(self.path, '%08d.seg' % segment)
+        with open(path, 'a+b') as fd:
+            fd.seek(0, os.SEEK_END)
+            size = fd.tell()
+            if size == 0:
+                size = max(self.segment_size, need)
+                fd.truncate(size)
+            self.maps[segment] = mmap.mmap(fd.fileno(), size)
+
+    def _scan(self, segment):
+        """Add records of ``segment`` to index."""
+        mm = self.maps[segment]
+        offset = 0
+        end = len(mm) - self._REC.size
+        while offset <= end:
+            num, length = self._REC.unpack_from(mm, offset)
+            if num == 0:
+                break
+            self._index[num] = (segment, offset)
+            offset += self._REC.size + length
+        self.segment, self.offset = segment, offset
+
+
+class _SQLiteDB(object):
+    """SQLite connection shared by stores of one database file.
+
+    SQLite allows one writer per database so sessions of a process
+    share the connection and its commit timer.
+    """
+
+    _SCHEMA = [
+        """CREATE TABLE IF NOT EXISTS messages (
+               session TEXT NOT NULL,
+               seqno INTEGER NOT NULL,
+               sent REAL NOT NULL,
+               msg BLOB NOT NULL,
+               PRIMARY KEY (session, seqno))""",
+        "CREATE INDEX IF NOT EXISTS messages_sent ON messages (session, sent)",
+        ]
+
+    _open = {}
+
+    def __init__(self, path):
+        self.path = path
+        self.refs = 0
+        self._tid = None
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        for stmt in self._SCHEMA:
+            self.conn.execute(stmt)
+        self.conn.commit()
+
+    @classmethod
+    def get(cls, path):
+        db = cls._open.get(path)
+        if db is None:
+            db = cls._open[path] = cls(path)
+        db.refs += 1
+        return db
+
+    def release(self):
+        self.refs -= 1
+        if self.refs == 0:
+            self.commit()
+            self.conn.close()
+            del self._open[self.path]
+
+    def execute(self, stmt, args=()):
+        return self.conn.execute(stmt, args)
+
+    def insert(self, row):
+        self.conn.execute("INSERT OR REPLACE INTO messages VALUES (?, ?, ?, ?)", row)
+        if self._tid is None:
+            self._tid = add_timer(0, self.commit)
+
+    def commit(self):
+        if self._tid is not None:
+            del_timer(self._tid)
+            self._tid = None
+        self.conn.commit()
+
+
 class SQLiteStore(MessageStore):
-    pass
+    """Message store in SQLite database.
+
+    Messages of many sessions can share database file; they are keyed by
+    session name and seqno. Database is used in WAL mode and inserts are
+    committed once per reaktor round from a zero timeout timer.
+    """
+
+    # connection and commit timer belong to reaktor thread
+    background = False
+
+    def __init__(self, path, session=''):
+        self.path = path
+        self.session = session
+        self.db = None
+        self._last = 0
+
+    def open(self):
+        if self.db is None:
+            self.db = _SQLiteDB.get(self.path)
+
+    def close(self):
+        if self.db is not None:
+            self.db.release()
+            self.db = None
+
+    def commit(self):
+        """Commit pending inserts."""
+        if self.db is not None:
+            self.db.commit()
+
+    sync = commit
+
+    def reset(self):
+        self.open()
+        self.db.execute("DELETE FROM messages WHERE session = ?", (self.session,))
+        self.db.commit()
+        self._last = 0
+
+    def save(self, num, msg):
+        self.open()
+        self.db.insert((self.session, num, time(), sqlite3.Binary(msg)))
+
+    def find(self, num, pos=0):
+        self.open()
+        row = self.db.execute(
+            "SELECT seqno, msg FROM messages WHERE session = ? AND seqno = ?",
+            (self.session, num)).fetchone()
+        return self._row(row)
+
+    def next(self, num):
+        """Return message following last found message."""
+        self.open()
+        row = self.db.execute(
+            "SELECT seqno, msg FROM messages WHERE session = ? AND seqno > ? "
+            "ORDER BY seqno LIMIT 1", (self.session, self._last)).fetchone()
+        return self._row(row)
+
+    def range(self, first, last=0):
+        self.open()
+        if last == 0:
+            cur = self.db.execute(
+                "SELECT seqno, msg FROM messages WHERE session = ? AND seqno >= ? "
+                "ORDER BY seqno", (self.session, first))
+        else:
+            cur = self.db.execute(
+                "SELECT seqno, msg FROM messages WHERE session = ? "
+                "AND seqno BETWEEN ? AND ? ORDER BY seqno", (self.session, first, last))
+        return [(num, str(msg)) for num, msg in cur]
+
+    def sent_between(self, start, end):
+        """Return list of (num, msg) sent between times ``start`` and ``end``."""
+        self.open()
+        cur = self.db.execute(
+            "SELECT seqno, msg FROM messages WHERE session = ? "
+            "AND sent BETWEEN ? AND ? ORDER BY sent", (self.session, start, end))
+        return [(num, str(msg)) for num, msg in cur]
+
+    def _row(self, row):
+        if row is None:
+            return -1, None
+        self._last = row[0]
+        return row[0], str(row[1])
 
             
+
+
+class DurableStore(MessageStore):
+    """Store wrapper writing messages in background thread.
+
+    Durability ``mode`` is one of
+
+    ``none``
+        messages are written by writer thread and never synced.
+    ``batch``
+        writer thread collects messages for ``batch_ms`` milliseconds or
+        until ``batch_count`` messages, writes them and syncs once.
+    ``sync``
+        messages are written and synced before ``save`` returns.
+
+    Writer queue holds at most ``queue_size`` messages; ``save`` blocks if
+    it is full. Queued messages are found from memory until written.
+    Stores that are not safe to write from another thread are written
+    directly; in ``batch`` mode they are left to commit once per reaktor
+    round by themselves.
+
+    If writer thread fails to write messages they are kept in memory and
+    the error is raised by next ``save``, ``flush``, ``sync`` or ``close``.
+    """
+
+    MODES = ('none', 'batch', 'sync')
+
+    def __init__(self, store, mode='batch', batch_ms=5, batch_count=100,
+                 queue_size=10000):
+        if mode not in self.MODES:
+            raise ValueError, "unknown durability mode: %s" % mode
+        self.store = store
+        self.mode = mode
+        self.batch_wait = batch_ms / 1000.0
+        self.batch_count = max(1, batch_count)
+        self._queue = Queue.Queue(queue_size)
+        self._lock = threading.Lock()
+        self._pending = {}
+        self._thread = None
+        self._error = None
+        self._last = 0
+
+    def start(self):
+        """Start writer thread."""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name='store-writer')
+            self._thread.daemon = True
+            self._thread.start()
+
+    def save(self, num, msg):
+        if self.mode == 'sync' or not self.store.background:
+            with self._lock:
+                self.store.save(num, msg)
+                if self.mode == 'sync':
+                    self.store.sync()
+            return
+        self._check()
+        self.start()
+        self._pending[num] = msg
+        self._queue.put((num, msg))
+
+    def find(self, num, pos=0):
+        msg = self._pending.get(num)
+        if msg is not None:
+            self._last = num
+            return num, msg
+        with self._lock:
+            num, msg = self.store.find(num)
+        if num != -1:
+            self._last = num
+        return num, msg
+
+    def next(self, num):
+        """Return message following last found message."""
+        return self.find(self._last + 1)
+
+    def range(self, first, last=0):
+        self.flush()
+        with self._lock:
+            return self.store.range(first, last)
+
+    def flush(self):
+        """Wait until queued messages are written."""
+        if self._thread is not None:
+            self._queue.join()
+        self._check()
+
+    def sync(self):
+        self.flush()
+        with self._lock:
+            self.store.sync()
+
+    def reset(self):
+        self.flush()
+        with self._lock:
+            self._pending.clear()
+            self.store.reset()
+
+    def close(self):
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join()
+            self._thread = None
+        with self._lock:
+            self.store.sync()
+            self.store.close()
+        self._check()
+
+    def _check(self):
+        """Raise error of writer thread."""
+        if self._error is not None:
+            e, self._error = self._error, None
+            raise e
+
+    def _run(self):
+        done = False
+        while not done:
+            batch = [self._queue.get()]
+            if batch[0] is None:
+                batch, done = [], True
+            deadline = time() + self.batch_wait
+            while batch and len(batch) < self.batch_count:
+                wait = deadline - time()
+                try:
+                    item = self._queue.get(wait > 0, max(wait, 0))
+                except Queue.Empty:
+                    break
+                if item is None:
+                    done = True
+                    break
+                batch.append(item)
+            written = True
+            try:
+                with self._lock:
+                    for num, msg in batch:
+                        self.store.save(num, msg)
+                    if batch and self.mode == 'batch':
+                        self.store.sync()
+            except Exception, e:
+                logging.error("store writer: %s: %s", type(e).__name__, str(e))
+                # keep messages findable, error is raised to caller
+                self._error = e
+                written = False
+            for num, msg in batch:
+                if written and self._pending.get(num) is msg:
+                    del self._pending[num]
+                self._queue.task_done()
+            if done:
+                self._queue.task_done()
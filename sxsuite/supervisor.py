@@ -0,0 +1,257 @@
+# (c) Harri Rautila, 2011
+
+# This file is part of sxsuite library. It is free software, distributed
+# under the terms of the GNU Lesser General Public License Version 3,
+# or any later version.
+# See the COPYING file included in this archive
+
+"""
+Run sessions sharded over worker processes.
+
+Sessions are assigned to workers by hash of session name. Each worker
+runs its own reaktor and creates its sessions with the factory function
+given to ``SessionSupervisor``::
+
+    def factory(reaktor, name, config):
+        ses = FixServer(reaktor, FixProtocol(), name=name, listen=False)
+        for key, val in config.items():
+            ses.set_conf(key, val)
+        return ses
+
+Client sessions are started by the factory. Connections to server
+sessions are accepted by the supervisor on one port, routed by
+CompIDs of the Logon message and passed to the owning worker over its
+control channel. The control channel also answers status queries.
+"""
+
+import logging
+import os
+import signal
+import socket
+import zlib
+
+from multiprocessing import Process, Pipe, cpu_count
+from multiprocessing.reduction import send_handle, recv_handle
+
+from sxsuite.apps import Application
+from sxsuite.fix.fixproto import FixAcceptor
+from sxsuite.reaktor import create_reaktor
+from sxsuite.session import Session
+from sxsuite.timer import flush_timers
+from sxsuite.transport import ConnectedTransport
+
+
+def set_cpu_affinity(cpu):
+    """Pin current process to ``cpu``. Returns False if not supported."""
+    if hasattr(os, 'sched_setaffinity'):
+        os.sched_setaffinity(0, [cpu])
+        return True
+    try:
+        import psutil
+    except ImportError:
+        return False
+    psutil.Process(os.getpid()).cpu_affinity([cpu])
+    return True
+
+
+class _WorkerControl(Application):
+    """Worker end of supervisor control channel."""
+
+    def __init__(self, worker, transport):
+        Application.__init__(self, None, name='control', transport=transport)
+        self.worker = worker
+
+    def event_readable(self, transport):
+        conn = transport.socket
+        try:
+            cmd, arg = conn.recv()
+        except (EOFError, IOError):
+            # supervisor gone
+            self.worker.stop()
+            return
+        if cmd == 'attach':
+            fd = recv_handle(conn)
+            self.worker.attach(arg[0], fd, arg[1])
+        elif cmd == 'status':
+            conn.send(('status', self.worker.status()))
+        elif cmd == 'stop':
+            self.worker.stop()
+
+    def event_stop(self, transport):
+        transport.close()
+        transport.del_channel()
+        self._state = Session.STOPPED
+
+
+class _Worker(object):
+    """Session worker. Executed in subprocess context."""
+
+    def __init__(self, index, factory, specs, conn, cpu=None):
+        self.index = index
+        self.factory = factory
+        self.specs = specs
+        self.conn = conn
+        self.cpu = cpu
+        self.reaktor = None
+        self.sessions = {}
+
+    def run(self):
+        flush_timers()
+        if self.cpu is not None and not set_cpu_affinity(self.cpu):
+            logging.warning("worker %d: cpu affinity not supported", self.index)
+        self.reaktor = create_reaktor()
+        signal.signal(signal.SIGTERM, self.reaktor.sigterm)
+        self.control = _WorkerControl(self, ConnectedTransport(self.reaktor, self.conn))
+        for name, config, server in self.specs:
+            self.sessions[name] = self.factory(self.reaktor, name, config)
+        self.reaktor.run(exc_handler=self._exc_handler)
+
+    def __call__(self):
+        self.run()
+
+    def attach(self, name, fd, data):
+        """Attach connection ``fd`` to server session ``name``."""
+        sock = socket.fromfd(fd, socket.AF_INET, socket.SOCK_STREAM)
+        os.close(fd)
+        session = self.sessions.get(name)
+        if session is None or not session.in_state(Session.IDLE):
+            logging.info("worker %d: %s not available", self.index, name)
+            sock.close()
+            return
+        session.attach(ConnectedTransport(self.reaktor, sock, session))
+        session.recv(data)
+
+    def status(self):
+        return [(name, Session._state_names[ses._state], str(ses))
+                for name, ses in self.sessions.items()]
+
+    def stop(self):
+        self.reaktor.stop()
+
+    def _exc_handler(self, ex):
+        logging.warning("worker %d: %s: %s", self.index, type(ex).__name__, str(ex))
+        return True
+
+
+class _RemoteSession(object):
+    """Supervisor side proxy of server session running in worker.
+
+    Connection attached to proxy is passed to the worker.
+    """
+
+    def __init__(self, name, config, worker):
+        self.name = name
+        self.config = config
+        self.worker = worker
+        self.transport = None
+
+    def get_conf(self, key, default=''):
+        return self.config.get(key, default)
+
+    def in_state(self, state):
+        # worker checks actual session state
+        return state == Session.IDLE
+
+    def attach(self, transport):
+        self.transport = transport
+
+    def recv(self, data):
+        transport = self.transport
+        self.transport = None
+        conn, process = self.worker
+        conn.send(('attach', (self.name, data)))
+        send_handle(conn, transport.socket.fileno(), process.pid)
+        transport.close()
+        transport.del_channel()
+
+
+class SessionSupervisor(object):
+    """Spread sessions over worker processes.
+
+    ``factory(reaktor, name, config)`` creates session in worker process.
+    Workers are pinned to ``cpus`` in order if given.
+    """
+
+    def __init__(self, factory, workers=0, cpus=None):
+        self.factory = factory
+        self.nworkers = workers if workers > 0 else cpu_count()
+        self.cpus = cpus
+        self.reaktor = None
+        self.acceptor = None
+        self._specs = []
+        self._workers = []
+
+    def add_session(self, name, config, server=False):
+        """Add session ``name``. Server sessions are reached through ``listen``."""
+        self._specs.append((name, config, server))
+
+    def shard_of(self, name):
+        """Return index of worker running session ``name``."""
+        return (zlib.crc32(name) & 0x7fffffff) % self.nworkers
+
+    def start(self):
+        """Start worker processes."""
+        shards = [[] for n in range(self.nworkers)]
+        for spec in self._specs:
+            shards[self.shard_of(spec[0])].append(spec)
+
+        for n in range(self.nworkers):
+            cpu = None
+            if self.cpus:
+                cpu = self.cpus[n % len(self.cpus)]
+            conn, child = Pipe(duplex=True)
+            process = Process(target=_Worker(n, self.factory, shards[n], child, cpu),
+                              name='worker-%d' % n)
+            process.start()
+            child.close()
+            self._workers.append((conn, process))
+
+    def listen(self, address):
+        """Accept connections to server sessions at ``address``."""
+        self.reaktor = create_reaktor()
+        self.acceptor = FixAcceptor(self.reaktor, name='supervisor')
+        for name, config, server in self._specs:
+            if server:
+                worker = self._workers[self.shard_of(name)]
+                self.acceptor.register(_RemoteSession(name, config, worker))
+        self.acceptor.start(address)
+
+    def run(self, address=None):
+        """Start workers and serve connections at ``address``."""
+        self.start()
+        if address is None:
+            for conn, process in self._workers:
+                process.join()
+            return
+        self.listen(address)
+        signal.signal(signal.SIGTERM, self.reaktor.sigterm)
+        try:
+            self.reaktor.run()
+        finally:
+            self.stop()
+
+    def status(self, timeout=1.0):
+        """Return status of all sessions as list of (name, state, description)."""
+        result = []
+        for conn, process in self._workers:
+            conn.send(('status', None))
+            if conn.poll(timeout):
+                cmd, status = conn.recv()
+                result.extend(status)
+        return result
+
+    def stop(self, timeout=2.0):
+        """Stop workers."""
+        for conn, process in self._workers:
+            try:
+                conn.send(('stop', None))
+            except (IOError, EOFError):
+                pass
+        for conn, process in self._workers:
+            process.join(timeout)
+            if process.is_alive():
+                process.terminate()
+            conn.close()
+        self._workers = []
+        if self.acceptor is not None:
+            self.acceptor.stop()
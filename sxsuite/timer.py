@@ -16,8 +16,14 @@ import logging
 import sys
 import os
 
+from heapq import heappush, heappop, heapify
+
+# heap of [fire_at, timer_id, func]; cancelled timers have func None
 _timer_list = []
+# timer_id -> heap entry of pending timers
+_timer_map = {}
 _timer_counter = 0
+_cancelled = 0
 
 from time import time
 
@@ -25,63 +31,81 @@ def add_timer(timeout, func):
     """Add ``func`` to execute in ``timeout`` seconds. ``Timeout`` can
     be float. Returns interger ``timer id``.
     """
-    global _timer_list, _timer_counter
-
-    fire_at = time() + timeout
+    global _timer_counter
 
     _timer_counter += 1
     timer_id = _timer_counter
-
-    for n in xrange(len(_timer_list)):
-        t, tid, f = _timer_list[n]
-        if fire_at > t:
-            next
-
-        if fire_at <= t:
-            _timer_list.insert(n, [fire_at, timer_id, func])
-            fire_at = 0
-        break
-
-    if fire_at != 0:
-        _timer_list.append([fire_at, timer_id, func])
-
+    entry = [time() + timeout, timer_id, func]
+    heappush(_timer_list, entry)
+    _timer_map[timer_id] = entry
     return timer_id
 
 def del_timer(timer_id):
-    """Remove timer with id ``timer_id``."""
-    global _timer_list
-    if not _timer_list:
-        return
-    if _timer_list[0][1] == timer_id:
-        _timer_list.pop(0)
-    else:
-        _timer_list = filter(lambda x: x[1] != timer_id, _timer_list)
+    """Remove timer with id ``timer_id``.
 
+    Timer is only marked cancelled and dropped when it reaches the top of
+    the heap. Heap is compacted if most of it is cancelled timers.
+    """
+    global _timer_list, _cancelled
+    entry = _timer_map.pop(timer_id, None)
+    if entry is None:
+        return
+    entry[2] = None
+    _cancelled += 1
+    if _cancelled > 64 and _cancelled > len(_timer_list)/2:
+        _timer_list = [x for x in _timer_list if x[2] is not None]
+        heapify(_timer_list)
+        _cancelled = 0
+
+def _drop_cancelled():
+    global _cancelled
+    while _timer_list and _timer_list[0][2] is None:
+        heappop(_timer_list)
+        _cancelled -= 1
+
+def next_deadline():
+    """Return time when next timer fires or None if no timers."""
+    _drop_cancelled()
+    if not _timer_list:
+        return None
+    return _timer_list[0][0]
 
 def flush_timers():
-    global _timer_list
+    global _timer_list, _cancelled
     _timer_list = []
+    _timer_map.clear()
+    _cancelled = 0
 
 def list_timers():
-    global _timer_list
-    return _timer_list
+    """Return list of pending timers ordered by firing time."""
+    return sorted([x for x in _timer_list if x[2] is not None])
 
 def run_timers():
     _run_until(time())
 
 def _run_until(t):
-    """Fire timers until time ``t``."""
-    global _timer_list
-    if not _timer_list:
-        return
-
-    if _timer_list[0][0] > t:
-        return
+    """Fire timers until time ``t``.
 
+    Timers added by fired timers are left for next call so that event
+    loop gets to run in between.
+    """
+    global _cancelled
+    last_id = _timer_counter
+    later = []
     while _timer_list and _timer_list[0][0] <= t:
-        r, td, func = _timer_list.pop(0)
+        entry = heappop(_timer_list)
+        func = entry[2]
+        if func is None:
+            _cancelled -= 1
+            continue
+        if entry[1] > last_id:
+            later.append(entry)
+            continue
+        del _timer_map[entry[1]]
         func()
         t = time()
+    for entry in later:
+        heappush(_timer_list, entry)
 
         
 if sys.platform != 'win32':
@@ -91,14 +115,14 @@ if sys.platform != 'win32':
     import signal
 
     def _arm_itimer():
-        global _timer_list
-        if _timer_list:
-            t = _timer_list[0][0] - time()
+        deadline = next_deadline()
+        if deadline is not None:
+            t = deadline - time()
             if t > 0:
                 signal.signal(signal.SIGALRM, _run_timer)
                 signal.setitimer(signal.ITIMER_REAL, t, 0)
             else:
-                _run_timer()
+                _run_timer(signal.SIGALRM, None)
 
     def _run_timer(signo, frame):
         """Run timer firing now. """
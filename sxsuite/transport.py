@@ -123,10 +123,25 @@ class Transport(asyncore.dispatcher):
         return self.state == Transport.CONNECTING or self.session.writable()
 
     def readable(self):
-        """Test if protocol transport readable events are listened."""
+        """Test if protocol transport readable events are listened.
+
+        Reading is stopped while session is paused by back-pressure.
+        """
+        if self.session.is_paused():
+            return False
         return  self.state == Transport.CONNECTED or self.session.readable()
 
 
+    def sendv(self, bufs):
+        """Write list of buffers with one ``send``.
+
+        Python 2 sockets have no vectored write so buffers are joined.
+        Returns number of bytes written.
+        """
+        if len(bufs) == 1:
+            return self.send(bufs[0])
+        return self.send(''.join(bufs))
+
     def is_connected(self):
         try:
             addr = self.socket.getpeername()
@@ -167,6 +182,7 @@ class InitiatorTransport(Transport):
         self.state = Transport.CONNECTING
         self.session.event_start(self)
         self.connect(target)
+        self.reaktor.update_interest(self)
     
     def handle_connect(self):
         """Connect event."""
@@ -200,12 +216,13 @@ class AcceptorTransport(Transport):
         self.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
         self.state = Transport.IDLE
 
-    def start(self, target):
+    def start(self, target, backlog=5):
         """Start listening."""
         self.state = Transport.ACCEPTING
         self.session.event_start(self)
         self.bind(target)
-        self.listen(5)
+        self.listen(backlog)
+        self.reaktor.update_interest(self)
 
     def writable(self):
         return self.state == Transport.ACCEPTING
@@ -291,6 +308,10 @@ if sys.platform != 'win32':
             """Transport becomes writable event."""
             self.session.event_writable(self)
 
+        def sendv(self, bufs):
+            """Write list of buffers with one ``send``."""
+            return self.send(''.join(bufs))
+
         def handle_error(self):
             """Transport error. Translates socket errors to ``TransportError``."""
             import traceback
@@ -305,5 +326,7 @@ if sys.platform != 'win32':
 
         def readable(self):
             """Test if protocol transport readable events are listened."""
+            if self.session.is_paused():
+                return False
             return self.state == Transport.CONNECTED or self.session.readable()
 
@@ -0,0 +1,81 @@
+# (c) Harri Rautila, 2011
+
+# This file is part of sxsuite library. It is free software, distributed
+# under the terms of the GNU Lesser General Public License Version 3,
+# or any later version.
+# See the COPYING file included in this archive
+
+import time
+import unittest
+
+from sxsuite.fix import FixAcceptor, FixClient, FixServer, FixProtocol
+from sxsuite.reaktor import Reaktor
+from sxsuite.session import Session
+from sxsuite.timer import flush_timers, run_timers
+
+
+def _configure(session, sender, target):
+    session.set_conf('sender_comp_id', sender)
+    session.set_conf('target_comp_id', target)
+    return session
+
+
+class AcceptorTest(unittest.TestCase):
+
+    def setUp(self):
+        self.reaktor = Reaktor()
+        self.acceptor = FixAcceptor(self.reaktor)
+        self.acceptor.start(('127.0.0.1', 0))
+        self.address = self.acceptor.listener.socket.getsockname()
+        self.sessions = []
+
+    def tearDown(self):
+        for session in self.sessions:
+            session.stop()
+        self.acceptor.stop()
+        flush_timers()
+
+    def _wait(self, cond, timeout=3.0):
+        deadline = time.time() + timeout
+        while not cond() and time.time() < deadline:
+            self.reaktor.poll()
+            run_timers()
+        return cond()
+
+    def _server(self, name, client_id):
+        server = FixServer(self.reaktor, FixProtocol(), name=name, listen=False)
+        self.acceptor.register(_configure(server, 'S', client_id))
+        self.sessions.append(server)
+        return server
+
+    def _client(self, name, client_id):
+        client = FixClient(self.reaktor, FixProtocol(), name=name)
+        _configure(client, client_id, 'S')
+        self.sessions.append(client)
+        client.start(self.address)
+        return client
+
+    def test_route_by_comp_id(self):
+        servers = [self._server('s%d' % n, 'C%d' % n) for n in range(3)]
+        # clients connect in different order to one port
+        clients = [self._client('c%d' % n, 'C%d' % n) for n in (2, 0)]
+        self.assertTrue(self._wait(lambda: all(
+            x.in_state(Session.INSESSION) for x in clients)))
+        self.assertTrue(servers[0].in_state(Session.INSESSION))
+        self.assertTrue(servers[2].in_state(Session.INSESSION))
+        self.assertTrue(servers[1].in_state(Session.IDLE))
+        self.assertEqual(servers[2].transport.getpeername(),
+                         clients[0].transport.socket.getsockname())
+
+    def test_unknown_comp_id(self):
+        server = self._server('s0', 'C0')
+        client = self._client('c9', 'C9')
+        self._wait(lambda: client.in_state(Session.INSESSION), 1.0)
+        self.assertFalse(client.in_state(Session.INSESSION))
+        self.assertTrue(server.in_state(Session.IDLE))
+        self.assertEqual(self.acceptor.session_for('C9', 'S'), None)
+        self.assertTrue(self.acceptor.session_for('C0', 'S') is server)
+
+
+if __name__ == '__main__':
+    unittest.main()
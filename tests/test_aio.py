@@ -0,0 +1,149 @@
+# (c) Harri Rautila, 2011
+
+# This file is part of sxsuite library. It is free software, distributed
+# under the terms of the GNU Lesser General Public License Version 3,
+# or any later version.
+# See the COPYING file included in this archive
+
+import sys
+import types
+import unittest
+
+try:
+    from sxsuite.aio import AioReaktor, AioTransport, asyncio
+except ImportError:
+    asyncio = None
+    # event loop is not needed to test pausing; import with stand-in module
+    _asyncio = types.ModuleType('asyncio')
+    _asyncio.Protocol = object
+    _asyncio.ensure_future = lambda coro, loop=None: coro
+    sys.modules['asyncio'] = _asyncio
+    try:
+        from sxsuite.aio import AioReaktor, AioTransport
+    finally:
+        del sys.modules['asyncio']
+        del sys.modules['sxsuite.aio']
+
+from sxsuite.apps import Application
+from sxsuite.fix import FixClient, FixServer, FixProtocol
+from sxsuite.session import Session
+from sxsuite.timer import flush_timers
+
+
+class _App(Application):
+    def __init__(self):
+        Application.__init__(self)
+        self.got = []
+
+    def upstream(self, data):
+        self.got.append(data)
+
+
+class _Loop(object):
+    """Event loop that never runs its callbacks."""
+
+    class _Handle(object):
+        def cancel(self):
+            pass
+
+    def call_later(self, delay, func):
+        return self._Handle()
+
+
+class _AsyncTransport(object):
+    """Asyncio transport recording pause and resume of reading."""
+
+    def __init__(self):
+        self.reading = True
+        self.calls = []
+
+    def get_extra_info(self, name):
+        return None
+
+    def pause_reading(self):
+        self.calls.append('pause')
+        self.reading = False
+
+    def resume_reading(self):
+        self.calls.append('resume')
+        self.reading = True
+
+
+class PauseTest(unittest.TestCase):
+
+    def tearDown(self):
+        flush_timers()
+
+    def test_pause_reading(self):
+        reaktor = AioReaktor(_Loop())
+        session = Session(None)
+        transport = AioTransport(reaktor)
+        transport.set_session(session)
+        session.transport = transport
+        # session paused before connection is made
+        session.pause_writing()
+        sock = _AsyncTransport()
+        transport.connection_made(sock)
+        self.assertFalse(sock.reading)
+        self.assertFalse(transport.readable())
+        session.resume_writing()
+        self.assertTrue(sock.reading)
+        self.assertTrue(transport.readable())
+        session.resume_writing()
+        session.pause_writing()
+        session.pause_writing()
+        self.assertEqual(sock.calls, ['pause', 'resume', 'pause'])
+
+
+class AioTest(unittest.TestCase):
+
+    def setUp(self):
+        if asyncio is None:
+            self.skipTest("asyncio or trollius not available")
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+
+    def tearDown(self):
+        flush_timers()
+        self.loop.close()
+        asyncio.set_event_loop(None)
+
+    def _wait(self, cond, timeout=3.0):
+        for n in range(int(timeout / 0.05)):
+            if cond():
+                return True
+            self.loop.run_until_complete(asyncio.sleep(0.05))
+        return cond()
+
+    def test_session(self):
+        reaktor = AioReaktor(self.loop)
+        server = FixServer(reaktor, FixProtocol(), transport=AioTransport(reaktor),
+                           name='server')
+        client = FixClient(reaktor, FixProtocol(), transport=AioTransport(reaktor),
+                           name='client')
+        apps = []
+        for session, sender, target in ((server, 'S', 'C'), (client, 'C', 'S')):
+            session.set_conf('sender_comp_id', sender)
+            session.set_conf('target_comp_id', target)
+            app = _App()
+            session.linkup(app)
+            app.linkdown(session)
+            apps.append(app)
+        errors = []
+        future = reaktor.listen(server, ('127.0.0.1', 0))
+        self.loop.run_until_complete(future)
+        port = future.result().sockets[0].getsockname()[1]
+        client.start(('127.0.0.1', port))
+        reaktor.start(exc_handler=lambda e: errors.append(e) or True)
+        self.assertTrue(self._wait(lambda: client.in_state(Session.INSESSION) and
+                                   server.in_state(Session.INSESSION)))
+        client.send('35=D\x0111=x\x01')
+        self.assertTrue(self._wait(lambda: apps[0].got))
+        self.assertEqual(apps[0].got[0].get(11), 'x')
+        self.assertEqual(errors, [])
+        client.stop()
+        future.result().close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,102 @@
+# (c) Harri Rautila, 2011
+
+# This file is part of sxsuite library. It is free software, distributed
+# under the terms of the GNU Lesser General Public License Version 3,
+# or any later version.
+# See the COPYING file included in this archive
+
+import os
+import select
+import signal
+import time
+import unittest
+
+from sxsuite.apps import ProcessPoolApplication, Handler
+from sxsuite.exc import SessionError
+from sxsuite.reaktor import Reaktor
+from sxsuite.timer import add_timer, flush_timers, run_timers
+
+
+class _Worker(Handler):
+    def handle(self, data, conn):
+        if data == 'a die':
+            os._exit(1)
+        return data
+
+
+class _Downlink(object):
+    def __init__(self, reaktor, count):
+        self.reaktor = reaktor
+        self.count = count
+        self.got = []
+
+    def downstream(self, data):
+        self.got.append(data)
+        if len(self.got) == self.count:
+            self.reaktor.stop()
+
+
+class PoolTest(unittest.TestCase):
+
+    def tearDown(self):
+        flush_timers()
+        signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+
+    def test_dead_worker(self):
+        reaktor = Reaktor()
+        # keys a and d go to different workers
+        app = ProcessPoolApplication(reaktor, _Worker(), name='pool', workers=2,
+                                     key=lambda data: data.split()[0])
+        down = _Downlink(reaktor, 4)
+        app.linkdown(down)
+        app.start()
+        errors = []
+        def first():
+            for data in ('a 1', 'd 1', 'a die', 'a 2', 'd 2'):
+                app.send(data)
+        def second():
+            for data in ('a 3', 'd 3'):
+                app.send(data)
+        add_timer(0.1, first)
+        add_timer(1.0, second)
+        add_timer(10, reaktor.stop)
+        reaktor.run(exc_handler=lambda e: errors.append(e) or True)
+        app.stop()
+        # results of the batch of crashed worker are lost
+        self.assertEqual(down.got, ['d 1', 'd 2', 'a 3', 'd 3'])
+        self.assertEqual(len(errors), 1)
+        self.assertTrue(isinstance(errors[0], SessionError))
+
+    def test_pause_epoll(self):
+        if not hasattr(select, 'epoll'):
+            self.skipTest("epoll not available")
+        from sxsuite.reaktor import EpollReaktor
+        reaktor = EpollReaktor(max_wait=0.01)
+        app = ProcessPoolApplication(reaktor, _Worker(), name='pool', workers=2,
+                                     key=lambda data: data.split()[0])
+        down = _Downlink(reaktor, 0)
+        app.linkdown(down)
+        app.start()
+        def run(count, timeout=5):
+            deadline = time.time() + timeout
+            while len(down.got) < count and time.time() < deadline:
+                reaktor.poll()
+                run_timers()
+        try:
+            app.send('a 1')
+            app.send('d 1')
+            run(2)
+            app.pause_writing()
+            app.send('a 2')
+            run(3, 0.5)
+            self.assertEqual(sorted(down.got), ['a 1', 'd 1'])
+            app.resume_writing()
+            app.send('d 2')
+            run(4)
+        finally:
+            app.stop()
+        self.assertEqual(sorted(down.got), ['a 1', 'a 2', 'd 1', 'd 2'])
+
+
+if __name__ == '__main__':
+    unittest.main()
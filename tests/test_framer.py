@@ -0,0 +1,68 @@
+# (c) Harri Rautila, 2011
+
+# This file is part of sxsuite library. It is free software, distributed
+# under the terms of the GNU Lesser General Public License Version 3,
+# or any later version.
+# See the COPYING file included in this archive
+
+import unittest
+
+from sxsuite.fix.fixproto import FixProtocol
+from sxsuite.fix.framer import FixFramer, frame_message
+
+
+def _message(n, text=''):
+    body = '35=0\x0134=%d\x01' % n
+    if text:
+        body += '58=%s\x01' % text
+    data = '8=FIX.4.4\x019=%d\x01%s' % (len(body), body)
+    return data + '10=%03d\x01' % (sum(map(ord, data)) % 256)
+
+
+class FramerTest(unittest.TestCase):
+
+    def test_bytewise(self):
+        msgs = [_message(n, 'x' * n) for n in range(1, 20)]
+        data = ''.join(msgs)
+        framer = FixFramer(64)
+        frames = []
+        for c in data:
+            frames.extend(f.tobytes() for f in framer.feed(c))
+        self.assertEqual(frames, msgs)
+        self.assertEqual(framer.pending(), 0)
+
+    def test_partial(self):
+        msg = _message(1, 'partial')
+        framer = FixFramer()
+        self.assertEqual(framer.feed(msg[:20]), [])
+        self.assertEqual(framer.feed(msg[20:-1]), [])
+        # length of message is known after BodyLength was read
+        self.assertEqual(framer._need, len(msg))
+        self.assertEqual([f.tobytes() for f in framer.feed(msg[-1:])], [msg])
+
+    def test_garbage(self):
+        msg = _message(1)
+        framer = FixFramer()
+        frames = framer.feed('garbage\x01' + msg + '8=FI')
+        self.assertEqual([f.tobytes() for f in frames], [msg])
+        # possible start of next message is kept
+        self.assertEqual(framer.pending(), 4)
+
+    def test_bad_body_length(self):
+        msg = _message(1, 'text')
+        # too short length does not point to checksum field
+        bad = msg.replace('\x019=18\x01', '\x019=16\x01', 1)
+        self.assertEqual(frame_message(bad, 0, len(bad)), (0, len(bad)))
+        bad = msg.replace('\x019=', '\x019=x', 1)
+        self.assertEqual(frame_message(bad, 0, len(bad)), (0, len(bad)))
+
+    def test_parser(self):
+        msgs = [_message(n) for n in range(3)]
+        data = ''.join(msgs) + msgs[0][:10]
+        lines, rest = FixProtocol().parser(data)
+        self.assertEqual(lines, msgs)
+        self.assertEqual(rest, msgs[0][:10])
+
+
+if __name__ == '__main__':
+    unittest.main()
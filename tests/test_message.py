@@ -0,0 +1,212 @@
+# (c) Harri Rautila, 2011
+
+# This file is part of sxsuite library. It is free software, distributed
+# under the terms of the GNU Lesser General Public License Version 3,
+# or any later version.
+# See the COPYING file included in this archive
+
+import copy
+import unittest
+
+from sxsuite.fix.context import FixContext
+from sxsuite.fix.fixproto import FixProtocol
+from sxsuite.fix.message import FixObject, FixSlotObject, FixHeader, FixMessage, \
+     FixRawMessage, _extract_header, _extract_body, _make_mbody, _split_fields
+
+_context = FixContext(version='4.4')
+
+
+class _Order(FixSlotObject):
+    __slots__ = ('ClOrdID', 'Price')
+
+
+class FixObjectTest(unittest.TestCase):
+
+    def test_plain_type(self):
+        obj = FixObject(_context, {'ClOrdID': 'x'})
+        self.assertTrue(type(obj) is FixObject)
+        self.assertEqual(obj.__dict__['ClOrdID'], 'x')
+
+    def test_slots(self):
+        obj = _Order(_context, {'ClOrdID': 'x', 'Price': 1.5})
+        # no instance dict, overflow dict is created for other fields only
+        self.assertFalse(hasattr(obj, '__dict__'))
+        self.assertEqual(obj._extra, None)
+        obj._9999 = 'c'
+        obj.Symbol = 'XYZ'
+        self.assertEqual(obj._extra, {'_9999': 'c', 'Symbol': 'XYZ'})
+        self.assertEqual(obj.Symbol, 'XYZ')
+        self.assertEqual(sorted(obj.attributes()), ['ClOrdID', 'Price', 'Symbol', '_9999'])
+        dup = copy.copy(obj)
+        self.assertTrue(type(dup) is _Order)
+        self.assertEqual(sorted(dup.attributes()), ['ClOrdID', 'Price', 'Symbol', '_9999'])
+        self.assertEqual(dup.Price, 1.5)
+        self.assertTrue(dup._context is _context)
+
+    def test_tag_attributes(self):
+        for cls in (FixObject, _context.class_for_msgname('NewOrderSingle')):
+            obj = cls(_context, {'ClOrdID': 'x'})
+            obj._55 = 'XYZ'
+            obj._9999 = 'custom'
+            fields = list(obj.mbody())
+            self.assertTrue('55=XYZ' in fields, fields)
+            self.assertTrue('9999=custom' in fields, fields)
+        header = FixHeader(_context, {'SenderCompID': 'A', 'TargetCompID': 'B'})
+        header._9998 = 'h'
+        self.assertTrue('9998=h' in list(obj.to_message(header)))
+
+    def test_bad_attributes(self):
+        obj = FixObject(_context)
+        self.assertRaises(AttributeError, setattr, obj, '_abc', 1)
+        self.assertRaises(AttributeError, setattr, obj, '_-5', 1)
+        raw = '8=FIX.4.4\x019=20\x0135=D\x0149=A\x0156=B\x0111=x\x0110=000\x01'
+        body, header = FixObject.from_message(FixMessage.from_raw(raw), _context)
+        self.assertEqual(body.ClOrdID, 'x')
+        self.assertRaises(AttributeError, getattr, body, '_abc')
+        self.assertEqual(getattr(body, '_12', None), None)
+
+    def test_desc_for_id(self):
+        self.assertEqual(_context.desc_for_id(11).name, 'ClOrdID')
+        self.assertRaises(KeyError, _context.desc_for_id, -1)
+        self.assertRaises(KeyError, _context.desc_for_id, 10 ** 6)
+
+
+def _order(parties):
+    return FixMessage.from_raw('8=FIX.4.4\x019=5\x0135=D\x0149=A\x0156=B\x0134=1\x01'
+                               '11=x\x01%s55=XYZ\x0154=1\x0138=100\x0140=1\x0110=000\x01'
+                               % parties)
+
+
+def _values(obj):
+    """Return fields of ``obj`` as dict with groups as lists of dicts."""
+    result = {}
+    for name in obj.attributes():
+        val = getattr(obj, name)
+        if isinstance(val, list):
+            val = [_values(x) for x in val]
+        result[name] = val
+    return result
+
+
+class CodecTest(unittest.TestCase):
+
+    PARTIES = [
+        '',
+        '453=0\x01',
+        '453=1\x01448=P1\x01447=D\x01452=1\x01',
+        '453=2\x01448=P1\x01447=D\x01452=1\x01802=2\x01523=S1\x01803=2\x01'
+        '523=S2\x01803=3\x01448=P2\x01447=D\x01452=3\x01',
+        '453=2\x01448=P1\x01447=D\x01452=1\x01802=0\x01448=P2\x01',
+        ]
+
+    def decode(self, fixm):
+        """Decode with compiled, generic and lazy decoders."""
+        compiled = FixObject.from_message(fixm, _context, lazy=False)[0]
+        fields = _split_fields(fixm)
+        hdr, msgname, index = _extract_header(fields, 0, _context)
+        generic = _context.class_for_msgname(msgname)(_context)
+        _extract_body(fields, index, _context, generic)
+        lazy = FixObject.from_message(fixm, _context)[0]
+        return [_values(x) for x in (compiled, generic, lazy)]
+
+    def test_round_trip(self):
+        self.assertTrue(_context.class_for_msgname('NewOrderSingle')._decode is not None)
+        for parties in self.PARTIES:
+            compiled, generic, lazy = self.decode(_order(parties))
+            self.assertEqual(compiled, generic)
+            self.assertEqual(compiled, lazy)
+            if parties:
+                count = int(parties[4:parties.find('\x01')])
+                self.assertEqual(len(compiled['NoPartyIDs']), count)
+            if '802=2' in parties:
+                party = compiled['NoPartyIDs'][0]
+                self.assertEqual([x['PartySubID'] for x in party['NoPartySubIDs']],
+                                 ['S1', 'S2'])
+                self.assertEqual(compiled['NoPartyIDs'][1]['PartyID'], 'P2')
+            body = FixObject.from_message(_order(parties), _context, lazy=False)[0]
+            # compiled and generic encoders
+            for fixm in (body.mbody(), _make_mbody(body, _context)):
+                self.assertEqual(fixm.count('453=0'), parties.count('453=0'))
+                msg = FixMessage(['49=A', '56=B', '34=1'])
+                msg.extend(fixm)
+                raw = msg.encode(_context.version, 'D')
+                for values in self.decode(FixMessage.from_raw(raw)):
+                    self.assertEqual(values, compiled)
+
+    def test_group_count(self):
+        for parties in ('453=1\x01', '453=3\x01448=P1\x01448=P2\x01',
+                        '453=1\x01448=P1\x01802=1\x01'):
+            fixm = _order(parties)
+            self.assertRaises(ValueError, FixObject.from_message, fixm, _context, lazy=False)
+            lazy = FixObject.from_message(fixm, _context)[0]
+            self.assertRaises(ValueError, getattr, lazy, 'NoPartyIDs')
+
+
+class _State(object):
+    send_seqno = 0
+
+    def store(self, seqno, data):
+        pass
+
+
+class _Session(object):
+    def __init__(self):
+        self.state = _State()
+        self.conf = {'sender_comp_id': 'A', 'target_comp_id': 'B'}
+        self.sent = []
+
+    def get_conf(self, name):
+        return self.conf[name]
+
+    def transmit(self, data):
+        self.sent.append(FixRawMessage(data))
+
+
+class FixRawMessageTest(unittest.TestCase):
+
+    def test_find_value(self):
+        raw = FixRawMessage('8=FIX.4.4\x019=20\x0135=D\x0111=x\x0110=000')
+        self.assertEqual(raw.find_value(8), 'FIX.4.4')
+        self.assertEqual(raw.find_value(11), 'x')
+        # last field without trailing SOH
+        self.assertEqual(raw.find_value(10), '000')
+        self.assertEqual(raw.find_value(55), None)
+
+    def test_data_fields(self):
+        data = 'a\x0155=bad\x0158=z'
+        raw = FixRawMessage('8=FIX.4.4\x019=40\x0135=B\x0195=%d\x0196=%s\x01'
+                            '58=text\x0155=XYZ\x0110=000\x01' % (len(data), data))
+        self.assertEqual(raw.find_value(96), data)
+        self.assertEqual(raw.find_value(55), 'XYZ')
+        self.assertEqual(raw.find_value(58), 'text')
+        self.assertEqual(raw.find_value(35), 'B')
+        self.assertEqual(raw.find_value(54), None)
+
+    def test_bounds(self):
+        # data length past end of message
+        raw = FixRawMessage('8=FIX.4.4\x019=40\x0135=B\x0195=100\x0196=ab\x0155=X\x01')
+        self.assertEqual(raw.find_value(96), 'ab\x0155=X\x01')
+        self.assertEqual(raw.find_value(55), None)
+        raw = FixRawMessage('8=FIX.4.4\x019=5\x0135=0\x0110=000\x01')
+        self.assertEqual(raw.find_value(0), None)
+        self.assertEqual(raw.find_value(-1), None)
+        self.assertEqual(FixRawMessage('').find_value(8), None)
+        self.assertEqual(FixRawMessage('8=').find_value(8), '')
+
+    def test_transmit_raw(self):
+        proto = FixProtocol()
+        proto.session = session = _Session()
+        proto.context = _context
+        proto.transmit_raw('35=D\x0111=x\x01')
+        raw = FixRawMessage('8=FIX.4.4\x019=20\x0135=D\x0149=C\x0156=D\x0134=7\x01'
+                            '11=y\x0110=000\x01')
+        proto.transmit_raw(raw)
+        proto.transmit_raw(str(raw))
+        self.assertEqual([m.find_value(11) for m in session.sent], ['x', 'y', 'y'])
+        self.assertEqual([m.find_value(34) for m in session.sent], ['1', '2', '3'])
+        self.assertEqual(session.sent[1].find_value(49), 'A')
+        self.assertRaises(ValueError, proto.transmit_raw, '11=x\x01')
+
+
+if __name__ == '__main__':
+    unittest.main()
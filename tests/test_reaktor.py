@@ -0,0 +1,80 @@
+# (c) Harri Rautila, 2011
+
+# This file is part of sxsuite library. It is free software, distributed
+# under the terms of the GNU Lesser General Public License Version 3,
+# or any later version.
+# See the COPYING file included in this archive
+
+import select
+import socket
+import unittest
+
+from sxsuite.reaktor import Reaktor
+from sxsuite.session import Session
+from sxsuite.transport import ConnectedTransport
+
+
+class _Session(Session):
+    def __init__(self):
+        Session.__init__(self, None)
+        self._state = Session.INSESSION
+        self.got = []
+
+    def event_readable(self, transport):
+        data = transport.recv(65536)
+        if data:
+            self.got.append(data)
+
+
+class EpollReaktorTest(unittest.TestCase):
+
+    def setUp(self):
+        if not hasattr(select, 'epoll'):
+            self.skipTest("epoll not available")
+        from sxsuite.reaktor import EpollReaktor
+        self.reaktor = EpollReaktor(max_wait=0.01)
+        a, b = socket.socketpair()
+        self.a, self.b = _Session(), _Session()
+        self.a.transport = ConnectedTransport(self.reaktor, a, self.a)
+        self.b.transport = ConnectedTransport(self.reaktor, b, self.b)
+
+    def tearDown(self):
+        for session in (self.a, self.b):
+            session.transport.close()
+
+    def _mask(self, session):
+        entry = self.reaktor._interest.get(session.transport._fileno)
+        return entry[1] if entry else 0
+
+    def test_interest(self):
+        reaktor = self.reaktor
+        reaktor.poll()
+        self.assertEqual(self._mask(self.a), select.EPOLLIN | select.EPOLLPRI)
+        reaktor.poll()
+        reaktor.poll()
+        self.assertEqual(reaktor._changed, set())
+
+        # queued outside of I/O events
+        self.a.transmit('hello')
+        self.assertEqual(reaktor._changed, set([self.a.transport._fileno]))
+        reaktor.poll()
+        self.assertTrue(self._mask(self.a) & select.EPOLLOUT)
+        for n in range(5):
+            reaktor.poll()
+        self.assertEqual(self.b.got, ['hello'])
+        self.assertFalse(self._mask(self.a) & select.EPOLLOUT)
+
+        self.b.pause_writing()
+        reaktor.poll()
+        self.assertEqual(self._mask(self.b), 0)
+        self.b.resume_writing()
+        reaktor.poll()
+        self.assertEqual(self._mask(self.b), select.EPOLLIN | select.EPOLLPRI)
+
+        fd = self.a.transport._fileno
+        self.a.transport.close()
+        self.assertFalse(fd in reaktor._interest)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,182 @@
+# (c) Harri Rautila, 2011
+
+# This file is part of sxsuite library. It is free software, distributed
+# under the terms of the GNU Lesser General Public License Version 3,
+# or any later version.
+# See the COPYING file included in this archive
+
+import os
+import shutil
+import tempfile
+import time
+import unittest
+
+from sxsuite.fix.fixproto import FixProtocol, FixState
+from sxsuite.fix.message import FixMessage
+from sxsuite.session import Session
+from sxsuite.store import open_store
+from sxsuite.timer import run_timers, list_timers, flush_timers
+
+# seqnos of admin messages; others are application messages
+ADMIN = frozenset([1, 2, 5, 6, 7, 10, 13])
+LAST = 14
+
+
+class _Session(object):
+    _state = Session.INSESSION
+
+    def __init__(self, store_url, batch):
+        self.state = FixState(store_url)
+        self.out = []
+        self.conf = {'sender_comp_id': 'A', 'target_comp_id': 'B',
+                     'resend_batch': batch}
+
+    def get_conf(self, key, default=''):
+        return self.conf.get(key, default)
+
+    def in_state(self, state):
+        return self._state == state
+
+    high_water = 10000
+
+    def outq_size(self):
+        return 0
+
+    def transmit(self, data):
+        self.out.append(FixMessage.from_raw(data))
+
+
+class ReplayTest(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        flush_timers()
+
+    def tearDown(self):
+        flush_timers()
+        shutil.rmtree(self.dir)
+
+    def urls(self):
+        self.runs = getattr(self, 'runs', 0) + 1
+        d = os.path.join(self.dir, str(self.runs))
+        os.mkdir(d)
+        return ['file://%s/store.pk' % d,
+                'journal://%s/journal' % d,
+                'mmap://%s/mmap' % d,
+                'sqlite://%s/store.db?session=A' % d,
+                'journal://%s/durable?durability=batch' % d]
+
+    def replay(self, url, batch, start, end):
+        proto = FixProtocol()
+        session = proto.session = _Session(url, batch)
+        for num in range(1, LAST+1):
+            if num in ADMIN:
+                proto.send_heartbeat()
+            else:
+                msg = FixMessage()
+                msg.set_field('ClOrdID', 'o%d' % num, proto.context)
+                proto._transmit('NewOrderSingle', msg)
+        session.out = []
+        proto.resend(start, end)
+        while list_timers():
+            run_timers()
+        session.state.mstore.close()
+        return session.out
+
+    def check(self, out, start, end):
+        """Output must cover ``start`` to ``end`` once, in order."""
+        expect = start
+        for msg in out:
+            self.assertEqual(msg.get(43), 'Y')
+            seqno = int(msg.get(34))
+            self.assertEqual(seqno, expect)
+            if msg.get(35) == '4':
+                self.assertEqual(msg.get(123), 'Y')
+                new_seqno = int(msg.get(36))
+                for num in range(seqno, new_seqno):
+                    self.assertTrue(num in ADMIN, "gap fill over %d" % num)
+                expect = new_seqno
+            else:
+                self.assertFalse(seqno in ADMIN)
+                self.assertEqual(msg.get(11), 'o%d' % seqno)
+                self.assertTrue(msg.get(122))
+                expect = seqno + 1
+        self.assertEqual(expect, end + 1)
+
+    def test_replay(self):
+        for n in range(len(self.urls())):
+            for batch in range(1, 7):
+                for start, end in [(1, 0), (2, 9), (3, 6), (5, 12), (13, 14)]:
+                    url = self.urls()[n]
+                    out = self.replay(url, batch, start, end)
+                    self.check(out, start, end or LAST)
+
+    def test_new_day(self):
+        for url in self.urls():
+            proto = FixProtocol()
+            session = proto.session = _Session(url, 100)
+            for clordid in ('day1-1', 'day1-2', 'day1-3'):
+                msg = FixMessage()
+                msg.set_field('ClOrdID', clordid, proto.context)
+                proto._transmit('NewOrderSingle', msg)
+            session.state.new_day()
+            proto.send_heartbeat()
+            msg = FixMessage()
+            msg.set_field('ClOrdID', 'day2-2', proto.context)
+            proto._transmit('NewOrderSingle', msg)
+            session.out = []
+            proto.resend(1, 3)
+            while list_timers():
+                run_timers()
+            self.assertEqual([(m.get(35), m.get(34), m.get(11)) for m in session.out],
+                             [('4', '1', None), ('D', '2', 'day2-2')])
+            session.state.mstore.close()
+            store = open_store(url)
+            self.assertEqual([n for n, m in store.range(1)], [2])
+            store.close()
+
+    def test_rounds(self):
+        proto = FixProtocol()
+        session = proto.session = _Session('', 100)
+        session.state.find_range = lambda first, last: \
+            [(n, '8=FIX.4.4\x019=5\x0135=D\x0134=%d\x0152=x\x0111=o%d\x0110=000\x01' %
+              (n, n)) for n in range(first, last+1)]
+        session.state.send_seqno = 2000
+        session.queued = 0
+        session.outq_size = lambda: session.queued
+        proto.resend(1, 0)
+        rounds = [len(session.out)]
+        while list_timers():
+            run_timers()
+            rounds.append(len(session.out))
+        # one batch per round
+        self.assertEqual(rounds[:3], [100, 200, 300])
+        self.assertEqual(len(rounds), 20)
+        self.assertEqual(len(session.out), 2000)
+
+        # no batches while outbound queue is full
+        session.out = []
+        proto.resend(1, 0)
+        session.queued = session.high_water
+        for n in range(3):
+            time.sleep(0.02)
+            run_timers()
+        self.assertEqual(len(session.out), 100)
+        session.queued = 0
+        while list_timers():
+            run_timers()
+        self.assertEqual(len(session.out), 2000)
+
+    def test_range(self):
+        for url in self.urls():
+            self.replay(url, 100, 1, 0)
+            store = open_store(url)
+            apps = [n for n in range(1, LAST+1) if n not in ADMIN]
+            self.assertEqual([n for n, m in store.range(1, 6)], [3, 4])
+            self.assertEqual([n for n, m in store.range(1)], apps)
+            self.assertEqual([n for n, m in store.range(5, 7)], [])
+            store.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+# (c) Harri Rautila, 2011
+
+# This file is part of sxsuite library. It is free software, distributed
+# under the terms of the GNU Lesser General Public License Version 3,
+# or any later version.
+# See the COPYING file included in this archive
+
+import socket
+import unittest
+
+from sxsuite.fix.fixproto import FixProtocol
+from sxsuite.reaktor import Reaktor
+from sxsuite.session import Session, TCPSession
+from sxsuite.transport import ConnectedTransport
+
+
+class _Transport(object):
+    def close(self):
+        pass
+
+    def del_channel(self):
+        pass
+
+
+class _Uplink(object):
+    paused = False
+
+    def pause_writing(self):
+        self.paused = True
+
+    def resume_writing(self):
+        self.paused = False
+
+
+class OutqResetTest(unittest.TestCase):
+
+    def test_disconnect_clears_outq(self):
+        session = TCPSession(None, FixProtocol(), server=True, listen=False)
+        uplink = _Uplink()
+        session.linkup(uplink)
+        session.set_conf('high_water_mark', 10)
+        session.set_conf('low_water_mark', 5)
+        session.transport = _Transport()
+        session._state = Session.INSESSION
+        session.transmit('8=FIX.4.4\x019=5\x01')
+        session.transmit('35=0\x01')
+        self.assertTrue(uplink.paused)
+        self.assertTrue(session.writable())
+
+        session._disconnect()
+        self.assertFalse(session.writable())
+        self.assertEqual(session.outq_size(), 0)
+        self.assertFalse(uplink.paused)
+        # water marks work again on next connection
+        session.transmit('8=FIX.4.4\x019=5\x01')
+        self.assertTrue(uplink.paused)
+
+
+class FlushOutqTest(unittest.TestCase):
+
+    def test_write_budget(self):
+        a, b = socket.socketpair()
+        session = TCPSession(None, FixProtocol(), server=True, listen=False)
+        session.set_conf('write_budget', 8)
+        session.transport = ConnectedTransport(Reaktor(), a, session)
+        session._state = Session.INSESSION
+        for data in ('35=0\x01', '35=1\x01', '35=2\x01'):
+            session.transmit(data)
+        # queued messages are joined up to budget
+        session._flush_outq()
+        self.assertEqual(b.recv(100), '35=0\x0135=1\x01')
+        self.assertEqual(session.outq_size(), 5)
+        session._flush_outq()
+        self.assertEqual(b.recv(100), '35=2\x01')
+        self.assertFalse(session.writable())
+        session.transport.close()
+        b.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
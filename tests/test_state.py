@@ -0,0 +1,72 @@
+# (c) Harri Rautila, 2011
+
+# This file is part of sxsuite library. It is free software, distributed
+# under the terms of the GNU Lesser General Public License Version 3,
+# or any later version.
+# See the COPYING file included in this archive
+
+import json
+import os
+import shutil
+import tempfile
+import time
+import unittest
+
+from datetime import datetime
+
+from sxsuite.fix.fixproto import FixState, FixStateRecord
+
+
+def _today():
+    now = datetime.utcnow()
+    return now.year*10000 + now.month*100 + now.day
+
+
+class StateRecordTest(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.dir, 'state')
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def test_in_place(self):
+        state = FixState('')
+        state.open_record(self.path)
+        state.receive_seqno = 7
+        state.send_seqno = 9
+        # record is read back without flush or close
+        record = FixStateRecord(self.path)
+        receive_seqno, send_seqno, day, start = record.read()
+        self.assertEqual((receive_seqno, send_seqno, day), (7, 9, _today()))
+        self.assertEqual(start, state.session_start)
+        record.close()
+        self.assertEqual(os.path.getsize(self.path), FixStateRecord._REC.size)
+
+    def test_convert_json(self):
+        with open(self.path, 'w') as fp:
+            fp.write(json.dumps({'receive_seqno': 3, 'send_seqno': 4}))
+        state = FixState('')
+        state.open_record(self.path)
+        self.assertEqual((state.receive_seqno, state.send_seqno), (3, 4))
+        self.assertEqual(state.session_day, _today())
+
+    def test_new_day(self):
+        state = FixState('')
+        state.open_record(self.path)
+        state.receive_seqno = 7
+        state.send_seqno = 9
+        state.record.set_day(20110101, 1.0)
+        state = FixState('')
+        state.open_record(self.path)
+        self.assertEqual((state.session_day, state.session_start), (20110101, 1.0))
+        before = time.time()
+        state.new_day()
+        receive_seqno, send_seqno, day, start = FixStateRecord(self.path).read()
+        self.assertEqual((receive_seqno, send_seqno, day), (0, 0, _today()))
+        self.assertTrue(start >= before)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,171 @@
+# (c) Harri Rautila, 2011
+
+# This file is part of sxsuite library. It is free software, distributed
+# under the terms of the GNU Lesser General Public License Version 3,
+# or any later version.
+# See the COPYING file included in this archive
+
+import os
+import shutil
+import tempfile
+import time
+import unittest
+
+from sxsuite.fix.fixproto import FixState
+from sxsuite.store import open_store, close_stores, DurableStore, \
+     MessageJournalStore, MessageMmapStore, MessageStore, SQLiteStore
+from sxsuite.timer import run_timers
+
+
+class _FailingStore(MessageStore):
+    def save(self, num, msg):
+        raise IOError, "disk full"
+
+
+class StoreCloseTest(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def test_close_stores(self):
+        for scheme in ('journal', 'mmap'):
+            for mode in ('none', 'batch'):
+                url = '%s://%s/%s-%s?durability=%s' % (scheme, self.dir, scheme, mode, mode)
+                store = open_store(url)
+                for num in xrange(1, 101):
+                    store.save(num, 'msg %d' % num)
+                close_stores()
+                store = open_store(url)
+                self.assertEqual([n for n, _ in store.range(1)], range(1, 101))
+                self.assertEqual(str(store.find(100)[1]), 'msg 100')
+                store.close()
+
+    def test_state_close(self):
+        url = 'sqlite://%s/store.db?session=A' % self.dir
+        state = FixState(url)
+        state.store(1, 'one')
+        state.close()
+        state = FixState(url)
+        self.assertEqual(state.find(1), (1, 'one'))
+        state.close()
+
+    def test_journal_url(self):
+        path = os.path.join(self.dir, 'journal')
+        store = open_store('journal://%s' % path)
+        self.assertTrue(isinstance(store, MessageJournalStore))
+        self.assertEqual(store.path, path)
+        store.close()
+        store = open_store('journal://%s?durability=sync' % path)
+        self.assertTrue(isinstance(store.store, MessageJournalStore))
+        store.close()
+
+    def test_journal_truncated_tail(self):
+        path = os.path.join(self.dir, 'journal')
+        store = MessageJournalStore(path, segment_size=64)
+        for num in xrange(1, 11):
+            store.save(num, 'message %d' % num)
+        store.close()
+        segment = os.path.join(path, '%08d.seg' % store.segment)
+        size = os.path.getsize(segment)
+        # crash cut last record in the middle of message and of header
+        for cut in (3, len('message 10') + 4):
+            with open(segment, 'r+b') as fp:
+                fp.truncate(size - cut)
+            store = MessageJournalStore(path, segment_size=64)
+            self.assertEqual(store.find(10), (-1, None))
+            self.assertEqual(store.find(9), (9, 'message 9'))
+            store.close()
+        store = MessageJournalStore(path, segment_size=64)
+        store.save(10, 'message 10')
+        self.assertEqual(store.range(8), [(8, 'message 8'), (9, 'message 9'),
+                                          (10, 'message 10')])
+        store.close()
+
+    def test_mmap_reopen(self):
+        path = os.path.join(self.dir, 'mm')
+        store = MessageMmapStore(path, segment_size=64)
+        for num in xrange(1, 11):
+            store.save(num, 'message %d' % num)
+        # larger than segment gets segment of its own
+        store.save(11, 'L' * 100)
+        # resent message replaces earlier one
+        store.save(3, 'message 3 again')
+        num, msg = store.find(5)
+        self.assertTrue(isinstance(msg, buffer))
+        self.assertEqual(str(msg), 'message 5')
+        store.close()
+        self.assertTrue(len(os.listdir(path)) > 2)
+        store = MessageMmapStore(path, segment_size=64)
+        self.assertEqual([(num, str(msg)) for num, msg in store.range(2, 4)],
+                         [(2, 'message 2'), (3, 'message 3 again'), (4, 'message 4')])
+        self.assertEqual(str(store.find(11)[1]), 'L' * 100)
+        self.assertEqual(store.last_seqno(), 11)
+        # appends continue after records found on open
+        store.save(12, 'message 12')
+        self.assertEqual([num for num, msg in store.range(1)], range(1, 13))
+        store.close()
+
+    def test_mmap_sync_segments(self):
+        store = MessageMmapStore(os.path.join(self.dir, 'mm'), segment_size=64)
+        for num in xrange(1, 11):
+            store.save(num, 'x' * 20)
+        self.assertTrue(len(store._dirty) > 1)
+        store.sync()
+        self.assertEqual(store._dirty, set())
+        store.close()
+
+    def test_sqlite_range(self):
+        path = os.path.join(self.dir, 'store.db')
+        a = SQLiteStore(path, 'A')
+        b = SQLiteStore(path, 'B')
+        for num in (1, 2, 3, 5):
+            a.save(num, 'a %d' % num)
+        b.save(2, 'b 2')
+        self.assertEqual(a.range(2, 4), [(2, 'a 2'), (3, 'a 3')])
+        self.assertEqual(a.range(3), [(3, 'a 3'), (5, 'a 5')])
+        self.assertEqual(b.range(1), [(2, 'b 2')])
+        self.assertEqual(a.range(6), [])
+        self.assertEqual(a.find(3), (3, 'a 3'))
+        self.assertEqual(a.next(3), (5, 'a 5'))
+        self.assertEqual(a.find(4), (-1, None))
+        start = time.time()
+        a.save(6, 'a 6')
+        self.assertEqual(a.sent_between(start, time.time()), [(6, 'a 6')])
+        a.close()
+        b.close()
+        # pending inserts are committed on close
+        a = SQLiteStore(path, 'A')
+        self.assertEqual([num for num, msg in a.range(1)], [1, 2, 3, 5, 6])
+        a.close()
+
+    def test_sqlite_batch_commit(self):
+        commits = []
+        for mode in ('batch', 'sync'):
+            store = open_store('sqlite://%s/store.db?session=%s&durability=%s'
+                               % (self.dir, mode, mode))
+            store.store.open()
+            db = store.store.db
+            db.commit = lambda commit=db.commit: (commits.append(mode), commit())
+            for num in xrange(1, 11):
+                store.save(num, 'msg %d' % num)
+            run_timers()
+            del db.commit
+            store.close()
+        # batch mode commits once per round, sync mode once per message
+        self.assertEqual(commits.count('batch'), 1)
+        self.assertEqual(commits.count('sync'), 10)
+
+    def test_writer_error(self):
+        store = DurableStore(_FailingStore(), 'batch')
+        store.save(1, 'one')
+        self.assertRaises(IOError, store.flush)
+        # failed message is kept
+        self.assertEqual(store.find(1), (1, 'one'))
+        store.close()
+
+
+if __name__ == '__main__':
+    unittest.main()